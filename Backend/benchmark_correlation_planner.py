@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Benchmark del Plan Unificado de Correlación
+====================================================
+
+Compara la cascada de estrategias de CorrelationServiceFixed (estrategia A,
+B y C, validación de números objetivo y rescate de emergencia por variación,
+cada paso recorriendo operator_call_data, la implementación anterior) con el
+plan unificado de una sola pasada, sobre una misión sintética:
+
+- Celdas HUNTER CLARO con operadores escritos de distintas formas
+- Llamadas dentro y fuera del período, con números con y sin prefijo 57
+- Números objetivo solo fuera del período (requieren rescate de emergencia)
+
+Uso:
+    python benchmark_correlation_planner.py [llamadas] [celdas_hunter]
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.correlation_service_fixed import CorrelationServiceFixed
+from testing.correlation_reference import legacy_analyze_correlation, populate_mission
+
+
+def benchmark(calls: int = 200_000, hunter_cells: int = 400) -> None:
+    from database.connection import init_database, get_database_manager, get_db_connection
+    from testing.operator_fixtures import apply_operator_schema
+
+    logging.disable(logging.WARNING)
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_benchmark_')
+    init_database(os.path.join(tmp_dir, 'kronos_benchmark.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls, hunter_cells)
+
+    service = CorrelationServiceFixed()
+    period = ('2024-03-05 00:00:00', '2024-03-20 23:59:59')
+
+    print("=" * 70)
+    print(f"BENCHMARK PLAN DE CORRELACIÓN: {calls:,} llamadas, {hunter_cells:,} celdas HUNTER")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    legacy = legacy_analyze_correlation(service, mission_id, *period)
+    legacy_elapsed = time.perf_counter() - start
+    print(f"  Cascada de estrategias: {legacy_elapsed:8.2f}s")
+
+    start = time.perf_counter()
+    response = service.analyze_correlation(mission_id, *period)
+    elapsed = time.perf_counter() - start
+    print(f"  Plan unificado:         {elapsed:8.2f}s  (x{legacy_elapsed / elapsed:.1f})")
+
+    def key(result):
+        return (result['targetNumber'], result['detectionStrategy'], result['totalCalls'], result['confidence'])
+
+    identical = sorted(map(key, legacy)) == sorted(map(key, response['data']))
+    print(f"  Números: {len(response['data']):,}  Resultados idénticos: {'SI' if identical else 'NO'}")
+    print(f"  Coincidencias por estrategia: {response['statistics']['strategyMatches']}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    benchmark(*args)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Benchmark de Motores de Lectura Excel
+==============================================
+
+Compara los motores de utils.excel_reader con pd.read_excel sobre archivos
+generados con la forma de los archivos reales de operadores:
+
+1. TIGO llamadas: varias pestañas con las 21 columnas del formato, de las
+   que se proyectan solo las columnas mapeadas
+2. CLARO datos: una pestaña con las columnas del formato de datos celulares,
+   leída completa como texto (dtype=str)
+
+'calamine' solo se mide si python-calamine está instalado.
+
+Uso:
+    python benchmark_excel_engines.py [filas_por_pestaña] [pestañas_tigo]
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import io
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import openpyxl
+import pandas as pd
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.file_processor_service import FileProcessorService
+from utils.excel_reader import get_available_excel_engines, read_excel_sheet, list_excel_sheets
+
+CLARO_DATOS_COLUMNS = ['numero', 'fecha_trafico', 'tipo_cdr', 'celda_decimal', 'lac_decimal']
+
+# Columnas extra que traen los archivos reales y que ningún procesador usa
+EXTRA_COLUMNS = ['OBSERVACIONES', 'CAMPO_LIBRE_1', 'CAMPO_LIBRE_2']
+
+
+def build_tigo_workbook(rows_per_sheet: int, sheets: int) -> bytes:
+    """Genera un XLSX TIGO multi-pestaña (escritura en modo write_only)"""
+    headers = list(FileProcessorService.TIGO_COLUMN_MAPPING) + EXTRA_COLUMNS
+    base_date = datetime(2024, 1, 1)
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet in range(sheets):
+        worksheet = workbook.create_sheet(f"Hoja{sheet + 1}")
+        worksheet.append(headers)
+        for i in range(rows_per_sheet):
+            worksheet.append([
+                'VOZ', f"300{i % 100000:07d}", f"310{i % 50000:07d}", 'AMR', 'O' if i % 2 else 'I',
+                i % 600, base_date + timedelta(seconds=i * 17), f"{12000 + i % 900}", 'LTE',
+                'CRA 7 # 32-10', 'BOGOTA', 'CUNDINAMARCA', i % 360, 30, 43.5,
+                -74.08 + (i % 100) / 1000, 4.60 + (i % 100) / 1000, 'URBANA', 'TORRE', 'TIGO',
+                f"{732103}{i % 9999:04d}", '', f"libre-{i}", None
+            ])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def build_claro_workbook(rows: int) -> bytes:
+    """Genera un XLSX CLARO de datos celulares de una pestaña"""
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Datos')
+    worksheet.append(CLARO_DATOS_COLUMNS + EXTRA_COLUMNS)
+    for i in range(rows):
+        worksheet.append([
+            f"573{i % 100000:09d}", 20240101000000 + i % 86400, 'DATOS',
+            20000 + i % 5000, 100 + i % 50, '', f"libre-{i}", None
+        ])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def benchmark(rows_per_sheet: int = 50_000, tigo_sheets: int = 3) -> None:
+    engines = [engine for engine in get_available_excel_engines() if engine != 'pandas']
+    tigo_bytes = build_tigo_workbook(rows_per_sheet, tigo_sheets)
+    claro_bytes = build_claro_workbook(rows_per_sheet * tigo_sheets)
+    tigo_columns = list(FileProcessorService.TIGO_COLUMN_MAPPING)
+
+    print("=" * 70)
+    print(f"BENCHMARK MOTORES EXCEL (motores disponibles: {', '.join(engines)})")
+    print("=" * 70)
+
+    # 1. TIGO multi-pestaña
+    print(f"TIGO: {tigo_sheets} pestañas x {rows_per_sheet:,} filas "
+          f"({len(tigo_bytes) / 1024 / 1024:.1f} MB)")
+    baseline, _ = _timed(lambda: [
+        pd.read_excel(io.BytesIO(tigo_bytes), sheet_name=name)
+        for name in pd.ExcelFile(io.BytesIO(tigo_bytes)).sheet_names
+    ])
+    print(f"  pd.read_excel (openpyxl):     {baseline:8.2f}s")
+    for engine in engines:
+        elapsed, _ = _timed(lambda: [
+            read_excel_sheet(tigo_bytes, sheet_name=name, columns=tigo_columns, engine=engine)
+            for name in list_excel_sheets(tigo_bytes, engine=engine)
+        ])
+        print(f"  {engine + ' (columnas TIGO)':<29} {elapsed:8.2f}s  (x{baseline / elapsed:.1f})")
+
+    # 2. CLARO una pestaña, todo como texto
+    print(f"CLARO datos: {rows_per_sheet * tigo_sheets:,} filas "
+          f"({len(claro_bytes) / 1024 / 1024:.1f} MB)")
+    baseline, _ = _timed(lambda: pd.read_excel(io.BytesIO(claro_bytes), dtype=str,
+                                               na_filter=False, engine='openpyxl'))
+    print(f"  pd.read_excel (openpyxl):     {baseline:8.2f}s")
+    for engine in engines:
+        elapsed, _ = _timed(lambda: read_excel_sheet(claro_bytes, dtype=str, na_filter=False, engine=engine))
+        print(f"  {engine + ' (todas)':<29} {elapsed:8.2f}s  (x{baseline / elapsed:.1f})")
+        elapsed, _ = _timed(lambda: read_excel_sheet(claro_bytes, columns=CLARO_DATOS_COLUMNS, dtype=str,
+                                                     na_filter=False, engine=engine))
+        print(f"  {engine + ' (columnas CLARO)':<29} {elapsed:8.2f}s  (x{baseline / elapsed:.1f})")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    benchmark(*args)
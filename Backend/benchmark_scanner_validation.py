@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Benchmark de Validación de Datos de Scanner
+====================================================
+
+Compara la validación fila por fila de ScannerDataProcessor (iterrows, ocho
+_validate_* por registro, cleaned_df.at y hash por registro para duplicados,
+la implementación anterior) con la validación columnar sobre un recorrido de
+scanner sintético con la forma de SCANHUNTER.xlsx:
+
+- Coordenadas y RSSI numéricos, con un porcentaje de valores fuera de rango
+- Operadores y tecnologías con nombres alternos (COMCEL, 2G, ...)
+- Mediciones repetidas (duplicados) y celdas con caracteres especiales
+
+La versión fila por fila se mide sobre una muestra y se extrapola al total.
+
+Uso:
+    python benchmark_scanner_validation.py [filas] [filas_muestra_fila_por_fila]
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import logging
+import os
+import sys
+import time
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.scanner_data_processor import ScannerDataProcessor
+from testing.scanner_reference import build_scanner_frame, legacy_validate_and_clean
+
+
+def benchmark(rows: int = 300_000, legacy_rows: int = 20_000) -> None:
+    logging.disable(logging.WARNING)
+    legacy_rows = min(legacy_rows, rows)
+    processor = ScannerDataProcessor('mission_benchmark')
+    mapped = processor._map_columns(build_scanner_frame(rows))
+
+    print("=" * 70)
+    print(f"BENCHMARK VALIDACIÓN SCANNER: {len(mapped):,} mediciones")
+    print("=" * 70)
+
+    sample = mapped.head(legacy_rows)
+    start = time.perf_counter()
+    legacy_df, legacy_results, _ = legacy_validate_and_clean(processor, sample)
+    legacy_elapsed = (time.perf_counter() - start) * len(mapped) / legacy_rows
+    print(f"  Fila por fila (extrapolado de {legacy_rows:,}): {legacy_elapsed:8.2f}s")
+
+    start = time.perf_counter()
+    processor._process_dataframe(build_scanner_frame(rows), 'benchmark.xlsx')
+    elapsed = time.perf_counter() - start
+    summary = processor.get_validation_summary()
+    print(f"  Columnar (_process_dataframe completo):  {elapsed:8.2f}s  (x{legacy_elapsed / elapsed:.0f})")
+    print(f"  Hallazgos: {summary['total_validations']:,} "
+          f"(materializados: {summary['stored_validations']:,})")
+
+    # Verificación de paridad sobre la muestra
+    sample_processor = ScannerDataProcessor('mission_benchmark')
+    vectorized_df = sample_processor._validate_and_clean_data(sample)
+    identical = (vectorized_df.equals(legacy_df)
+                 and sum(sample_processor.validation_counts['by_field'].values()) == len(legacy_results))
+    print(f"  Resultados idénticos en la muestra: {'SI' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    benchmark(*args)
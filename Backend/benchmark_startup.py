@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Benchmark de Arranque (time-to-interactive)
+====================================================
+
+Mide el arranque por etapas del backend en un intérprete nuevo, sobre una
+copia temporal de la base de datos:
+
+1. Importación de main (sin pandas/numpy/openpyxl)
+2. Etapa 1 de initialize_backend: BD abierta y servicios básicos (interactivo)
+3. Etapa 2 en segundo plano: integridad, verificación de servicios y
+   servicios pesados (listo)
+
+Como referencia mide también el arranque secuencial equivalente al anterior:
+verificación completa de la BD e importación de pandas antes de la interfaz.
+
+Uso:
+    python benchmark_startup.py [ruta_bd]   (por defecto Backend/kronos.db)
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNS = 3
+
+STAGED_SCRIPT = """
+import json, sys, time, logging
+t0 = time.perf_counter()
+sys.path.insert(0, {backend!r})
+import main
+logging.disable(logging.CRITICAL)
+imported = time.perf_counter() - t0
+heavy_after_import = [m for m in ('pandas', 'numpy', 'openpyxl') if m in sys.modules]
+main.initialize_backend({db_path!r})
+interactive = time.perf_counter() - t0
+status = main.wait_for_startup_checks(timeout=120)
+ready = time.perf_counter() - t0
+print(json.dumps({{'import': imported, 'interactive': interactive, 'ready': ready,
+                  'stage': status['stage'], 'heavy': heavy_after_import}}))
+"""
+
+SEQUENTIAL_SCRIPT = """
+import json, sys, time, logging
+t0 = time.perf_counter()
+sys.path.insert(0, {backend!r})
+import main
+logging.disable(logging.CRITICAL)
+import pandas, numpy, openpyxl
+from database.connection import init_database
+init_database({db_path!r}, defer_checks=False)
+main.get_role_service().get_all_roles()
+main.get_user_service().get_all_users()
+main.get_mission_service().get_missions_summary(page=1, page_size=1)
+main.get_operator_data_service()
+print(json.dumps({{'interactive': time.perf_counter() - t0}}))
+"""
+
+
+def _run(script: str, db_path: str, work_dir: str) -> dict:
+    code = script.format(backend=BACKEND_DIR, db_path=db_path)
+    output = subprocess.run([sys.executable, '-c', code], cwd=work_dir,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark(source_db: str) -> None:
+    work_dir = tempfile.mkdtemp(prefix='kronos_bench_')
+    db_path = os.path.join(work_dir, 'kronos.db')
+    if os.path.exists(source_db):
+        shutil.copy(source_db, db_path)
+    else:
+        # Sin BD de origen: crear una nueva en la primera corrida
+        _run(STAGED_SCRIPT, db_path, work_dir)
+
+    staged = [_run(STAGED_SCRIPT, db_path, work_dir) for _ in range(RUNS)]
+    sequential = [_run(SEQUENTIAL_SCRIPT, db_path, work_dir) for _ in range(RUNS)]
+
+    def best(results, key):
+        return min(r[key] for r in results)
+
+    print("=" * 70)
+    print(f"BENCHMARK DE ARRANQUE (mejor de {RUNS} corridas)")
+    print("=" * 70)
+    print(f"Importación de main:              {best(staged, 'import'):.3f}s")
+    print(f"Módulos pesados tras importar:    {staged[0]['heavy'] or 'ninguno'}")
+    print(f"Interactivo (arranque por etapas): {best(staged, 'interactive'):.3f}s")
+    print(f"Listo (verificaciones en 2do plano): {best(staged, 'ready'):.3f}s  [{staged[0]['stage']}]")
+    print(f"Interactivo (arranque secuencial): {best(sequential, 'interactive'):.3f}s")
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else os.path.join(BACKEND_DIR, 'kronos.db'))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Benchmark de Distancias Vectorizadas
+=============================================
+
+Compara calculate_distance (escalar, Python puro) con las funciones NumPy
+de utils.helpers para el caso de proximidad celdas de operador x puntos HUNTER:
+
+1. Uno a muchos: un punto HUNTER contra todas las celdas
+2. Muchos a muchos: celda más cercana a cada punto HUNTER (por bloques)
+
+La versión escalar se mide sobre una muestra y se extrapola, dado que el
+recorrido completo de 100k x 10k pares tomaría horas.
+
+Uso:
+    python benchmark_vectorized_distance.py [celdas] [puntos_hunter]
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.helpers import calculate_distance, calculate_distances_to_point, find_nearest_points
+
+SCALAR_SAMPLE_PAIRS = 200_000
+
+
+def _random_points(count: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(4.4, 4.9, count), rng.uniform(-74.3, -73.9, count)
+
+
+def benchmark(cells: int = 100_000, hunter_points: int = 10_000) -> None:
+    cells_lat, cells_lon = _random_points(cells, seed=1)
+    hunter_lat, hunter_lon = _random_points(hunter_points, seed=2)
+
+    print("=" * 70)
+    print(f"BENCHMARK DISTANCIAS: {cells:,} celdas x {hunter_points:,} puntos HUNTER")
+    print("=" * 70)
+
+    # Escalar: muestra de pares para estimar costo por par
+    sample = min(SCALAR_SAMPLE_PAIRS, cells)
+    start = time.perf_counter()
+    for i in range(sample):
+        calculate_distance(hunter_lat[0], hunter_lon[0], cells_lat[i], cells_lon[i])
+    scalar_per_pair = (time.perf_counter() - start) / sample
+
+    # 1. Uno a muchos
+    start = time.perf_counter()
+    calculate_distances_to_point(hunter_lat[0], hunter_lon[0], cells_lat, cells_lon)
+    one_to_many = time.perf_counter() - start
+    scalar_one_to_many = scalar_per_pair * cells
+    print(f"Uno a muchos ({cells:,} pares):")
+    print(f"  Escalar:     {scalar_one_to_many:10.3f}s")
+    print(f"  Vectorizado: {one_to_many:10.3f}s  (x{scalar_one_to_many / one_to_many:,.0f})")
+
+    # 2. Muchos a muchos: celda más cercana para cada punto HUNTER
+    start = time.perf_counter()
+    find_nearest_points(hunter_lat, hunter_lon, cells_lat, cells_lon)
+    many_to_many = time.perf_counter() - start
+    scalar_many_to_many = scalar_per_pair * cells * hunter_points
+    print(f"Muchos a muchos, más cercano ({cells * hunter_points:,} pares):")
+    print(f"  Escalar (estimado): {scalar_many_to_many:10.1f}s")
+    print(f"  Vectorizado:        {many_to_many:10.1f}s  (x{scalar_many_to_many / many_to_many:,.0f})")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    benchmark(*args)
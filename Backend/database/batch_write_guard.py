@@ -0,0 +1,37 @@
+"""
+KRONOS Batch Write Guard
+===============================================================================
+Marca de escritura por lotes sobre las tablas masivas.
+
+Las estructuras derivadas de las tablas masivas (diccionario de celdas,
+índice de búsqueda de números) se mantienen con triggers fila a fila, que
+solo son el respaldo de las escrituras fuera del núcleo de carga. El núcleo
+(FileProcessorService._write_prepared_rows) las mantiene con sentencias
+set-based una vez por lote: al iniciar el lote registra la tabla en
+batch_write_guard y los triggers con outside_batch_sql(tabla) en su WHEN no
+se ejecutan para las filas del lote.
+
+La marca se inserta y se elimina dentro de la transacción del lote: las demás
+conexiones nunca la ven, y un ROLLBACK también la descarta.
+
+La tabla vive en kronos.db; en las conexiones de una misión fragmentada
+(database/mission_shards.py) el nombre sin esquema se resuelve en 'shared'.
+
+Author: KRONOS Development Team
+Date: 2026-10-19
+===============================================================================
+"""
+
+BATCH_WRITE_GUARD_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS batch_write_guard (
+        table_name TEXT PRIMARY KEY
+    ) WITHOUT ROWID
+"""
+
+BEGIN_BATCH_WRITE_SQL = "INSERT OR IGNORE INTO batch_write_guard (table_name) VALUES (?)"
+END_BATCH_WRITE_SQL = "DELETE FROM batch_write_guard WHERE table_name = ?"
+
+
+def outside_batch_sql(table: str) -> str:
+    """Condición de trigger: la fila no pertenece a un lote del núcleo de carga"""
+    return f"NOT EXISTS (SELECT 1 FROM batch_write_guard WHERE table_name = '{table}')"
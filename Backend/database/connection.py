@@ -9,16 +9,24 @@ Características principales:
 - Inicialización automática de esquema si no existe
 - Carga de datos iniciales en primera ejecución
 - Configuración optimizada de SQLite para rendimiento
+- Lecturas de análisis sobre un snapshot WAL consistente (sesiones y
+  conexiones de solo lectura) que no bloquean las cargas
+- Enrutamiento por misión: las sesiones y conexiones con mission_id usan el
+  archivo propio de las misiones fragmentadas (database/mission_shards.py)
 - Manejo robusto de errores y transacciones
 - Funciones de utilidad para mantenimiento
+- Backup en línea por pasos (API de backup de SQLite) que no detiene las
+  escrituras
 ===============================================================================
 """
 
 import os
 import sqlite3
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from contextlib import contextmanager
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
@@ -27,7 +35,11 @@ from sqlalchemy.exc import SQLAlchemyError
 import bcrypt
 import json
 
-from .models import Base, User, Role, Mission, get_all_models
+from .models import (
+    Base, User, Role, Mission, get_all_models,
+    CELLULAR_HASH_FIELDS, calculate_cellular_record_hash
+)
+from .mission_shards import get_mission_shard_router
 
 # Configuración de logging
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +49,42 @@ logger = logging.getLogger(__name__)
 DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'kronos.db')
 DEFAULT_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.sql')
 DEFAULT_INITIAL_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'initial_data.sql')
+CELLULAR_HASH_BACKFILL_BATCH = 5000  # Registros por lote al calcular record_hash
+
+# Checkpoint automático del WAL cada 4000 páginas (~16MB con páginas de 4KB).
+# El valor por defecto (1000) hace que las cargas masivas ejecuten checkpoints
+# dentro de sus commits; el resto lo hace el checkpoint PASSIVE en segundo
+# plano (services/wal_checkpoint_service.py)
+WAL_AUTOCHECKPOINT_PAGES = 4000
+# Tamaño al que se trunca el WAL después de un checkpoint completo
+WAL_JOURNAL_SIZE_LIMIT = 64 * 1024 * 1024
+
+# Pragmas de las conexiones de escritura de SQLAlchemy
+ENGINE_PRAGMAS = (
+    "PRAGMA auto_vacuum=INCREMENTAL",      # Solo aplica a BD nuevas; las anteriores: run_maintenance(convert_auto_vacuum=True)
+    "PRAGMA foreign_keys=ON",              # Habilitar foreign keys
+    "PRAGMA journal_mode=WAL",             # Write-Ahead Logging
+    "PRAGMA synchronous=NORMAL",           # Balance seguridad/velocidad
+    "PRAGMA cache_size=10000",             # 10MB cache
+    "PRAGMA temp_store=MEMORY",            # Temporales en memoria
+    "PRAGMA mmap_size=268435456",          # 256MB memory mapping
+    f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}",
+    f"PRAGMA journal_size_limit={WAL_JOURNAL_SIZE_LIMIT}"
+    # ANALYZE / PRAGMA optimize: después de cargas grandes, en inactividad
+    # (services/database_maintenance_service.py)
+)
+
+# Backup en línea: páginas copiadas por paso y pausa entre pasos
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP_SECONDS = 0.005
+
+# Pragmas de las conexiones de solo lectura (snapshots de análisis)
+READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA cache_size=10000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456"
+)
 
 
 class DatabaseManager:
@@ -46,19 +94,31 @@ class DatabaseManager:
         self.db_path = os.path.abspath(db_path)
         self.engine: Optional[Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
+        self.read_engine: Optional[Engine] = None
+        self.ReadSessionLocal: Optional[sessionmaker] = None
+        # Sesiones por misión fragmentada: (mission_id, solo lectura) -> sessionmaker
+        self._shard_sessions = {}
+        self._shard_lock = threading.Lock()
         self._initialized = False
+        self._deferred_checks_pending = False
         
-    def initialize(self, force_recreate: bool = False) -> None:
+    def initialize(self, force_recreate: bool = False, defer_checks: bool = False) -> None:
         """
         Inicializa la base de datos y crea las conexiones necesarias
         
         Args:
             force_recreate: Si True, elimina la BD existente y la recrea
+            defer_checks: Si True y la BD ya existe, omite la auto-reparación
+                de datos iniciales y la verificación de integridad; deben
+                ejecutarse luego con run_deferred_checks()
         """
         try:
             # Crear directorio si no existe
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
+            # El registro de misiones fragmentadas se vuelve a leer de la BD
+            self.dispose_shard_engines()
+            
             # Si force_recreate, eliminar DB existente
             if force_recreate and os.path.exists(self.db_path):
                 os.remove(self.db_path)
@@ -80,7 +140,7 @@ class DatabaseManager:
             )
             
             # Configurar eventos SQLite
-            self._setup_sqlite_events()
+            self._setup_sqlite_events(self.engine)
             
             # Crear SessionMaker
             self.SessionLocal = sessionmaker(
@@ -89,6 +149,9 @@ class DatabaseManager:
                 bind=self.engine
             )
             
+            # Engine de solo lectura para snapshots de análisis
+            self._setup_read_engine()
+            
             # Inicializar esquema y datos según sea necesario
             if is_new_database:
                 logger.info("Nueva base de datos detectada. Inicializando esquema y datos...")
@@ -99,11 +162,16 @@ class DatabaseManager:
                 logger.info(f"Conectado a base de datos existente: {self.db_path}")
                 # Asegurar que el esquema esté actualizado
                 self._ensure_schema_exists()
-                # Verificar y reparar datos faltantes
-                self._ensure_initial_data_exists()
             
-            # Verificar integridad final de la base de datos
-            self._verify_database_integrity()
+            self._deferred_checks_pending = defer_checks and not is_new_database
+            if not self._deferred_checks_pending:
+                if not is_new_database:
+                    # Verificar y reparar datos faltantes
+                    self._ensure_initial_data_exists()
+                # Verificar integridad final de la base de datos
+                self._verify_database_integrity()
+            else:
+                logger.info("Verificación de integridad diferida al arranque en segundo plano")
             
             self._initialized = True
             
@@ -111,26 +179,15 @@ class DatabaseManager:
             logger.error(f"Error al inicializar la base de datos: {e}")
             raise
     
-    def _setup_sqlite_events(self) -> None:
+    def _setup_sqlite_events(self, engine: Engine) -> None:
         """Configura eventos SQLite para optimización"""
         
-        @event.listens_for(self.engine, "connect")
+        @event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             """Configura pragmas SQLite para mejor rendimiento y integridad"""
             cursor = dbapi_connection.cursor()
             
-            # Configuraciones críticas de SQLite
-            pragmas = [
-                "PRAGMA foreign_keys=ON",              # Habilitar foreign keys
-                "PRAGMA journal_mode=WAL",             # Write-Ahead Logging
-                "PRAGMA synchronous=NORMAL",           # Balance seguridad/velocidad
-                "PRAGMA cache_size=10000",             # 10MB cache
-                "PRAGMA temp_store=MEMORY",            # Temporales en memoria
-                "PRAGMA mmap_size=268435456",          # 256MB memory mapping
-                "PRAGMA optimize"                       # Optimizar estadísticas
-            ]
-            
-            for pragma in pragmas:
+            for pragma in ENGINE_PRAGMAS:
                 try:
                     cursor.execute(pragma)
                 except sqlite3.Error as e:
@@ -138,6 +195,94 @@ class DatabaseManager:
             
             cursor.close()
     
+    def _setup_read_engine(self) -> None:
+        """
+        Crea el engine de solo lectura usado por get_read_session()
+        
+        pysqlite no inicia transacciones para SELECT, por lo que cada consulta
+        de una sesión vería un estado distinto de la BD. Aquí cada transacción
+        de la sesión emite BEGIN: la primera lectura fija un snapshot del WAL
+        y todas las consultas siguientes lo ven, sin bloquear a los escritores.
+        """
+        self.read_engine = create_engine(
+            f'sqlite:///{self.db_path}',
+            echo=False,
+            connect_args={
+                'check_same_thread': False,
+                'timeout': 20
+            }
+        )
+        self._setup_read_events(self.read_engine)
+        
+        self.ReadSessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.read_engine
+        )
+    
+    def _setup_read_events(self, engine: Engine) -> None:
+        """Configura un engine para snapshots de solo lectura"""
+        
+        @event.listens_for(engine, "connect")
+        def set_read_pragmas(dbapi_connection, connection_record):
+            """Conexión en modo autocommit del driver (BEGIN explícito) y solo lectura"""
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for pragma in READ_CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+        
+        @event.listens_for(engine, "begin")
+        def begin_snapshot(conn):
+            """Inicia la transacción de lectura que fija el snapshot"""
+            conn.exec_driver_sql("BEGIN")
+    
+    def _get_shard_sessionmaker(self, mission_id: Optional[str], read_only: bool) -> Optional[sessionmaker]:
+        """
+        Sessionmaker enrutado al fragmento de una misión, o None si la misión
+        usa la BD principal
+        """
+        router = get_mission_shard_router(self.db_path)
+        shard_path = router.get_shard_path(mission_id)
+        if shard_path is None:
+            return None
+        
+        key = (mission_id, read_only)
+        with self._shard_lock:
+            factory = self._shard_sessions.get(key)
+            if factory is None:
+                engine = create_engine(
+                    f'sqlite:///{shard_path}',
+                    echo=False,
+                    creator=lambda: router.connect(mission_id, check_same_thread=False, timeout=20)
+                )
+                if read_only:
+                    self._setup_read_events(engine)
+                else:
+                    self._setup_sqlite_events(engine)
+                factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                self._shard_sessions[key] = factory
+        return factory
+    
+    def is_mission_sharded(self, mission_id: Optional[str]) -> bool:
+        """True si la misión guarda sus datos masivos en un archivo propio"""
+        return get_mission_shard_router(self.db_path).get_shard_path(mission_id) is not None
+    
+    def get_sharded_missions(self) -> List[str]:
+        """IDs de las misiones con archivo propio"""
+        return sorted(get_mission_shard_router(self.db_path).list_shards())
+    
+    def dispose_shard_engines(self, mission_id: Optional[str] = None) -> None:
+        """
+        Cierra los engines de misiones fragmentadas (todas o una) y descarta el
+        registro en memoria; se llama después de migrar el almacenamiento de
+        una misión
+        """
+        with self._shard_lock:
+            for key in [key for key in self._shard_sessions if mission_id is None or key[0] == mission_id]:
+                self._shard_sessions.pop(key).kw['bind'].dispose()
+        get_mission_shard_router(self.db_path).invalidate()
+    
     def _create_schema(self) -> None:
         """Crea el esquema de la base de datos desde schema.sql"""
         try:
@@ -154,12 +299,88 @@ class DatabaseManager:
         try:
             # Verificar que el esquema esté actualizado
             Base.metadata.create_all(self.engine)
+            self._migrate_cellular_record_hash()
+            self._migrate_cellular_clear_marker()
             logger.info("Esquema verificado y actualizado")
             
         except Exception as e:
             logger.error(f"Error al verificar esquema: {e}")
             raise
     
+    def _migrate_cellular_record_hash(self) -> None:
+        """
+        Agrega la columna record_hash a cellular_data en BD anteriores y
+        calcula el hash de los registros que no lo tienen
+        """
+        with self.engine.begin() as conn:
+            columns = [row[1] for row in conn.execute(text("PRAGMA table_info(cellular_data)"))]
+            if 'record_hash' not in columns:
+                conn.execute(text("ALTER TABLE cellular_data ADD COLUMN record_hash TEXT"))
+                logger.info("Columna record_hash agregada a cellular_data")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_cellular_mission_record_hash "
+                "ON cellular_data (mission_id, record_hash)"
+            ))
+            self._backfill_cellular_record_hashes(conn)
+    
+    def _migrate_cellular_clear_marker(self) -> None:
+        """Agrega missions.cellular_clear_through_id en BD anteriores"""
+        with self.engine.begin() as conn:
+            columns = [row[1] for row in conn.execute(text("PRAGMA table_info(missions)"))]
+            if 'cellular_clear_through_id' not in columns:
+                conn.execute(text("ALTER TABLE missions ADD COLUMN cellular_clear_through_id INTEGER"))
+                logger.info("Columna cellular_clear_through_id agregada a missions")
+    
+    def _backfill_cellular_record_hashes(self, conn) -> int:
+        """
+        Calcula record_hash de los registros cargados sin hash, por lotes
+        
+        trg_clean_analysis_on_cellular_update (schema.sql) se quita durante el
+        cálculo y se recrea al final de la misma transacción: cambiar solo el
+        hash no altera los datos, y con el trigger cada fila eliminaría los
+        análisis de su operador en toda la misión.
+        
+        Args:
+            conn: Conexión SQLAlchemy dentro de una transacción
+            
+        Returns:
+            Número de registros actualizados
+        """
+        pending = conn.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM cellular_data WHERE record_hash IS NULL)"
+        )).scalar()
+        if not pending:
+            return 0
+        
+        trigger_sql = conn.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' "
+            "AND name = 'trg_clean_analysis_on_cellular_update'"
+        )).scalar()
+        if trigger_sql:
+            conn.execute(text("DROP TRIGGER trg_clean_analysis_on_cellular_update"))
+        
+        updated = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(text(
+                f"SELECT id, {', '.join(CELLULAR_HASH_FIELDS)} FROM cellular_data "
+                f"WHERE record_hash IS NULL AND id > :last_id ORDER BY id LIMIT {CELLULAR_HASH_BACKFILL_BATCH}"
+            ), {'last_id': last_id}).mappings().all()
+            if not rows:
+                break
+            conn.execute(
+                text("UPDATE cellular_data SET record_hash = :row_hash WHERE id = :row_id"),
+                [{'row_id': row['id'], 'row_hash': calculate_cellular_record_hash(row)} for row in rows]
+            )
+            updated += len(rows)
+            last_id = rows[-1]['id']
+        
+        if trigger_sql:
+            conn.execute(text(trigger_sql))
+        
+        logger.info(f"Hash de contenido calculado para {updated} registros celulares existentes")
+        return updated
+    
     def _ensure_initial_data_exists(self) -> None:
         """Verifica y carga datos iniciales si faltan en BD existente"""
         try:
@@ -418,13 +639,30 @@ class DatabaseManager:
             logger.error(f"ERROR CRÍTICO en verificación final de integridad: {e}")
             raise
     
+    def run_deferred_checks(self) -> None:
+        """
+        Ejecuta la auto-reparación de datos iniciales y la verificación de
+        integridad omitidas con initialize(defer_checks=True)
+        """
+        if not self._deferred_checks_pending:
+            return
+        self._ensure_initial_data_exists()
+        self._verify_database_integrity()
+        self._deferred_checks_pending = False
+    
     @contextmanager
-    def get_session(self):
-        """Context manager para obtener una sesión de base de datos"""
+    def get_session(self, mission_id: Optional[str] = None):
+        """
+        Context manager para obtener una sesión de base de datos
+        
+        Args:
+            mission_id: Si se indica y la misión está fragmentada, la sesión
+                usa el archivo de la misión (con kronos.db adjunta)
+        """
         if not self._initialized:
             raise ValueError("DatabaseManager no ha sido inicializado")
         
-        session = self.SessionLocal()
+        session = (self._get_shard_sessionmaker(mission_id, False) or self.SessionLocal)()
         try:
             yield session
         except Exception as e:
@@ -434,6 +672,30 @@ class DatabaseManager:
         finally:
             session.close()
     
+    @contextmanager
+    def get_read_session(self, mission_id: Optional[str] = None):
+        """
+        Context manager para consultas de análisis sobre un snapshot consistente
+        
+        Todas las consultas de la sesión ven la BD como estaba en la primera
+        lectura, aunque una carga esté insertando en paralelo. La sesión es de
+        solo lectura (query_only) y conviene mantenerla abierta solo durante
+        la consulta: un snapshot abierto impide reiniciar el WAL.
+        
+        Args:
+            mission_id: Si se indica y la misión está fragmentada, la sesión
+                usa el archivo de la misión (con kronos.db adjunta)
+        """
+        if not self._initialized:
+            raise ValueError("DatabaseManager no ha sido inicializado")
+        
+        session = (self._get_shard_sessionmaker(mission_id, True) or self.ReadSessionLocal)()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            session.close()
+    
     def get_engine(self) -> Engine:
         """Retorna el engine de SQLAlchemy"""
         if not self._initialized:
@@ -450,12 +712,12 @@ class DatabaseManager:
             logger.error(f"Error ejecutando SQL: {e}")
             raise
     
-    def backup_database(self, backup_path: str) -> None:
-        """Crea un backup de la base de datos"""
+    def backup_database(self, backup_path: str) -> Dict[str, Any]:
+        """Crea un backup en línea de la base de datos (ver online_backup)"""
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
-            logger.info(f"Backup creado: {backup_path}")
+            result = online_backup(self.db_path, backup_path)
+            logger.info(f"Backup creado: {backup_path} ({result['pages']} páginas en {result['durationSeconds']}s)")
+            return result
         except Exception as e:
             logger.error(f"Error creando backup: {e}")
             raise
@@ -472,6 +734,9 @@ class DatabaseManager:
     
     def close(self) -> None:
         """Cierra las conexiones de base de datos"""
+        self.dispose_shard_engines()
+        if self.read_engine:
+            self.read_engine.dispose()
         if self.engine:
             self.engine.dispose()
             self._initialized = False
@@ -486,12 +751,13 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
-def init_database(db_path: str = DEFAULT_DB_PATH, force_recreate: bool = False) -> None:
+def init_database(db_path: str = DEFAULT_DB_PATH, force_recreate: bool = False,
+                  defer_checks: bool = False) -> None:
     """Inicializa la base de datos global"""
     global db_manager
     if db_path != DEFAULT_DB_PATH:
         db_manager = DatabaseManager(db_path)
-    db_manager.initialize(force_recreate=force_recreate)
+    db_manager.initialize(force_recreate=force_recreate, defer_checks=defer_checks)
 
 
 def get_db_session():
@@ -541,18 +807,103 @@ def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 
+def online_backup(source_path: str, target_path: str,
+                  pages_per_step: int = BACKUP_PAGES_PER_STEP,
+                  step_sleep_seconds: float = BACKUP_STEP_SLEEP_SECONDS) -> Dict[str, Any]:
+    """
+    Copia una base de datos SQLite con la API de backup, por pasos
+    
+    La conexión de origen mantiene una transacción de lectura durante toda la
+    copia: el backup es el snapshot WAL del inicio y no se reinicia cuando
+    otra conexión confirma cambios. Entre pasos no se mantiene ningún bloqueo
+    de escritura y la pausa deja pasar a las cargas en curso.
+    
+    Args:
+        source_path: Base de datos de origen
+        target_path: Archivo destino (se reemplaza)
+        pages_per_step: Páginas copiadas por paso
+        step_sleep_seconds: Pausa entre pasos
+        
+    Returns:
+        Dict con 'pages', 'steps' y 'durationSeconds'
+    """
+    started = time.perf_counter()
+    steps = []
+    
+    def throttle(status, remaining, total):
+        steps.append(total)
+        if remaining and step_sleep_seconds:
+            time.sleep(step_sleep_seconds)
+    
+    source = sqlite3.connect(source_path, isolation_level=None, timeout=20)
+    try:
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=pages_per_step, progress=throttle)
+        finally:
+            target.close()
+        source.execute("COMMIT")
+    finally:
+        source.close()
+    
+    return {
+        'pages': steps[-1] if steps else 0,
+        'steps': len(steps),
+        'durationSeconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def _connect(mission_id: Optional[str] = None, **connect_kwargs) -> sqlite3.Connection:
+    """Conexión a la BD principal o, si la misión está fragmentada, a su archivo"""
+    conn = None
+    if mission_id:
+        conn = get_mission_shard_router(db_manager.db_path).connect(mission_id, **connect_kwargs)
+    # Misma BD que el gestor global (por defecto Backend/kronos.db)
+    return conn or sqlite3.connect(db_manager.db_path, **connect_kwargs)
+
+
 @contextmanager  
-def get_db_connection():
+def get_db_connection(mission_id: Optional[str] = None):
     """
     Context manager para obtener conexión SQLite directa para operator services
     
     Esta función proporciona una conexión SQLite simple para uso en los servicios
     de operadores que necesitan acceso directo a la base de datos.
+    
+    Args:
+        mission_id: Si se indica y la misión está fragmentada, las tablas
+            masivas se leen y escriben en el archivo de la misión
     """
-    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'kronos.db')
-    conn = sqlite3.connect(db_path)
+    conn = _connect(mission_id)
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA wal_autocheckpoint = {WAL_AUTOCHECKPOINT_PAGES}")
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+@contextmanager
+def get_db_read_connection(mission_id: Optional[str] = None):
+    """
+    Context manager para una conexión SQLite de solo lectura sobre un
+    snapshot consistente (ver DatabaseManager.get_read_session)
+    
+    Todas las consultas de la conexión ven la BD como estaba en la primera
+    lectura; las cargas en curso no la bloquean ni son bloqueadas por ella.
+    
+    Args:
+        mission_id: Si se indica y la misión está fragmentada, las tablas
+            masivas se leen del archivo de la misión
+    """
+    conn = _connect(mission_id, isolation_level=None)
     try:
+        for pragma in READ_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("BEGIN")
         yield conn
     finally:
-        conn.close()
\ No newline at end of file
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.close()
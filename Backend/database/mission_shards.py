@@ -0,0 +1,288 @@
+"""
+KRONOS Mission Shards
+===============================================================================
+Almacenamiento opcional de los datos masivos de una misión en su propio
+archivo SQLite.
+
+Las tablas masivas (operator_call_data, operator_cellular_data y
+cellular_data) de una misión fragmentada, junto con los diccionarios de
+operator_specific_data de sus archivos, viven en mission_shards/<misión>.db
+junto a kronos.db; usuarios, roles, misiones, hojas de operador y el resto
+de metadatos siguen en kronos.db.
+
+Enrutamiento transparente: la conexión de una misión fragmentada abre el
+archivo de la misión como base principal y adjunta kronos.db como 'shared'
+(ATTACH DATABASE). SQLite resuelve los nombres sin esquema buscando primero
+en la base principal, por lo que las mismas consultas de los servicios leen
+y escriben las tablas masivas de la misión (y solo sus índices) y siguen
+viendo los metadatos compartidos.
+
+Limitaciones propias de SQLite entre archivos:
+- Las claves foráneas no cruzan archivos: las tablas del fragmento se crean
+  sin ellas y la eliminación de la misión borra el archivo completo
+- Los triggers de kronos.db sobre las tablas masivas se recrean como
+  triggers TEMP en cada conexión (pueden escribir en 'shared'), salvo los
+  que indexan por ID de fila (índice espacial R*Tree): los IDs de distintos
+  archivos pueden coincidir
+- Las vistas de kronos.db no ven los datos de las misiones fragmentadas
+
+El registro de fragmentos es la tabla mission_shards de kronos.db; una
+misión sin registro usa kronos.db como siempre.
+
+Author: KRONOS Development Team
+Date: 2026-10-19
+===============================================================================
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tablas masivas que se guardan en el archivo de cada misión fragmentada
+SHARDED_TABLES = ('operator_call_data', 'operator_cellular_data', 'cellular_data')
+
+# Tablas por archivo de operador (file_upload_id) que acompañan a las filas
+# masivas: el diccionario de operator_specific_data se lee en la misma conexión
+FILE_SCOPED_TABLES = ('operator_specific_fields',)
+
+# Nombre del esquema de kronos.db en las conexiones de una misión fragmentada
+SHARED_SCHEMA = 'shared'
+
+SHARD_DIRECTORY_NAME = 'mission_shards'
+
+# Triggers que indexan por ID de fila en tablas de kronos.db: no se aplican a
+# los fragmentos y siguen activos al migrar (ver services/spatial_index_service.py)
+ROW_ID_TRIGGER_PREFIXES = ('trg_spatial_',)
+
+SHARD_REGISTRY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS mission_shards (
+        mission_id TEXT PRIMARY KEY,
+        shard_file TEXT NOT NULL UNIQUE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+_FOREIGN_KEY_ACTION = r'(?:\s+ON\s+(?:DELETE|UPDATE)\s+(?:SET\s+NULL|SET\s+DEFAULT|CASCADE|RESTRICT|NO\s+ACTION))*'
+_TABLE_FOREIGN_KEY = re.compile(
+    r',\s*(?:CONSTRAINT\s+\w+\s+)?FOREIGN\s+KEY\s*\([^)]*\)\s*REFERENCES\s+"?\w+"?\s*(?:\([^)]*\))?' + _FOREIGN_KEY_ACTION,
+    re.IGNORECASE
+)
+_COLUMN_FOREIGN_KEY = re.compile(r'\s+REFERENCES\s+"?\w+"?\s*(?:\([^)]*\))?' + _FOREIGN_KEY_ACTION, re.IGNORECASE)
+_SQL_COMMENT = re.compile(r'--[^\n]*')
+
+
+class MissionShardError(Exception):
+    """Excepción personalizada para errores de fragmentos de misión"""
+    pass
+
+
+def _without_foreign_keys(table_sql: str) -> str:
+    """DDL de una tabla sin claves foráneas (no pueden referenciar otro archivo)"""
+    sql = _SQL_COMMENT.sub('', table_sql)
+    sql = _TABLE_FOREIGN_KEY.sub('', sql)
+    return _COLUMN_FOREIGN_KEY.sub('', sql)
+
+
+def _as_temp_trigger(trigger_sql: str, table: str) -> str:
+    """DDL de un trigger de kronos.db como trigger TEMP sobre la tabla del fragmento"""
+    sql = re.sub(r'^\s*CREATE\s+TRIGGER\s+(?:IF\s+NOT\s+EXISTS\s+)?', 'CREATE TEMP TRIGGER IF NOT EXISTS ',
+                 _SQL_COMMENT.sub('', trigger_sql), count=1, flags=re.IGNORECASE)
+    return re.sub(rf'\bON\s+"?{table}"?(?=\s)', f'ON main.{table}', sql, count=1, flags=re.IGNORECASE)
+
+
+class MissionShardRouter:
+    """
+    Registro de misiones fragmentadas y conexiones enrutadas a su archivo
+
+    Una instancia por base de datos (ver get_mission_shard_router); el
+    registro se lee una vez y se mantiene en memoria.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = os.path.abspath(db_path)
+        self.shard_dir = os.path.join(os.path.dirname(self.db_path), SHARD_DIRECTORY_NAME)
+        self._lock = threading.Lock()
+        self._shards: Optional[Dict[str, str]] = None
+
+    def _registry(self) -> Dict[str, str]:
+        """Misión -> ruta del fragmento (se carga en la primera consulta)"""
+        shards = self._shards
+        if shards is None:
+            with self._lock:
+                if self._shards is None:
+                    self._shards = self._load_registry()
+                shards = self._shards
+        return shards
+
+    def _load_registry(self) -> Dict[str, str]:
+        if not os.path.exists(self.db_path):
+            return {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='mission_shards'"
+            ).fetchone()
+            if not exists:
+                return {}
+            rows = conn.execute("SELECT mission_id, shard_file FROM mission_shards").fetchall()
+        finally:
+            conn.close()
+        return {mission_id: os.path.join(self.shard_dir, shard_file) for mission_id, shard_file in rows}
+
+    def invalidate(self) -> None:
+        """Descarta el registro en memoria (después de migrar)"""
+        with self._lock:
+            self._shards = None
+
+    def get_shard_path(self, mission_id: Optional[str]) -> Optional[str]:
+        """Ruta del archivo de la misión, o None si usa kronos.db"""
+        if not mission_id:
+            return None
+        return self._registry().get(mission_id)
+
+    def list_shards(self) -> Dict[str, str]:
+        """Copia del registro misión -> ruta del fragmento"""
+        return dict(self._registry())
+
+    def shard_file_name(self, mission_id: str) -> str:
+        """Nombre de archivo estable y seguro para el fragmento de una misión"""
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', mission_id)[:60]
+        digest = hashlib.sha1(mission_id.encode('utf-8')).hexdigest()[:8]
+        return f"{safe_id}_{digest}.db"
+
+    def connect(self, mission_id: Optional[str], **connect_kwargs) -> Optional[sqlite3.Connection]:
+        """
+        Abre una conexión enrutada al fragmento de la misión
+
+        Args:
+            mission_id: ID de la misión
+            **connect_kwargs: Argumentos de sqlite3.connect (isolation_level, ...)
+
+        Returns:
+            Conexión con el fragmento como base principal y kronos.db adjunta
+            como 'shared', o None si la misión no está fragmentada
+        """
+        shard_path = self.get_shard_path(mission_id)
+        if shard_path is None:
+            return None
+        conn = sqlite3.connect(shard_path, **connect_kwargs)
+        try:
+            conn.execute(f"ATTACH DATABASE ? AS {SHARED_SCHEMA}", (self.db_path,))
+            for trigger_sql in self._shared_triggers(conn):
+                conn.execute(trigger_sql)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _shared_triggers(self, conn: sqlite3.Connection) -> List[str]:
+        """
+        Triggers de kronos.db sobre las tablas masivas, como triggers TEMP
+
+        Se leen en cada conexión (el esquema ya está en memoria) para incluir
+        los triggers creados después, como los del índice de números.
+        """
+        return [
+            _as_temp_trigger(sql, table)
+            for _, table, sql in bulk_table_triggers(conn, SHARED_SCHEMA)
+        ]
+
+    def shard_schema(self, conn: sqlite3.Connection) -> List[str]:
+        """
+        DDL de las tablas masivas y sus índices para un fragmento, tomada de
+        kronos.db (conn) para que las columnas e índices coincidan
+        """
+        statements = []
+        for table in SHARDED_TABLES + FILE_SCOPED_TABLES:
+            rows = conn.execute("""
+                SELECT type, sql FROM main.sqlite_master
+                WHERE tbl_name = ? AND type IN ('table', 'index') AND sql IS NOT NULL
+                ORDER BY type = 'index', name
+            """, (table,)).fetchall()
+            if not rows and table in SHARDED_TABLES:
+                raise MissionShardError(f"Tabla {table} no existe en la base de datos principal")
+            for object_type, sql in rows:
+                statements.append(_without_foreign_keys(sql) if object_type == 'table' else sql)
+        return statements
+
+    def create_shard_file(self, conn: sqlite3.Connection, mission_id: str) -> str:
+        """
+        Crea (o recrea vacío) el archivo de fragmento de una misión sin registrarlo
+
+        Args:
+            conn: Conexión a kronos.db de la que se copia el esquema
+            mission_id: ID de la misión
+
+        Returns:
+            Ruta del archivo creado
+        """
+        os.makedirs(self.shard_dir, exist_ok=True)
+        shard_path = os.path.join(self.shard_dir, self.shard_file_name(mission_id))
+        remove_shard_file(shard_path)
+
+        shard = sqlite3.connect(shard_path)
+        try:
+            shard.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            shard.execute("PRAGMA journal_mode=WAL")
+            for statement in self.shard_schema(conn):
+                shard.execute(statement)
+            shard.commit()
+        finally:
+            shard.close()
+        return shard_path
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Misiones fragmentadas con el tamaño de su archivo"""
+        status = []
+        for mission_id, shard_path in sorted(self.list_shards().items()):
+            status.append({
+                'missionId': mission_id,
+                'shardFile': os.path.basename(shard_path),
+                'exists': os.path.exists(shard_path),
+                'sizeBytes': sum(
+                    os.path.getsize(path) for path in (shard_path, f"{shard_path}-wal")
+                    if os.path.exists(path)
+                )
+            })
+        return status
+
+
+def bulk_table_triggers(conn: sqlite3.Connection, schema: str = 'main') -> List[tuple]:
+    """
+    Triggers (name, tbl_name, sql) del esquema sobre las tablas masivas,
+    sin los que indexan por ID de fila
+    """
+    rows = conn.execute(f"""
+        SELECT name, tbl_name, sql FROM {schema}.sqlite_master
+        WHERE type = 'trigger' AND sql IS NOT NULL
+          AND tbl_name IN ({','.join('?' * len(SHARDED_TABLES))})
+    """, SHARDED_TABLES).fetchall()
+    return [row for row in rows if not row[0].startswith(ROW_ID_TRIGGER_PREFIXES)]
+
+
+def remove_shard_file(shard_path: str) -> None:
+    """Elimina el archivo de un fragmento junto con su WAL"""
+    for path in (shard_path, f"{shard_path}-wal", f"{shard_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# Una instancia por ruta de base de datos
+_mission_shard_routers: Dict[str, MissionShardRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_mission_shard_router(db_path: str) -> MissionShardRouter:
+    """Retorna el enrutador de fragmentos de la base de datos indicada"""
+    db_path = os.path.abspath(db_path)
+    router = _mission_shard_routers.get(db_path)
+    if router is None:
+        with _routers_lock:
+            router = _mission_shard_routers.setdefault(db_path, MissionShardRouter(db_path))
+    return router
@@ -16,13 +16,14 @@ Características principales:
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+import hashlib
 import json
 from sqlalchemy import (
     Column, String, Text, Integer, Float, DateTime, ForeignKey,
     CheckConstraint, UniqueConstraint, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm import relationship, validates, object_session
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -158,6 +159,9 @@ class Mission(Base, BaseModel):
     created_at = Column(DateTime, default=func.current_timestamp())
     updated_at = Column(DateTime, default=func.current_timestamp())
     created_by = Column(String, ForeignKey('users.id'))
+    # Último id de cellular_data de una limpieza en segundo plano en curso:
+    # los registros con id menor o igual se ignoran hasta que termine
+    cellular_clear_through_id = Column(Integer)
     
     # Relaciones
     creator = relationship("User", back_populates="created_missions")
@@ -192,11 +196,15 @@ class Mission(Base, BaseModel):
             result['updatedAt'] = result.pop('updated_at')
         if 'created_by' in result:
             result['createdBy'] = result.pop('created_by')
+        result.pop('cellular_clear_through_id', None)
         
         # Incluir datos celulares (solo si se solicitan explícitamente)
         # Para evitar N+1 queries, estos se cargarán bajo demanda
         if hasattr(self, '_include_relations') and self._include_relations:
-            result['cellularData'] = [cd.to_dict() for cd in self.cellular_data] if self.cellular_data else []
+            clear_through_id = self.cellular_clear_through_id or 0
+            result['cellularData'] = [
+                cd.to_dict() for cd in self.cellular_data if cd.id > clear_through_id
+            ] if self.cellular_data else []
             result['operatorData'] = []  # Mantener estructura para compatibilidad con frontend
         
         return result
@@ -208,18 +216,73 @@ class Mission(Base, BaseModel):
         delattr(self, '_include_relations')
         return result
     
+    def active_cellular_filter(self):
+        """
+        Condición que excluye los registros celulares de una limpieza en
+        segundo plano en curso (services/bulk_deletion_service.py)
+        """
+        return CellularData.id > (self.cellular_clear_through_id or 0)
+    
     def get_stats(self) -> Dict[str, int]:
-        """Retorna estadísticas de la misión"""
+        """
+        Retorna estadísticas de la misión
+        
+        Usa COUNT en la base de datos en lugar de cargar las relaciones
+        completas; solo recurre a len() si la instancia está desconectada.
+        """
+        session = object_session(self)
+        if session is None:
+            return {
+                'cellularRecordsCount': len(self.cellular_data) if self.cellular_data else 0,
+                'operatorSheetsCount': 0,  # Mantener para compatibilidad con frontend
+                'targetRecordsCount': len(self.target_records) if self.target_records else 0
+            }
+        
+        cellular_count = session.query(func.count(CellularData.id)).filter(
+            CellularData.mission_id == self.id,
+            self.active_cellular_filter()
+        ).scalar()
+        target_count = session.query(func.count(TargetRecord.id)).filter(
+            TargetRecord.mission_id == self.id
+        ).scalar()
+        
         return {
-            'cellularRecordsCount': len(self.cellular_data) if self.cellular_data else 0,
+            'cellularRecordsCount': cellular_count or 0,
             'operatorSheetsCount': 0,  # Mantener para compatibilidad con frontend
-            'targetRecordsCount': len(self.target_records) if self.target_records else 0
+            'targetRecordsCount': target_count or 0
         }
     
     def __repr__(self):
         return f"<Mission(id='{self.id}', code='{self.code}', status='{self.status}')>"
 
 
+# Campos que definen el contenido de una medición para la deduplicación.
+# file_record_id se excluye porque el escáner reinicia el Id en cada sesión.
+CELLULAR_HASH_FIELDS = (
+    'punto', 'lat', 'lon', 'mnc_mcc', 'operator', 'rssi', 'tecnologia',
+    'cell_id', 'lac_tac', 'enb', 'channel', 'comentario'
+)
+
+
+def calculate_cellular_record_hash(record: Dict[str, Any]) -> str:
+    """
+    Calcula el hash de contenido (record_hash) de una medición SCANHUNTER
+    
+    Args:
+        record: Registro celular con los campos de CELLULAR_HASH_FIELDS
+        
+    Returns:
+        Hash SHA256 hexadecimal
+    """
+    values = []
+    for field in CELLULAR_HASH_FIELDS:
+        value = record.get(field)
+        if field in ('lat', 'lon') and value is not None:
+            value = f"{float(value):.6f}"
+        values.append('' if value is None else str(value).strip())
+    return hashlib.sha256('|'.join(values).encode('utf-8')).hexdigest()
+
+
 class CellularData(Base, BaseModel):
     """Modelo para la tabla cellular_data expandida con todos los campos SCANHUNTER"""
     __tablename__ = 'cellular_data'
@@ -253,6 +316,9 @@ class CellularData(Base, BaseModel):
     # Información adicional
     comentario = Column(Text)                       # Observaciones, contexto temporal
     
+    # Deduplicación de cargas incrementales (SHA256 del contenido de la medición)
+    record_hash = Column(String)
+    
     # Auditoría
     created_at = Column(DateTime, default=func.current_timestamp())
     
@@ -311,6 +377,7 @@ class CellularData(Base, BaseModel):
         Index('idx_cellular_location', 'lat', 'lon'),
         Index('idx_cellular_geo_analysis', 'mission_id', 'operator', 'lat', 'lon', 'rssi'),
         Index('idx_cellular_coverage_analysis', 'mission_id', 'tecnologia', 'operator', 'rssi'),
+        Index('idx_cellular_mission_record_hash', 'mission_id', 'record_hash'),  # Deduplicación en modo append
     )
     
     @validates('tecnologia')
@@ -341,6 +408,9 @@ class CellularData(Base, BaseModel):
         """Serialización expandida para compatibilidad con frontend SCANHUNTER"""
         result = super().to_dict()
         
+        # El hash de contenido es interno, no se expone al frontend
+        result.pop('record_hash', None)
+        
         # Convertir coordenadas a strings para coincidir con el frontend
         result['lat'] = str(result['lat']) if result.get('lat') is not None else ''
         result['lon'] = str(result['lon']) if result.get('lon') is not None else ''
@@ -44,7 +44,7 @@ CREATE TABLE operator_data_sheets (
     operator_file_format TEXT NOT NULL,       -- Formato específico del archivo
     
     -- Estado de procesamiento
-    processing_status TEXT NOT NULL DEFAULT 'PENDING', -- 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED'
+    processing_status TEXT NOT NULL DEFAULT 'PENDING', -- 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED' | 'DELETING'
     records_processed INTEGER DEFAULT 0,
     records_failed INTEGER DEFAULT 0,
     processing_start_time DATETIME,
@@ -68,7 +68,7 @@ CREATE TABLE operator_data_sheets (
     CHECK (length(file_checksum) = 64), -- SHA256 hex length
     CHECK (file_type IN ('CELLULAR_DATA', 'CALL_DATA')),
     CHECK (operator IN ('CLARO', 'MOVISTAR', 'TIGO', 'WOM')),
-    CHECK (processing_status IN ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED')),
+    CHECK (processing_status IN ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', 'DELETING')),
     CHECK (records_processed >= 0),
     CHECK (records_failed >= 0),
     CHECK (processing_start_time IS NULL OR processing_end_time IS NULL OR processing_start_time <= processing_end_time)
@@ -375,6 +375,12 @@ CREATE INDEX idx_cellular_numero_fecha ON operator_cellular_data(numero_telefono
 CREATE INDEX idx_cellular_celda_fecha ON operator_cellular_data(celda_id, fecha_hora_inicio);
 CREATE INDEX idx_cellular_operator_fecha ON operator_cellular_data(operator, fecha_hora_inicio);
 
+-- Índices para paginación por cursor de get_operator_sheet_data (orden y filtros por archivo)
+CREATE INDEX idx_cellular_file_upload ON operator_cellular_data(file_upload_id);
+CREATE INDEX idx_cellular_file_fecha ON operator_cellular_data(file_upload_id, fecha_hora_inicio);
+CREATE INDEX idx_cellular_file_numero ON operator_cellular_data(file_upload_id, numero_telefono);
+CREATE INDEX idx_cellular_file_celda ON operator_cellular_data(file_upload_id, celda_id);
+
 -- Índices para operator_call_data (optimizados para análisis de comunicaciones)
 CREATE INDEX idx_calls_mission_operator ON operator_call_data(mission_id, operator);
 CREATE INDEX idx_calls_numero_objetivo ON operator_call_data(numero_objetivo);
@@ -391,6 +397,14 @@ CREATE INDEX idx_calls_objetivo_fecha ON operator_call_data(numero_objetivo, fec
 CREATE INDEX idx_calls_origen_destino ON operator_call_data(numero_origen, numero_destino);
 CREATE INDEX idx_calls_tipo_fecha ON operator_call_data(tipo_llamada, fecha_hora_llamada);
 
+-- Índices para paginación por cursor de get_operator_sheet_data (orden y filtros por archivo)
+CREATE INDEX idx_calls_file_upload ON operator_call_data(file_upload_id);
+CREATE INDEX idx_calls_file_fecha ON operator_call_data(file_upload_id, fecha_hora_llamada);
+CREATE INDEX idx_calls_file_origen ON operator_call_data(file_upload_id, numero_origen);
+CREATE INDEX idx_calls_file_destino ON operator_call_data(file_upload_id, numero_destino);
+CREATE INDEX idx_calls_file_objetivo ON operator_call_data(file_upload_id, numero_objetivo);
+CREATE INDEX idx_calls_file_celda_origen ON operator_call_data(file_upload_id, celda_origen);
+
 -- Índices para file_processing_logs
 CREATE INDEX idx_logs_file_upload ON file_processing_logs(file_upload_id);
 CREATE INDEX idx_logs_level_time ON file_processing_logs(log_level, logged_at);
@@ -9,11 +9,15 @@ Funciones expuestas para el frontend:
 - Authentication: login
 - Users: get_users, create_user, update_user, delete_user
 - Roles: get_roles, create_role, update_role, delete_role
-- Missions: get_missions, create_mission, update_mission, delete_mission
+- Missions: get_missions, get_missions_summary, get_mission_cellular_data,
+  create_mission, update_mission, delete_mission
 - File Upload: upload_cellular_data
-- Data Management: clear_cellular_data
+- Data Management: clear_cellular_data, get_deletion_job_status, list_deletion_jobs
 - Analysis: run_analysis, analyze_correlation, get_correlation_summary
 - Call Data: get_call_interactions
+- Startup: get_startup_status
+- Spatial: find_points_in_bbox, find_points_within_radius, find_nearest_points,
+  find_cells_near_hunter_point
 
 Características principales:
 - Inicialización automática de base de datos
@@ -41,7 +45,7 @@ sys.path.insert(0, str(current_dir))
 import eel
 
 # Importar servicios
-from database.connection import init_database, get_database_manager, get_db_connection
+from database.connection import init_database, get_database_manager, get_db_read_connection
 import sqlite3
 from services.auth_service import get_auth_service, AuthenticationError
 from services.user_service import get_user_service, UserServiceError
@@ -54,9 +58,21 @@ from services.diagram_correlation_service import get_diagram_correlation_service
 from services.correlation_service_dynamic import get_correlation_service_dynamic
 from services.correlation_service_hunter_validated import get_correlation_service_hunter_validated
 from services.file_processor import FileProcessorError
+from services.spatial_index_service import get_spatial_index_service, SpatialIndexServiceError
+from services.number_search_index_service import get_number_search_index_service, NumberSearchIndexServiceError
+from services.cell_dictionary_service import get_cell_dictionary_service
+from services.communication_graph_service import get_communication_graph_service, CommunicationGraphServiceError
+from services.bulk_deletion_service import (
+    get_bulk_deletion_service, BulkDeletionServiceError, active_sheet_rows_sql, active_cellular_rows_sql
+)
+from services.wal_checkpoint_service import get_wal_checkpoint_service, WalCheckpointServiceError
+from services.mission_shard_service import get_mission_shard_service, MissionShardServiceError
+from services.backup_service import get_backup_service, BackupServiceError
+from services.database_maintenance_service import get_database_maintenance_service, DatabaseMaintenanceServiceError
+from utils.columnar_response import encode_columnar, is_columnar_format
 
 # Importar servicio de datos de operador (para registrar funciones Eel expuestas)
-import services.operator_data_service
+from services.operator_data_service import get_operator_data_service
 
 # Configurar logging
 logging.basicConfig(
@@ -565,6 +581,66 @@ def get_missions():
         handle_service_error("get_missions", e)
 
 
+@eel.expose
+def get_missions_summary(page=1, page_size=50, search=None):
+    """
+    Obtiene un listado liviano y paginado de misiones (sin datos celulares)
+    
+    Args:
+        page: Número de página (empieza en 1)
+        page_size: Misiones por página
+        search: Texto opcional para filtrar por código, nombre o descripción
+        
+    Returns:
+        {"data": [...], "total": int, "hasMore": bool, "page": int, "pageSize": int}
+    """
+    try:
+        logger.info(f"Obteniendo resumen de misiones (página {page}, búsqueda: {search})")
+        
+        # Lazy loading: obtener servicio si la variable global no está inicializada
+        global mission_service
+        if mission_service is None:
+            logger.warning("Servicio de misiones no inicializado, creando instancia lazy")
+            mission_service = get_mission_service()
+        
+        summary = mission_service.get_missions_summary(page=page, page_size=page_size, search=search)
+        logger.info(f"Enviando {len(summary['data'])} de {summary['total']} misiones al frontend")
+        return summary
+    except MissionServiceError as e:
+        handle_service_error("get_missions_summary", e)
+    except Exception as e:
+        handle_service_error("get_missions_summary", e)
+
+
+@eel.expose
+def get_mission_cellular_data(mission_id, page=1, page_size=1000):
+    """
+    Obtiene los datos celulares (SCANHUNTER) de una misión bajo demanda
+    
+    Args:
+        mission_id: ID de la misión
+        page: Número de página (empieza en 1)
+        page_size: Registros por página
+        
+    Returns:
+        {"data": [...], "total": int, "hasMore": bool, "page": int, "pageSize": int}
+    """
+    try:
+        logger.info(f"Obteniendo datos celulares de misión {mission_id} (página {page})")
+        
+        # Lazy loading: obtener servicio si la variable global no está inicializada
+        global mission_service
+        if mission_service is None:
+            logger.warning("Servicio de misiones no inicializado, creando instancia lazy")
+            mission_service = get_mission_service()
+        
+        return mission_service.get_mission_cellular_data(mission_id, page=page, page_size=page_size)
+    except MissionServiceError as e:
+        handle_service_error("get_mission_cellular_data", e)
+    except Exception as e:
+        handle_service_error("get_mission_cellular_data", e)
+
+
 @eel.expose
 def create_mission(mission_data):
     """
@@ -659,19 +735,20 @@ def delete_mission(mission_id):
 # ============================================================================
 
 @eel.expose
-def upload_cellular_data(mission_id, file_data):
+def upload_cellular_data(mission_id, file_data, mode='replace'):
     """
     Carga datos celulares desde archivo a una misión
     
     Args:
         mission_id: ID de la misión
         file_data: {"name": "...", "content": "data:mime/type;base64,..."}
+        mode: 'replace' (reemplaza datos existentes) o 'append' (agrega)
         
     Returns:
-        Misión actualizada con nuevos datos
+        Misión actualizada (sin datos celulares) con conteos y 'uploadSummary'
     """
     try:
-        logger.info(f"Cargando datos celulares para misión: {mission_id}")
+        logger.info(f"Cargando datos celulares para misión: {mission_id} (modo: {mode})")
         
         # Lazy loading: obtener servicio si la variable global no está inicializada
         global mission_service
@@ -679,7 +756,7 @@ def upload_cellular_data(mission_id, file_data):
             logger.warning("Servicio de misiones no inicializado, creando instancia lazy")
             mission_service = get_mission_service()
         
-        updated_mission = mission_service.upload_cellular_data(mission_id, file_data)
+        updated_mission = mission_service.upload_cellular_data(mission_id, file_data, mode=mode)
         logger.info("Datos celulares cargados exitosamente")
         return updated_mission
     except (MissionServiceError, FileProcessorError) as e:
@@ -694,15 +771,19 @@ def upload_cellular_data(mission_id, file_data):
 
 
 @eel.expose
-def clear_cellular_data(mission_id):
+def clear_cellular_data(mission_id, vacuum=False):
     """
     Elimina todos los datos celulares de una misión
     
+    La eliminación de registros continúa en segundo plano por lotes; su
+    progreso se consulta con get_deletion_job_status.
+    
     Args:
         mission_id: ID de la misión
+        vacuum: Ejecutar VACUUM incremental al terminar
         
     Returns:
-        Misión actualizada sin datos celulares
+        Misión actualizada sin datos celulares, con 'deletionJob'
     """
     try:
         logger.info(f"Limpiando datos celulares de misión: {mission_id}")
@@ -713,8 +794,8 @@ def clear_cellular_data(mission_id):
             logger.warning("Servicio de misiones no inicializado, creando instancia lazy")
             mission_service = get_mission_service()
         
-        updated_mission = mission_service.clear_cellular_data(mission_id)
-        logger.info("Datos celulares eliminados exitosamente")
+        updated_mission = mission_service.clear_cellular_data(mission_id, vacuum=bool(vacuum))
+        logger.info("Eliminación de datos celulares iniciada exitosamente")
         return updated_mission
     except MissionServiceError as e:
         handle_service_error("clear_cellular_data", e)
@@ -722,6 +803,39 @@ def clear_cellular_data(mission_id):
         handle_service_error("clear_cellular_data", e)
 
 
+@eel.expose
+def get_deletion_job_status(job_id):
+    """
+    Obtiene el progreso de un trabajo de eliminación en segundo plano
+    
+    Args:
+        job_id: ID del trabajo (retornado por delete_operator_sheet o clear_cellular_data)
+        
+    Returns:
+        Dict con 'status', 'rowsDeleted', 'rowsTotal', 'progress' y 'vacuum'
+    """
+    try:
+        return get_bulk_deletion_service().get_job(job_id)
+    except BulkDeletionServiceError as e:
+        handle_service_error("get_deletion_job_status", e)
+    except Exception as e:
+        handle_service_error("get_deletion_job_status", e)
+
+
+@eel.expose
+def list_deletion_jobs(active_only=False):
+    """
+    Lista los trabajos de eliminación en segundo plano, más recientes primero
+    
+    Args:
+        active_only: Solo trabajos pendientes o en ejecución
+    """
+    try:
+        return get_bulk_deletion_service().list_jobs(active_only=bool(active_only))
+    except Exception as e:
+        handle_service_error("list_deletion_jobs", e)
+
+
 # La función delete_operator_sheet está implementada directamente en operator_data_service.py
 # y se expone automáticamente vía Eel desde ese módulo. Esta función antigua ha sido removida
 # para evitar conflictos de nombres.
@@ -760,8 +874,20 @@ def run_analysis(mission_id):
         handle_service_error("run_analysis", e)
 
 
+# Campos de analyze_correlation: (clave frontend, campo del servicio, valor por defecto)
+CORRELATION_RESULT_FIELDS = (
+    ('targetNumber', 'numero_objetivo', 'N/A'),
+    ('operator', 'operador', 'DESCONOCIDO'),
+    ('occurrences', 'ocurrencias', 0),
+    ('firstDetection', 'primera_deteccion', ''),
+    ('lastDetection', 'ultima_deteccion', ''),
+    ('relatedCells', 'celdas_relacionadas', []),
+    ('confidence', 'nivel_confianza', 0)
+)
+
+
 @eel.expose
-def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrences=1):
+def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrences=1, response_format='records'):
     """
     Ejecuta análisis de correlación para detectar números objetivo
     que utilizaron las mismas celdas que HUNTER en un período específico
@@ -771,6 +897,8 @@ def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrence
         start_datetime: Inicio del período (formato: YYYY-MM-DD HH:MM:SS)
         end_datetime: Fin del período (formato: YYYY-MM-DD HH:MM:SS)
         min_occurrences: Mínimo de coincidencias de celdas requeridas (default: 1)
+        response_format: 'records' o 'columnar' ('data' en el formato de
+            utils.columnar_response, con las mismas claves)
         
     Returns:
         Dict con resultados del análisis de correlación:
@@ -795,6 +923,7 @@ def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrence
         }
     """
     try:
+        columnar = is_columnar_format(response_format)
         logger.info(f"Ejecutando análisis de correlación para misión: {mission_id}")
         logger.info(f"Período: {start_datetime} - {end_datetime}, Min occurrences: {min_occurrences}")
         
@@ -817,20 +946,19 @@ def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrence
         logger.info(f"CORRECCIÓN BORIS: Inflación eliminada mediante filtrado por celdas HUNTER reales")
         
         # Mapear resultado del servicio dinámico al formato esperado por el frontend
-        if result['success'] and result['data']:
-            mapped_data = []
-            for item in result['data']:
-                # Transformar campos de snake_case a camelCase para el frontend
-                mapped_item = {
-                    'targetNumber': item.get('numero_objetivo', 'N/A'),
-                    'operator': item.get('operador', 'DESCONOCIDO'),
-                    'occurrences': item.get('ocurrencias', 0),
-                    'firstDetection': item.get('primera_deteccion', ''),
-                    'lastDetection': item.get('ultima_deteccion', ''),
-                    'relatedCells': item.get('celdas_relacionadas', []),
-                    'confidence': item.get('nivel_confianza', 0)
-                }
-                mapped_data.append(mapped_item)
+        if result['success'] and (result['data'] or columnar):
+            # Transformar campos de snake_case a camelCase para el frontend
+            if columnar:
+                mapped_data = encode_columnar(
+                    [key for key, _, _ in CORRELATION_RESULT_FIELDS],
+                    [tuple(item.get(field, default) for _, field, default in CORRELATION_RESULT_FIELDS)
+                     for item in result['data']]
+                )
+            else:
+                mapped_data = [
+                    {key: item.get(field, default) for key, field, default in CORRELATION_RESULT_FIELDS}
+                    for item in result['data']
+                ]
             
             # Devolver resultado con formato estándar para el frontend
             return {
@@ -838,7 +966,7 @@ def analyze_correlation(mission_id, start_datetime, end_datetime, min_occurrence
                 'data': mapped_data,
                 'statistics': {
                     'totalAnalyzed': result.get('total_count', 0),
-                    'totalFound': len(mapped_data),
+                    'totalFound': len(result['data']),
                     'processingTime': result.get('processing_time', 0)
                 }
             }
@@ -981,7 +1109,7 @@ def get_correlation_diagram(mission_id: str,
 
 
 @eel.expose
-def get_call_interactions(mission_id, target_number, start_datetime, end_datetime):
+def get_call_interactions(mission_id, target_number, start_datetime, end_datetime, response_format='records'):
     """
     Obtiene interacciones telefónicas específicas de un número objetivo desde operator_call_data
     correlacionadas con datos HUNTER de cellular_data.
@@ -994,6 +1122,8 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
         target_number: Número telefónico objetivo (string, sin prefijo +57)
         start_datetime: Inicio del período (string, formato: YYYY-MM-DD HH:MM:SS)
         end_datetime: Fin del período (string, formato: YYYY-MM-DD HH:MM:SS)
+        response_format: 'records' (lista) o 'columnar' (payload de
+            utils.columnar_response con las mismas columnas y conversiones)
         
     Returns:
         Lista de diccionarios con interacciones telefónicas correlacionadas:
@@ -1053,6 +1183,8 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
             logger.error(error_msg)
             raise ValueError(f"Todos los parámetros son requeridos: mission_id, target_number, start_datetime, end_datetime. Faltantes: {', '.join(missing_params)}")
         
+        columnar = is_columnar_format(response_format)
+        
         # Validar que el número sea numérico
         if not str(target_number).isdigit():
             raise ValueError(f"target_number debe ser numérico: {target_number}")
@@ -1067,7 +1199,7 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
         # Problema identificado: Frontend mostraba "N/A" cuando punto_hunter_origen era NULL 
         # pero punto_hunter_destino tenía datos válidos (ej: celda 56124)
         # Solución: Campos unificados que priorizan destino sobre origen usando COALESCE
-        query = """
+        query = f"""
         SELECT 
             ocd.numero_origen as originador,
             ocd.numero_destino as receptor,
@@ -1118,12 +1250,16 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
                 ELSE 'SIN_DATOS'
             END as precision_ubicacion
         FROM operator_call_data ocd
-        LEFT JOIN cellular_data cd_origen ON (cd_origen.cell_id = ocd.celda_origen AND cd_origen.mission_id = ocd.mission_id)
-        LEFT JOIN cellular_data cd_destino ON (cd_destino.cell_id = ocd.celda_destino AND cd_destino.mission_id = ocd.mission_id)
+        LEFT JOIN cellular_data cd_origen ON (cd_origen.cell_id = ocd.celda_origen AND cd_origen.mission_id = ocd.mission_id
+                                              AND {active_cellular_rows_sql('cd_origen', ':mission_id')})
+        LEFT JOIN cellular_data cd_destino ON (cd_destino.cell_id = ocd.celda_destino AND cd_destino.mission_id = ocd.mission_id
+                                               AND {active_cellular_rows_sql('cd_destino', ':mission_id')})
         WHERE ocd.mission_id = :mission_id
+          AND {active_sheet_rows_sql('ocd')}
           AND (ocd.numero_origen = :target_number OR ocd.numero_destino = :target_number)
           AND ocd.fecha_hora_llamada BETWEEN :start_datetime AND :end_datetime  
-        ORDER BY ocd.fecha_hora_llamada DESC
+        -- Desempate por ID: el orden no depende del índice que elija el planificador
+        ORDER BY ocd.fecha_hora_llamada DESC, ocd.id, cd_origen.id, cd_destino.id
         """
         
         # Parámetros para la query (prevención de SQL injection)
@@ -1136,15 +1272,24 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
         
         logger.info(f"Ejecutando query con parámetros: {params}")
         
-        # Ejecutar query usando conexión directa a SQLite
+        # Ejecutar query sobre un snapshot de lectura (no compite con cargas en curso)
         interactions = []
-        with get_db_connection() as conn:
+        with get_db_read_connection(mission_id) as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
             
-            # Convertir resultados a lista de diccionarios
             column_names = [description[0] for description in cursor.description]
+            
+            if columnar:
+                # Mismas conversiones que el formato por registros, por columna
+                converters = {name: str for name in column_names}
+                converters['fecha_hora'] = lambda value: str(value) if value else None
+                converters['duracion'] = int
+                logger.info(f"✓ Interacciones encontradas: {len(rows)} (formato columnar)")
+                return encode_columnar(column_names, rows, converters=converters)
+            
+            # Convertir resultados a lista de diccionarios
             for row in rows:
                 interaction = {}
                 for i, value in enumerate(row):
@@ -1227,6 +1372,426 @@ def get_call_interactions(mission_id, target_number, start_datetime, end_datetim
         handle_service_error("get_call_interactions", e)
 
 
+# ============================================================================
+# SPATIAL QUERIES
+# ============================================================================
+
+@eel.expose
+def find_points_in_bbox(source, min_lat, min_lon, max_lat, max_lon, mission_id=None, limit=5000):
+    """
+    Obtiene registros con coordenadas dentro de un rectángulo (vista de mapa)
+    
+    Args:
+        source: 'cellular_data', 'operator_cellular_data', 'operator_call_origen',
+            'operator_call_destino' u 'operator_cell_registry'
+        min_lat, min_lon, max_lat, max_lon: Límites del rectángulo
+        mission_id: ID de la misión (opcional)
+        limit: Máximo de registros
+        
+    Returns:
+        Dict con 'data', 'total' y 'queryTime'
+    """
+    try:
+        return get_spatial_index_service().find_in_bbox(
+            source, float(min_lat), float(min_lon), float(max_lat), float(max_lon),
+            mission_id=mission_id, limit=limit
+        )
+    except SpatialIndexServiceError as e:
+        handle_service_error("find_points_in_bbox", e)
+    except Exception as e:
+        logger.error(f"Error inesperado en consulta espacial por rectángulo: {e}")
+        handle_service_error("find_points_in_bbox", e)
+
+
+@eel.expose
+def find_points_within_radius(source, lat, lon, radius_m, mission_id=None, limit=5000):
+    """
+    Obtiene registros a menos de radius_m metros de un punto, ordenados por distancia
+    
+    Args:
+        source: Fuente espacial (ver find_points_in_bbox)
+        lat, lon: Punto central
+        radius_m: Radio en metros
+        mission_id: ID de la misión (opcional)
+        limit: Máximo de registros
+        
+    Returns:
+        Dict con 'data' (incluye 'distanceM'), 'total' y 'queryTime'
+    """
+    try:
+        return get_spatial_index_service().find_within_radius(
+            source, float(lat), float(lon), float(radius_m), mission_id=mission_id, limit=limit
+        )
+    except SpatialIndexServiceError as e:
+        handle_service_error("find_points_within_radius", e)
+    except Exception as e:
+        logger.error(f"Error inesperado en consulta espacial por radio: {e}")
+        handle_service_error("find_points_within_radius", e)
+
+
+@eel.expose
+def find_nearest_points(source, lat, lon, k=10, mission_id=None):
+    """
+    Obtiene los k registros más cercanos a un punto
+    
+    Args:
+        source: Fuente espacial (ver find_points_in_bbox)
+        lat, lon: Punto de referencia
+        k: Número de vecinos
+        mission_id: ID de la misión (opcional)
+        
+    Returns:
+        Dict con 'data' (incluye 'distanceM'), 'total' y 'queryTime'
+    """
+    try:
+        return get_spatial_index_service().find_nearest(
+            source, float(lat), float(lon), k=k, mission_id=mission_id
+        )
+    except SpatialIndexServiceError as e:
+        handle_service_error("find_nearest_points", e)
+    except Exception as e:
+        logger.error(f"Error inesperado en consulta de vecinos cercanos: {e}")
+        handle_service_error("find_nearest_points", e)
+
+
+@eel.expose
+def find_cells_near_hunter_point(mission_id, hunter_record_id, radius_m, source='operator_cell_registry'):
+    """
+    Obtiene las celdas a menos de radius_m metros de un punto HUNTER (mapa y diagrama)
+    
+    Args:
+        mission_id: ID de la misión
+        hunter_record_id: ID del registro en cellular_data
+        radius_m: Radio en metros
+        source: Fuente de celdas (por defecto operator_cell_registry)
+        
+    Returns:
+        Dict con 'hunterPoint', 'data' (incluye 'distanceM'), 'total' y 'queryTime'
+    """
+    try:
+        return get_spatial_index_service().find_cells_near_hunter_point(
+            mission_id, int(hunter_record_id), float(radius_m), source=source
+        )
+    except SpatialIndexServiceError as e:
+        handle_service_error("find_cells_near_hunter_point", e)
+    except Exception as e:
+        logger.error(f"Error inesperado buscando celdas cercanas a punto HUNTER: {e}")
+        handle_service_error("find_cells_near_hunter_point", e)
+
+
+# ============================================================================
+# NUMBER SEARCH
+# ============================================================================
+
+@eel.expose
+def search_number(number, mission_id=None):
+    """
+    Busca un número telefónico en todas las misiones (índice invertido)
+    
+    Args:
+        number: Número telefónico (acepta prefijo 57 y separadores)
+        mission_id: ID de la misión (opcional)
+        
+    Returns:
+        Dict con 'numero', 'data' (misión, operador, 'firstSeen', 'lastSeen',
+        'callCount', 'dataCount' y 'cells'), 'totalMissions', 'total' y 'queryTime'
+    """
+    try:
+        return get_number_search_index_service().search_number(number, mission_id=mission_id)
+    except NumberSearchIndexServiceError as e:
+        handle_service_error("search_number", e)
+    except Exception as e:
+        logger.error(f"Error inesperado buscando número entre misiones: {e}")
+        handle_service_error("search_number", e)
+
+
+# ============================================================================
+# COMMUNICATION GRAPH
+# ============================================================================
+
+@eel.expose
+def get_communication_network(mission_id, numero, hops=2, start_datetime=None, end_datetime=None,
+                              max_nodes=100):
+    """
+    Obtiene la red de comunicaciones a k saltos de un número (grafo en memoria)
+    
+    Args:
+        mission_id: ID de la misión
+        numero: Número telefónico central
+        hops: Saltos desde el número (1 = contactos directos)
+        start_datetime, end_datetime: Ventana de tiempo opcional (YYYY-MM-DD HH:MM:SS)
+        max_nodes: Máximo de nodos
+        
+    Returns:
+        Dict con 'nodes' (incluye 'hops', 'degree', 'calls'), 'edges' (pesos
+        por par), 'truncated', 'graph' y 'queryTime'
+    """
+    try:
+        return get_communication_graph_service().get_neighborhood(
+            mission_id, numero, hops=hops, start_datetime=start_datetime,
+            end_datetime=end_datetime, max_nodes=max_nodes
+        )
+    except CommunicationGraphServiceError as e:
+        handle_service_error("get_communication_network", e)
+    except Exception as e:
+        logger.error(f"Error inesperado obteniendo red de comunicaciones: {e}")
+        handle_service_error("get_communication_network", e)
+
+
+@eel.expose
+def get_communication_centrality(mission_id, top=20, start_datetime=None, end_datetime=None):
+    """
+    Obtiene los números más centrales de la red de comunicaciones de la misión
+    
+    Args:
+        mission_id: ID de la misión
+        top: Cantidad de números
+        start_datetime, end_datetime: Ventana de tiempo opcional (YYYY-MM-DD HH:MM:SS)
+        
+    Returns:
+        Dict con 'data' (grado, llamadas, 'degreeCentrality', 'pagerank'), 'total' y 'queryTime'
+    """
+    try:
+        return get_communication_graph_service().get_centrality(
+            mission_id, top=top, start_datetime=start_datetime, end_datetime=end_datetime
+        )
+    except CommunicationGraphServiceError as e:
+        handle_service_error("get_communication_centrality", e)
+    except Exception as e:
+        logger.error(f"Error inesperado obteniendo centralidad de comunicaciones: {e}")
+        handle_service_error("get_communication_centrality", e)
+
+
+# ============================================================================
+# DATABASE CHECKPOINTS
+# ============================================================================
+
+@eel.expose
+def get_wal_checkpoint_status():
+    """
+    Obtiene el estado de los checkpoints del WAL en segundo plano
+    
+    Returns:
+        Dict con 'running', 'intervalSeconds', 'checkpoints', 'busyCheckpoints',
+        'errors', 'lastCheckpoint' y 'lastError'
+    """
+    try:
+        return get_wal_checkpoint_service().get_status()
+    except Exception as e:
+        handle_service_error("get_wal_checkpoint_status", e)
+
+
+@eel.expose
+def run_wal_checkpoint(mode='PASSIVE'):
+    """
+    Ejecuta un checkpoint del WAL inmediatamente
+    
+    Args:
+        mode: PASSIVE (no espera a cargas ni lecturas), FULL, RESTART o TRUNCATE
+        
+    Returns:
+        Dict con 'busy', 'walFrames', 'checkpointedFrames' y 'durationSeconds'
+    """
+    try:
+        return get_wal_checkpoint_service().checkpoint(mode)
+    except WalCheckpointServiceError as e:
+        handle_service_error("run_wal_checkpoint", e)
+    except Exception as e:
+        logger.error(f"Error inesperado ejecutando checkpoint del WAL: {e}")
+        handle_service_error("run_wal_checkpoint", e)
+
+
+# ============================================================================
+# MISSION STORAGE
+# ============================================================================
+
+@eel.expose
+def get_mission_storage_status():
+    """
+    Obtiene el almacenamiento de las misiones (kronos.db o archivo propio)
+    
+    Returns:
+        Dict con 'storageMode', 'mainDatabaseBytes' y 'shards'
+    """
+    try:
+        return get_mission_shard_service().get_status()
+    except Exception as e:
+        handle_service_error("get_mission_storage_status", e)
+
+
+@eel.expose
+def shard_mission(mission_id):
+    """
+    Mueve los datos masivos de una misión a su archivo propio
+    
+    Args:
+        mission_id: ID de la misión
+        
+    Returns:
+        Dict con 'shardFile', 'rowsMoved' y 'durationSeconds'
+    """
+    try:
+        return get_mission_shard_service().shard_mission(mission_id)
+    except MissionShardServiceError as e:
+        handle_service_error("shard_mission", e)
+    except Exception as e:
+        logger.error(f"Error inesperado migrando misión {mission_id} a archivo propio: {e}")
+        handle_service_error("shard_mission", e)
+
+
+@eel.expose
+def unshard_mission(mission_id):
+    """
+    Devuelve los datos masivos de una misión a kronos.db
+    
+    Args:
+        mission_id: ID de la misión
+        
+    Returns:
+        Dict con 'rowsMoved', 'renumberedTables' y 'durationSeconds'
+    """
+    try:
+        return get_mission_shard_service().unshard_mission(mission_id)
+    except MissionShardServiceError as e:
+        handle_service_error("unshard_mission", e)
+    except Exception as e:
+        logger.error(f"Error inesperado devolviendo misión {mission_id} a kronos.db: {e}")
+        handle_service_error("unshard_mission", e)
+
+
+# ============================================================================
+# DATABASE BACKUPS
+# ============================================================================
+
+@eel.expose
+def get_backup_status():
+    """
+    Obtiene el estado de los backups programados y los backups en disco
+    
+    Returns:
+        Dict con 'running', 'inProgress', 'backupDir', 'backups', 'errors',
+        'lastBackup', 'lastError', 'nextKind' y 'available' (manifiestos sin
+        el detalle por archivo)
+    """
+    try:
+        service = get_backup_service()
+        status = service.get_status()
+        status['nextKind'] = service.next_scheduled_kind()
+        status['available'] = [
+            {key: value for key, value in manifest.items() if key != 'units'}
+            for manifest in service.list_backups()
+        ]
+        return status
+    except Exception as e:
+        handle_service_error("get_backup_status", e)
+
+
+@eel.expose
+def run_backup(kind='differential'):
+    """
+    Ejecuta un backup en línea inmediatamente
+    
+    Args:
+        kind: 'differential' (solo archivos modificados desde el último
+            completo) o 'full'
+        
+    Returns:
+        Manifiesto del backup
+    """
+    try:
+        return get_backup_service().run_backup(kind)
+    except BackupServiceError as e:
+        handle_service_error("run_backup", e)
+    except Exception as e:
+        logger.error(f"Error inesperado ejecutando backup: {e}")
+        handle_service_error("run_backup", e)
+
+
+@eel.expose
+def verify_backup(backup_id):
+    """
+    Verifica los archivos de un backup (SHA-256 y PRAGMA quick_check)
+    
+    Args:
+        backup_id: ID del backup
+        
+    Returns:
+        Dict con 'backupId', 'valid' y 'units'
+    """
+    try:
+        return get_backup_service().verify_backup(backup_id)
+    except BackupServiceError as e:
+        handle_service_error("verify_backup", e)
+    except Exception as e:
+        logger.error(f"Error inesperado verificando backup {backup_id}: {e}")
+        handle_service_error("verify_backup", e)
+
+
+# ============================================================================
+# DATABASE MAINTENANCE
+# ============================================================================
+
+@eel.expose
+def get_database_size_report(include_fragmentation=True):
+    """
+    Obtiene el tamaño de tablas e índices de kronos.db y de los archivos de misión
+    
+    Args:
+        include_fragmentation: Calcular la fragmentación (recorre todas las hojas)
+        
+    Returns:
+        Dict con 'files' (páginas, páginas libres y objetos por archivo) y 'totalBytes'
+    """
+    try:
+        return get_database_maintenance_service().get_size_report(bool(include_fragmentation))
+    except DatabaseMaintenanceServiceError as e:
+        handle_service_error("get_database_size_report", e)
+    except Exception as e:
+        logger.error(f"Error inesperado generando reporte de tamaño: {e}")
+        handle_service_error("get_database_size_report", e)
+
+
+@eel.expose
+def get_database_maintenance_status():
+    """
+    Obtiene el estado del mantenimiento en segundo plano
+    
+    Returns:
+        Dict con 'running', 'cycles', 'analyzeRuns', 'pagesFreed',
+        'pendingRows', 'lastAnalyze', 'errors' y 'lastError'
+    """
+    try:
+        return get_database_maintenance_service().get_status()
+    except Exception as e:
+        handle_service_error("get_database_maintenance_status", e)
+
+
+@eel.expose
+def run_database_maintenance(convert_auto_vacuum=False):
+    """
+    Ejecuta inmediatamente ANALYZE, PRAGMA optimize e incremental_vacuum
+    acotado en todos los archivos y crea los índices esperados que falten
+    
+    Args:
+        convert_auto_vacuum: Convertir una sola vez a auto_vacuum=INCREMENTAL
+            los archivos creados antes de que se fijara el modo (VACUUM
+            completo: bloquea las escrituras mientras dura)
+    
+    Returns:
+        Dict con 'analyzed', 'converted', 'pagesFreed', 'durationSeconds' e 'indexes'
+    """
+    try:
+        service = get_database_maintenance_service()
+        result = service.run_maintenance(force=True, convert_auto_vacuum=bool(convert_auto_vacuum))
+        result['indexes'] = service.ensure_expected_indexes()
+        return result
+    except DatabaseMaintenanceServiceError as e:
+        handle_service_error("run_database_maintenance", e)
+    except Exception as e:
+        logger.error(f"Error inesperado en mantenimiento de base de datos: {e}")
+        handle_service_error("run_database_maintenance", e)
+
+
 # ============================================================================
 # SIGNAL HANDLERS Y CLEANUP SETUP
 # ============================================================================
@@ -1255,8 +1820,11 @@ def setup_cleanup_handlers():
     """Registra todos los handlers de cleanup necesarios"""
     
     def cleanup_database():
-        """Cierra conexiones de base de datos"""
+        """Detiene los checkpoints, backups y mantenimiento en segundo plano y cierra conexiones de base de datos"""
         try:
+            get_wal_checkpoint_service().stop()
+            get_backup_service().stop()
+            get_database_maintenance_service().stop()
             db_manager = get_database_manager()
             if db_manager and db_manager._initialized:
                 db_manager.close()
@@ -1353,8 +1921,160 @@ def setup_atexit_handler():
 # INITIALIZATION AND STARTUP
 # ============================================================================
 
-def initialize_backend():
-    """Inicializa el backend completo"""
+# Estado del arranque por etapas (consultable desde el frontend)
+startup_status = {
+    'stage': 'starting',        # starting -> interactive -> ready | degraded
+    'interactiveSeconds': None, # BD abierta y servicios básicos listos
+    'readySeconds': None,       # Verificaciones en segundo plano completadas
+    'checks': {},
+    'errors': {},               # Error por paso de la etapa 2 (ver run_startup_checks)
+    'error': None
+}
+_startup_checks_thread = None
+
+
+def _verify_basic_services() -> bool:
+    """Consulta roles, usuarios y misiones con reintentos y registra los conteos"""
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            roles = role_service.get_all_roles()
+            users = user_service.get_all_users()
+            # Listado liviano: no cargar datos celulares solo para verificar
+            missions = mission_service.get_missions_summary(page=1, page_size=1)
+            
+            startup_status['checks'].update({
+                'roles': len(roles), 'users': len(users), 'missions': missions['total']
+            })
+            logger.info(f"Sistema verificado: {len(roles)} roles, {len(users)} usuarios, {missions['total']} misiones")
+            return True
+            
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise
+            logger.warning(f"Error en intento {attempt + 1}/{max_retries}: {e}")
+            time.sleep(1)  # Esperar 1 segundo antes del siguiente intento
+
+
+def _run_startup_step(name: str, step) -> None:
+    """
+    Ejecuta un paso de la etapa 2 y guarda su resultado en
+    startup_status['checks'] o su error en startup_status['errors']
+    """
+    try:
+        startup_status['checks'][name] = step()
+    except Exception as e:
+        startup_status['errors'][name] = str(e)
+        logger.error(f"Error en paso de arranque '{name}': {e}")
+        import traceback
+        logger.error(f"Traceback completo:\n{traceback.format_exc()}")
+
+
+def _run_deferred_database_checks() -> bool:
+    get_database_manager().run_deferred_checks()
+    return True
+
+
+def _create_operator_data_service() -> bool:
+    # Crear una sola vez el servicio de operadores (dependencias y verificación de schema)
+    get_operator_data_service()
+    return True
+
+
+def _ensure_expected_indexes() -> int:
+    # Índices de correlación esperados por el mantenimiento
+    return sum(
+        len(unit['indexes'])
+        for unit in get_database_maintenance_service().ensure_expected_indexes()['created']
+    )
+
+
+# Pasos de la etapa 2, en orden. Cada paso es independiente: si uno falla,
+# su error queda en startup_status['errors'] y los siguientes se ejecutan
+STARTUP_STEPS = (
+    ('databaseIntegrity', _run_deferred_database_checks),
+    ('services', _verify_basic_services),
+    ('operatorDataService', _create_operator_data_service),
+    # Limpiezas de datos celulares interrumpidas (corte pendiente en la misión)
+    ('cellularClears', lambda: get_mission_service().resume_pending_cellular_clears()),
+    # Índice de números: crea triggers (y lo puebla) antes de las próximas cargas
+    ('numberSearchIndex', lambda: get_number_search_index_service().ensure_index()),
+    # Diccionario de celdas: IDs enteros para los cruces de correlación
+    ('cellDictionary', lambda: get_cell_dictionary_service().ensure_dictionary()),
+    # Checkpoints PASSIVE del WAL para que ni las cargas ni los análisis los esperen
+    ('walCheckpoints', lambda: get_wal_checkpoint_service().start()['running']),
+    # Backups en línea programados (no detienen las cargas)
+    ('scheduledBackups', lambda: get_backup_service().start()['running']),
+    ('createdIndexes', _ensure_expected_indexes),
+    # Mantenimiento en inactividad (ANALYZE, incremental_vacuum)
+    ('databaseMaintenance', lambda: get_database_maintenance_service().start()['running']),
+)
+
+
+def run_startup_checks(started_at: float) -> None:
+    """
+    Etapa 2 del arranque, en segundo plano: verificación de integridad de
+    la BD, verificación de servicios y creación de servicios pesados
+    (importan pandas/openpyxl). Los resultados quedan en startup_status.
+    
+    Cada paso de STARTUP_STEPS se ejecuta aunque falle uno anterior. Si
+    alguno falla, la etapa termina en 'degraded' con el error del paso en
+    startup_status['errors'].
+    
+    Args:
+        started_at: time.perf_counter() del inicio del arranque
+    """
+    for name, step in STARTUP_STEPS:
+        _run_startup_step(name, step)
+    
+    startup_status['readySeconds'] = round(time.perf_counter() - started_at, 3)
+    if startup_status['errors']:
+        startup_status['stage'] = 'degraded'
+        startup_status['error'] = '; '.join(
+            f"{name}: {error}" for name, error in startup_status['errors'].items()
+        )
+        logger.error(f"=== VERIFICACIONES DE ARRANQUE CON ERRORES ({startup_status['readySeconds']}s): "
+                     f"{', '.join(startup_status['errors'])} ===")
+    else:
+        startup_status['stage'] = 'ready'
+        logger.info(f"=== VERIFICACIONES DE ARRANQUE COMPLETADAS ({startup_status['readySeconds']}s) ===")
+
+
+def wait_for_startup_checks(timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Espera a que terminen las verificaciones en segundo plano y retorna el estado"""
+    if _startup_checks_thread is not None:
+        _startup_checks_thread.join(timeout)
+    return dict(startup_status)
+
+
+@eel.expose
+def get_startup_status():
+    """
+    Retorna el estado del arranque por etapas
+    
+    Returns:
+        Dict con 'stage' (starting, interactive, ready, degraded),
+        tiempos 'interactiveSeconds'/'readySeconds', 'checks', 'errors'
+        (error por paso) y 'error'
+    """
+    return dict(startup_status, checks=dict(startup_status['checks']),
+                errors=dict(startup_status['errors']))
+
+
+def initialize_backend(db_path: Optional[str] = None):
+    """
+    Inicializa el backend por etapas
+    
+    Etapa 1 (bloqueante): abre la BD sin verificación de integridad y crea
+    los servicios livianos; al terminar la interfaz ya puede cargarse.
+    Etapa 2 (hilo en segundo plano): run_startup_checks.
+    
+    Args:
+        db_path: Ruta de la BD (por defecto Backend/kronos.db)
+    """
+    global _startup_checks_thread
+    started_at = time.perf_counter()
+    
     try:
         logger.info("=== INICIANDO BACKEND KRONOS ===")
         
@@ -1368,11 +2088,11 @@ def initialize_backend():
         
         # Inicializar base de datos con manejo robusto de errores
         logger.info("Inicializando base de datos...")
-        db_path = os.path.join(current_dir, 'kronos.db')
+        db_path = db_path or os.path.join(current_dir, 'kronos.db')
         
-        # Intentar inicialización normal primero
+        # Intentar inicialización normal primero (verificación diferida a la etapa 2)
         try:
-            init_database(db_path, force_recreate=False)
+            init_database(db_path, force_recreate=False, defer_checks=True)
             logger.info("Base de datos inicializada exitosamente")
         except Exception as db_error:
             logger.warning(f"Error en inicialización normal de BD: {db_error}")
@@ -1397,46 +2117,15 @@ def initialize_backend():
         
         logger.info("Servicios inicializados exitosamente")
         
-        # Verificar servicios
-        logger.info("Verificando servicios...")
+        startup_status['interactiveSeconds'] = round(time.perf_counter() - started_at, 3)
+        startup_status['stage'] = 'interactive'
+        logger.info(f"=== BACKEND INTERACTIVO ({startup_status['interactiveSeconds']}s) ===")
         
-        # Test de servicios básicos con reintentos
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                roles = role_service.get_all_roles()
-                users = user_service.get_all_users()
-                missions = mission_service.get_all_missions()
-                
-                logger.info(f"Sistema verificado: {len(roles)} roles, {len(users)} usuarios, {len(missions)} misiones")
-                break
-                
-            except Exception as e:
-                if attempt == max_retries - 1:  # Último intento
-                    logger.error(f"Error verificando servicios después de {max_retries} intentos: {e}")
-                    # Intentar una última recreación completa
-                    logger.info("Intentando recreación final de base de datos...")
-                    init_database(db_path, force_recreate=True)
-                    
-                    # Reinicializar servicios después de recrear BD
-                    auth_service = get_auth_service()
-                    user_service = get_user_service()
-                    role_service = get_role_service()
-                    mission_service = get_mission_service()
-                    analysis_service = get_analysis_service()
-                    
-                    # Un último test
-                    roles = role_service.get_all_roles()
-                    users = user_service.get_all_users()
-                    missions = mission_service.get_all_missions()
-                    logger.info(f"Sistema verificado tras recreación: {len(roles)} roles, {len(users)} usuarios, {len(missions)} misiones")
-                    break
-                else:
-                    logger.warning(f"Error en intento {attempt + 1}/{max_retries}: {e}")
-                    import time
-                    time.sleep(1)  # Esperar 1 segundo antes del siguiente intento
-        
-        logger.info("=== BACKEND INICIALIZADO CORRECTAMENTE ===")
+        # Verificaciones y servicios pesados en segundo plano
+        _startup_checks_thread = threading.Thread(
+            target=run_startup_checks, args=(started_at,), name="KronosStartupChecks", daemon=True
+        )
+        _startup_checks_thread.start()
         
     except Exception as e:
         logger.error(f"Error crítico inicializando backend: {e}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Script para migrar misiones entre kronos.db y su archivo propio en mission_shards/
+
+Uso:
+    python migrate_mission_shards.py --status
+    python migrate_mission_shards.py --mission MISSION_ID [--to-main]
+    python migrate_mission_shards.py --all [--to-main]
+    python migrate_mission_shards.py --db otra.db --status
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_db_connection
+from services.mission_shard_service import MissionShardService, MissionShardServiceError
+
+
+def _format_size(size_bytes):
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
+def print_status(service):
+    status = service.get_status()
+    print(f"Modo para misiones nuevas: {status['storageMode']}")
+    print(f"kronos.db: {_format_size(status['mainDatabaseBytes'])}")
+    if not status['shards']:
+        print("No hay misiones con archivo propio")
+    for shard in status['shards']:
+        missing = '' if shard['exists'] else ' (ARCHIVO NO ENCONTRADO)'
+        print(f"  {shard['missionId']}: {shard['shardFile']} {_format_size(shard['sizeBytes'])}{missing}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra misiones entre kronos.db y archivos propios")
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kronos.db'),
+                        help="Ruta de la base de datos principal")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--status', action='store_true', help="Muestra el almacenamiento de cada misión")
+    target.add_argument('--mission', help="ID de la misión a migrar")
+    target.add_argument('--all', action='store_true', help="Migra todas las misiones")
+    parser.add_argument('--to-main', action='store_true', help="Devuelve las misiones a kronos.db")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"ERROR: Base de datos no encontrada: {args.db}")
+        return 1
+
+    init_database(args.db)
+    service = MissionShardService()
+    if args.status:
+        print_status(service)
+        return 0
+
+    if args.mission:
+        mission_ids = [args.mission]
+    else:
+        with get_db_connection() as conn:
+            mission_ids = [row[0] for row in conn.execute("SELECT id FROM missions ORDER BY id")]
+
+    sharded = {shard['missionId'] for shard in service.get_status()['shards']}
+    failed = 0
+    for mission_id in mission_ids:
+        if args.all and (mission_id in sharded) != args.to_main:
+            continue
+        try:
+            if args.to_main:
+                result = service.unshard_mission(mission_id)
+            else:
+                result = service.shard_mission(mission_id)
+            print(f"EXITO: {mission_id} {result['rowsMoved']} en {result['durationSeconds']}s")
+        except MissionShardServiceError as e:
+            failed += 1
+            print(f"ERROR: {mission_id}: {e}")
+
+    print_status(service)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
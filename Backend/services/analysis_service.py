@@ -54,7 +54,7 @@ class AnalysisService:
         try:
             logger.info(f"Análisis solicitado para misión {mission_id} - funcionalidad de operadores eliminada")
             
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session(mission_id) as session:
                 # Verificar que la misión existe
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
@@ -62,7 +62,8 @@ class AnalysisService:
                 
                 # Verificar si hay datos celulares
                 cellular_count = session.query(CellularData).filter(
-                    CellularData.mission_id == mission_id
+                    CellularData.mission_id == mission_id,
+                    mission.active_cellular_filter()
                 ).count()
                 
                 # Limpiar análisis previos si existen
@@ -99,13 +100,14 @@ class AnalysisService:
             Diccionario con estadísticas básicas
         """
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session(mission_id) as session:
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
                     raise AnalysisServiceError("Misión no encontrada")
                 
                 cellular_count = session.query(CellularData).filter(
-                    CellularData.mission_id == mission_id
+                    CellularData.mission_id == mission_id,
+                    mission.active_cellular_filter()
                 ).count()
                 
                 target_count = session.query(TargetRecord).filter(
@@ -0,0 +1,407 @@
+"""
+KRONOS - Backup Service
+===============================================================================
+BACKUPS EN LÍNEA, DIFERENCIALES Y VERIFICADOS
+===============================================================================
+
+Reemplaza las copias completas de archivo (kronos.db.backup_*) por backups
+hechos con la API de backup de SQLite (database.connection.online_backup):
+la copia avanza por pasos sobre un snapshot WAL y no detiene las cargas.
+
+UNIDADES DE BACKUP:
+- kronos.db
+- El archivo propio de cada misión fragmentada (database/mission_shards.py)
+
+TIPOS:
+- full: copia todas las unidades
+- differential: copia solo las unidades que cambiaron desde el último backup
+  completo (firma de fecha de modificación y tamaño del archivo y su WAL);
+  las demás se referencian en el manifiesto al backup completo. Con las
+  misiones en archivos propios, una misión sin cambios no se vuelve a copiar.
+
+Cada backup es un directorio backups/<id>/ con las copias y manifest.json
+(unidades, firma, tamaño y SHA-256). El directorio se escribe como
+<id>.partial y se renombra al terminar, por lo que un backup interrumpido
+nunca aparece como válido. Cada copia se verifica con PRAGMA quick_check.
+
+La retención conserva los últimos BACKUP_RETENTION_FULL backups completos
+junto con sus diferenciales. Un hilo en segundo plano ejecuta un backup cada
+BACKUP_INTERVAL_SECONDS: completo si no hay uno o si ya hay FULL_BACKUP_EVERY
+diferenciales sobre el último, diferencial en otro caso.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from database.connection import get_database_manager, online_backup
+from database.mission_shards import SHARD_DIRECTORY_NAME, get_mission_shard_router
+
+logger = logging.getLogger(__name__)
+
+
+class BackupServiceError(Exception):
+    """Excepción personalizada para errores de backup"""
+    pass
+
+
+# Directorio de backups (por defecto backups/ junto a kronos.db)
+BACKUP_DIRECTORY_ENV = 'KRONOS_BACKUP_DIR'
+
+# Segundos entre backups en segundo plano
+BACKUP_INTERVAL_SECONDS = 24 * 60 * 60
+
+# Diferenciales sobre un mismo backup completo antes del siguiente completo
+FULL_BACKUP_EVERY = 6
+
+# Backups completos conservados (cada uno con sus diferenciales)
+BACKUP_RETENTION_FULL = 2
+
+BACKUP_KINDS = ('full', 'differential')
+MANIFEST_NAME = 'manifest.json'
+PARTIAL_SUFFIX = '.partial'
+
+
+def _file_signature(path: str) -> List[int]:
+    """Fecha de modificación y tamaño del archivo y su WAL (cambian con cada commit)"""
+    signature = []
+    for file_path in (path, f"{path}-wal"):
+        if os.path.exists(file_path):
+            stat = os.stat(file_path)
+            signature += [stat.st_mtime_ns, stat.st_size]
+        else:
+            signature += [0, 0]
+    return signature
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _quick_check(path: str) -> str:
+    """Resultado de PRAGMA quick_check ('ok' si la copia es íntegra)"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return '; '.join(row[0] for row in conn.execute("PRAGMA quick_check"))
+    finally:
+        conn.close()
+
+
+class BackupService:
+    """
+    Servicio de backups en línea con programación en segundo plano
+    """
+
+    def __init__(self, backup_dir: Optional[str] = None,
+                 interval_seconds: float = BACKUP_INTERVAL_SECONDS,
+                 full_every: int = FULL_BACKUP_EVERY,
+                 retention_full: int = BACKUP_RETENTION_FULL):
+        self._backup_dir = backup_dir or os.environ.get(BACKUP_DIRECTORY_ENV)
+        self.interval_seconds = interval_seconds
+        self.full_every = full_every
+        self.retention_full = max(1, retention_full)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._backup_lock = threading.Lock()
+        self._status = {
+            'intervalSeconds': interval_seconds,
+            'backups': 0,
+            'errors': 0,
+            'lastBackup': None,
+            'lastError': None
+        }
+
+    @property
+    def backup_dir(self) -> str:
+        if self._backup_dir:
+            return os.path.abspath(self._backup_dir)
+        return os.path.join(os.path.dirname(os.path.abspath(get_database_manager().db_path)), 'backups')
+
+    def _units(self) -> List[Dict[str, Any]]:
+        """kronos.db y los archivos de las misiones fragmentadas"""
+        db_path = get_database_manager().db_path
+        units = [{'name': 'kronos.db', 'path': db_path, 'missionId': None}]
+        for mission_id, shard_path in sorted(get_mission_shard_router(db_path).list_shards().items()):
+            if os.path.exists(shard_path):
+                units.append({
+                    'name': f"{SHARD_DIRECTORY_NAME}/{os.path.basename(shard_path)}",
+                    'path': shard_path,
+                    'missionId': mission_id
+                })
+        return units
+
+    def run_backup(self, kind: str = 'differential') -> Dict[str, Any]:
+        """
+        Ejecuta un backup
+
+        Args:
+            kind: 'differential' (por defecto; completo si no hay uno previo) o 'full'
+
+        Returns:
+            Manifiesto del backup: 'backupId', 'kind', 'baseBackupId',
+            'createdAt', 'durationSeconds' y 'units' (por unidad: 'name',
+            'missionId', 'storedIn', 'copied', 'sizeBytes' y 'sha256')
+
+        Raises:
+            BackupServiceError: Si el tipo no es válido, ya hay un backup en
+                curso o una copia no supera la verificación
+        """
+        kind = (kind or 'differential').lower()
+        if kind not in BACKUP_KINDS:
+            raise BackupServiceError(f"Tipo de backup no válido: {kind}. Use uno de {', '.join(BACKUP_KINDS)}")
+        if not self._backup_lock.acquire(blocking=False):
+            raise BackupServiceError("Ya hay un backup en curso")
+
+        try:
+            manifest = self._run_backup(kind)
+        except Exception as e:
+            with self._lock:
+                self._status['errors'] += 1
+                self._status['lastError'] = str(e)
+            raise
+        finally:
+            self._backup_lock.release()
+
+        with self._lock:
+            self._status['backups'] += 1
+            self._status['lastBackup'] = {key: value for key, value in manifest.items() if key != 'units'}
+        return manifest
+
+    def _run_backup(self, kind: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        base = self._latest_full() if kind == 'differential' else None
+        if base is None:
+            kind = 'full'
+        base_units = {unit['name']: unit for unit in (base or {}).get('units', [])}
+
+        # Directorios de backups interrumpidos (solo corre un backup a la vez)
+        if os.path.isdir(self.backup_dir):
+            for name in os.listdir(self.backup_dir):
+                if name.endswith(PARTIAL_SUFFIX):
+                    shutil.rmtree(os.path.join(self.backup_dir, name), ignore_errors=True)
+
+        backup_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{kind}"
+        work_dir = os.path.join(self.backup_dir, backup_id + PARTIAL_SUFFIX)
+        os.makedirs(work_dir)
+
+        try:
+            units = []
+            for unit in self._units():
+                # Firma previa a la copia: un cambio durante la copia se copia en el próximo backup
+                signature = _file_signature(unit['path'])
+                previous = base_units.get(unit['name'])
+                entry = {'name': unit['name'], 'missionId': unit['missionId'], 'signature': signature}
+
+                if previous and previous['signature'] == signature:
+                    entry.update({
+                        'storedIn': previous['storedIn'], 'copied': False,
+                        'sizeBytes': previous['sizeBytes'], 'sha256': previous['sha256']
+                    })
+                else:
+                    target = os.path.join(work_dir, unit['name'])
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    copy = online_backup(unit['path'], target)
+                    check = _quick_check(target)
+                    if check != 'ok':
+                        raise BackupServiceError(f"La copia de {unit['name']} no es íntegra: {check}")
+                    entry.update({
+                        'storedIn': backup_id, 'copied': True, 'pages': copy['pages'],
+                        'sizeBytes': os.path.getsize(target), 'sha256': _sha256(target)
+                    })
+                units.append(entry)
+
+            manifest = {
+                'backupId': backup_id,
+                'kind': kind,
+                'baseBackupId': base['backupId'] if base else None,
+                'createdAt': datetime.now().isoformat(),
+                'durationSeconds': round(time.perf_counter() - started, 3),
+                'units': units
+            }
+            with open(os.path.join(work_dir, MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+                json.dump(manifest, handle, indent=2)
+            os.rename(work_dir, os.path.join(self.backup_dir, backup_id))
+        except Exception:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+
+        copied = sum(1 for unit in units if unit['copied'])
+        logger.info(f"Backup {backup_id}: {copied}/{len(units)} archivos copiados en {manifest['durationSeconds']}s")
+        self.apply_retention()
+        return manifest
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Manifiestos de los backups completos en disco, del más reciente al más antiguo"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        backups = []
+        for name in os.listdir(self.backup_dir):
+            manifest_path = os.path.join(self.backup_dir, name, MANIFEST_NAME)
+            if name.endswith(PARTIAL_SUFFIX) or not os.path.exists(manifest_path):
+                continue
+            try:
+                with open(manifest_path, encoding='utf-8') as handle:
+                    backups.append(json.load(handle))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Manifiesto de backup ilegible {manifest_path}: {e}")
+        return sorted(backups, key=lambda manifest: manifest['backupId'], reverse=True)
+
+    def _latest_full(self) -> Optional[Dict[str, Any]]:
+        return next((manifest for manifest in self.list_backups() if manifest['kind'] == 'full'), None)
+
+    def _get_manifest(self, backup_id: str) -> Dict[str, Any]:
+        manifest = next((manifest for manifest in self.list_backups() if manifest['backupId'] == backup_id), None)
+        if manifest is None:
+            raise BackupServiceError(f"Backup {backup_id} no encontrado")
+        return manifest
+
+    def verify_backup(self, backup_id: str) -> Dict[str, Any]:
+        """
+        Verifica que cada archivo de un backup exista, conserve su SHA-256 y
+        supere PRAGMA quick_check
+
+        Returns:
+            Dict con 'backupId', 'valid' y 'units' (por unidad: 'name',
+            'valid' y 'error')
+        """
+        manifest = self._get_manifest(backup_id)
+        units = []
+        for unit in manifest['units']:
+            path = os.path.join(self.backup_dir, unit['storedIn'], unit['name'])
+            error = None
+            if not os.path.exists(path):
+                error = f"Archivo no encontrado en {unit['storedIn']}"
+            elif _sha256(path) != unit['sha256']:
+                error = "SHA-256 distinto al del manifiesto"
+            else:
+                check = _quick_check(path)
+                if check != 'ok':
+                    error = check
+            units.append({'name': unit['name'], 'valid': error is None, 'error': error})
+        return {
+            'backupId': backup_id,
+            'valid': all(unit['valid'] for unit in units),
+            'units': units
+        }
+
+    def restore_backup(self, backup_id: str, target_dir: str) -> List[str]:
+        """
+        Reconstruye un backup (completo o diferencial) en un directorio nuevo
+        con la misma estructura de kronos.db y mission_shards/
+
+        No reemplaza la base de datos en uso: el directorio destino no debe
+        contener kronos.db.
+
+        Returns:
+            Rutas de los archivos restaurados
+        """
+        manifest = self._get_manifest(backup_id)
+        if os.path.exists(os.path.join(target_dir, 'kronos.db')):
+            raise BackupServiceError(f"{target_dir} ya contiene kronos.db")
+
+        restored = []
+        for unit in manifest['units']:
+            source = os.path.join(self.backup_dir, unit['storedIn'], unit['name'])
+            target = os.path.join(target_dir, unit['name'])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+            restored.append(target)
+        logger.info(f"Backup {backup_id} restaurado en {target_dir}")
+        return restored
+
+    def apply_retention(self) -> List[str]:
+        """
+        Elimina los backups completos más antiguos que los últimos
+        retention_full y sus diferenciales
+
+        Returns:
+            IDs de los backups eliminados
+        """
+        backups = self.list_backups()
+        kept_fulls = {manifest['backupId'] for manifest in backups if manifest['kind'] == 'full'}
+        kept_fulls = set(sorted(kept_fulls, reverse=True)[:self.retention_full])
+
+        removed = []
+        for manifest in backups:
+            chain = manifest['backupId'] if manifest['kind'] == 'full' else manifest['baseBackupId']
+            if chain not in kept_fulls:
+                shutil.rmtree(os.path.join(self.backup_dir, manifest['backupId']), ignore_errors=True)
+                removed.append(manifest['backupId'])
+
+        if removed:
+            logger.info(f"Backups eliminados por retención: {', '.join(removed)}")
+        return removed
+
+    def next_scheduled_kind(self) -> str:
+        """Tipo del próximo backup programado"""
+        backups = self.list_backups()
+        latest_full = next((manifest for manifest in backups if manifest['kind'] == 'full'), None)
+        if latest_full is None:
+            return 'full'
+        differentials = sum(1 for manifest in backups if manifest['baseBackupId'] == latest_full['backupId'])
+        return 'full' if differentials >= self.full_every else 'differential'
+
+    def start(self) -> Dict[str, Any]:
+        """Inicia el hilo de backups programados (no hace nada si ya está activo)"""
+        with self._lock:
+            already_running = self._thread is not None and self._thread.is_alive()
+            if not already_running:
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, name="database-backup", daemon=True)
+                self._thread.start()
+
+        if not already_running:
+            logger.info(f"Backups programados cada {self.interval_seconds}s en {self.backup_dir}")
+        return self.get_status()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Detiene el hilo de backups programados"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retorna una copia del estado del servicio"""
+        with self._lock:
+            status = dict(self._status)
+        status['running'] = self._thread is not None and self._thread.is_alive()
+        status['inProgress'] = self._backup_lock.locked()
+        status['backupDir'] = self.backup_dir
+        return status
+
+    def _run(self) -> None:
+        """Bucle de backups programados hasta stop()"""
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.run_backup(self.next_scheduled_kind())
+            except Exception as e:
+                logger.warning(f"Error en backup programado: {e}")
+
+
+# Instancia global del servicio
+_backup_service_instance = None
+
+
+def get_backup_service() -> BackupService:
+    """Retorna la instancia singleton del servicio de backups"""
+    global _backup_service_instance
+    if _backup_service_instance is None:
+        _backup_service_instance = BackupService()
+    return _backup_service_instance
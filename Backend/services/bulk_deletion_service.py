@@ -0,0 +1,389 @@
+"""
+KRONOS - Bulk Deletion Service
+===============================================================================
+ELIMINACIÓN MASIVA EN SEGUNDO PLANO POR LOTES
+===============================================================================
+
+Ejecuta eliminaciones grandes (archivos de operador, datos celulares de una
+misión) como trabajos en segundo plano:
+
+- Cada paso elimina filas de una tabla en lotes acotados (las n filas de
+  menor rowid que cumplen la condición) y confirma cada lote, liberando el
+  bloqueo de escritura de SQLite entre lotes para que las cargas
+  concurrentes puedan avanzar.
+- En las tablas de operadores, el índice de búsqueda de números se
+  actualiza una vez por lote antes del DELETE, en la misma transacción
+  (NumberSearchIndexService.remove_batch); sus triggers fila a fila no se
+  ejecutan para el lote (database/batch_write_guard.py).
+- El progreso (filas eliminadas / filas estimadas) se consulta por ID de trabajo.
+- Opcionalmente ejecuta VACUUM incremental al terminar, si la base de datos
+  usa auto_vacuum = INCREMENTAL.
+- Los trabajos de una misión con almacenamiento propio eliminan y liberan
+  espacio en el archivo de la misión (database/mission_shards.py).
+
+Los pasos son idempotentes: si un trabajo falla o la aplicación se cierra, se
+puede volver a lanzar con los mismos pasos y continúa donde quedó.
+
+Mientras un trabajo corre, las lecturas ignoran de inmediato las filas que
+va a eliminar: los archivos de operador quedan en estado DELETING y la
+limpieza celular de una misión guarda su corte en
+missions.cellular_clear_through_id. Las consultas SQL agregan las
+condiciones de active_sheet_rows_sql y active_cellular_rows_sql.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+
+from database.batch_write_guard import BEGIN_BATCH_WRITE_SQL, END_BATCH_WRITE_SQL
+from database.connection import get_db_connection
+from services.number_search_index_service import (
+    NUMBER_INDEX_SOURCES, NumberSearchIndexServiceError, get_number_search_index_service
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BulkDeletionServiceError(Exception):
+    """Excepción personalizada para errores de eliminación masiva"""
+    pass
+
+
+# Filas por lote y pausa entre lotes para ceder el bloqueo de escritura
+DELETION_BATCH_SIZE = 5000
+DELETION_BATCH_PAUSE_SECONDS = 0.01
+
+# Páginas liberadas por paso de VACUUM incremental
+VACUUM_PAGES_PER_STEP = 2000
+
+# Trabajos terminados que se conservan para consulta de estado
+MAX_FINISHED_JOBS = 50
+
+# PRAGMA auto_vacuum: 0 = NONE, 1 = FULL, 2 = INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def active_sheet_rows_sql(alias: Optional[str] = None) -> str:
+    """
+    Condición SQL que excluye las filas de archivos de operador en estado
+    DELETING (operator_call_data / operator_cellular_data)
+
+    Args:
+        alias: Alias de la tabla en la consulta, si lo tiene
+
+    Returns:
+        Condición para agregar al WHERE (sin AND inicial)
+    """
+    column = f"{alias}.file_upload_id" if alias else "file_upload_id"
+    return f"{column} NOT IN (SELECT id FROM operator_data_sheets WHERE processing_status = 'DELETING')"
+
+
+def active_cellular_rows_sql(alias: Optional[str] = None, mission_param: Optional[str] = None) -> str:
+    """
+    Condición SQL que excluye los registros de cellular_data de una limpieza
+    en curso (id menor o igual a missions.cellular_clear_through_id)
+
+    Args:
+        alias: Alias de cellular_data en la consulta, si lo tiene
+        mission_param: Parámetro con el ID de la misión (':mission_id', '?').
+            Con él la subconsulta se evalúa una sola vez; sin él se
+            correlaciona con la columna mission_id de cada fila.
+
+    Returns:
+        Condición para agregar al WHERE (sin AND inicial). El '+' unario
+        evita que SQLite use el rango de id para elegir el índice en lugar
+        del índice de la consulta.
+    """
+    table = alias or 'cellular_data'
+    mission_ref = mission_param or f"{table}.mission_id"
+    return (
+        f"+{table}.id > COALESCE((SELECT cellular_clear_through_id FROM missions "
+        f"WHERE id = {mission_ref}), 0)"
+    )
+
+
+def incremental_vacuum(max_steps: Optional[int] = None,
+                       pages_per_step: int = VACUUM_PAGES_PER_STEP,
+                       mission_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Devuelve al sistema de archivos las páginas libres de la base de datos
+    en pasos cortos (PRAGMA incremental_vacuum), sin reconstruir el archivo.
+
+    Args:
+        max_steps: Máximo de pasos a ejecutar (None = hasta liberar todo)
+        pages_per_step: Páginas liberadas por paso
+        mission_id: Liberar el archivo propio de la misión, si lo tiene
+
+    Returns:
+        Dict con 'status' ('COMPLETED' o 'SKIPPED'), 'pagesFreed' y 'reason'
+    """
+    with get_db_connection(mission_id) as conn:
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+            return {
+                'status': 'SKIPPED',
+                'pagesFreed': 0,
+                'reason': 'La base de datos no usa auto_vacuum = INCREMENTAL '
+                          '(convertir con run_database_maintenance(convert_auto_vacuum=True))'
+            }
+
+        initial_free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        steps = 0
+        while conn.execute("PRAGMA freelist_count").fetchone()[0] > 0:
+            if max_steps is not None and steps >= max_steps:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages_per_step)})").fetchall()
+            steps += 1
+            time.sleep(DELETION_BATCH_PAUSE_SECONDS)
+
+        final_free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return {
+            'status': 'COMPLETED',
+            'pagesFreed': initial_free - final_free,
+            'reason': None
+        }
+
+
+class BulkDeletionService:
+    """
+    Servicio de trabajos de eliminación masiva por lotes en segundo plano
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def start_job(self, kind: str, target_id: str, steps: List[Dict[str, Any]],
+                  vacuum: bool = False,
+                  on_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
+                  mission_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Lanza un trabajo de eliminación en un hilo en segundo plano
+
+        Args:
+            kind: Tipo de trabajo ('OPERATOR_SHEET', 'CELLULAR_DATA')
+            target_id: ID del objeto eliminado (archivo o misión)
+            steps: Pasos en orden, cada uno {'table', 'where', 'params'}
+            vacuum: Ejecutar VACUUM incremental al terminar
+            on_complete: Callback con el estado final si el trabajo termina bien
+            mission_id: Misión de los datos eliminados; las tablas masivas de
+                una misión con almacenamiento propio se eliminan en su archivo
+
+        Returns:
+            Estado inicial del trabajo
+
+        Raises:
+            BulkDeletionServiceError: Si ya hay un trabajo activo para el objeto
+        """
+        if not steps:
+            raise BulkDeletionServiceError("El trabajo de eliminación no tiene pasos")
+
+        with self._lock:
+            active = self._find_active_job(kind, target_id)
+            if active:
+                raise BulkDeletionServiceError(
+                    f"Ya existe un trabajo de eliminación activo para {target_id}: {active['jobId']}"
+                )
+
+            job_id = str(uuid.uuid4())
+            job = {
+                'jobId': job_id,
+                'kind': kind,
+                'targetId': target_id,
+                'status': 'PENDING',
+                'rowsTotal': 0,
+                'rowsDeleted': 0,
+                'progress': 0.0,
+                'currentTable': None,
+                'batches': 0,
+                'vacuum': None,
+                'error': None,
+                'startedAt': datetime.now().isoformat(),
+                'finishedAt': None
+            }
+            self._jobs[job_id] = job
+            self._prune_finished_jobs()
+
+            thread = threading.Thread(
+                target=self._run_job,
+                args=(job_id, steps, vacuum, on_complete, mission_id),
+                name=f"bulk-delete-{job_id[:8]}",
+                daemon=True
+            )
+            self._threads[job_id] = thread
+
+        logger.info(f"Trabajo de eliminación {job_id} iniciado: {kind} {target_id}")
+        thread.start()
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Retorna una copia del estado de un trabajo
+
+        Raises:
+            BulkDeletionServiceError: Si el trabajo no existe
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise BulkDeletionServiceError(f"Trabajo de eliminación no encontrado: {job_id}")
+            return dict(job)
+
+    def list_jobs(self, active_only: bool = False) -> List[Dict[str, Any]]:
+        """Retorna el estado de los trabajos conocidos, más recientes primero"""
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values()
+                    if not active_only or job['status'] in ('PENDING', 'RUNNING')]
+        return sorted(jobs, key=lambda job: job['startedAt'], reverse=True)
+
+    def find_active_job(self, kind: str, target_id: str) -> Optional[Dict[str, Any]]:
+        """Retorna el trabajo activo de un objeto, si existe"""
+        with self._lock:
+            job = self._find_active_job(kind, target_id)
+            return dict(job) if job else None
+
+    def wait_for_job(self, job_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Espera a que un trabajo termine y retorna su estado final"""
+        thread = self._threads.get(job_id)
+        if thread is not None:
+            thread.join(timeout)
+        return self.get_job(job_id)
+
+    def _find_active_job(self, kind: str, target_id: str) -> Optional[Dict[str, Any]]:
+        for job in self._jobs.values():
+            if job['kind'] == kind and job['targetId'] == target_id and job['status'] in ('PENDING', 'RUNNING'):
+                return job
+        return None
+
+    def _prune_finished_jobs(self) -> None:
+        finished = [job for job in self._jobs.values() if job['status'] in ('COMPLETED', 'FAILED')]
+        finished.sort(key=lambda job: job['finishedAt'] or '')
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self._jobs.pop(job['jobId'], None)
+            self._threads.pop(job['jobId'], None)
+
+    def _update_job(self, job_id: str, **changes) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(changes)
+            if job['rowsTotal']:
+                job['progress'] = round(min(job['rowsDeleted'] / job['rowsTotal'], 1.0) * 100, 1)
+
+    def _record_batch(self, job_id: str, deleted: int) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job['rowsDeleted'] += deleted
+            job['batches'] += 1
+            if job['rowsTotal']:
+                job['progress'] = round(min(job['rowsDeleted'] / job['rowsTotal'], 1.0) * 100, 1)
+
+    def _run_job(self, job_id: str, steps: List[Dict[str, Any]], vacuum: bool,
+                 on_complete: Optional[Callable[[Dict[str, Any]], None]],
+                 mission_id: Optional[str] = None) -> None:
+        """Ejecuta los pasos del trabajo lote por lote"""
+        try:
+            maintainers = {step['table']: self._batch_maintainers(step['table']) for step in steps}
+            with get_db_connection(mission_id) as conn:
+                rows_total = 0
+                for step in steps:
+                    rows_total += conn.execute(
+                        f"SELECT COUNT(*) FROM {step['table']} WHERE {step['where']}",
+                        step.get('params', ())
+                    ).fetchone()[0]
+                self._update_job(job_id, status='RUNNING', rowsTotal=rows_total)
+
+                for step in steps:
+                    self._delete_step_in_batches(conn, job_id, step, maintainers[step['table']])
+
+            if vacuum:
+                self._update_job(job_id, currentTable=None, vacuum=incremental_vacuum(mission_id=mission_id))
+
+            self._update_job(job_id, status='COMPLETED', currentTable=None, progress=100.0,
+                             finishedAt=datetime.now().isoformat())
+            job = self.get_job(job_id)
+            logger.info(f"Trabajo de eliminación {job_id} completado: {job['rowsDeleted']} filas "
+                        f"en {job['batches']} lotes")
+
+            # Import diferido: el servicio de mantenimiento usa este módulo
+            from .database_maintenance_service import get_database_maintenance_service
+            get_database_maintenance_service().record_write_activity(mission_id, job['rowsDeleted'])
+
+            if on_complete:
+                on_complete(job)
+
+        except Exception as e:
+            logger.error(f"Error en trabajo de eliminación {job_id}: {e}")
+            self._update_job(job_id, status='FAILED', error=str(e), finishedAt=datetime.now().isoformat())
+
+    def _batch_maintainers(self, table: str) -> List[Callable]:
+        """
+        Mantenimientos set-based de las filas de un lote antes de eliminarlas,
+        ejecutados con (conexión, tabla, condición, parámetros)
+
+        Un servicio que no está listo queda fuera: sus triggers (si existen)
+        mantienen las filas eliminadas.
+        """
+        maintainers = []
+        if table in NUMBER_INDEX_SOURCES:
+            number_index = get_number_search_index_service()
+            try:
+                if number_index.ensure_ready():
+                    maintainers.append(number_index.remove_batch)
+            except NumberSearchIndexServiceError as e:
+                logger.warning(f"Índice de números no disponible para la eliminación: {e}")
+        return maintainers
+
+    def _delete_step_in_batches(self, conn, job_id: str, step: Dict[str, Any],
+                                maintainers: List[Callable] = ()) -> None:
+        """Elimina las filas de un paso en lotes, confirmando cada lote"""
+        table = step['table']
+        params = tuple(step.get('params', ()))
+        self._update_job(job_id, currentTable=table)
+
+        # Último rowid del lote: el mantenimiento y el DELETE ven las mismas filas
+        last_rowid_sql = (
+            f"SELECT MAX(rowid) FROM (SELECT rowid FROM {table} WHERE {step['where']} ORDER BY rowid LIMIT ?)"
+        )
+        batch_where = f"({step['where']}) AND rowid <= ?"
+        while True:
+            last_rowid = conn.execute(last_rowid_sql, params + (DELETION_BATCH_SIZE,)).fetchone()[0]
+            if last_rowid is None:
+                break
+            batch_params = params + (last_rowid,)
+            if maintainers:
+                conn.execute(BEGIN_BATCH_WRITE_SQL, (table,))
+                for maintain in maintainers:
+                    maintain(conn, table, batch_where, batch_params)
+            deleted = conn.execute(f"DELETE FROM {table} WHERE {batch_where}", batch_params).rowcount
+            if maintainers:
+                conn.execute(END_BATCH_WRITE_SQL, (table,))
+            conn.commit()
+            if deleted <= 0:
+                break
+
+            self._record_batch(job_id, deleted)
+
+            if deleted < DELETION_BATCH_SIZE:
+                break
+            # Ceder el bloqueo de escritura a otras conexiones
+            time.sleep(DELETION_BATCH_PAUSE_SECONDS)
+
+
+# Instancia global del servicio
+_bulk_deletion_service_instance = None
+
+
+def get_bulk_deletion_service() -> BulkDeletionService:
+    """Retorna la instancia singleton del servicio de eliminación masiva"""
+    global _bulk_deletion_service_instance
+    if _bulk_deletion_service_instance is None:
+        _bulk_deletion_service_instance = BulkDeletionService()
+    return _bulk_deletion_service_instance
@@ -0,0 +1,355 @@
+"""
+KRONOS - Cell Dictionary Service
+===============================================================================
+DICCIONARIO DE CELDAS: CLAVE CANÓNICA -> ID ENTERO
+===============================================================================
+
+Los identificadores de celda (cell_id, celda_id, celda_origen, celda_destino,
+celda_objetivo) se guardan como TEXT libre y las correlaciones los comparan
+como cadenas: '12345', ' 12345' y '12345.0' (Excel leído como float) no
+coinciden. El diccionario asigna a cada clave canónica un entero pequeño y
+las tablas masivas guardan ese entero en columnas *_key_id indexadas, de modo
+que los cruces con las celdas HUNTER y los conteos de celdas distintas de la
+correlación operan sobre enteros.
+
+CLAVE CANÓNICA (canonical_cell_key / _canonical_sql):
+- Sin espacios al inicio y al final
+- Un entero escrito como decimal sin parte fraccionaria ('12345.0') pierde
+  los decimales
+- Vacío -> NULL (sin clave)
+
+Las claves se comparten entre operadores: la correlación cruza las celdas
+HUNTER de cellular_data con las llamadas de cualquier operador, así que una
+misma celda debe tener el mismo ID en todas las tablas.
+
+MANTENIMIENTO:
+El núcleo de carga (FileProcessorService._write_prepared_rows) asigna los
+IDs una vez por lote escrito con assign_batch: INSERT OR IGNORE de las
+claves distintas del lote y UPDATE ... FROM sobre su rango de IDs, en la
+misma transacción. Triggers AFTER INSERT/UPDATE OF <celdas> hacen lo mismo
+fila a fila como respaldo para las escrituras fuera del núcleo; el de INSERT
+no se ejecuta durante un lote del núcleo (database/batch_write_guard.py).
+En misiones con archivo propio se ejecutan como triggers TEMP y el
+diccionario vive en kronos.db. Al crear las columnas se asignan los IDs de
+los registros existentes.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import re
+from typing import Dict, Any, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.batch_write_guard import BATCH_WRITE_GUARD_SCHEMA, outside_batch_sql
+from database.connection import get_database_manager, get_db_connection
+
+logger = logging.getLogger(__name__)
+
+
+class CellDictionaryServiceError(Exception):
+    """Excepción personalizada para errores del diccionario de celdas"""
+    pass
+
+
+CELL_DICTIONARY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cell_dictionary (
+        id INTEGER PRIMARY KEY,
+        cell_key TEXT NOT NULL UNIQUE
+    )
+"""
+
+# Columnas de celda de cada tabla masiva -> columna con el ID del diccionario
+CELL_KEY_COLUMNS = {
+    'cellular_data': {'cell_id': 'cell_key_id'},
+    'operator_cellular_data': {'celda_id': 'celda_key_id'},
+    'operator_call_data': {
+        'celda_origen': 'celda_origen_key_id',
+        'celda_destino': 'celda_destino_key_id',
+        'celda_objetivo': 'celda_objetivo_key_id'
+    }
+}
+
+# Índices sobre los IDs (los cruces con HUNTER filtran por misión y celda)
+CELL_KEY_INDEXES = {
+    'idx_cellular_data_mission_cell_key': ('cellular_data', ('mission_id', 'cell_key_id')),
+    'idx_operator_cellular_data_mission_celda_key': ('operator_cellular_data', ('mission_id', 'celda_key_id')),
+    'idx_operator_call_data_mission_origen_key': ('operator_call_data', ('mission_id', 'celda_origen_key_id')),
+    'idx_operator_call_data_mission_destino_key': ('operator_call_data', ('mission_id', 'celda_destino_key_id')),
+}
+
+# Claves por consulta al traducir celdas <-> IDs
+LOOKUP_CHUNK_SIZE = 500
+
+_INTEGRAL_DECIMAL = re.compile(r'([0-9]+)\.0*')
+
+
+def canonical_cell_key(value: Any) -> Optional[str]:
+    """
+    Clave canónica de un identificador de celda (igual a _canonical_sql)
+
+    Returns:
+        Clave sin espacios ni decimales nulos, o None si está vacía
+    """
+    if value is None:
+        return None
+    key = str(value).strip(' ')
+    match = _INTEGRAL_DECIMAL.fullmatch(key)
+    if match:
+        key = match.group(1)
+    return key or None
+
+
+def _canonical_sql(expression: str) -> str:
+    """Expresión SQL equivalente a canonical_cell_key"""
+    value = f"trim({expression})"
+    dot = f"instr({value}, '.')"
+    whole = f"substr({value}, 1, {dot} - 1)"
+    return (
+        f"NULLIF(CASE WHEN {dot} > 1 AND rtrim(substr({value}, {dot} + 1), '0') = '' "
+        f"AND {whole} NOT GLOB '*[^0-9]*' THEN {whole} ELSE {value} END, '')"
+    )
+
+
+class CellDictionaryService:
+    """
+    Servicio del diccionario de celdas
+
+    Funcionalidades:
+    1. Crear el diccionario, las columnas de IDs, sus índices y los triggers
+       de asignación (kronos.db y archivos de misiones fragmentadas)
+    2. Asignar los IDs de un lote escrito por el núcleo de carga
+    3. Traducir celdas (por ejemplo las del archivo HUNTER) a IDs y viceversa
+    """
+
+    def __init__(self):
+        self._ready_engine = None
+
+    @property
+    def db_manager(self):
+        """Obtiene el database manager de manera lazy (init_database puede reemplazarlo)"""
+        return get_database_manager()
+
+    def ensure_dictionary(self) -> Optional[int]:
+        """
+        Crea el diccionario, las columnas de IDs y los triggers si no existen,
+        asignando los IDs de los registros existentes
+
+        Returns:
+            Claves del diccionario, o None si faltan tablas masivas
+        """
+        if not self.ensure_ready():
+            return None
+        with self.db_manager.get_session() as session:
+            return session.execute(text("SELECT COUNT(*) FROM cell_dictionary")).scalar()
+
+    def ensure_ready(self) -> bool:
+        """
+        Verificación rápida para las consultas de correlación: crea el
+        diccionario la primera vez y luego solo compara el engine
+
+        Returns:
+            False si alguna tabla masiva no existe en kronos.db
+        """
+        return self._ensure_dictionary()
+
+    def assign_batch(self, conn, table: str, after_id: int) -> None:
+        """
+        Registra las claves de un lote y asigna sus IDs (set-based)
+
+        Args:
+            conn: Conexión o cursor sqlite3 de la transacción del lote (también
+                la de una misión fragmentada)
+            table: Tabla masiva escrita
+            after_id: Último ID de la tabla antes del lote (el lote son las
+                filas con id mayor, aún sin confirmar)
+        """
+        columns = CELL_KEY_COLUMNS[table]
+        keys = ' UNION ALL '.join(
+            f"SELECT {_canonical_sql(cell_column)} AS cell_key FROM {table} WHERE id > ?" for cell_column in columns
+        )
+        conn.execute(f"INSERT OR IGNORE INTO cell_dictionary (cell_key) "
+                     f"SELECT DISTINCT cell_key FROM ({keys}) WHERE cell_key IS NOT NULL", (after_id,) * len(columns))
+        for cell_column, key_column in columns.items():
+            conn.execute(f"UPDATE {table} AS t SET {key_column} = d.id FROM cell_dictionary d "
+                         f"WHERE t.id > ? AND d.cell_key = {_canonical_sql('t.' + cell_column)}", (after_id,))
+
+    def lookup_ids(self, session, cells: Iterable[Any]) -> Dict[str, int]:
+        """
+        IDs de un conjunto de celdas
+
+        Args:
+            session: Sesión o conexión (también la de una misión fragmentada)
+            cells: Identificadores de celda en cualquier formato
+
+        Returns:
+            Clave canónica -> ID, solo para las claves registradas (una clave
+            sin ID no aparece en ningún registro)
+        """
+        keys = sorted({key for key in map(canonical_cell_key, cells) if key is not None})
+        return {key: key_id for key, key_id in self._lookup(session, 'cell_key', keys, 'cell_key, id')}
+
+    def lookup_keys(self, session, key_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Claves canónicas de un conjunto de IDs
+
+        Returns:
+            ID -> clave canónica
+        """
+        ids = sorted({int(key_id) for key_id in key_ids if key_id is not None})
+        return {key_id: key for key_id, key in self._lookup(session, 'id', ids, 'id, cell_key')}
+
+    def _lookup(self, session, column: str, values: List[Any], columns: str) -> List[tuple]:
+        """Filas del diccionario con column IN values, por bloques"""
+        rows = []
+        try:
+            for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+                chunk = values[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ', '.join(f":v{i}" for i in range(len(chunk)))
+                rows.extend(session.execute(
+                    text(f"SELECT {columns} FROM cell_dictionary WHERE {column} IN ({placeholders})"),
+                    {f"v{i}": value for i, value in enumerate(chunk)}
+                ).fetchall())
+        except SQLAlchemyError as e:
+            logger.error(f"Error consultando diccionario de celdas: {e}")
+            raise CellDictionaryServiceError("Error consultando el diccionario de celdas")
+        return rows
+
+    def _ensure_dictionary(self) -> bool:
+        """
+        Crea el diccionario en kronos.db y las columnas, índices y triggers en
+        kronos.db y en cada archivo de misión
+
+        Returns:
+            False si alguna tabla masiva no existe en kronos.db
+        """
+        # Una reinicialización de la BD crea un engine nuevo: verificar de nuevo
+        if self._ready_engine is self.db_manager.get_engine():
+            return True
+
+        try:
+            with get_db_connection() as conn:
+                existing = {row[0] for row in conn.execute(
+                    f"SELECT name FROM sqlite_master WHERE type = 'table' "
+                    f"AND name IN ({', '.join('?' * len(CELL_KEY_COLUMNS))})", tuple(CELL_KEY_COLUMNS)
+                )}
+                conn.execute(CELL_DICTIONARY_SCHEMA)
+                conn.execute(BATCH_WRITE_GUARD_SCHEMA)
+                added = self._prepare_tables(conn, existing)
+                current = dict(conn.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_cell_dictionary_%'"
+                ))
+                for name, body in self._trigger_definitions(existing).items():
+                    trigger_sql = f"CREATE TRIGGER {name} {body}"
+                    if current.get(name) == trigger_sql:
+                        continue
+                    if name in current:
+                        # Definición anterior (sin la marca de lotes del núcleo)
+                        conn.execute(f"DROP TRIGGER {name}")
+                    conn.execute(trigger_sql)
+                conn.commit()
+            if added:
+                logger.info(f"Diccionario de celdas: IDs asignados en {', '.join(added)}")
+
+            sharded = self.db_manager.get_sharded_missions()
+            if sharded:
+                # Las conexiones abiertas antes de crear los triggers no los tienen
+                self.db_manager.dispose_shard_engines()
+            for mission_id in sharded:
+                with get_db_connection(mission_id) as conn:
+                    self._prepare_tables(conn, set(CELL_KEY_COLUMNS))
+                    conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error creando diccionario de celdas: {e}")
+            raise CellDictionaryServiceError("Error creando el diccionario de celdas")
+
+        if existing != set(CELL_KEY_COLUMNS):
+            return False
+        self._ready_engine = self.db_manager.get_engine()
+        return True
+
+    def _prepare_tables(self, conn, tables: set) -> List[str]:
+        """
+        Agrega las columnas de IDs y sus índices a las tablas de 'main' que
+        no las tienen, asignando los IDs de los registros existentes
+
+        Returns:
+            Tablas a las que se agregaron columnas
+        """
+        added = []
+        for table, columns in CELL_KEY_COLUMNS.items():
+            if table not in tables:
+                continue
+            current = {row[1] for row in conn.execute(f"PRAGMA main.table_info({table})")}
+            missing = [key_column for key_column in columns.values() if key_column not in current]
+            for key_column in missing:
+                conn.execute(f"ALTER TABLE main.{table} ADD COLUMN {key_column} INTEGER")
+            if missing:
+                self._assign_existing(conn, table)
+                added.append(table)
+        for name, (table, columns) in CELL_KEY_INDEXES.items():
+            if table in tables:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS main.{name} ON {table}({', '.join(columns)})")
+        return added
+
+    def _assign_existing(self, conn, table: str) -> None:
+        """Registra las claves de una tabla de 'main' y asigna sus IDs"""
+        columns = CELL_KEY_COLUMNS[table]
+        keys = ' UNION '.join(
+            f"SELECT {_canonical_sql(cell_column)} AS cell_key FROM main.{table}" for cell_column in columns
+        )
+        conn.execute(f"INSERT OR IGNORE INTO cell_dictionary (cell_key) "
+                     f"SELECT cell_key FROM ({keys}) WHERE cell_key IS NOT NULL")
+        assignments = ', '.join(
+            f"{key_column} = (SELECT d.id FROM cell_dictionary d WHERE d.cell_key = {_canonical_sql(cell_column)})"
+            for cell_column, key_column in columns.items()
+        )
+        conn.execute(f"UPDATE main.{table} SET {assignments}")
+
+    def _trigger_definitions(self, tables: set) -> Dict[str, str]:
+        """Triggers INSERT/UPDATE de cada tabla masiva existente (respaldo fuera del núcleo de carga)"""
+        triggers = {}
+        for table, columns in CELL_KEY_COLUMNS.items():
+            if table not in tables:
+                continue
+            body = self._assign_statements(table, columns)
+            any_cell = ' OR '.join(f"NEW.{cell_column} IS NOT NULL" for cell_column in columns)
+            triggers[f"trg_cell_dictionary_{table}_insert"] = (
+                f"AFTER INSERT ON {table} WHEN ({any_cell}) AND {outside_batch_sql(table)} BEGIN {body} END"
+            )
+            triggers[f"trg_cell_dictionary_{table}_update"] = (
+                f"AFTER UPDATE OF {', '.join(columns)} ON {table} BEGIN {body} END"
+            )
+        return triggers
+
+    def _assign_statements(self, table: str, columns: Dict[str, str]) -> str:
+        """Sentencias que registran las claves de NEW y asignan sus IDs a la fila"""
+        keys = ' UNION ALL '.join(
+            f"SELECT {_canonical_sql('NEW.' + cell_column)} AS cell_key" for cell_column in columns
+        )
+        assignments = ', '.join(
+            f"{key_column} = (SELECT id FROM cell_dictionary WHERE cell_key = {_canonical_sql('NEW.' + cell_column)})"
+            for cell_column, key_column in columns.items()
+        )
+        return (
+            f"INSERT OR IGNORE INTO cell_dictionary (cell_key) "
+            f"SELECT cell_key FROM ({keys}) WHERE cell_key IS NOT NULL; "
+            f"UPDATE {table} SET {assignments} WHERE id = NEW.id; "
+        )
+
+
+# Instancia global del servicio
+_cell_dictionary_service_instance = None
+
+
+def get_cell_dictionary_service() -> CellDictionaryService:
+    """Retorna la instancia singleton del servicio de diccionario de celdas"""
+    global _cell_dictionary_service_instance
+    if _cell_dictionary_service_instance is None:
+        _cell_dictionary_service_instance = CellDictionaryService()
+    return _cell_dictionary_service_instance
@@ -0,0 +1,246 @@
+"""
+KRONOS - Communication Graph Service
+===============================================================================
+GRAFO DE COMUNICACIONES EN MEMORIA POR MISIÓN
+===============================================================================
+
+Mantiene un grafo de comunicaciones (utils.communication_graph) por misión,
+construido en la primera consulta con una sola lectura de operator_call_data.
+Las consultas posteriores (vecindario a k saltos, grado, centralidad, ventanas
+de tiempo) se resuelven en memoria sin SQL.
+
+INVALIDACIÓN:
+Las cargas de archivos de operador (al terminar) y las eliminaciones (al
+marcar el archivo DELETING) descartan el grafo de la misión mediante
+register_call_data_change_listener (services/operator_data_service.py), sin
+consultas en cada lectura. Como respaldo para escrituras fuera de esos
+caminos, cada signature_check_seconds se compara una firma de las llamadas
+de la misión (cantidad, máximo y suma de ids). invalidate() permite
+descartarlo explícitamente.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.connection import get_database_manager
+from services.bulk_deletion_service import active_sheet_rows_sql
+
+logger = logging.getLogger(__name__)
+
+
+class CommunicationGraphServiceError(Exception):
+    """Excepción personalizada para errores del grafo de comunicaciones"""
+    pass
+
+
+# Límites de consulta y de cache
+COMMUNICATION_GRAPH_LIMITS = {
+    'max_hops': 3,               # Máximo de saltos desde el número
+    'max_nodes': 500,            # Máximo de nodos en un vecindario
+    'max_top': 200,              # Máximo de números en el ranking de centralidad
+    'cached_missions': 4,        # Grafos de misión mantenidos en memoria
+    'signature_check_seconds': 300  # Verificación de respaldo de la firma de llamadas
+}
+
+
+class CommunicationGraphService:
+    """
+    Servicio de grafos de comunicaciones por misión
+
+    Funcionalidades:
+    1. Construir y cachear el grafo de llamadas de una misión
+    2. Vecindario a k saltos de un número con pesos por par
+    3. Ranking de centralidad (grado y PageRank ponderado)
+    4. Filtro por ventana de tiempo en memoria
+    """
+
+    def __init__(self, signature_check_seconds: float = COMMUNICATION_GRAPH_LIMITS['signature_check_seconds']):
+        self.db_manager = get_database_manager()
+        self.signature_check_seconds = signature_check_seconds
+        self._graphs = OrderedDict()  # mission_id -> (firma, grafo, verificado en)
+        self._generations: Dict[Optional[str], int] = {}  # mission_id (None = todas) -> invalidaciones
+        self._lock = threading.Lock()
+
+    def get_neighborhood(self, mission_id: str, numero: str, hops: int = 2,
+                         start_datetime: Optional[str] = None, end_datetime: Optional[str] = None,
+                         max_nodes: int = 100) -> Dict[str, Any]:
+        """
+        Obtiene el subgrafo a k saltos de un número
+
+        Args:
+            mission_id: ID de la misión
+            numero: Número telefónico central
+            hops: Cantidad de saltos (1 = contactos directos)
+            start_datetime, end_datetime: Ventana de tiempo opcional (YYYY-MM-DD HH:MM:SS)
+            max_nodes: Máximo de nodos retornados
+
+        Returns:
+            Diccionario con 'nodes', 'edges', 'truncated', 'graph' (tamaño del
+            grafo de la misión) y 'queryTime'
+        """
+        start_time = time.time()
+        hops = int(hops or 1)
+        if hops < 1 or hops > COMMUNICATION_GRAPH_LIMITS['max_hops']:
+            raise CommunicationGraphServiceError(
+                f"Los saltos deben estar entre 1 y {COMMUNICATION_GRAPH_LIMITS['max_hops']}"
+            )
+        max_nodes = min(max(int(max_nodes or 1), 1), COMMUNICATION_GRAPH_LIMITS['max_nodes'])
+        start_ts, end_ts = self._parse_window(start_datetime, end_datetime)
+
+        graph = self.get_graph(mission_id)
+        result = graph.neighborhood(str(numero).strip(), hops=hops, max_nodes=max_nodes,
+                                    start_ts=start_ts, end_ts=end_ts)
+        result.update({
+            'numero': str(numero).strip(),
+            'hops': hops,
+            'graph': {'nodes': graph.node_count, 'events': graph.event_count},
+            'queryTime': round(time.time() - start_time, 4)
+        })
+        return result
+
+    def get_centrality(self, mission_id: str, top: int = 20, start_datetime: Optional[str] = None,
+                       end_datetime: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Obtiene los números más centrales de la misión
+
+        Args:
+            mission_id: ID de la misión
+            top: Cantidad de números retornados
+            start_datetime, end_datetime: Ventana de tiempo opcional (YYYY-MM-DD HH:MM:SS)
+
+        Returns:
+            Diccionario con 'data' (número, grado, llamadas, centralidad de
+            grado y PageRank), 'total' y 'queryTime'
+        """
+        start_time = time.time()
+        top = min(max(int(top or 1), 1), COMMUNICATION_GRAPH_LIMITS['max_top'])
+        start_ts, end_ts = self._parse_window(start_datetime, end_datetime)
+
+        data = self.get_graph(mission_id).centrality(top=top, start_ts=start_ts, end_ts=end_ts)
+        return {
+            'data': data,
+            'total': len(data),
+            'queryTime': round(time.time() - start_time, 4)
+        }
+
+    def get_graph(self, mission_id: str):
+        """
+        Obtiene el grafo de la misión, reconstruyéndolo si fue invalidado o
+        si la verificación de respaldo detecta que las llamadas cambiaron
+
+        Returns:
+            CommunicationGraph de la misión
+        """
+        with self._lock:
+            cached = self._graphs.get(mission_id)
+            generation = (self._generations.get(None, 0), self._generations.get(mission_id, 0))
+            if cached and time.monotonic() - cached[2] < self.signature_check_seconds:
+                self._graphs.move_to_end(mission_id)
+                return cached[1]
+
+        signature = self._calls_signature(mission_id)
+        if cached and cached[0] == signature:
+            graph = cached[1]
+        else:
+            graph = self._build_graph(mission_id)
+
+        with self._lock:
+            # Una invalidación durante la construcción descarta el resultado
+            if (self._generations.get(None, 0), self._generations.get(mission_id, 0)) == generation:
+                self._graphs[mission_id] = (signature, graph, time.monotonic())
+                self._graphs.move_to_end(mission_id)
+                while len(self._graphs) > COMMUNICATION_GRAPH_LIMITS['cached_missions']:
+                    self._graphs.popitem(last=False)
+        return graph
+
+    def invalidate(self, mission_id: Optional[str] = None) -> None:
+        """Descarta el grafo de una misión (o todos)"""
+        with self._lock:
+            if mission_id is None:
+                self._graphs.clear()
+            else:
+                self._graphs.pop(mission_id, None)
+            self._generations[mission_id] = self._generations.get(mission_id, 0) + 1
+
+    def _parse_window(self, start_datetime: Optional[str],
+                      end_datetime: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+        """Convierte la ventana de tiempo a epoch (fin de día si solo se indica la fecha)"""
+        from utils.communication_graph import datetime_to_epoch
+
+        try:
+            start_ts = datetime_to_epoch(start_datetime)
+            end_ts = datetime_to_epoch(end_datetime)
+        except ValueError:
+            raise CommunicationGraphServiceError("Formato de fecha inválido, use YYYY-MM-DD HH:MM:SS")
+
+        if end_ts is not None and end_datetime and ' ' not in str(end_datetime).strip():
+            end_ts += 86399
+        if start_ts is not None and end_ts is not None and start_ts > end_ts:
+            raise CommunicationGraphServiceError("La fecha de inicio es posterior a la fecha de fin")
+        return start_ts, end_ts
+
+    def _calls_signature(self, mission_id: str) -> Tuple:
+        """Firma de las llamadas visibles de la misión (respaldo: cambia con cada INSERT/DELETE)"""
+        try:
+            with self.db_manager.get_session(mission_id) as session:
+                return tuple(session.execute(text(
+                    "SELECT COUNT(*), MAX(id), TOTAL(id) FROM operator_call_data "
+                    f"WHERE mission_id = :mission_id AND {active_sheet_rows_sql()}"
+                ), {'mission_id': mission_id}).first())
+        except SQLAlchemyError as e:
+            logger.error(f"Error verificando llamadas de la misión {mission_id}: {e}")
+            raise CommunicationGraphServiceError("Error consultando las llamadas de la misión")
+
+    def _build_graph(self, mission_id: str):
+        """Construye el grafo de la misión con una sola lectura de operator_call_data"""
+        from utils.communication_graph import CommunicationGraph
+
+        start_time = time.time()
+        try:
+            with self.db_manager.get_session(mission_id) as session:
+                rows = session.execute(text(f"""
+                    SELECT numero_origen, numero_destino,
+                           CAST(strftime('%s', fecha_hora_llamada) AS INTEGER) AS ts,
+                           COALESCE(duracion_segundos, 0)
+                    FROM operator_call_data
+                    WHERE mission_id = :mission_id
+                      AND {active_sheet_rows_sql()}
+                      AND numero_origen IS NOT NULL AND numero_origen != ''
+                      AND numero_destino IS NOT NULL AND numero_destino != ''
+                      AND strftime('%s', fecha_hora_llamada) IS NOT NULL
+                """), {'mission_id': mission_id}).fetchall()
+        except SQLAlchemyError as e:
+            logger.error(f"Error leyendo llamadas de la misión {mission_id}: {e}")
+            raise CommunicationGraphServiceError("Error construyendo el grafo de comunicaciones")
+
+        origen, destino, ts, duration = zip(*rows) if rows else ((), (), (), ())
+        graph = CommunicationGraph.from_calls(origen, destino, ts, duration)
+        logger.info(f"Grafo de comunicaciones de {mission_id}: {graph.node_count} números, "
+                    f"{graph.event_count} llamadas ({time.time() - start_time:.3f}s)")
+        return graph
+
+
+# Instancia global del servicio
+_communication_graph_service_instance = None
+
+
+def get_communication_graph_service() -> CommunicationGraphService:
+    """Retorna la instancia singleton del servicio de grafo de comunicaciones"""
+    global _communication_graph_service_instance
+    if _communication_graph_service_instance is None:
+        from services.operator_data_service import register_call_data_change_listener
+
+        _communication_graph_service_instance = CommunicationGraphService()
+        # Descartar el grafo cuando una carga o eliminación cambia las llamadas
+        register_call_data_change_listener(_communication_graph_service_instance.invalidate)
+    return _communication_graph_service_instance
@@ -26,6 +26,7 @@ from collections import defaultdict, Counter
 
 from database.connection import get_database_manager
 from database.models import Mission, CellularData
+from services.bulk_deletion_service import active_sheet_rows_sql, active_cellular_rows_sql
 
 logger = logging.getLogger(__name__)
 
@@ -84,7 +85,7 @@ class CorrelationService:
             # Validar parámetros
             self._validate_correlation_parameters(mission_id, start_datetime, end_datetime, min_occurrences)
             
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session(mission_id) as session:
                 # Verificar que la misión existe
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
@@ -166,10 +167,11 @@ class CorrelationService:
         """
         try:
             # CORRECCIÓN: Query optimizada para extraer celdas HUNTER únicas SOLO para operador CLARO
-            query = text("""
+            query = text(f"""
                 SELECT DISTINCT cell_id
                 FROM cellular_data 
                 WHERE mission_id = :mission_id
+                  AND {active_cellular_rows_sql(mission_param=':mission_id')}
                   AND created_at >= :start_dt
                   AND created_at <= :end_dt
                   AND cell_id IS NOT NULL
@@ -237,6 +239,7 @@ class CorrelationService:
                     ) as related_cells
                 FROM operator_call_data 
                 WHERE mission_id = :mission_id
+                  AND {active_rows}
                   AND fecha_hora_llamada >= :start_dt
                   AND fecha_hora_llamada <= :end_dt
                   AND numero_objetivo IS NOT NULL
@@ -250,7 +253,8 @@ class CorrelationService:
                 GROUP BY numero_objetivo, operator
                 HAVING unique_hunter_cells_used >= :min_occurrences
                 ORDER BY unique_hunter_cells_used DESC, total_calls DESC
-            """.format(placeholders=','.join([':cell_{}'.format(i) for i in range(len(hunter_cells_list))])))
+            """.format(placeholders=','.join([':cell_{}'.format(i) for i in range(len(hunter_cells_list))]),
+                       active_rows=active_sheet_rows_sql()))
             
             # Preparar parámetros
             params = {
@@ -436,9 +440,9 @@ class CorrelationService:
             Diccionario con estadísticas de datos disponibles
         """
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session(mission_id) as session:
                 # Contar datos HUNTER
-                hunter_query = text("""
+                hunter_query = text(f"""
                     SELECT 
                         COUNT(*) as total_records,
                         COUNT(DISTINCT cell_id) as unique_cells,
@@ -446,12 +450,13 @@ class CorrelationService:
                         MAX(created_at) as latest_record
                     FROM cellular_data 
                     WHERE mission_id = :mission_id
+                      AND {active_cellular_rows_sql(mission_param=':mission_id')}
                 """)
                 
                 hunter_result = session.execute(hunter_query, {'mission_id': mission_id}).fetchone()
                 
                 # Contar datos de operadores
-                operator_query = text("""
+                operator_query = text(f"""
                     SELECT 
                         COUNT(*) as total_calls,
                         COUNT(DISTINCT numero_objetivo) as unique_numbers,
@@ -460,6 +465,7 @@ class CorrelationService:
                         MAX(fecha_hora_llamada) as latest_call
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id
+                      AND {active_sheet_rows_sql()}
                 """)
                 
                 operator_result = session.execute(operator_query, {'mission_id': mission_id}).fetchone()
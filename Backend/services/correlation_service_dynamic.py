@@ -35,6 +35,8 @@ from sqlalchemy import text
 from collections import defaultdict
 
 from database.connection import get_database_manager
+from services.cell_dictionary_service import get_cell_dictionary_service
+from services.bulk_deletion_service import active_sheet_rows_sql, active_cellular_rows_sql
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +85,10 @@ class CorrelationServiceDynamic:
             logger.info(f"Período: {start_datetime} - {end_datetime}")
             logger.info(f"Min occurrences: {min_occurrences}")
             
-            with self.db_manager.get_session() as session:
+            # IDs de celda del diccionario (se crean y asignan la primera vez)
+            get_cell_dictionary_service().ensure_ready()
+            
+            with self.db_manager.get_session(mission_id) as session:
                 # 1. Extraer celdas HUNTER
                 hunter_cells = self._extract_hunter_cells(session, mission_id)
                 if not hunter_cells:
@@ -131,10 +136,11 @@ class CorrelationServiceDynamic:
         """Extrae celdas HUNTER de la misión"""
         try:
             # Primero intentar con cellular_data (datos celulares HUNTER)
-            query_cellular = text("""
+            query_cellular = text(f"""
                 SELECT DISTINCT cell_id
                 FROM cellular_data 
                 WHERE mission_id = :mission_id 
+                  AND {active_cellular_rows_sql(mission_param=':mission_id')}
                   AND cell_id IS NOT NULL
             """)
             
@@ -144,15 +150,17 @@ class CorrelationServiceDynamic:
             # Si no hay datos en cellular_data, extraer celdas únicas de operator_call_data
             if not hunter_cells:
                 logger.warning("No se encontraron celdas en cellular_data, extrayendo de operator_call_data")
-                query_operator = text("""
+                query_operator = text(f"""
                     SELECT DISTINCT celda_origen
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
+                      AND {active_sheet_rows_sql()}
                       AND celda_origen IS NOT NULL
                     UNION
                     SELECT DISTINCT celda_destino
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
+                      AND {active_sheet_rows_sql()}
                       AND celda_destino IS NOT NULL
                 """)
                 
@@ -189,11 +197,15 @@ class CorrelationServiceDynamic:
         4. Cuenta 1 ocurrencia por combinación única número-celda
         
         RESULTADO: Conteos precisos sin inflación artificial
+        
+        Celdas HUNTER, combinaciones y celdas relacionadas usan los IDs del
+        diccionario de celdas (columnas *_key_id).
         """
         try:
-            # Convertir celdas HUNTER a lista para SQL
+            # Convertir celdas HUNTER a IDs del diccionario para SQL
             hunter_cells_list = list(hunter_cells)
-            hunter_cells_str = ','.join([f"'{cell}'" for cell in hunter_cells_list])
+            hunter_key_ids = sorted(get_cell_dictionary_service().lookup_ids(session, hunter_cells_list).values())
+            hunter_cells_str = ','.join(str(key_id) for key_id in hunter_key_ids)
             
             if not hunter_cells_str:
                 return []
@@ -205,7 +217,8 @@ class CorrelationServiceDynamic:
                     SELECT DISTINCT numero_origen as numero, operator as operador
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
-                      AND celda_origen IN ({hunter_cells_str})
+                      AND {active_sheet_rows_sql()}
+                      AND celda_origen_key_id IN ({hunter_cells_str})
                       AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
                       AND numero_origen IS NOT NULL 
                       AND numero_origen != ''
@@ -215,7 +228,8 @@ class CorrelationServiceDynamic:
                     SELECT DISTINCT numero_destino as numero, operator as operador
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
-                      AND celda_destino IN ({hunter_cells_str})
+                      AND {active_sheet_rows_sql()}
+                      AND celda_destino_key_id IN ({hunter_cells_str})
                       AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
                       AND numero_destino IS NOT NULL 
                       AND numero_destino != ''
@@ -225,48 +239,48 @@ class CorrelationServiceDynamic:
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_origen as celda,
+                        ocd.celda_origen_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_origen AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_origen IS NOT NULL
-                      AND ocd.celda_origen != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_origen
+                      AND ocd.celda_origen_key_id IS NOT NULL
+                    GROUP BY tn.numero, tn.operador, ocd.celda_origen_key_id
                     
                     UNION
                     
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_destino as celda,
+                        ocd.celda_destino_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_origen AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_destino IS NOT NULL
-                      AND ocd.celda_destino != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_destino
+                      AND ocd.celda_destino_key_id IS NOT NULL
+                    GROUP BY tn.numero, tn.operador, ocd.celda_destino_key_id
                     
                     UNION
                     
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_destino as celda,
+                        ocd.celda_destino_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_destino AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_destino IS NOT NULL
-                      AND ocd.celda_destino != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_destino
+                      AND ocd.celda_destino_key_id IS NOT NULL
+                    GROUP BY tn.numero, tn.operador, ocd.celda_destino_key_id
                 ),
                 final_unique_combinations AS (
                     -- Consolidar para evitar duplicados cuando la misma combinación número-celda 
@@ -333,8 +347,14 @@ class CorrelationServiceDynamic:
                 logger.error(f"Query problemático detectado - verificar sintaxis SQLite")
                 raise CorrelationServiceDynamicError(f"Error en query SQL: {sql_error}")
             
+            rows = result.fetchall()
+            # Claves de las celdas relacionadas (la consulta devuelve IDs del diccionario)
+            cell_keys = get_cell_dictionary_service().lookup_keys(
+                session, {int(key_id) for row in rows if row[5] for key_id in str(row[5]).split(',')}
+            )
+            
             correlations = []
-            for row in result.fetchall():
+            for row in rows:
                 numero = str(row[0])
                 operador = str(row[1])
                 ocurrencias = int(row[2])
@@ -342,10 +362,10 @@ class CorrelationServiceDynamic:
                 ultima_deteccion = row[4]
                 celdas_relacionadas_str = str(row[5]) if row[5] else ""
                 
-                # Procesar celdas relacionadas (SQLite devuelve separadas por comas)
+                # Procesar celdas relacionadas (SQLite devuelve IDs separados por comas)
                 if celdas_relacionadas_str:
                     # SQLite GROUP_CONCAT usa coma como separador por defecto
-                    celdas_relacionadas = [cell.strip() for cell in celdas_relacionadas_str.split(',') if cell.strip()]
+                    celdas_relacionadas = [cell_keys[int(key_id)] for key_id in celdas_relacionadas_str.split(',')]
                 else:
                     celdas_relacionadas = []
                 
@@ -434,6 +454,7 @@ class CorrelationServiceDynamic:
                     numero_destino as otro_numero
                 FROM operator_call_data 
                 WHERE numero_origen = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_origen IS NOT NULL
                   AND numero_origen != ''
                 
@@ -449,6 +470,7 @@ class CorrelationServiceDynamic:
                     numero_destino as otro_numero
                 FROM operator_call_data 
                 WHERE numero_origen = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_origen IS NOT NULL
                   AND numero_origen != ''
                   AND celda_destino IS NOT NULL
@@ -466,6 +488,7 @@ class CorrelationServiceDynamic:
                     numero_origen as otro_numero
                 FROM operator_call_data 
                 WHERE numero_destino = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_destino IS NOT NULL
                   AND numero_destino != ''
                 
@@ -22,6 +22,15 @@ ESTRATEGIAS IMPLEMENTADAS:
 3. Búsqueda Directa de Objetivos - Garantiza que números críticos aparezcan
 4. Rescate de Emergencia - Recupera números faltantes con criterios muy amplios
 
+PLAN UNIFICADO:
+Las cuatro estrategias se calculan en una sola consulta: las celdas HUNTER se
+agregan una vez por ID de celda (marcando las de la estrategia A dentro del
+conjunto flexible de B) y operator_call_data se recorre una sola vez con
+agregados condicionales por estrategia. El rescate de emergencia reutiliza los
+mismos grupos. Cada resultado indica en matchedStrategies qué estrategias lo
+detectaron. Los cruces y conteos de celdas HUNTER usan los IDs enteros de
+services/cell_dictionary_service.py.
+
 GARANTÍA: Este servicio ASEGURA 100% que los números objetivo aparezcan.
 
 Autor: Claude Code para Boris
@@ -40,6 +49,9 @@ from collections import defaultdict, Counter
 
 from database.connection import get_database_manager
 from database.models import Mission, CellularData
+from services.mission_service import register_cellular_change_listener
+from services.cell_dictionary_service import get_cell_dictionary_service
+from services.bulk_deletion_service import active_sheet_rows_sql, active_cellular_rows_sql
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +78,9 @@ class CorrelationServiceFixed:
         '3143534707',  # ⚠️ CRÍTICO
         '3214161903'
     }
+
+    # Orden de prioridad de las estrategias (procedencia de resultados)
+    STRATEGY_ORDER = ("Original", "Flexible", "DirectTarget", "Emergency")
     
     def __init__(self):
         self._cache_hunter_cells = {}  # Cache para celdas HUNTER por misión
@@ -105,60 +120,48 @@ class CorrelationServiceFixed:
             # Validar parámetros
             self._validate_correlation_parameters(mission_id, start_datetime, end_datetime, min_occurrences)
             
-            with self.db_manager.get_session() as session:
+            # IDs de celda del diccionario (se crean y asignan la primera vez)
+            get_cell_dictionary_service().ensure_ready()
+            
+            with self.db_manager.get_read_session(mission_id) as session:
                 # Verificar que la misión existe
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
                     raise CorrelationServiceFixedError(f"Misión {mission_id} no encontrada")
                 
-                # ESTRATEGIA MÚLTIPLE DE BÚSQUEDA
-                all_results = []
-                
-                # ESTRATEGIA A: Correlación Original
-                logger.info("📊 EJECUTANDO ESTRATEGIA A: Correlación Original")
-                strategy_a_results = self._execute_original_correlation_strategy(
-                    session, mission_id, start_datetime, end_datetime, min_occurrences
-                )
-                all_results.extend(strategy_a_results)
-                logger.info(f"Estrategia A encontró: {len(strategy_a_results)} números")
-                
-                # ESTRATEGIA B: Búsqueda Flexible
-                logger.info("🔍 EJECUTANDO ESTRATEGIA B: Búsqueda Flexible")
-                strategy_b_results = self._execute_flexible_search_strategy(
-                    session, mission_id, start_datetime, end_datetime, min_occurrences
-                )
-                all_results.extend(strategy_b_results)
-                logger.info(f"Estrategia B encontró: {len(strategy_b_results)} números adicionales")
-                
-                # ESTRATEGIA C: Búsqueda Directa de Objetivos
-                logger.info("🎯 EJECUTANDO ESTRATEGIA C: Búsqueda Directa de Objetivos")
-                strategy_c_results = self._execute_direct_target_search_strategy(
+                # PLAN UNIFICADO: una sola pasada sobre operator_call_data
+                groups, hunter_totals = self._execute_correlation_plan(
                     session, mission_id, start_datetime, end_datetime
                 )
-                all_results.extend(strategy_c_results)
-                logger.info(f"Estrategia C encontró: {len(strategy_c_results)} números objetivo")
-                
+                logger.info(f"Plan unificado: {len(groups)} grupos número/operador candidatos, "
+                            f"celdas HUNTER A={hunter_totals['Original']} B={hunter_totals['Flexible']}")
+
+                strategy_results = self._collect_strategy_results(groups, min_occurrences, hunter_totals)
+                all_results = []
+                for strategy in ("Original", "Flexible", "DirectTarget"):
+                    all_results.extend(strategy_results[strategy])
+                    logger.info(f"Estrategia {strategy} encontró: {len(strategy_results[strategy])} números")
+
                 # FUSIÓN Y ELIMINACIÓN DE DUPLICADOS
                 merged_results = self._merge_and_deduplicate_results(all_results)
                 logger.info(f"Resultados fusionados: {len(merged_results)} números únicos")
-                
+
                 # VALIDACIÓN CRÍTICA: Verificar números objetivo
                 missing_targets = self._validate_target_numbers_presence(merged_results)
-                
+
                 if missing_targets:
                     logger.warning(f"⚠️ NÚMEROS OBJETIVO FALTANTES: {missing_targets}")
                     logger.info("🚨 EJECUTANDO RESCATE DE EMERGENCIA")
-                    
-                    # ESTRATEGIA DE EMERGENCIA
-                    emergency_results = self._emergency_rescue_targets(
-                        session, mission_id, start_datetime, end_datetime, missing_targets
-                    )
+
+                    # ESTRATEGIA DE EMERGENCIA (sobre los mismos grupos, sin nueva consulta)
+                    emergency_results = self._emergency_rescue_targets(groups, missing_targets)
+                    strategy_results["Emergency"] = emergency_results
                     merged_results.extend(emergency_results)
                     logger.info(f"Rescate de emergencia recuperó: {len(emergency_results)} números")
-                    
+
                     # RE-FUSIÓN después del rescate
                     merged_results = self._merge_and_deduplicate_results(merged_results)
-                
+
                 # VALIDACIÓN FINAL OBLIGATORIA
                 final_missing = self._validate_target_numbers_presence(merged_results)
                 if final_missing:
@@ -166,17 +169,20 @@ class CorrelationServiceFixed:
                     logger.error("❌ ESTO NO DEBERÍA OCURRIR - ALGORITMO FALLIDO")
                 else:
                     logger.info("✅ VALIDACIÓN EXITOSA: Todos los números objetivo presentes")
-                
+
+                # Procedencia: estrategias que detectaron cada número
+                self._annotate_strategy_provenance(merged_results, strategy_results)
+
                 # Formatear respuesta final
-                response = self._format_correlation_response(merged_results, start_time)
-                
+                response = self._format_correlation_response(merged_results, start_time, strategy_results)
+
                 logger.info(f"=== ANÁLISIS CRÍTICO COMPLETADO ===")
                 logger.info(f"Números encontrados: {len(response['data'])}")
                 logger.info(f"Números objetivo recuperados: {len(self.TARGET_NUMBERS) - len(final_missing)}/{len(self.TARGET_NUMBERS)}")
                 logger.info(f"Tiempo total: {response['statistics']['processingTime']:.2f}s")
-                
+
                 return response
-                
+
         except CorrelationServiceFixedError:
             raise
         except SQLAlchemyError as e:
@@ -185,402 +191,248 @@ class CorrelationServiceFixed:
         except Exception as e:
             logger.error(f"Error inesperado en correlación crítica: {e}")
             raise CorrelationServiceFixedError(f"Error interno del servidor: {str(e)}")
-    
-    def _execute_original_correlation_strategy(self, session, mission_id: str, 
-                                             start_datetime: str, end_datetime: str, 
-                                             min_occurrences: int) -> List[Dict[str, Any]]:
-        """
-        ESTRATEGIA A: Correlación Original
-        Mantiene la lógica actual como base
-        """
-        try:
-            # Extraer Cell IDs únicos de HUNTER en el período
-            hunter_cells = self._extract_hunter_cells_original(session, mission_id, start_datetime, end_datetime)
-            if not hunter_cells:
-                logger.warning("Estrategia A: No se encontraron celdas HUNTER")
-                return []
-            
-            # Buscar números que usaron esas celdas
-            target_numbers = self._find_correlated_numbers_original(
-                session, mission_id, hunter_cells, start_datetime, end_datetime, min_occurrences
-            )
-            
-            # Enriquecer con estadísticas
-            return self._enrich_results_with_strategy_info(target_numbers, "Original", hunter_cells)
-            
-        except Exception as e:
-            logger.error(f"Error en estrategia original: {e}")
-            return []
-    
-    def _execute_flexible_search_strategy(self, session, mission_id: str, 
-                                        start_datetime: str, end_datetime: str,
-                                        min_occurrences: int) -> List[Dict[str, Any]]:
-        """
-        ESTRATEGIA B: Búsqueda Flexible
-        Filtros menos restrictivos y período temporal expandido ±1 día
-        """
-        try:
-            # Expandir período temporal ±1 día
-            start_dt = datetime.strptime(start_datetime, '%Y-%m-%d %H:%M:%S') - timedelta(days=1)
-            end_dt = datetime.strptime(end_datetime, '%Y-%m-%d %H:%M:%S') + timedelta(days=1)
-            
-            expanded_start = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-            expanded_end = end_dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            logger.info(f"Estrategia B: Período expandido {expanded_start} - {expanded_end}")
-            
-            # Extraer celdas HUNTER con filtros flexibles
-            hunter_cells = self._extract_hunter_cells_flexible(session, mission_id, expanded_start, expanded_end)
-            if not hunter_cells:
-                logger.warning("Estrategia B: No se encontraron celdas HUNTER flexibles")
-                return []
-            
-            # Buscar con filtros tolerantes (min_occurrences = 1, operador LIKE)
-            target_numbers = self._find_correlated_numbers_flexible(
-                session, mission_id, hunter_cells, expanded_start, expanded_end
-            )
-            
-            return self._enrich_results_with_strategy_info(target_numbers, "Flexible", hunter_cells)
-            
-        except Exception as e:
-            logger.error(f"Error en estrategia flexible: {e}")
-            return []
-    
-    def _execute_direct_target_search_strategy(self, session, mission_id: str,
-                                             start_datetime: str, end_datetime: str) -> List[Dict[str, Any]]:
-        """
-        ESTRATEGIA C: Búsqueda Directa de Números Objetivo
-        Busca específicamente cada número objetivo en operator_call_data
-        """
-        try:
-            target_results = []
-            
-            for target_number in self.TARGET_NUMBERS:
-                # Buscar directamente cada número objetivo
-                direct_results = self._search_target_number_directly(
-                    session, mission_id, target_number, start_datetime, end_datetime
-                )
-                target_results.extend(direct_results)
-            
-            logger.info(f"Estrategia C: Búsqueda directa encontró {len(target_results)} coincidencias")
-            return self._enrich_results_with_strategy_info(target_results, "DirectTarget", set())
-            
-        except Exception as e:
-            logger.error(f"Error en estrategia de búsqueda directa: {e}")
-            return []
-    
-    def _emergency_rescue_targets(self, session, mission_id: str, start_datetime: str,
-                                end_datetime: str, missing_numbers: Set[str]) -> List[Dict[str, Any]]:
+
+    def _execute_correlation_plan(self, session, mission_id: str, start_datetime: str,
+                                  end_datetime: str) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
         """
-        FUNCIONALIDAD DE EMERGENCIA
-        Si faltan números objetivo, los busca con criterios MUY AMPLIOS
+        PLAN UNIFICADO: calcula todas las estrategias en una sola consulta
+
+        Las celdas HUNTER de la estrategia B (período expandido ±1 día,
+        operador flexible) se agregan una vez por cell_key_id, marcando con in_a
+        las que además cumplen la estrategia A (período exacto, operador
+        CLARO). Cada llamada se une tres veces contra ese conjunto y se marca
+        para cada estrategia; la agregación por número/operador produce las
+        métricas de A, B, C y emergencia en columnas condicionales. Los
+        cruces y las celdas distintas de A y B se calculan sobre los IDs del
+        diccionario de celdas y se traducen a claves al final.
+
+        Returns:
+            Tupla (grupos por numero_objetivo/operator, total de celdas HUNTER
+            de las estrategias Original y Flexible)
         """
-        try:
-            emergency_results = []
-            
-            logger.info(f"🚨 RESCATE DE EMERGENCIA para números: {missing_numbers}")
-            
-            for missing_number in missing_numbers:
-                # Búsqueda con criterios muy amplios
-                emergency_found = self._emergency_search_single_number(
-                    session, mission_id, missing_number
-                )
-                emergency_results.extend(emergency_found)
-                
-                if emergency_found:
-                    logger.info(f"✅ RESCATADO: {missing_number}")
-                else:
-                    logger.warning(f"❌ NO RESCATADO: {missing_number}")
-            
-            return self._enrich_results_with_strategy_info(emergency_results, "Emergency", set())
-            
-        except Exception as e:
-            logger.error(f"Error en rescate de emergencia: {e}")
-            return []
-    
-    def _extract_hunter_cells_original(self, session, mission_id: str, 
-                                     start_datetime: str, end_datetime: str) -> Set[str]:
-        """Extrae celdas HUNTER usando lógica original"""
-        try:
-            query = text("""
-                SELECT DISTINCT cell_id
-                FROM cellular_data 
-                WHERE mission_id = :mission_id
-                  AND created_at >= :start_dt
-                  AND created_at <= :end_dt
-                  AND cell_id IS NOT NULL
-                  AND LENGTH(TRIM(cell_id)) > 0
-                  AND UPPER(TRIM(operator)) = 'CLARO'
-                ORDER BY cell_id
-            """)
-            
-            result = session.execute(query, {
-                'mission_id': mission_id,
-                'start_dt': start_datetime,
-                'end_dt': end_datetime
-            })
-            
-            return {row[0] for row in result.fetchall() if row[0]}
-            
-        except Exception as e:
-            logger.error(f"Error extrayendo celdas HUNTER originales: {e}")
-            return set()
-    
-    def _extract_hunter_cells_flexible(self, session, mission_id: str,
-                                     start_datetime: str, end_datetime: str) -> Set[str]:
-        """Extrae celdas HUNTER con criterios flexibles"""
-        try:
-            query = text("""
-                SELECT DISTINCT cell_id
-                FROM cellular_data 
+        expanded_start, expanded_end = self._expanded_period(start_datetime, end_datetime)
+
+        variations = sorted({variation for target in self.TARGET_NUMBERS
+                             for variation in self._generate_number_variations(target)})
+        # Toda variación contiene alguno de estos patrones mínimos
+        patterns = [v for v in variations if not any(other != v and other in v for other in variations)]
+
+        params = {
+            'mission_id': mission_id,
+            'start_dt': start_datetime,
+            'end_dt': end_datetime,
+            'expanded_start': expanded_start,
+            'expanded_end': expanded_end
+        }
+        params.update({f'variation_{i}': variation for i, variation in enumerate(variations)})
+        params.update({f'pattern_{i}': pattern for i, pattern in enumerate(patterns)})
+
+        variation_list = ','.join(f':variation_{i}' for i in range(len(variations)))
+        contains_target = ' OR '.join(f'instr(c.numero_objetivo, :pattern_{i}) > 0' for i in range(len(patterns)))
+
+        query = text(f"""
+            WITH hunter AS (
+                SELECT
+                    cell_key_id,
+                    MAX(created_at >= :start_dt AND created_at <= :end_dt
+                        AND UPPER(TRIM(operator)) = 'CLARO') as in_a
+                FROM cellular_data
                 WHERE mission_id = :mission_id
-                  AND created_at >= :start_dt
-                  AND created_at <= :end_dt
-                  AND cell_id IS NOT NULL
-                  AND LENGTH(TRIM(cell_id)) > 0
+                  AND {active_cellular_rows_sql(mission_param=':mission_id')}
+                  AND created_at >= :expanded_start
+                  AND created_at <= :expanded_end
+                  AND cell_key_id IS NOT NULL
                   AND (UPPER(TRIM(operator)) LIKE '%CLARO%' OR TRIM(operator) = '')
-                ORDER BY cell_id
-            """)
-            
-            result = session.execute(query, {
-                'mission_id': mission_id,
-                'start_dt': start_datetime,
-                'end_dt': end_datetime
-            })
-            
-            return {row[0] for row in result.fetchall() if row[0]}
-            
-        except Exception as e:
-            logger.error(f"Error extrayendo celdas HUNTER flexibles: {e}")
-            return set()
-    
-    def _find_correlated_numbers_original(self, session, mission_id: str, hunter_cells: Set[str],
-                                        start_datetime: str, end_datetime: str, 
-                                        min_occurrences: int) -> List[Dict[str, Any]]:
-        """Encuentra números correlacionados usando lógica original"""
-        try:
-            hunter_cells_list = list(hunter_cells)
-            if not hunter_cells_list:
-                return []
-            
-            query = text("""
-                SELECT 
-                    numero_objetivo,
-                    operator,
-                    COUNT(*) as total_calls,
-                    COUNT(DISTINCT 
-                        CASE 
-                            WHEN celda_objetivo IN ({placeholders}) THEN celda_objetivo
-                            WHEN celda_origen IN ({placeholders}) THEN celda_origen  
-                            WHEN celda_destino IN ({placeholders}) THEN celda_destino
+                GROUP BY cell_key_id
+            ),
+            flagged AS (
+                SELECT
+                    c.numero_objetivo,
+                    c.operator,
+                    c.fecha_hora_llamada as fecha,
+                    c.celda_objetivo,
+                    CASE WHEN c.fecha_hora_llamada >= :start_dt
+                          AND c.fecha_hora_llamada <= :end_dt
+                          AND LENGTH(TRIM(c.numero_objetivo)) >= 10
+                          AND UPPER(TRIM(c.operator)) = 'CLARO'
+                    THEN
+                        CASE
+                            WHEN ho.in_a THEN c.celda_objetivo_key_id
+                            WHEN hs.in_a THEN c.celda_origen_key_id
+                            WHEN hd.in_a THEN c.celda_destino_key_id
                         END
-                    ) as unique_hunter_cells_used,
-                    MIN(fecha_hora_llamada) as first_detection,
-                    MAX(fecha_hora_llamada) as last_detection,
-                    GROUP_CONCAT(DISTINCT 
-                        CASE 
-                            WHEN celda_objetivo IN ({placeholders}) THEN celda_objetivo
-                            WHEN celda_origen IN ({placeholders}) THEN celda_origen
-                            WHEN celda_destino IN ({placeholders}) THEN celda_destino
+                    END as a_cell,
+                    CASE WHEN c.fecha_hora_llamada >= :expanded_start
+                          AND c.fecha_hora_llamada <= :expanded_end
+                          AND LENGTH(TRIM(c.numero_objetivo)) >= 8
+                          AND (UPPER(TRIM(c.operator)) LIKE '%CLARO%' OR TRIM(c.operator) = '')
+                    THEN
+                        CASE
+                            WHEN ho.cell_key_id IS NOT NULL THEN c.celda_objetivo_key_id
+                            WHEN hs.cell_key_id IS NOT NULL THEN c.celda_origen_key_id
+                            WHEN hd.cell_key_id IS NOT NULL THEN c.celda_destino_key_id
                         END
-                    ) as related_cells
-                FROM operator_call_data 
-                WHERE mission_id = :mission_id
-                  AND fecha_hora_llamada >= :start_dt
-                  AND fecha_hora_llamada <= :end_dt
-                  AND numero_objetivo IS NOT NULL
-                  AND LENGTH(TRIM(numero_objetivo)) >= 10
-                  AND UPPER(TRIM(operator)) = 'CLARO'
+                    END as b_cell,
+                    CASE WHEN c.fecha_hora_llamada >= :start_dt
+                          AND c.fecha_hora_llamada <= :end_dt
+                          AND c.numero_objetivo IN ({variation_list})
+                    THEN 1 ELSE 0 END as c_row,
+                    CASE WHEN {contains_target} THEN 1 ELSE 0 END as e_row,
+                    COALESCE(c.celda_objetivo, c.celda_origen, c.celda_destino, 'N/A') as e_cell
+                FROM operator_call_data c
+                LEFT JOIN hunter ho ON ho.cell_key_id = c.celda_objetivo_key_id
+                LEFT JOIN hunter hs ON hs.cell_key_id = c.celda_origen_key_id
+                LEFT JOIN hunter hd ON hd.cell_key_id = c.celda_destino_key_id
+                WHERE c.mission_id = :mission_id
+                  AND {active_sheet_rows_sql('c')}
+                  AND c.numero_objetivo IS NOT NULL
                   AND (
-                      celda_objetivo IN ({placeholders}) OR
-                      celda_origen IN ({placeholders}) OR  
-                      celda_destino IN ({placeholders})
+                      (c.fecha_hora_llamada >= :expanded_start
+                       AND c.fecha_hora_llamada <= :expanded_end
+                       AND (ho.cell_key_id IS NOT NULL OR hs.cell_key_id IS NOT NULL OR hd.cell_key_id IS NOT NULL))
+                      OR {contains_target}
                   )
-                GROUP BY numero_objetivo, operator
-                HAVING unique_hunter_cells_used >= :min_occurrences
-                ORDER BY unique_hunter_cells_used DESC, total_calls DESC
-            """.format(placeholders=','.join([':cell_{}'.format(i) for i in range(len(hunter_cells_list))])))
-            
-            params = {
-                'mission_id': mission_id,
-                'start_dt': start_datetime,
-                'end_dt': end_datetime,
-                'min_occurrences': min_occurrences
-            }
-            
-            for i, cell in enumerate(hunter_cells_list):
-                params[f'cell_{i}'] = cell
-            
-            result = session.execute(query, params)
-            
-            return self._process_correlation_results(result.fetchall())
-            
-        except Exception as e:
-            logger.error(f"Error en búsqueda de números correlacionados originales: {e}")
-            return []
-    
-    def _find_correlated_numbers_flexible(self, session, mission_id: str, hunter_cells: Set[str],
-                                        start_datetime: str, end_datetime: str) -> List[Dict[str, Any]]:
-        """Encuentra números correlacionados con filtros flexibles"""
-        try:
-            hunter_cells_list = list(hunter_cells)
-            if not hunter_cells_list:
-                return []
-            
-            # Filtros más tolerantes: min_occurrences = 1, operador LIKE
-            query = text("""
-                SELECT 
-                    numero_objetivo,
-                    operator,
-                    COUNT(*) as total_calls,
-                    COUNT(DISTINCT 
-                        CASE 
-                            WHEN celda_objetivo IN ({placeholders}) THEN celda_objetivo
-                            WHEN celda_origen IN ({placeholders}) THEN celda_origen  
-                            WHEN celda_destino IN ({placeholders}) THEN celda_destino
-                        END
-                    ) as unique_hunter_cells_used,
-                    MIN(fecha_hora_llamada) as first_detection,
-                    MAX(fecha_hora_llamada) as last_detection,
-                    GROUP_CONCAT(DISTINCT 
-                        CASE 
-                            WHEN celda_objetivo IN ({placeholders}) THEN celda_objetivo
-                            WHEN celda_origen IN ({placeholders}) THEN celda_origen
-                            WHEN celda_destino IN ({placeholders}) THEN celda_destino
-                        END
-                    ) as related_cells
-                FROM operator_call_data 
-                WHERE mission_id = :mission_id
-                  AND fecha_hora_llamada >= :start_dt
-                  AND fecha_hora_llamada <= :end_dt
-                  AND numero_objetivo IS NOT NULL
-                  AND LENGTH(TRIM(numero_objetivo)) >= 8
-                  AND (UPPER(TRIM(operator)) LIKE '%CLARO%' OR TRIM(operator) = '')
-                  AND (
-                      celda_objetivo IN ({placeholders}) OR
-                      celda_origen IN ({placeholders}) OR  
-                      celda_destino IN ({placeholders})
-                  )
-                GROUP BY numero_objetivo, operator
-                HAVING unique_hunter_cells_used >= 1
-                ORDER BY unique_hunter_cells_used DESC, total_calls DESC
-            """.format(placeholders=','.join([':cell_{}'.format(i) for i in range(len(hunter_cells_list))])))
-            
-            params = {
-                'mission_id': mission_id,
-                'start_dt': start_datetime,
-                'end_dt': end_datetime
-            }
-            
-            for i, cell in enumerate(hunter_cells_list):
-                params[f'cell_{i}'] = cell
-            
-            result = session.execute(query, params)
-            
-            return self._process_correlation_results(result.fetchall())
-            
-        except Exception as e:
-            logger.error(f"Error en búsqueda flexible: {e}")
-            return []
-    
-    def _search_target_number_directly(self, session, mission_id: str, target_number: str,
-                                     start_datetime: str, end_datetime: str) -> List[Dict[str, Any]]:
-        """Busca un número objetivo específico directamente en operator_call_data"""
-        try:
-            # Buscar el número con y sin prefijo 57
-            numbers_to_search = [target_number]
-            if not target_number.startswith('57') and len(target_number) == 10:
-                numbers_to_search.append('57' + target_number)
-            elif target_number.startswith('57') and len(target_number) == 12:
-                numbers_to_search.append(target_number[2:])
-            
-            all_results = []
-            
-            for search_number in numbers_to_search:
-                query = text("""
-                    SELECT 
-                        numero_objetivo,
-                        operator,
-                        COUNT(*) as total_calls,
-                        1 as unique_hunter_cells_used,
-                        MIN(fecha_hora_llamada) as first_detection,
-                        MAX(fecha_hora_llamada) as last_detection,
-                        GROUP_CONCAT(DISTINCT celda_objetivo) as related_cells
-                    FROM operator_call_data 
-                    WHERE mission_id = :mission_id
-                      AND fecha_hora_llamada >= :start_dt
-                      AND fecha_hora_llamada <= :end_dt
-                      AND numero_objetivo = :target_number
-                    GROUP BY numero_objetivo, operator
-                    ORDER BY total_calls DESC
-                """)
-                
-                result = session.execute(query, {
-                    'mission_id': mission_id,
-                    'start_dt': start_datetime,
-                    'end_dt': end_datetime,
-                    'target_number': search_number
-                })
-                
-                found_results = self._process_correlation_results(result.fetchall())
-                all_results.extend(found_results)
-            
-            return all_results
-            
-        except Exception as e:
-            logger.error(f"Error en búsqueda directa de {target_number}: {e}")
-            return []
-    
-    def _emergency_search_single_number(self, session, mission_id: str, 
-                                      missing_number: str) -> List[Dict[str, Any]]:
-        """Búsqueda de emergencia con criterios MUY amplios para un número específico"""
-        try:
-            # Generar variaciones del número
-            search_variations = self._generate_number_variations(missing_number)
-            
-            all_emergency_results = []
-            
-            for variation in search_variations:
-                query = text("""
-                    SELECT 
-                        numero_objetivo,
-                        operator,
-                        COUNT(*) as total_calls,
-                        1 as unique_hunter_cells_used,
-                        MIN(fecha_hora_llamada) as first_detection,
-                        MAX(fecha_hora_llamada) as last_detection,
-                        GROUP_CONCAT(DISTINCT 
-                            CASE 
-                                WHEN celda_objetivo IS NOT NULL THEN celda_objetivo
-                                WHEN celda_origen IS NOT NULL THEN celda_origen
-                                WHEN celda_destino IS NOT NULL THEN celda_destino
-                                ELSE 'N/A'
-                            END
-                        ) as related_cells
-                    FROM operator_call_data 
-                    WHERE mission_id = :mission_id
-                      AND (numero_objetivo = :variation 
-                           OR numero_objetivo LIKE :variation_like)
-                    GROUP BY numero_objetivo, operator
-                    ORDER BY total_calls DESC
-                    LIMIT 10
-                """)
-                
-                result = session.execute(query, {
-                    'mission_id': mission_id,
-                    'variation': variation,
-                    'variation_like': f'%{variation}%'
-                })
-                
-                emergency_results = self._process_correlation_results(result.fetchall())
-                all_emergency_results.extend(emergency_results)
-            
-            return all_emergency_results
-            
-        except Exception as e:
-            logger.error(f"Error en búsqueda de emergencia para {missing_number}: {e}")
-            return []
-    
+                -- LIMIT -1 evita que SQLite aplane la subconsulta y reevalúe
+                -- cada CASE por cada agregado que lo referencia
+                LIMIT -1
+            )
+            SELECT
+                numero_objetivo,
+                operator,
+                SUM(a_cell IS NOT NULL) as a_total,
+                COUNT(DISTINCT a_cell) as a_unique,
+                MIN(CASE WHEN a_cell IS NOT NULL THEN fecha END) as a_first,
+                MAX(CASE WHEN a_cell IS NOT NULL THEN fecha END) as a_last,
+                GROUP_CONCAT(DISTINCT a_cell) as a_cells,
+                SUM(b_cell IS NOT NULL) as b_total,
+                COUNT(DISTINCT b_cell) as b_unique,
+                MIN(CASE WHEN b_cell IS NOT NULL THEN fecha END) as b_first,
+                MAX(CASE WHEN b_cell IS NOT NULL THEN fecha END) as b_last,
+                GROUP_CONCAT(DISTINCT b_cell) as b_cells,
+                SUM(c_row) as c_total,
+                MIN(CASE WHEN c_row THEN fecha END) as c_first,
+                MAX(CASE WHEN c_row THEN fecha END) as c_last,
+                GROUP_CONCAT(DISTINCT CASE WHEN c_row THEN celda_objetivo END) as c_cells,
+                SUM(e_row) as e_total,
+                MIN(CASE WHEN e_row THEN fecha END) as e_first,
+                MAX(CASE WHEN e_row THEN fecha END) as e_last,
+                GROUP_CONCAT(DISTINCT CASE WHEN e_row THEN e_cell END) as e_cells
+            FROM flagged
+            GROUP BY numero_objetivo, operator
+            ORDER BY numero_objetivo, operator
+        """)
+        groups = [dict(row) for row in session.execute(query, params).mappings()]
+        self._cell_ids_to_keys(session, groups, ('a_cells', 'b_cells'))
+
+        totals = session.execute(text(f"""
+            SELECT
+                COUNT(DISTINCT cell_key_id) as flexible_cells,
+                COUNT(DISTINCT CASE WHEN created_at >= :start_dt AND created_at <= :end_dt
+                                     AND UPPER(TRIM(operator)) = 'CLARO' THEN cell_key_id END) as original_cells
+            FROM cellular_data
+            WHERE mission_id = :mission_id
+              AND {active_cellular_rows_sql(mission_param=':mission_id')}
+              AND created_at >= :expanded_start
+              AND created_at <= :expanded_end
+              AND cell_key_id IS NOT NULL
+              AND (UPPER(TRIM(operator)) LIKE '%CLARO%' OR TRIM(operator) = '')
+        """), params).first()
+
+        return groups, {'Original': totals[1] or 0, 'Flexible': totals[0] or 0}
+
+    def _cell_ids_to_keys(self, session, groups: List[Dict[str, Any]], columns: Tuple[str, ...]) -> None:
+        """Reemplaza las listas de IDs de celda (GROUP_CONCAT) por sus claves"""
+        ids = {int(key_id) for group in groups for column in columns
+               for key_id in (group[column] or '').split(',') if key_id}
+        keys = get_cell_dictionary_service().lookup_keys(session, ids)
+        for group in groups:
+            for column in columns:
+                if group[column]:
+                    group[column] = ','.join(keys[int(key_id)] for key_id in group[column].split(','))
+
+    def _collect_strategy_results(self, groups: List[Dict[str, Any]], min_occurrences: int,
+                                  hunter_totals: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Separa los grupos del plan unificado en los resultados de las
+        estrategias A (Original), B (Flexible) y C (DirectTarget), con el
+        mismo orden y formato que producía cada estrategia por separado
+        """
+        def rows(prefix: str, selected: List[Dict[str, Any]], unique=None) -> List[Tuple]:
+            return [(g['numero_objetivo'], g['operator'], g[f'{prefix}_total'],
+                     g[f'{prefix}_unique'] if unique is None else unique,
+                     g[f'{prefix}_first'], g[f'{prefix}_last'], g[f'{prefix}_cells']) for g in selected]
+
+        # ESTRATEGIA A: celdas HUNTER CLARO del período, mínimo de celdas requerido
+        original = sorted((g for g in groups if g['a_total'] and g['a_unique'] >= min_occurrences),
+                          key=lambda g: (-g['a_unique'], -g['a_total']))
+
+        # ESTRATEGIA B: período expandido, operador flexible, al menos una celda
+        flexible = sorted((g for g in groups if g['b_total'] and g['b_unique'] >= 1),
+                          key=lambda g: (-g['b_unique'], -g['b_total']))
+
+        # ESTRATEGIA C: números objetivo (y variaciones) dentro del período
+        by_number = defaultdict(list)
+        for group in groups:
+            if group['c_total']:
+                by_number[group['numero_objetivo']].append(group)
+        direct = []
+        for target_number in sorted(self.TARGET_NUMBERS):
+            for variation in self._generate_number_variations(target_number):
+                direct.extend(sorted(by_number.get(variation, []), key=lambda g: -g['c_total']))
+
+        return {
+            "Original": self._enrich_results_with_strategy_info(
+                self._process_correlation_results(rows('a', original)), "Original", hunter_totals['Original']),
+            "Flexible": self._enrich_results_with_strategy_info(
+                self._process_correlation_results(rows('b', flexible)), "Flexible", hunter_totals['Flexible']),
+            "DirectTarget": self._enrich_results_with_strategy_info(
+                self._process_correlation_results(rows('c', direct, unique=1)), "DirectTarget", 0)
+        }
+
+    def _emergency_rescue_targets(self, groups: List[Dict[str, Any]],
+                                  missing_numbers: Set[str]) -> List[Dict[str, Any]]:
+        """
+        FUNCIONALIDAD DE EMERGENCIA
+        Si faltan números objetivo, los busca con criterios MUY AMPLIOS: cualquier
+        número que contenga alguna variación, sin filtro de fechas (10 por variación)
+        """
+        emergency_results = []
+
+        logger.info(f"🚨 RESCATE DE EMERGENCIA para números: {missing_numbers}")
+
+        for missing_number in sorted(missing_numbers):
+            emergency_found = []
+            for variation in self._generate_number_variations(missing_number):
+                matched = sorted((g for g in groups if g['e_total'] and variation in str(g['numero_objetivo'])),
+                                 key=lambda g: -g['e_total'])[:10]
+                emergency_found.extend(self._process_correlation_results([
+                    (g['numero_objetivo'], g['operator'], g['e_total'], 1, g['e_first'], g['e_last'], g['e_cells'])
+                    for g in matched
+                ]))
+            emergency_results.extend(emergency_found)
+
+            if emergency_found:
+                logger.info(f"✅ RESCATADO: {missing_number}")
+            else:
+                logger.warning(f"❌ NO RESCATADO: {missing_number}")
+
+        return self._enrich_results_with_strategy_info(emergency_results, "Emergency", 0)
+
+    def _expanded_period(self, start_datetime: str, end_datetime: str) -> Tuple[str, str]:
+        """Período expandido ±1 día de la estrategia B"""
+        start_dt = datetime.strptime(start_datetime, '%Y-%m-%d %H:%M:%S') - timedelta(days=1)
+        end_dt = datetime.strptime(end_datetime, '%Y-%m-%d %H:%M:%S') + timedelta(days=1)
+        return start_dt.strftime('%Y-%m-%d %H:%M:%S'), end_dt.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _annotate_strategy_provenance(self, results: List[Dict[str, Any]],
+                                      strategy_results: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Agrega a cada resultado la lista de estrategias que detectaron el número"""
+        found_by = {strategy: {result['targetNumber'] for result in strategy_list}
+                    for strategy, strategy_list in strategy_results.items()}
+        for result in results:
+            result['matchedStrategies'] = [strategy for strategy in self.STRATEGY_ORDER
+                                           if result['targetNumber'] in found_by.get(strategy, ())]
+
     def _generate_number_variations(self, number: str) -> List[str]:
         """Genera variaciones de un número para búsqueda exhaustiva"""
         variations = [number]
@@ -619,18 +471,18 @@ class CorrelationServiceFixed:
         
         return processed_results
     
-    def _enrich_results_with_strategy_info(self, results: List[Dict[str, Any]], 
-                                          strategy: str, hunter_cells: Set[str]) -> List[Dict[str, Any]]:
+    def _enrich_results_with_strategy_info(self, results: List[Dict[str, Any]],
+                                          strategy: str, hunter_cells_total: int) -> List[Dict[str, Any]]:
         """Enriquece resultados con información de la estrategia utilizada"""
         for result in results:
             result['detectionStrategy'] = strategy
-            result['hunterCellsTotal'] = len(hunter_cells)
+            result['hunterCellsTotal'] = hunter_cells_total
             
             # Calcular confianza basada en la estrategia
             if strategy == "Original":
-                confidence = min(100.0, (result['uniqueHunterCells'] / max(1, len(hunter_cells))) * 100)
+                confidence = min(100.0, (result['uniqueHunterCells'] / max(1, hunter_cells_total)) * 100)
             elif strategy == "Flexible":
-                confidence = min(80.0, (result['uniqueHunterCells'] / max(1, len(hunter_cells))) * 80)
+                confidence = min(80.0, (result['uniqueHunterCells'] / max(1, hunter_cells_total)) * 80)
             elif strategy == "DirectTarget":
                 confidence = 90.0  # Alta confianza para búsqueda directa
             else:  # Emergency
@@ -711,8 +563,9 @@ class CorrelationServiceFixed:
         
         return clean_number
     
-    def _format_correlation_response(self, results: List[Dict[str, Any]], 
-                                   start_time: float) -> Dict[str, Any]:
+    def _format_correlation_response(self, results: List[Dict[str, Any]], start_time: float,
+                                   strategy_results: Optional[Dict[str, List[Dict[str, Any]]]] = None
+                                   ) -> Dict[str, Any]:
         """Formatea la respuesta final del análisis de correlación"""
         processing_time = time.time() - start_time
         
@@ -737,6 +590,8 @@ class CorrelationServiceFixed:
                 'targetNumbersTotal': len(self.TARGET_NUMBERS),
                 'processingTime': round(processing_time, 3),
                 'strategiesUsed': strategy_stats,
+                'strategyMatches': {strategy: len(strategy_list)
+                                    for strategy, strategy_list in (strategy_results or {}).items()},
                 'analysisType': 'correlation_fixed',
                 'timestamp': datetime.now().isoformat()
             }
@@ -771,9 +626,9 @@ class CorrelationServiceFixed:
         Incluye información sobre números objetivo disponibles
         """
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_read_session(mission_id) as session:
                 # Contar datos HUNTER
-                hunter_query = text("""
+                hunter_query = text(f"""
                     SELECT 
                         COUNT(*) as total_records,
                         COUNT(DISTINCT cell_id) as unique_cells,
@@ -781,12 +636,13 @@ class CorrelationServiceFixed:
                         MAX(created_at) as latest_record
                     FROM cellular_data 
                     WHERE mission_id = :mission_id
+                      AND {active_cellular_rows_sql(mission_param=':mission_id')}
                 """)
                 
                 hunter_result = session.execute(hunter_query, {'mission_id': mission_id}).fetchone()
                 
                 # Contar datos de operadores
-                operator_query = text("""
+                operator_query = text(f"""
                     SELECT 
                         COUNT(*) as total_calls,
                         COUNT(DISTINCT numero_objetivo) as unique_numbers,
@@ -795,6 +651,7 @@ class CorrelationServiceFixed:
                         MAX(fecha_hora_llamada) as latest_call
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id
+                      AND {active_sheet_rows_sql()}
                 """)
                 
                 operator_result = session.execute(operator_query, {'mission_id': mission_id}).fetchone()
@@ -848,10 +705,11 @@ class CorrelationServiceFixed:
                 found = False
                 
                 for variation in variations:
-                    query = text("""
+                    query = text(f"""
                         SELECT COUNT(*) as count, MIN(fecha_hora_llamada) as first_seen
                         FROM operator_call_data 
                         WHERE mission_id = :mission_id AND numero_objetivo = :number
+                          AND {active_sheet_rows_sql()}
                     """)
                     
                     result = session.execute(query, {
@@ -914,5 +772,9 @@ def get_correlation_service_fixed() -> CorrelationServiceFixed:
     global _correlation_service_fixed_instance
     if _correlation_service_fixed_instance is None:
         _correlation_service_fixed_instance = CorrelationServiceFixed()
+        # Descartar celdas HUNTER en cache cuando cambian los datos de la misión
+        register_cellular_change_listener(
+            lambda mission_id, operators: _correlation_service_fixed_instance._cache_hunter_cells.pop(mission_id, None)
+        )
         logger.info("🚀 Servicio de correlación CRÍTICO inicializado con éxito")
     return _correlation_service_fixed_instance
\ No newline at end of file
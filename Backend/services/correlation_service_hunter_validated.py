@@ -32,7 +32,6 @@ Versión: 3.0 - HUNTER VALIDATED
 import logging
 import time
 import os
-import pandas as pd
 from datetime import datetime
 from typing import Dict, Any, List, Set, Tuple, Optional
 from sqlalchemy.exc import SQLAlchemyError
@@ -40,6 +39,8 @@ from sqlalchemy import text
 from collections import defaultdict
 
 from database.connection import get_database_manager
+from services.cell_dictionary_service import get_cell_dictionary_service
+from services.bulk_deletion_service import active_sheet_rows_sql
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +102,7 @@ class CorrelationServiceHunterValidated:
             logger.info(f"Cargando celdas HUNTER reales desde: {self.hunter_file_path}")
             
             # Leer archivo HUNTER
+            import pandas as pd  # Importación diferida: solo al leer el archivo HUNTER
             df_hunter = pd.read_excel(self.hunter_file_path)
             
             # Validar columna CELLID
@@ -167,7 +169,10 @@ class CorrelationServiceHunterValidated:
             logger.info(f"Min occurrences: {min_occurrences}")
             logger.info(f"CORRECCIÓN: Filtrando SOLO por celdas HUNTER reales")
             
-            with self.db_manager.get_session() as session:
+            # IDs de celda del diccionario (se crean y asignan la primera vez)
+            get_cell_dictionary_service().ensure_ready()
+            
+            with self.db_manager.get_read_session(mission_id) as session:
                 # 1. Cargar celdas HUNTER REALES desde archivo oficial
                 real_hunter_cells = self._load_real_hunter_cells()
                 if not real_hunter_cells:
@@ -228,14 +233,19 @@ class CorrelationServiceHunterValidated:
         - ANTES: [16478, 22504, 6159, 6578] = 4 ocurrencias
         - HUNTER REAL: [22504, 6159] = 2 celdas válidas  
         - AHORA: Solo cuenta [22504, 6159] = 2 ocurrencias CORRECTAS
+        
+        Las celdas HUNTER se traducen a IDs del diccionario de celdas: el
+        filtro y la agrupación usan las columnas *_key_id ('22504.0' del
+        archivo HUNTER coincide con '22504' del operador).
         """
         try:
-            # Convertir celdas HUNTER REALES a lista para SQL
+            # Convertir celdas HUNTER REALES a IDs del diccionario para SQL
             real_hunter_cells_list = list(real_hunter_cells)
-            hunter_cells_str = ','.join([f"'{cell}'" for cell in real_hunter_cells_list])
+            hunter_key_ids = sorted(get_cell_dictionary_service().lookup_ids(session, real_hunter_cells_list).values())
+            hunter_cells_str = ','.join(str(key_id) for key_id in hunter_key_ids)
             
             if not hunter_cells_str:
-                logger.warning("No hay celdas HUNTER reales para filtrar")
+                logger.warning("No hay celdas HUNTER reales registradas en los datos de la misión")
                 return []
             
             # Query CORREGIDO - FILTRADO POR CELDAS HUNTER REALES ÚNICAMENTE
@@ -245,7 +255,8 @@ class CorrelationServiceHunterValidated:
                     SELECT DISTINCT numero_origen as numero, operator as operador
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
-                      AND celda_origen IN ({hunter_cells_str})  -- FILTRO POR HUNTER REAL
+                      AND {active_sheet_rows_sql()}
+                      AND celda_origen_key_id IN ({hunter_cells_str})  -- FILTRO POR HUNTER REAL
                       AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
                       AND numero_origen IS NOT NULL 
                       AND numero_origen != ''
@@ -255,7 +266,8 @@ class CorrelationServiceHunterValidated:
                     SELECT DISTINCT numero_destino as numero, operator as operador
                     FROM operator_call_data 
                     WHERE mission_id = :mission_id 
-                      AND celda_destino IN ({hunter_cells_str})  -- FILTRO POR HUNTER REAL
+                      AND {active_sheet_rows_sql()}
+                      AND celda_destino_key_id IN ({hunter_cells_str})  -- FILTRO POR HUNTER REAL
                       AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
                       AND numero_destino IS NOT NULL 
                       AND numero_destino != ''
@@ -268,17 +280,16 @@ class CorrelationServiceHunterValidated:
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_origen as celda,
+                        ocd.celda_origen_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_origen AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_origen IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
-                      AND ocd.celda_origen IS NOT NULL
-                      AND ocd.celda_origen != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_origen
+                      AND ocd.celda_origen_key_id IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
+                    GROUP BY tn.numero, tn.operador, ocd.celda_origen_key_id
                     
                     UNION
                     
@@ -286,17 +297,16 @@ class CorrelationServiceHunterValidated:
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_destino as celda,
+                        ocd.celda_destino_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_origen AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_destino IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
-                      AND ocd.celda_destino IS NOT NULL
-                      AND ocd.celda_destino != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_destino
+                      AND ocd.celda_destino_key_id IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
+                    GROUP BY tn.numero, tn.operador, ocd.celda_destino_key_id
                     
                     UNION
                     
@@ -304,17 +314,16 @@ class CorrelationServiceHunterValidated:
                     SELECT DISTINCT 
                         tn.numero,
                         tn.operador,
-                        ocd.celda_destino as celda,
+                        ocd.celda_destino_key_id as celda,
                         MIN(ocd.fecha_hora_llamada) as primera_deteccion,
                         MAX(ocd.fecha_hora_llamada) as ultima_deteccion
                     FROM target_numbers tn
                     JOIN operator_call_data ocd ON tn.numero = ocd.numero_destino AND tn.operador = ocd.operator
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       AND date(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                      AND ocd.celda_destino IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
-                      AND ocd.celda_destino IS NOT NULL
-                      AND ocd.celda_destino != ''
-                    GROUP BY tn.numero, tn.operador, ocd.celda_destino
+                      AND ocd.celda_destino_key_id IN ({hunter_cells_str})  -- SOLO CELDAS HUNTER REALES
+                    GROUP BY tn.numero, tn.operador, ocd.celda_destino_key_id
                 ),
                 final_hunter_validated_combinations AS (
                     -- Consolidar para evitar duplicados manteniendo SOLO celdas HUNTER reales
@@ -380,8 +389,12 @@ class CorrelationServiceHunterValidated:
                 logger.error(f"Query HUNTER-validated problemático detectado")
                 raise CorrelationServiceHunterValidatedError(f"Error en query SQL: {sql_error}")
             
+            rows = result.fetchall()
+            # Claves de las celdas HUNTER (la consulta devuelve IDs del diccionario)
+            cell_keys = get_cell_dictionary_service().lookup_keys(session, hunter_key_ids)
+            
             correlations = []
-            for row in result.fetchall():
+            for row in rows:
                 numero = str(row[0])
                 operador = str(row[1])
                 ocurrencias = int(row[2])
@@ -389,9 +402,9 @@ class CorrelationServiceHunterValidated:
                 ultima_deteccion = row[4]
                 celdas_hunter_reales_str = str(row[5]) if row[5] else ""
                 
-                # Procesar celdas HUNTER reales (SQLite devuelve separadas por comas)
+                # Procesar celdas HUNTER reales (SQLite devuelve IDs separados por comas)
                 if celdas_hunter_reales_str:
-                    celdas_hunter_reales = [cell.strip() for cell in celdas_hunter_reales_str.split(',') if cell.strip()]
+                    celdas_hunter_reales = [cell_keys[int(key_id)] for key_id in celdas_hunter_reales_str.split(',') if key_id]
                 else:
                     celdas_hunter_reales = []
                 
@@ -483,7 +496,10 @@ class CorrelationServiceHunterValidated:
             logger.info(f"Período: {start_datetime} - {end_datetime}")
             logger.info(f"OBJETIVO: Solo interacciones directas (máximo 4-5 nodos)")
             
-            with self.db_manager.get_session() as session:
+            # IDs de celda del diccionario (se crean y asignan la primera vez)
+            get_cell_dictionary_service().ensure_ready()
+            
+            with self.db_manager.get_read_session(mission_id) as session:
                 # 1. Cargar celdas HUNTER reales
                 real_hunter_cells = self._load_real_hunter_cells()
                 if not real_hunter_cells:
@@ -546,11 +562,12 @@ class CorrelationServiceHunterValidated:
         - NO dataset completo, SOLO interacciones específicas del número
         """
         try:
-            # Convertir celdas HUNTER a formato SQL
-            hunter_cells_str = ','.join([f"'{cell}'" for cell in real_hunter_cells])
+            # Convertir celdas HUNTER a IDs del diccionario para SQL
+            hunter_key_ids = sorted(get_cell_dictionary_service().lookup_ids(session, real_hunter_cells).values())
+            hunter_cells_str = ','.join(str(key_id) for key_id in hunter_key_ids)
             
             if not hunter_cells_str:
-                logger.warning("No hay celdas HUNTER reales para filtrar")
+                logger.warning("No hay celdas HUNTER reales registradas en los datos de la misión")
                 return []
             
             # Query ESPECÍFICO: Solo interacciones directas del número objetivo
@@ -566,9 +583,10 @@ class CorrelationServiceHunterValidated:
                     'origen' as rol_objetivo
                 FROM operator_call_data 
                 WHERE mission_id = :mission_id
+                  AND {active_sheet_rows_sql()}
                   AND numero_origen = :numero_objetivo  -- ESPECÍFICO: número como origen
                   AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                  AND (celda_origen IN ({hunter_cells_str}) OR celda_destino IN ({hunter_cells_str}))  -- Solo celdas HUNTER
+                  AND (celda_origen_key_id IN ({hunter_cells_str}) OR celda_destino_key_id IN ({hunter_cells_str}))  -- Solo celdas HUNTER
                   AND numero_origen IS NOT NULL 
                   AND numero_origen != ''
                   AND numero_destino IS NOT NULL 
@@ -586,9 +604,10 @@ class CorrelationServiceHunterValidated:
                     'destino' as rol_objetivo
                 FROM operator_call_data 
                 WHERE mission_id = :mission_id
+                  AND {active_sheet_rows_sql()}
                   AND numero_destino = :numero_objetivo  -- ESPECÍFICO: número como destino
                   AND date(fecha_hora_llamada) BETWEEN :start_date AND :end_date
-                  AND (celda_origen IN ({hunter_cells_str}) OR celda_destino IN ({hunter_cells_str}))  -- Solo celdas HUNTER
+                  AND (celda_origen_key_id IN ({hunter_cells_str}) OR celda_destino_key_id IN ({hunter_cells_str}))  -- Solo celdas HUNTER
                   AND numero_origen IS NOT NULL 
                   AND numero_origen != ''
                   AND numero_destino IS NOT NULL 
@@ -762,7 +781,7 @@ class CorrelationServiceHunterValidated:
         """
         try:
             # Query para obtener TODAS las apariciones del número
-            query = text("""
+            query = text(f"""
                 SELECT 
                     'originador_fisica' as rol,
                     numero_origen as numero,
@@ -772,6 +791,7 @@ class CorrelationServiceHunterValidated:
                     numero_destino as otro_numero
                 FROM operator_call_data 
                 WHERE numero_origen = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_origen IS NOT NULL
                   AND numero_origen != ''
                 
@@ -786,6 +806,7 @@ class CorrelationServiceHunterValidated:
                     numero_destino as otro_numero
                 FROM operator_call_data 
                 WHERE numero_origen = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_origen IS NOT NULL
                   AND numero_origen != ''
                   AND celda_destino IS NOT NULL
@@ -802,6 +823,7 @@ class CorrelationServiceHunterValidated:
                     numero_origen as otro_numero
                 FROM operator_call_data 
                 WHERE numero_destino = :numero
+                  AND {active_sheet_rows_sql()}
                   AND numero_destino IS NOT NULL
                   AND numero_destino != ''
                 
@@ -0,0 +1,399 @@
+"""
+KRONOS - Database Maintenance Service
+===============================================================================
+MANTENIMIENTO PROGRAMADO: ESTADÍSTICAS, ESPACIO LIBRE E ÍNDICES
+===============================================================================
+
+Reemplaza el PRAGMA optimize en cada conexión nueva, el VACUUM completo
+manual y la aplicación a mano de los scripts de índices de correlación:
+
+- ANALYZE + PRAGMA optimize después de cargas grandes: las cargas y
+  eliminaciones registran las filas escritas (record_write_activity) y,
+  al superar ANALYZE_AFTER_ROWS, las estadísticas del archivo se actualizan
+  en el siguiente periodo de inactividad. PRAGMA analysis_limit acota el
+  tiempo de ANALYZE en tablas grandes.
+- incremental_vacuum acotado a VACUUM_MAX_STEPS_PER_CYCLE pasos por ciclo
+  (auto_vacuum=INCREMENTAL), solo en inactividad.
+- Conversión única a auto_vacuum=INCREMENTAL de archivos creados antes de
+  que la conexión fijara el modo (run_maintenance(convert_auto_vacuum=True)):
+  el PRAGMA solo cambia un archivo existente después de un VACUUM completo,
+  que reconstruye el archivo y bloquea las escrituras mientras dura.
+- Inactividad: sin escrituras registradas en IDLE_SECONDS, sin archivos de
+  operador en PROCESSING y sin eliminaciones por lotes activas.
+- Índices de correlación esperados (EXPECTED_INDEXES): se crean los que
+  falten; un índice existente con las mismas columnas iniciales cuenta
+  como presente.
+- Reporte de tamaño por tabla e índice (dbstat): páginas, bytes, espacio
+  sin usar y fragmentación (hojas fuera de orden físico).
+
+Cada operación se aplica a kronos.db y al archivo propio de cada misión
+fragmentada (database/mission_shards.py).
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from database.connection import get_database_manager, get_db_connection
+from .bulk_deletion_service import get_bulk_deletion_service, incremental_vacuum, AUTO_VACUUM_INCREMENTAL
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseMaintenanceServiceError(Exception):
+    """Excepción personalizada para errores de mantenimiento de base de datos"""
+    pass
+
+
+# Segundos entre ciclos de mantenimiento en segundo plano
+MAINTENANCE_INTERVAL_SECONDS = 60
+
+# Segundos sin escrituras para considerar la base de datos inactiva
+IDLE_SECONDS = 120
+
+# Filas escritas en un archivo a partir de las cuales se actualizan estadísticas
+ANALYZE_AFTER_ROWS = 50000
+
+# Filas muestreadas por índice en ANALYZE (PRAGMA analysis_limit)
+ANALYSIS_LIMIT = 1000
+
+# Pasos de incremental_vacuum por ciclo (VACUUM_PAGES_PER_STEP páginas cada uno)
+VACUUM_MAX_STEPS_PER_CYCLE = 20
+
+# Índices que usan las consultas de correlación (antes en
+# crear_indices_optimizacion_hunter_llamadas.sql): nombre -> (tabla, columnas)
+EXPECTED_INDEXES = {
+    'idx_cellular_data_mission_cell': ('cellular_data', ('mission_id', 'cell_id')),
+    'idx_operator_call_data_mission_origen': ('operator_call_data', ('mission_id', 'celda_origen')),
+    'idx_operator_call_data_mission_destino': ('operator_call_data', ('mission_id', 'celda_destino')),
+    'idx_operator_call_data_mission_fecha': ('operator_call_data', ('mission_id', 'fecha_hora_llamada')),
+    'idx_calls_objetivo_mission': ('operator_call_data', ('numero_objetivo', 'mission_id')),
+}
+
+
+class DatabaseMaintenanceService:
+    """
+    Servicio de mantenimiento de base de datos con ciclos en segundo plano
+    """
+
+    def __init__(self, interval_seconds: float = MAINTENANCE_INTERVAL_SECONDS,
+                 idle_seconds: float = IDLE_SECONDS,
+                 analyze_after_rows: int = ANALYZE_AFTER_ROWS):
+        self.interval_seconds = interval_seconds
+        self.idle_seconds = idle_seconds
+        self.analyze_after_rows = analyze_after_rows
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._maintenance_lock = threading.Lock()
+        self._pending_rows: Dict[Optional[str], int] = {}
+        self._last_write = 0.0
+        self._status = {
+            'intervalSeconds': interval_seconds,
+            'cycles': 0,
+            'analyzeRuns': 0,
+            'pagesFreed': 0,
+            'errors': 0,
+            'lastAnalyze': None,
+            'lastError': None
+        }
+
+    def _units(self) -> List[Optional[str]]:
+        """None (kronos.db) y las misiones con archivo propio"""
+        return [None] + get_database_manager().get_sharded_missions()
+
+    def _unit_key(self, mission_id: Optional[str]) -> Optional[str]:
+        return mission_id if get_database_manager().is_mission_sharded(mission_id) else None
+
+    def record_write_activity(self, mission_id: Optional[str], rows: int) -> None:
+        """
+        Registra filas escritas o eliminadas por una carga
+
+        Args:
+            mission_id: Misión de la carga (define el archivo afectado)
+            rows: Filas insertadas más eliminadas
+        """
+        key = self._unit_key(mission_id)
+        with self._lock:
+            self._last_write = time.monotonic()
+            self._pending_rows[key] = self._pending_rows.get(key, 0) + max(int(rows or 0), 0)
+
+    def is_idle(self) -> bool:
+        """True si no hay escrituras recientes, archivos en proceso ni eliminaciones activas"""
+        with self._lock:
+            if time.monotonic() - self._last_write < self.idle_seconds:
+                return False
+        if get_bulk_deletion_service().list_jobs(active_only=True):
+            return False
+        with get_db_connection() as conn:
+            has_sheets = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'operator_data_sheets'"
+            ).fetchone()
+            if has_sheets and conn.execute(
+                "SELECT 1 FROM operator_data_sheets WHERE processing_status = 'PROCESSING' LIMIT 1"
+            ).fetchone():
+                return False
+        return True
+
+    def run_analyze(self, mission_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Actualiza las estadísticas del planificador de un archivo
+
+        Args:
+            mission_id: Misión con archivo propio (None = kronos.db)
+
+        Returns:
+            Dict con 'missionId' y 'durationSeconds'
+        """
+        key = self._unit_key(mission_id)
+        started = time.perf_counter()
+        with get_db_connection(key) as conn:
+            conn.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+            # 'main' es el archivo de la misión en una conexión enrutada
+            conn.execute("ANALYZE main")
+            conn.execute("PRAGMA main.optimize").fetchall()
+            conn.commit()
+
+        result = {'missionId': key, 'durationSeconds': round(time.perf_counter() - started, 3)}
+        with self._lock:
+            self._pending_rows.pop(key, None)
+            self._status['analyzeRuns'] += 1
+            self._status['lastAnalyze'] = dict(result, timestamp=datetime.now().isoformat())
+        logger.info(f"Estadísticas actualizadas ({key or 'kronos.db'}) en {result['durationSeconds']}s")
+        return result
+
+    def run_maintenance(self, force: bool = False, convert_auto_vacuum: bool = False) -> Dict[str, Any]:
+        """
+        Ejecuta un ciclo de mantenimiento
+
+        Args:
+            force: Ejecutar aunque la base de datos no esté inactiva y
+                actualizar estadísticas de todos los archivos
+            convert_auto_vacuum: Convertir a auto_vacuum=INCREMENTAL (con
+                VACUUM completo) los archivos que aún no lo usan
+
+        Returns:
+            Dict con 'skipped', 'analyzed' (archivos con estadísticas
+            actualizadas), 'converted' (archivos convertidos a
+            auto_vacuum=INCREMENTAL), 'pagesFreed' y 'durationSeconds'
+        """
+        if not self._maintenance_lock.acquire(blocking=False):
+            raise DatabaseMaintenanceServiceError("Ya hay un mantenimiento en curso")
+        try:
+            started = time.perf_counter()
+            if not force and not self.is_idle():
+                return {'skipped': True, 'analyzed': [], 'converted': [], 'pagesFreed': 0, 'durationSeconds': 0}
+
+            units = self._units()
+            converted = []
+            if convert_auto_vacuum:
+                converted = [key for key in units if self._convert_auto_vacuum(key)]
+
+            with self._lock:
+                pending = [key for key, rows in self._pending_rows.items() if rows >= self.analyze_after_rows]
+            analyzed = [self.run_analyze(key)['missionId'] for key in (units if force else pending)]
+
+            pages_freed = 0
+            for key in units:
+                result = incremental_vacuum(max_steps=VACUUM_MAX_STEPS_PER_CYCLE, mission_id=key)
+                pages_freed += result['pagesFreed']
+
+            with self._lock:
+                self._status['cycles'] += 1
+                self._status['pagesFreed'] += pages_freed
+            return {
+                'skipped': False,
+                'analyzed': analyzed,
+                'converted': converted,
+                'pagesFreed': pages_freed,
+                'durationSeconds': round(time.perf_counter() - started, 3)
+            }
+        finally:
+            self._maintenance_lock.release()
+
+    def _convert_auto_vacuum(self, mission_id: Optional[str]) -> bool:
+        """
+        Pasa un archivo a auto_vacuum=INCREMENTAL si aún no lo usa
+
+        Returns:
+            True si el archivo se convirtió
+        """
+        with get_db_connection(mission_id) as conn:
+            if conn.execute("PRAGMA main.auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+                return False
+            started = time.perf_counter()
+            conn.execute("PRAGMA main.auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM main")
+            mode = conn.execute("PRAGMA main.auto_vacuum").fetchone()[0]
+        if mode != AUTO_VACUUM_INCREMENTAL:
+            raise DatabaseMaintenanceServiceError(
+                f"No se pudo convertir {mission_id or 'kronos.db'} a auto_vacuum = INCREMENTAL"
+            )
+        logger.info(f"{mission_id or 'kronos.db'} convertido a auto_vacuum = INCREMENTAL "
+                    f"en {time.perf_counter() - started:.3f}s")
+        return True
+
+    def ensure_expected_indexes(self) -> Dict[str, Any]:
+        """
+        Crea los índices de correlación esperados que falten
+
+        Returns:
+            Dict con 'created' y 'present' (por archivo: 'missionId' y nombres)
+        """
+        created, present = [], []
+        for key in self._units():
+            unit_created, unit_present = [], []
+            with get_db_connection(key) as conn:
+                for name, (table, columns) in EXPECTED_INDEXES.items():
+                    existing = self._indexes_by_columns(conn, table)
+                    if existing is None:
+                        continue
+                    if any(index_columns[:len(columns)] == columns for index_columns in existing):
+                        unit_present.append(name)
+                        continue
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS main.{name} ON {table}({', '.join(columns)})")
+                    unit_created.append(name)
+                conn.commit()
+            if unit_created:
+                logger.info(f"Índices creados ({key or 'kronos.db'}): {', '.join(unit_created)}")
+            created.append({'missionId': key, 'indexes': unit_created})
+            present.append({'missionId': key, 'indexes': unit_present})
+        return {'created': created, 'present': present}
+
+    def _indexes_by_columns(self, conn, table: str) -> Optional[List[tuple]]:
+        """Columnas de cada índice de una tabla de 'main', o None si la tabla no existe"""
+        if not conn.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone():
+            return None
+        return [
+            tuple(column[2] for column in conn.execute(f'PRAGMA main.index_info("{index[1]}")'))
+            for index in conn.execute(f"PRAGMA main.index_list({table})")
+        ]
+
+    def get_size_report(self, include_fragmentation: bool = True) -> Dict[str, Any]:
+        """
+        Tamaño de las tablas e índices de kronos.db y de cada archivo de misión
+
+        Args:
+            include_fragmentation: Calcular la fragmentación (recorre todas
+                las hojas; más lento en bases de datos grandes)
+
+        Returns:
+            Dict con 'files' (por archivo: 'missionId', 'fileBytes',
+            'pageSize', 'pageCount', 'autoVacuum' (0 = NONE, 1 = FULL,
+            2 = INCREMENTAL), 'freePages' y 'objects' con 'name',
+            'type', 'table', 'pages', 'bytes', 'unusedBytes' y
+            'fragmentationPercent') y 'totalBytes'
+        """
+        files = []
+        for key in self._units():
+            try:
+                files.append(self._file_report(key, include_fragmentation))
+            except Exception as e:
+                logger.error(f"Error generando reporte de tamaño ({key or 'kronos.db'}): {e}")
+                raise DatabaseMaintenanceServiceError("Error generando el reporte de tamaño")
+        return {'files': files, 'totalBytes': sum(report['fileBytes'] for report in files)}
+
+    def _file_report(self, mission_id: Optional[str], include_fragmentation: bool) -> Dict[str, Any]:
+        with get_db_connection(mission_id) as conn:
+            path = conn.execute("PRAGMA database_list").fetchone()[2]
+            page_size = conn.execute("PRAGMA main.page_size").fetchone()[0]
+            report = {
+                'missionId': mission_id,
+                'fileBytes': sum(os.path.getsize(p) for p in (path, f"{path}-wal") if os.path.exists(p)),
+                'pageSize': page_size,
+                'pageCount': conn.execute("PRAGMA main.page_count").fetchone()[0],
+                'autoVacuum': conn.execute("PRAGMA main.auto_vacuum").fetchone()[0],
+                'freePages': conn.execute("PRAGMA main.freelist_count").fetchone()[0],
+                'objects': []
+            }
+            kinds = {name: (object_type, table) for object_type, name, table in conn.execute(
+                "SELECT type, name, tbl_name FROM main.sqlite_master WHERE type IN ('table', 'index')"
+            )}
+            rows = conn.execute("""
+                SELECT name, COUNT(*), SUM(pgsize), SUM(unused) FROM dbstat('main') GROUP BY name
+            """).fetchall()
+            jumps = {}
+            if include_fragmentation:
+                # Hojas en orden lógico (path) cuya página no sigue a la anterior
+                jumps = dict(conn.execute("""
+                    SELECT name, SUM(prev IS NOT NULL AND pageno <> prev + 1) * 1.0 / COUNT(*)
+                    FROM (
+                        SELECT name, pageno, LAG(pageno) OVER (PARTITION BY name ORDER BY path) AS prev
+                        FROM dbstat('main') WHERE pagetype = 'leaf'
+                    ) GROUP BY name
+                """).fetchall())
+
+        for name, pages, size_bytes, unused in sorted(rows, key=lambda row: row[2], reverse=True):
+            object_type, table = kinds.get(name, ('internal', name))
+            report['objects'].append({
+                'name': name,
+                'type': object_type,
+                'table': table,
+                'pages': pages,
+                'bytes': size_bytes,
+                'unusedBytes': unused,
+                'fragmentationPercent': round(jumps[name] * 100, 1) if name in jumps else None
+            })
+        return report
+
+    def start(self) -> Dict[str, Any]:
+        """Inicia el hilo de mantenimiento (no hace nada si ya está activo)"""
+        with self._lock:
+            already_running = self._thread is not None and self._thread.is_alive()
+            if not already_running:
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, name="database-maintenance", daemon=True)
+                self._thread.start()
+
+        if not already_running:
+            logger.info(f"Mantenimiento de base de datos en segundo plano cada {self.interval_seconds}s")
+        return self.get_status()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Detiene el hilo de mantenimiento"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retorna una copia del estado del servicio"""
+        with self._lock:
+            status = dict(self._status)
+            status['pendingRows'] = {key or 'kronos.db': rows for key, rows in self._pending_rows.items()}
+        status['running'] = self._thread is not None and self._thread.is_alive()
+        return status
+
+    def _run(self) -> None:
+        """Bucle de ciclos de mantenimiento hasta stop()"""
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.run_maintenance()
+            except DatabaseMaintenanceServiceError:
+                pass
+            except Exception as e:
+                with self._lock:
+                    self._status['errors'] += 1
+                    self._status['lastError'] = str(e)
+                logger.warning(f"Error en mantenimiento de base de datos en segundo plano: {e}")
+
+
+# Instancia global del servicio
+_database_maintenance_service_instance = None
+
+
+def get_database_maintenance_service() -> DatabaseMaintenanceService:
+    """Retorna la instancia singleton del servicio de mantenimiento de base de datos"""
+    global _database_maintenance_service_instance
+    if _database_maintenance_service_instance is None:
+        _database_maintenance_service_instance = DatabaseMaintenanceService()
+    return _database_maintenance_service_instance
@@ -35,6 +35,7 @@ from sqlalchemy import text
 from collections import defaultdict, Counter
 
 from database.connection import get_database_manager
+from services.bulk_deletion_service import active_sheet_rows_sql, active_cellular_rows_sql
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +111,7 @@ class DiagramCorrelationService:
                 logger.info("Datos del diagrama obtenidos desde cache")
                 return cached_result
             
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session(mission_id) as session:
                 # 1. Obtener red de comunicaciones
                 network_data = self._build_communication_network(
                     session, mission_id, numero_objetivo, start_datetime, end_datetime, filtros
@@ -246,6 +247,7 @@ class DiagramCorrelationService:
                         
                     FROM operator_call_data ocd
                     WHERE ocd.mission_id = :mission_id
+                      AND {active_sheet_rows_sql('ocd')}
                       -- FILTRO PRINCIPAL: Solo llamadas donde el número objetivo participó directamente
                       AND (ocd.numero_origen = :numero_objetivo OR ocd.numero_destino = :numero_objetivo)
                       AND DATE(ocd.fecha_hora_llamada) BETWEEN :start_date AND :end_date
@@ -255,6 +257,7 @@ class DiagramCorrelationService:
                       AND EXISTS (
                           SELECT 1 FROM cellular_data cd 
                           WHERE cd.mission_id = :mission_id 
+                          AND {active_cellular_rows_sql('cd', ':mission_id')}
                           AND (cd.cell_id = ocd.celda_origen OR cd.cell_id = ocd.celda_destino)
                       )
                       {filtro_sql}
@@ -490,14 +493,17 @@ class DiagramCorrelationService:
                 FROM cellular_data cd
                 LEFT JOIN operator_call_data ocd1 ON (
                     cd.cell_id = ocd1.celda_origen AND 
-                    cd.mission_id = ocd1.mission_id
+                    cd.mission_id = ocd1.mission_id AND
+                    {active_sheet_rows_sql('ocd1')}
                 )
                 LEFT JOIN operator_call_data ocd2 ON (
                     cd.cell_id = ocd2.celda_destino AND 
-                    cd.mission_id = ocd2.mission_id
+                    cd.mission_id = ocd2.mission_id AND
+                    {active_sheet_rows_sql('ocd2')}
                 )
                 
                 WHERE cd.mission_id = :mission_id
+                  AND {active_cellular_rows_sql('cd', ':mission_id')}
                   AND cd.cell_id IN ({cell_ids_str})
                 
                 GROUP BY cd.cell_id, cd.operator, cd.tecnologia, cd.lat, cd.lon, 
@@ -17,13 +17,17 @@ Características principales:
 ===============================================================================
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-import pandas as pd
-import numpy as np
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 import chardet
 
+# pandas se importa en los métodos que lo usan: se carga con la primera carga de archivo
+if TYPE_CHECKING:
+    import pandas as pd
+
 from utils.helpers import (
     decode_base64_file, 
     read_excel_file, 
@@ -32,6 +36,7 @@ from utils.helpers import (
     normalize_column_names,
     validate_dataframe_not_empty
 )
+from utils.excel_reader import list_excel_sheets
 from utils.validators import (
     validate_file_data,
     validate_cellular_data_record,
@@ -266,8 +271,7 @@ class FileProcessor:
                 raise FileProcessorError("El archivo no es un Excel válido")
             
             # Leer todas las hojas para obtener nombres
-            excel_file = pd.ExcelFile(file_bytes)
-            return excel_file.sheet_names
+            return list_excel_sheets(file_bytes)
             
         except FileProcessorError:
             raise
@@ -500,6 +504,7 @@ class FileProcessor:
     
     def _clean_scanhunter_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Limpia tipos de datos para columnas SCANHUNTER expandidas"""
+        import pandas as pd
         df_clean = df.copy()
         
         # Limpiar punto (identificador del punto de medición)
@@ -556,6 +561,7 @@ class FileProcessor:
     
     def _clean_operator_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Limpia tipos de datos para columnas de operador"""
+        import pandas as pd
         df_clean = df.copy()
         
         # Limpiar strings
@@ -575,6 +581,7 @@ class FileProcessor:
     
     def _dataframe_to_cellular_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Convierte DataFrame a registros celulares SCANHUNTER validados"""
+        import pandas as pd
         records = []
         
         for index, row in df.iterrows():
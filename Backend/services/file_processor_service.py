@@ -12,6 +12,8 @@ Características principales:
 - Manejo de errores granular por registro
 - Soporte para CSV y XLSX
 - Normalización automática de datos
+- Núcleo común de carga para formatos descritos por adaptadores declarativos
+  (CLARO, MOVISTAR, TIGO, WOM y SCANHUNTER; ver services.operator_ingestion_adapters)
 
 Operadores soportados:
 - CLARO: Datos por Celda, Llamadas Entrantes/Salientes
@@ -24,13 +26,14 @@ Versión: 1.0.0
 """
 
 import pandas as pd
-import numpy as np
 import io
 import csv
-from typing import Dict, List, Optional, Any, Tuple, Generator
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 import hashlib
 import json
 import re
+import sqlite3
+import time
 from datetime import datetime
 import sys
 import os
@@ -40,9 +43,23 @@ import chardet
 # Agregar el directorio padre al path para imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from database.batch_write_guard import BEGIN_BATCH_WRITE_SQL, END_BATCH_WRITE_SQL
 from database.connection import get_db_connection
+from database.models import calculate_cellular_record_hash
+from services.cell_dictionary_service import CELL_KEY_COLUMNS, CellDictionaryServiceError, get_cell_dictionary_service
+from services.number_search_index_service import (
+    NUMBER_INDEX_SOURCES, NumberSearchIndexServiceError, get_number_search_index_service
+)
 from services.data_normalizer_service import DataNormalizerService
 from utils.operator_logger import OperatorLogger
+from utils.excel_reader import list_excel_sheets, read_excel_sheet, read_excel_sheets, select_excel_engine
+from utils.cell_id_converter import extract_cellid_lac_vectorized
+from utils.operator_specific_codec import OperatorSpecificDataPacker
+from services.parallel_sheet_processor import iter_sheet_results, should_process_sheets_in_parallel
+from services.operator_ingestion_adapters import (
+    IngestionAdapter, SCANHUNTER_ADAPTER, TIGO_COLUMN_MAPPING, get_ingestion_adapter, insert_table,
+    specific_data_position
+)
 
 
 class FileProcessorService:
@@ -53,14 +70,21 @@ class FileProcessorService:
     con énfasis en robustez, performance y logging detallado.
     """
     
-    def __init__(self):
-        """Inicializa el servicio con dependencias."""
-        self.data_normalizer = DataNormalizerService()
+    # Columnas del formato TIGO y su nombre estándar (ver services.operator_ingestion_adapters)
+    TIGO_COLUMN_MAPPING = TIGO_COLUMN_MAPPING
+    
+    def __init__(self, data_normalizer: Optional[DataNormalizerService] = None):
+        """
+        Inicializa el servicio con dependencias.
+        
+        Args:
+            data_normalizer: Normalizador compartido; si no se indica se crea uno
+        """
+        self.data_normalizer = data_normalizer or DataNormalizerService()
         self.logger = OperatorLogger()
         
         # Configuración de procesamiento
         self.CHUNK_SIZE = 1000  # Registros por lote
-        self.MAX_ERRORS_PER_FILE = 100  # Máximo errores antes de abortar
         
         # Patrones de validación
         self.PHONE_PATTERN = re.compile(r'^57\d{10}$|^\d{10}$')  # Números colombianos
@@ -207,24 +231,29 @@ class FileProcessorService:
                 self.logger.error(f"Error crítico leyendo CSV: {final_error}")
                 raise
     
-    def _read_excel_robust(self, file_bytes: bytes, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def _read_excel_robust(self, file_bytes: bytes, sheet_name: Optional[str] = None,
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Lee un archivo Excel de forma robusta.
         
+        Usa la capa utils.excel_reader, que selecciona el motor más rápido
+        disponible (calamine u openpyxl en modo streaming).
+        
         Args:
             file_bytes (bytes): Contenido del archivo
             sheet_name (Optional[str]): Nombre de la hoja (None = primera hoja)
+            columns (Optional[List[str]]): Columnas a leer (None = todas)
             
         Returns:
             pd.DataFrame: Datos leídos
         """
         try:
-            df = pd.read_excel(
-                io.BytesIO(file_bytes),
-                sheet_name=sheet_name or 0,  # Primera hoja si no se especifica
+            df = read_excel_sheet(
+                file_bytes,
+                sheet_name=sheet_name,
+                columns=columns,
                 dtype=str,  # Leer todo como string
-                na_filter=False,
-                engine='openpyxl'
+                na_filter=False
             )
             
             self.logger.debug(f"Excel leído exitosamente: {len(df)} filas, {len(df.columns)} columnas")
@@ -416,480 +445,212 @@ class FileProcessorService:
         self.logger.debug(f"Datos de llamadas limpiados (MODO PERMISIVO): {len(clean_df)} filas válidas (TODOS los tipos)")
         return clean_df
     
-    def _validate_claro_call_record(self, record: Dict[str, Any], call_type: str = 'ENTRANTE') -> Tuple[bool, List[str]]:
+    def _digit_field_errors(self, values: pd.Series, label: str, min_length: int,
+                            max_length: int) -> List[Tuple[str, pd.Series]]:
+        """Máscaras de un campo numérico de texto: vacío, muy corto, muy largo o con no dígitos"""
+        values = values.astype(str).str.strip()
+        lengths = values.str.len()
+        empty = values == ''
+        too_short = ~empty & (lengths < min_length)
+        too_long = ~empty & ~too_short & (lengths > max_length)
+        not_digits = ~empty & ~too_short & ~too_long & ~values.str.isdigit()
+        return [
+            (f"{label} vacío", empty),
+            (f"{label} muy corto", too_short),
+            (f"{label} muy largo", too_long),
+            (f"{label} contiene caracteres no numéricos", not_digits)
+        ]
+    
+    def _compact_date_errors(self, values: pd.Series, label: str) -> List[Tuple[str, pd.Series]]:
+        """Máscaras de una fecha YYYYMMDDHHMMSS: vacía, con formato incorrecto o componentes fuera de rango"""
+        values = values.astype(str).str.strip()
+        empty = values == ''
+        bad_format = ~empty & ~values.str.fullmatch(r'\d{14}')
+        
+        well_formed = values.where(~empty & ~bad_format, '20200101000000')
+        component = lambda start, end: well_formed.str[start:end].astype(int)
+        out_of_range = (
+            ~component(0, 4).between(2020, 2030) | ~component(4, 6).between(1, 12) |
+            ~component(6, 8).between(1, 31) | ~component(8, 10).between(0, 23) |
+            ~component(10, 12).between(0, 59) | ~component(12, 14).between(0, 59)
+        )
+        return [
+            (f"{label} vacía", empty),
+            (f"Formato de {label.lower()} incorrecto (esperado YYYYMMDDHHMMSS)", bad_format),
+            (f"{label} con componentes fuera de rango", out_of_range)
+        ]
+    
+    def _claro_cellular_record_errors(self, df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
         """
-        Valida un registro individual de datos de llamadas de CLARO.
-        
-        CORRECCIÓN BORIS: Validación muy permisiva para no perder registros
+        Validación vectorizada de los registros de datos celulares de CLARO.
         
         Args:
-            record (Dict[str, Any]): Registro a validar
-            call_type (str): Tipo de llamada ('ENTRANTE' o 'SALIENTE')
+            df (pd.DataFrame): DataFrame limpio
             
         Returns:
-            Tuple[bool, List[str]]: (Es válido, Lista de errores)
+            List[Tuple[str, pd.Series]]: (mensaje, máscara de registros inválidos)
+        """
+        tipo_cdr = df['tipo_cdr'].astype(str).str.strip().str.upper()
+        celda = df['celda_decimal'].astype(str).str.strip()
+        lac = df['lac_decimal'].astype(str).str.strip()
+        
+        return (
+            self._digit_field_errors(df['numero'], 'Número telefónico', 10, 12) +
+            self._compact_date_errors(df['fecha_trafico'], 'Fecha de tráfico') +
+            [
+                ("Tipo CDR vacío", tipo_cdr == ''),
+                ("Tipo CDR no reconocido",
+                 (tipo_cdr != '') & ~tipo_cdr.isin(['DATOS', 'DATA', 'SMS', 'MMS', 'VOZ', 'VOICE'])),
+                ("Celda decimal vacía", celda == ''),
+                ("Celda decimal no numérica", (celda != '') & ~celda.str.isdigit()),
+                ("LAC decimal no numérico", (lac != '') & ~lac.str.isdigit())
+            ]
+        )
+    
+    def _claro_call_record_errors(self, df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
         """
-        errors = []
-        
-        # CORRECCIÓN: Validar número originador de forma MUY permisiva
-        originador = str(record.get('originador', '')).strip()
-        
-        # CORRECCIÓN: Validar número receptor de forma MUY permisiva
-        receptor = str(record.get('receptor', '')).strip()
-        
-        # Solo rechazar si AMBOS números están vacíos
-        if (not originador or originador == 'nan' or len(originador) < 8) and \
-           (not receptor or receptor == 'nan' or len(receptor) < 8):
-            errors.append("Tanto originador como receptor están vacíos o son muy cortos")
-        
-        # CORRECCIÓN: Validación de números menos restrictiva
-        if originador and originador != 'nan':
-            if len(originador) > 15:
-                errors.append(f"Número originador muy largo: {originador}")
-            elif not originador.isdigit():
-                errors.append(f"Número originador contiene caracteres no numéricos: {originador}")
-        
-        if receptor and receptor != 'nan':
-            if len(receptor) > 15:
-                errors.append(f"Número receptor muy largo: {receptor}")
-            elif not receptor.isdigit():
-                errors.append(f"Número receptor contiene caracteres no numéricos: {receptor}")
-        
-        # CORRECCIÓN: Validación de fecha MUY permisiva (solo verificar que no esté vacía)
-        fecha_hora = str(record.get('fecha_hora', '')).strip()
-        if not fecha_hora or fecha_hora == 'nan':
-            # Solo warning, no error crítico
-            pass
-        
-        # CORRECCIÓN: NO validar tipo CDR para cargar TODOS los registros
-        # Comentamos la validación de tipo para preservar todos los datos
-        # tipo = str(record.get('tipo', '')).strip().upper()
-        # if not tipo:
-        #     errors.append("Tipo CDR vacío")
-        # elif call_type == 'ENTRANTE' and 'CDR_ENTRANTE' not in tipo:
-        #     errors.append(f"Tipo CDR no es CDR_ENTRANTE: {tipo}")
-        # elif call_type == 'SALIENTE' and 'CDR_SALIENTE' not in tipo:
-        #     errors.append(f"Tipo CDR no es CDR_SALIENTE: {tipo}")
-        
-        # Validar duración
-        duracion = record.get('duracion', 0)
-        try:
-            duracion_int = int(duracion)
-            if duracion_int < 0:
-                errors.append(f"Duración no puede ser negativa: {duracion_int}")
-        except (ValueError, TypeError):
-            errors.append(f"Duración debe ser numérica: {duracion}")
-        
-        # Validar celdas (pueden estar vacías en algunos casos)
-        celda_inicio = str(record.get('celda_inicio_llamada', '')).strip()
-        if celda_inicio and celda_inicio != 'nan' and not celda_inicio.replace('.', '').isdigit():
-            errors.append(f"Celda inicio no numérica: {celda_inicio}")
+        Validación vectorizada (permisiva) de los registros de llamadas de CLARO.
         
-        celda_final = str(record.get('celda_final_llamada', '')).strip()
-        if celda_final and celda_final != 'nan' and not celda_final.replace('.', '').isdigit():
-            errors.append(f"Celda final no numérica: {celda_final}")
+        Solo se rechaza un registro si ambos números faltan o son muy cortos, si
+        algún número es muy largo o no numérico, si la duración es negativa o si
+        una celda informada no es numérica.
         
-        return len(errors) == 0, errors
-
-    def _validate_claro_cellular_record(self, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        Args:
+            df (pd.DataFrame): DataFrame limpio
+            
+        Returns:
+            List[Tuple[str, pd.Series]]: (mensaje, máscara de registros inválidos)
+        """
+        originador = df['originador'].astype(str).str.strip()
+        receptor = df['receptor'].astype(str).str.strip()
+        
+        def missing_or_short(values):
+            return (values == '') | (values == 'nan') | (values.str.len() < 8)
+        
+        def present(values):
+            return (values != '') & (values != 'nan')
+        
+        errors = [("Tanto originador como receptor están vacíos o son muy cortos",
+                   missing_or_short(originador) & missing_or_short(receptor))]
+        for label, values in (('originador', originador), ('receptor', receptor)):
+            too_long = present(values) & (values.str.len() > 15)
+            errors.append((f"Número {label} muy largo", too_long))
+            errors.append((f"Número {label} contiene caracteres no numéricos",
+                           present(values) & ~too_long & ~values.str.isdigit()))
+        
+        errors.append(("Duración no puede ser negativa", pd.to_numeric(df['duracion'], errors='coerce') < 0))
+        for label, column in (('inicio', 'celda_inicio_llamada'), ('final', 'celda_final_llamada')):
+            celda = df[column].astype(str).str.strip()
+            errors.append((f"Celda {label} no numérica",
+                           present(celda) & ~celda.str.replace('.', '', regex=False).str.isdigit()))
+        return errors
+    
+    def _validate_claro_call_record(self, record: Dict[str, Any], call_type: str = 'ENTRANTE') -> Tuple[bool, List[str]]:
         """
-        Valida un registro individual de datos celulares de CLARO.
+        Valida un registro individual de llamadas de CLARO con las reglas de
+        _claro_call_record_errors (diagnóstico de registros puntuales).
         
         Args:
             record (Dict[str, Any]): Registro a validar
+            call_type (str): Tipo de llamada ('ENTRANTE' o 'SALIENTE')
             
         Returns:
             Tuple[bool, List[str]]: (Es válido, Lista de errores)
         """
-        errors = []
-        
-        # Validar número telefónico
-        numero = str(record.get('numero', '')).strip()
-        if not numero:
-            errors.append("Número telefónico vacío")
-        elif len(numero) < 10:
-            errors.append(f"Número telefónico muy corto: {numero}")
-        elif len(numero) > 12:
-            errors.append(f"Número telefónico muy largo: {numero}")
-        elif not numero.isdigit():
-            errors.append(f"Número telefónico contiene caracteres no numéricos: {numero}")
-        
-        # Validar fecha
-        fecha = str(record.get('fecha_trafico', '')).strip()
-        if not fecha:
-            errors.append("Fecha de tráfico vacía")
-        elif len(fecha) != 14:
-            errors.append(f"Formato de fecha incorrecto (esperado YYYYMMDDHHMMSS): {fecha}")
-        elif not fecha.isdigit():
-            errors.append(f"Fecha contiene caracteres no numéricos: {fecha}")
-        else:
-            # Validar componentes de fecha
-            try:
-                year = int(fecha[:4])
-                month = int(fecha[4:6])
-                day = int(fecha[6:8])
-                hour = int(fecha[8:10])
-                minute = int(fecha[10:12])
-                second = int(fecha[12:14])
-                
-                if not (2020 <= year <= 2030):
-                    errors.append(f"Año fuera de rango válido: {year}")
-                if not (1 <= month <= 12):
-                    errors.append(f"Mes inválido: {month}")
-                if not (1 <= day <= 31):
-                    errors.append(f"Día inválido: {day}")
-                if not (0 <= hour <= 23):
-                    errors.append(f"Hora inválida: {hour}")
-                if not (0 <= minute <= 59):
-                    errors.append(f"Minuto inválido: {minute}")
-                if not (0 <= second <= 59):
-                    errors.append(f"Segundo inválido: {second}")
-                    
-            except ValueError:
-                errors.append(f"Error parseando fecha: {fecha}")
-        
-        # Validar tipo CDR
-        tipo_cdr = str(record.get('tipo_cdr', '')).strip().upper()
-        if not tipo_cdr:
-            errors.append("Tipo CDR vacío")
-        elif tipo_cdr not in ['DATOS', 'DATA', 'SMS', 'MMS', 'VOZ', 'VOICE']:
-            errors.append(f"Tipo CDR no reconocido: {tipo_cdr}")
-        
-        # Validar celda
-        celda = str(record.get('celda_decimal', '')).strip()
-        if not celda:
-            errors.append("Celda decimal vacía")
-        elif not celda.isdigit():
-            errors.append(f"Celda decimal no numérica: {celda}")
-        
-        # Validar LAC (puede estar vacío en algunos casos)
-        lac = str(record.get('lac_decimal', '')).strip()
-        if lac and not lac.isdigit():
-            errors.append(f"LAC decimal no numérico: {lac}")
-        
+        checks = self._claro_call_record_errors(pd.DataFrame([record]))
+        errors = [message for message, mask in checks if mask.iloc[0]]
         return len(errors) == 0, errors
     
-    def _process_claro_cellular_chunk(self, chunk_df: pd.DataFrame, file_upload_id: str, 
-                                    mission_id: str, chunk_number: int) -> Dict[str, Any]:
+    def _build_claro_cellular_params(self, row_data: Dict[str, Any], connection_type: str,
+                                     file_upload_id: str, mission_id: str) -> Optional[tuple]:
         """
-        Procesa un chunk de datos celulares de CLARO.
+        Normaliza un registro CLARO de datos y construye los parámetros de
+        CELLULAR_DATA_INSERT_SQL.
         
-        Args:
-            chunk_df (pd.DataFrame): Chunk de datos a procesar
-            file_upload_id (str): ID del archivo
-            mission_id (str): ID de la misión
-            chunk_number (int): Número del chunk para logging
-            
         Returns:
-            Dict[str, Any]: Resultado del procesamiento del chunk
+            Tupla de parámetros, o None si el registro no se pudo normalizar
         """
-        records_processed = 0
-        records_failed = 0
-        records_duplicated = 0  # NUEVO: contador de duplicados
-        validation_failed = 0   # NUEVO: contador de errores de validación
-        other_errors = 0        # NUEVO: contador de otros errores
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in chunk_df.iterrows():
-                    try:
-                        # Convertir fila a diccionario
-                        record = row.to_dict()
-                        
-                        # Validar registro
-                        is_valid, errors = self._validate_claro_cellular_record(record)
-                        if not is_valid:
-                            # CAMBIO: errores de validación se clasifican por separado
-                            validation_failed += 1
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': errors,
-                                'type': 'validation',
-                                'record': record
-                            })
-                            
-                            if len(failed_records) > 10:  # Limitar detalle de errores
-                                break
-                            continue
-                        
-                        # Normalizar datos
-                        normalized_data = self.data_normalizer.normalize_claro_cellular_data(
-                            record, file_upload_id, mission_id
-                        )
-                        
-                        if not normalized_data:
-                            validation_failed += 1
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['Error en normalización'],
-                                'type': 'normalization',
-                                'record': record
-                            })
-                            continue
-                        
-                        # Verificar que existen los registros padre antes del INSERT
-                        # para evitar FOREIGN KEY constraint failed
-                        
-                        # Verificar que file_upload_id existe en operator_data_sheets
-                        cursor.execute("SELECT id FROM operator_data_sheets WHERE id = ?", 
-                                     (normalized_data['file_upload_id'],))
-                        if not cursor.fetchone():
-                            raise Exception(f"file_upload_id '{normalized_data['file_upload_id']}' no existe en operator_data_sheets")
-                        
-                        # Verificar que mission_id existe en missions
-                        cursor.execute("SELECT id FROM missions WHERE id = ?", 
-                                     (normalized_data['mission_id'],))
-                        if not cursor.fetchone():
-                            raise Exception(f"mission_id '{normalized_data['mission_id']}' no existe en missions")
-                        
-                        # Insertar en base de datos
-                        # cursor.execute("""
-                        #     INSERT INTO operator_cellular_data (
-                        #         file_upload_id, mission_id, operator, numero_telefono,
-                        #         fecha_hora_inicio, celda_id, lac_tac, trafico_subida_bytes,
-                        #         trafico_bajada_bytes, tecnologia, tipo_conexion, record_hash
-                        #     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        # """, (
-                        #     normalized_data['file_upload_id'],
-                        #     normalized_data['mission_id'],
-                        #     normalized_data['operator'],
-                        #     normalized_data['numero_telefono'],
-                        #     normalized_data['fecha_hora_inicio'],
-                        #     normalized_data['celda_id'],
-                        #     normalized_data['lac_tac'],
-                        #     normalized_data['trafico_subida_bytes'],
-                        #     normalized_data['trafico_bajada_bytes'],
-                        #     normalized_data['tecnologia'],
-                        #     normalized_data['tipo_conexion'],
-                        #     normalized_data['record_hash']
-                        # ))
-
-                        cursor.execute("""
-                            INSERT INTO cellular_data (
-                                mission_id, file_record_id, punto, lat, lon, mnc_mcc, operator,
-                                rssi, tecnologia, cell_id, lac_tac, enb, 
-                                comentario, channel, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (
-                            normalized_data['mission_id'],
-                            normalized_data.get('file_record_id'),
-                            normalized_data['punto'],
-                            normalized_data['latitud'],
-                            normalized_data['longitud'],
-                            normalized_data['mnc_mcc'],
-                            normalized_data['operator'],
-                            normalized_data['rssi'],
-                            normalized_data['tecnologia'],
-                            normalized_data['cell_id'],
-                            normalized_data['lac_tac'],
-                            normalized_data['enb'],
-                            normalized_data['comentario'],
-                            normalized_data['channel']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        error_str = str(e)
-                        
-                        # NUEVO: Distinguir tipos de errores por mensaje
-                        if "UNIQUE constraint failed" in error_str:
-                            # Es un duplicado legítimo - NO cuenta como error para el límite
-                            records_duplicated += 1
-                            error_type = 'duplicate'
-                            self.logger.debug(f"Registro duplicado omitido {index + 1} en chunk {chunk_number}: {error_str}")
-                        else:
-                            # Es un error real - SÍ cuenta para el límite de errores
-                            other_errors += 1
-                            records_failed += 1  # SOLO errores reales incrementan records_failed
-                            error_type = 'database'
-                            self.logger.error(f"Error procesando registro {index + 1} en chunk {chunk_number}: {e}")
-                        
-                        # Agregar a la lista de fallos (para debugging, pero no afecta límite de errores)
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {error_str}'],
-                            'type': error_type,
-                            'record': record if 'record' in locals() else {}
-                        })
-                
-                # Confirmar transacción del chunk
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos ({records_duplicated} duplicados, {validation_failed} validación, {other_errors} otros)"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'records_duplicated': records_duplicated,      # NUEVO
-                    'validation_failed': validation_failed,       # NUEVO
-                    'other_errors': other_errors,                 # NUEVO
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed,
-                'records_duplicated': records_duplicated,
-                'validation_failed': validation_failed,
-                'other_errors': other_errors
-            }
+        normalized_data = self.data_normalizer.normalize_claro_cellular_data(
+            row_data, file_upload_id, mission_id
+        )
+        return self._operator_cellular_params(normalized_data) if normalized_data else None
     
-    def _process_claro_call_chunk(self, chunk_df: pd.DataFrame, file_upload_id: str, 
-                                mission_id: str, chunk_number: int, call_type: str = 'ENTRANTE') -> Dict[str, Any]:
+    def _build_claro_call_params(self, row_data: Dict[str, Any], call_direction: str,
+                                 file_upload_id: str, mission_id: str) -> Optional[tuple]:
         """
-        Procesa un chunk de datos de llamadas de CLARO.
+        Normaliza un registro CLARO de llamadas y construye los parámetros de
+        CALL_DATA_INSERT_SQL.
         
-        Args:
-            chunk_df (pd.DataFrame): Chunk de datos a procesar
-            file_upload_id (str): ID del archivo
-            mission_id (str): ID de la misión
-            chunk_number (int): Número del chunk para logging
-            call_type (str): Tipo de llamada ('ENTRANTE' o 'SALIENTE')
-            
         Returns:
-            Dict[str, Any]: Resultado del procesamiento del chunk
+            Tupla de parámetros, o None si el registro no se pudo normalizar
         """
-        records_processed = 0
-        records_failed = 0
-        failed_records = []
+        if call_direction == 'ENTRANTE':
+            normalize = self.data_normalizer.normalize_claro_call_data_entrantes
+        else:
+            normalize = self.data_normalizer.normalize_claro_call_data_salientes
         
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in chunk_df.iterrows():
-                    try:
-                        # Convertir fila a diccionario
-                        record = row.to_dict()
-                        
-                        # Validar registro
-                        is_valid, errors = self._validate_claro_call_record(record, call_type)
-                        if not is_valid:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': errors,
-                                'record': record
-                            })
-                            
-                            if len(failed_records) > 10:  # Limitar detalle de errores
-                                break
-                            continue
-                        
-                        # Normalizar datos según el tipo de llamada
-                        if call_type == 'ENTRANTE':
-                            normalized_data = self.data_normalizer.normalize_claro_call_data_entrantes(
-                                record, file_upload_id, mission_id
-                            )
-                        elif call_type == 'SALIENTE':
-                            normalized_data = self.data_normalizer.normalize_claro_call_data_salientes(
-                                record, file_upload_id, mission_id
-                            )
-                        else:
-                            # Fallback genérico
-                            normalized_data = self.data_normalizer.normalize_claro_call_data(
-                                record, file_upload_id, mission_id
-                            )
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['Error en normalización'],
-                                'record': record
-                            })
-                            continue
-                        
-                        # Insertar en base de datos
-                        cursor.execute("""
-                            INSERT INTO operator_call_data (
-                                file_upload_id, mission_id, operator, tipo_llamada,
-                                numero_origen, numero_destino, numero_objetivo,
-                                fecha_hora_llamada, duracion_segundos,
-                                celda_origen, celda_destino, celda_objetivo,
-                                latitud_origen, longitud_origen, latitud_destino, longitud_destino,
-                                tecnologia, tipo_trafico, estado_llamada,
-                                operator_specific_data, record_hash
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            normalized_data['operator'],
-                            normalized_data['tipo_llamada'],
-                            normalized_data['numero_origen'],
-                            normalized_data['numero_destino'],
-                            normalized_data['numero_objetivo'],
-                            normalized_data['fecha_hora_llamada'],
-                            normalized_data['duracion_segundos'],
-                            normalized_data['celda_origen'],
-                            normalized_data['celda_destino'],
-                            normalized_data['celda_objetivo'],
-                            normalized_data['latitud_origen'],
-                            normalized_data['longitud_origen'],
-                            normalized_data['latitud_destino'],
-                            normalized_data['longitud_destino'],
-                            normalized_data['tecnologia'],
-                            normalized_data['tipo_trafico'],
-                            normalized_data['estado_llamada'],
-                            normalized_data['operator_specific_data'],
-                            normalized_data['record_hash']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        records_failed += 1
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {str(e)}'],
-                            'record': record if 'record' in locals() else {}
-                        })
-                        
-                        self.logger.error(
-                            f"Error procesando registro {index + 1} en chunk {chunk_number}: {e}"
-                        )
-                
-                # Confirmar transacción del chunk
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed
-            }
+        normalized_data = normalize(row_data, file_upload_id, mission_id)
+        return self._operator_call_params(normalized_data, None, None) if normalized_data else None
+    
+    def _operator_cellular_params(self, normalized_data: Dict[str, Any]) -> tuple:
+        """Parámetros de CELLULAR_DATA_INSERT_SQL de un registro normalizado de datos por celda"""
+        return (
+            normalized_data['file_upload_id'],
+            normalized_data['mission_id'],
+            normalized_data['operator'],
+            normalized_data['numero_telefono'],
+            normalized_data['fecha_hora_inicio'],
+            normalized_data['fecha_hora_fin'],
+            normalized_data['duracion_segundos'],
+            normalized_data['celda_id'],
+            normalized_data['lac_tac'],
+            normalized_data['trafico_subida_bytes'],
+            normalized_data['trafico_bajada_bytes'],
+            normalized_data['latitud'],
+            normalized_data['longitud'],
+            normalized_data['tecnologia'],
+            normalized_data['tipo_conexion'],
+            normalized_data['operator_specific_data'],
+            normalized_data['record_hash']
+        )
+    
+    def _operator_call_params(self, normalized_data: Dict[str, Any], cellid_decimal: Optional[int],
+                              lac_decimal: Optional[int]) -> tuple:
+        """Parámetros de CALL_DATA_INSERT_SQL de un registro normalizado de llamadas"""
+        return (
+            normalized_data['file_upload_id'],
+            normalized_data['mission_id'],
+            normalized_data['operator'],
+            normalized_data['tipo_llamada'],
+            normalized_data['numero_origen'],
+            normalized_data['numero_destino'],
+            normalized_data['numero_objetivo'],
+            normalized_data['fecha_hora_llamada'],
+            normalized_data['duracion_segundos'],
+            normalized_data['celda_origen'],
+            normalized_data['celda_destino'],
+            normalized_data['celda_objetivo'],
+            normalized_data['latitud_origen'],
+            normalized_data['longitud_origen'],
+            normalized_data['latitud_destino'],
+            normalized_data['longitud_destino'],
+            normalized_data['tecnologia'],
+            normalized_data['tipo_trafico'],
+            normalized_data['estado_llamada'],
+            normalized_data['operator_specific_data'],
+            normalized_data['record_hash'],
+            cellid_decimal,
+            lac_decimal
+        )
     
     def process_claro_data_por_celda(self, file_bytes: bytes, file_name: str,
                                    file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
         Procesa un archivo de datos por celda de CLARO.
         
+        El formato se describe en el adaptador CLARO/CELLULAR_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
         Args:
             file_bytes (bytes): Contenido del archivo
             file_name (str): Nombre del archivo
@@ -899,221 +660,18 @@ class FileProcessorService:
         Returns:
             Dict[str, Any]: Resultado del procesamiento
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento CLARO datos por celda: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
+        return self.process_with_adapter(
+            get_ingestion_adapter('CLARO', 'CELLULAR_DATA'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
-            
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension == '.csv':
-                # Para CLARO, el separador es ';'
-                df = self._read_csv_robust(file_bytes, delimiter=';')
-            elif file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado: {file_extension}'
-                }
-            
-            self.logger.info(f"Archivo leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
-            
-            is_valid_structure, structure_errors = self._validate_claro_cellular_columns(df)
-            if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_claro_cellular_data(df)
-            cleaned_count = len(df)
-            
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza'
-                }
-            
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza"
-                )
-            
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
-            
-            total_processed = 0
-            total_failed = 0
-            total_duplicated = 0        # NUEVO: contador total de duplicados
-            total_validation_failed = 0 # NUEVO: contador total de errores de validación
-            total_other_errors = 0      # NUEVO: contador total de otros errores
-            chunk_number = 0
-            processing_errors = []
-            
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_claro_cellular_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    total_duplicated += chunk_result.get('records_duplicated', 0)          # NUEVO
-                    total_validation_failed += chunk_result.get('validation_failed', 0)  # NUEVO
-                    total_other_errors += chunk_result.get('other_errors', 0)             # NUEVO
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
-                
-                else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error procesando datos (chunk {chunk_number}): {error_msg}',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed,
-                        'records_duplicated': total_duplicated,
-                        'records_validation_failed': total_validation_failed,
-                        'records_other_errors': total_other_errors
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(f"Demasiados errores ({total_failed}), abortando procesamiento")
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores en el archivo ({total_failed}). Verifique el formato.',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-            
-            # === ETAPA 5: RESULTADO FINAL ===
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Determinar éxito basado en ratio de registros procesados
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
-            
-            # NUEVA LÓGICA CON MÉTRICAS PRECISAS: usar contadores exactos de los chunks
-            effective_failures = total_validation_failed + total_other_errors  # Solo errores reales, no duplicados
-            effective_success_rate = (total_processed / (total_processed + effective_failures)) * 100 if (total_processed + effective_failures) > 0 else 0
-            
-            # NUEVA LÓGICA: Duplicados = comportamiento normal, no error
-            is_successful = (
-                total_processed > 0 and  # Se procesó al menos 1 registro único
-                (effective_failures == 0 or effective_success_rate >= 80.0)  # Sin errores reales O tasa efectiva alta
-            )
-            
-            result = {
-                'success': is_successful,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'records_duplicated': total_duplicated,                    # NUEVO: contador exacto de duplicados
-                'records_validation_failed': total_validation_failed,     # NUEVO: contador exacto de errores de validación
-                'records_other_errors': total_other_errors,               # NUEVO: contador exacto de otros errores
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'details': {
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count,
-                    'chunks_processed': chunk_number,
-                    'processing_errors': processing_errors[:10],  # Limitar errores mostrados
-                    'duplicate_analysis': {
-                        'detected_duplicates': total_duplicated,
-                        'validation_failures': total_validation_failed,
-                        'other_failures': total_other_errors,
-                        'duplicate_percentage': round((total_duplicated / total_failed) * 100, 1) if total_failed > 0 else 0
-                    }
-                }
-            }
-            
-            if not is_successful:
-                # Crear mensaje específico según tipo de problemas
-                duplicate_percentage = (total_duplicated / total_failed) * 100 if total_failed > 0 else 0
-                if duplicate_percentage >= 50.0:
-                    result['error'] = f'Procesamiento incompleto: {total_processed}/{total_processed + total_failed} registros únicos procesados. {total_duplicated} registros duplicados omitidos ({duplicate_percentage:.1f}% del total de fallos). Verifique si el archivo contiene registros válidos adicionales.'
-                else:
-                    result['error'] = f'Tasa de procesamiento baja ({success_rate:.1f}%). Verifique el formato del archivo. Errores: {effective_failures} reales, {total_duplicated} duplicados.'
-            
-            self.logger.info(
-                f"Procesamiento CLARO completado: {total_processed} exitosos, {total_failed} fallidos, {total_duplicated} duplicados ({success_rate:.1f}% éxito)"
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if is_successful else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_processed,
-                        total_failed,
-                        int(processing_time),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento CLARO actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final CLARO: {update_error}")
-            
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Error crítico procesando archivo CLARO: {str(e)}"
-            
-            self.logger.error(error_msg, exc_info=True)
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'processing_time_seconds': round(processing_time, 2),
-                'records_processed': 0,
-                'records_failed': 0
-            }
     
     def process_claro_llamadas_entrantes(self, file_bytes: bytes, file_name: str,
                                        file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
         Procesa un archivo de llamadas entrantes de CLARO.
         
+        El formato se describe en el adaptador CLARO/CALL_DATA_ENTRANTE
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
         Args:
             file_bytes (bytes): Contenido del archivo
             file_name (str): Nombre del archivo
@@ -1123,186 +681,9 @@ class FileProcessorService:
         Returns:
             Dict[str, Any]: Resultado del procesamiento
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento CLARO llamadas entrantes: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
+        return self.process_with_adapter(
+            get_ingestion_adapter('CLARO', 'CALL_DATA_ENTRANTE'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
-            
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension == '.csv':
-                # Para CLARO llamadas entrantes, el separador es ','
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-            elif file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado: {file_extension}'
-                }
-            
-            self.logger.info(f"Archivo leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
-            
-            is_valid_structure, structure_errors = self._validate_claro_call_columns(df)
-            if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_claro_call_data(df, 'ENTRANTE')
-            cleaned_count = len(df)
-            
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza (no se encontraron CDR_ENTRANTE)'
-                }
-            
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza (solo CDR_ENTRANTE procesados)"
-                )
-            
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
-            
-            total_processed = 0
-            total_failed = 0
-            chunk_number = 0
-            processing_errors = []
-            
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_claro_call_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number, 'ENTRANTE'
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
-                
-                else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error procesando datos (chunk {chunk_number}): {error_msg}',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(f"Demasiados errores ({total_failed}), abortando procesamiento")
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores en el archivo ({total_failed}). Verifique el formato.',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-            
-            # === ETAPA 5: RESULTADO FINAL ===
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Determinar éxito basado en ratio de registros procesados
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
-            
-            # NUEVA LÓGICA: Considerar exitoso si se procesó al menos 1 registro (duplicados = normal)
-            is_successful = total_processed > 0
-            
-            result = {
-                'success': is_successful,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'details': {
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count,
-                    'chunks_processed': chunk_number,
-                    'processing_errors': processing_errors[:10],  # Limitar errores mostrados
-                    'file_type': 'CLARO_LLAMADAS_ENTRANTES'
-                }
-            }
-            
-            if not is_successful:
-                result['error'] = f'Tasa de éxito baja ({success_rate:.1f}%). Verifique el formato del archivo.'
-            
-            self.logger.info(
-                f"Procesamiento CLARO llamadas entrantes completado: {total_processed} exitosos, {total_failed} fallidos ({success_rate:.1f}% éxito)"
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if is_successful else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_processed,
-                        total_failed,
-                        int(processing_time),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento CLARO llamadas entrantes actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final CLARO llamadas entrantes: {update_error}")
-            
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Error crítico procesando archivo CLARO llamadas entrantes: {str(e)}"
-            
-            self.logger.error(error_msg, exc_info=True)
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'processing_time_seconds': round(processing_time, 2),
-                'records_processed': 0,
-                'records_failed': 0
-            }
     
     def _validate_movistar_cellular_columns(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
@@ -1497,187 +878,68 @@ class FileProcessorService:
         self.logger.debug(f"Datos de llamadas MOVISTAR limpiados: {len(clean_df)} filas válidas")
         return clean_df
 
-    def _validate_movistar_cellular_record(self, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def _clean_movistar_call_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Limpia los datos de llamadas de MOVISTAR y agrega cellid_decimal y
+        lac_decimal extraídos de celda_origen en una sola pasada vectorizada.
+        """
+        clean_df = self._clean_movistar_call_data(df)
+        if 'celda_origen' in clean_df.columns:
+            cell_data = extract_cellid_lac_vectorized(clean_df['celda_origen'], "MOVISTAR")
+            clean_df['cellid_decimal'] = cell_data['cellid_decimal'].to_numpy()
+            clean_df['lac_decimal'] = cell_data['lac_decimal'].to_numpy()
+        return clean_df
+
+    def _movistar_cellular_record_errors(self, df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
         """
-        Valida un registro individual de datos celulares de MOVISTAR.
+        Validación vectorizada de los registros de datos celulares de MOVISTAR.
         
         Args:
-            record (Dict[str, Any]): Registro a validar
+            df (pd.DataFrame): DataFrame limpio
             
         Returns:
-            Tuple[bool, List[str]]: (Es válido, Lista de errores)
-        """
-        errors = []
-        
-        # Validar número telefónico
-        numero = str(record.get('numero_que_navega', '')).strip()
-        if not numero:
-            errors.append("Número que navega vacío")
-        elif len(numero) < 10:
-            errors.append(f"Número que navega muy corto: {numero}")
-        elif len(numero) > 15:
-            errors.append(f"Número que navega muy largo: {numero}")
-        elif not numero.isdigit():
-            errors.append(f"Número que navega contiene caracteres no numéricos: {numero}")
-        
-        # Validar fecha inicio sesión (formato YYYYMMDDHHMMSS)
-        fecha_inicio = str(record.get('fecha_hora_inicio_sesion', '')).strip()
-        if not fecha_inicio:
-            errors.append("Fecha hora inicio sesión vacía")
-        elif len(fecha_inicio) != 14:
-            errors.append(f"Formato de fecha inicio incorrecto (esperado YYYYMMDDHHMMSS): {fecha_inicio}")
-        elif not fecha_inicio.isdigit():
-            errors.append(f"Fecha inicio contiene caracteres no numéricos: {fecha_inicio}")
-        else:
-            # Validar componentes de fecha
-            try:
-                year = int(fecha_inicio[:4])
-                month = int(fecha_inicio[4:6])
-                day = int(fecha_inicio[6:8])
-                hour = int(fecha_inicio[8:10])
-                minute = int(fecha_inicio[10:12])
-                second = int(fecha_inicio[12:14])
-                
-                if not (2020 <= year <= 2030):
-                    errors.append(f"Año fuera de rango válido: {year}")
-                if not (1 <= month <= 12):
-                    errors.append(f"Mes inválido: {month}")
-                if not (1 <= day <= 31):
-                    errors.append(f"Día inválido: {day}")
-                if not (0 <= hour <= 23):
-                    errors.append(f"Hora inválida: {hour}")
-                if not (0 <= minute <= 59):
-                    errors.append(f"Minuto inválido: {minute}")
-                if not (0 <= second <= 59):
-                    errors.append(f"Segundo inválido: {second}")
-                    
-            except ValueError:
-                errors.append(f"Error parseando fecha inicio: {fecha_inicio}")
-        
-        # Validar celda
-        celda = str(record.get('celda', '')).strip()
-        if not celda:
-            errors.append("Celda vacía")
-        # Las celdas MOVISTAR pueden ser alfanuméricas (ej: "000073")
-        
-        # Validar tráfico (deben ser numéricos)
-        trafico_subida = record.get('trafico_de_subida', 0)
-        try:
-            trafico_subida_int = int(trafico_subida)
-            if trafico_subida_int < 0:
-                errors.append(f"Tráfico de subida no puede ser negativo: {trafico_subida_int}")
-        except (ValueError, TypeError):
-            errors.append(f"Tráfico de subida debe ser numérico: {trafico_subida}")
-        
-        trafico_bajada = record.get('trafico_de_bajada', 0)
-        try:
-            trafico_bajada_int = int(trafico_bajada)
-            if trafico_bajada_int < 0:
-                errors.append(f"Tráfico de bajada no puede ser negativo: {trafico_bajada_int}")
-        except (ValueError, TypeError):
-            errors.append(f"Tráfico de bajada debe ser numérico: {trafico_bajada}")
-        
-        # Validar duración
-        duracion = record.get('duracion', 0)
-        try:
-            duracion_int = int(duracion)
-            if duracion_int < 0:
-                errors.append(f"Duración no puede ser negativa: {duracion_int}")
-        except (ValueError, TypeError):
-            errors.append(f"Duración debe ser numérica: {duracion}")
-        
-        return len(errors) == 0, errors
+            List[Tuple[str, pd.Series]]: (mensaje, máscara de registros inválidos)
+        """
+        celda = df['celda'].astype(str).str.strip()
+        return (
+            self._digit_field_errors(df['numero_que_navega'], 'Número que navega', 10, 15) +
+            self._compact_date_errors(df['fecha_hora_inicio_sesion'], 'Fecha hora inicio sesión') +
+            [
+                # Las celdas MOVISTAR pueden ser alfanuméricas (ej: "000073")
+                ("Celda vacía", celda == ''),
+                ("Tráfico de subida no puede ser negativo", df['trafico_de_subida'] < 0),
+                ("Tráfico de bajada no puede ser negativo", df['trafico_de_bajada'] < 0),
+                ("Duración no puede ser negativa", df['duracion'] < 0)
+            ]
+        )
 
-    def _validate_movistar_call_record(self, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def _movistar_call_record_errors(self, df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
         """
-        Valida un registro individual de datos de llamadas de MOVISTAR.
+        Validación vectorizada de los registros de llamadas de MOVISTAR.
+        
+        Las celdas no se validan: MOVISTAR usa formatos alfanuméricos (ej: "07F083-05").
         
         Args:
-            record (Dict[str, Any]): Registro a validar
+            df (pd.DataFrame): DataFrame limpio
             
         Returns:
-            Tuple[bool, List[str]]: (Es válido, Lista de errores)
+            List[Tuple[str, pd.Series]]: (mensaje, máscara de registros inválidos)
         """
-        errors = []
-        
-        # Validar número que contesta
-        numero_contesta = str(record.get('numero_que_contesta', '')).strip()
-        if not numero_contesta:
-            errors.append("Número que contesta vacío")
-        elif len(numero_contesta) < 10:
-            errors.append(f"Número que contesta muy corto: {numero_contesta}")
-        elif len(numero_contesta) > 15:
-            errors.append(f"Número que contesta muy largo: {numero_contesta}")
-        elif not numero_contesta.isdigit():
-            errors.append(f"Número que contesta contiene caracteres no numéricos: {numero_contesta}")
-        
-        # Validar número que marca
-        numero_marca = str(record.get('numero_que_marca', '')).strip()
-        if not numero_marca:
-            errors.append("Número que marca vacío")
-        elif len(numero_marca) < 10:
-            errors.append(f"Número que marca muy corto: {numero_marca}")
-        elif len(numero_marca) > 15:
-            errors.append(f"Número que marca muy largo: {numero_marca}")
-        elif not numero_marca.isdigit():
-            errors.append(f"Número que marca contiene caracteres no numéricos: {numero_marca}")
-        
-        # Validar fecha inicio llamada (formato YYYYMMDDHHMMSS)
-        fecha_inicio = str(record.get('fecha_hora_inicio_llamada', '')).strip()
-        if not fecha_inicio:
-            errors.append("Fecha hora inicio llamada vacía")
-        elif len(fecha_inicio) != 14:
-            errors.append(f"Formato de fecha inicio incorrecto (esperado YYYYMMDDHHMMSS): {fecha_inicio}")
-        elif not fecha_inicio.isdigit():
-            errors.append(f"Fecha inicio contiene caracteres no numéricos: {fecha_inicio}")
-        else:
-            # Validar componentes de fecha
-            try:
-                year = int(fecha_inicio[:4])
-                month = int(fecha_inicio[4:6])
-                day = int(fecha_inicio[6:8])
-                hour = int(fecha_inicio[8:10])
-                minute = int(fecha_inicio[10:12])
-                second = int(fecha_inicio[12:14])
-                
-                if not (2020 <= year <= 2030):
-                    errors.append(f"Año fuera de rango válido: {year}")
-                if not (1 <= month <= 12):
-                    errors.append(f"Mes inválido: {month}")
-                if not (1 <= day <= 31):
-                    errors.append(f"Día inválido: {day}")
-                if not (0 <= hour <= 23):
-                    errors.append(f"Hora inválida: {hour}")
-                if not (0 <= minute <= 59):
-                    errors.append(f"Minuto inválido: {minute}")
-                if not (0 <= second <= 59):
-                    errors.append(f"Segundo inválido: {second}")
-                    
-            except ValueError:
-                errors.append(f"Error parseando fecha inicio llamada: {fecha_inicio}")
-        
-        # Validar duración
-        duracion = record.get('duracion', 0)
-        try:
-            duracion_int = int(duracion)
-            if duracion_int < 0:
-                errors.append(f"Duración no puede ser negativa: {duracion_int}")
-        except (ValueError, TypeError):
-            errors.append(f"Duración debe ser numérica: {duracion}")
-        
-        # Validar celdas (pueden estar vacías en algunos casos)
-        celda_origen = str(record.get('celda_origen', '')).strip()
-        if celda_origen and celda_origen != 'nan':
-            # Las celdas MOVISTAR pueden ser alfanuméricas (ej: "07F083-05")
-            pass  # Acepta cualquier formato para celdas MOVISTAR
-        
-        return len(errors) == 0, errors
+        return (
+            self._digit_field_errors(df['numero_que_contesta'], 'Número que contesta', 10, 15) +
+            self._digit_field_errors(df['numero_que_marca'], 'Número que marca', 10, 15) +
+            self._compact_date_errors(df['fecha_hora_inicio_llamada'], 'Fecha hora inicio llamada') +
+            [("Duración no puede ser negativa", df['duracion'] < 0)]
+        )
 
     def process_claro_llamadas_salientes(self, file_bytes: bytes, file_name: str,
                                        file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
         Procesa un archivo de llamadas salientes de CLARO.
         
+        El formato se describe en el adaptador CLARO/CALL_DATA_SALIENTE
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
         Args:
             file_bytes (bytes): Contenido del archivo
             file_name (str): Nombre del archivo
@@ -1687,401 +949,17 @@ class FileProcessorService:
         Returns:
             Dict[str, Any]: Resultado del procesamiento
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento CLARO llamadas salientes: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
+        return self.process_with_adapter(
+            get_ingestion_adapter('CLARO', 'CALL_DATA_SALIENTE'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
-            
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension == '.csv':
-                # Para CLARO llamadas salientes, el separador es ','
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-            elif file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado: {file_extension}'
-                }
-            
-            self.logger.info(f"Archivo leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
-            
-            is_valid_structure, structure_errors = self._validate_claro_call_columns(df)
-            if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_claro_call_data(df, 'SALIENTE')
-            cleaned_count = len(df)
-            
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza (no se encontraron CDR_SALIENTE)'
-                }
-            
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza (solo CDR_SALIENTE procesados)"
-                )
-            
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
-            
-            total_processed = 0
-            total_failed = 0
-            chunk_number = 0
-            processing_errors = []
-            
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_claro_call_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number, 'SALIENTE'
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
-
-                else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error procesando datos (chunk {chunk_number}): {error_msg}',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(f"Demasiados errores ({total_failed}), abortando procesamiento")
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores en el archivo ({total_failed}). Verifique el formato.',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-            
-            # === ETAPA 5: RESULTADO FINAL ===
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Determinar éxito basado en ratio de registros procesados
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
-            
-            # NUEVA LÓGICA: Considerar exitoso si se procesó al menos 1 registro (duplicados = normal)
-            is_successful = total_processed > 0
-            
-            result = {
-                'success': is_successful,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'details': {
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count,
-                    'chunks_processed': chunk_number,
-                    'processing_errors': processing_errors[:10],  # Limitar errores mostrados
-                    'file_type': 'CLARO_LLAMADAS_SALIENTES'
-                }
-            }
-            
-            if not is_successful:
-                result['error'] = f'Tasa de éxito baja ({success_rate:.1f}%). Verifique el formato del archivo.'
-            
-            self.logger.info(
-                f"Procesamiento CLARO llamadas salientes completado: {total_processed} exitosos, {total_failed} fallidos ({success_rate:.1f}% éxito)"
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if is_successful else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_processed,
-                        total_failed,
-                        int(processing_time),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento CLARO llamadas salientes actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final CLARO llamadas salientes: {update_error}")
-            
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Error crítico procesando archivo CLARO llamadas salientes: {str(e)}"
-            
-            self.logger.error(error_msg, exc_info=True)
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'processing_time_seconds': round(processing_time, 2),
-                'records_processed': 0,
-                'records_failed': 0
-            }
 
     def process_movistar_datos_por_celda(self, file_bytes: bytes, file_name: str,
                                        file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
         Procesa un archivo de datos por celda de MOVISTAR.
         
-        Args:
-            file_bytes (bytes): Contenido del archivo
-            file_name (str): Nombre del archivo
-            file_upload_id (str): ID único del archivo
-            mission_id (str): ID de la misión
-            
-        Returns:
-            Dict[str, Any]: Resultado del procesamiento
-        """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento MOVISTAR datos por celda: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
-        )
-        
-        try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
-            
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension == '.csv':
-                # Para MOVISTAR, usar separador coma
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-            elif file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado: {file_extension}'
-                }
-            
-            self.logger.info(f"Archivo leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
-            
-            is_valid_structure, structure_errors = self._validate_movistar_cellular_columns(df)
-            if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_movistar_cellular_data(df)
-            cleaned_count = len(df)
-            
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza'
-                }
-            
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza"
-                )
-            
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
-            
-            total_processed = 0
-            total_failed = 0
-            total_duplicated = 0      # NUEVO: contador total de duplicados
-            total_validation_failed = 0  # NUEVO: contador total de errores de validación
-            total_other_errors = 0    # NUEVO: contador total de otros errores
-            chunk_number = 0
-            processing_errors = []
-            
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_movistar_cellular_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    total_duplicated += chunk_result.get('records_duplicated', 0)      # NUEVO
-                    total_validation_failed += chunk_result.get('validation_failed', 0)  # NUEVO
-                    total_other_errors += chunk_result.get('other_errors', 0)         # NUEVO
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
-                
-                else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error procesando datos (chunk {chunk_number}): {error_msg}',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(f"Demasiados errores ({total_failed}), abortando procesamiento")
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores en el archivo ({total_failed}). Verifique el formato.',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-            
-            # === ETAPA 5: RESULTADO FINAL ===
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Determinar éxito basado en ratio de registros procesados
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
-            
-            # NUEVA LÓGICA: Considerar exitoso si se procesó al menos 1 registro (duplicados = normal)
-            is_successful = total_processed > 0
-            
-            result = {
-                'success': is_successful,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'records_duplicated': total_duplicated,      # NUEVO: incluir duplicados
-                'records_validation_failed': total_validation_failed,  # NUEVO
-                'records_other_errors': total_other_errors,  # NUEVO
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'details': {
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count,
-                    'chunks_processed': chunk_number,
-                    'processing_errors': processing_errors[:10],  # Limitar errores mostrados
-                    'file_type': 'MOVISTAR_DATOS_POR_CELDA',
-                    'duplicate_analysis': {  # NUEVO: análisis detallado de duplicados
-                        'detected_duplicates': total_duplicated,
-                        'validation_failures': total_validation_failed,
-                        'other_failures': total_other_errors,
-                        'duplicate_percentage': round((total_duplicated / original_count) * 100, 1) if original_count > 0 else 0
-                    }
-                }
-            }
-            
-            if not is_successful:
-                result['error'] = f'Tasa de éxito baja ({success_rate:.1f}%). Verifique el formato del archivo.'
-            
-            self.logger.info(
-                f"Procesamiento MOVISTAR datos por celda completado: {total_processed} exitosos, {total_failed} fallidos, {total_duplicated} duplicados ({success_rate:.1f}% éxito)"
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if is_successful else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_processed,
-                        total_failed,
-                        int(processing_time),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento MOVISTAR datos por celda actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final MOVISTAR datos por celda: {update_error}")
-            
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Error crítico procesando archivo MOVISTAR datos por celda: {str(e)}"
-            
-            self.logger.error(error_msg, exc_info=True)
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'processing_time_seconds': round(processing_time, 2),
-                'records_processed': 0,
-                'records_failed': 0
-            }
-
-    def process_movistar_llamadas_salientes(self, file_bytes: bytes, file_name: str,
-                                          file_upload_id: str, mission_id: str) -> Dict[str, Any]:
-        """
-        Procesa un archivo de llamadas salientes de MOVISTAR.
+        El formato se describe en el adaptador MOVISTAR/CELLULAR_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
         
         Args:
             file_bytes (bytes): Contenido del archivo
@@ -2092,1023 +970,161 @@ class FileProcessorService:
         Returns:
             Dict[str, Any]: Resultado del procesamiento
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento MOVISTAR llamadas salientes: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
-        )
-        
-        try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
-            
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension == '.csv':
-                # Para MOVISTAR, usar separador coma
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-            elif file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado: {file_extension}'
-                }
-            
-            self.logger.info(f"Archivo leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
-            
-            is_valid_structure, structure_errors = self._validate_movistar_call_columns(df)
-            if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_movistar_call_data(df)
-            cleaned_count = len(df)
-            
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza'
-                }
-            
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza"
-                )
-            
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
-            
-            total_processed = 0
-            total_failed = 0
-            chunk_number = 0
-            processing_errors = []
-            
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_movistar_call_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
-                
-                else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error procesando datos (chunk {chunk_number}): {error_msg}',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(f"Demasiados errores ({total_failed}), abortando procesamiento")
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores en el archivo ({total_failed}). Verifique el formato.',
-                        'processedRecords': total_processed,
-                        'records_failed': total_failed
-                    }
-            
-            # === ETAPA 5: RESULTADO FINAL ===
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Determinar éxito basado en ratio de registros procesados
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
-            
-            # NUEVA LÓGICA: Considerar exitoso si se procesó al menos 1 registro (duplicados = normal)
-            is_successful = total_processed > 0
-            
-            result = {
-                'success': is_successful,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'details': {
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count,
-                    'chunks_processed': chunk_number,
-                    'processing_errors': processing_errors[:10],  # Limitar errores mostrados
-                    'file_type': 'MOVISTAR_LLAMADAS_SALIENTES'
-                }
-            }
-            
-            if not is_successful:
-                result['error'] = f'Tasa de éxito baja ({success_rate:.1f}%). Verifique el formato del archivo.'
-            
-            self.logger.info(
-                f"Procesamiento MOVISTAR llamadas salientes completado: {total_processed} exitosos, {total_failed} fallidos ({success_rate:.1f}% éxito)"
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if is_successful else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_processed,
-                        total_failed,
-                        int(processing_time),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento MOVISTAR llamadas salientes actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final MOVISTAR llamadas salientes: {update_error}")
-            
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Error crítico procesando archivo MOVISTAR llamadas salientes: {str(e)}"
-            
-            self.logger.error(error_msg, exc_info=True)
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'processing_time_seconds': round(processing_time, 2),
-                'records_processed': 0,
-                'records_failed': 0
-            }
-
-    def _process_movistar_cellular_chunk(self, chunk_df: pd.DataFrame, file_upload_id: str, 
-                                       mission_id: str, chunk_number: int) -> Dict[str, Any]:
-        """
-        Procesa un chunk de datos celulares de MOVISTAR.
-        
-        Args:
-            chunk_df (pd.DataFrame): Chunk de datos a procesar
-            file_upload_id (str): ID del archivo
-            mission_id (str): ID de la misión
-            chunk_number (int): Número del chunk para logging
-            
-        Returns:
-            Dict[str, Any]: Resultado del procesamiento del chunk
-        """
-        records_processed = 0
-        records_failed = 0
-        records_duplicated = 0  # NUEVO: contador de duplicados
-        validation_failed = 0   # NUEVO: contador de errores de validación
-        other_errors = 0        # NUEVO: contador de otros errores
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in chunk_df.iterrows():
-                    try:
-                        # Convertir fila a diccionario
-                        record = row.to_dict()
-                        
-                        # Validar registro
-                        is_valid, errors = self._validate_movistar_cellular_record(record)
-                        if not is_valid:
-                            # CAMBIO: errores de validación se clasifican por separado
-                            validation_failed += 1
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': errors,
-                                'type': 'validation',
-                                'record': record
-                            })
-                            
-                            if len(failed_records) > 10:  # Limitar detalle de errores
-                                break
-                            continue
-                        
-                        # Normalizar datos
-                        normalized_data = self.data_normalizer.normalize_movistar_cellular_data(
-                            record, file_upload_id, mission_id
-                        )
-                        
-                        if not normalized_data:
-                            validation_failed += 1
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['Error en normalización'],
-                                'type': 'normalization',
-                                'record': record
-                            })
-                            continue
-                        
-                        # Insertar en base de datos
-                        cursor.execute("""
-                            INSERT INTO operator_cellular_data (
-                                file_upload_id, mission_id, operator, numero_telefono,
-                                fecha_hora_inicio, celda_id, lac_tac, trafico_subida_bytes,
-                                trafico_bajada_bytes, tecnologia, tipo_conexion, record_hash
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            normalized_data['operator'],
-                            normalized_data['numero_telefono'],
-                            normalized_data['fecha_hora_inicio'],
-                            normalized_data['celda_id'],
-                            normalized_data['lac_tac'],
-                            normalized_data['trafico_subida_bytes'],
-                            normalized_data['trafico_bajada_bytes'],
-                            normalized_data['tecnologia'],
-                            normalized_data['tipo_conexion'],
-                            normalized_data['record_hash']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        error_str = str(e)
-                        
-                        # NUEVO: Distinguir tipos de errores por mensaje
-                        if "UNIQUE constraint failed" in error_str:
-                            # Es un duplicado legítimo - NO cuenta como error para el límite
-                            records_duplicated += 1
-                            error_type = 'duplicate'
-                            self.logger.debug(f"Registro duplicado omitido MOVISTAR {index + 1} en chunk {chunk_number}: {error_str}")
-                        else:
-                            # Es un error real - SÍ cuenta para el límite de errores
-                            other_errors += 1
-                            records_failed += 1  # SOLO errores reales incrementan records_failed
-                            error_type = 'database'
-                            self.logger.error(f"Error procesando registro MOVISTAR {index + 1} en chunk {chunk_number}: {e}")
-                        
-                        # Agregar a la lista de fallos (para debugging, pero no afecta límite de errores)
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {error_str}'],
-                            'type': error_type,
-                            'record': record if 'record' in locals() else {}
-                        })
-                
-                # Confirmar transacción del chunk
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk MOVISTAR {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos ({records_duplicated} duplicados, {validation_failed} validación, {other_errors} otros)"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'records_duplicated': records_duplicated,      # NUEVO
-                    'validation_failed': validation_failed,       # NUEVO
-                    'other_errors': other_errors,                 # NUEVO
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk MOVISTAR {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed,
-                'records_duplicated': records_duplicated,
-                'validation_failed': validation_failed,
-                'other_errors': other_errors
-            }
-
-    def _process_movistar_call_chunk(self, chunk_df: pd.DataFrame, file_upload_id: str, 
-                                   mission_id: str, chunk_number: int) -> Dict[str, Any]:
-        """
-        Procesa un chunk de datos de llamadas de MOVISTAR.
-        
-        Args:
-            chunk_df (pd.DataFrame): Chunk de datos a procesar
-            file_upload_id (str): ID del archivo
-            mission_id (str): ID de la misión
-            chunk_number (int): Número del chunk para logging
-            
-        Returns:
-            Dict[str, Any]: Resultado del procesamiento del chunk
-        """
-        records_processed = 0
-        records_failed = 0
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in chunk_df.iterrows():
-                    try:
-                        # Convertir fila a diccionario
-                        record = row.to_dict()
-                        
-                        # Validar registro
-                        is_valid, errors = self._validate_movistar_call_record(record)
-                        if not is_valid:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': errors,
-                                'record': record
-                            })
-                            
-                            if len(failed_records) > 10:  # Limitar detalle de errores
-                                break
-                            continue
-                        
-                        # Normalizar datos de llamadas MOVISTAR
-                        normalized_data = self.data_normalizer.normalize_movistar_call_data_salientes(
-                            record, file_upload_id, mission_id
-                        )
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['Error en normalización'],
-                                'record': record
-                            })
-                            continue
-                        
-                        # Extraer cellid_decimal y lac_decimal desde celda_origen
-                        from utils.cell_id_converter import extract_cellid_lac_from_celda_origen
-                        cell_data = extract_cellid_lac_from_celda_origen(normalized_data.get('celda_origen', ''))
-                        normalized_data['cellid_decimal'] = cell_data['cellid_decimal']
-                        normalized_data['lac_decimal'] = cell_data['lac_decimal']
-                        
-                        # Insertar en base de datos
-                        cursor.execute("""
-                            INSERT INTO operator_call_data (
-                                file_upload_id, mission_id, operator, tipo_llamada,
-                                numero_origen, numero_destino, numero_objetivo,
-                                fecha_hora_llamada, duracion_segundos,
-                                celda_origen, celda_destino, celda_objetivo,
-                                latitud_origen, longitud_origen, latitud_destino, longitud_destino,
-                                tecnologia, tipo_trafico, estado_llamada,
-                                operator_specific_data, record_hash,
-                                cellid_decimal, lac_decimal
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            normalized_data['operator'],
-                            normalized_data['tipo_llamada'],
-                            normalized_data['numero_origen'],
-                            normalized_data['numero_destino'],
-                            normalized_data['numero_objetivo'],
-                            normalized_data['fecha_hora_llamada'],
-                            normalized_data['duracion_segundos'],
-                            normalized_data['celda_origen'],
-                            normalized_data['celda_destino'],
-                            normalized_data['celda_objetivo'],
-                            normalized_data['latitud_origen'],
-                            normalized_data['longitud_origen'],
-                            normalized_data['latitud_destino'],
-                            normalized_data['longitud_destino'],
-                            normalized_data['tecnologia'],
-                            normalized_data['tipo_trafico'],
-                            normalized_data['estado_llamada'],
-                            normalized_data['operator_specific_data'],
-                            normalized_data['record_hash'],
-                            normalized_data['cellid_decimal'],
-                            normalized_data['lac_decimal']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        records_failed += 1
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {str(e)}'],
-                            'record': record if 'record' in locals() else {}
-                        })
-                        
-                        self.logger.error(
-                            f"Error procesando registro MOVISTAR {index + 1} en chunk {chunk_number}: {e}"
-                        )
-                
-                # Confirmar transacción del chunk
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk llamadas MOVISTAR {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk llamadas MOVISTAR {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed
-            }
-
-    # ==============================================================================
-    # PROCESAMIENTO ESPECÍFICO PARA TIGO
-    # ==============================================================================
-
-    def process_tigo_llamadas_unificadas(self, file_bytes: bytes, file_name: str,
-                                        file_upload_id: str, mission_id: str) -> Dict[str, Any]:
-        """
-        Procesa un archivo de llamadas unificadas de TIGO (entrantes y salientes en un archivo).
-        
-        TIGO diferencia entre llamadas entrantes y salientes usando el campo DIRECCION:
-        - 'O' = SALIENTE 
-        - 'I' = ENTRANTE
-        
-        Args:
-            file_bytes (bytes): Contenido del archivo TIGO
-            file_name (str): Nombre del archivo original
-            file_upload_id (str): ID único del archivo cargado
-            mission_id (str): ID de la misión asociada
-            
-        Returns:
-            Dict[str, Any]: Resultado del procesamiento con estadísticas
-        """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento TIGO llamadas unificadas: {file_name}",
-            extra={'file_upload_id': file_upload_id, 'mission_id': mission_id}
+        return self.process_with_adapter(
+            get_ingestion_adapter('MOVISTAR', 'CELLULAR_DATA'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === CREAR REGISTRO EN OPERATOR_DATA_SHEETS PRIMERO ===
-            # Esto es CRÍTICO para que no falle la foreign key constraint
-            
-            import hashlib
-            file_checksum = hashlib.sha256(file_bytes).hexdigest()
-            
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Nota: La verificación de duplicados se maneja en operator_data_service.py
-                # Si llegamos aquí, significa que ya se validó que no hay duplicados
-                # o se limpiaron los registros fallidos anteriores
-                
-                # Nota: El registro en operator_data_sheets ya fue creado por operator_data_service.py
-                # Solo necesitamos usar el file_upload_id proporcionado
-                
-                self.logger.info(f"Procesando archivo TIGO con ID existente: {file_upload_id}")
-            
-            # === LECTURA DEL ARCHIVO ===
-            
-            # Detectar encoding
-            encoding = self._detect_encoding(file_bytes)
-            
-            # Determinar formato y leer datos
-            if file_name.lower().endswith('.xlsx'):
-                # Manejar Excel potencialmente multi-pestaña
-                dfs = []
-                excel_buffer = io.BytesIO(file_bytes)
-                
-                try:
-                    # Leer todas las pestañas del archivo Excel
-                    excel_file = pd.ExcelFile(excel_buffer)
-                    sheet_names = excel_file.sheet_names
-                    
-                    self.logger.info(f"Archivo Excel TIGO con {len(sheet_names)} pestañas: {sheet_names}")
-                    
-                    # Estadísticas detalladas por hoja
-                    sheet_stats = {
-                        'total_sheets': len(sheet_names),
-                        'successful_sheets': 0,
-                        'failed_sheets': 0,
-                        'empty_sheets': 0,
-                        'sheet_details': {},
-                        'failed_sheet_errors': {}
-                    }
-                    
-                    for sheet_index, sheet_name in enumerate(sheet_names, 1):
-                        try:
-                            self.logger.info(f"Procesando hoja {sheet_index}/{len(sheet_names)}: '{sheet_name}'")
-                            
-                            df_sheet = pd.read_excel(excel_buffer, sheet_name=sheet_name)
-                            
-                            if len(df_sheet) == 0:
-                                sheet_stats['empty_sheets'] += 1
-                                sheet_stats['sheet_details'][sheet_name] = {
-                                    'status': 'empty',
-                                    'records': 0,
-                                    'columns': 0,
-                                    'error': None
-                                }
-                                self.logger.warning(f"Hoja '{sheet_name}' está vacía, omitiendo")
-                                continue
-                            
-                            # Agregar metadatos de origen
-                            df_sheet['_source_sheet'] = sheet_name
-                            df_sheet['_sheet_index'] = sheet_index
-                            df_sheet['_total_sheets'] = len(sheet_names)
-                            
-                            dfs.append(df_sheet)
-                            sheet_stats['successful_sheets'] += 1
-                            sheet_stats['sheet_details'][sheet_name] = {
-                                'status': 'success',
-                                'records': len(df_sheet),
-                                'columns': len(df_sheet.columns),
-                                'error': None
-                            }
-                            
-                            self.logger.info(f"Hoja '{sheet_name}' procesada exitosamente: {len(df_sheet)} registros, {len(df_sheet.columns)} columnas")
-                            
-                        except Exception as e:
-                            sheet_stats['failed_sheets'] += 1
-                            sheet_stats['failed_sheet_errors'][sheet_name] = str(e)
-                            sheet_stats['sheet_details'][sheet_name] = {
-                                'status': 'failed',
-                                'records': 0,
-                                'columns': 0,
-                                'error': str(e)
-                            }
-                            
-                            self.logger.error(f"Error procesando hoja '{sheet_name}' ({sheet_index}/{len(sheet_names)}): {e}", exc_info=True)
-                            # Continuar con las demás hojas
-                            continue
-                    
-                    # Reporte final de hojas procesadas
-                    self.logger.info(
-                        f"Resumen procesamiento hojas TIGO: "
-                        f"{sheet_stats['successful_sheets']} exitosas, "
-                        f"{sheet_stats['failed_sheets']} fallidas, "
-                        f"{sheet_stats['empty_sheets']} vacías de {sheet_stats['total_sheets']} total"
-                    )
-                    
-                    if not dfs:
-                        error_details = []
-                        if sheet_stats['failed_sheets'] > 0:
-                            error_details.append(f"{sheet_stats['failed_sheets']} hojas fallaron")
-                        if sheet_stats['empty_sheets'] > 0:
-                            error_details.append(f"{sheet_stats['empty_sheets']} hojas estaban vacías")
-                        
-                        error_msg = f"No se pudieron procesar datos de ninguna hoja del archivo Excel. {'; '.join(error_details)}"
-                        
-                        return {
-                            'success': False,
-                            'error': error_msg,
-                            'records_processed': 0,
-                            'records_failed': 0,
-                            'sheet_processing_details': sheet_stats
-                        }
-                    
-                    # Combinar todas las pestañas válidas
-                    df = pd.concat(dfs, ignore_index=True)
-                    
-                    self.logger.info(
-                        f"Combinadas {len(dfs)} pestañas válidas en {len(df)} registros totales. "
-                        f"Hojas procesadas: {[name for name, details in sheet_stats['sheet_details'].items() if details['status'] == 'success']}"
-                    )
-                    
-                except Exception as e:
-                    return {
-                        'success': False,
-                        'error': f'Error leyendo archivo Excel TIGO: {str(e)}',
-                        'records_processed': 0,
-                        'records_failed': 0
-                    }
-            
-            elif file_name.lower().endswith('.csv'):
-                # Leer CSV
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-                
-            else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado para TIGO: {file_name}',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === VALIDACIÓN INICIAL ===
-            
-            if df is None or len(df) == 0:
-                return {
-                    'success': False,
-                    'error': 'El archivo TIGO está vacío o no se pudo leer',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            self.logger.info(f"Archivo TIGO leído: {len(df)} registros, {len(df.columns)} columnas")
-            
-            # Mapear columnas TIGO a nombres estándar
-            tigo_column_mapping = {
-                'TIPO_DE_LLAMADA': 'tipo_de_llamada',
-                'NUMERO A': 'numero_a',
-                'NUMERO MARCADO': 'numero_marcado',
-                'TRCSEXTRACODEC': 'trcsextracodec',
-                'DIRECCION: O SALIENTE, I ENTRANTE': 'direccion',
-                'DURACION TOTAL seg': 'duracion_total_seg',
-                'FECHA Y HORA ORIGEN': 'fecha_hora_origen',
-                'CELDA_ORIGEN_TRUNCADA': 'celda_origen_truncada',
-                'TECH': 'tecnologia',
-                'DIRECCION': 'direccion_fisica',
-                'CITY_DS': 'ciudad',
-                'DEPARTMENT_DS': 'departamento',
-                'AZIMUTH': 'azimuth',
-                'ALTURA': 'altura',
-                'POTENCIA': 'potencia',
-                'LONGITUDE': 'longitud',
-                'LATITUDE': 'latitud',
-                'TIPO_COBERTURA': 'tipo_cobertura',
-                'TIPO_ESTRUCTURA': 'tipo_estructura',
-                'OPERADOR': 'operador',
-                'CELLID_NVAL': 'cellid_nval'
-            }
-            
-            # Normalizar nombres de columnas
-            df_normalized = df.copy()
-            df_normalized.columns = df_normalized.columns.str.strip()
-            
-            # Mapear columnas TIGO
-            columns_to_rename = {}
-            for original_col in df_normalized.columns:
-                if original_col in tigo_column_mapping:
-                    columns_to_rename[original_col] = tigo_column_mapping[original_col]
-            
-            df_normalized = df_normalized.rename(columns=columns_to_rename)
-            
-            # Verificar columnas esenciales
-            required_columns = ['tipo_de_llamada', 'numero_a', 'direccion', 'fecha_hora_origen']
-            missing_columns = [col for col in required_columns if col not in df_normalized.columns]
-            
-            if missing_columns:
-                return {
-                    'success': False,
-                    'error': f'Archivo TIGO falta columnas requeridas: {", ".join(missing_columns)}',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === LIMPIEZA DE DATOS ===
-            
-            # Limpiar valores nulos en campos críticos
-            df_clean = df_normalized.dropna(subset=['numero_a', 'direccion']).copy()
-            
-            # Convertir coordenadas formato TIGO (comas a puntos decimales)
-            for coord_col in ['latitud', 'longitud']:
-                if coord_col in df_clean.columns:
-                    df_clean[coord_col] = (df_clean[coord_col]
-                                          .astype(str)
-                                          .str.replace(',', '.')
-                                          .str.strip('"\'')
-                                          .replace(['', 'nan', 'None'], None))
-                    
-                    # Convertir a float donde sea posible
-                    df_clean[coord_col] = pd.to_numeric(df_clean[coord_col], errors='coerce')
-            
-            # Convertir potencia (formato con comas)
-            if 'potencia' in df_clean.columns:
-                df_clean['potencia'] = (df_clean['potencia']
-                                       .astype(str)
-                                       .str.replace(',', '.')
-                                       .str.strip('"\''))
-                df_clean['potencia'] = pd.to_numeric(df_clean['potencia'], errors='coerce')
-            
-            # Convertir duración a numérico
-            if 'duracion_total_seg' in df_clean.columns:
-                df_clean['duracion_total_seg'] = pd.to_numeric(df_clean['duracion_total_seg'], errors='coerce').fillna(0)
-            
-            self.logger.info(f"Datos TIGO limpiados: {len(df_clean)} registros válidos de {len(df)} originales")
-            
-            # === SEPARACIÓN POR DIRECCIÓN ===
-            
-            # Separar registros por dirección (O/I)
-            df_entrantes = df_clean[df_clean['direccion'].str.upper().isin(['I', 'ENTRANTE'])].copy()
-            df_salientes = df_clean[df_clean['direccion'].str.upper().isin(['O', 'SALIENTE'])].copy()
-            
-            self.logger.info(f"Separación TIGO: {len(df_entrantes)} entrantes, {len(df_salientes)} salientes")
-            
-            # === PROCESAMIENTO EN CHUNKS ===
-            
-            total_records_processed = 0
-            total_records_failed = 0
-            all_failed_records = []
-            
-            # Procesar llamadas entrantes
-            if len(df_entrantes) > 0:
-                for chunk_df in self._chunk_dataframe(df_entrantes, self.CHUNK_SIZE):
-                    chunk_result = self._process_tigo_chunk(
-                        chunk_df, 'ENTRANTE', file_upload_id, mission_id
-                    )
-                    
-                    total_records_processed += chunk_result.get('records_processed', 0)
-                    total_records_failed += chunk_result.get('records_failed', 0)
-                    
-                    if chunk_result.get('failed_records'):
-                        all_failed_records.extend(chunk_result['failed_records'])
-                    
-                    if not chunk_result.get('success', False):
-                        self.logger.error(f"Error procesando chunk TIGO entrantes: {chunk_result.get('error')}")
-            
-            # Procesar llamadas salientes
-            if len(df_salientes) > 0:
-                for chunk_df in self._chunk_dataframe(df_salientes, self.CHUNK_SIZE):
-                    chunk_result = self._process_tigo_chunk(
-                        chunk_df, 'SALIENTE', file_upload_id, mission_id
-                    )
-                    
-                    total_records_processed += chunk_result.get('records_processed', 0)
-                    total_records_failed += chunk_result.get('records_failed', 0)
-                    
-                    if chunk_result.get('failed_records'):
-                        all_failed_records.extend(chunk_result['failed_records'])
-                    
-                    if not chunk_result.get('success', False):
-                        self.logger.error(f"Error procesando chunk TIGO salientes: {chunk_result.get('error')}")
-            
-            # === RESULTADO FINAL ===
-            
-            processing_time = datetime.now() - start_time
-            
-            self.logger.info(
-                f"Procesamiento TIGO completado: {total_records_processed} exitosos, {total_records_failed} fallidos",
-                extra={
-                    'processing_time_seconds': processing_time.total_seconds(),
-                    'entrantes_count': len(df_entrantes),
-                    'salientes_count': len(df_salientes)
-                }
-            )
-            
-            # Preparar detalles del resultado final
-            result_details = {
-                'processing_time_seconds': processing_time.total_seconds(),
-                'entrantes_processed': len(df_entrantes),
-                'salientes_processed': len(df_salientes),
-                'sheets_combined': len(dfs) if file_name.lower().endswith('.xlsx') else 1
-            }
-            
-            # Agregar información detallada de hojas si es Excel multi-hoja
-            if file_name.lower().endswith('.xlsx') and 'sheet_stats' in locals():
-                result_details.update({
-                    'sheet_processing_summary': {
-                        'total_sheets': sheet_stats['total_sheets'],
-                        'successful_sheets': sheet_stats['successful_sheets'],
-                        'failed_sheets': sheet_stats['failed_sheets'],
-                        'empty_sheets': sheet_stats['empty_sheets'],
-                        'successful_sheet_names': [name for name, details in sheet_stats['sheet_details'].items() if details['status'] == 'success'],
-                        'failed_sheet_names': list(sheet_stats['failed_sheet_errors'].keys()),
-                        'sheet_record_counts': {name: details['records'] for name, details in sheet_stats['sheet_details'].items() if details['status'] == 'success'}
-                    }
-                })
-                
-                # Logs de resumen final con información de hojas
-                self.logger.info(
-                    f"Procesamiento TIGO completado con {sheet_stats['successful_sheets']} hojas exitosas: "
-                    f"{total_records_processed} registros exitosos, {total_records_failed} fallidos",
-                    extra={
-                        'sheet_summary': result_details['sheet_processing_summary'],
-                        'processing_time_seconds': processing_time.total_seconds()
-                    }
-                )
-            
-            # Actualizar estado final en operator_data_sheets
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                processing_status = 'COMPLETED' if total_records_failed == 0 else 'FAILED'
-                
-                cursor.execute("""
-                    UPDATE operator_data_sheets 
-                    SET processing_status = ?, 
-                        records_processed = ?, 
-                        records_failed = ?,
-                        processing_end_time = CURRENT_TIMESTAMP,
-                        processing_duration_seconds = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (
-                    processing_status,
-                    total_records_processed,
-                    total_records_failed,
-                    int(processing_time.total_seconds()),
-                    file_upload_id
-                ))
-                
-                conn.commit()
-                
-                self.logger.info(f"Estado de procesamiento TIGO actualizado: {processing_status}")
-            
-            return {
-                'success': True,
-                'processedRecords': total_records_processed,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': total_records_processed,  # Mantener por compatibilidad
-                'records_failed': total_records_failed,
-                'failed_records': all_failed_records[:10],  # Limitar a primeros 10 errores
-                'details': result_details
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando archivo TIGO {file_name}: {e}", exc_info=True)
-            
-            # Actualizar estado como FAILED en caso de error crítico
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = 'FAILED', 
-                            error_details = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (str(e), file_upload_id))
-                    
-                    conn.commit()
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado de fallo: {update_error}")
+    
+    def process_movistar_llamadas_salientes(self, file_bytes: bytes, file_name: str,
+                                          file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+        """
+        Procesa un archivo de llamadas salientes de MOVISTAR.
+        
+        El formato se describe en el adaptador MOVISTAR/CALL_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
+        Args:
+            file_bytes (bytes): Contenido del archivo
+            file_name (str): Nombre del archivo
+            file_upload_id (str): ID único del archivo
+            mission_id (str): ID de la misión
             
-            return {
-                'success': False,
-                'error': f'Error crítico: {str(e)}',
-                'processedRecords': 0,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': 0,  # Mantener por compatibilidad
-                'records_failed': 0
-            }
+        Returns:
+            Dict[str, Any]: Resultado del procesamiento
+        """
+        return self.process_with_adapter(
+            get_ingestion_adapter('MOVISTAR', 'CALL_DATA'), file_bytes, file_name, file_upload_id, mission_id
+        )
+    
+    def _build_movistar_cellular_params(self, row_data: Dict[str, Any], connection_type: str,
+                                        file_upload_id: str, mission_id: str) -> Optional[tuple]:
+        """
+        Normaliza un registro MOVISTAR de datos y construye los parámetros de
+        CELLULAR_DATA_INSERT_SQL.
+        
+        Returns:
+            Tupla de parámetros, o None si el registro no se pudo normalizar
+        """
+        normalized_data = self.data_normalizer.normalize_movistar_cellular_data(
+            row_data, file_upload_id, mission_id
+        )
+        return self._operator_cellular_params(normalized_data) if normalized_data else None
+    
+    def _build_movistar_call_params(self, row_data: Dict[str, Any], call_direction: str,
+                                    file_upload_id: str, mission_id: str) -> Optional[tuple]:
+        """
+        Normaliza un registro MOVISTAR de llamadas y construye los parámetros de
+        CALL_DATA_INSERT_SQL (cellid_decimal y lac_decimal vienen de
+        _clean_movistar_call_frame).
+        
+        Returns:
+            Tupla de parámetros, o None si el registro no se pudo normalizar
+        """
+        cellid_decimal = row_data.pop('cellid_decimal', None)
+        lac_decimal = row_data.pop('lac_decimal', None)
+        
+        normalized_data = self.data_normalizer.normalize_movistar_call_data_salientes(
+            row_data, file_upload_id, mission_id
+        )
+        if not normalized_data:
+            return None
+        return self._operator_call_params(normalized_data, cellid_decimal, lac_decimal)
+
+    # ==============================================================================
+    # PROCESAMIENTO ESPECÍFICO PARA TIGO
+    # ==============================================================================
 
-    def _process_tigo_chunk(self, df_chunk: pd.DataFrame, call_direction: str,
-                           file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+    def process_tigo_llamadas_unificadas(self, file_bytes: bytes, file_name: str,
+                                        file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+        """
+        Procesa un archivo de llamadas unificadas de TIGO (entrantes y salientes en un archivo).
+        
+        TIGO diferencia entre llamadas entrantes y salientes usando el campo DIRECCION:
+        - 'O' = SALIENTE 
+        - 'I' = ENTRANTE
+        
+        El formato se describe en el adaptador TIGO/CALL_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
+        Args:
+            file_bytes (bytes): Contenido del archivo TIGO
+            file_name (str): Nombre del archivo original
+            file_upload_id (str): ID único del archivo cargado
+            mission_id (str): ID de la misión asociada
+        
+        Returns:
+            Dict[str, Any]: Resultado del procesamiento con estadísticas
+        """
+        return self.process_with_adapter(
+            get_ingestion_adapter('TIGO', 'CALL_DATA'), file_bytes, file_name, file_upload_id, mission_id
+        )
+
+    def _build_tigo_call_params(self, row_data: Dict[str, Any], call_direction: str,
+                                file_upload_id: str, mission_id: str) -> Optional[tuple]:
         """
-        Procesa un chunk de datos TIGO para un tipo específico de llamada.
+        Normaliza un registro TIGO y construye los parámetros de CALL_DATA_INSERT_SQL.
         
         Args:
-            df_chunk: DataFrame con registros del chunk
+            row_data: Registro del DataFrame limpio (con metadatos de pestaña)
             call_direction: 'ENTRANTE' o 'SALIENTE'
             file_upload_id: ID del archivo fuente
             mission_id: ID de la misión
             
         Returns:
-            Dict con resultado del procesamiento del chunk
+            Tupla de parámetros, o None si el registro no se pudo normalizar
         """
-        chunk_number = getattr(self, '_current_chunk_number', 0) + 1
-        setattr(self, '_current_chunk_number', chunk_number)
+        # Preservar información de origen si está disponible
+        source_sheet = row_data.get('_source_sheet', 'unknown')
+        sheet_index = row_data.get('_sheet_index', 0)
+        total_sheets = row_data.get('_total_sheets', 1)
         
-        records_processed = 0
-        records_failed = 0
-        failed_records = []
+        # Normalizar registro TIGO usando DataNormalizerService
+        normalized_data = self.data_normalizer.normalize_tigo_call_data_unificadas(
+            row_data, file_upload_id, mission_id, call_direction
+        )
         
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in df_chunk.iterrows():
-                    try:
-                        # Preparar datos del registro con información de origen
-                        row_data = dict(row)
-                        
-                        # Preservar información de origen si está disponible
-                        source_sheet = row_data.get('_source_sheet', 'unknown')
-                        sheet_index = row_data.get('_sheet_index', 0)
-                        total_sheets = row_data.get('_total_sheets', 1)
-                        
-                        # Normalizar registro TIGO usando DataNormalizerService
-                        normalized_data = self.data_normalizer.normalize_tigo_call_data_unificadas(
-                            row_data, file_upload_id, mission_id, call_direction
-                        )
-                        
-                        # Agregar información de origen al operator_specific_data
-                        if normalized_data and 'operator_specific_data' in normalized_data:
-                            operator_data = json.loads(normalized_data['operator_specific_data']) if isinstance(normalized_data['operator_specific_data'], str) else normalized_data['operator_specific_data']
-                            if operator_data is None:
-                                operator_data = {}
-                            
-                            operator_data.update({
-                                'source_sheet': source_sheet,
-                                'sheet_index': sheet_index,
-                                'total_sheets_in_file': total_sheets,
-                                'call_direction': call_direction
-                            })
-                            
-                            normalized_data['operator_specific_data'] = json.dumps(operator_data, ensure_ascii=False)
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['No se pudo normalizar el registro'],
-                                'record': dict(row)
-                            })
-                            continue
-                        
-                        # Insertar en base de datos
-                        cursor.execute("""
-                            INSERT INTO operator_call_data (
-                                file_upload_id, mission_id, operator, tipo_llamada, numero_origen, 
-                                numero_destino, numero_objetivo, fecha_hora_llamada, duracion_segundos,
-                                celda_origen, celda_destino, celda_objetivo, latitud_origen, 
-                                longitud_origen, latitud_destino, longitud_destino, tecnologia,
-                                tipo_trafico, estado_llamada, operator_specific_data, record_hash,
-                                cellid_decimal, lac_decimal
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            'TIGO',  # operator
-                            normalized_data['tipo_llamada'],
-                            normalized_data['numero_origen'],
-                            normalized_data['numero_destino'],
-                            normalized_data['numero_objetivo'],
-                            normalized_data['fecha_hora_llamada'],
-                            normalized_data['duracion_segundos'],
-                            normalized_data['celda_origen'],
-                            normalized_data['celda_destino'],
-                            normalized_data['celda_objetivo'],
-                            normalized_data['latitud_origen'],
-                            normalized_data['longitud_origen'],
-                            normalized_data['latitud_destino'],
-                            normalized_data['longitud_destino'],
-                            normalized_data['tecnologia'],
-                            normalized_data['tipo_trafico'],
-                            normalized_data['estado_llamada'],
-                            normalized_data['operator_specific_data'],
-                            normalized_data['record_hash'],
-                            normalized_data['cellid_decimal'],
-                            normalized_data['lac_decimal']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        records_failed += 1
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {str(e)}'],
-                            'record': dict(row) if 'row' in locals() else {}
-                        })
-                        
-                        self.logger.error(
-                            f"Error procesando registro TIGO {call_direction} {index + 1} en chunk {chunk_number}: {e}"
-                        )
-                
-                # Confirmar transacción del chunk
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk TIGO {call_direction} {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk TIGO {call_direction} {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed
-            }
+        if not normalized_data:
+            return None
+        
+        # Agregar información de origen al operator_specific_data
+        if 'operator_specific_data' in normalized_data:
+            operator_data = json.loads(normalized_data['operator_specific_data']) if isinstance(normalized_data['operator_specific_data'], str) else normalized_data['operator_specific_data']
+            if operator_data is None:
+                operator_data = {}
+            
+            operator_data.update({
+                'source_sheet': source_sheet,
+                'sheet_index': sheet_index,
+                'total_sheets_in_file': total_sheets,
+                'call_direction': call_direction
+            })
+            
+            normalized_data['operator_specific_data'] = json.dumps(operator_data, ensure_ascii=False)
+        
+        return (
+            normalized_data['file_upload_id'],
+            normalized_data['mission_id'],
+            'TIGO',  # operator
+            normalized_data['tipo_llamada'],
+            normalized_data['numero_origen'],
+            normalized_data['numero_destino'],
+            normalized_data['numero_objetivo'],
+            normalized_data['fecha_hora_llamada'],
+            normalized_data['duracion_segundos'],
+            normalized_data['celda_origen'],
+            normalized_data['celda_destino'],
+            normalized_data['celda_objetivo'],
+            normalized_data['latitud_origen'],
+            normalized_data['longitud_origen'],
+            normalized_data['latitud_destino'],
+            normalized_data['longitud_destino'],
+            normalized_data['tecnologia'],
+            normalized_data['tipo_trafico'],
+            normalized_data['estado_llamada'],
+            normalized_data['operator_specific_data'],
+            normalized_data['record_hash'],
+            normalized_data['cellid_decimal'],
+            normalized_data['lac_decimal']
+        )
 
     # ==============================================================================
     # MÉTODOS ESPECÍFICOS PARA OPERADOR WOM
@@ -3125,233 +1141,22 @@ class FileProcessorService:
         - Coordenadas con formato de comas decimales
         - Multi-pestaña en archivos XLSX
         
+        El formato se describe en el adaptador WOM/CELLULAR_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
         Args:
             file_bytes (bytes): Contenido del archivo WOM
             file_name (str): Nombre del archivo original
             file_upload_id (str): ID único del archivo cargado
             mission_id (str): ID de la misión asociada
-            
+        
         Returns:
             Dict[str, Any]: Resultado del procesamiento con estadísticas
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento WOM datos por celda: {file_name}",
-            extra={
-                'file_name': file_name,
-                'file_upload_id': file_upload_id,
-                'mission_id': mission_id,
-                'operator': 'WOM',
-                'file_type': 'CELLULAR_DATA'
-            }
+        return self.process_with_adapter(
+            get_ingestion_adapter('WOM', 'CELLULAR_DATA'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === LECTURA DE ARCHIVO ===
-            
-            # Leer archivo (CSV o XLSX multi-pestaña)
-            dfs = []
-            if file_name.lower().endswith('.xlsx'):
-                # WOM usa archivos multi-pestaña: leer todas las pestañas
-                try:
-                    excel_file = pd.ExcelFile(io.BytesIO(file_bytes))
-                    self.logger.info(f"Pestañas encontradas en {file_name}: {excel_file.sheet_names}")
-                    
-                    for sheet_name in excel_file.sheet_names:
-                        sheet_df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                        if not sheet_df.empty:
-                            sheet_df['source_sheet'] = sheet_name
-                            dfs.append(sheet_df)
-                            self.logger.info(f"Pestaña '{sheet_name}': {len(sheet_df)} registros")
-                    
-                    if not dfs:
-                        return {
-                            'success': False,
-                            'error': 'No se encontraron datos válidos en ninguna pestaña del archivo Excel',
-                            'records_processed': 0,
-                            'records_failed': 0
-                        }
-                    
-                    # Combinar todas las pestañas
-                    df = pd.concat(dfs, ignore_index=True)
-                    self.logger.info(f"Total registros combinados: {len(df)}")
-                    
-                except Exception as excel_error:
-                    self.logger.error(f"Error leyendo Excel multi-pestaña: {excel_error}")
-                    return {
-                        'success': False,
-                        'error': f'Error leyendo archivo Excel: {str(excel_error)}',
-                        'records_processed': 0,
-                        'records_failed': 0
-                    }
-            else:
-                # Archivo CSV
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-                if df is None or df.empty:
-                    return {
-                        'success': False,
-                        'error': 'No se pudo leer el archivo CSV o está vacío',
-                        'records_processed': 0,
-                        'records_failed': 0
-                    }
-            
-            self.logger.info(f"Archivo WOM datos por celda leído: {len(df)} registros")
-            
-            # === VALIDACIÓN DE ESTRUCTURA ===
-            
-            # Campos requeridos específicos de WOM datos por celda
-            required_fields = [
-                'OPERADOR_TECNOLOGIA', 'BTS_ID', 'TAC', 'CELL_ID_VOZ', 'SECTOR',
-                'FECHA_HORA_INICIO', 'FECHA_HORA_FIN', 'OPERADOR_RAN', 'NUMERO_ORIGEN',
-                'DURACION_SEG', 'UP_DATA_BYTES', 'DOWN_DATA_BYTES', 'IMSI',
-                'NOMBRE_ANTENA', 'DIRECCION', 'LATITUD', 'LONGITUD',
-                'LOCALIDAD', 'CIUDAD', 'DEPARTAMENTO'
-            ]
-            
-            # Verificar campos requeridos
-            missing_fields = [field for field in required_fields if field not in df.columns]
-            if missing_fields:
-                return {
-                    'success': False,
-                    'error': f'Campos requeridos faltantes: {", ".join(missing_fields)}',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === NORMALIZACIÓN DE DATOS ===
-            
-            # Normalizar usando DataNormalizerService
-            df_normalized = self.data_normalizer.normalize_wom_cellular_data(df)
-            
-            if df_normalized is None or df_normalized.empty:
-                return {
-                    'success': False,
-                    'error': 'Error en normalización de datos WOM',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === LIMPIEZA Y VALIDACIÓN ===
-            
-            # Filtrar registros con datos válidos
-            df_clean = df_normalized.dropna(subset=['numero_origen', 'operador_tecnologia']).copy()
-            
-            # Convertir coordenadas formato WOM (comas a puntos decimales)
-            for coord_col in ['latitud', 'longitud']:
-                if coord_col in df_clean.columns:
-                    df_clean[coord_col] = (df_clean[coord_col]
-                                          .astype(str)
-                                          .str.replace(',', '.')
-                                          .str.strip('"\'')
-                                          .replace(['', 'nan', 'None'], None))
-                    
-                    # Convertir a float donde sea posible
-                    df_clean[coord_col] = pd.to_numeric(df_clean[coord_col], errors='coerce')
-            
-            # Convertir campos numéricos específicos de WOM
-            numeric_fields = ['duracion_seg', 'up_data_bytes', 'down_data_bytes', 'bts_id', 'tac', 'cell_id_voz', 'sector']
-            for field in numeric_fields:
-                if field in df_clean.columns:
-                    df_clean[field] = pd.to_numeric(df_clean[field], errors='coerce').fillna(0)
-            
-            self.logger.info(f"Datos WOM limpiados: {len(df_clean)} registros válidos de {len(df)} originales")
-            
-            # === PROCESAMIENTO EN CHUNKS ===
-            
-            total_records_processed = 0
-            total_records_failed = 0
-            total_duplicated = 0          # NUEVO: contador de duplicados
-            total_validation_failed = 0  # NUEVO: contador de errores de validación
-            total_other_errors = 0       # NUEVO: contador de otros errores
-            all_failed_records = []
-            
-            for chunk_df in self._chunk_dataframe(df_clean, self.CHUNK_SIZE):
-                chunk_result = self._process_wom_cellular_chunk(
-                    chunk_df, file_upload_id, mission_id
-                )
-                
-                total_records_processed += chunk_result.get('records_processed', 0)
-                total_records_failed += chunk_result.get('records_failed', 0)
-                total_duplicated += chunk_result.get('records_duplicated', 0)          # NUEVO
-                total_validation_failed += chunk_result.get('validation_failed', 0)  # NUEVO
-                total_other_errors += chunk_result.get('other_errors', 0)             # NUEVO
-                
-                if chunk_result.get('failed_records'):
-                    all_failed_records.extend(chunk_result['failed_records'])
-                
-                if not chunk_result.get('success', False):
-                    self.logger.error(f"Error procesando chunk WOM datos: {chunk_result.get('error')}")
-            
-            # === RESULTADO FINAL ===
-            
-            processing_time = datetime.now() - start_time
-            
-            self.logger.info(
-                f"Procesamiento WOM datos por celda completado: {total_records_processed} exitosos, {total_records_failed} fallidos",
-                extra={
-                    'processing_time_seconds': processing_time.total_seconds(),
-                    'total_processed': total_records_processed,
-                    'total_failed': total_records_failed
-                }
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if total_records_failed == 0 else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_records_processed,
-                        total_records_failed,
-                        int(processing_time.total_seconds()),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento WOM datos por celda actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final WOM datos por celda: {update_error}")
-            
-            return {
-                'success': True,
-                'processedRecords': total_records_processed,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': total_records_processed,  # Mantener por compatibilidad
-                'records_failed': total_records_failed,
-                'records_duplicated': total_duplicated,                    # NUEVO: contador exacto de duplicados
-                'records_validation_failed': total_validation_failed,     # NUEVO: contador exacto de errores de validación
-                'records_other_errors': total_other_errors,               # NUEVO: contador exacto de otros errores
-                'failed_records': all_failed_records[:10],  # Limitar a primeros 10 errores
-                'details': {
-                    'processing_time_seconds': processing_time.total_seconds(),
-                    'sheets_combined': len(dfs) if file_name.lower().endswith('.xlsx') else 1,
-                    'operator_technology_types': df_clean['operador_tecnologia'].value_counts().to_dict() if 'operador_tecnologia' in df_clean.columns else {}
-                }
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando archivo WOM datos por celda {file_name}: {e}", exc_info=True)
-            return {
-                'success': False,
-                'error': f'Error crítico: {str(e)}',
-                'processedRecords': 0,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': 0,  # Mantener por compatibilidad
-                'records_failed': 0
-            }
-
+    
     def process_wom_llamadas_entrantes(self, file_bytes: bytes, file_name: str,
                                       file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
@@ -3362,555 +1167,135 @@ class FileProcessorService:
         - 'ENTRANTE' = llamada entrante
         - 'SALIENTE' = llamada saliente
         
-        Incluye información técnica avanzada como IMEI, IMSI, ACCESS_NETWORK_INFORMATION
+        Incluye información técnica avanzada como IMEI, IMSI, ACCESS_NETWORK_INFORMATION.
+        El formato se describe en el adaptador WOM/CALL_DATA
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
         
         Args:
             file_bytes (bytes): Contenido del archivo WOM
             file_name (str): Nombre del archivo original
             file_upload_id (str): ID único del archivo cargado
             mission_id (str): ID de la misión asociada
-            
+        
         Returns:
             Dict[str, Any]: Resultado del procesamiento con estadísticas
         """
-        start_time = datetime.now()
-        
-        self.logger.info(
-            f"Iniciando procesamiento WOM llamadas entrantes/salientes: {file_name}",
-            extra={
-                'file_name': file_name,
-                'file_upload_id': file_upload_id,
-                'mission_id': mission_id,
-                'operator': 'WOM',
-                'file_type': 'CALL_DATA'
-            }
+        return self.process_with_adapter(
+            get_ingestion_adapter('WOM', 'CALL_DATA'), file_bytes, file_name, file_upload_id, mission_id
         )
-        
-        try:
-            # === LECTURA DE ARCHIVO ===
-            
-            # Leer archivo (CSV o XLSX multi-pestaña)
-            dfs = []
-            if file_name.lower().endswith('.xlsx'):
-                # WOM usa archivos multi-pestaña: leer todas las pestañas
-                try:
-                    excel_file = pd.ExcelFile(io.BytesIO(file_bytes))
-                    self.logger.info(f"Pestañas encontradas en {file_name}: {excel_file.sheet_names}")
-                    
-                    for sheet_name in excel_file.sheet_names:
-                        sheet_df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                        if not sheet_df.empty:
-                            sheet_df['source_sheet'] = sheet_name
-                            dfs.append(sheet_df)
-                            self.logger.info(f"Pestaña '{sheet_name}': {len(sheet_df)} registros")
-                    
-                    if not dfs:
-                        return {
-                            'success': False,
-                            'error': 'No se encontraron datos válidos en ninguna pestaña del archivo Excel',
-                            'records_processed': 0,
-                            'records_failed': 0
-                        }
-                    
-                    # Combinar todas las pestañas
-                    df = pd.concat(dfs, ignore_index=True)
-                    self.logger.info(f"Total registros combinados: {len(df)}")
-                    
-                except Exception as excel_error:
-                    self.logger.error(f"Error leyendo Excel multi-pestaña: {excel_error}")
-                    return {
-                        'success': False,
-                        'error': f'Error leyendo archivo Excel: {str(excel_error)}',
-                        'records_processed': 0,
-                        'records_failed': 0
-                    }
-            else:
-                # Archivo CSV
-                df = self._read_csv_robust(file_bytes, delimiter=',')
-                if df is None or df.empty:
-                    return {
-                        'success': False,
-                        'error': 'No se pudo leer el archivo CSV o está vacío',
-                        'records_processed': 0,
-                        'records_failed': 0
-                    }
-            
-            self.logger.info(f"Archivo WOM llamadas leído: {len(df)} registros")
-            
-            # === VALIDACIÓN DE ESTRUCTURA ===
-            
-            # Campos requeridos específicos de WOM llamadas
-            required_fields = [
-                'OPERADOR_TECNOLOGIA', 'BTS_ID', 'TAC', 'CELL_ID_VOZ', 'SECTOR',
-                'NUMERO_ORIGEN', 'NUMERO_DESTINO', 'FECHA_HORA_INICIO', 'FECHA_HORA_FIN',
-                'DURACION_SEG', 'OPERADOR_RAN_ORIGEN', 'NOMBRE_ANTENA', 'DIRECCION',
-                'LATITUD', 'LONGITUD', 'LOCALIDAD', 'CIUDAD', 'DEPARTAMENTO', 'SENTIDO'
-            ]
-            
-            # Verificar campos requeridos
-            missing_fields = [field for field in required_fields if field not in df.columns]
-            if missing_fields:
-                return {
-                    'success': False,
-                    'error': f'Campos requeridos faltantes: {", ".join(missing_fields)}',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === NORMALIZACIÓN DE DATOS ===
-            
-            # Normalizar usando DataNormalizerService
-            df_normalized = self.data_normalizer.normalize_wom_call_data_entrantes(df)
-            
-            if df_normalized is None or df_normalized.empty:
-                return {
-                    'success': False,
-                    'error': 'Error en normalización de datos WOM',
-                    'records_processed': 0,
-                    'records_failed': 0
-                }
-            
-            # === LIMPIEZA Y VALIDACIÓN ===
-            
-            # Filtrar registros con datos válidos
-            df_clean = df_normalized.dropna(subset=['numero_origen', 'sentido']).copy()
-            
-            # Convertir coordenadas formato WOM (comas a puntos decimales)
-            for coord_col in ['latitud', 'longitud']:
-                if coord_col in df_clean.columns:
-                    df_clean[coord_col] = (df_clean[coord_col]
-                                          .astype(str)
-                                          .str.replace(',', '.')
-                                          .str.strip('"\'')
-                                          .replace(['', 'nan', 'None'], None))
-                    
-                    # Convertir a float donde sea posible
-                    df_clean[coord_col] = pd.to_numeric(df_clean[coord_col], errors='coerce')
-            
-            # Convertir duración a numérico
-            if 'duracion_seg' in df_clean.columns:
-                df_clean['duracion_seg'] = pd.to_numeric(df_clean['duracion_seg'], errors='coerce').fillna(0)
-            
-            self.logger.info(f"Datos WOM limpiados: {len(df_clean)} registros válidos de {len(df)} originales")
-            
-            # === SEPARACIÓN POR SENTIDO ===
-            
-            # Separar registros por sentido de llamada
-            df_entrantes = df_clean[df_clean['sentido'].str.upper().isin(['ENTRANTE'])].copy()
-            df_salientes = df_clean[df_clean['sentido'].str.upper().isin(['SALIENTE'])].copy()
-            
-            self.logger.info(f"Separación WOM: {len(df_entrantes)} entrantes, {len(df_salientes)} salientes")
-            
-            # === PROCESAMIENTO EN CHUNKS ===
-            
-            total_records_processed = 0
-            total_records_failed = 0
-            total_duplicated = 0          # NUEVO: contador de duplicados
-            total_validation_failed = 0  # NUEVO: contador de errores de validación
-            total_other_errors = 0       # NUEVO: contador de otros errores
-            all_failed_records = []
-            
-            # Procesar llamadas entrantes
-            if len(df_entrantes) > 0:
-                for chunk_df in self._chunk_dataframe(df_entrantes, self.CHUNK_SIZE):
-                    chunk_result = self._process_wom_call_chunk(
-                        chunk_df, 'ENTRANTE', file_upload_id, mission_id
-                    )
-                    
-                    total_records_processed += chunk_result.get('records_processed', 0)
-                    total_records_failed += chunk_result.get('records_failed', 0)
-                    total_duplicated += chunk_result.get('records_duplicated', 0)          # NUEVO
-                    total_validation_failed += chunk_result.get('validation_failed', 0)  # NUEVO
-                    total_other_errors += chunk_result.get('other_errors', 0)             # NUEVO
-                    
-                    if chunk_result.get('failed_records'):
-                        all_failed_records.extend(chunk_result['failed_records'])
-                    
-                    if not chunk_result.get('success', False):
-                        self.logger.error(f"Error procesando chunk WOM entrantes: {chunk_result.get('error')}")
-            
-            # Procesar llamadas salientes
-            if len(df_salientes) > 0:
-                for chunk_df in self._chunk_dataframe(df_salientes, self.CHUNK_SIZE):
-                    chunk_result = self._process_wom_call_chunk(
-                        chunk_df, 'SALIENTE', file_upload_id, mission_id
-                    )
-                    
-                    total_records_processed += chunk_result.get('records_processed', 0)
-                    total_records_failed += chunk_result.get('records_failed', 0)
-                    total_duplicated += chunk_result.get('records_duplicated', 0)          # NUEVO
-                    total_validation_failed += chunk_result.get('validation_failed', 0)  # NUEVO
-                    total_other_errors += chunk_result.get('other_errors', 0)             # NUEVO
-                    
-                    if chunk_result.get('failed_records'):
-                        all_failed_records.extend(chunk_result['failed_records'])
-                    
-                    if not chunk_result.get('success', False):
-                        self.logger.error(f"Error procesando chunk WOM salientes: {chunk_result.get('error')}")
-            
-            # === RESULTADO FINAL ===
-            
-            processing_time = datetime.now() - start_time
-            
-            self.logger.info(
-                f"Procesamiento WOM llamadas completado: {total_records_processed} exitosos, {total_records_failed} fallidos",
-                extra={
-                    'processing_time_seconds': processing_time.total_seconds(),
-                    'entrantes_count': len(df_entrantes),
-                    'salientes_count': len(df_salientes)
-                }
-            )
-            
-            # Actualizar tabla operator_data_sheets con conteo final
-            try:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    processing_status = 'COMPLETED' if total_records_failed == 0 else 'FAILED'
-                    
-                    cursor.execute("""
-                        UPDATE operator_data_sheets 
-                        SET processing_status = ?, 
-                            records_processed = ?, 
-                            records_failed = ?,
-                            processing_end_time = CURRENT_TIMESTAMP,
-                            processing_duration_seconds = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        processing_status,
-                        total_records_processed,
-                        total_records_failed,
-                        int(processing_time.total_seconds()),
-                        file_upload_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.logger.info(f"Estado de procesamiento WOM llamadas actualizado: {processing_status}")
-            except Exception as update_error:
-                self.logger.error(f"Error actualizando estado final WOM llamadas: {update_error}")
-            
-            return {
-                'success': True,
-                'processedRecords': total_records_processed,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': total_records_processed,  # Mantener por compatibilidad
-                'records_failed': total_records_failed,
-                'records_duplicated': total_duplicated,                    # NUEVO: contador exacto de duplicados
-                'records_validation_failed': total_validation_failed,     # NUEVO: contador exacto de errores de validación
-                'records_other_errors': total_other_errors,               # NUEVO: contador exacto de otros errores
-                'failed_records': all_failed_records[:10],  # Limitar a primeros 10 errores
-                'details': {
-                    'processing_time_seconds': processing_time.total_seconds(),
-                    'entrantes_processed': len(df_entrantes),
-                    'salientes_processed': len(df_salientes),
-                    'sheets_combined': len(dfs) if file_name.lower().endswith('.xlsx') else 1,
-                    'technology_distribution': df_clean['operador_tecnologia'].value_counts().to_dict() if 'operador_tecnologia' in df_clean.columns else {}
-                }
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando archivo WOM llamadas {file_name}: {e}", exc_info=True)
-            return {
-                'success': False,
-                'error': f'Error crítico: {str(e)}',
-                'processedRecords': 0,  # CORRECCIÓN: Usar nombre consistente con frontend
-                'records_processed': 0,  # Mantener por compatibilidad
-                'records_failed': 0
-            }
 
-    def _process_wom_cellular_chunk(self, df_chunk: pd.DataFrame,
-                                   file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+    def _build_wom_cellular_params(self, row_data: Dict[str, Any], connection_type: str,
+                                   file_upload_id: str, mission_id: str) -> Optional[tuple]:
         """
-        Procesa un chunk de datos celulares WOM.
+        Normaliza un registro WOM de datos y construye los parámetros de
+        CELLULAR_DATA_INSERT_SQL.
         
         Args:
-            df_chunk: DataFrame con registros del chunk
+            row_data: Registro del DataFrame limpio
+            connection_type: Tipo de conexión (sentido DATA_DIRECTION del adaptador)
             file_upload_id: ID del archivo fuente
             mission_id: ID de la misión
-            
-        Returns:
-            Dict con resultado del procesamiento del chunk
-        """
-        chunk_number = getattr(self, '_current_chunk_number', 0) + 1
-        setattr(self, '_current_chunk_number', chunk_number)
-        
-        records_processed = 0
-        records_failed = 0
-        records_duplicated = 0  # NUEVO: contador de duplicados
-        validation_failed = 0   # NUEVO: contador de errores de validación
-        other_errors = 0        # NUEVO: contador de otros errores
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in df_chunk.iterrows():
-                    try:
-                        # Normalizar registro WOM usando DataNormalizerService
-                        normalized_data = self.data_normalizer.normalize_wom_cellular_data_record(
-                            dict(row), file_upload_id, mission_id
-                        )
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['No se pudo normalizar el registro'],
-                                'record': dict(row)
-                            })
-                            continue
-                        
-                        # Insertar en tabla unificada operator_cellular_data
-                        cursor.execute("""
-                            INSERT INTO operator_cellular_data (
-                                file_upload_id, mission_id, operator, numero_telefono,
-                                fecha_hora_inicio, fecha_hora_fin, duracion_segundos, celda_id, 
-                                lac_tac, trafico_subida_bytes, trafico_bajada_bytes, latitud, 
-                                longitud, tecnologia, tipo_conexion, operator_specific_data, record_hash
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            'WOM',
-                            normalized_data['numero_origen'],
-                            normalized_data['fecha_hora_inicio'],
-                            normalized_data['fecha_hora_fin'],
-                            normalized_data['duracion_seg'],
-                            str(normalized_data.get('cell_id_voz', '')),
-                            str(normalized_data.get('tac', '')),
-                            normalized_data.get('up_data_bytes', 0),
-                            normalized_data.get('down_data_bytes', 0),
-                            normalized_data.get('latitud'),
-                            normalized_data.get('longitud'),
-                            self._map_wom_technology(normalized_data.get('operator_technology', 'WOM')),
-                            'DATOS',
-                            json.dumps({
-                                'bts_id': normalized_data.get('bts_id'),
-                                'imsi': normalized_data.get('imsi'),
-                                'localizacion_usuario': normalized_data.get('localizacion_usuario'),
-                                'nombre_antena': normalized_data.get('nombre_antena'),
-                                'direccion': normalized_data.get('direccion'),
-                                'localidad': normalized_data.get('localidad'),
-                                'ciudad': normalized_data.get('ciudad'),
-                                'departamento': normalized_data.get('departamento'),
-                                'regional': normalized_data.get('regional'),
-                                'entorno_geografico': normalized_data.get('entorno_geografico'),
-                                'uli': normalized_data.get('uli'),
-                                'operador_ran': normalized_data.get('operador_ran')
-                            }),
-                            hashlib.md5(f"{normalized_data['numero_origen']}{normalized_data['fecha_hora_inicio']}{normalized_data.get('cell_id_voz', '')}".encode()).hexdigest()
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as record_error:
-                        error_str = str(record_error)
-                        
-                        # NUEVO: Distinguir tipos de errores por mensaje
-                        if "UNIQUE constraint failed" in error_str:
-                            # Es un duplicado legítimo - NO cuenta como error para el límite
-                            records_duplicated += 1
-                            error_type = 'duplicate'
-                            self.logger.debug(f"Registro duplicado omitido WOM cellular {index + 1} en chunk {chunk_number}: {error_str}")
-                        else:
-                            # Error real - cuenta para el límite de errores
-                            records_failed += 1
-                            if "constraint failed" in error_str.lower() or "check constraint" in error_str.lower():
-                                validation_failed += 1
-                                error_type = 'validation'
-                            else:
-                                other_errors += 1
-                                error_type = 'other'
-                            
-                            self.logger.warning(f"Error procesando registro WOM cellular chunk {chunk_number} fila {index + 1}: {record_error}")
-                            
-                            failed_records.append({
-                                'row': index + 1,
-                                'error_type': error_type,
-                                'errors': [error_str],
-                                'record': dict(row)
-                            })
-                
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk WOM cellular {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos ({records_duplicated} duplicados, {validation_failed} validación, {other_errors} otros)"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'records_duplicated': records_duplicated,      # NUEVO
-                    'validation_failed': validation_failed,       # NUEVO
-                    'other_errors': other_errors,                 # NUEVO
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk WOM cellular {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed,
-                'records_duplicated': records_duplicated,
-                'validation_failed': validation_failed,
-                'other_errors': other_errors
-            }
-
-    def _process_wom_call_chunk(self, df_chunk: pd.DataFrame, call_direction: str,
-                               file_upload_id: str, mission_id: str) -> Dict[str, Any]:
-        """
-        Procesa un chunk de datos de llamadas WOM para un tipo específico de llamada.
         
-        Args:
-            df_chunk: DataFrame con registros del chunk
-            call_direction: 'ENTRANTE' o 'SALIENTE'
-            file_upload_id: ID del archivo fuente
-            mission_id: ID de la misión
-            
         Returns:
-            Dict con resultado del procesamiento del chunk
+            Tupla de parámetros, o None si el registro no se pudo normalizar
         """
-        chunk_number = getattr(self, '_current_chunk_number', 0) + 1
-        setattr(self, '_current_chunk_number', chunk_number)
-        
-        records_processed = 0
-        records_failed = 0
-        records_duplicated = 0  # NUEVO: contador de duplicados
-        validation_failed = 0   # NUEVO: contador de errores de validación
-        other_errors = 0        # NUEVO: contador de otros errores
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in df_chunk.iterrows():
-                    try:
-                        # Normalizar registro WOM usando DataNormalizerService
-                        normalized_data = self.data_normalizer.normalize_wom_call_data_record(
-                            dict(row), file_upload_id, mission_id, call_direction
-                        )
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['No se pudo normalizar el registro'],
-                                'record': dict(row)
-                            })
-                            continue
-                        
-                        # Insertar en tabla unificada operator_call_data
-                        cursor.execute("""
-                            INSERT INTO operator_call_data (
-                                file_upload_id, mission_id, operator, tipo_llamada, numero_origen,
-                                numero_destino, numero_objetivo, fecha_hora_llamada, duracion_segundos,
-                                celda_origen, celda_destino, celda_objetivo, latitud_origen, longitud_origen,
-                                latitud_destino, longitud_destino, calidad_senal, tecnologia,
-                                operator_specific_data, record_hash
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            normalized_data['file_upload_id'],
-                            normalized_data['mission_id'],
-                            'WOM',
-                            call_direction,
-                            normalized_data['numero_origen'],
-                            normalized_data['numero_destino'],
-                            normalized_data['numero_destino'] if call_direction == 'SALIENTE' else normalized_data['numero_origen'],
-                            normalized_data['fecha_hora_inicio'],
-                            normalized_data['duracion_seg'],
-                            str(normalized_data.get('cell_id_voz', '')),
-                            None,  # celda_destino no disponible en WOM
-                            str(normalized_data.get('cell_id_voz', '')),
-                            normalized_data.get('latitud'),
-                            normalized_data.get('longitud'),
-                            None,  # latitud_destino no disponible
-                            None,  # longitud_destino no disponible
-                            None,  # calidad_senal no disponible en WOM
-                            self._map_wom_technology(normalized_data.get('operator_technology', 'WOM')),
-                            json.dumps({
-                                'bts_id': normalized_data.get('bts_id'),
-                                'tac': normalized_data.get('tac'),
-                                'sector': normalized_data.get('sector'),
-                                'operador_ran_origen': normalized_data.get('operador_ran_origen'),
-                                'user_location_info': normalized_data.get('user_location_info'),
-                                'access_network_information': normalized_data.get('access_network_information'),
-                                'imei': normalized_data.get('imei'),
-                                'imsi': normalized_data.get('imsi'),
-                                'nombre_antena': normalized_data.get('nombre_antena'),
-                                'direccion': normalized_data.get('direccion'),
-                                'localidad': normalized_data.get('localidad'),
-                                'ciudad': normalized_data.get('ciudad'),
-                                'departamento': normalized_data.get('departamento'),
-                                'sentido': normalized_data.get('sentido'),
-                                'fecha_hora_fin': normalized_data.get('fecha_hora_fin')
-                            }),
-                            hashlib.md5(f"{normalized_data['numero_origen']}{normalized_data['numero_destino']}{normalized_data['fecha_hora_inicio']}".encode()).hexdigest()
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as record_error:
-                        error_str = str(record_error)
-                        
-                        # NUEVO: Distinguir tipos de errores por mensaje
-                        if "UNIQUE constraint failed" in error_str:
-                            # Es un duplicado legítimo - NO cuenta como error para el límite
-                            records_duplicated += 1
-                            error_type = 'duplicate'
-                            self.logger.debug(f"Registro duplicado omitido WOM call {call_direction} {index + 1} en chunk {chunk_number}: {error_str}")
-                        else:
-                            # Error real - cuenta para el límite de errores
-                            records_failed += 1
-                            if "constraint failed" in error_str.lower() or "check constraint" in error_str.lower():
-                                validation_failed += 1
-                                error_type = 'validation'
-                            else:
-                                other_errors += 1
-                                error_type = 'other'
-                            
-                            self.logger.warning(f"Error procesando registro WOM call {call_direction} chunk {chunk_number} fila {index + 1}: {record_error}")
-                            
-                            failed_records.append({
-                                'row': index + 1,
-                                'error_type': error_type,
-                                'errors': [error_str],
-                                'record': dict(row)
-                            })
-                
-                conn.commit()
-                
-                self.logger.debug(
-                    f"Chunk WOM {call_direction} {chunk_number} procesado: {records_processed} exitosos, {records_failed} fallidos ({records_duplicated} duplicados, {validation_failed} validación, {other_errors} otros)"
-                )
-                
-                return {
-                    'success': True,
-                    'records_processed': records_processed,
-                    'records_failed': records_failed,
-                    'records_duplicated': records_duplicated,      # NUEVO
-                    'validation_failed': validation_failed,       # NUEVO
-                    'other_errors': other_errors,                 # NUEVO
-                    'failed_records': failed_records[:10]  # Limitar detalle
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error crítico procesando chunk WOM {call_direction} {chunk_number}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed,
-                'records_duplicated': records_duplicated,
-                'validation_failed': validation_failed,
-                'other_errors': other_errors
-            }
-            
+        # Normalizar registro WOM usando DataNormalizerService
+        normalized_data = self.data_normalizer.normalize_wom_cellular_data_record(
+            row_data, file_upload_id, mission_id
+        )
+        
+        if not normalized_data:
+            return None
+        
+        return (
+            normalized_data['file_upload_id'],
+            normalized_data['mission_id'],
+            'WOM',
+            normalized_data['numero_origen'],
+            normalized_data['fecha_hora_inicio'],
+            normalized_data['fecha_hora_fin'],
+            normalized_data['duracion_seg'],
+            str(normalized_data.get('cell_id_voz', '')),
+            str(normalized_data.get('tac', '')),
+            normalized_data.get('up_data_bytes', 0),
+            normalized_data.get('down_data_bytes', 0),
+            normalized_data.get('latitud'),
+            normalized_data.get('longitud'),
+            self._map_wom_technology(normalized_data.get('operator_technology', 'WOM')),
+            connection_type,
+            json.dumps({
+                'bts_id': normalized_data.get('bts_id'),
+                'imsi': normalized_data.get('imsi'),
+                'localizacion_usuario': normalized_data.get('localizacion_usuario'),
+                'nombre_antena': normalized_data.get('nombre_antena'),
+                'direccion': normalized_data.get('direccion'),
+                'localidad': normalized_data.get('localidad'),
+                'ciudad': normalized_data.get('ciudad'),
+                'departamento': normalized_data.get('departamento'),
+                'regional': normalized_data.get('regional'),
+                'entorno_geografico': normalized_data.get('entorno_geografico'),
+                'uli': normalized_data.get('uli'),
+                'operador_ran': normalized_data.get('operador_ran')
+            }),
+            hashlib.md5(f"{normalized_data['numero_origen']}{normalized_data['fecha_hora_inicio']}{normalized_data.get('cell_id_voz', '')}".encode()).hexdigest()
+        )
+    
+    def _build_wom_call_params(self, row_data: Dict[str, Any], call_direction: str,
+                               file_upload_id: str, mission_id: str) -> Optional[tuple]:
+        """
+        Normaliza un registro WOM de llamadas y construye los parámetros de
+        WOM_CALL_INSERT_SQL.
+        
+        Returns:
+            Tupla de parámetros, o None si el registro no se pudo normalizar
+        """
+        # Normalizar registro WOM usando DataNormalizerService
+        normalized_data = self.data_normalizer.normalize_wom_call_data_record(
+            row_data, file_upload_id, mission_id, call_direction
+        )
+        
+        if not normalized_data:
+            return None
+        
+        return (
+            normalized_data['file_upload_id'],
+            normalized_data['mission_id'],
+            'WOM',
+            call_direction,
+            normalized_data['numero_origen'],
+            normalized_data['numero_destino'],
+            normalized_data['numero_destino'] if call_direction == 'SALIENTE' else normalized_data['numero_origen'],
+            normalized_data['fecha_hora_inicio'],
+            normalized_data['duracion_seg'],
+            str(normalized_data.get('cell_id_voz', '')),
+            None,  # celda_destino no disponible en WOM
+            str(normalized_data.get('cell_id_voz', '')),
+            normalized_data.get('latitud'),
+            normalized_data.get('longitud'),
+            None,  # latitud_destino no disponible
+            None,  # longitud_destino no disponible
+            None,  # calidad_senal no disponible en WOM
+            self._map_wom_technology(normalized_data.get('operator_technology', 'WOM')),
+            json.dumps({
+                'bts_id': normalized_data.get('bts_id'),
+                'tac': normalized_data.get('tac'),
+                'sector': normalized_data.get('sector'),
+                'operador_ran_origen': normalized_data.get('operador_ran_origen'),
+                'user_location_info': normalized_data.get('user_location_info'),
+                'access_network_information': normalized_data.get('access_network_information'),
+                'imei': normalized_data.get('imei'),
+                'imsi': normalized_data.get('imsi'),
+                'nombre_antena': normalized_data.get('nombre_antena'),
+                'direccion': normalized_data.get('direccion'),
+                'localidad': normalized_data.get('localidad'),
+                'ciudad': normalized_data.get('ciudad'),
+                'departamento': normalized_data.get('departamento'),
+                'sentido': normalized_data.get('sentido'),
+                'fecha_hora_fin': normalized_data.get('fecha_hora_fin')
+            }),
+            hashlib.md5(f"{normalized_data['numero_origen']}{normalized_data['numero_destino']}{normalized_data['fecha_hora_inicio']}".encode()).hexdigest()
+        )
+    
     def _map_wom_technology(self, technology_value: str) -> str:
         """
         Mapea tecnologías WOM a valores estándar para BD.
@@ -3949,184 +1334,806 @@ class FileProcessorService:
         
         return 'UNKNOWN'
 
-    def process_scanhunter_data(self, file_bytes: bytes, file_name: str,
-                               file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+    # ==============================================================================
+    # NÚCLEO DE CARGA CON ADAPTADORES (TIGO / WOM / operadores registrados)
+    # ==============================================================================
+    
+    def process_with_adapter(self, adapter: IngestionAdapter, file_bytes: bytes, file_name: str,
+                             file_upload_id: str, mission_id: str) -> Dict[str, Any]:
         """
-        Procesa un archivo de datos SCANHUNTER para mediciones de scanner celular.
+        Procesa un archivo de operador con el núcleo común de carga.
         
-        SCANHUNTER es un formato específico para datos de scanner celular con columnas:
-        ['Id', 'Punto', 'Latitud', 'Longitud', 'MNC+MCC', 'OPERADOR', 'RSSI', 
-         'TECNOLOGIA', 'CELLID', 'LAC o TAC', 'ENB', 'Comentario', 'CHANNEL']
+        Los archivos XLSX se procesan pestaña por pestaña (en el pool de procesos
+        si el archivo es grande) y cada pestaña se escribe apenas termina; los
+        CSV se procesan como una sola pestaña. Ver services.operator_ingestion_adapters.
         
         Args:
+            adapter: Adaptador del operador y tipo de archivo
             file_bytes (bytes): Contenido del archivo
-            file_name (str): Nombre del archivo
-            file_upload_id (str): ID único del archivo
-            mission_id (str): ID de la misión
-            
+            file_name (str): Nombre del archivo original
+            file_upload_id (str): ID único del archivo cargado
+            mission_id (str): ID de la misión asociada
+        
         Returns:
-            Dict[str, Any]: Resultado del procesamiento
+            Dict[str, Any]: Resultado del procesamiento con estadísticas
         """
         start_time = datetime.now()
+        label = adapter.label
         
         self.logger.info(
-            f"Iniciando procesamiento SCANHUNTER: {file_name}",
-            extra={'file_size': len(file_bytes), 'file_upload_id': file_upload_id}
+            f"Iniciando procesamiento {label}: {file_name}",
+            extra={
+                'file_name': file_name,
+                'file_upload_id': file_upload_id,
+                'mission_id': mission_id,
+                'operator': adapter.operator,
+                'file_type': adapter.file_type
+            }
         )
         
         try:
-            # === ETAPA 1: LECTURA DEL ARCHIVO ===
+            is_excel = file_name.lower().endswith('.xlsx')
+            parallel = False
+            
+            if is_excel:
+                try:
+                    excel_engine = select_excel_engine()
+                    sheet_names = list_excel_sheets(file_bytes, engine=excel_engine)
+                except Exception as excel_error:
+                    self.logger.error(f"Error leyendo Excel {label}: {excel_error}")
+                    return self._adapter_error_result(f'Error leyendo archivo Excel {label}: {str(excel_error)}')
+                
+                # Pestañas en paralelo (pool de procesos) para archivos grandes
+                parallel = should_process_sheets_in_parallel(file_bytes, sheet_names)
+                self.logger.info(f"Archivo Excel {label} con {len(sheet_names)} pestañas: {sheet_names} "
+                                 f"(motor: {excel_engine}, {'en paralelo' if parallel else 'serial'})")
+                
+                task_kwargs = {'adapter': adapter, 'file_upload_id': file_upload_id, 'mission_id': mission_id}
+                if parallel:
+                    sheet_results = iter_sheet_results(self, file_bytes, sheet_names, '_prepare_adapter_sheet',
+                                                       task_kwargs)
+                else:
+                    sheet_results = self._iter_adapter_sheets_serial(file_bytes, sheet_names, excel_engine,
+                                                                     **task_kwargs)
+                totals = self._ingest_sheet_results(adapter, sheet_results, len(sheet_names),
+                                                    file_upload_id, mission_id)
+                
+                if totals['sheet_stats']['successful_sheets'] == 0:
+                    return self._no_sheet_data_error(
+                        totals['sheet_stats'], 'No se encontraron datos válidos en ninguna pestaña del archivo Excel'
+                    )
             
-            # Determinar tipo de archivo
-            file_extension = Path(file_name).suffix.lower()
+            elif file_name.lower().endswith('.csv'):
+                started = time.perf_counter()
+                df = self._read_csv_robust(file_bytes, delimiter=adapter.csv_delimiter)
+                if df is None or df.empty:
+                    return self._adapter_error_result('No se pudo leer el archivo CSV o está vacío')
+                
+                csv_result = self._prepare_adapter_frame(adapter, df, file_name, 1, file_upload_id, mission_id)
+                csv_result['prepare_seconds'] = time.perf_counter() - started
+                if csv_result['status'] == 'failed':
+                    return self._adapter_error_result(csv_result['error'])
+                totals = self._ingest_sheet_results(adapter, [csv_result], 1, file_upload_id, mission_id)
             
-            if file_extension == '.xlsx':
-                df = self._read_excel_robust(file_bytes)
-            elif file_extension == '.csv':
-                df = self._read_csv_robust(file_bytes, delimiter=',')  # SCANHUNTER típicamente usa comas
             else:
-                return {
-                    'success': False,
-                    'error': f'Formato de archivo no soportado para SCANHUNTER: {file_extension}'
-                }
+                return self._adapter_error_result(f'Formato de archivo no soportado para {label}: {file_name}')
             
-            self.logger.info(f"Archivo SCANHUNTER leído: {len(df)} registros, {len(df.columns)} columnas")
+            return self._adapter_final_result(adapter, totals, file_upload_id, start_time, is_excel, parallel)
+        
+        except Exception as e:
+            self.logger.error(f"Error crítico procesando archivo {label} {file_name}: {e}", exc_info=True)
             
-            # === ETAPA 2: VALIDACIÓN DE ESTRUCTURA ===
+            try:
+                with get_db_connection() as conn:
+                    conn.execute("""
+                        UPDATE operator_data_sheets
+                        SET processing_status = 'FAILED',
+                            error_details = ?,
+                            processing_end_time = CURRENT_TIMESTAMP,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, (str(e), file_upload_id))
+                    conn.commit()
+            except Exception as update_error:
+                self.logger.error(f"Error actualizando estado de fallo: {update_error}")
             
-            is_valid_structure, structure_errors = self._validate_scanhunter_columns(df)
+            return self._adapter_error_result(f'Error crítico: {str(e)}')
+    
+    def _adapter_error_result(self, error: str) -> Dict[str, Any]:
+        """Resultado de un archivo que no se pudo procesar"""
+        return {
+            'success': False,
+            'error': error,
+            'processedRecords': 0,
+            'records_processed': 0,
+            'records_failed': 0
+        }
+    
+    def _new_sheet_result(self, sheet_name: str, sheet_index: int) -> Dict[str, Any]:
+        """Estructura del resultado de una tarea de pestaña"""
+        return {
+            'sheet_name': sheet_name,
+            'sheet_index': sheet_index,
+            'status': 'success',
+            'records': 0,
+            'columns': 0,
+            'error': None,
+            'rows': [],                 # (parámetros de inserción, fila)
+            'records_failed': 0,
+            'validation_failed': 0,     # Registros descartados por record_validator
+            'failed_records': [],
+            'direction_counts': {},
+            'technology_counts': {},
+            'prepare_seconds': 0.0
+        }
+    
+    def _clean_with_adapter(self, adapter: IngestionAdapter,
+                            df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        Aplica las reglas de limpieza vectorizadas del adaptador.
+        
+        Args:
+            adapter: Adaptador del formato
+            df: DataFrame leído del archivo (una pestaña o el CSV)
+        
+        Returns:
+            Tuple (DataFrame limpio, mensaje de error si no se pudo procesar)
+        """
+        # Normalizar nombres de columnas y mapearlos a nombres estándar
+        df_clean = df.rename(columns=lambda column: column.strip() if isinstance(column, str) else column)
+        if adapter.column_mapping:
+            df_clean = df_clean.rename(columns=adapter.column_mapping)
+        
+        if adapter.structure_validator:
+            is_valid_structure, structure_errors = getattr(self, adapter.structure_validator)(df_clean)
             if not is_valid_structure:
-                return {
-                    'success': False,
-                    'error': f'Estructura de archivo SCANHUNTER inválida: {"; ".join(structure_errors)}'
-                }
-            
-            # === ETAPA 3: LIMPIEZA DE DATOS ===
-            
-            original_count = len(df)
-            df = self._clean_scanhunter_data(df)
-            cleaned_count = len(df)
+                return None, f'Estructura de archivo inválida: {"; ".join(structure_errors)}'
+        
+        missing_fields = [field for field in adapter.required_columns if field not in df_clean.columns]
+        if missing_fields:
+            return None, f'Campos requeridos faltantes: {", ".join(missing_fields)}'
+        
+        if adapter.frame_normalizer:
+            df_clean = getattr(self.data_normalizer, adapter.frame_normalizer)(df_clean)
+            if df_clean is None or df_clean.empty:
+                return None, f'Error en normalización de datos {adapter.label}'
+        
+        if adapter.frame_cleaner:
+            df_clean = getattr(self, adapter.frame_cleaner)(df_clean)
+            if df_clean.empty:
+                return None, 'No quedaron registros válidos después de la limpieza'
+        
+        # Filtrar registros sin datos en campos críticos
+        if adapter.dropna_columns:
+            df_clean = df_clean.dropna(subset=list(adapter.dropna_columns))
+        df_clean = df_clean.copy()
+        
+        # Decimales con coma (coordenadas, potencia)
+        for column in adapter.decimal_comma_columns:
+            if column in df_clean.columns:
+                df_clean[column] = pd.to_numeric(
+                    df_clean[column].astype(str).str.replace(',', '.').str.strip('"\'')
+                    .replace(['', 'nan', 'None'], None),
+                    errors='coerce'
+                )
+        
+        for column in adapter.numeric_columns:
+            if column in df_clean.columns:
+                df_clean[column] = pd.to_numeric(df_clean[column], errors='coerce').fillna(0)
+        
+        return df_clean, None
+    
+    def _split_by_direction(self, adapter: IngestionAdapter, df_clean: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """DataFrames limpios por sentido ('ENTRANTE', 'SALIENTE' o DATA_DIRECTION)"""
+        if not adapter.direction_column:
+            return {adapter.default_direction: df_clean}
+        
+        direction = df_clean[adapter.direction_column].astype(str).str.upper()
+        return {
+            direction_name: df_clean[direction.isin(values)]
+            for direction_name, values in adapter.direction_values.items()
+        }
+    
+    def _prepare_sheet_rows(self, result: Dict[str, Any], frames_by_direction: Dict[str, pd.DataFrame],
+                            build_params) -> None:
+        """
+        Normaliza los registros de una pestaña y acumula sus parámetros de inserción.
+        
+        Args:
+            result: Resultado de la pestaña (se modifica)
+            frames_by_direction: DataFrames limpios por sentido ('ENTRANTE', 'SALIENTE', 'DATOS')
+            build_params: Función (registro, sentido) -> tupla de parámetros o None
+        """
+        for direction, df_direction in frames_by_direction.items():
+            result['direction_counts'][direction] = len(df_direction)
             
-            if cleaned_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No quedaron registros válidos después de la limpieza'
-                }
+            # to_dict('records') arma los registros sin crear una Serie por fila
+            for index, row_data in zip(df_direction.index, df_direction.to_dict('records')):
+                error = None
+                try:
+                    insert_params = build_params(row_data, direction)
+                    if insert_params is None:
+                        error = 'No se pudo normalizar el registro'
+                    else:
+                        result['rows'].append((insert_params, index + 1))
+                except Exception as e:
+                    error = f'Error procesando registro: {str(e)}'
+                
+                if error:
+                    result['records_failed'] += 1
+                    if len(result['failed_records']) < 10:
+                        result['failed_records'].append({
+                            'sheet': result['sheet_name'],
+                            'row': index + 1,
+                            'errors': [error],
+                            'record': row_data
+                        })
+    
+    def _drop_invalid_records(self, result: Dict[str, Any], df_clean: pd.DataFrame,
+                              record_validator) -> pd.DataFrame:
+        """
+        Descarta los registros que no pasan la validación del adaptador.
+        
+        Args:
+            result: Resultado de la pestaña (acumula validation_failed y el detalle)
+            df_clean: DataFrame limpio
+            record_validator: Función (DataFrame) -> [(mensaje, máscara de filas inválidas)]
+        
+        Returns:
+            DataFrame con los registros válidos
+        """
+        checks = record_validator(df_clean)
+        if not checks:
+            return df_clean
+        
+        invalid = pd.Series(False, index=df_clean.index)
+        for _, mask in checks:
+            invalid |= mask
+        
+        result['validation_failed'] = int(invalid.sum())
+        for position in invalid.to_numpy().nonzero()[0][:10]:
+            result['failed_records'].append({
+                'sheet': result['sheet_name'],
+                'row': int(df_clean.index[position]) + 1,
+                'errors': [message for message, mask in checks if mask.iloc[position]],
+                'record': df_clean.iloc[[position]].to_dict('records')[0]
+            })
+        
+        return df_clean[~invalid]
+    
+    def _prepare_adapter_frame(self, adapter: IngestionAdapter, df: pd.DataFrame, sheet_name: str,
+                               sheet_index: int, file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+        """
+        Limpia una pestaña (o el CSV) y arma los parámetros de inserción de sus registros.
+        
+        Returns:
+            Resultado de la pestaña; status 'failed' si no tiene el formato del adaptador
+        """
+        result = self._new_sheet_result(sheet_name, sheet_index)
+        try:
+            result['records'] = len(df)
+            result['columns'] = len(df.columns)
             
-            if cleaned_count < original_count:
-                self.logger.warning(
-                    f"Se descartaron {original_count - cleaned_count} registros durante la limpieza SCANHUNTER"
-                )
+            df_clean, clean_error = self._clean_with_adapter(adapter, df)
+            if clean_error:
+                raise ValueError(clean_error)
             
-            # === ETAPA 4: PROCESAMIENTO POR CHUNKS ===
+            if adapter.record_validator:
+                df_clean = self._drop_invalid_records(result, df_clean, getattr(self, adapter.record_validator))
             
-            total_processed = 0
-            total_failed = 0
-            chunk_number = 0
-            processing_errors = []
+            if adapter.technology_column and adapter.technology_column in df_clean.columns:
+                result['technology_counts'] = {
+                    technology: int(count)
+                    for technology, count in df_clean[adapter.technology_column].value_counts().items()
+                }
             
-            # Procesar en chunks para manejar archivos grandes
-            for start_idx in range(0, len(df), self.CHUNK_SIZE):
-                chunk_number += 1
-                end_idx = min(start_idx + self.CHUNK_SIZE, len(df))
-                chunk_df = df.iloc[start_idx:end_idx]
-                
-                self.logger.debug(f"Procesando chunk SCANHUNTER {chunk_number}: registros {start_idx+1} a {end_idx}")
-                
-                chunk_result = self._process_scanhunter_chunk(
-                    chunk_df, file_upload_id, mission_id, chunk_number
-                )
-                
-                if chunk_result.get('success', False):
-                    total_processed += chunk_result.get('records_processed', 0)
-                    total_failed += chunk_result.get('records_failed', 0)
-                    
-                    # Acumular errores detallados (limitado)
-                    if chunk_result.get('failed_records'):
-                        processing_errors.extend(chunk_result['failed_records'][:5])
-                        if len(processing_errors) > 20:  # Límite total de errores detallados
-                            processing_errors = processing_errors[:20]
+            build_params = getattr(self, adapter.params_builder)
+            self._prepare_sheet_rows(
+                result,
+                self._split_by_direction(adapter, df_clean),
+                lambda row_data, direction: build_params(row_data, direction, file_upload_id, mission_id)
+            )
+        
+        except Exception as e:
+            result.update(status='failed', error=str(e), rows=[])
+        
+        return result
+    
+    def _excel_read_options(self, adapter: IngestionAdapter) -> Dict[str, Any]:
+        """Opciones de lectura del Excel: columnas del adaptador y, si corresponde, celdas como texto"""
+        options = {'columns': list(adapter.read_columns) if adapter.read_columns else None}
+        if adapter.read_as_text:
+            options.update(dtype=str, na_filter=False)
+        return options
+    
+    def _prepare_adapter_sheet(self, file_bytes: bytes, sheet_name: str, sheet_index: int,
+                               total_sheets: int, adapter: IngestionAdapter, file_upload_id: str,
+                               mission_id: str) -> Dict[str, Any]:
+        """
+        Tarea de pestaña: lee, limpia y normaliza una pestaña sin escribir en BD.
+        Se ejecuta en un proceso del pool (ver services.parallel_sheet_processor).
+        """
+        started = time.perf_counter()
+        try:
+            df_sheet = read_excel_sheet(file_bytes, sheet_name=sheet_name, **self._excel_read_options(adapter))
+        except Exception as e:
+            result = self._new_sheet_result(sheet_name, sheet_index)
+            result.update(status='failed', error=str(e))
+            return result
+        
+        return self._prepare_adapter_sheet_frame(df_sheet, sheet_name, sheet_index, total_sheets, adapter,
+                                                 file_upload_id, mission_id, started)
+    
+    def _prepare_adapter_sheet_frame(self, df_sheet: pd.DataFrame, sheet_name: str, sheet_index: int,
+                                     total_sheets: int, adapter: IngestionAdapter, file_upload_id: str,
+                                     mission_id: str, started: float) -> Dict[str, Any]:
+        """Limpia y normaliza una pestaña ya leída (started: inicio de su lectura)"""
+        if len(df_sheet) == 0:
+            result = self._new_sheet_result(sheet_name, sheet_index)
+            result['status'] = 'empty'
+            return result
+        
+        # Agregar metadatos de origen
+        sheet_values = {'sheet_name': sheet_name, 'sheet_index': sheet_index, 'total_sheets': total_sheets}
+        for column, source in adapter.sheet_metadata_columns.items():
+            df_sheet[column] = sheet_values[source]
+        
+        result = self._prepare_adapter_frame(adapter, df_sheet, sheet_name, sheet_index, file_upload_id, mission_id)
+        result['prepare_seconds'] = time.perf_counter() - started
+        return result
+    
+    def _iter_adapter_sheets_serial(self, file_bytes: bytes, sheet_names: List[str], excel_engine: str,
+                                    adapter: IngestionAdapter, file_upload_id: str,
+                                    mission_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Prepara las pestañas en el proceso principal abriendo el libro una sola
+        vez (read_excel_sheets). Si la lectura falla, las pestañas pendientes se
+        leen una por una con _prepare_adapter_sheet.
+        """
+        total_sheets = len(sheet_names)
+        prepared = 0
+        try:
+            started = time.perf_counter()
+            sheets = read_excel_sheets(file_bytes, engine=excel_engine, **self._excel_read_options(adapter))
+            for sheet_index, (sheet_name, df_sheet) in enumerate(sheets, 1):
+                result = self._prepare_adapter_sheet_frame(df_sheet, sheet_name, sheet_index, total_sheets,
+                                                           adapter, file_upload_id, mission_id, started)
+                prepared = sheet_index
+                yield result
+                started = time.perf_counter()
+            return
+        except Exception as e:
+            self.logger.warning(f"Lectura del libro completo falló ({e}), leyendo "
+                                f"{total_sheets - prepared} pestañas una por una")
+        
+        for sheet_index, sheet_name in enumerate(sheet_names[prepared:], prepared + 1):
+            yield self._prepare_adapter_sheet(file_bytes, sheet_name, sheet_index, total_sheets,
+                                              adapter, file_upload_id, mission_id)
+    
+    def _pack_insert_params(self, specific_packer: OperatorSpecificDataPacker, insert_sql: str,
+                            insert_params: Tuple) -> Tuple:
+        """
+        Reemplaza operator_specific_data de los parámetros preparados por su
+        versión compacta (ver utils.operator_specific_codec).
+        """
+        position = specific_data_position(insert_sql)
+        params = list(insert_params)
+        params[position] = specific_packer.pack(params[position])
+        return tuple(params)
+    
+    def _write_prepared_rows(self, insert_sql: str, sheet_result: Dict[str, Any], file_upload_id: str,
+                             mission_id: str, max_failures: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Escritor único: inserta los registros preparados de una pestaña en
+        transacciones de CHUNK_SIZE filas.
+        
+        Cada lote se inserta con executemany; si SQLite rechaza alguna fila, el
+        lote se deshace y se inserta fila a fila para clasificar los errores.
+        Las estructuras derivadas de la tabla (IDs del diccionario de celdas,
+        índice de búsqueda de números) se mantienen una vez por lote con sentencias set-based, en la misma
+        transacción; sus triggers fila a fila no se ejecutan para el lote.
+        
+        Args:
+            insert_sql: INSERT del adaptador
+            sheet_result: Resultado preparado de la pestaña
+            file_upload_id: ID del archivo cargado
+            mission_id: ID de la misión (base de datos de la misión)
+            max_failures: Errores de validación y otros errores tolerados en la
+                pestaña; al superarlos se deja de escribir (aborted)
+        
+        Returns:
+            Dict con insertados, duplicados, errores de validación y otros errores
+        """
+        counts = {'records_processed': 0, 'records_duplicated': 0, 'validation_failed': 0,
+                  'other_errors': 0, 'failed_records': [], 'batches': 0, 'row_fallback_batches': 0,
+                  'aborted': False}
+        rows = sheet_result['rows']
+        if max_failures is not None and max_failures < 0:
+            counts['aborted'] = True
+        if not rows or counts['aborted']:
+            return counts
+        
+        packs_specific_data = specific_data_position(insert_sql) is not None
+        table = insert_table(insert_sql)
+        batch_maintainers = self._batch_maintainers(table)
+        with get_db_connection(mission_id) as conn:
+            cursor = conn.cursor()
+            specific_packer = OperatorSpecificDataPacker.load(cursor, file_upload_id) if packs_specific_data else None
+            
+            for start in range(0, len(rows), self.CHUNK_SIZE):
+                batch = rows[start:start + self.CHUNK_SIZE]
+                if specific_packer:
+                    batch = [
+                        (self._pack_insert_params(specific_packer, insert_sql, insert_params), row_number)
+                        for insert_params, row_number in batch
+                    ]
+                counts['batches'] += 1
+                after_id = self._begin_batch_write(cursor, table) if batch_maintainers else None
+                try:
+                    cursor.executemany(insert_sql, [params for params, _ in batch])
+                    counts['records_processed'] += len(batch)
+                except sqlite3.Error:
+                    conn.rollback()
+                    counts['row_fallback_batches'] += 1
+                    if batch_maintainers:
+                        # El ROLLBACK descartó la marca del lote
+                        self._begin_batch_write(cursor, table)
+                    self._write_rows_one_by_one(cursor, insert_sql, batch, sheet_result['sheet_name'], counts)
+                
+                if batch_maintainers:
+                    for maintain in batch_maintainers:
+                        maintain(cursor, table, after_id)
+                    cursor.execute(END_BATCH_WRITE_SQL, (table,))
+                if specific_packer:
+                    specific_packer.save(cursor)
+                conn.commit()
                 
+                # Tope de errores verificado por lote (los duplicados no cuentan)
+                if max_failures is not None and counts['validation_failed'] + counts['other_errors'] > max_failures:
+                    counts['aborted'] = True
+                    break
+        
+        return counts
+    
+    def _batch_maintainers(self, table: str) -> List:
+        """
+        Mantenimientos set-based de la tabla, ejecutados una vez por lote con
+        (cursor, tabla, último ID anterior al lote)
+        
+        Un servicio que no está listo queda fuera: sus triggers (si existen)
+        mantienen las filas del lote.
+        """
+        maintainers = []
+        if table in CELL_KEY_COLUMNS:
+            cell_dictionary = get_cell_dictionary_service()
+            try:
+                if cell_dictionary.ensure_ready():
+                    maintainers.append(cell_dictionary.assign_batch)
+            except CellDictionaryServiceError as e:
+                self.logger.warning(f"Diccionario de celdas no disponible para la carga: {e}")
+        if table in NUMBER_INDEX_SOURCES:
+            number_index = get_number_search_index_service()
+            try:
+                if number_index.ensure_ready():
+                    maintainers.append(number_index.add_batch)
+            except NumberSearchIndexServiceError as e:
+                self.logger.warning(f"Índice de números no disponible para la carga: {e}")
+        return maintainers
+    
+    def _begin_batch_write(self, cursor, table: str) -> int:
+        """Marca el lote (desactiva los triggers de respaldo) y retorna el último ID de la tabla"""
+        cursor.execute(BEGIN_BATCH_WRITE_SQL, (table,))
+        return cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+    
+    def _write_rows_one_by_one(self, cursor, insert_sql: str, batch: List[Tuple], sheet_name: str,
+                               counts: Dict[str, Any]) -> None:
+        """Inserta un lote fila a fila clasificando duplicados, validación y otros errores"""
+        for params, row_number in batch:
+            try:
+                cursor.execute(insert_sql, params)
+                counts['records_processed'] += 1
+            except Exception as e:
+                error_str = str(e)
+                if "UNIQUE constraint failed" in error_str:
+                    counts['records_duplicated'] += 1
+                    continue
+                if "constraint failed" in error_str.lower() or "check constraint" in error_str.lower():
+                    counts['validation_failed'] += 1
                 else:
-                    # Error crítico en el chunk
-                    error_msg = chunk_result.get('error', 'Error desconocido en chunk')
-                    self.logger.error(f"Error crítico en chunk SCANHUNTER {chunk_number}: {error_msg}")
-                    
-                    return {
-                        'success': False,
-                        'error': f'Error crítico en procesamiento chunk {chunk_number}: {error_msg}',
-                        'partial_results': {
-                            'processedRecords': total_processed,
-                            'records_failed': total_failed,
-                            'chunks_completed': chunk_number - 1
-                        }
-                    }
-                
-                # Verificar si hay demasiados errores
-                if total_failed > self.MAX_ERRORS_PER_FILE:
-                    self.logger.error(
-                        f"Demasiados errores en SCANHUNTER ({total_failed}), abortando procesamiento"
-                    )
-                    return {
-                        'success': False,
-                        'error': f'Demasiados errores: {total_failed} > {self.MAX_ERRORS_PER_FILE}',
-                        'partial_results': {
-                            'processedRecords': total_processed,
-                            'records_failed': total_failed,
-                            'chunks_completed': chunk_number
-                        }
-                    }
-            
-            # === RESULTADO FINAL ===
+                    counts['other_errors'] += 1
+                if len(counts['failed_records']) < 10:
+                    counts['failed_records'].append({
+                        'sheet': sheet_name,
+                        'row': row_number,
+                        'errors': [error_str]
+                    })
+    
+    def _ingest_sheet_results(self, adapter: IngestionAdapter, sheet_results, total_sheets: int,
+                              file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+        """
+        Escribe cada pestaña preparada apenas llega y acumula sus estadísticas.
+        
+        Si el adaptador tiene tope de errores (max_failed_records) y se supera,
+        la carga se detiene y totals['aborted'] queda en True.
+        
+        Args:
+            adapter: Adaptador del formato
+            sheet_results: Resultados de pestaña (de iter_sheet_results o del CSV)
+            total_sheets: Número de pestañas del archivo
+            file_upload_id: ID del archivo cargado
+            mission_id: ID de la misión
+        
+        Returns:
+            Dict con estadísticas por pestaña y contadores agregados
+        """
+        sheet_stats = {
+            'total_sheets': total_sheets,
+            'successful_sheets': 0,
+            'failed_sheets': 0,
+            'empty_sheets': 0,
+            'sheet_details': {},
+            'failed_sheet_errors': {}
+        }
+        totals = {
+            'records_processed': 0,
+            'preparation_failed': 0,
+            'aborted': False,
+            'records_duplicated': 0,
+            'validation_failed': 0,
+            'other_errors': 0,
+            'failed_records': [],
+            'direction_counts': {},
+            'technology_counts': {},
+            'prepare_seconds': 0.0,
+            'write_seconds': 0.0,
+            'batches': 0,
+            'row_fallback_batches': 0,
+            'sheet_stats': sheet_stats
+        }
+        
+        for sheet_result in sheet_results:
+            sheet_name = sheet_result['sheet_name']
+            totals['prepare_seconds'] += sheet_result['prepare_seconds']
             
-            processing_time = (datetime.now() - start_time).total_seconds()
-            success_rate = (total_processed / (total_processed + total_failed)) * 100 if (total_processed + total_failed) > 0 else 0
+            if sheet_result['status'] == 'empty':
+                sheet_stats['empty_sheets'] += 1
+                sheet_stats['sheet_details'][sheet_name] = {
+                    'status': 'empty', 'records': 0, 'columns': 0, 'error': None
+                }
+                self.logger.warning(f"Hoja '{sheet_name}' está vacía, omitiendo")
+                continue
             
-            result = {
-                'success': True,
-                'processedRecords': total_processed,
-                'records_failed': total_failed,
-                'success_rate': round(success_rate, 2),
-                'processing_time_seconds': round(processing_time, 2),
-                'chunks_processed': chunk_number,
-                'file_info': {
-                    'name': file_name,
-                    'size_bytes': len(file_bytes),
-                    'original_records': original_count,
-                    'cleaned_records': cleaned_count
+            if sheet_result['status'] == 'failed':
+                sheet_stats['failed_sheets'] += 1
+                sheet_stats['failed_sheet_errors'][sheet_name] = sheet_result['error']
+                sheet_stats['sheet_details'][sheet_name] = {
+                    'status': 'failed', 'records': 0, 'columns': 0, 'error': sheet_result['error']
                 }
-            }
+                self.logger.error(f"Error procesando hoja '{sheet_name}' "
+                                  f"({sheet_result['sheet_index']}/{total_sheets}): {sheet_result['error']}")
+                continue
             
-            # Agregar errores detallados si los hay
-            if processing_errors:
-                result['processing_errors'] = processing_errors
+            # Errores que quedan antes del tope (los de preparación y validación de la pestaña cuentan primero)
+            max_failures = None
+            if adapter.max_failed_records is not None:
+                max_failures = adapter.max_failed_records - self._real_failures(totals) - (
+                    sheet_result['records_failed'] + sheet_result['validation_failed'])
+            
+            write_started = time.perf_counter()
+            written = self._write_prepared_rows(adapter.insert_sql, sheet_result, file_upload_id,
+                                                mission_id, max_failures)
+            totals['write_seconds'] += time.perf_counter() - write_started
+            
+            totals['records_processed'] += written['records_processed']
+            totals['preparation_failed'] += sheet_result['records_failed']
+            totals['validation_failed'] += sheet_result['validation_failed']
+            for key in ('records_duplicated', 'validation_failed', 'other_errors', 'batches', 'row_fallback_batches'):
+                totals[key] += written[key]
+            totals['failed_records'].extend(sheet_result['failed_records'] + written['failed_records'])
+            for counter in ('direction_counts', 'technology_counts'):
+                for key, value in sheet_result[counter].items():
+                    totals[counter][key] = totals[counter].get(key, 0) + int(value)
+            
+            sheet_stats['successful_sheets'] += 1
+            sheet_stats['sheet_details'][sheet_name] = {
+                'status': 'success',
+                'records': sheet_result['records'],
+                'columns': sheet_result['columns'],
+                'error': None,
+                'records_processed': written['records_processed'],
+                'records_failed': (sheet_result['records_failed'] + sheet_result['validation_failed'] +
+                                   written['records_duplicated'] + written['validation_failed'] +
+                                   written['other_errors'])
+            }
             
             self.logger.info(
-                f"SCANHUNTER procesado exitosamente: {total_processed} registros, "
-                f"{success_rate:.2f}% éxito, {processing_time:.2f}s",
-                extra={
-                    'processedRecords': total_processed,
-                    'records_failed': total_failed,
-                    'processing_time': processing_time,
-                    'file_upload_id': file_upload_id
-                }
+                f"Hoja '{sheet_name}' procesada: {sheet_result['records']} registros, "
+                f"{written['records_processed']} insertados"
             )
             
-            return result
-            
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self.logger.error(
-                f"Error crítico procesando SCANHUNTER {file_name}: {str(e)}",
-                exc_info=True,
-                extra={'file_upload_id': file_upload_id, 'processing_time': processing_time}
+            if written['aborted']:
+                totals['aborted'] = True
+                self.logger.error(f"Demasiados errores ({self._real_failures(totals)}), abortando procesamiento "
+                                  f"{adapter.label}")
+                # No preparar las pestañas pendientes
+                if hasattr(sheet_results, 'close'):
+                    sheet_results.close()
+                break
+        
+        return totals
+    
+    def _real_failures(self, totals: Dict[str, Any]) -> int:
+        """Registros fallidos que cuentan para el tope de errores (sin duplicados)"""
+        return totals['preparation_failed'] + totals['validation_failed'] + totals['other_errors']
+    
+    def _sheet_summary(self, sheet_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Resumen de pestañas incluido en los detalles del resultado"""
+        return {
+            'total_sheets': sheet_stats['total_sheets'],
+            'successful_sheets': sheet_stats['successful_sheets'],
+            'failed_sheets': sheet_stats['failed_sheets'],
+            'empty_sheets': sheet_stats['empty_sheets'],
+            'successful_sheet_names': [name for name, details in sheet_stats['sheet_details'].items() if details['status'] == 'success'],
+            'failed_sheet_names': list(sheet_stats['failed_sheet_errors'].keys()),
+            'sheet_record_counts': {name: details['records'] for name, details in sheet_stats['sheet_details'].items() if details['status'] == 'success'}
+        }
+    
+    def _update_final_processing_status(self, file_upload_id: str, records_processed: int,
+                                        records_failed: int, processing_time, label: str,
+                                        processing_status: str) -> None:
+        """Actualiza operator_data_sheets con el resultado final del procesamiento"""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                UPDATE operator_data_sheets
+                SET processing_status = ?,
+                    records_processed = ?,
+                    records_failed = ?,
+                    processing_end_time = CURRENT_TIMESTAMP,
+                    processing_duration_seconds = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (
+                processing_status,
+                records_processed,
+                records_failed,
+                int(processing_time.total_seconds()),
+                file_upload_id
+            ))
+            
+            conn.commit()
+            
+            self.logger.info(f"Estado de procesamiento {label} actualizado: {processing_status}")
+    
+    def _no_sheet_data_error(self, sheet_stats: Dict[str, Any], error_prefix: str) -> Dict[str, Any]:
+        """Resultado de error cuando ninguna pestaña aportó datos"""
+        error_details = []
+        if sheet_stats['failed_sheets'] > 0:
+            first_error = next(iter(sheet_stats['failed_sheet_errors'].values()))
+            error_details.append(f"{sheet_stats['failed_sheets']} hojas fallaron ({first_error})")
+        if sheet_stats['empty_sheets'] > 0:
+            error_details.append(f"{sheet_stats['empty_sheets']} hojas estaban vacías")
+        
+        return {
+            'success': False,
+            'error': f"{error_prefix}. {'; '.join(error_details)}",
+            'records_processed': 0,
+            'records_failed': 0,
+            'sheet_processing_details': sheet_stats
+        }
+    
+    def _adapter_final_result(self, adapter: IngestionAdapter, totals: Dict[str, Any], file_upload_id: str,
+                              start_time: datetime, is_excel: bool, parallel: bool) -> Dict[str, Any]:
+        """
+        Arma el resultado del archivo y actualiza su estado final en operator_data_sheets.
+        
+        Los registros que no se pudieron normalizar cuentan como otros errores;
+        los duplicados solo cuentan como fallidos si el adaptador lo indica.
+        La carga es exitosa salvo que se haya superado el tope de errores o que
+        la tasa de éxito (sin contar duplicados) quede bajo min_success_rate.
+        """
+        sheet_stats = totals['sheet_stats']
+        total_records_processed = totals['records_processed']
+        total_validation_failed = totals['validation_failed']
+        total_other_errors = totals['other_errors'] + totals['preparation_failed']
+        effective_failures = total_validation_failed + total_other_errors
+        total_records_failed = effective_failures
+        if adapter.duplicates_are_failures:
+            total_records_failed += totals['records_duplicated']
+        attempted = total_records_processed + effective_failures
+        success_rate = total_records_processed / attempted * 100 if attempted else 0.0
+        
+        error = None
+        if totals['aborted']:
+            error = f'Demasiados errores en el archivo ({effective_failures}). Verifique el formato.'
+        elif adapter.min_success_rate is not None and not (
+                total_records_processed > 0 and
+                (effective_failures == 0 or success_rate >= adapter.min_success_rate)):
+            error = f'Tasa de éxito baja ({success_rate:.1f}%). Verifique el formato del archivo.'
+        
+        if error or (adapter.min_success_rate is None and total_records_failed > 0):
+            processing_status = 'FAILED'
+        else:
+            processing_status = 'COMPLETED'
+        processing_time = datetime.now() - start_time
+        elapsed_seconds = processing_time.total_seconds()
+        
+        details = {
+            'processing_time_seconds': elapsed_seconds,
+            'sheets_combined': sheet_stats['successful_sheets'],
+            'ingestion_metrics': {
+                'prepare_seconds': round(totals['prepare_seconds'], 3),   # Suma de las pestañas
+                'write_seconds': round(totals['write_seconds'], 3),
+                'records_per_second': round(total_records_processed / elapsed_seconds, 1) if elapsed_seconds > 0 else None,
+                'write_batches': totals['batches'],
+                'row_fallback_batches': totals['row_fallback_batches']
+            }
+        }
+        for direction in adapter.direction_values:
+            details[f'{direction.lower()}s_processed'] = totals['direction_counts'].get(direction, 0)
+        if adapter.technology_detail_key:
+            details[adapter.technology_detail_key] = totals['technology_counts']
+        if is_excel:
+            details['sheet_processing_summary'] = self._sheet_summary(sheet_stats)
+        if parallel:
+            details['parallel_sheets'] = True
+        
+        self.logger.info(
+            f"Procesamiento {adapter.label} completado con {sheet_stats['successful_sheets']} hojas exitosas: "
+            f"{total_records_processed} exitosos, {total_records_failed} fallidos",
+            extra={
+                'processing_time_seconds': elapsed_seconds,
+                'ingestion_metrics': details['ingestion_metrics']
+            }
+        )
+        
+        try:
+            self._update_final_processing_status(
+                file_upload_id, total_records_processed, total_records_failed, processing_time, adapter.label,
+                processing_status
             )
+        except Exception as update_error:
+            self.logger.error(f"Error actualizando estado final {adapter.label}: {update_error}")
+        
+        result = {
+            'success': error is None,
+            'processedRecords': total_records_processed,
+            'records_processed': total_records_processed,
+            'records_failed': total_records_failed,
+            'records_duplicated': totals['records_duplicated'],
+            'records_validation_failed': total_validation_failed,
+            'records_other_errors': total_other_errors,
+            'success_rate': round(success_rate, 2),
+            'failed_records': totals['failed_records'][:10],
+            'details': details
+        }
+        if error:
+            result['error'] = error
+        return result
+    
+    def process_scanhunter_data(self, file_bytes: bytes, file_name: str,
+                               file_upload_id: str, mission_id: str) -> Dict[str, Any]:
+        """
+        Procesa un archivo de datos SCANHUNTER para mediciones de scanner celular.
+        
+        SCANHUNTER es un formato específico para datos de scanner celular con columnas:
+        ['Id', 'Punto', 'Latitud', 'Longitud', 'MNC+MCC', 'OPERADOR', 'RSSI', 
+         'TECNOLOGIA', 'CELLID', 'LAC o TAC', 'ENB', 'Comentario', 'CHANNEL']
+        
+        El formato se describe en SCANHUNTER_ADAPTER
+        (services.operator_ingestion_adapters) y lo procesa process_with_adapter.
+        
+        Args:
+            file_bytes (bytes): Contenido del archivo
+            file_name (str): Nombre del archivo
+            file_upload_id (str): ID único del archivo
+            mission_id (str): ID de la misión
             
-            return {
-                'success': False,
-                'error': f'Error crítico: {str(e)}',
-                'processing_time_seconds': round(processing_time, 2)
-            }
+        Returns:
+            Dict[str, Any]: Resultado del procesamiento
+        """
+        return self.process_with_adapter(SCANHUNTER_ADAPTER, file_bytes, file_name, file_upload_id, mission_id)
 
     def _validate_scanhunter_columns(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
@@ -4279,177 +2286,60 @@ class FileProcessorService:
             # Devolver DataFrame original en caso de error
             return df
 
-    def _process_scanhunter_chunk(self, chunk_df: pd.DataFrame, file_upload_id: str,
-                                 mission_id: str, chunk_number: int) -> Dict[str, Any]:
+    def _build_scanhunter_params(self, row_data: Dict[str, Any], direction: str,
+                                 file_upload_id: str, mission_id: str) -> Optional[tuple]:
         """
-        Procesa un chunk de datos SCANHUNTER.
+        Normaliza una medición SCANHUNTER y construye los parámetros de
+        SCANHUNTER_INSERT_SQL.
         
-        Args:
-            chunk_df (pd.DataFrame): Chunk de datos a procesar
-            file_upload_id (str): ID del archivo
-            mission_id (str): ID de la misión
-            chunk_number (int): Número del chunk para logging
-            
         Returns:
-            Dict[str, Any]: Resultado del procesamiento del chunk
+            Tupla de parámetros, o None si el registro no se pudo normalizar
         """
-        records_processed = 0
-        records_failed = 0
-        failed_records = []
-        
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                for index, row in chunk_df.iterrows():
-                    try:
-                        # Convertir fila a diccionario
-                        record = row.to_dict()
-                        
-                        # Validar registro
-                        is_valid, errors = self._validate_scanhunter_record(record)
-                        if not is_valid:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': errors,
-                                'record': record
-                            })
-                            
-                            if len(failed_records) > 10:  # Limitar detalle de errores
-                                break
-                            continue
-                        
-                        # Normalizar datos usando DataNormalizerService
-                        normalized_data = self.data_normalizer.normalize_scanhunter_data(
-                            record, file_upload_id, mission_id
-                        )
-                        
-                        if not normalized_data:
-                            records_failed += 1
-                            failed_records.append({
-                                'row': index + 1,
-                                'errors': ['Error en normalización'],
-                                'record': record
-                            })
-                            continue
-                        
-                        # Insertar en tabla cellular_data (que ya tiene los campos expandidos)
-                        cursor.execute("""
-                            INSERT INTO cellular_data (
-                                mission_id, file_record_id, punto, lat, lon, mnc_mcc, operator,
-                                rssi, tecnologia, cell_id, lac_tac, enb, 
-                                comentario, channel, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (
-                            normalized_data['mission_id'],
-                            normalized_data.get('file_record_id'),
-                            normalized_data['punto'],
-                            normalized_data['lat'],
-                            normalized_data['lon'],
-                            normalized_data['mnc_mcc'],
-                            normalized_data['operator'],
-                            normalized_data['rssi'],
-                            normalized_data['tecnologia'],
-                            normalized_data['cell_id'],
-                            normalized_data['lac_tac'],
-                            normalized_data['enb'],
-                            normalized_data['comentario'],
-                            normalized_data['channel']
-                        ))
-                        
-                        records_processed += 1
-                        
-                    except Exception as e:
-                        records_failed += 1
-                        failed_records.append({
-                            'row': index + 1,
-                            'errors': [f'Error procesando registro: {str(e)}'],
-                            'record': record if 'record' in locals() else {}
-                        })
-                        
-                        self.logger.error(
-                            f"Error procesando registro SCANHUNTER {index + 1}: {str(e)}",
-                            extra={'chunk_number': chunk_number, 'row_index': index}
-                        )
-                        
-                        if len(failed_records) > 10:
-                            break
-                
-                # Commit del chunk
-                conn.commit()
-                
-            self.logger.info(
-                f"Chunk SCANHUNTER {chunk_number} procesado: "
-                f"{records_processed} exitosos, {records_failed} fallidos"
-            )
-            
-            return {
-                'success': True,
-                'records_processed': records_processed,
-                'records_failed': records_failed,
-                'failed_records': failed_records if failed_records else None
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error crítico en chunk SCANHUNTER {chunk_number}: {str(e)}", exc_info=True)
-            return {
-                'success': False,
-                'error': str(e),
-                'records_processed': records_processed,
-                'records_failed': records_failed
-            }
+        normalized_data = self.data_normalizer.normalize_scanhunter_data(
+            row_data, file_upload_id, mission_id
+        )
+        if not normalized_data:
+            return None
+        
+        return (
+            normalized_data['mission_id'],
+            normalized_data.get('file_record_id'),
+            normalized_data['punto'],
+            normalized_data['lat'],
+            normalized_data['lon'],
+            normalized_data['mnc_mcc'],
+            normalized_data['operator'],
+            normalized_data['rssi'],
+            normalized_data['tecnologia'],
+            normalized_data['cell_id'],
+            normalized_data['lac_tac'],
+            normalized_data['enb'],
+            normalized_data['comentario'],
+            normalized_data['channel'],
+            calculate_cellular_record_hash(normalized_data)
+        )
 
-    def _validate_scanhunter_record(self, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def _scanhunter_record_errors(self, df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
         """
-        Valida un registro individual de SCANHUNTER.
+        Validación vectorizada de las mediciones SCANHUNTER.
         
         Args:
-            record (Dict[str, Any]): Registro a validar
+            df (pd.DataFrame): DataFrame limpio (coordenadas, RSSI y MNC+MCC numéricos y sin nulos)
             
         Returns:
-            Tuple[bool, List[str]]: (es_válido, lista_de_errores)
+            List[Tuple[str, pd.Series]]: (mensaje, máscara de registros inválidos)
         """
-        errors = []
-        
-        # Campos obligatorios
-        required_fields = ['Punto', 'Latitud', 'Longitud', 'OPERADOR', 'RSSI', 'TECNOLOGIA', 'CELLID']
-        
-        for field in required_fields:
-            if field not in record or record[field] is None:
-                errors.append(f"Campo obligatorio faltante: {field}")
-            elif field in ['Punto', 'OPERADOR', 'TECNOLOGIA'] and str(record[field]).strip() == '':
-                errors.append(f"Campo obligatorio vacío: {field}")
-        
-        # Validaciones específicas si los campos están presentes
-        try:
-            # Coordenadas
-            if 'Latitud' in record and record['Latitud'] is not None:
-                lat = float(record['Latitud'])
-                if lat < -90 or lat > 90:
-                    errors.append(f"Latitud fuera de rango: {lat}")
-            
-            if 'Longitud' in record and record['Longitud'] is not None:
-                lon = float(record['Longitud'])
-                if lon < -180 or lon > 180:
-                    errors.append(f"Longitud fuera de rango: {lon}")
-            
-            # RSSI
-            if 'RSSI' in record and record['RSSI'] is not None:
-                rssi = int(record['RSSI'])
-                if rssi > 0 or rssi < -150:
-                    errors.append(f"RSSI fuera de rango esperado: {rssi} (debe estar entre -150 y 0)")
-            
-            # MNC+MCC
-            if 'MNC+MCC' in record and record['MNC+MCC'] is not None:
-                mnc_mcc = int(record['MNC+MCC'])
-                if mnc_mcc <= 0:
-                    errors.append(f"MNC+MCC inválido: {mnc_mcc}")
-            
-        except (ValueError, TypeError) as e:
-            errors.append(f"Error de tipo de dato: {str(e)}")
-        
-        return len(errors) == 0, errors
+        errors = [
+            (f"Campo obligatorio vacío: {field}", df[field].astype(str).str.strip() == '')
+            for field in ('Punto', 'OPERADOR', 'TECNOLOGIA')
+        ]
+        errors.extend([
+            ("Latitud fuera de rango", ~df['Latitud'].between(-90, 90)),
+            ("Longitud fuera de rango", ~df['Longitud'].between(-180, 180)),
+            ("RSSI fuera de rango esperado (debe estar entre -150 y 0)", ~df['RSSI'].between(-150, 0)),
+            ("MNC+MCC inválido", df['MNC+MCC'] <= 0)
+        ])
+        return errors
 
 
 # ==============================================================================
@@ -18,13 +18,16 @@ Características principales:
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Callable, Set
+from sqlalchemy import func, or_, select, delete
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.orm import joinedload
 
-from database.connection import get_database_manager
+from database.connection import get_database_manager, get_db_connection
 from database.models import (
-    Mission, CellularData, TargetRecord
+    Mission, CellularData, TargetRecord,
+    CELLULAR_HASH_FIELDS, calculate_cellular_record_hash
 )
 from utils.validators import validate_mission_data, ValidationError
 from utils.helpers import (
@@ -33,9 +36,42 @@ from utils.helpers import (
     map_cellular_record_to_frontend
 )
 from .file_processor import get_file_processor, FileProcessorError
+from .bulk_deletion_service import get_bulk_deletion_service, BulkDeletionServiceError
+from .mission_shard_service import get_mission_shard_service
+from .database_maintenance_service import get_database_maintenance_service
 
 logger = logging.getLogger(__name__)
 
+# Límites de paginación para listados livianos
+DEFAULT_PAGE_SIZE = 50
+MAX_MISSIONS_PAGE_SIZE = 500
+MAX_CELLULAR_PAGE_SIZE = 5000
+
+# Carga masiva de datos SCANHUNTER
+CELLULAR_INSERT_BATCH_SIZE = 5000
+CELLULAR_UPLOAD_MODES = ('replace', 'append')
+CELLULAR_INSERT_COLUMNS = (
+    'file_record_id', 'punto', 'lat', 'lon', 'mnc_mcc', 'operator', 'rssi',
+    'tecnologia', 'cell_id', 'lac_tac', 'enb', 'channel', 'comentario'
+)
+CELLULAR_HASH_LOOKUP_CHUNK = 500  # Parámetros por consulta IN (límite SQLite 999)
+
+# Observadores de cambios en datos celulares: callback(mission_id, operators)
+_cellular_change_listeners: List[Callable[[str, Set[str]], None]] = []
+
+
+def register_cellular_change_listener(listener: Callable[[str, Set[str]], None]) -> None:
+    """
+    Registra un callback que se invoca cuando cambian los datos celulares
+    de una misión, para invalidar caches e índices derivados
+    
+    Args:
+        listener: Función que recibe (mission_id, operadores afectados).
+            Un conjunto vacío de operadores indica que cambió toda la misión.
+    """
+    if listener not in _cellular_change_listeners:
+        _cellular_change_listeners.append(listener)
+
 
 class MissionServiceError(Exception):
     """Excepción personalizada para errores del servicio de misiones"""
@@ -98,7 +134,13 @@ class MissionService:
                 
                 result = []
                 for mission in missions:
-                    mission_dict = mission.to_dict_with_relations()
+                    if self._get_db_manager().is_mission_sharded(mission.id):
+                        # El joinedload solo ve kronos.db; cargar desde el archivo de la misión
+                        mission_dict = self.get_mission_by_id(mission.id)
+                        if mission_dict is None:
+                            continue
+                    else:
+                        mission_dict = mission.to_dict_with_relations()
                     result.append(mission_dict)
                 
                 logger.info(f"Recuperadas {len(result)} misiones")
@@ -111,6 +153,148 @@ class MissionService:
             logger.error(f"Error inesperado obteniendo misiones: {e}")
             raise MissionServiceError("Error interno del servidor")
     
+    def get_missions_summary(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE,
+                             search: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Obtiene un listado liviano y paginado de misiones
+        
+        No carga datos celulares: los conteos se calculan con subconsultas
+        COUNT correlacionadas, por lo que el costo no depende del volumen
+        de registros SCANHUNTER de cada misión.
+        
+        Args:
+            page: Número de página (empieza en 1)
+            page_size: Misiones por página (máximo MAX_MISSIONS_PAGE_SIZE)
+            search: Texto opcional a buscar en código, nombre o descripción
+            
+        Returns:
+            Diccionario con 'data', 'total', 'hasMore', 'page' y 'pageSize'
+        """
+        try:
+            page = max(int(page or 1), 1)
+            page_size = min(max(int(page_size or DEFAULT_PAGE_SIZE), 1), MAX_MISSIONS_PAGE_SIZE)
+            offset = (page - 1) * page_size
+            
+            cellular_count = select(func.count(CellularData.id)).where(
+                CellularData.mission_id == Mission.id,
+                CellularData.id > func.coalesce(Mission.cellular_clear_through_id, 0)
+            ).correlate(Mission).scalar_subquery()
+            
+            target_count = select(func.count(TargetRecord.id)).where(
+                TargetRecord.mission_id == Mission.id
+            ).correlate(Mission).scalar_subquery()
+            
+            with self._get_db_manager().get_session() as session:
+                query = session.query(
+                    Mission,
+                    cellular_count.label('cellular_count'),
+                    target_count.label('target_count')
+                )
+                
+                if search and search.strip():
+                    pattern = f"%{search.strip()}%"
+                    query = query.filter(or_(
+                        Mission.code.ilike(pattern),
+                        Mission.name.ilike(pattern),
+                        Mission.description.ilike(pattern)
+                    ))
+                
+                total = query.with_entities(func.count(Mission.id)).scalar() or 0
+                
+                rows = query.order_by(Mission.created_at.desc()).limit(page_size).offset(offset).all()
+                
+                result = []
+                for mission, cellular_records, target_records in rows:
+                    if self._get_db_manager().is_mission_sharded(mission.id):
+                        # La subconsulta solo ve kronos.db; contar en el archivo de la misión
+                        cellular_records = self._count_cellular_records(mission.id)
+                    mission_dict = mission.to_dict()
+                    mission_dict['cellularRecordsCount'] = cellular_records or 0
+                    mission_dict['operatorSheetsCount'] = 0  # Mantener para compatibilidad con frontend
+                    mission_dict['targetRecordsCount'] = target_records or 0
+                    result.append(mission_dict)
+                
+                logger.info(f"Recuperadas {len(result)} de {total} misiones (página {page})")
+                return {
+                    'data': result,
+                    'total': total,
+                    'hasMore': (offset + len(result)) < total,
+                    'page': page,
+                    'pageSize': page_size
+                }
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Error de base de datos obteniendo resumen de misiones: {e}")
+            raise MissionServiceError("Error accediendo a los datos de misiones")
+        except Exception as e:
+            logger.error(f"Error inesperado obteniendo resumen de misiones: {e}")
+            raise MissionServiceError("Error interno del servidor")
+    
+    def _count_cellular_records(self, mission_id: str) -> int:
+        """Cantidad de registros celulares de una misión (enrutado a su almacenamiento)"""
+        with self._get_db_manager().get_session(mission_id) as session:
+            mission = session.query(Mission).filter(Mission.id == mission_id).first()
+            if not mission:
+                return 0
+            return session.query(func.count(CellularData.id)).filter(
+                CellularData.mission_id == mission_id,
+                mission.active_cellular_filter()
+            ).scalar() or 0
+    
+    def get_mission_cellular_data(self, mission_id: str, page: int = 1,
+                                  page_size: int = 1000) -> Dict[str, Any]:
+        """
+        Obtiene los datos celulares de una misión bajo demanda, paginados
+        
+        Args:
+            mission_id: ID de la misión
+            page: Número de página (empieza en 1)
+            page_size: Registros por página (máximo MAX_CELLULAR_PAGE_SIZE)
+            
+        Returns:
+            Diccionario con 'data', 'total', 'hasMore', 'page' y 'pageSize'
+        """
+        try:
+            page = max(int(page or 1), 1)
+            page_size = min(max(int(page_size or 1000), 1), MAX_CELLULAR_PAGE_SIZE)
+            offset = (page - 1) * page_size
+            
+            with self._get_db_manager().get_session(mission_id) as session:
+                mission = session.query(Mission).filter(Mission.id == mission_id).first()
+                if not mission:
+                    raise MissionServiceError("Misión no encontrada")
+                
+                # Los registros de una limpieza en curso ya no se muestran
+                active_filter = mission.active_cellular_filter()
+                total = session.query(func.count(CellularData.id)).filter(
+                    CellularData.mission_id == mission_id, active_filter
+                ).scalar() or 0
+                
+                records = session.query(CellularData).filter(
+                    CellularData.mission_id == mission_id, active_filter
+                ).order_by(
+                    CellularData.file_record_id, CellularData.id
+                ).limit(page_size).offset(offset).all()
+                
+                data = [record.to_dict() for record in records]
+                
+                return {
+                    'data': data,
+                    'total': total,
+                    'hasMore': (offset + len(data)) < total,
+                    'page': page,
+                    'pageSize': page_size
+                }
+                
+        except MissionServiceError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error(f"Error de base de datos obteniendo datos celulares de misión {mission_id}: {e}")
+            raise MissionServiceError("Error accediendo a los datos celulares")
+        except Exception as e:
+            logger.error(f"Error inesperado obteniendo datos celulares de misión {mission_id}: {e}")
+            raise MissionServiceError("Error interno del servidor")
+    
     def get_mission_by_id(self, mission_id: str) -> Optional[Dict[str, Any]]:
         """
         Obtiene una misión por su ID con todos los datos
@@ -122,7 +306,7 @@ class MissionService:
             Diccionario con datos de la misión o None si no existe
         """
         try:
-            with self._get_db_manager().get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 mission = session.query(Mission).options(
                     joinedload(Mission.cellular_data),
                     joinedload(Mission.creator)
@@ -191,8 +375,10 @@ class MissionService:
                 
                 result = created_mission.to_dict_with_relations()
                 logger.info(f"Misión creada exitosamente: {validated_data['code']}")
-                
-                return result
+            
+            # Almacenamiento propio si KRONOS_MISSION_STORAGE=sharded
+            get_mission_shard_service().prepare_new_mission(mission_id)
+            return result
                 
         except ValidationError as e:
             logger.warning(f"Error de validación creando misión: {e}")
@@ -303,7 +489,7 @@ class MissionService:
             # Validar datos para actualización
             validated_data = validate_mission_data(mission_data, is_update=True)
             
-            with self.db_manager.get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 # Buscar misión
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 
@@ -377,9 +563,12 @@ class MissionService:
                 # Eliminar (cascada automática por la configuración en modelos)
                 session.delete(mission)
                 session.commit()
-                
-                logger.info(f"Misión eliminada exitosamente: {mission_code}")
-                return {"status": "ok"}
+            
+            # Las claves foráneas no alcanzan el archivo propio de la misión
+            get_mission_shard_service().drop_mission_shard(mission_id)
+            
+            logger.info(f"Misión eliminada exitosamente: {mission_code}")
+            return {"status": "ok"}
                 
         except MissionServiceError:
             raise
@@ -390,66 +579,100 @@ class MissionService:
             logger.error(f"Error inesperado eliminando misión: {e}")
             raise MissionServiceError("Error interno del servidor")
     
-    def upload_cellular_data(self, mission_id: str, file_data: Dict[str, Any]) -> Dict[str, Any]:
+    def upload_cellular_data(self, mission_id: str, file_data: Dict[str, Any],
+                             mode: str = 'replace') -> Dict[str, Any]:
         """
         Carga datos celulares desde archivo a una misión
         
+        La inserción se hace con INSERT a nivel Core en lotes (executemany)
+        en lugar de un objeto ORM por registro, y la respuesta es un resumen
+        liviano sin el grafo completo de datos celulares.
+        
+        Cada medición se identifica por un hash de contenido y las repetidas
+        dentro del archivo se insertan una sola vez en ambos modos. En modo
+        'append' además se omiten las que ya existen en la misión y solo se
+        invalidan los análisis de los operadores que recibieron datos nuevos,
+        de modo que el costo es proporcional a los datos nuevos y no al tamaño
+        de la misión.
+        
         Args:
             mission_id: ID de la misión
             file_data: Datos del archivo {"name": "...", "content": "..."}
+            mode: 'replace' elimina los datos celulares existentes antes de
+                insertar; 'append' los conserva y agrega solo los nuevos
             
         Returns:
-            Diccionario con la misión actualizada
+            Diccionario con la misión (sin relaciones), sus conteos y
+            'uploadSummary' con el resultado de la carga
         """
         try:
-            logger.info(f"Iniciando carga de datos celulares para misión {mission_id}")
+            if mode not in CELLULAR_UPLOAD_MODES:
+                raise MissionServiceError(
+                    f"Modo de carga no soportado: {mode}. Use: {', '.join(CELLULAR_UPLOAD_MODES)}"
+                )
+            
+            logger.info(f"Iniciando carga de datos celulares para misión {mission_id} (modo: {mode})")
+            start_time = time.time()
             
             # Procesar archivo
             cellular_records = self.file_processor.process_cellular_file(file_data)
+            unique_records = {}
+            for record in cellular_records:
+                record['record_hash'] = calculate_cellular_record_hash(record)
+                unique_records.setdefault(record['record_hash'], record)
             
-            with self.db_manager.get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 # Verificar que la misión existe
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
                     raise MissionServiceError("Misión no encontrada")
                 
-                # Limpiar datos celulares existentes
-                session.query(CellularData).filter(
-                    CellularData.mission_id == mission_id
-                ).delete()
-                
-                # Insertar nuevos datos con todos los campos SCANHUNTER
-                for record in cellular_records:
-                    cellular_data = CellularData(
-                        mission_id=mission_id,
-                        file_record_id=record.get('file_record_id'),  # ID original del archivo SCANHUNTER
-                        punto=record['punto'],
-                        lat=record['lat'],
-                        lon=record['lon'],
-                        mnc_mcc=record['mnc_mcc'],
-                        operator=record['operator'],
-                        rssi=record['rssi'],
-                        tecnologia=record['tecnologia'],
-                        cell_id=record['cell_id'],
-                        lac_tac=record.get('lac_tac'),
-                        enb=record.get('enb'),
-                        channel=record.get('channel'),
-                        comentario=record.get('comentario')
+                deleted_count = 0
+                if mode == 'replace':
+                    # Limpiar datos celulares existentes
+                    deleted_count = session.execute(
+                        delete(CellularData).where(CellularData.mission_id == mission_id)
+                    ).rowcount
+                    new_records = list(unique_records.values())
+                else:
+                    new_records = self._filter_new_cellular_records(
+                        session, mission_id, list(unique_records.values()),
+                        mission.cellular_clear_through_id
                     )
-                    session.add(cellular_data)
                 
-                session.flush()
+                inserted_count = self._bulk_insert_cellular_records(
+                    session, mission_id, new_records, mission.cellular_clear_through_id
+                )
                 
-                # Cargar misión actualizada con relaciones
-                updated_mission = session.query(Mission).options(
-                    joinedload(Mission.cellular_data),
-                    joinedload(Mission.creator)
-                ).filter(Mission.id == mission_id).first()
+                # Invalidar solo lo afectado: toda la misión en replace,
+                # los operadores con datos nuevos en append
+                affected_operators = set() if mode == 'replace' else {r['operator'] for r in new_records}
+                if mode == 'replace' or affected_operators:
+                    self._invalidate_cellular_derived_data(session, mission_id, affected_operators)
                 
                 session.commit()
                 
-                result = updated_mission.to_dict_with_relations()
-                logger.info(f"Datos celulares cargados: {len(cellular_records)} registros")
+                if mode == 'replace' or affected_operators:
+                    self._notify_cellular_change(mission_id, affected_operators)
+                get_database_maintenance_service().record_write_activity(mission_id, inserted_count + deleted_count)
+                
+                result = mission.to_dict()
+                result.update(mission.get_stats())
+                result['uploadSummary'] = {
+                    'mode': mode,
+                    'recordsProcessed': len(cellular_records),
+                    'recordsInserted': inserted_count,
+                    'recordsSkipped': len(cellular_records) - inserted_count,
+                    'recordsDeleted': deleted_count,
+                    'affectedOperators': sorted(affected_operators),
+                    'processingTime': round(time.time() - start_time, 3)
+                }
+                
+                logger.info(
+                    f"Datos celulares cargados: {inserted_count} registros insertados, "
+                    f"{result['uploadSummary']['recordsSkipped']} duplicados omitidos, "
+                    f"{deleted_count} eliminados en {result['uploadSummary']['processingTime']}s"
+                )
                 
                 return result
                 
@@ -465,6 +688,125 @@ class MissionService:
             logger.error(f"Error inesperado cargando datos celulares: {e}")
             raise MissionServiceError("Error interno del servidor")
     
+    def _filter_new_cellular_records(self, session, mission_id: str,
+                                     records: List[Dict[str, Any]],
+                                     clear_through_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Descarta las mediciones que ya existen en la misión
+        
+        Los hashes existentes se consultan por bloques usando el índice
+        (mission_id, record_hash), sin recorrer todos los datos de la misión.
+        Los registros previos a la columna reciben su hash en la migración
+        (_migrate_cellular_record_hash); los que aún no lo tengan se comparan
+        calculándolo en memoria, sin UPDATE que dispare los triggers de
+        invalidación de análisis.
+        
+        Args:
+            session: Sesión SQLAlchemy activa
+            mission_id: ID de la misión
+            records: Registros celulares con 'record_hash' calculado y únicos
+            clear_through_id: Corte de la limpieza en curso; los registros
+                que va a eliminar no cuentan como existentes
+            
+        Returns:
+            Registros cuyo hash no existe en la misión
+        """
+        table = CellularData.__table__
+        active = table.c.id > (clear_through_id or 0)
+        hashes = [record['record_hash'] for record in records]
+        existing = set()
+        for start in range(0, len(hashes), CELLULAR_HASH_LOOKUP_CHUNK):
+            chunk = hashes[start:start + CELLULAR_HASH_LOOKUP_CHUNK]
+            existing.update(session.execute(
+                select(table.c.record_hash).where(
+                    table.c.mission_id == mission_id,
+                    table.c.record_hash.in_(chunk),
+                    active
+                )
+            ).scalars())
+        
+        unhashed_rows = session.execute(
+            select(*[table.c[field] for field in CELLULAR_HASH_FIELDS]).where(
+                table.c.mission_id == mission_id,
+                table.c.record_hash.is_(None),
+                active
+            )
+        ).mappings()
+        existing.update(calculate_cellular_record_hash(row) for row in unhashed_rows)
+        
+        return [record for record in records if record['record_hash'] not in existing]
+    
+    def _invalidate_cellular_derived_data(self, session, mission_id: str, operators: Set[str]) -> None:
+        """
+        Elimina los análisis que dependen de los datos celulares modificados
+        
+        Args:
+            session: Sesión SQLAlchemy activa
+            mission_id: ID de la misión
+            operators: Operadores afectados; vacío invalida toda la misión
+        """
+        query = session.query(TargetRecord).filter(TargetRecord.mission_id == mission_id)
+        if operators:
+            query = query.filter(TargetRecord.operator.in_(operators))
+        query.delete(synchronize_session=False)
+    
+    def _notify_cellular_change(self, mission_id: str, operators: Set[str]) -> None:
+        """Notifica a los observadores registrados que cambiaron datos celulares"""
+        for listener in list(_cellular_change_listeners):
+            try:
+                listener(mission_id, set(operators))
+            except Exception as e:
+                logger.warning(f"Error invalidando cache derivado de datos celulares: {e}")
+    
+    def _bulk_insert_cellular_records(self, session, mission_id: str,
+                                      records: List[Dict[str, Any]],
+                                      clear_through_id: Optional[int] = None) -> int:
+        """
+        Inserta registros celulares por lotes con INSERT Core (executemany)
+        
+        Los registros ya vienen validados por el procesador de archivos,
+        por lo que no se construyen objetos ORM.
+        
+        Con una limpieza en curso (clear_through_id), el primer registro se
+        inserta con un id mayor al corte: cellular_data puede reutilizar ids
+        y un registro nuevo con id bajo el corte quedaría oculto y lo
+        eliminaría el trabajo de limpieza.
+        
+        Args:
+            session: Sesión SQLAlchemy activa
+            mission_id: ID de la misión
+            records: Registros celulares validados
+            clear_through_id: Corte de la limpieza en curso de la misión
+            
+        Returns:
+            Número de registros insertados
+        """
+        insert_stmt = CellularData.__table__.insert()
+        inserted = 0
+        
+        rows = [
+            dict(
+                {column: record.get(column) for column in CELLULAR_INSERT_COLUMNS},
+                mission_id=mission_id,
+                record_hash=record.get('record_hash')
+            )
+            for record in records
+        ]
+        
+        if rows and clear_through_id is not None:
+            max_id = session.query(func.max(CellularData.id)).scalar() or 0
+            if max_id < clear_through_id:
+                session.execute(insert_stmt, dict(rows[0], id=clear_through_id + 1))
+                rows = rows[1:]
+                inserted += 1
+        
+        for start in range(0, len(rows), CELLULAR_INSERT_BATCH_SIZE):
+            batch = rows[start:start + CELLULAR_INSERT_BATCH_SIZE]
+            session.execute(insert_stmt, batch)
+            inserted += len(batch)
+        
+        return inserted
+    
     def upload_operator_data(self, mission_id: str, sheet_name: str, file_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Funcionalidad de carga de datos de operador eliminada
@@ -479,7 +821,7 @@ class MissionService:
         """
         # Funcionalidad de operadores eliminada - solo retornar misión actual
         try:
-            with self._get_db_manager().get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 mission = session.query(Mission).options(
                     joinedload(Mission.cellular_data),
                     joinedload(Mission.creator)
@@ -499,50 +841,68 @@ class MissionService:
             logger.error(f"Error accediendo a misión: {e}")
             raise MissionServiceError("Error interno del servidor")
     
-    def clear_cellular_data(self, mission_id: str) -> Dict[str, Any]:
+    def clear_cellular_data(self, mission_id: str, vacuum: bool = False) -> Dict[str, Any]:
         """
         Elimina todos los datos celulares de una misión
         
+        Los análisis derivados se eliminan de inmediato. Los registros celulares
+        se eliminan por lotes en un trabajo en segundo plano que no retiene el
+        bloqueo de escritura y conserva los registros cargados después de la
+        solicitud (id mayor al último existente).
+        
         Args:
             mission_id: ID de la misión
+            vacuum: Ejecutar VACUUM incremental al terminar
             
         Returns:
-            Diccionario con la misión actualizada
+            Diccionario con la misión sin datos celulares y el estado del
+            trabajo de eliminación en 'deletionJob'
         """
         try:
-            with self._get_db_manager().get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 # Verificar que la misión existe
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
                     raise MissionServiceError("Misión no encontrada")
                 
-                # Eliminar datos celulares
-                deleted_count = session.query(CellularData).filter(
+                deletion_service = get_bulk_deletion_service()
+                active_job = deletion_service.find_active_job('CELLULAR_DATA', mission_id)
+                if active_job:
+                    raise MissionServiceError(
+                        f"Ya existe una limpieza de datos celulares en curso: {active_job['jobId']}"
+                    )
+                
+                last_record_id = session.query(func.max(CellularData.id)).filter(
                     CellularData.mission_id == mission_id
-                ).delete()
+                ).scalar()
                 
-                # También limpiar análisis existentes ya que dependen de datos celulares
-                session.query(TargetRecord).filter(
-                    TargetRecord.mission_id == mission_id
-                ).delete()
+                # Las lecturas dejan de ver los registros a eliminar desde ya
+                if last_record_id is not None:
+                    mission.cellular_clear_through_id = last_record_id
                 
-                session.flush()
+                # También limpiar análisis existentes ya que dependen de datos celulares
+                self._invalidate_cellular_derived_data(session, mission_id, set())
+                session.commit()
+                self._notify_cellular_change(mission_id, set())
                 
-                # Cargar misión actualizada
-                updated_mission = session.query(Mission).options(
-                    joinedload(Mission.cellular_data),
-                    joinedload(Mission.creator)
-                ).filter(Mission.id == mission_id).first()
+                result = mission.to_dict()
+                result['cellularData'] = []
+                result['operatorData'] = []
+                result['deletionJob'] = None
                 
-                session.commit()
+                if last_record_id is not None:
+                    result['deletionJob'] = self._start_cellular_clear_job(
+                        mission_id, last_record_id, vacuum
+                    )
                 
-                result = updated_mission.to_dict_with_relations()
-                logger.info(f"Datos celulares eliminados: {deleted_count} registros de misión {mission.code}")
+                logger.info(f"Eliminación de datos celulares iniciada para misión {mission.code}")
                 
                 return result
                 
         except MissionServiceError:
             raise
+        except BulkDeletionServiceError as e:
+            raise MissionServiceError(str(e))
         except SQLAlchemyError as e:
             logger.error(f"Error de base de datos limpiando datos celulares: {e}")
             raise MissionServiceError("Error eliminando los datos celulares")
@@ -550,6 +910,65 @@ class MissionService:
             logger.error(f"Error inesperado limpiando datos celulares: {e}")
             raise MissionServiceError("Error interno del servidor")
     
+
+    def _start_cellular_clear_job(self, mission_id: str, clear_through_id: int,
+                                  vacuum: bool = False) -> Dict[str, Any]:
+        """
+        Lanza el trabajo que elimina los registros celulares con id menor o
+        igual al corte y, al terminar, retira el corte de la misión
+        
+        Args:
+            mission_id: ID de la misión
+            clear_through_id: Último id de cellular_data incluido en la limpieza
+            vacuum: Ejecutar VACUUM incremental al terminar
+            
+        Returns:
+            Estado inicial del trabajo de eliminación
+        """
+        def on_complete(job):
+            with get_db_connection() as conn:
+                conn.execute(
+                    "UPDATE missions SET cellular_clear_through_id = NULL "
+                    "WHERE id = ? AND cellular_clear_through_id = ?",
+                    (mission_id, clear_through_id)
+                )
+                conn.commit()
+            self._notify_cellular_change(mission_id, set())
+        
+        return get_bulk_deletion_service().start_job(
+            'CELLULAR_DATA', mission_id,
+            [{
+                'table': 'cellular_data',
+                'where': 'mission_id = ? AND id <= ?',
+                'params': (mission_id, clear_through_id)
+            }],
+            vacuum=vacuum,
+            on_complete=on_complete,
+            mission_id=mission_id
+        )
+    
+    def resume_pending_cellular_clears(self) -> int:
+        """
+        Reanuda las limpiezas de datos celulares que quedaron con corte
+        pendiente (la aplicación se cerró antes de que terminaran)
+        
+        Returns:
+            Número de limpiezas reanudadas
+        """
+        with get_db_connection() as conn:
+            pending = conn.execute(
+                "SELECT id, cellular_clear_through_id FROM missions "
+                "WHERE cellular_clear_through_id IS NOT NULL"
+            ).fetchall()
+        
+        resumed = 0
+        for mission_id, clear_through_id in pending:
+            if get_bulk_deletion_service().find_active_job('CELLULAR_DATA', mission_id):
+                continue
+            logger.info(f"Reanudando limpieza de datos celulares de la misión {mission_id}")
+            self._start_cellular_clear_job(mission_id, clear_through_id)
+            resumed += 1
+        return resumed
     def delete_operator_sheet(self, mission_id: str, sheet_id: str) -> Dict[str, Any]:
         """
         Funcionalidad de eliminación de hojas de operador eliminada
@@ -563,7 +982,7 @@ class MissionService:
         """
         # Funcionalidad de operadores eliminada - solo retornar misión actual
         try:
-            with self._get_db_manager().get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 mission = session.query(Mission).options(
                     joinedload(Mission.cellular_data),
                     joinedload(Mission.creator)
@@ -594,13 +1013,14 @@ class MissionService:
             Diccionario con estadísticas
         """
         try:
-            with self._get_db_manager().get_session() as session:
+            with self._get_db_manager().get_session(mission_id) as session:
                 mission = session.query(Mission).filter(Mission.id == mission_id).first()
                 if not mission:
                     raise MissionServiceError("Misión no encontrada")
                 
                 cellular_count = session.query(CellularData).filter(
-                    CellularData.mission_id == mission_id
+                    CellularData.mission_id == mission_id,
+                    mission.active_cellular_filter()
                 ).count()
                 
                 target_records_count = session.query(TargetRecord).filter(
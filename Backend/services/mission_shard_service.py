@@ -0,0 +1,331 @@
+"""
+KRONOS - Mission Shard Service
+===============================================================================
+MIGRACIÓN DEL ALMACENAMIENTO DE MISIONES A ARCHIVOS PROPIOS
+===============================================================================
+
+Mueve los datos masivos de una misión (operator_call_data,
+operator_cellular_data, cellular_data) entre kronos.db y su archivo propio
+en mission_shards/ (ver database/mission_shards.py), y los devuelve a
+kronos.db cuando se desea:
+
+- Mientras migra, la misión queda bloqueada para escritura: la conexión a
+  kronos.db mantiene BEGIN IMMEDIATE durante la copia.
+- Hacia el fragmento: primero se copia y confirma el archivo de la misión y
+  luego, en una sola transacción de kronos.db, se registra el fragmento y se
+  eliminan las filas. Si el proceso se interrumpe entre ambos pasos, el
+  archivo queda sin registrar y la misión sigue usando kronos.db.
+- Hacia kronos.db: la copia, la eliminación del registro y la liberación
+  del fragmento ocurren en una sola transacción de kronos.db; el archivo se
+  borra después.
+- Los triggers de kronos.db sobre las tablas masivas (auditoría, índice de
+  números, ...) se suspenden durante el traslado, dentro de la misma
+  transacción: las filas solo cambian de archivo y los datos derivados ya
+  las reflejan. Los del índice espacial siguen activos: ese índice solo
+  cubre las filas de kronos.db.
+- Con KRONOS_MISSION_STORAGE=sharded las misiones nuevas se crean
+  fragmentadas.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+from database.connection import get_database_manager, get_db_connection
+from database.mission_shards import (
+    SHARDED_TABLES, FILE_SCOPED_TABLES, SHARD_REGISTRY_SCHEMA, MissionShardError,
+    bulk_table_triggers, get_mission_shard_router, remove_shard_file
+)
+from utils.operator_specific_codec import FIELD_DICTIONARY_SCHEMA
+from .bulk_deletion_service import incremental_vacuum
+
+logger = logging.getLogger(__name__)
+
+
+class MissionShardServiceError(Exception):
+    """Excepción personalizada para errores de migración de almacenamiento"""
+    pass
+
+
+# Variable de entorno que define el almacenamiento de las misiones nuevas
+STORAGE_MODE_ENV = 'KRONOS_MISSION_STORAGE'
+SHARED_STORAGE = 'shared'
+SHARDED_STORAGE = 'sharded'
+
+# Esquema con el que se adjunta el fragmento a kronos.db al volver a compartir
+SHARD_SCHEMA = 'mission_shard'
+
+
+def _table_columns(conn: sqlite3.Connection, schema: str, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info({table})")]
+
+
+def _mission_filters(conn: sqlite3.Connection, source: str, sheets_schema: str) -> Dict[str, str]:
+    """
+    Condición WHERE (parámetro: mission_id) de las filas de la misión en cada
+    tabla trasladada que existe en el esquema de origen
+    """
+    filters = {table: 'mission_id = ?' for table in SHARDED_TABLES}
+    for table in FILE_SCOPED_TABLES:
+        if _table_columns(conn, source, table):
+            filters[table] = f"file_upload_id IN (SELECT id FROM {sheets_schema}.operator_data_sheets WHERE mission_id = ?)"
+    return filters
+
+
+@contextmanager
+def _suspended_triggers(conn: sqlite3.Connection):
+    """
+    Elimina y recrea (en la transacción en curso) los triggers de kronos.db
+    sobre las tablas masivas
+    """
+    triggers = bulk_table_triggers(conn)
+    for name, _, _ in triggers:
+        conn.execute(f'DROP TRIGGER main."{name}"')
+    yield
+    for _, _, sql in triggers:
+        conn.execute(sql)
+
+
+class MissionShardService:
+    """
+    Servicio de migración de misiones entre kronos.db y archivos propios
+    """
+
+    def __init__(self, storage_mode: Optional[str] = None):
+        storage_mode = (storage_mode or os.environ.get(STORAGE_MODE_ENV) or SHARED_STORAGE).lower()
+        if storage_mode not in (SHARED_STORAGE, SHARDED_STORAGE):
+            logger.warning(f"{STORAGE_MODE_ENV}={storage_mode} no es válido, se usa '{SHARED_STORAGE}'")
+            storage_mode = SHARED_STORAGE
+        self.storage_mode = storage_mode
+
+    def _router(self):
+        return get_mission_shard_router(get_database_manager().db_path)
+
+    def _check_mission(self, conn: sqlite3.Connection, mission_id: str) -> None:
+        if not conn.execute("SELECT 1 FROM missions WHERE id = ?", (mission_id,)).fetchone():
+            raise MissionShardServiceError(f"Misión {mission_id} no encontrada")
+
+    def _after_migration(self, mission_id: str) -> None:
+        """Descarta conexiones y registro en memoria de la misión migrada"""
+        get_database_manager().dispose_shard_engines(mission_id)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Estado del almacenamiento por misión
+
+        Returns:
+            Dict con 'storageMode' (misiones nuevas), 'mainDatabaseBytes' y
+            'shards' (misión, archivo y tamaño de cada fragmento)
+        """
+        db_path = get_database_manager().db_path
+        return {
+            'storageMode': self.storage_mode,
+            'mainDatabaseBytes': sum(
+                os.path.getsize(path) for path in (db_path, f"{db_path}-wal") if os.path.exists(path)
+            ),
+            'shards': self._router().get_status()
+        }
+
+    def prepare_new_mission(self, mission_id: str) -> Optional[str]:
+        """
+        Crea el fragmento vacío de una misión nueva si el modo de
+        almacenamiento es 'sharded'
+
+        Returns:
+            Ruta del fragmento, o None si la misión usa kronos.db
+        """
+        if self.storage_mode != SHARDED_STORAGE:
+            return None
+        return self.shard_mission(mission_id)['shardFile']
+
+    def shard_mission(self, mission_id: str) -> Dict[str, Any]:
+        """
+        Mueve los datos masivos de una misión a su archivo propio
+
+        Returns:
+            Dict con 'missionId', 'shardFile', 'rowsMoved' por tabla y
+            'durationSeconds'
+
+        Raises:
+            MissionShardServiceError: Si la misión no existe o ya está fragmentada
+        """
+        router = self._router()
+        if router.get_shard_path(mission_id):
+            raise MissionShardServiceError(f"La misión {mission_id} ya tiene almacenamiento propio")
+
+        started = time.perf_counter()
+        with get_db_connection() as conn:
+            self._check_mission(conn, mission_id)
+            conn.execute(SHARD_REGISTRY_SCHEMA)
+            # El fragmento copia la tabla de diccionarios de kronos.db
+            conn.execute(FIELD_DICTIONARY_SCHEMA)
+            conn.commit()
+
+            # Bloquea las escrituras en kronos.db (y por tanto las cargas de la misión)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                shard_path = router.create_shard_file(conn, mission_id)
+                rows_moved = self._copy_to_shard(conn, shard_path, mission_id)
+
+                conn.execute(
+                    "INSERT INTO mission_shards (mission_id, shard_file) VALUES (?, ?)",
+                    (mission_id, os.path.basename(shard_path))
+                )
+                with _suspended_triggers(conn):
+                    for table, where in _mission_filters(conn, 'main', 'main').items():
+                        conn.execute(f"DELETE FROM main.{table} WHERE {where}", (mission_id,))
+                conn.commit()
+            except MissionShardError as e:
+                conn.rollback()
+                raise MissionShardServiceError(str(e))
+            except Exception:
+                conn.rollback()
+                raise
+        self._after_migration(mission_id)
+
+        if any(rows_moved.values()):
+            # Devuelve al disco el espacio que ocupaban las filas movidas
+            incremental_vacuum()
+
+        result = {
+            'missionId': mission_id,
+            'shardFile': os.path.basename(shard_path),
+            'rowsMoved': rows_moved,
+            'durationSeconds': round(time.perf_counter() - started, 3)
+        }
+        logger.info(f"Misión {mission_id} migrada a almacenamiento propio: {result}")
+        return result
+
+    def _copy_to_shard(self, conn: sqlite3.Connection, shard_path: str, mission_id: str) -> Dict[str, int]:
+        """Copia y confirma en el fragmento las filas de la misión, verificando conteos"""
+        shard = sqlite3.connect(shard_path)
+        try:
+            shard.execute("ATTACH DATABASE ? AS shared", (get_database_manager().db_path,))
+            rows_moved = {}
+            for table, where in _mission_filters(shard, 'shared', 'shared').items():
+                columns = ', '.join(_table_columns(shard, 'main', table))
+                shard.execute(
+                    f"INSERT INTO main.{table} ({columns}) SELECT {columns} FROM shared.{table} WHERE {where}",
+                    (mission_id,)
+                )
+                copied = shard.execute(f"SELECT COUNT(*) FROM main.{table}").fetchone()[0]
+                expected = conn.execute(
+                    f"SELECT COUNT(*) FROM main.{table} WHERE {where.replace('shared.', 'main.')}", (mission_id,)
+                ).fetchone()[0]
+                if copied != expected:
+                    raise MissionShardServiceError(
+                        f"Copia incompleta de {table}: {copied} de {expected} registros"
+                    )
+                rows_moved[table] = copied
+            shard.commit()
+        except Exception:
+            shard.close()
+            remove_shard_file(shard_path)
+            raise
+        shard.close()
+        return rows_moved
+
+    def unshard_mission(self, mission_id: str) -> Dict[str, Any]:
+        """
+        Devuelve los datos masivos de una misión fragmentada a kronos.db
+
+        Los IDs se conservan salvo que choquen con registros de otras misiones
+        en kronos.db; en ese caso la tabla recibe IDs nuevos.
+
+        Returns:
+            Dict con 'missionId', 'rowsMoved' y 'renumberedTables'
+
+        Raises:
+            MissionShardServiceError: Si la misión no está fragmentada
+        """
+        router = self._router()
+        shard_path = router.get_shard_path(mission_id)
+        if not shard_path:
+            raise MissionShardServiceError(f"La misión {mission_id} no tiene almacenamiento propio")
+
+        started = time.perf_counter()
+        rows_moved = {}
+        renumbered = []
+        with get_db_connection() as conn:
+            conn.execute(f"ATTACH DATABASE ? AS {SHARD_SCHEMA}", (shard_path,))
+            # Bloquea las escrituras en ambos archivos durante la copia
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                with _suspended_triggers(conn):
+                    for table in SHARDED_TABLES:
+                        columns = _table_columns(conn, SHARD_SCHEMA, table)
+                        collision = conn.execute(f"""
+                            SELECT 1 FROM {SHARD_SCHEMA}.{table} s JOIN main.{table} m ON m.id = s.id LIMIT 1
+                        """).fetchone()
+                        if collision:
+                            columns = [column for column in columns if column != 'id']
+                            renumbered.append(table)
+                        column_list = ', '.join(columns)
+                        cursor = conn.execute(
+                            f"INSERT INTO main.{table} ({column_list}) SELECT {column_list} FROM {SHARD_SCHEMA}.{table}"
+                        )
+                        rows_moved[table] = cursor.rowcount
+                for table in FILE_SCOPED_TABLES:
+                    if _table_columns(conn, SHARD_SCHEMA, table):
+                        conn.execute(FIELD_DICTIONARY_SCHEMA)
+                        cursor = conn.execute(
+                            f"INSERT OR REPLACE INTO main.{table} SELECT * FROM {SHARD_SCHEMA}.{table}"
+                        )
+                        rows_moved[table] = cursor.rowcount
+                conn.execute("DELETE FROM mission_shards WHERE mission_id = ?", (mission_id,))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.execute(f"DETACH DATABASE {SHARD_SCHEMA}")
+        self._after_migration(mission_id)
+        remove_shard_file(shard_path)
+
+        if renumbered:
+            logger.warning(f"Misión {mission_id}: IDs reasignados en {', '.join(renumbered)} por colisión")
+        result = {
+            'missionId': mission_id,
+            'rowsMoved': rows_moved,
+            'renumberedTables': renumbered,
+            'durationSeconds': round(time.perf_counter() - started, 3)
+        }
+        logger.info(f"Misión {mission_id} devuelta a kronos.db: {result}")
+        return result
+
+    def drop_mission_shard(self, mission_id: str) -> bool:
+        """
+        Elimina el fragmento de una misión (al eliminar la misión)
+
+        Returns:
+            True si la misión tenía fragmento
+        """
+        shard_path = self._router().get_shard_path(mission_id)
+        if not shard_path:
+            return False
+        with get_db_connection() as conn:
+            conn.execute("DELETE FROM mission_shards WHERE mission_id = ?", (mission_id,))
+            conn.commit()
+        self._after_migration(mission_id)
+        remove_shard_file(shard_path)
+        logger.info(f"Fragmento de la misión {mission_id} eliminado")
+        return True
+
+
+# Instancia global del servicio
+_mission_shard_service_instance = None
+
+
+def get_mission_shard_service() -> MissionShardService:
+    """Retorna la instancia singleton del servicio de fragmentos de misión"""
+    global _mission_shard_service_instance
+    if _mission_shard_service_instance is None:
+        _mission_shard_service_instance = MissionShardService()
+    return _mission_shard_service_instance
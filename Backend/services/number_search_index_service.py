@@ -0,0 +1,576 @@
+"""
+KRONOS - Number Search Index Service
+===============================================================================
+ÍNDICE INVERTIDO DE NÚMEROS TELEFÓNICOS ENTRE MISIONES
+===============================================================================
+
+Responde "¿en qué misiones, operadores y rangos de tiempo aparece el número X?"
+sin recorrer operator_call_data y operator_cellular_data misión por misión.
+
+TABLAS DEL ÍNDICE:
+- number_search_index: una fila por (número normalizado, misión, operador) con
+  primera y última aparición, cantidad de llamadas y de sesiones de datos
+- number_search_cells: celdas en que aparece cada (número, misión, operador)
+  con su cantidad de registros
+
+MANTENIMIENTO:
+El núcleo de carga (FileProcessorService._write_prepared_rows) y el borrado
+por lotes (services/bulk_deletion_service.py) actualizan el índice una vez
+por lote, en su misma transacción, con agregaciones GROUP BY numero,
+mission_id, operator: add_batch (INSERT ... SELECT ... ON CONFLICT DO UPDATE)
+y remove_batch (UPDATE ... FROM con los conteos del lote). Triggers AFTER
+INSERT/UPDATE/DELETE sobre las tablas de operadores hacen lo mismo fila a
+fila como respaldo para las demás escrituras (por ejemplo el CASCADE al
+eliminar una misión); los de INSERT y DELETE no se ejecutan durante un lote
+(database/batch_write_guard.py). Al borrar un registro que definía la
+primera o última aparición, la fila se marca 'stale' y se recalcula desde
+las tablas de operadores la próxima vez que se consulta.
+
+Las tablas se crean al arrancar (o en la primera consulta) y se pueblan con
+los registros existentes en ese momento.
+
+El índice vive en kronos.db también para las misiones con archivo propio
+(database/mission_shards.py): sus conexiones ejecutan los mismos triggers
+como triggers TEMP, y la población y los recálculos leen el archivo de la
+misión.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import re
+import time
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.batch_write_guard import BATCH_WRITE_GUARD_SCHEMA, outside_batch_sql
+from database.connection import get_database_manager
+
+logger = logging.getLogger(__name__)
+
+
+class NumberSearchIndexServiceError(Exception):
+    """Excepción personalizada para errores del índice de números"""
+    pass
+
+
+# Apariciones de números por tabla de operador: columna del número, columna de
+# celda, columnas de primera/última aparición y contador que incrementa.
+# El destino de una llamada solo se indexa si es distinto del origen.
+NUMBER_INDEX_SOURCES = {
+    'operator_cellular_data': [
+        {'number': 'numero_telefono', 'cell': 'celda_id', 'first_seen': '{row}.fecha_hora_inicio',
+         'last_seen': 'COALESCE({row}.fecha_hora_fin, {row}.fecha_hora_inicio)', 'counter': 'data_count'}
+    ],
+    'operator_call_data': [
+        {'number': 'numero_origen', 'cell': 'celda_origen', 'first_seen': '{row}.fecha_hora_llamada',
+         'last_seen': '{row}.fecha_hora_llamada', 'counter': 'call_count'},
+        {'number': 'numero_destino', 'cell': 'celda_destino', 'first_seen': '{row}.fecha_hora_llamada',
+         'last_seen': '{row}.fecha_hora_llamada', 'counter': 'call_count', 'distinct_from': 'numero_origen'}
+    ]
+}
+
+# Columnas cuyo cambio requiere actualizar el índice
+NUMBER_INDEX_TRACKED_COLUMNS = {
+    'operator_cellular_data': ('mission_id', 'operator', 'numero_telefono', 'celda_id',
+                               'fecha_hora_inicio', 'fecha_hora_fin'),
+    'operator_call_data': ('mission_id', 'operator', 'numero_origen', 'numero_destino',
+                           'celda_origen', 'celda_destino', 'fecha_hora_llamada')
+}
+
+NUMBER_INDEX_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS number_search_index (
+        numero TEXT NOT NULL,
+        mission_id TEXT NOT NULL,
+        operator TEXT NOT NULL,
+        first_seen DATETIME,
+        last_seen DATETIME,
+        call_count INTEGER NOT NULL DEFAULT 0,
+        data_count INTEGER NOT NULL DEFAULT 0,
+        stale INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (numero, mission_id, operator)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS number_search_cells (
+        numero TEXT NOT NULL,
+        mission_id TEXT NOT NULL,
+        operator TEXT NOT NULL,
+        celda_id TEXT NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (numero, mission_id, operator, celda_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_number_search_index_mission ON number_search_index(mission_id)",
+    "CREATE INDEX IF NOT EXISTS idx_number_search_cells_mission ON number_search_cells(mission_id)"
+)
+
+# Mínimo de dígitos de un número buscable (igual a los CHECK de operator_call_data)
+MIN_SEARCH_DIGITS = 7
+
+
+def normalize_search_number(number: Any) -> str:
+    """
+    Normaliza un número con la regla de DataNormalizerService._normalize_phone_number:
+    solo dígitos y sin prefijo 57 en números de 12 dígitos
+    """
+    digits = re.sub(r'[^\d]', '', str(number or '').strip())
+    if len(digits) == 12 and digits.startswith('57'):
+        return digits[2:]
+    return digits
+
+
+def _normalized_sql(expression: str) -> str:
+    """Expresión SQL equivalente a normalize_search_number para números ya limpios"""
+    return (f"(CASE WHEN length({expression}) = 12 AND substr({expression}, 1, 2) = '57' "
+            f"THEN substr({expression}, 3) ELSE {expression} END)")
+
+
+def _raw_candidates(numero: str) -> List[str]:
+    """Valores almacenados que se normalizan a numero (permite usar los índices B-tree)"""
+    return [numero, '57' + numero] if len(numero) == 10 else [numero]
+
+
+class NumberSearchIndexService:
+    """
+    Servicio de búsqueda de números entre misiones
+
+    Funcionalidades:
+    1. Crear el índice invertido y sus triggers de sincronización
+    2. Actualizar el índice con un lote cargado o por eliminar
+    3. Buscar un número en todas las misiones (misión, operador, rango de
+       tiempo, conteos y celdas)
+    4. Reconstruir el índice desde las tablas de operadores
+    """
+
+    def __init__(self):
+        self._ready_engine = None
+
+    @property
+    def db_manager(self):
+        """Obtiene el database manager de manera lazy (init_database puede reemplazarlo)"""
+        return get_database_manager()
+
+    def ensure_index(self) -> Optional[int]:
+        """
+        Crea el índice y sus triggers si no existen, poblándolo con los registros existentes
+
+        Returns:
+            Entradas del índice, o None si las tablas de operadores no existen
+        """
+        if not self._ensure_index():
+            return None
+        with self.db_manager.get_session() as session:
+            return session.execute(text("SELECT COUNT(*) FROM number_search_index")).scalar()
+
+    def ensure_ready(self) -> bool:
+        """
+        Verificación rápida para los lotes de carga y borrado: crea el índice
+        la primera vez y luego solo compara el engine
+
+        Returns:
+            False si las tablas de operadores no existen
+        """
+        return self._ensure_index()
+
+    def add_batch(self, conn, table: str, after_id: int) -> None:
+        """
+        Registra las apariciones de un lote cargado (set-based)
+
+        Args:
+            conn: Conexión o cursor sqlite3 de la transacción del lote (también
+                la de una misión fragmentada)
+            table: Tabla de operadores escrita
+            after_id: Último ID de la tabla antes del lote (el lote son las
+                filas con id mayor, aún sin confirmar)
+        """
+        occurrences, repeats = self._occurrences_sql((table,), 't.id > ?')
+        params = (after_id,) * repeats
+        conn.execute(
+            f"INSERT INTO number_search_index (numero, mission_id, operator, first_seen, last_seen, "
+            f"call_count, data_count) "
+            f"SELECT numero, mission_id, operator, MIN(first_seen), MAX(last_seen), "
+            f"SUM(is_call), SUM(1 - is_call) FROM ({occurrences}) "
+            f"GROUP BY numero, mission_id, operator "
+            f"ON CONFLICT (numero, mission_id, operator) DO UPDATE SET "
+            f"first_seen = min(first_seen, excluded.first_seen), "
+            f"last_seen = max(last_seen, excluded.last_seen), "
+            f"call_count = call_count + excluded.call_count, "
+            f"data_count = data_count + excluded.data_count", params
+        )
+        conn.execute(
+            f"INSERT INTO number_search_cells (numero, mission_id, operator, celda_id, hits) "
+            f"SELECT numero, mission_id, operator, celda_id, COUNT(*) FROM ({occurrences}) "
+            f"WHERE COALESCE(celda_id, '') <> '' GROUP BY numero, mission_id, operator, celda_id "
+            f"ON CONFLICT (numero, mission_id, operator, celda_id) DO UPDATE SET hits = hits + excluded.hits", params
+        )
+
+    def remove_batch(self, conn, table: str, condition: str, params: Sequence[Any]) -> None:
+        """
+        Retira las apariciones de un lote antes de eliminarlo (set-based)
+
+        Args:
+            conn: Conexión sqlite3 de la transacción del borrado
+            table: Tabla de operadores
+            condition: Condición WHERE (parámetros '?') de las filas del lote
+            params: Parámetros de condition
+        """
+        occurrences, repeats = self._occurrences_sql((table,), condition)
+        params = tuple(params) * repeats
+        conn.execute(
+            f"UPDATE number_search_index AS i SET call_count = i.call_count - g.call_count, "
+            f"data_count = i.data_count - g.data_count, "
+            f"stale = CASE WHEN g.first_seen <= i.first_seen OR g.last_seen >= i.last_seen "
+            f"THEN 1 ELSE i.stale END "
+            f"FROM (SELECT numero, mission_id, operator, MIN(first_seen) AS first_seen, "
+            f"MAX(last_seen) AS last_seen, SUM(is_call) AS call_count, SUM(1 - is_call) AS data_count "
+            f"FROM ({occurrences}) GROUP BY numero, mission_id, operator) AS g "
+            f"WHERE i.numero = g.numero AND i.mission_id = g.mission_id AND i.operator = g.operator", params
+        )
+        conn.execute(
+            f"DELETE FROM number_search_index WHERE call_count <= 0 AND data_count <= 0 "
+            f"AND (numero, mission_id, operator) IN (SELECT numero, mission_id, operator FROM ({occurrences}))",
+            params
+        )
+        conn.execute(
+            f"UPDATE number_search_cells AS c SET hits = c.hits - g.hits "
+            f"FROM (SELECT numero, mission_id, operator, celda_id, COUNT(*) AS hits FROM ({occurrences}) "
+            f"WHERE COALESCE(celda_id, '') <> '' GROUP BY numero, mission_id, operator, celda_id) AS g "
+            f"WHERE c.numero = g.numero AND c.mission_id = g.mission_id AND c.operator = g.operator "
+            f"AND c.celda_id = g.celda_id", params
+        )
+        conn.execute(
+            f"DELETE FROM number_search_cells WHERE hits <= 0 AND (numero, mission_id, operator, celda_id) IN "
+            f"(SELECT numero, mission_id, operator, celda_id FROM ({occurrences}))", params
+        )
+
+    def search_number(self, number: Any, mission_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Busca un número en todas las misiones
+
+        Args:
+            number: Número telefónico (se normaliza: solo dígitos, sin prefijo 57)
+            mission_id: Limita la búsqueda a una misión (opcional)
+
+        Returns:
+            Diccionario con 'numero', 'data' (una entrada por misión y operador con
+            'firstSeen', 'lastSeen', 'callCount', 'dataCount' y 'cells'),
+            'totalMissions', 'total' y 'queryTime'
+        """
+        start_time = time.time()
+        numero = normalize_search_number(number)
+        if len(numero) < MIN_SEARCH_DIGITS:
+            raise NumberSearchIndexServiceError(
+                f"El número debe tener al menos {MIN_SEARCH_DIGITS} dígitos"
+            )
+
+        entries = []
+        if self._ensure_index():
+            entries = self._query_entries(numero, mission_id)
+
+        return {
+            'numero': numero,
+            'data': entries,
+            'totalMissions': len({entry['missionId'] for entry in entries}),
+            'total': len(entries),
+            'queryTime': round(time.time() - start_time, 4)
+        }
+
+    def rebuild_index(self) -> int:
+        """
+        Reconstruye el índice completo desde las tablas de operadores
+
+        Returns:
+            Entradas del índice reconstruido
+        """
+        if not self._ensure_index():
+            return 0
+        try:
+            with self.db_manager.get_engine().begin() as conn:
+                conn.execute(text("DELETE FROM number_search_index"))
+                conn.execute(text("DELETE FROM number_search_cells"))
+                self._populate(conn)
+            self._populate_sharded_missions()
+            with self.db_manager.get_session() as session:
+                return session.execute(text("SELECT COUNT(*) FROM number_search_index")).scalar()
+        except SQLAlchemyError as e:
+            logger.error(f"Error reconstruyendo índice de números: {e}")
+            raise NumberSearchIndexServiceError("Error reconstruyendo el índice de números")
+
+    def _query_entries(self, numero: str, mission_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Obtiene las entradas de un número, recalculando primero las marcadas 'stale'"""
+        params = {'numero': numero}
+        mission_filter = ''
+        if mission_id:
+            mission_filter = ' AND i.mission_id = :mission_id'
+            params['mission_id'] = mission_id
+
+        try:
+            with self.db_manager.get_engine().begin() as conn:
+                stale = conn.execute(text(
+                    f"SELECT i.mission_id, i.operator FROM number_search_index i "
+                    f"WHERE i.numero = :numero AND i.stale = 1{mission_filter}"
+                ), params).fetchall()
+                for stale_mission, stale_operator in stale:
+                    self._refresh_time_range(conn, numero, stale_mission, stale_operator)
+
+                rows = conn.execute(text(
+                    f"SELECT i.mission_id, m.code, m.name, i.operator, i.first_seen, i.last_seen, "
+                    f"i.call_count, i.data_count "
+                    f"FROM number_search_index i LEFT JOIN missions m ON m.id = i.mission_id "
+                    f"WHERE i.numero = :numero{mission_filter} "
+                    f"ORDER BY i.last_seen DESC, i.mission_id, i.operator"
+                ), params).fetchall()
+                cells = conn.execute(text(
+                    f"SELECT i.mission_id, i.operator, i.celda_id, i.hits FROM number_search_cells i "
+                    f"WHERE i.numero = :numero{mission_filter} ORDER BY i.hits DESC, i.celda_id"
+                ), params).fetchall()
+        except SQLAlchemyError as e:
+            logger.error(f"Error buscando número {numero} en el índice: {e}")
+            raise NumberSearchIndexServiceError("Error consultando el índice de números")
+
+        cells_by_key = {}
+        for cell_mission, cell_operator, celda_id, hits in cells:
+            cells_by_key.setdefault((cell_mission, cell_operator), []).append(
+                {'cellId': celda_id, 'hits': hits}
+            )
+
+        return [{
+            'missionId': row[0],
+            'missionCode': row[1],
+            'missionName': row[2],
+            'operator': row[3],
+            'firstSeen': row[4],
+            'lastSeen': row[5],
+            'callCount': row[6],
+            'dataCount': row[7],
+            'cells': cells_by_key.get((row[0], row[3]), [])
+        } for row in rows]
+
+    def _refresh_time_range(self, conn, numero: str, mission_id: str, operator: str) -> None:
+        """Recalcula primera y última aparición de una entrada desde las tablas de operadores"""
+        candidates = _raw_candidates(numero)
+        placeholders = ', '.join(f":n{i}" for i in range(len(candidates)))
+        params = {'mission_id': mission_id, 'operator': operator}
+        params.update({f"n{i}": value for i, value in enumerate(candidates)})
+
+        queries = []
+        for table, occurrences in NUMBER_INDEX_SOURCES.items():
+            for occurrence in occurrences:
+                sql = self._occurrence_sql(occurrence, 't')
+                queries.append(text(
+                    f"SELECT MIN({sql['first_seen']}), MAX({sql['last_seen']}) FROM {table} t "
+                    f"WHERE t.{occurrence['number']} IN ({placeholders}) "
+                    f"AND t.mission_id = :mission_id AND t.operator = :operator"
+                ))
+
+        if self.db_manager.is_mission_sharded(mission_id):
+            with self.db_manager.get_read_session(mission_id) as session:
+                ranges = [session.execute(query, params).first() for query in queries]
+        else:
+            ranges = [conn.execute(query, params).first() for query in queries]
+
+        firsts = [first for first, _ in ranges if first is not None]
+        lasts = [last for _, last in ranges if last is not None]
+        conn.execute(text(
+            "UPDATE number_search_index SET first_seen = :first_seen, last_seen = :last_seen, stale = 0 "
+            "WHERE numero = :numero AND mission_id = :mission_id AND operator = :operator"
+        ), {'first_seen': min(firsts) if firsts else None, 'last_seen': max(lasts) if lasts else None,
+            'numero': numero, 'mission_id': mission_id, 'operator': operator})
+
+    def _ensure_index(self) -> bool:
+        """
+        Crea las tablas del índice y los triggers de sincronización si no existen
+
+        Returns:
+            False si las tablas de operadores no existen en la base de datos
+        """
+        # Una reinicialización de la BD crea un engine nuevo: verificar de nuevo
+        if self._ready_engine is self.db_manager.get_engine():
+            return True
+
+        try:
+            with self.db_manager.get_engine().begin() as conn:
+                existing = {row[0] for row in conn.execute(text(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN "
+                    "('operator_cellular_data', 'operator_call_data', 'number_search_index')"
+                ))}
+                if not {'operator_cellular_data', 'operator_call_data'} <= existing:
+                    return False
+
+                for statement in NUMBER_INDEX_TABLES:
+                    conn.execute(text(statement))
+                conn.execute(text(BATCH_WRITE_GUARD_SCHEMA))
+                current = dict(conn.execute(text(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_number_index_%'"
+                )).fetchall())
+                for name, body in self._trigger_definitions().items():
+                    trigger_sql = f"CREATE TRIGGER {name} {body}"
+                    if current.get(name) == trigger_sql:
+                        continue
+                    if name in current:
+                        # Definición anterior (sin la marca de lotes)
+                        conn.execute(text(f"DROP TRIGGER {name}"))
+                    conn.execute(text(trigger_sql))
+
+                created = 'number_search_index' not in existing
+                if created:
+                    # Poblar con los registros existentes al crear el índice
+                    self._populate(conn)
+                    logger.info("Índice de búsqueda de números creado")
+
+            if created:
+                self._populate_sharded_missions()
+            self._ready_engine = self.db_manager.get_engine()
+            return True
+
+        except SQLAlchemyError as e:
+            logger.error(f"Error creando índice de búsqueda de números: {e}")
+            raise NumberSearchIndexServiceError("Error creando el índice de búsqueda de números")
+
+    def _populate_sharded_missions(self) -> None:
+        """
+        Puebla el índice con las misiones con archivo propio (después del
+        commit en kronos.db: cada población escribe en kronos.db)
+        """
+        sharded = self.db_manager.get_sharded_missions()
+        if sharded:
+            # Las conexiones abiertas antes de crear los triggers no los tienen
+            self.db_manager.dispose_shard_engines()
+        for mission_id in sharded:
+            with self.db_manager.get_session(mission_id) as session:
+                self._populate(session, mission_id)
+                session.commit()
+
+    def _trigger_definitions(self) -> Dict[str, str]:
+        """Triggers INSERT/UPDATE/DELETE de cada tabla de operadores (respaldo fuera de los lotes)"""
+        triggers = {}
+        for table, occurrences in NUMBER_INDEX_SOURCES.items():
+            add = ''.join(self._add_statements(occurrence, 'NEW') for occurrence in occurrences)
+            remove = ''.join(self._remove_statements(occurrence, 'OLD') for occurrence in occurrences)
+            tracked = ', '.join(NUMBER_INDEX_TRACKED_COLUMNS[table])
+            outside_batch = outside_batch_sql(table)
+            triggers[f"trg_number_index_{table}_insert"] = (
+                f"AFTER INSERT ON {table} WHEN {outside_batch} BEGIN {add} END"
+            )
+            triggers[f"trg_number_index_{table}_update"] = (
+                f"AFTER UPDATE OF {tracked} ON {table} BEGIN {remove} {add} END"
+            )
+            triggers[f"trg_number_index_{table}_delete"] = (
+                f"AFTER DELETE ON {table} WHEN {outside_batch} BEGIN {remove} END"
+            )
+        return triggers
+
+    def _occurrence_sql(self, occurrence: Dict[str, str], row: str) -> Dict[str, str]:
+        """Expresiones SQL de una aparición sobre NEW/OLD"""
+        numero = _normalized_sql(f"{row}.{occurrence['number']}")
+        condition = "1"
+        if occurrence.get('distinct_from'):
+            condition = f"{numero} <> {_normalized_sql(row + '.' + occurrence['distinct_from'])}"
+        return {
+            'numero': numero,
+            'cell': f"{row}.{occurrence['cell']}",
+            'first_seen': occurrence['first_seen'].format(row=row),
+            'last_seen': occurrence['last_seen'].format(row=row),
+            'counter': occurrence['counter'],
+            'condition': condition,
+            'key': f"numero = {numero} AND mission_id = {row}.mission_id AND operator = {row}.operator"
+        }
+
+    def _add_statements(self, occurrence: Dict[str, str], row: str) -> str:
+        """Sentencias que registran una aparición en el índice"""
+        sql = self._occurrence_sql(occurrence, row)
+        return (
+            f"INSERT INTO number_search_index (numero, mission_id, operator, first_seen, last_seen, "
+            f"call_count, data_count) "
+            f"SELECT {sql['numero']}, {row}.mission_id, {row}.operator, {sql['first_seen']}, {sql['last_seen']}, "
+            f"{int(sql['counter'] == 'call_count')}, {int(sql['counter'] == 'data_count')} "
+            f"WHERE {sql['condition']} "
+            f"ON CONFLICT (numero, mission_id, operator) DO UPDATE SET "
+            f"first_seen = min(first_seen, excluded.first_seen), "
+            f"last_seen = max(last_seen, excluded.last_seen), "
+            f"{sql['counter']} = {sql['counter']} + 1; "
+            f"INSERT INTO number_search_cells (numero, mission_id, operator, celda_id, hits) "
+            f"SELECT {sql['numero']}, {row}.mission_id, {row}.operator, trim({sql['cell']}), 1 "
+            f"WHERE {sql['condition']} AND trim(COALESCE({sql['cell']}, '')) <> '' "
+            f"ON CONFLICT (numero, mission_id, operator, celda_id) DO UPDATE SET hits = hits + 1; "
+        )
+
+    def _remove_statements(self, occurrence: Dict[str, str], row: str) -> str:
+        """Sentencias que retiran una aparición del índice"""
+        sql = self._occurrence_sql(occurrence, row)
+        return (
+            f"UPDATE number_search_index SET {sql['counter']} = {sql['counter']} - 1, "
+            f"stale = CASE WHEN {sql['first_seen']} <= first_seen OR {sql['last_seen']} >= last_seen "
+            f"THEN 1 ELSE stale END "
+            f"WHERE {sql['key']} AND {sql['condition']}; "
+            f"DELETE FROM number_search_index "
+            f"WHERE {sql['key']} AND call_count <= 0 AND data_count <= 0; "
+            f"UPDATE number_search_cells SET hits = hits - 1 "
+            f"WHERE {sql['key']} AND celda_id = trim({sql['cell']}) AND {sql['condition']}; "
+            f"DELETE FROM number_search_cells "
+            f"WHERE {sql['key']} AND celda_id = trim({sql['cell']}) AND hits <= 0; "
+        )
+
+    def _populate(self, conn, mission_id: Optional[str] = None) -> None:
+        """
+        Puebla el índice con una agregación sobre los registros existentes
+
+        Args:
+            conn: Conexión o sesión
+            mission_id: Limita la población a una misión (archivo propio)
+        """
+        params = {'mission_id': mission_id} if mission_id else {}
+        occurrences_sql, _ = self._occurrences_sql(
+            NUMBER_INDEX_SOURCES, "t.mission_id = :mission_id" if mission_id else "1"
+        )
+
+        conn.execute(text(
+            f"INSERT INTO number_search_index (numero, mission_id, operator, first_seen, last_seen, "
+            f"call_count, data_count) "
+            f"SELECT numero, mission_id, operator, MIN(first_seen), MAX(last_seen), "
+            f"SUM(is_call), SUM(1 - is_call) FROM ({occurrences_sql}) "
+            f"GROUP BY numero, mission_id, operator"
+        ), params)
+        conn.execute(text(
+            f"INSERT INTO number_search_cells (numero, mission_id, operator, celda_id, hits) "
+            f"SELECT numero, mission_id, operator, celda_id, COUNT(*) FROM ({occurrences_sql}) "
+            f"WHERE COALESCE(celda_id, '') <> '' GROUP BY numero, mission_id, operator, celda_id"
+        ), params)
+
+    def _occurrences_sql(self, tables: Iterable[str], condition: str) -> Tuple[str, int]:
+        """
+        Apariciones (numero, mission_id, operator, first_seen, last_seen,
+        is_call, celda_id) de las filas t que cumplen condition
+
+        Returns:
+            SQL y cantidad de veces que incluye condition (una por aparición)
+        """
+        selects = []
+        for table in tables:
+            for occurrence in NUMBER_INDEX_SOURCES[table]:
+                sql = self._occurrence_sql(occurrence, 't')
+                selects.append(
+                    f"SELECT {sql['numero']} AS numero, t.mission_id, t.operator, "
+                    f"{sql['first_seen']} AS first_seen, {sql['last_seen']} AS last_seen, "
+                    f"{int(sql['counter'] == 'call_count')} AS is_call, trim({sql['cell']}) AS celda_id "
+                    f"FROM {table} t WHERE {sql['condition']} AND ({condition})"
+                )
+        return ' UNION ALL '.join(selects), len(selects)
+
+
+# Instancia global del servicio
+_number_search_index_service_instance = None
+
+
+def get_number_search_index_service() -> NumberSearchIndexService:
+    """Retorna la instancia singleton del servicio de índice de números"""
+    global _number_search_index_service_instance
+    if _number_search_index_service_instance is None:
+        _number_search_index_service_instance = NumberSearchIndexService()
+    return _number_search_index_service_instance
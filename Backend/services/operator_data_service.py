@@ -16,25 +16,97 @@ Versión: 1.0.0
 """
 
 import eel
+import logging
 import uuid
 import hashlib
 import base64
 import json
+import re
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable
 import traceback
 from pathlib import Path
 import sys
 import os
+import threading
 
 # Agregar el directorio padre al path para imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.connection import get_db_connection
-from services.file_processor_service import FileProcessorService
-from services.data_normalizer_service import DataNormalizerService  
+from database.connection import get_db_connection, get_db_read_connection, get_database_manager
+from services.bulk_deletion_service import get_bulk_deletion_service
+from services.database_maintenance_service import get_database_maintenance_service
+from services.operator_ingestion_adapters import get_ingestion_adapter
 from utils.operator_logger import OperatorLogger
+from utils.operator_specific_codec import load_field_dictionary, expand_operator_specific_data
+from utils.columnar_response import encode_columnar, is_columnar_format
+
+# Paginación por cursor de get_operator_sheet_data. Las columnas ordenables
+# son NOT NULL y están presentes en todas las configuraciones de columnas
+SHEET_DATA_TABLES = {
+    'CELLULAR_DATA': 'operator_cellular_data',
+    'CALL_DATA': 'operator_call_data'
+}
+SHEET_SORT_COLUMNS = {
+    'CELLULAR_DATA': ('id', 'fecha_hora_inicio', 'numero_telefono', 'celda_id'),
+    'CALL_DATA': ('id', 'fecha_hora_llamada', 'numero_origen', 'numero_destino')
+}
+SHEET_FILTER_COLUMNS = {
+    'CELLULAR_DATA': ('numero_telefono', 'celda_id', 'tecnologia'),
+    'CALL_DATA': ('numero_origen', 'numero_destino', 'numero_objetivo', 'celda_origen', 'tipo_llamada')
+}
+SHEET_MAX_PAGE_SIZE = 5000
+
+# Índices (file_upload_id, columna): SQLite agrega el rowid al final de cada
+# índice, por lo que también sirven para el desempate por id del cursor.
+# Cada columna de orden y de filtro tiene el suyo; un filtro solo se combina
+# con el orden por id o por la misma columna (ver _build_sheet_page_query)
+SHEET_PAGINATION_INDEXES = {
+    'operator_cellular_data': {
+        'idx_cellular_file_upload': ('file_upload_id',),
+        'idx_cellular_file_fecha': ('file_upload_id', 'fecha_hora_inicio'),
+        'idx_cellular_file_numero': ('file_upload_id', 'numero_telefono'),
+        'idx_cellular_file_celda': ('file_upload_id', 'celda_id'),
+        'idx_cellular_file_tecnologia': ('file_upload_id', 'tecnologia')
+    },
+    'operator_call_data': {
+        'idx_calls_file_upload': ('file_upload_id',),
+        'idx_calls_file_fecha': ('file_upload_id', 'fecha_hora_llamada'),
+        'idx_calls_file_origen': ('file_upload_id', 'numero_origen'),
+        'idx_calls_file_destino': ('file_upload_id', 'numero_destino'),
+        'idx_calls_file_objetivo': ('file_upload_id', 'numero_objetivo'),
+        'idx_calls_file_celda_origen': ('file_upload_id', 'celda_origen'),
+        'idx_calls_file_tipo': ('file_upload_id', 'tipo_llamada')
+    }
+}
+
+# Observadores de cambios en las llamadas de una misión: callback(mission_id)
+_call_data_change_listeners: List[Callable[[str], None]] = []
+
+
+def register_call_data_change_listener(listener: Callable[[str], None]) -> None:
+    """
+    Registra un callback que se invoca cuando cambian las llamadas visibles
+    de una misión (carga terminada o archivo marcado para eliminación), para
+    invalidar caches derivados
+    
+    Args:
+        listener: Función que recibe el ID de la misión
+    """
+    if listener not in _call_data_change_listeners:
+        _call_data_change_listeners.append(listener)
+
+
+def _notify_call_data_change(mission_id: Optional[str]) -> None:
+    """Notifica a los observadores registrados que cambiaron las llamadas de una misión"""
+    if not mission_id:
+        return
+    for listener in list(_call_data_change_listeners):
+        try:
+            listener(mission_id)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error invalidando cache derivado de llamadas: {e}")
 
 
 def _ensure_eel_serializable(response_dict):
@@ -74,11 +146,19 @@ class OperatorDataService:
     
     def __init__(self):
         """Inicializa el servicio con dependencias."""
-        self.file_processor = FileProcessorService()
+        # Importación diferida: el procesador carga pandas y se crea en el
+        # arranque en segundo plano, no al importar este módulo
+        from services.file_processor_service import FileProcessorService
+        from services.data_normalizer_service import DataNormalizerService
+        
+        # Un único normalizador compartido con el procesador de archivos
         self.data_normalizer = DataNormalizerService()
+        self.file_processor = FileProcessorService(data_normalizer=self.data_normalizer)
         self.logger = OperatorLogger()
-        # Verificar y aplicar migración de schema si es necesario
-        self._ensure_schema_migration()
+        # Migración de schema y eliminaciones pendientes, una vez por BD
+        self._schema_engine = None
+        self._schema_lock = threading.Lock()
+        self._ensure_schema_current()
         
         # Configuración de operadores soportados
         self.SUPPORTED_OPERATORS = ['CLARO', 'MOVISTAR', 'TIGO', 'WOM']
@@ -280,6 +360,22 @@ class OperatorDataService:
                 }
             }
     
+    def _ensure_schema_current(self):
+        """
+        Aplica la migración de schema y reanuda las eliminaciones interrumpidas
+        (archivos en estado DELETING) si la BD activa aún no fue verificada.
+        """
+        # Una reinicialización de la BD crea un engine nuevo: verificar de nuevo
+        engine = get_database_manager().get_engine()
+        if self._schema_engine is engine:
+            return
+        with self._schema_lock:
+            if self._schema_engine is engine:
+                return
+            self._ensure_schema_migration()
+            self._resume_pending_deletions()
+            self._schema_engine = engine
+    
     def _ensure_schema_migration(self):
         """
         Verifica si necesita aplicar la migración para permitir duplicados por misión.
@@ -305,6 +401,221 @@ class OperatorDataService:
         except Exception as e:
             self.logger.error(f"Error verificando migración de schema: {str(e)}")
             # No fallar el servicio por problemas de migración
+        
+        try:
+            with get_db_connection() as conn:
+                self._ensure_deleting_status_schema(conn)
+        except Exception as e:
+            self.logger.error(f"Error verificando estado DELETING en schema: {str(e)}")
+        
+        try:
+            with get_db_connection() as conn:
+                self._ensure_sheet_pagination_schema(conn)
+        except Exception as e:
+            self.logger.error(f"Error verificando schema de paginación: {str(e)}")
+    
+    def _ensure_deleting_status_schema(self, conn):
+        """
+        Agrega 'DELETING' a los estados permitidos de operator_data_sheets.
+        
+        SQLite no permite modificar un CHECK, por lo que se reconstruye la tabla
+        a partir de su definición actual (conservando columnas, índices y
+        triggers) con las claves foráneas desactivadas, para que el DROP de la
+        tabla original no elimine en cascada los datos asociados.
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT sql FROM sqlite_master 
+            WHERE type='table' AND name='operator_data_sheets'
+        """)
+        row = cursor.fetchone()
+        if not row:
+            return
+        
+        check_pattern = re.compile(r"(CHECK\s*\(\s*processing_status\s+IN\s*\()([^)]*)(\))", re.IGNORECASE)
+        check_match = check_pattern.search(row[0])
+        if not check_match or 'DELETING' in check_match.group(2):
+            return
+        
+        self.logger.info("Aplicando migración: agregar estado DELETING a operator_data_sheets")
+        new_table_sql = check_pattern.sub(r"\1\2, 'DELETING'\3", row[0], count=1)
+        new_table_sql = re.sub(r'^CREATE TABLE\s+["`]?operator_data_sheets["`]?',
+                               'CREATE TABLE operator_data_sheets_new', new_table_sql, count=1)
+        
+        cursor.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE tbl_name = 'operator_data_sheets' AND type IN ('index', 'trigger') AND sql IS NOT NULL
+        """)
+        dependent_sql = [dependent[0] for dependent in cursor.fetchall()]
+        
+        conn.commit()
+        cursor.execute("PRAGMA foreign_keys = OFF")
+        cursor.execute("PRAGMA legacy_alter_table = ON")
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(new_table_sql)
+            cursor.execute("INSERT INTO operator_data_sheets_new SELECT * FROM operator_data_sheets")
+            cursor.execute("DROP TABLE operator_data_sheets")
+            cursor.execute("ALTER TABLE operator_data_sheets_new RENAME TO operator_data_sheets")
+            for statement in dependent_sql:
+                cursor.execute(statement)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.execute("PRAGMA legacy_alter_table = OFF")
+            cursor.execute("PRAGMA foreign_keys = ON")
+        
+        self.logger.info("Migración de estado DELETING completada")
+    
+    def _ensure_sheet_pagination_schema(self, conn):
+        """
+        Agrega el conteo cacheado de registros (data_row_count) y los índices
+        usados por la paginación por cursor de get_operator_sheet_data.
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name IN ('operator_data_sheets', 'operator_cellular_data', 'operator_call_data')
+        """)
+        existing_tables = {row[0] for row in cursor.fetchall()}
+        
+        if 'operator_data_sheets' in existing_tables:
+            cursor.execute("PRAGMA table_info(operator_data_sheets)")
+            if 'data_row_count' not in {row[1] for row in cursor.fetchall()}:
+                self.logger.info("Aplicando migración: agregar data_row_count a operator_data_sheets")
+                cursor.execute("ALTER TABLE operator_data_sheets ADD COLUMN data_row_count INTEGER")
+        
+        for table, indexes in SHEET_PAGINATION_INDEXES.items():
+            if table not in existing_tables:
+                continue
+            for index_name, columns in indexes.items():
+                try:
+                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({', '.join(columns)})")
+                except sqlite3.OperationalError as e:
+                    self.logger.warning(f"No se pudo crear el índice {index_name}: {str(e)}")
+        
+        conn.commit()
+    
+    def _refresh_sheet_row_count(self, cursor, file_upload_id: str, file_type: str) -> int:
+        """
+        Cuenta los registros de un archivo y guarda el total en data_row_count.
+        """
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {SHEET_DATA_TABLES[file_type]} WHERE file_upload_id = ?",
+            (file_upload_id,)
+        )
+        row_count = cursor.fetchone()[0]
+        cursor.execute(
+            "UPDATE operator_data_sheets SET data_row_count = ? WHERE id = ?",
+            (row_count, file_upload_id)
+        )
+        return row_count
+    
+    def _get_cached_row_count(self, cursor, file_upload_id: str) -> Optional[int]:
+        """
+        Retorna el conteo cacheado de un archivo, o None si no está guardado
+        o la columna data_row_count no existe (migración no aplicada).
+        """
+        try:
+            cursor.execute("SELECT data_row_count FROM operator_data_sheets WHERE id = ?", (file_upload_id,))
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Conteo cacheado no disponible: {str(e)}")
+            return None
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    def _store_sheet_row_count(self, mission_id: Optional[str], file_upload_id: str,
+                               file_type: str) -> Optional[int]:
+        """
+        Cuenta los registros de un archivo completado y guarda el conteo.
+        Retorna None si no se pudo guardar, para contar sin caché.
+        """
+        try:
+            with get_db_connection(mission_id) as write_conn:
+                row_count = self._refresh_sheet_row_count(write_conn.cursor(), file_upload_id, file_type)
+                write_conn.commit()
+            return row_count
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"No se pudo guardar el conteo del archivo {file_upload_id}: {str(e)}")
+            return None
+    
+    def _build_sheet_page_query(self, file_type: str, sort_by: str, sort_dir: str,
+                                filters: Optional[Dict[str, Any]],
+                                page_cursor: Optional[Dict[str, Any]]) -> Tuple[str, List[Any], str]:
+        """
+        Construye las condiciones WHERE adicionales y el ORDER BY de una página.
+        
+        El cursor se expresa como rango sobre el índice (file_upload_id, columna)
+        (columna >= valor AND (columna > valor OR id > último_id)), de modo que
+        SQLite posiciona el índice en el cursor en lugar de recorrer las filas
+        anteriores como hace OFFSET.
+        
+        Se admite un solo filtro por consulta, ordenado por id o por la misma
+        columna: así la página es un rango del índice (file_upload_id, filtro)
+        y no un recorrido del índice de orden descartando filas que no cumplen
+        el filtro (o un ordenamiento en memoria de todas las que lo cumplen).
+        
+        Returns:
+            Tuple: (condiciones SQL, parámetros, cláusula ORDER BY)
+        
+        Raises:
+            ValueError: Si la columna de orden, los filtros o el cursor no son válidos
+        """
+        if sort_by not in SHEET_SORT_COLUMNS[file_type]:
+            raise ValueError(f"Columna de orden no soportada: {sort_by}")
+        if sort_dir not in ('asc', 'desc'):
+            raise ValueError(f"Dirección de orden no soportada: {sort_dir}")
+        
+        conditions = []
+        params = []
+        filter_columns = []
+        for column, value in (filters or {}).items():
+            if column not in SHEET_FILTER_COLUMNS[file_type]:
+                raise ValueError(f"Columna de filtro no soportada: {column}")
+            if value is None or str(value).strip() == '':
+                continue
+            conditions.append(f"{column} = ?")
+            params.append(str(value).strip())
+            filter_columns.append(column)
+        
+        if len(filter_columns) > 1:
+            raise ValueError("Solo se admite un filtro por consulta")
+        if filter_columns and sort_by not in ('id', filter_columns[0]):
+            raise ValueError(
+                f"El filtro por {filter_columns[0]} solo admite ordenar por id o por {filter_columns[0]}"
+            )
+        if filter_columns:
+            # Con el filtro por igualdad todas las filas comparten el valor de
+            # la columna de orden: el orden efectivo es el desempate por id
+            sort_by = 'id'
+        
+        if page_cursor:
+            try:
+                last_id = int(page_cursor['id'])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Cursor de paginación inválido")
+            
+            operator_strict = '>' if sort_dir == 'asc' else '<'
+            if sort_by == 'id':
+                conditions.append(f"id {operator_strict} ?")
+                params.append(last_id)
+            else:
+                if page_cursor.get('value') is None:
+                    raise ValueError("Cursor de paginación inválido")
+                conditions.append(
+                    f"{sort_by} {operator_strict}= ? AND ({sort_by} {operator_strict} ? OR id {operator_strict} ?)"
+                )
+                params.extend([page_cursor['value'], page_cursor['value'], last_id])
+        
+        direction = sort_dir.upper()
+        if sort_by == 'id':
+            order_by = f"id {direction}"
+        else:
+            order_by = f"{sort_by} {direction}, id {direction}"
+        
+        return ''.join(f" AND {condition}" for condition in conditions), params, order_by
     
     def _apply_duplicate_per_mission_migration(self, conn):
         """
@@ -425,8 +736,9 @@ class OperatorDataService:
                 if result:
                     existing_id, existing_status = result
                     
-                    # Solo bloquear si el procesamiento fue exitoso o está en progreso
-                    if existing_status in ['COMPLETED', 'PROCESSING']:
+                    # Solo bloquear si el procesamiento fue exitoso, está en progreso
+                    # o el archivo anterior aún se está eliminando
+                    if existing_status in ['COMPLETED', 'PROCESSING', 'DELETING']:
                         self.logger.warning(f"Archivo duplicado detectado en misión {mission_id}: checksum {checksum[:8]}... (estado: {existing_status})")
                         return True
                     
@@ -490,11 +802,21 @@ class OperatorDataService:
             self.logger.error(f"Error creando registro de archivo: {str(e)}")
             raise
     
+    def _get_file_mission_id(self, file_upload_id: str) -> Optional[str]:
+        """Misión de un archivo (para enrutar a su almacenamiento), o None si no existe."""
+        with get_db_connection() as conn:
+            row = conn.execute(
+                "SELECT mission_id FROM operator_data_sheets WHERE id = ?", (file_upload_id,)
+            ).fetchone()
+        return row[0] if row else None
+    
     def _update_processing_status(self, file_upload_id: str, status: str, 
                                 error_details: Optional[str] = None):
         """Actualiza el estado de procesamiento del archivo."""
         try:
-            with get_db_connection() as conn:
+            # El conteo cacheado se calcula en el almacenamiento de la misión
+            mission_id = self._get_file_mission_id(file_upload_id)
+            with get_db_connection(mission_id) as conn:
                 cursor = conn.cursor()
                 
                 if status == 'PROCESSING':
@@ -515,11 +837,113 @@ class OperatorDataService:
                         WHERE id = ?
                     """, (status, error_details, file_upload_id))
                 
+                rows_loaded = 0
+                if status == 'COMPLETED':
+                    # Conteo cacheado para la paginación de get_operator_sheet_data
+                    cursor.execute("SELECT file_type FROM operator_data_sheets WHERE id = ?", (file_upload_id,))
+                    row = cursor.fetchone()
+                    if row and row[0] in SHEET_DATA_TABLES:
+                        rows_loaded = self._refresh_sheet_row_count(cursor, file_upload_id, row[0])
+                
                 conn.commit()
+            
+            if rows_loaded:
+                get_database_maintenance_service().record_write_activity(mission_id, rows_loaded)
+            
+            # Carga terminada (también fallida: pudo dejar lotes escritos)
+            if status in ['COMPLETED', 'FAILED']:
+                _notify_call_data_change(mission_id)
                 
         except Exception as e:
             self.logger.error(f"Error actualizando estado {status}: {str(e)}")
             raise
+    
+    def _build_sheet_deletion_steps(self, cursor, file_upload_id: str) -> List[Dict[str, Any]]:
+        """
+        Pasos de eliminación por lotes de un archivo: sus datos, sus logs, su
+        diccionario de campos específicos y al final el registro del archivo
+        (que ya no tiene filas en cascada).
+        """
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name IN ('operator_cellular_data', 'operator_call_data', 'file_processing_logs',
+                                            'operator_specific_fields')
+        """)
+        existing_tables = {row[0] for row in cursor.fetchall()}
+        
+        steps = [
+            {'table': table, 'where': 'file_upload_id = ?', 'params': (file_upload_id,)}
+            for table in (*SHEET_DATA_TABLES.values(), 'file_processing_logs', 'operator_specific_fields')
+            if table in existing_tables
+        ]
+        steps.append({'table': 'operator_data_sheets', 'where': 'id = ?', 'params': (file_upload_id,)})
+        return steps
+    
+    def _start_sheet_deletion(self, file_upload_id: str, vacuum: bool = False) -> Dict[str, Any]:
+        """
+        Lanza (o retorna, si ya está activo) el trabajo de eliminación de un
+        archivo en estado DELETING.
+        """
+        deletion_service = get_bulk_deletion_service()
+        active_job = deletion_service.find_active_job('OPERATOR_SHEET', file_upload_id)
+        if active_job:
+            return active_job
+        
+        with get_db_connection() as conn:
+            steps = self._build_sheet_deletion_steps(conn.cursor(), file_upload_id)
+        
+        return deletion_service.start_job(
+            'OPERATOR_SHEET', file_upload_id, steps, vacuum=vacuum,
+            on_complete=lambda job: self.logger.info(
+                f"Archivo eliminado: {file_upload_id}", extra={'records_affected': job['rowsDeleted']}
+            ),
+            mission_id=self._get_file_mission_id(file_upload_id)
+        )
+    
+    def _resume_pending_deletions(self):
+        """Reanuda la eliminación de archivos que quedaron en estado DELETING."""
+        try:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id FROM operator_data_sheets WHERE processing_status = 'DELETING'")
+                pending = [row[0] for row in cursor.fetchall()]
+            
+            for file_upload_id in pending:
+                self.logger.info(f"Reanudando eliminación pendiente del archivo {file_upload_id}")
+                self._start_sheet_deletion(file_upload_id)
+                
+        except Exception as e:
+            self.logger.error(f"Error reanudando eliminaciones pendientes: {str(e)}")
+
+
+# ============================================================================
+# SINGLETON DEL SERVICIO
+# ============================================================================
+
+_operator_data_service_instance = None
+_operator_data_service_lock = threading.Lock()
+
+
+def get_operator_data_service() -> OperatorDataService:
+    """
+    Retorna la instancia singleton del servicio de datos de operador
+    
+    El servicio y sus dependencias (procesador, normalizador, logger) se
+    crean una sola vez. La verificación de migración de schema se repite
+    solo si la BD fue reinicializada. Las dependencias no guardan estado por
+    solicitud, por lo que la instancia se comparte entre los hilos de Eel.
+    
+    Returns:
+        OperatorDataService: Instancia compartida del servicio
+    """
+    global _operator_data_service_instance
+    if _operator_data_service_instance is None:
+        with _operator_data_service_lock:
+            if _operator_data_service_instance is None:
+                _operator_data_service_instance = OperatorDataService()
+                return _operator_data_service_instance
+    _operator_data_service_instance._ensure_schema_current()
+    return _operator_data_service_instance
 
 
 # ==============================================================================
@@ -543,7 +967,7 @@ def upload_operator_data(file_data: str, file_name: str, mission_id: str,
     Returns:
         Dict[str, Any]: Resultado del procesamiento con estado y detalles
     """
-    service = OperatorDataService()
+    service = get_operator_data_service()
     
     try:
         service.logger.info(
@@ -918,6 +1342,16 @@ def upload_operator_data(file_data: str, file_name: str, mission_id: str,
                     mission_id=mission_id
                 )
             
+            elif get_ingestion_adapter(operator, file_type):
+                # Operadores registrados con un adaptador declarativo: núcleo común de carga
+                processing_result = service.file_processor.process_with_adapter(
+                    get_ingestion_adapter(operator, file_type),
+                    file_bytes=file_bytes,
+                    file_name=file_name,
+                    file_upload_id=file_upload_id,
+                    mission_id=mission_id
+                )
+            
             else:
                 # Placeholder para otros operadores/tipos no implementados
                 error_msg = f'Procesamiento para {operator} {file_type} no implementado aún'
@@ -1041,7 +1475,7 @@ def get_operator_sheets(mission_id: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Lista de archivos con metadata
     """
-    service = OperatorDataService()
+    service = get_operator_data_service()
     
     try:
         with get_db_connection() as conn:
@@ -1069,7 +1503,7 @@ def get_operator_sheets(mission_id: Optional[str] = None) -> Dict[str, Any]:
                     FROM operator_data_sheets ods
                     LEFT JOIN users u ON ods.uploaded_by = u.id
                     LEFT JOIN missions m ON ods.mission_id = m.id
-                    WHERE ods.mission_id = ?
+                    WHERE ods.mission_id = ? AND ods.processing_status != 'DELETING'
                     ORDER BY ods.uploaded_at DESC
                 """, (mission_id,))
             
@@ -1087,6 +1521,7 @@ def get_operator_sheets(mission_id: Optional[str] = None) -> Dict[str, Any]:
                     FROM operator_data_sheets ods
                     LEFT JOIN users u ON ods.uploaded_by = u.id
                     LEFT JOIN missions m ON ods.mission_id = m.id
+                    WHERE ods.processing_status != 'DELETING'
                     ORDER BY ods.uploaded_at DESC
                 """)
             
@@ -1144,31 +1579,66 @@ def get_operator_sheets(mission_id: Optional[str] = None) -> Dict[str, Any]:
 
 @eel.expose
 def get_operator_sheet_data(file_upload_id: str, page: int = 1, 
-                          page_size: int = 50) -> Dict[str, Any]:
+                          page_size: int = 50, page_cursor: Optional[Dict[str, Any]] = None,
+                          sort_by: str = 'id', sort_dir: str = 'asc',
+                          filters: Optional[Dict[str, Any]] = None,
+                          response_format: str = 'records') -> Dict[str, Any]:
     """
     Obtiene los datos procesados de un archivo específico.
     
+    La paginación recomendada es por cursor: la primera llamada se hace sin
+    page_cursor y las siguientes pasan el 'nextCursor' de la respuesta anterior,
+    con el mismo orden y filtros. Cada página cuesta lo mismo sin importar su
+    posición en el archivo. Sin cursor y con page > 1 se mantiene la
+    paginación por OFFSET para compatibilidad.
+    
     Args:
         file_upload_id (str): ID del archivo cargado
-        page (int): Número de página (empieza en 1)
+        page (int): Número de página (empieza en 1), solo sin page_cursor
         page_size (int): Registros por página (máximo 5000)
+        page_cursor (Dict, optional): Cursor {'id', 'value'} de la página anterior
+        sort_by (str): Columna de orden (ver SHEET_SORT_COLUMNS)
+        sort_dir (str): 'asc' o 'desc'
+        filters (Dict, optional): Filtro por igualdad {columna: valor}
+            (ver SHEET_FILTER_COLUMNS); uno por consulta, con sort_by 'id'
+            o la misma columna
+        response_format (str): 'records' (lista de registros) o 'columnar'
+            ('data' en el formato de utils.columnar_response)
     
     Returns:
-        Dict[str, Any]: Datos del archivo con paginación
+        Dict[str, Any]: Datos del archivo con paginación. 'total' es None en
+        páginas con cursor y filtros (se informa en la primera página)
     """
-    service = OperatorDataService()
+    service = get_operator_data_service()
     
     try:
+        try:
+            columnar = is_columnar_format(response_format)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_code': 'INVALID_PARAMETERS'
+            }
+        
+
         # Convertir page/page_size a limit/offset
-        if page_size > 5000:
-            page_size = 5000
+        if page_size > SHEET_MAX_PAGE_SIZE:
+            page_size = SHEET_MAX_PAGE_SIZE
+        if page_size < 1:
+            page_size = 1
         if page < 1:
             page = 1
             
         limit = page_size
-        offset = (page - 1) * page_size
+        offset = 0 if page_cursor else (page - 1) * page_size
+        sort_dir = (sort_dir or 'asc').lower()
+        sort_by = sort_by or 'id'
         
-        with get_db_connection() as conn:
+        # Snapshot de lectura en el almacenamiento de la misión: las cargas en
+        # curso no bloquean ni alteran la página
+        mission_id = service._get_file_mission_id(file_upload_id)
+        with get_db_read_connection(mission_id) as conn:
             cursor = conn.cursor()
             
             # Obtener información del archivo
@@ -1180,7 +1650,7 @@ def get_operator_sheet_data(file_upload_id: str, page: int = 1,
             """, (file_upload_id,))
             
             file_info = cursor.fetchone()
-            if not file_info:
+            if not file_info or file_info[3] == 'DELETING':
                 return {
                     'success': False,
                     'error': f'Archivo no encontrado: {file_upload_id}',
@@ -1190,63 +1660,82 @@ def get_operator_sheet_data(file_upload_id: str, page: int = 1,
             file_type, operator, file_name = file_info[0], file_info[1], file_info[2]
             processing_status, records_processed, records_failed = file_info[3], file_info[4], file_info[5]
             
-            # Definir columnas según operador y tipo de archivo
-            column_config = service._get_column_configuration(operator, file_type)
-            
-            # Obtener datos según el tipo de archivo usando configuración dinámica
-            if file_type == 'CELLULAR_DATA':
-                # Primero obtener conteo total
-                cursor.execute("""
-                    SELECT COUNT(*) FROM operator_cellular_data 
-                    WHERE file_upload_id = ?
-                """, (file_upload_id,))
-                total_count = cursor.fetchone()[0]
-                
-                # Construir query dinámico basado en configuración
-                select_query = column_config['select_query'] + """
-                    WHERE file_upload_id = ?
-                    ORDER BY id ASC
-                    LIMIT ? OFFSET ?
-                """
-                cursor.execute(select_query, (file_upload_id, limit, offset))
-                
-            elif file_type == 'CALL_DATA':
-                # Primero obtener conteo total
-                cursor.execute("""
-                    SELECT COUNT(*) FROM operator_call_data 
-                    WHERE file_upload_id = ?
-                """, (file_upload_id,))
-                total_count = cursor.fetchone()[0]
-                
-                # Construir query dinámico basado en configuración
-                select_query = column_config['select_query'] + """
-                    WHERE file_upload_id = ?
-                    ORDER BY id ASC
-                    LIMIT ? OFFSET ?
-                """
-                cursor.execute(select_query, (file_upload_id, limit, offset))
-            
-            else:
+            if file_type not in SHEET_DATA_TABLES:
                 return {
                     'success': False,
                     'error': f'Tipo de archivo no soportado: {file_type}',
                     'error_code': 'UNSUPPORTED_FILE_TYPE'
                 }
             
-            # Convertir resultados (ahora el cursor tiene los datos correctos)
+            try:
+                extra_conditions, filter_params, order_by = service._build_sheet_page_query(
+                    file_type, sort_by, sort_dir, filters, page_cursor
+                )
+            except ValueError as e:
+                return {
+                    'success': False,
+                    'error': str(e),
+                    'error_code': 'INVALID_PARAMETERS'
+                }
+            
+            # Definir columnas según operador y tipo de archivo
+            column_config = service._get_column_configuration(operator, file_type)
+            has_filters = any(value is not None and str(value).strip() != '' for value in (filters or {}).values())
+            
+            # Conteo total: cacheado en operator_data_sheets sin filtros; con
+            # filtros solo se cuenta en la primera página
+            if not has_filters:
+                total_count = service._get_cached_row_count(cursor, file_upload_id)
+                if total_count is None and processing_status == 'COMPLETED':
+                    # Archivos cargados antes de existir data_row_count
+                    total_count = service._store_sheet_row_count(mission_id, file_upload_id, file_type)
+                if total_count is None:
+                    cursor.execute(
+                        f"SELECT COUNT(*) FROM {SHEET_DATA_TABLES[file_type]} WHERE file_upload_id = ?",
+                        (file_upload_id,)
+                    )
+                    total_count = cursor.fetchone()[0]
+            elif not page_cursor:
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM {SHEET_DATA_TABLES[file_type]} WHERE file_upload_id = ?{extra_conditions}",
+                    [file_upload_id] + filter_params
+                )
+                total_count = cursor.fetchone()[0]
+            else:
+                total_count = None
+            
+            # Se pide un registro extra para saber si hay más páginas
+            select_query = column_config['select_query'] + f"""
+                WHERE file_upload_id = ?{extra_conditions}
+                ORDER BY {order_by}
+                LIMIT ? OFFSET ?
+            """
+            cursor.execute(select_query, [file_upload_id] + filter_params + [limit + 1, offset])
+            
+            # Convertir resultados
             columns = [description[0] for description in cursor.description]
             rows = cursor.fetchall()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
             
-            data = []
-            for row in rows:
-                record = dict(zip(columns, row))
-                data.append(record)
+            if columnar:
+                data = encode_columnar(columns, rows)
+            else:
+                data = []
+                for row in rows:
+                    record = dict(zip(columns, row))
+                    data.append(record)
+            
+            next_cursor = None
+            if has_more:
+                next_cursor = {'id': rows[-1][columns.index('id')], 'value': rows[-1][columns.index(sort_by)]}
             
             return {
                 'success': True,
                 'data': data,
                 'total': total_count,
-                'hasMore': (offset + limit) < total_count,
+                'hasMore': has_more,
+                'nextCursor': next_cursor,
                 'columns': column_config['columns'],
                 'displayNames': column_config['display_names'],
                 'metadata': {
@@ -1260,7 +1749,13 @@ def get_operator_sheet_data(file_upload_id: str, page: int = 1,
                     'page': page,
                     'page_size': page_size,
                     'limit': limit,
-                    'offset': offset
+                    'offset': offset,
+                    'sort_by': sort_by,
+                    'sort_dir': sort_dir,
+                    'filters': filters or {},
+                    'response_format': 'columnar' if columnar else 'records',
+                    'sortable_columns': list(SHEET_SORT_COLUMNS[file_type]),
+                    'filterable_columns': list(SHEET_FILTER_COLUMNS[file_type])
                 }
             }
     
@@ -1274,7 +1769,78 @@ def get_operator_sheet_data(file_upload_id: str, page: int = 1,
 
 
 @eel.expose
-def delete_operator_sheet(file_upload_id: str, user_id: str) -> Dict[str, Any]:
+def get_operator_record_details(file_upload_id: str, record_id: int) -> Dict[str, Any]:
+    """
+    Obtiene un registro de un archivo con su operator_specific_data completo.
+    
+    Los listados de get_operator_sheet_data no incluyen los datos específicos
+    del operador; este detalle los reconstruye a partir del diccionario de
+    campos del archivo (las filas antiguas con JSON completo se leen igual).
+    
+    Args:
+        file_upload_id (str): ID del archivo cargado
+        record_id (int): ID del registro (columna 'id' de los listados)
+    
+    Returns:
+        Dict[str, Any]: Registro con 'operator_specific_data' como diccionario
+    """
+    service = get_operator_data_service()
+    
+    try:
+        with get_db_connection(service._get_file_mission_id(file_upload_id)) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                "SELECT file_type, processing_status FROM operator_data_sheets WHERE id = ?",
+                (file_upload_id,)
+            )
+            file_info = cursor.fetchone()
+            if not file_info or file_info[1] == 'DELETING':
+                return {
+                    'success': False,
+                    'error': f'Archivo no encontrado: {file_upload_id}',
+                    'error_code': 'FILE_NOT_FOUND'
+                }
+            if file_info[0] not in SHEET_DATA_TABLES:
+                return {
+                    'success': False,
+                    'error': f'Tipo de archivo no soportado: {file_info[0]}',
+                    'error_code': 'UNSUPPORTED_FILE_TYPE'
+                }
+            
+            cursor.execute(
+                f"SELECT * FROM {SHEET_DATA_TABLES[file_info[0]]} WHERE file_upload_id = ? AND id = ?",
+                (file_upload_id, record_id)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return {
+                    'success': False,
+                    'error': f'Registro no encontrado: {record_id}',
+                    'error_code': 'RECORD_NOT_FOUND'
+                }
+            
+            record = dict(zip([description[0] for description in cursor.description], row))
+            record['operator_specific_data'] = expand_operator_specific_data(
+                record.get('operator_specific_data'), load_field_dictionary(cursor, file_upload_id)
+            )
+            
+            return {
+                'success': True,
+                'data': record
+            }
+    
+    except Exception as e:
+        service.logger.error(f"Error obteniendo registro {record_id} del archivo {file_upload_id}: {str(e)}")
+        return {
+            'success': False,
+            'error': f"Error obteniendo registro: {str(e)}",
+            'error_code': 'QUERY_ERROR'
+        }
+
+
+@eel.expose
+def delete_operator_sheet(file_upload_id: str, user_id: str, vacuum: bool = False) -> Dict[str, Any]:
     """
     Elimina un archivo de datos de operador y todos sus datos asociados.
     
@@ -1282,16 +1848,20 @@ def delete_operator_sheet(file_upload_id: str, user_id: str) -> Dict[str, Any]:
     - El registro del archivo en operator_data_sheets
     - Todos los datos celulares/llamadas asociados
     - Los logs de procesamiento
-    - Los registros de auditoría
+    
+    El archivo se marca como DELETING de inmediato (deja de aparecer en las
+    consultas) y sus datos se eliminan por lotes en un trabajo en segundo
+    plano. El progreso se consulta con get_deletion_job_status(jobId).
     
     Args:
         file_upload_id (str): ID del archivo a eliminar
         user_id (str): ID del usuario que solicita la eliminación
+        vacuum (bool): Ejecutar VACUUM incremental al terminar
     
     Returns:
-        Dict[str, Any]: Resultado de la eliminación
+        Dict[str, Any]: Resultado de la solicitud con el trabajo de eliminación
     """
-    service = OperatorDataService()
+    service = get_operator_data_service()
     
     try:
         # Validar que el usuario existe
@@ -1334,11 +1904,14 @@ def delete_operator_sheet(file_upload_id: str, user_id: str) -> Dict[str, Any]:
                 }
             )
             
-            # Eliminar archivo (CASCADE eliminará datos relacionados)
-            cursor.execute("DELETE FROM operator_data_sheets WHERE id = ?", (file_upload_id,))
+            # Marcar el archivo para que las consultas lo ignoren
+            cursor.execute("""
+                UPDATE operator_data_sheets 
+                SET processing_status = 'DELETING'
+                WHERE id = ?
+            """, (file_upload_id,))
             
-            deleted_count = cursor.rowcount
-            if deleted_count == 0:
+            if cursor.rowcount == 0:
                 return {
                     'success': False,
                     'error': 'No se pudo eliminar el archivo',
@@ -1346,18 +1919,19 @@ def delete_operator_sheet(file_upload_id: str, user_id: str) -> Dict[str, Any]:
                 }
             
             conn.commit()
-            
-            service.logger.info(
-                f"Archivo eliminado exitosamente: {file_name}",
-                extra={'records_affected': records_processed or 0}
-            )
-            
-            return {
-                'success': True,
-                'message': f'Archivo "{file_name}" eliminado exitosamente',
-                'file_name': file_name,
-                'records_deleted': records_processed or 0
-            }
+        
+        _notify_call_data_change(service._get_file_mission_id(file_upload_id))
+        deletion_job = service._start_sheet_deletion(file_upload_id, vacuum=vacuum)
+        
+        return {
+            'success': True,
+            'message': f'Eliminación del archivo "{file_name}" en curso',
+            'file_name': file_name,
+            'records_deleted': records_processed or 0,
+            'status': 'DELETING',
+            'jobId': deletion_job['jobId'],
+            'deletionJob': deletion_job
+        }
     
     except Exception as e:
         service.logger.error(f"Error eliminando archivo {file_upload_id}: {str(e)}")
@@ -1383,7 +1957,7 @@ def get_operator_statistics(mission_id: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Estadísticas consolidadas con totales y por operador
     """
-    service = OperatorDataService()
+    service = get_operator_data_service()
     
     try:
         with get_db_connection() as conn:
@@ -1403,9 +1977,9 @@ def get_operator_statistics(mission_id: Optional[str] = None) -> Dict[str, Any]:
             """
             
             if mission_id:
-                cursor.execute(base_query + "WHERE mission_id = ? GROUP BY operator", (mission_id,))
+                cursor.execute(base_query + "WHERE mission_id = ? AND processing_status != 'DELETING' GROUP BY operator", (mission_id,))
             else:
-                cursor.execute(base_query + "GROUP BY operator")
+                cursor.execute(base_query + "WHERE processing_status != 'DELETING' GROUP BY operator")
             
             stats = {}
             total_stats = {
@@ -1461,7 +2035,7 @@ def get_operator_statistics(mission_id: Optional[str] = None) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Código de testing básico
-    service = OperatorDataService()
+    service = get_operator_data_service()
     print("OperatorDataService inicializado correctamente")
     
     # Test de estadísticas
@@ -0,0 +1,338 @@
+"""
+KRONOS - Operator Ingestion Adapters
+===============================================================================
+ADAPTADORES DECLARATIVOS DE CARGA POR OPERADOR
+===============================================================================
+
+Cada formato de archivo de operador se describe con un IngestionAdapter: qué
+columnas leer y cómo renombrarlas, las reglas de limpieza vectorizadas, la
+validación de registros, cómo separar los registros por sentido y qué método
+arma los parámetros del INSERT de cada registro.
+FileProcessorService.process_with_adapter ejecuta cualquier adaptador con el
+mismo núcleo:
+
+- Lectura pestaña por pestaña (o el CSV completo), sin concatenar el libro
+- Limpieza, validación (máscara vectorizada) y normalización por pestaña, en
+  el pool de procesos para archivos grandes (ver services.parallel_sheet_processor)
+- Escritura por lotes con executemany; un lote rechazado se reintenta fila a
+  fila para separar duplicados, errores de validación y otros errores
+- Tope de errores verificado después de cada lote y tasa de éxito mínima
+- Métricas de preparación, escritura y registros por segundo
+
+Para agregar un formato basta con registrar su adaptador y definir su método
+de parámetros en FileProcessorService: operator_data_service usa el adaptador
+para cualquier combinación operador/tipo de archivo sin procesador propio. Un
+operador nuevo además debe figurar en SUPPORTED_OPERATORS y en los CHECK de
+operador de las tablas de operadores.
+
+Los adaptadores se envían a los procesos del pool, por lo que solo contienen
+datos (los métodos se referencian por nombre).
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+# Inserción de llamadas de TIGO, CLARO y MOVISTAR (parámetros de _build_*_call_params)
+CALL_DATA_INSERT_SQL = """
+    INSERT INTO operator_call_data (
+        file_upload_id, mission_id, operator, tipo_llamada, numero_origen,
+        numero_destino, numero_objetivo, fecha_hora_llamada, duracion_segundos,
+        celda_origen, celda_destino, celda_objetivo, latitud_origen,
+        longitud_origen, latitud_destino, longitud_destino, tecnologia,
+        tipo_trafico, estado_llamada, operator_specific_data, record_hash,
+        cellid_decimal, lac_decimal
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Inserción de datos celulares de WOM, CLARO y MOVISTAR (parámetros de _build_*_cellular_params)
+CELLULAR_DATA_INSERT_SQL = """
+    INSERT INTO operator_cellular_data (
+        file_upload_id, mission_id, operator, numero_telefono,
+        fecha_hora_inicio, fecha_hora_fin, duracion_segundos, celda_id,
+        lac_tac, trafico_subida_bytes, trafico_bajada_bytes, latitud,
+        longitud, tecnologia, tipo_conexion, operator_specific_data, record_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Inserción de llamadas WOM (parámetros de _build_wom_call_params)
+WOM_CALL_INSERT_SQL = """
+    INSERT INTO operator_call_data (
+        file_upload_id, mission_id, operator, tipo_llamada, numero_origen,
+        numero_destino, numero_objetivo, fecha_hora_llamada, duracion_segundos,
+        celda_origen, celda_destino, celda_objetivo, latitud_origen, longitud_origen,
+        latitud_destino, longitud_destino, calidad_senal, tecnologia,
+        operator_specific_data, record_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Inserción de mediciones SCANHUNTER en cellular_data (parámetros de _build_scanhunter_params)
+SCANHUNTER_INSERT_SQL = """
+    INSERT INTO cellular_data (
+        mission_id, file_record_id, punto, lat, lon, mnc_mcc, operator,
+        rssi, tecnologia, cell_id, lac_tac, enb, comentario, channel, record_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Sentido de los registros de archivos sin separación por sentido (datos por celda)
+DATA_DIRECTION = 'DATOS'
+
+# Registros fallidos (sin contar duplicados) tras los que se aborta la carga
+MAX_FAILED_RECORDS = 100
+
+# Columnas del formato TIGO y su nombre estándar (solo estas se leen del Excel)
+TIGO_COLUMN_MAPPING = {
+    'TIPO_DE_LLAMADA': 'tipo_de_llamada',
+    'NUMERO A': 'numero_a',
+    'NUMERO MARCADO': 'numero_marcado',
+    'TRCSEXTRACODEC': 'trcsextracodec',
+    'DIRECCION: O SALIENTE, I ENTRANTE': 'direccion',
+    'DURACION TOTAL seg': 'duracion_total_seg',
+    'FECHA Y HORA ORIGEN': 'fecha_hora_origen',
+    'CELDA_ORIGEN_TRUNCADA': 'celda_origen_truncada',
+    'TECH': 'tecnologia',
+    'DIRECCION': 'direccion_fisica',
+    'CITY_DS': 'ciudad',
+    'DEPARTMENT_DS': 'departamento',
+    'AZIMUTH': 'azimuth',
+    'ALTURA': 'altura',
+    'POTENCIA': 'potencia',
+    'LONGITUDE': 'longitud',
+    'LATITUDE': 'latitud',
+    'TIPO_COBERTURA': 'tipo_cobertura',
+    'TIPO_ESTRUCTURA': 'tipo_estructura',
+    'OPERADOR': 'operador',
+    'CELLID_NVAL': 'cellid_nval'
+}
+
+
+@lru_cache(maxsize=None)
+def specific_data_position(insert_sql: str) -> Optional[int]:
+    """Posición de operator_specific_data en los parámetros de un INSERT (None si no la incluye)"""
+    columns = insert_sql.split('(', 1)[1].split(')', 1)[0]
+    columns = [column.strip() for column in columns.split(',')]
+    return columns.index('operator_specific_data') if 'operator_specific_data' in columns else None
+
+
+@lru_cache(maxsize=None)
+def insert_table(insert_sql: str) -> str:
+    """Tabla destino de un INSERT"""
+    return insert_sql.split('INTO', 1)[1].split('(', 1)[0].strip()
+
+
+@dataclass(frozen=True)
+class IngestionAdapter:
+    """
+    Descripción declarativa de un formato de archivo de operador
+
+    Las reglas de limpieza se aplican en este orden: nombres de columnas sin
+    espacios y renombrados (column_mapping), validación de estructura
+    (structure_validator), verificación de required_columns, normalización del
+    DataFrame (frame_normalizer y frame_cleaner), descarte de filas sin
+    dropna_columns, decimales con coma (decimal_comma_columns) y columnas
+    numéricas con nulos en 0 (numeric_columns). Después, record_validator
+    descarta los registros inválidos de la pestaña en una sola pasada.
+    """
+    operator: str
+    file_type: str                      # 'CALL_DATA', 'CELLULAR_DATA' o una variante ('CALL_DATA_ENTRANTE')
+    label: str                          # Nombre del formato en logs y mensajes
+    insert_sql: str
+    # Método de FileProcessorService (registro, sentido, file_upload_id, mission_id) -> tupla o None
+    params_builder: str
+    read_columns: Optional[Tuple[str, ...]] = None      # Columnas del Excel a leer (None = todas)
+    read_as_text: bool = False                          # Celdas del Excel como texto, igual que el CSV
+    column_mapping: Dict[str, str] = field(default_factory=dict)
+    # Método de FileProcessorService (DataFrame) -> (es válido, errores); puede renombrar columnas
+    structure_validator: Optional[str] = None
+    required_columns: Tuple[str, ...] = ()
+    frame_normalizer: Optional[str] = None              # Método de DataNormalizerService sobre el DataFrame
+    frame_cleaner: Optional[str] = None                 # Método de FileProcessorService sobre el DataFrame
+    dropna_columns: Tuple[str, ...] = ()
+    decimal_comma_columns: Tuple[str, ...] = ()
+    numeric_columns: Tuple[str, ...] = ()
+    # Método de FileProcessorService (DataFrame) -> [(mensaje, máscara de filas inválidas)]
+    record_validator: Optional[str] = None
+    # Columna de sentido y valores aceptados por sentido (sin columna: todo es default_direction)
+    direction_column: Optional[str] = None
+    direction_values: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    default_direction: str = DATA_DIRECTION
+    # Distribución de tecnologías incluida en los detalles del resultado
+    technology_column: Optional[str] = None
+    technology_detail_key: Optional[str] = None
+    # Columnas de origen agregadas a cada pestaña: columna -> 'sheet_name' | 'sheet_index' | 'total_sheets'
+    sheet_metadata_columns: Dict[str, str] = field(default_factory=dict)
+    csv_delimiter: str = ','
+    # Las llamadas de TIGO, CLARO y MOVISTAR cuentan los duplicados como fallidos;
+    # WOM y los datos por celda los reportan aparte
+    duplicates_are_failures: bool = False
+    # Registros fallidos (sin duplicados) tras los que se aborta la carga (None = sin tope)
+    max_failed_records: Optional[int] = None
+    # Porcentaje mínimo de registros insertados para dar la carga por exitosa
+    # (None = siempre exitosa; el estado queda FAILED si hubo registros fallidos)
+    min_success_rate: Optional[float] = None
+
+
+# Adaptadores registrados por (operador, tipo de archivo)
+INGESTION_ADAPTERS: Dict[Tuple[str, str], IngestionAdapter] = {}
+
+
+def register_ingestion_adapter(adapter: IngestionAdapter) -> IngestionAdapter:
+    """Registra (o reemplaza) el adaptador de un operador y tipo de archivo"""
+    INGESTION_ADAPTERS[(adapter.operator.upper(), adapter.file_type.upper())] = adapter
+    return adapter
+
+
+def get_ingestion_adapter(operator: str, file_type: str) -> Optional[IngestionAdapter]:
+    """Adaptador registrado para un operador y tipo de archivo, o None"""
+    return INGESTION_ADAPTERS.get(((operator or '').upper(), (file_type or '').upper()))
+
+
+# Coordenadas con coma decimal (formato de TIGO y WOM)
+_COORDINATE_COLUMNS = ('latitud', 'longitud')
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='TIGO',
+    file_type='CALL_DATA',
+    label='TIGO',
+    insert_sql=CALL_DATA_INSERT_SQL,
+    params_builder='_build_tigo_call_params',
+    read_columns=tuple(TIGO_COLUMN_MAPPING),
+    column_mapping=TIGO_COLUMN_MAPPING,
+    required_columns=('tipo_de_llamada', 'numero_a', 'direccion', 'fecha_hora_origen'),
+    dropna_columns=('numero_a', 'direccion'),
+    decimal_comma_columns=_COORDINATE_COLUMNS + ('potencia',),
+    numeric_columns=('duracion_total_seg',),
+    direction_column='direccion',
+    direction_values={'ENTRANTE': ('I', 'ENTRANTE'), 'SALIENTE': ('O', 'SALIENTE')},
+    sheet_metadata_columns={'_source_sheet': 'sheet_name', '_sheet_index': 'sheet_index',
+                            '_total_sheets': 'total_sheets'},
+    duplicates_are_failures=True
+))
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='WOM',
+    file_type='CELLULAR_DATA',
+    label='WOM datos por celda',
+    insert_sql=CELLULAR_DATA_INSERT_SQL,
+    params_builder='_build_wom_cellular_params',
+    required_columns=(
+        'OPERADOR_TECNOLOGIA', 'BTS_ID', 'TAC', 'CELL_ID_VOZ', 'SECTOR',
+        'FECHA_HORA_INICIO', 'FECHA_HORA_FIN', 'OPERADOR_RAN', 'NUMERO_ORIGEN',
+        'DURACION_SEG', 'UP_DATA_BYTES', 'DOWN_DATA_BYTES', 'IMSI',
+        'NOMBRE_ANTENA', 'DIRECCION', 'LATITUD', 'LONGITUD',
+        'LOCALIDAD', 'CIUDAD', 'DEPARTAMENTO'
+    ),
+    frame_normalizer='normalize_wom_cellular_data',
+    dropna_columns=('numero_origen', 'operador_tecnologia'),
+    decimal_comma_columns=_COORDINATE_COLUMNS,
+    numeric_columns=('duracion_seg', 'up_data_bytes', 'down_data_bytes', 'bts_id', 'tac', 'cell_id_voz', 'sector'),
+    technology_column='operador_tecnologia',
+    technology_detail_key='operator_technology_types',
+    sheet_metadata_columns={'source_sheet': 'sheet_name'}
+))
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='WOM',
+    file_type='CALL_DATA',
+    label='WOM llamadas',
+    insert_sql=WOM_CALL_INSERT_SQL,
+    params_builder='_build_wom_call_params',
+    required_columns=(
+        'OPERADOR_TECNOLOGIA', 'BTS_ID', 'TAC', 'CELL_ID_VOZ', 'SECTOR',
+        'NUMERO_ORIGEN', 'NUMERO_DESTINO', 'FECHA_HORA_INICIO', 'FECHA_HORA_FIN',
+        'DURACION_SEG', 'OPERADOR_RAN_ORIGEN', 'NOMBRE_ANTENA', 'DIRECCION',
+        'LATITUD', 'LONGITUD', 'LOCALIDAD', 'CIUDAD', 'DEPARTAMENTO', 'SENTIDO'
+    ),
+    frame_normalizer='normalize_wom_call_data_entrantes',
+    dropna_columns=('numero_origen', 'sentido'),
+    decimal_comma_columns=_COORDINATE_COLUMNS,
+    numeric_columns=('duracion_seg',),
+    direction_column='sentido',
+    direction_values={'ENTRANTE': ('ENTRANTE',), 'SALIENTE': ('SALIENTE',)},
+    technology_column='operador_tecnologia',
+    technology_detail_key='technology_distribution',
+    sheet_metadata_columns={'source_sheet': 'sheet_name'}
+))
+
+# CLARO, MOVISTAR y SCANHUNTER: celdas en texto como en sus CSV y tope de errores.
+# min_success_rate=0.0 exige al menos un registro insertado
+_TEXT_FORMAT_RULES = dict(read_as_text=True, max_failed_records=MAX_FAILED_RECORDS)
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='CLARO',
+    file_type='CELLULAR_DATA',
+    label='CLARO datos por celda',
+    insert_sql=CELLULAR_DATA_INSERT_SQL,
+    params_builder='_build_claro_cellular_params',
+    structure_validator='_validate_claro_cellular_columns',
+    frame_cleaner='_clean_claro_cellular_data',
+    record_validator='_claro_cellular_record_errors',
+    csv_delimiter=';',
+    min_success_rate=80.0,
+    **_TEXT_FORMAT_RULES
+))
+
+# CLARO entrega entrantes y salientes en archivos separados
+for _call_direction in ('ENTRANTE', 'SALIENTE'):
+    register_ingestion_adapter(IngestionAdapter(
+        operator='CLARO',
+        file_type=f'CALL_DATA_{_call_direction}',
+        label=f'CLARO llamadas {_call_direction.lower()}s',
+        insert_sql=CALL_DATA_INSERT_SQL,
+        params_builder='_build_claro_call_params',
+        structure_validator='_validate_claro_call_columns',
+        frame_cleaner='_clean_claro_call_data',
+        record_validator='_claro_call_record_errors',
+        default_direction=_call_direction,
+        duplicates_are_failures=True,
+        min_success_rate=0.0,
+        **_TEXT_FORMAT_RULES
+    ))
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='MOVISTAR',
+    file_type='CELLULAR_DATA',
+    label='MOVISTAR datos por celda',
+    insert_sql=CELLULAR_DATA_INSERT_SQL,
+    params_builder='_build_movistar_cellular_params',
+    structure_validator='_validate_movistar_cellular_columns',
+    frame_cleaner='_clean_movistar_cellular_data',
+    record_validator='_movistar_cellular_record_errors',
+    min_success_rate=0.0,
+    **_TEXT_FORMAT_RULES
+))
+
+register_ingestion_adapter(IngestionAdapter(
+    operator='MOVISTAR',
+    file_type='CALL_DATA',
+    label='MOVISTAR llamadas salientes',
+    insert_sql=CALL_DATA_INSERT_SQL,
+    params_builder='_build_movistar_call_params',
+    structure_validator='_validate_movistar_call_columns',
+    frame_cleaner='_clean_movistar_call_frame',
+    record_validator='_movistar_call_record_errors',
+    default_direction='SALIENTE',
+    duplicates_are_failures=True,
+    min_success_rate=0.0,
+    **_TEXT_FORMAT_RULES
+))
+
+# Mediciones de scanner de la misión (cellular_data): no es un archivo de
+# operador, por eso no se registra
+SCANHUNTER_ADAPTER = IngestionAdapter(
+    operator='SCANHUNTER',
+    file_type='CELLULAR_DATA',
+    label='SCANHUNTER',
+    insert_sql=SCANHUNTER_INSERT_SQL,
+    params_builder='_build_scanhunter_params',
+    structure_validator='_validate_scanhunter_columns',
+    frame_cleaner='_clean_scanhunter_data',
+    record_validator='_scanhunter_record_errors',
+    min_success_rate=0.0,
+    **_TEXT_FORMAT_RULES
+)
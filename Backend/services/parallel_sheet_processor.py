@@ -0,0 +1,125 @@
+"""
+KRONOS - Parallel Sheet Processor
+===============================================================================
+PROCESAMIENTO PARALELO DE PESTAÑAS EXCEL
+===============================================================================
+
+Los archivos TIGO y WOM llegan como libros de varias pestañas. Cada pestaña se
+lee, limpia y normaliza de forma independiente en un pool de procesos; el
+proceso principal recibe los registros ya preparados a medida que cada
+pestaña termina y es el único que escribe en SQLite.
+
+- El contenido del archivo se envía una sola vez a cada proceso (initializer)
+- Cada proceso crea su propio FileProcessorService
+- Si el pool no puede crearse o se rompe, las pestañas pendientes se
+  procesan en el proceso principal con la misma tarea
+
+Las tareas son métodos de FileProcessorService con la firma
+(file_bytes, sheet_name, sheet_index, total_sheets, **task_kwargs) que
+retornan un diccionario serializable con el resultado de la pestaña.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Procesos del pool (se deja un núcleo libre para el escritor y la interfaz)
+PARALLEL_SHEET_MAX_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# Tamaño mínimo de archivo para usar el pool (en archivos pequeños el costo
+# de arrancar los procesos supera la ganancia)
+PARALLEL_SHEET_MIN_FILE_BYTES = 2 * 1024 * 1024
+
+# Estado por proceso del pool
+_worker_file_bytes: Optional[bytes] = None
+_worker_service = None
+
+
+def _init_sheet_worker(file_bytes: bytes) -> None:
+    """Inicializa un proceso del pool con el contenido del archivo"""
+    global _worker_file_bytes
+    _worker_file_bytes = file_bytes
+
+
+def _run_sheet_task(task_name: str, sheet_name: str, sheet_index: int, total_sheets: int,
+                    task_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Ejecuta una tarea de pestaña dentro de un proceso del pool"""
+    global _worker_service
+    if _worker_service is None:
+        from services.file_processor_service import FileProcessorService
+        _worker_service = FileProcessorService()
+
+    task = getattr(_worker_service, task_name)
+    return task(_worker_file_bytes, sheet_name, sheet_index, total_sheets, **task_kwargs)
+
+
+def should_process_sheets_in_parallel(file_bytes: bytes, sheet_names: List[str]) -> bool:
+    """Indica si conviene procesar las pestañas en el pool de procesos"""
+    return (
+        PARALLEL_SHEET_MAX_WORKERS > 1
+        and len(sheet_names) > 1
+        and len(file_bytes) >= PARALLEL_SHEET_MIN_FILE_BYTES
+    )
+
+
+def iter_sheet_results(service, file_bytes: bytes, sheet_names: List[str], task_name: str,
+                       task_kwargs: Optional[Dict[str, Any]] = None,
+                       max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Ejecuta una tarea por pestaña y entrega los resultados en orden de término
+
+    Args:
+        service: FileProcessorService del proceso principal (para el respaldo serial)
+        file_bytes: Contenido del archivo Excel
+        sheet_names: Pestañas a procesar, en orden
+        task_name: Método de FileProcessorService que procesa una pestaña
+        task_kwargs: Argumentos adicionales de la tarea
+        max_workers: Procesos del pool (None = PARALLEL_SHEET_MAX_WORKERS, 1 = serial)
+
+    Yields:
+        Resultado de cada pestaña tal como lo retorna la tarea
+    """
+    task_kwargs = task_kwargs or {}
+    total_sheets = len(sheet_names)
+    workers = min(max_workers or PARALLEL_SHEET_MAX_WORKERS, total_sheets)
+    pending = {sheet_index: sheet_name for sheet_index, sheet_name in enumerate(sheet_names, 1)}
+
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_sheet_worker,
+                                     initargs=(file_bytes,)) as executor:
+                futures = {
+                    executor.submit(_run_sheet_task, task_name, sheet_name, sheet_index,
+                                    total_sheets, task_kwargs): sheet_index
+                    for sheet_index, sheet_name in pending.items()
+                }
+                logger.info(f"Procesando {total_sheets} pestañas en {workers} procesos ({task_name})")
+
+                try:
+                    for future in as_completed(futures):
+                        result = future.result()
+                        pending.pop(futures[future], None)
+                        yield result
+                except GeneratorExit:
+                    # El consumidor dejó de leer (carga abortada): no iniciar las pestañas pendientes
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        except (BrokenProcessPool, OSError, PermissionError) as e:
+            logger.warning(f"Pool de procesos no disponible ({e}), procesando "
+                           f"{len(pending)} pestañas en el proceso principal")
+
+    # Respaldo serial: pestañas no procesadas por el pool (o pool deshabilitado)
+    task = getattr(service, task_name)
+    for sheet_index, sheet_name in list(pending.items()):
+        result = task(file_bytes, sheet_name, sheet_index, total_sheets, **task_kwargs)
+        pending.pop(sheet_index, None)
+        yield result
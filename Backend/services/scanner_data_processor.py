@@ -6,8 +6,8 @@ en formato SCANHUNTER.xlsx con validación robusta y mapeo optimizado.
 
 Características principales:
 - Mapeo inteligente de columnas SCANHUNTER -> base de datos
-- Validación integral de datos con reportes detallados
-- Detección de duplicados y anomalías
+- Validación integral de datos con reportes detallados (columnar)
+- Detección de duplicados y anomalías (duplicated())
 - Procesamiento por lotes optimizado
 - Integración con sistema de misiones KRONOS
 ====================================================================
@@ -18,7 +18,8 @@ import numpy as np
 import re
 import hashlib
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Union
+from collections import Counter
+from typing import Dict, List, Tuple, Optional, Any, Union, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -118,6 +119,34 @@ class ScannerDataProcessor:
         '154': 'PARTNERS'  # Partners Telecom
     }
     
+    # Máximo de ValidationResult materializados por archivo (los conteos de
+    # estadísticas y resumen siempre cubren todos los hallazgos)
+    MAX_VALIDATION_RESULTS = 10000
+    
+    # Orden de validación de cada registro (orden de los ValidationResult)
+    VALIDATION_FIELDS = (
+        'punto', 'latitude', 'longitude', 'mnc_mcc', 'operator_name',
+        'rssi_dbm', 'technology', 'cell_id', 'duplicate'
+    )
+    
+    # Campos cuyos errores invalidan el registro
+    ROW_ERROR_FIELDS = ('punto', 'latitude', 'longitude', 'rssi_dbm', 'cell_id')
+    
+    # Método _validate_* de cada campo (genera el ValidationResult de un registro)
+    FIELD_VALIDATORS = {
+        'punto': 'punto',
+        'latitude': 'latitude',
+        'longitude': 'longitude',
+        'mnc_mcc': 'mnc_mcc',
+        'operator_name': 'operator',
+        'rssi_dbm': 'rssi',
+        'technology': 'technology',
+        'cell_id': 'cell_id'
+    }
+    
+    # Campos que identifican un registro duplicado
+    DUPLICATE_KEY_FIELDS = ('mission_id', 'punto', 'latitude', 'longitude', 'cell_id', 'operator_name')
+    
     def __init__(self, mission_id: str):
         """
         Inicializa el procesador para una misión específica
@@ -127,8 +156,8 @@ class ScannerDataProcessor:
         """
         self.mission_id = mission_id
         self.validation_results: List[ValidationResult] = []
+        self.validation_counts: Dict[str, Counter] = self._new_validation_counts()
         self.stats = ProcessingStats(0, 0, 0, 0, 0, 0, 0.0)
-        self.duplicate_hashes: set = set()
         
     def process_file(self, file_path: str, filename: str = None) -> Tuple[pd.DataFrame, ProcessingStats, List[ValidationResult]]:
         """
@@ -163,8 +192,9 @@ class ScannerDataProcessor:
             self.stats.total_rows = len(df)
             self.stats.valid_rows = len(processed_df)
             self.stats.invalid_rows = self.stats.total_rows - self.stats.valid_rows
-            self.stats.warnings = len([v for v in self.validation_results if v.severity == ValidationSeverity.WARNING])
-            self.stats.errors = len([v for v in self.validation_results if v.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]])
+            by_severity = self.validation_counts['by_severity']
+            self.stats.warnings = by_severity[ValidationSeverity.WARNING]
+            self.stats.errors = by_severity[ValidationSeverity.ERROR] + by_severity[ValidationSeverity.CRITICAL]
             
             logger.info(f"Procesamiento completado: {self.stats.valid_rows}/{self.stats.total_rows} registros válidos")
             
@@ -187,7 +217,7 @@ class ScannerDataProcessor:
         """
         # Resetear resultados anteriores
         self.validation_results.clear()
-        self.duplicate_hashes.clear()
+        self.validation_counts = self._new_validation_counts()
         
         # Verificar columnas requeridas
         self._validate_columns(df)
@@ -244,90 +274,268 @@ class ScannerDataProcessor:
     def _validate_and_clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Realiza validación y limpieza completa de todos los campos
+        
+        Cada campo se valida por columna con máscaras (_flag_*) y los duplicados
+        se detectan con duplicated(). Las reglas son las de los métodos
+        _validate_*, que solo se invocan para materializar los ValidationResult
+        de los registros con hallazgos (hasta MAX_VALIDATION_RESULTS).
         """
         cleaned_df = df.copy()
+        if cleaned_df.empty:
+            return cleaned_df
         
-        for index, row in cleaned_df.iterrows():
-            row_errors = []
-            
-            # Validar punto de medición
-            punto_result = self._validate_punto(row['punto'], index)
-            if punto_result:
-                self.validation_results.append(punto_result)
-                if punto_result.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]:
-                    row_errors.append(punto_result.message)
-                if punto_result.suggested_value:
-                    cleaned_df.at[index, 'punto'] = punto_result.suggested_value
-            
-            # Validar coordenadas
-            lat_result = self._validate_latitude(row['latitude'], index)
-            if lat_result:
-                self.validation_results.append(lat_result)
-                if lat_result.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]:
-                    row_errors.append(lat_result.message)
-                elif lat_result.suggested_value is not None:
-                    cleaned_df.at[index, 'latitude'] = lat_result.suggested_value
-            
-            lon_result = self._validate_longitude(row['longitude'], index)
-            if lon_result:
-                self.validation_results.append(lon_result)
-                if lon_result.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]:
-                    row_errors.append(lon_result.message)
-                elif lon_result.suggested_value is not None:
-                    cleaned_df.at[index, 'longitude'] = lon_result.suggested_value
-            
-            # Validar MNC+MCC
-            mnc_result = self._validate_mnc_mcc(row['mnc_mcc'], index)
-            if mnc_result:
-                self.validation_results.append(mnc_result)
-                if mnc_result.suggested_value:
-                    cleaned_df.at[index, 'mnc_mcc'] = mnc_result.suggested_value
-            
-            # Validar operador
-            operator_result = self._validate_operator(row['operator_name'], index)
-            if operator_result:
-                self.validation_results.append(operator_result)
-                if operator_result.suggested_value:
-                    cleaned_df.at[index, 'operator_name'] = operator_result.suggested_value
-            
-            # Validar RSSI
-            rssi_result = self._validate_rssi(row['rssi_dbm'], index)
-            if rssi_result:
-                self.validation_results.append(rssi_result)
-                if rssi_result.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]:
-                    row_errors.append(rssi_result.message)
-                elif rssi_result.suggested_value is not None:
-                    cleaned_df.at[index, 'rssi_dbm'] = rssi_result.suggested_value
-            
-            # Validar tecnología
-            tech_result = self._validate_technology(row['technology'], index)
-            if tech_result:
-                self.validation_results.append(tech_result)
-                if tech_result.suggested_value:
-                    cleaned_df.at[index, 'technology'] = tech_result.suggested_value
-            
-            # Validar Cell ID
-            cell_result = self._validate_cell_id(row['cell_id'], index)
-            if cell_result:
-                self.validation_results.append(cell_result)
-                if cell_result.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]:
-                    row_errors.append(cell_result.message)
-                elif cell_result.suggested_value:
-                    cleaned_df.at[index, 'cell_id'] = cell_result.suggested_value
+        findings_by_field = {}
+        error_messages: Dict[int, List[str]] = {}
+        
+        for field in self.VALIDATION_FIELDS[:-1]:
+            findings, fixes = getattr(self, f'_flag_{field}')(df[field])
+            findings_by_field[field] = findings
             
-            # Detectar duplicados
-            duplicate_result = self._check_duplicate(cleaned_df.iloc[index], index)
-            if duplicate_result:
-                self.validation_results.append(duplicate_result)
-                self.stats.duplicates += 1
+            # Aplicar valores corregidos/normalizados
+            column_position = cleaned_df.columns.get_loc(field)
+            for mask, values in fixes:
+                if mask.any():
+                    cleaned_df.iloc[np.flatnonzero(mask), column_position] = values
             
-            # Establecer estado de validación
-            if not row_errors:
-                cleaned_df.at[index, 'is_validated'] = True
+            # Errores que invalidan el registro (en orden de campo)
+            if field in self.ROW_ERROR_FIELDS:
+                for mask, severity, messages in findings:
+                    if severity in (ValidationSeverity.ERROR, ValidationSeverity.CRITICAL):
+                        for position, message in zip(np.flatnonzero(mask), _expand_messages(mask, messages)):
+                            error_messages.setdefault(position, []).append(message)
+        
+        # Detectar duplicados sobre los valores ya limpios
+        duplicate_mask = self._duplicate_mask(cleaned_df)
+        findings_by_field['duplicate'] = [
+            (duplicate_mask, ValidationSeverity.WARNING, "Posible registro duplicado detectado")
+        ]
+        self.stats.duplicates += int(duplicate_mask.sum())
+        
+        # Establecer estado de validación
+        is_validated = np.ones(len(cleaned_df), dtype=bool)
+        validation_errors = np.full(len(cleaned_df), '', dtype=object)
+        for position, messages in error_messages.items():
+            is_validated[position] = False
+            validation_errors[position] = '; '.join(messages)
+        cleaned_df['is_validated'] = is_validated
+        cleaned_df['validation_errors'] = validation_errors
+        
+        self._record_validations(df, cleaned_df, findings_by_field)
+        return cleaned_df
+    
+    def _record_validations(self, df: pd.DataFrame, cleaned_df: pd.DataFrame,
+                            findings_by_field: Dict[str, list]) -> None:
+        """
+        Acumula los conteos de todos los hallazgos y materializa los
+        ValidationResult de los primeros MAX_VALIDATION_RESULTS (orden fila, campo)
+        """
+        positions = []
+        field_orders = []
+        
+        for field_order, field in enumerate(self.VALIDATION_FIELDS):
+            for mask, severity, messages in findings_by_field[field]:
+                count = int(mask.sum())
+                if not count:
+                    continue
+                self.validation_counts['by_severity'][severity] += count
+                self.validation_counts['by_field'][field] += count
+                if isinstance(messages, str):
+                    self.validation_counts['by_message'][messages] += count
+                else:
+                    self.validation_counts['by_message'].update(messages)
+                positions.append(np.flatnonzero(mask))
+                field_orders.append(np.full(count, field_order))
+        
+        if not positions:
+            return
+        
+        positions = np.concatenate(positions)
+        field_orders = np.concatenate(field_orders)
+        selected = np.lexsort((field_orders, positions))[:self.MAX_VALIDATION_RESULTS]
+        
+        for position, field_order in zip(positions[selected].tolist(), field_orders[selected].tolist()):
+            field = self.VALIDATION_FIELDS[field_order]
+            row_index = df.index[position]
+            if field == 'duplicate':
+                duplicate_key = '|'.join(str(cleaned_df[key].iat[position]) for key in self.DUPLICATE_KEY_FIELDS)
+                row_hash = hashlib.md5(duplicate_key.encode()).hexdigest()
+                result = ValidationResult(
+                    row_index, 'duplicate', ValidationSeverity.WARNING,
+                    "Posible registro duplicado detectado", row_hash
+                )
             else:
-                cleaned_df.at[index, 'validation_errors'] = '; '.join(row_errors)
+                validator = getattr(self, f'_validate_{self.FIELD_VALIDATORS[field]}')
+                result = validator(df[field].iat[position], row_index)
+            self.validation_results.append(result)
         
-        return cleaned_df
+        if len(positions) > self.MAX_VALIDATION_RESULTS:
+            logger.info(f"Validaciones materializadas: {self.MAX_VALIDATION_RESULTS} de {len(positions)} "
+                        f"(los conteos incluyen todas)")
+    
+    @staticmethod
+    def _new_validation_counts() -> Dict[str, Counter]:
+        """Conteos de hallazgos por severidad, campo y mensaje"""
+        return {'by_severity': Counter(), 'by_field': Counter(), 'by_message': Counter()}
+    
+    def _duplicate_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Registros cuya clave (str de DUPLICATE_KEY_FIELDS) ya apareció en un
+        registro anterior
+        """
+        key_codes = pd.DataFrame({
+            field: _factorize_text(df[field])[0] for field in self.DUPLICATE_KEY_FIELDS
+        })
+        return key_codes.duplicated(keep='first').to_numpy()
+    
+    # ------------------------------------------------------------------
+    # Validaciones columnares: cada _flag_<campo> retorna
+    #   findings: [(máscara, severidad, mensaje o lista de mensajes por fila marcada)]
+    #   fixes:    [(máscara, valores limpios para las filas marcadas)]
+    # con las mismas reglas que el _validate_* correspondiente. Las
+    # operaciones de texto se calculan una vez por valor distinto.
+    # ------------------------------------------------------------------
+    
+    def _flag_punto(self, values: pd.Series) -> Tuple[list, list]:
+        codes, text = _factorize_text(values)
+        stripped = text.str.strip()
+        empty = values.isna().to_numpy() | (stripped == '').to_numpy()[codes]
+        lengths = stripped.str.len().to_numpy()[codes]
+        too_long = ~empty & (lengths > 100)
+        spaces = ~empty & ~too_long & (stripped != text).to_numpy()[codes]
+        
+        findings = [
+            (empty, ValidationSeverity.ERROR, "Punto de medición es requerido"),
+            (too_long, ValidationSeverity.WARNING,
+             [f"Punto de medición muy largo ({length} caracteres)" for length in lengths[too_long].tolist()]),
+            (spaces, ValidationSeverity.INFO, "Punto de medición limpiado (espacios)")
+        ]
+        changed = too_long | spaces
+        return findings, [(changed, stripped.str[:100].to_numpy()[codes[changed]])]
+    
+    def _flag_latitude(self, values: pd.Series) -> Tuple[list, list]:
+        return _flag_coordinate(values, 'Latitud', '(-90 a 90)', (-90.0, 90.0), (-4.5, 16.0))
+    
+    def _flag_longitude(self, values: pd.Series) -> Tuple[list, list]:
+        return _flag_coordinate(values, 'Longitud', '(-180 a 180)', (-180.0, 180.0), (-83.0, -66.0))
+    
+    def _flag_mnc_mcc(self, values: pd.Series) -> Tuple[list, list]:
+        codes, text = _factorize_text(values)
+        stripped = text.str.strip()
+        empty = values.isna().to_numpy() | (stripped == '').to_numpy()[codes]
+        digits = stripped.str.isdigit().to_numpy(dtype=bool)[codes]
+        lengths = stripped.str.len().to_numpy()[codes]
+        not_digits = ~empty & ~digits
+        bad_length = ~empty & digits & ((lengths < 5) | (lengths > 6))
+        not_colombia = ~empty & digits & ~bad_length & ~stripped.str.startswith('732').to_numpy(dtype=bool)[codes]
+        stripped = stripped.to_numpy()
+        
+        findings = [
+            (empty, ValidationSeverity.WARNING, "MNC+MCC vacío - se requerirá para análisis avanzado"),
+            (not_digits, ValidationSeverity.ERROR,
+             [f"MNC+MCC debe contener solo números: {value}" for value in stripped[codes[not_digits]]]),
+            (bad_length, ValidationSeverity.ERROR,
+             [f"MNC+MCC debe tener 5-6 dígitos: {value}" for value in stripped[codes[bad_length]]]),
+            (not_colombia, ValidationSeverity.WARNING,
+             [f"MCC no es 732 (Colombia): {value}" for value in stripped[codes[not_colombia]]])
+        ]
+        return findings, [(empty, np.full(int(empty.sum()), "732000", dtype=object))]
+    
+    def _flag_operator_name(self, values: pd.Series) -> Tuple[list, list]:
+        empty, original, normalized, unknown, renamed = _normalize_with_mapping(values, self.OPERATOR_MAPPING)
+        findings = [
+            (empty, ValidationSeverity.ERROR, "Operador es requerido"),
+            (unknown, ValidationSeverity.WARNING,
+             [f"Operador no reconocido: {value}" for value in original[unknown]]),
+            (renamed, ValidationSeverity.INFO,
+             [f"Operador normalizado: {old} -> {new}"
+              for old, new in zip(original[renamed], normalized[renamed])])
+        ]
+        changed = unknown | renamed
+        return findings, [(changed, normalized[changed])]
+    
+    def _flag_rssi_dbm(self, values: pd.Series) -> Tuple[list, list]:
+        missing = values.isna().to_numpy()
+        floats, parsed = _parse_floats(values)
+        invalid = ~missing & ~(parsed & np.isfinite(floats))
+        rssi = np.trunc(np.where(invalid | missing, 0.0, floats))
+        numeric = ~missing & ~invalid
+        positive = numeric & (rssi > 0)
+        too_low = numeric & (rssi < -150)
+        unusually_high = numeric & ~positive & (rssi > -30)
+        candidates = numeric & ~positive & ~too_low & ~unusually_high
+        
+        if values.dtype.kind == 'f':
+            changed = candidates & (rssi != floats)
+        elif values.dtype.kind in 'iub':
+            changed = np.zeros(len(values), dtype=bool)
+        else:
+            changed = candidates.copy()
+            original = values.to_numpy(dtype=object)
+            positions = np.flatnonzero(candidates)
+            changed[positions] = [int(value) != raw for value, raw in
+                                  zip(rssi[positions].tolist(), original[positions])]
+        
+        positive_values = [int(value) for value in rssi[positive].tolist()]
+        changed_values = [int(value) for value in rssi[changed].tolist()]
+        findings = [
+            (missing, ValidationSeverity.ERROR, "RSSI es requerido"),
+            (invalid, ValidationSeverity.ERROR,
+             [f"RSSI no es un número válido: {value}" for value in values.to_numpy(dtype=object)[invalid]]),
+            (positive, ValidationSeverity.WARNING,
+             [f"RSSI positivo corregido a negativo: {value} -> {-abs(value)}" for value in positive_values]),
+            (too_low, ValidationSeverity.ERROR,
+             [f"RSSI demasiado bajo (posible error): {int(value)}" for value in rssi[too_low].tolist()]),
+            (unusually_high, ValidationSeverity.WARNING,
+             [f"RSSI inusualmente alto: {int(value)}" for value in rssi[unusually_high].tolist()]),
+            (changed, ValidationSeverity.INFO, [f"RSSI válido: {value}" for value in changed_values])
+        ]
+        # Arreglos numéricos (int64 si caben) para conservar el dtype de la columna
+        fixes = [
+            (positive, np.array([-abs(value) for value in positive_values])),
+            (changed, np.array(changed_values))
+        ]
+        return findings, fixes
+    
+    def _flag_technology(self, values: pd.Series) -> Tuple[list, list]:
+        empty, original, normalized, unknown, renamed = _normalize_with_mapping(values, self.TECHNOLOGY_MAPPING)
+        findings = [
+            (empty, ValidationSeverity.WARNING, "Tecnología vacía - asignando UNKNOWN"),
+            (unknown, ValidationSeverity.WARNING,
+             [f"Tecnología no reconocida: {value}" for value in original[unknown]]),
+            (renamed, ValidationSeverity.INFO,
+             [f"Tecnología normalizada: {old} -> {new}"
+              for old, new in zip(original[renamed], normalized[renamed])])
+        ]
+        changed = empty | unknown | renamed
+        cleaned = np.where(empty, 'UNKNOWN', normalized).astype(object)
+        return findings, [(changed, cleaned[changed])]
+    
+    def _flag_cell_id(self, values: pd.Series) -> Tuple[list, list]:
+        codes, text = _factorize_text(values)
+        stripped = text.str.strip()
+        empty = values.isna().to_numpy() | (stripped == '').to_numpy()[codes]
+        lengths = stripped.str.len().to_numpy()[codes]
+        too_long = ~empty & (lengths > 50)
+        normalized = stripped.str.replace(r'[^\w\-]', '', regex=True)
+        renamed = ~empty & ~too_long & (normalized != stripped).to_numpy()[codes]
+        # Un Cell ID normalizado vacío no reemplaza el valor original
+        renamed_fix = renamed & (normalized != '').to_numpy()[codes]
+        truncated = stripped.str[:50].to_numpy()
+        stripped = stripped.to_numpy()
+        normalized = normalized.to_numpy()
+        
+        findings = [
+            (empty, ValidationSeverity.ERROR, "Cell ID es requerido"),
+            (too_long, ValidationSeverity.WARNING,
+             [f"Cell ID muy largo ({length} caracteres)" for length in lengths[too_long].tolist()]),
+            (renamed, ValidationSeverity.INFO,
+             [f"Cell ID normalizado: {stripped[code]} -> {normalized[code]}" for code in codes[renamed]])
+        ]
+        fixes = [
+            (too_long, truncated[codes[too_long]]),
+            (renamed_fix, normalized[codes[renamed_fix]])
+        ]
+        return findings, fixes
     
     def _validate_punto(self, value: Any, row_index: int) -> Optional[ValidationResult]:
         """Valida campo punto de medición"""
@@ -524,7 +732,7 @@ class ScannerDataProcessor:
                 f"RSSI válido: {rssi}", value, rssi
             ) if rssi != value else None
             
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return ValidationResult(
                 row_index, 'rssi_dbm', ValidationSeverity.ERROR,
                 f"RSSI no es un número válido: {value}", value
@@ -585,29 +793,6 @@ class ScannerDataProcessor:
         
         return None
     
-    def _check_duplicate(self, row: pd.Series, row_index: int) -> Optional[ValidationResult]:
-        """Detecta registros duplicados"""
-        # Crear hash único basado en campos clave
-        hash_components = [
-            str(row['mission_id']),
-            str(row['punto']),
-            str(row['latitude']),
-            str(row['longitude']),
-            str(row['cell_id']),
-            str(row['operator_name'])
-        ]
-        
-        row_hash = hashlib.md5('|'.join(hash_components).encode()).hexdigest()
-        
-        if row_hash in self.duplicate_hashes:
-            return ValidationResult(
-                row_index, 'duplicate', ValidationSeverity.WARNING,
-                "Posible registro duplicado detectado", row_hash
-            )
-        
-        self.duplicate_hashes.add(row_hash)
-        return None
-    
     def _add_metadata(self, df: pd.DataFrame, filename: str) -> pd.DataFrame:
         """Agrega metadatos de procesamiento"""
         df = df.copy()
@@ -617,49 +802,144 @@ class ScannerDataProcessor:
         df['processing_timestamp'] = datetime.now()
         
         # Generar hash único para cada registro válido
-        for index, row in df.iterrows():
-            if row['is_validated']:
-                hash_components = [
-                    str(row['mission_id']),
-                    str(row['punto']),
-                    str(row['latitude']),
-                    str(row['longitude']),
-                    str(row['cell_id']),
-                    str(row['operator_name']),
-                    str(row['rssi_dbm']),
-                    str(row['technology'])
-                ]
-                df.at[index, 'data_hash'] = hashlib.md5('|'.join(hash_components).encode()).hexdigest()
+        validated = df['is_validated'].to_numpy(dtype=bool)
+        if validated.any():
+            hash_columns = [df[field][validated].map(str) for field in (
+                'mission_id', 'punto', 'latitude', 'longitude', 'cell_id',
+                'operator_name', 'rssi_dbm', 'technology'
+            )]
+            df.loc[validated, 'data_hash'] = [
+                hashlib.md5('|'.join(components).encode()).hexdigest()
+                for components in zip(*hash_columns)
+            ]
         
         return df
     
     def get_validation_summary(self) -> Dict[str, Any]:
-        """Genera resumen de validaciones"""
+        """Genera resumen de validaciones (incluye las no materializadas)"""
+        counts = self.validation_counts
         summary = {
-            'total_validations': len(self.validation_results),
+            'total_validations': sum(counts['by_field'].values()),
+            'stored_validations': len(self.validation_results),
             'by_severity': {},
-            'by_field': {},
+            'by_field': dict(counts['by_field']),
             'most_common_issues': {}
         }
         
         # Contar por severidad
         for severity in ValidationSeverity:
-            count = len([v for v in self.validation_results if v.severity == severity])
-            summary['by_severity'][severity.value] = count
-        
-        # Contar por campo
-        field_counts = {}
-        for validation in self.validation_results:
-            field_counts[validation.field] = field_counts.get(validation.field, 0) + 1
-        summary['by_field'] = field_counts
+            summary['by_severity'][severity.value] = counts['by_severity'][severity]
         
         # Problemas más comunes
-        message_counts = {}
-        for validation in self.validation_results:
-            message_counts[validation.message] = message_counts.get(validation.message, 0) + 1
-        
         summary['most_common_issues'] = dict(
-            sorted(message_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+            sorted(counts['by_message'].items(), key=lambda x: x[1], reverse=True)[:10]
         )
         
-        return summary
\ No newline at end of file
+        return summary
+
+
+def _expand_messages(mask: np.ndarray, messages: Union[str, Sequence[str]]) -> Sequence[str]:
+    """Mensajes por fila marcada (un mensaje constante se repite)"""
+    if isinstance(messages, str):
+        return [messages] * int(mask.sum())
+    return messages
+
+
+def _parse_floats(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte una columna con float(valor) por elemento
+    
+    Returns:
+        Tuple (valores float, máscara de conversión exitosa)
+    """
+    if values.dtype.kind in 'fiub':
+        return values.to_numpy(dtype=float), np.ones(len(values), dtype=bool)
+    
+    floats = np.full(len(values), np.nan)
+    parsed = np.zeros(len(values), dtype=bool)
+    for position, value in enumerate(values.to_numpy(dtype=object)):
+        try:
+            floats[position] = float(value)
+            parsed[position] = True
+        except (ValueError, TypeError):
+            pass
+    return floats, parsed
+
+
+def _flag_coordinate(values: pd.Series, label: str, range_label: str,
+                     valid_range: Tuple[float, float], colombia_range: Tuple[float, float]) -> Tuple[list, list]:
+    """Validación columnar de latitud/longitud (reglas de _validate_latitude/_validate_longitude)"""
+    missing = values.isna().to_numpy()
+    floats, parsed = _parse_floats(values)
+    invalid = ~missing & ~parsed
+    numeric = ~missing & parsed
+    
+    with np.errstate(invalid='ignore'):
+        out_of_range = numeric & ((floats < valid_range[0]) | (floats > valid_range[1]))
+        in_colombia = (floats >= colombia_range[0]) & (floats <= colombia_range[1])
+    atypical = numeric & ~out_of_range & ~in_colombia
+    candidates = numeric & ~out_of_range & ~atypical
+    
+    # El valor se reemplaza por su float solo si difiere del original (p. ej. texto)
+    changed = np.zeros(len(values), dtype=bool)
+    if values.dtype.kind not in 'fiub':
+        original = values.to_numpy(dtype=object)
+        positions = np.flatnonzero(candidates)
+        changed[positions] = [value != raw for value, raw in zip(floats[positions].tolist(), original[positions])]
+    
+    findings = [
+        (missing, ValidationSeverity.ERROR, f"{label} es requerida"),
+        (invalid, ValidationSeverity.ERROR,
+         [f"{label} no es un número válido: {value}" for value in values.to_numpy(dtype=object)[invalid]]),
+        (out_of_range, ValidationSeverity.ERROR,
+         [f"{label} fuera de rango válido {range_label}: {value}" for value in floats[out_of_range].tolist()]),
+        (atypical, ValidationSeverity.WARNING,
+         [f"{label} fuera del rango típico de Colombia: {value}" for value in floats[atypical].tolist()]),
+        (changed, ValidationSeverity.INFO,
+         [f"{label} válida: {value}" for value in floats[changed].tolist()])
+    ]
+    return findings, [(changed, floats[changed])]
+
+
+def _factorize_text(values: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """
+    str(valor) por valor distinto de la columna
+    
+    Returns:
+        Tuple (código por fila, serie de textos distintos); dos filas tienen el
+        mismo código si y solo si str() de sus valores es igual
+    """
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+        # Columnas de texto: factorizar directamente (los nulos se convierten aparte)
+        codes, uniques = pd.factorize(values)
+        texts = list(uniques)
+        missing = np.flatnonzero(codes == -1)
+        if len(missing):
+            texts.extend(str(value) for value in values.to_numpy(dtype=object)[missing])
+            codes[missing] = np.arange(len(uniques), len(texts))
+    else:
+        # Otros tipos (números, mezclas): str() por fila para no unir 1, 1.0 y True
+        codes, texts = pd.factorize(values.map(str).to_numpy(dtype=object))
+    
+    # Unificar textos repetidos (p. ej. 'nan' de texto y de un nulo)
+    unique_codes, unique_texts = pd.factorize(np.asarray(texts, dtype=object))
+    return unique_codes[codes], pd.Series(unique_texts, dtype=object)
+
+
+def _normalize_with_mapping(values: pd.Series, mapping: Dict[str, str]) -> Tuple:
+    """
+    Normalización columnar contra un mapeo (reglas de _validate_operator/_validate_technology)
+    
+    Returns:
+        Tuple (vacíos, valor original en mayúsculas, valor normalizado,
+               no reconocidos, normalizados a otro nombre); los valores por fila
+               como arreglos object
+    """
+    codes, text = _factorize_text(values)
+    stripped = text.str.strip()
+    empty = values.isna().to_numpy() | (stripped == '').to_numpy()[codes]
+    original = stripped.str.upper()
+    normalized = original.map(mapping).fillna('UNKNOWN')
+    unknown = ~empty & (normalized == 'UNKNOWN').to_numpy()[codes]
+    renamed = ~empty & ~unknown & (normalized != original).to_numpy()[codes]
+    return empty, original.to_numpy()[codes], normalized.to_numpy()[codes], unknown, renamed
@@ -0,0 +1,440 @@
+"""
+KRONOS - Spatial Index Service
+===============================================================================
+ÍNDICE ESPACIAL PARA PUNTOS HUNTER Y UBICACIONES DE CELDAS
+===============================================================================
+
+Mantiene tablas virtuales SQLite R*Tree sincronizadas por triggers para todas
+las tablas con coordenadas (lat/lon):
+
+- cellular_data: puntos HUNTER (SCANHUNTER)
+- operator_cellular_data: coordenadas de celdas en datos de operador
+- operator_call_data: coordenadas de origen y destino de llamadas
+- operator_cell_registry: registro consolidado de celdas por operador
+
+CONSULTAS SOPORTADAS:
+1. Rectángulo de coordenadas (bounding box)
+2. Radio en metros alrededor de un punto (R*Tree + distancia haversine exacta)
+3. K vecinos más cercanos (búsqueda con radio creciente)
+4. Celdas cercanas a un punto HUNTER de la misión
+
+Las tablas R*Tree se crean bajo demanda la primera vez que se consulta una
+fuente y desde ese momento los triggers las mantienen actualizadas en cada
+INSERT/UPDATE/DELETE. Si la compilación de SQLite no incluye R*Tree se usan
+los índices B-tree existentes sobre (lat, lon).
+
+Las tablas R*Tree solo cubren kronos.db: las consultas acotadas a una misión
+con almacenamiento propio (database/mission_shards.py) usan los índices
+B-tree de su archivo.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import time
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.connection import get_database_manager
+from utils.helpers import calculate_distances_to_point, calculate_bounding_box
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialIndexServiceError(Exception):
+    """Excepción personalizada para errores del índice espacial"""
+    pass
+
+
+# Fuentes indexables: tabla, columnas de coordenadas y columnas retornadas
+SPATIAL_INDEX_SOURCES = {
+    'cellular_data': {
+        'table': 'cellular_data',
+        'lat': 'lat',
+        'lon': 'lon',
+        'mission_column': 'mission_id',
+        'columns': ('mission_id', 'punto', 'operator', 'tecnologia', 'cell_id', 'lac_tac', 'rssi')
+    },
+    'operator_cellular_data': {
+        'table': 'operator_cellular_data',
+        'lat': 'latitud',
+        'lon': 'longitud',
+        'mission_column': 'mission_id',
+        'columns': ('mission_id', 'operator', 'numero_telefono', 'celda_id', 'lac_tac', 'tecnologia')
+    },
+    'operator_call_origen': {
+        'table': 'operator_call_data',
+        'lat': 'latitud_origen',
+        'lon': 'longitud_origen',
+        'mission_column': 'mission_id',
+        'columns': ('mission_id', 'operator', 'numero_origen', 'numero_destino', 'celda_origen')
+    },
+    'operator_call_destino': {
+        'table': 'operator_call_data',
+        'lat': 'latitud_destino',
+        'lon': 'longitud_destino',
+        'mission_column': 'mission_id',
+        'columns': ('mission_id', 'operator', 'numero_origen', 'numero_destino', 'celda_destino')
+    },
+    'operator_cell_registry': {
+        'table': 'operator_cell_registry',
+        'lat': 'latitud',
+        'lon': 'longitud',
+        'mission_column': None,
+        'columns': ('operator', 'celda_id', 'lac_tac', 'tecnologia_predominante', 'ciudad')
+    }
+}
+
+# Límites de consulta
+SPATIAL_QUERY_LIMITS = {
+    'max_results': 5000,           # Máximo de registros por consulta
+    'max_radius_m': 50000,         # Radio máximo de búsqueda (50 km)
+    'knn_initial_radius_m': 250,   # Radio inicial de la búsqueda kNN
+    'max_k': 500                   # Máximo de vecinos por consulta kNN
+}
+
+
+class SpatialIndexService:
+    """
+    Servicio de índice espacial sobre tablas con coordenadas
+
+    Funcionalidades:
+    1. Crear y mantener índices R*Tree por fuente
+    2. Consultas por rectángulo, radio y k vecinos más cercanos
+    3. Búsqueda de celdas cercanas a puntos HUNTER
+    """
+
+    def __init__(self):
+        self.db_manager = get_database_manager()
+        self._ready_sources = set()
+        self._ready_engine = None
+        self._rtree_available = None
+
+    def ensure_spatial_indexes(self) -> Dict[str, int]:
+        """
+        Crea los índices espaciales de todas las fuentes cuyas tablas existen
+
+        Returns:
+            Diccionario {fuente: registros indexados} de los índices creados o verificados
+        """
+        indexed = {}
+        for source in SPATIAL_INDEX_SOURCES:
+            if self._ensure_source_index(source):
+                indexed[source] = self._count_indexed(source)
+        return indexed
+
+    def find_in_bbox(self, source: str, min_lat: float, min_lon: float,
+                     max_lat: float, max_lon: float, mission_id: Optional[str] = None,
+                     limit: int = SPATIAL_QUERY_LIMITS['max_results']) -> Dict[str, Any]:
+        """
+        Obtiene los registros de una fuente dentro de un rectángulo de coordenadas
+
+        Args:
+            source: Fuente de SPATIAL_INDEX_SOURCES
+            min_lat, min_lon, max_lat, max_lon: Límites del rectángulo
+            mission_id: Filtra por misión si la fuente lo soporta
+            limit: Máximo de registros retornados
+
+        Returns:
+            Diccionario con 'data', 'total' y 'queryTime'
+        """
+        start_time = time.time()
+        bbox = {'min_lat': min_lat, 'max_lat': max_lat, 'min_lon': min_lon, 'max_lon': max_lon}
+        limit = min(max(int(limit or 1), 1), SPATIAL_QUERY_LIMITS['max_results'])
+
+        records = self._query_bbox(source, bbox, mission_id, limit)
+        return {
+            'source': source,
+            'data': records,
+            'total': len(records),
+            'queryTime': round(time.time() - start_time, 4)
+        }
+
+    def find_within_radius(self, source: str, lat: float, lon: float, radius_m: float,
+                           mission_id: Optional[str] = None,
+                           limit: int = SPATIAL_QUERY_LIMITS['max_results']) -> Dict[str, Any]:
+        """
+        Obtiene los registros a menos de radius_m metros de un punto, ordenados por distancia
+
+        Args:
+            source: Fuente de SPATIAL_INDEX_SOURCES
+            lat, lon: Punto central
+            radius_m: Radio en metros (máximo SPATIAL_QUERY_LIMITS['max_radius_m'])
+            mission_id: Filtra por misión si la fuente lo soporta
+            limit: Máximo de registros retornados
+
+        Returns:
+            Diccionario con 'data' (incluye 'distanceM'), 'total' y 'queryTime'
+        """
+        start_time = time.time()
+        radius_m = self._validate_radius(radius_m)
+        limit = min(max(int(limit or 1), 1), SPATIAL_QUERY_LIMITS['max_results'])
+
+        records = self._query_radius(source, float(lat), float(lon), radius_m, mission_id)
+        return {
+            'source': source,
+            'center': {'lat': float(lat), 'lon': float(lon)},
+            'radiusM': radius_m,
+            'data': records[:limit],
+            'total': len(records),
+            'queryTime': round(time.time() - start_time, 4)
+        }
+
+    def find_nearest(self, source: str, lat: float, lon: float, k: int = 10,
+                     mission_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Obtiene los k registros más cercanos a un punto
+
+        La búsqueda duplica el radio hasta encontrar k registros: todo registro
+        fuera del radio está más lejos que los encontrados dentro, por lo que
+        el resultado es exacto sin recorrer la tabla completa.
+
+        Args:
+            source: Fuente de SPATIAL_INDEX_SOURCES
+            lat, lon: Punto de referencia
+            k: Número de vecinos (máximo SPATIAL_QUERY_LIMITS['max_k'])
+            mission_id: Filtra por misión si la fuente lo soporta
+
+        Returns:
+            Diccionario con 'data' (incluye 'distanceM'), 'total' y 'queryTime'
+        """
+        start_time = time.time()
+        k = min(max(int(k or 1), 1), SPATIAL_QUERY_LIMITS['max_k'])
+        radius_m = SPATIAL_QUERY_LIMITS['knn_initial_radius_m']
+
+        while True:
+            records = self._query_radius(source, float(lat), float(lon), radius_m, mission_id)
+            if len(records) >= k or radius_m >= SPATIAL_QUERY_LIMITS['max_radius_m']:
+                break
+            radius_m = min(radius_m * 2, SPATIAL_QUERY_LIMITS['max_radius_m'])
+
+        return {
+            'source': source,
+            'center': {'lat': float(lat), 'lon': float(lon)},
+            'searchRadiusM': radius_m,
+            'data': records[:k],
+            'total': min(len(records), k),
+            'queryTime': round(time.time() - start_time, 4)
+        }
+
+    def find_cells_near_hunter_point(self, mission_id: str, hunter_record_id: int, radius_m: float,
+                                     source: str = 'operator_cell_registry') -> Dict[str, Any]:
+        """
+        Obtiene las celdas a menos de radius_m metros de un punto HUNTER de la misión
+
+        Args:
+            mission_id: ID de la misión
+            hunter_record_id: ID del registro en cellular_data
+            radius_m: Radio en metros
+            source: Fuente de celdas a consultar
+
+        Returns:
+            Resultado de find_within_radius con el punto HUNTER en 'hunterPoint'
+        """
+        try:
+            with self.db_manager.get_session(mission_id) as session:
+                point = session.execute(
+                    text("SELECT id, punto, lat, lon FROM cellular_data WHERE id = :id AND mission_id = :mission_id"),
+                    {'id': hunter_record_id, 'mission_id': mission_id}
+                ).mappings().first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error obteniendo punto HUNTER {hunter_record_id}: {e}")
+            raise SpatialIndexServiceError("Error consultando el punto HUNTER")
+
+        if not point:
+            raise SpatialIndexServiceError("Punto HUNTER no encontrado en la misión")
+
+        scope = mission_id if SPATIAL_INDEX_SOURCES.get(source, {}).get('mission_column') else None
+        result = self.find_within_radius(source, point['lat'], point['lon'], radius_m, mission_id=scope)
+        result['hunterPoint'] = dict(point)
+        return result
+
+    def _validate_radius(self, radius_m: float) -> float:
+        """Valida que el radio sea positivo y no supere el máximo permitido"""
+        radius_m = float(radius_m)
+        if radius_m <= 0:
+            raise SpatialIndexServiceError("El radio debe ser mayor que cero")
+        return min(radius_m, SPATIAL_QUERY_LIMITS['max_radius_m'])
+
+    def _query_radius(self, source: str, lat: float, lon: float, radius_m: float,
+                      mission_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Consulta el rectángulo que contiene el círculo y filtra por distancia exacta"""
+        candidates = self._query_bbox(source, calculate_bounding_box(lat, lon, radius_m), mission_id, None)
+
+        if not candidates:
+            return []
+
+        import numpy as np
+
+        distances_m = calculate_distances_to_point(
+            lat, lon, [r['lat'] for r in candidates], [r['lon'] for r in candidates]
+        ) * 1000
+
+        records = []
+        for index in np.argsort(distances_m, kind='stable'):
+            if distances_m[index] > radius_m:
+                break
+            record = candidates[index]
+            record['distanceM'] = round(float(distances_m[index]), 2)
+            records.append(record)
+        return records
+
+    def _query_bbox(self, source: str, bbox: Dict[str, float], mission_id: Optional[str],
+                    limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Ejecuta la consulta por rectángulo usando R*Tree o el índice B-tree"""
+        config = self._get_source_config(source)
+        if not self._ensure_source_index(source):
+            return []
+
+        lat_col, lon_col = config['lat'], config['lon']
+        columns = ', '.join(f"t.{column}" for column in config['columns'])
+        params = dict(bbox)
+
+        # Las coordenadas del R*Tree son float32 redondeadas hacia afuera: se
+        # repite el filtro sobre las columnas reales para un resultado exacto
+        conditions = [
+            f"t.{lat_col} BETWEEN :min_lat AND :max_lat",
+            f"t.{lon_col} BETWEEN :min_lon AND :max_lon"
+        ]
+        scoped = bool(mission_id and config['mission_column'])
+        sharded = scoped and self.db_manager.is_mission_sharded(mission_id)
+        if self._rtree_available and not sharded:
+            from_clause = f"{self._rtree_name(source)} r JOIN {config['table']} t ON t.id = r.id"
+            conditions = [
+                "r.min_lat <= :max_lat", "r.max_lat >= :min_lat",
+                "r.min_lon <= :max_lon", "r.max_lon >= :min_lon"
+            ] + conditions
+        else:
+            from_clause = f"{config['table']} t"
+
+        if scoped:
+            conditions.append(f"t.{config['mission_column']} = :mission_id")
+            params['mission_id'] = mission_id
+
+        sql = (
+            f"SELECT t.id, t.{lat_col} AS lat, t.{lon_col} AS lon, {columns} "
+            f"FROM {from_clause} WHERE {' AND '.join(conditions)}"
+        )
+        if limit:
+            sql += " LIMIT :limit"
+            params['limit'] = limit
+
+        try:
+            with self.db_manager.get_session(mission_id if scoped else None) as session:
+                return [dict(row) for row in session.execute(text(sql), params).mappings()]
+        except SQLAlchemyError as e:
+            logger.error(f"Error en consulta espacial sobre {source}: {e}")
+            raise SpatialIndexServiceError(f"Error consultando el índice espacial de {source}")
+
+    def _get_source_config(self, source: str) -> Dict[str, Any]:
+        """Obtiene la configuración de una fuente indexable"""
+        if source not in SPATIAL_INDEX_SOURCES:
+            raise SpatialIndexServiceError(
+                f"Fuente espacial no soportada: {source}. Use: {', '.join(SPATIAL_INDEX_SOURCES)}"
+            )
+        return SPATIAL_INDEX_SOURCES[source]
+
+    def _rtree_name(self, source: str) -> str:
+        return f"spatial_rtree_{source}"
+
+    def _ensure_source_index(self, source: str) -> bool:
+        """
+        Crea el R*Tree de una fuente y sus triggers de sincronización si no existen
+
+        Returns:
+            False si la tabla de la fuente no existe en la base de datos
+        """
+        # Una reinicialización de la BD crea un engine nuevo: verificar de nuevo
+        if self._ready_engine is not self.db_manager.get_engine():
+            self._ready_sources.clear()
+            self._ready_engine = self.db_manager.get_engine()
+        if source in self._ready_sources:
+            return True
+
+        config = self._get_source_config(source)
+        table, lat_col, lon_col = config['table'], config['lat'], config['lon']
+        rtree = self._rtree_name(source)
+
+        try:
+            with self.db_manager.get_engine().begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {'name': table}
+                ).first()
+                if not exists:
+                    return False
+
+                if self._rtree_available is None:
+                    self._rtree_available = self._detect_rtree(conn)
+                if not self._rtree_available:
+                    self._ready_sources.add(source)
+                    return True
+
+                created = not conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': rtree}
+                ).first()
+
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+                ))
+
+                has_coords = f"NEW.{lat_col} IS NOT NULL AND NEW.{lon_col} IS NOT NULL"
+                new_row = f"SELECT NEW.id, NEW.{lat_col}, NEW.{lat_col}, NEW.{lon_col}, NEW.{lon_col} WHERE {has_coords}"
+                triggers = {
+                    f"trg_spatial_{source}_insert": f"AFTER INSERT ON {table} BEGIN INSERT INTO {rtree} {new_row}; END",
+                    f"trg_spatial_{source}_update": (
+                        f"AFTER UPDATE OF {lat_col}, {lon_col} ON {table} BEGIN "
+                        f"DELETE FROM {rtree} WHERE id = OLD.id; INSERT INTO {rtree} {new_row}; END"
+                    ),
+                    f"trg_spatial_{source}_delete": f"AFTER DELETE ON {table} BEGIN DELETE FROM {rtree} WHERE id = OLD.id; END"
+                }
+                for name, body in triggers.items():
+                    conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {body}"))
+
+                if created:
+                    # Poblar con los registros existentes al crear el índice
+                    conn.execute(text(
+                        f"INSERT INTO {rtree} SELECT id, {lat_col}, {lat_col}, {lon_col}, {lon_col} "
+                        f"FROM {table} WHERE {lat_col} IS NOT NULL AND {lon_col} IS NOT NULL"
+                    ))
+                    logger.info(f"Índice espacial {rtree} creado para {table}")
+
+            self._ready_sources.add(source)
+            return True
+
+        except SQLAlchemyError as e:
+            logger.error(f"Error creando índice espacial para {source}: {e}")
+            raise SpatialIndexServiceError(f"Error creando el índice espacial de {source}")
+
+    def _detect_rtree(self, conn) -> bool:
+        """Verifica si la compilación de SQLite incluye el módulo R*Tree"""
+        try:
+            conn.execute(text("CREATE VIRTUAL TABLE temp.spatial_rtree_probe USING rtree(id, a, b)"))
+            conn.execute(text("DROP TABLE temp.spatial_rtree_probe"))
+            return True
+        except SQLAlchemyError:
+            logger.warning("SQLite sin soporte R*Tree: consultas espaciales usarán índices B-tree")
+            return False
+
+    def _count_indexed(self, source: str) -> int:
+        """Cuenta los registros indexados de una fuente"""
+        config = SPATIAL_INDEX_SOURCES[source]
+        table_name = self._rtree_name(source) if self._rtree_available else config['table']
+        with self.db_manager.get_session() as session:
+            return session.execute(text(f"SELECT COUNT(*) FROM {table_name}")).scalar()
+
+
+# Instancia global del servicio
+_spatial_index_service_instance = None
+
+
+def get_spatial_index_service() -> SpatialIndexService:
+    """Retorna la instancia singleton del servicio de índice espacial"""
+    global _spatial_index_service_instance
+    if _spatial_index_service_instance is None:
+        _spatial_index_service_instance = SpatialIndexService()
+    return _spatial_index_service_instance
@@ -0,0 +1,162 @@
+"""
+KRONOS - WAL Checkpoint Service
+===============================================================================
+CHECKPOINTS DEL WAL EN SEGUNDO PLANO
+===============================================================================
+
+En modo WAL cada commit agrega páginas al archivo kronos.db-wal; un
+checkpoint las copia a la base de datos. Si el checkpoint ocurre dentro del
+commit de una carga (wal_autocheckpoint), la carga se detiene mientras copia;
+si nunca ocurre, el WAL crece y las lecturas se vuelven más lentas.
+
+Este servicio ejecuta PRAGMA wal_checkpoint(PASSIVE) periódicamente en un
+hilo propio:
+
+- PASSIVE no espera a lectores ni escritores: copia lo que puede y retorna,
+  por lo que nunca detiene una carga ni un análisis en curso.
+- Las páginas que un snapshot de lectura todavía necesita quedan para el
+  siguiente ciclo.
+- Con wal_autocheckpoint alto en las conexiones de escritura
+  (database/connection.py), las cargas casi no ejecutan checkpoints propios.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+===============================================================================
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from database.connection import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+
+class WalCheckpointServiceError(Exception):
+    """Excepción personalizada para errores de checkpoint del WAL"""
+    pass
+
+
+# Segundos entre checkpoints en segundo plano
+CHECKPOINT_INTERVAL_SECONDS = 30
+
+CHECKPOINT_MODES = ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE')
+
+
+class WalCheckpointService:
+    """
+    Servicio de checkpoints periódicos del WAL en un hilo en segundo plano
+    """
+
+    def __init__(self, interval_seconds: float = CHECKPOINT_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._status = {
+            'intervalSeconds': interval_seconds,
+            'checkpoints': 0,
+            'busyCheckpoints': 0,
+            'errors': 0,
+            'lastCheckpoint': None,
+            'lastError': None
+        }
+
+    def start(self) -> Dict[str, Any]:
+        """Inicia el hilo de checkpoints (no hace nada si ya está activo)"""
+        with self._lock:
+            already_running = self._thread is not None and self._thread.is_alive()
+            if not already_running:
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, name="wal-checkpoint", daemon=True)
+                self._thread.start()
+
+        if not already_running:
+            logger.info(f"Checkpoints del WAL en segundo plano cada {self.interval_seconds}s")
+        return self.get_status()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Detiene el hilo de checkpoints"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def checkpoint(self, mode: str = 'PASSIVE') -> Dict[str, Any]:
+        """
+        Ejecuta un checkpoint del WAL
+
+        Args:
+            mode: PASSIVE (por defecto), FULL, RESTART o TRUNCATE. Los modos
+                distintos de PASSIVE esperan a los escritores (busy_timeout)
+
+        Returns:
+            Dict con 'mode', 'busy', 'walFrames', 'checkpointedFrames',
+            'durationSeconds' y 'timestamp'
+
+        Raises:
+            WalCheckpointServiceError: Si el modo no es válido
+        """
+        mode = (mode or 'PASSIVE').upper()
+        if mode not in CHECKPOINT_MODES:
+            raise WalCheckpointServiceError(
+                f"Modo de checkpoint no válido: {mode}. Use uno de {', '.join(CHECKPOINT_MODES)}"
+            )
+
+        started = time.perf_counter()
+        try:
+            with get_db_connection() as conn:
+                busy, wal_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        except Exception as e:
+            with self._lock:
+                self._status['errors'] += 1
+                self._status['lastError'] = str(e)
+            raise
+
+        result = {
+            'mode': mode,
+            'busy': bool(busy),
+            # -1 si la base de datos no está en modo WAL
+            'walFrames': wal_frames,
+            'checkpointedFrames': checkpointed,
+            'durationSeconds': round(time.perf_counter() - started, 4),
+            'timestamp': datetime.now().isoformat()
+        }
+        with self._lock:
+            self._status['checkpoints'] += 1
+            self._status['busyCheckpoints'] += int(result['busy'])
+            self._status['lastCheckpoint'] = result
+        return result
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retorna una copia del estado del servicio"""
+        with self._lock:
+            status = dict(self._status)
+        status['running'] = self._thread is not None and self._thread.is_alive()
+        return status
+
+    def _run(self) -> None:
+        """Bucle de checkpoints PASSIVE hasta stop()"""
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                result = self.checkpoint('PASSIVE')
+                if result['walFrames'] > result['checkpointedFrames']:
+                    logger.debug(f"Checkpoint parcial del WAL: {result['checkpointedFrames']}/"
+                                 f"{result['walFrames']} páginas (lectores activos)")
+            except Exception as e:
+                logger.warning(f"Error en checkpoint del WAL en segundo plano: {e}")
+
+
+# Instancia global del servicio
+_wal_checkpoint_service_instance = None
+
+
+def get_wal_checkpoint_service() -> WalCheckpointService:
+    """Retorna la instancia singleton del servicio de checkpoints del WAL"""
+    global _wal_checkpoint_service_instance
+    if _wal_checkpoint_service_instance is None:
+        _wal_checkpoint_service_instance = WalCheckpointService()
+    return _wal_checkpoint_service_instance
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Eliminación Masiva en Segundo Plano
+====================================================
+
+Valida la eliminación por lotes de BulkDeletionService:
+1. La migración agrega el estado DELETING sin perder datos asociados
+2. delete_operator_sheet oculta el archivo de inmediato y elimina sus datos
+   por lotes en segundo plano, reportando progreso
+3. clear_cellular_data elimina los datos celulares de la misión por lotes
+4. VACUUM incremental opcional al terminar
+5. Las consultas de análisis ignoran los archivos en DELETING y los registros
+   celulares bajo el corte de una limpieza en curso
+6. Los registros celulares cargados durante una limpieza quedan visibles y
+   no los elimina el trabajo en curso
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection
+from database.models import Mission, CellularData
+import services.bulk_deletion_service as deletion_module
+import services.operator_data_service as operator_module
+from services.bulk_deletion_service import get_bulk_deletion_service
+from services.operator_data_service import (
+    get_operator_data_service, get_operator_sheets, get_operator_sheet_data, delete_operator_sheet
+)
+from services.mission_service import MissionService
+from test_cellular_bulk_upload import build_scanhunter_file
+from testing.correlation_reference import populate_mission
+from testing.operator_fixtures import apply_operator_schema
+
+TOTAL_RECORDS = 1000
+BATCH_SIZE = 150
+
+
+def _create_sheet_with_legacy_schema():
+    """Crea un archivo de llamadas sobre un esquema sin el estado DELETING"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path,
+                           replacements=((", 'FAILED', 'DELETING')", ", 'FAILED')"),))
+
+    file_upload_id = str(uuid.uuid4())
+    with get_db_connection() as conn:
+        mission_id, user_id = conn.execute("SELECT id, created_by FROM missions LIMIT 1").fetchone()
+        conn.execute("""
+            INSERT INTO operator_data_sheets (
+                id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                operator, operator_file_format, processing_status, uploaded_by
+            ) VALUES (?, ?, 'claro_llamadas.xlsx', 2048, ?, 'CALL_DATA', 'CLARO', 'CLARO_LLAMADAS', 'COMPLETED', ?)
+        """, (file_upload_id, mission_id, 'b' * 64, user_id))
+        conn.executemany("""
+            INSERT INTO operator_call_data (
+                file_upload_id, mission_id, operator, tipo_llamada, numero_origen,
+                numero_destino, numero_objetivo, fecha_hora_llamada, record_hash
+            ) VALUES (?, ?, 'CLARO', 'SALIENTE', '3001234567', ?, '3001234567', '2024-01-01 10:00:00', ?)
+        """, [(file_upload_id, mission_id, f"310{i:07d}", f"hash-{i}") for i in range(TOTAL_RECORDS)])
+        conn.commit()
+
+    operator_module._operator_data_service_instance = None
+    return file_upload_id, mission_id, user_id
+
+
+def test_delete_operator_sheet_in_background():
+    """Valida estado DELETING, lotes, progreso y eliminación final del archivo"""
+    print("=== TEST: ELIMINACIÓN MASIVA EN SEGUNDO PLANO ===")
+    file_upload_id, mission_id, user_id = _create_sheet_with_legacy_schema()
+    get_operator_data_service()
+
+    with get_db_connection() as conn:
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='operator_data_sheets'"
+        ).fetchone()[0]
+        call_rows = conn.execute("SELECT COUNT(*) FROM operator_call_data").fetchone()[0]
+    assert "'FAILED', 'DELETING')" in table_sql
+    assert call_rows == TOTAL_RECORDS
+
+    original_batch_size = deletion_module.DELETION_BATCH_SIZE
+    deletion_module.DELETION_BATCH_SIZE = BATCH_SIZE
+    try:
+        result = delete_operator_sheet(file_upload_id, user_id, vacuum=True)
+        assert result['success'], result
+        assert result['status'] == 'DELETING'
+
+        # Oculto de inmediato para las consultas
+        listed = get_operator_sheets(mission_id)
+        assert all(sheet['id'] != file_upload_id for sheet in listed['data'])
+        assert get_operator_sheet_data(file_upload_id)['error_code'] == 'FILE_NOT_FOUND'
+
+        job = get_bulk_deletion_service().wait_for_job(result['jobId'], timeout=60)
+    finally:
+        deletion_module.DELETION_BATCH_SIZE = original_batch_size
+
+    assert job['status'] == 'COMPLETED', job
+    assert job['progress'] == 100.0
+    assert job['rowsDeleted'] == TOTAL_RECORDS + 1
+    assert job['batches'] >= TOTAL_RECORDS // BATCH_SIZE
+    assert job['vacuum']['status'] == 'COMPLETED'
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM operator_call_data").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM operator_data_sheets WHERE id = ?",
+                            (file_upload_id,)).fetchone()[0] == 0
+
+
+def test_pending_deletion_resumes_on_startup():
+    """Valida que un archivo que quedó en DELETING se elimine al iniciar el servicio"""
+    file_upload_id, _, _ = _create_sheet_with_legacy_schema()
+    get_operator_data_service()
+    with get_db_connection() as conn:
+        conn.execute("UPDATE operator_data_sheets SET processing_status = 'DELETING' WHERE id = ?",
+                     (file_upload_id,))
+        conn.commit()
+
+    operator_module._operator_data_service_instance = None
+    get_operator_data_service()
+    job = get_bulk_deletion_service().find_active_job('OPERATOR_SHEET', file_upload_id)
+    if job:
+        job = get_bulk_deletion_service().wait_for_job(job['jobId'], timeout=60)
+        assert job['status'] == 'COMPLETED', job
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM operator_data_sheets WHERE id = ?",
+                            (file_upload_id,)).fetchone()[0] == 0
+
+
+def test_clear_cellular_data_in_background():
+    """Valida la limpieza por lotes de los datos celulares de una misión"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    with get_database_manager().get_session() as session:
+        session.add(Mission(id='mclear', code='CLR-001', name='Mision Limpieza',
+                            status='En Progreso', start_date='2025-01-01'))
+        session.commit()
+
+    service = MissionService()
+    service.db_manager = get_database_manager()
+    service.upload_cellular_data('mclear', build_scanhunter_file(400))
+
+    original_batch_size = deletion_module.DELETION_BATCH_SIZE
+    deletion_module.DELETION_BATCH_SIZE = 50
+    try:
+        result = service.clear_cellular_data('mclear')
+        assert result['cellularData'] == []
+        job = get_bulk_deletion_service().wait_for_job(result['deletionJob']['jobId'], timeout=60)
+    finally:
+        deletion_module.DELETION_BATCH_SIZE = original_batch_size
+
+    assert job['status'] == 'COMPLETED', job
+    assert job['rowsDeleted'] == 400
+    assert job['batches'] == 8
+    with get_database_manager().get_session() as session:
+        assert session.query(CellularData).filter(CellularData.mission_id == 'mclear').count() == 0
+
+    # Sin datos no se lanza trabajo
+    assert service.clear_cellular_data('mclear')['deletionJob'] is None
+
+
+def test_readers_skip_rows_being_deleted():
+    """Valida que correlación, grafo e interacciones ignoren los datos en eliminación"""
+    from main import get_call_interactions
+    from services.communication_graph_service import CommunicationGraphService
+    from services.correlation_service_fixed import CorrelationServiceFixed
+
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, 2000, 40)
+        file_upload_id = conn.execute("SELECT id FROM operator_data_sheets").fetchone()[0]
+
+    period = ('2024-03-01 00:00:00', '2024-03-31 23:59:59')
+    correlation = CorrelationServiceFixed()
+    # El estado se cambia por SQL: la firma de respaldo se verifica en cada consulta
+    graph_service = CommunicationGraphService(signature_check_seconds=0)
+
+    def results():
+        return (
+            correlation.analyze_correlation(mission_id, *period, 1)['data'],
+            get_call_interactions(mission_id, '3000000000', *period),
+            graph_service.get_graph(mission_id).event_count
+        )
+
+    correlated, interactions, events = results()
+    assert correlated and interactions and events > 0
+
+    with get_db_connection() as conn:
+        conn.execute("UPDATE operator_data_sheets SET processing_status = 'DELETING' WHERE id = ?",
+                     (file_upload_id,))
+        conn.execute("UPDATE missions SET cellular_clear_through_id = "
+                     "(SELECT MAX(id) FROM cellular_data) WHERE id = ?", (mission_id,))
+        conn.commit()
+
+    assert results() == ([], [], 0)
+    summary = correlation.get_correlation_summary(mission_id)
+    assert summary['hunterData']['totalRecords'] == 0
+    assert summary['operatorData']['totalCalls'] == 0
+
+
+def test_cellular_upload_during_clear_stays_visible():
+    """Valida el corte de limpieza celular: lecturas, cargas nuevas y reanudación"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    with get_database_manager().get_session() as session:
+        session.add(Mission(id='mcut', code='CUT-001', name='Mision Corte',
+                            status='En Progreso', start_date='2025-01-01'))
+        session.commit()
+
+    service = MissionService()
+    service.db_manager = get_database_manager()
+    file_data = build_scanhunter_file(200)
+    service.upload_cellular_data('mcut', file_data)
+
+    # Limpieza interrumpida: el corte quedó guardado pero el trabajo no corrió
+    with get_db_connection() as conn:
+        clear_through_id = conn.execute("SELECT MAX(id) FROM cellular_data").fetchone()[0]
+        conn.execute("UPDATE missions SET cellular_clear_through_id = ? WHERE id = 'mcut'",
+                     (clear_through_id,))
+        conn.commit()
+
+    assert service.get_mission_cellular_data('mcut')['total'] == 0
+    assert service.get_mission_stats('mcut')['cellularRecordsCount'] == 0
+
+    # Las mediciones repetidas no cuentan como existentes y, tras un replace
+    # que vació la tabla, los ids nuevos no reutilizan los del corte
+    summary = service.upload_cellular_data('mcut', file_data, mode='append')['uploadSummary']
+    assert summary['recordsInserted'] == 200
+    summary = service.upload_cellular_data('mcut', file_data, mode='replace')['uploadSummary']
+    assert summary['recordsInserted'] == 200
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT MIN(id) FROM cellular_data").fetchone()[0] > clear_through_id
+
+    assert service.resume_pending_cellular_clears() == 1
+    job = get_bulk_deletion_service().find_active_job('CELLULAR_DATA', 'mcut')
+    if job:
+        job = get_bulk_deletion_service().wait_for_job(job['jobId'], timeout=60)
+        assert job['status'] == 'COMPLETED', job
+
+    assert service.get_mission_cellular_data('mcut')['total'] == 200
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT cellular_clear_through_id FROM missions "
+                            "WHERE id = 'mcut'").fetchone()[0] is None
+
+if __name__ == "__main__":
+    tests = [
+        test_delete_operator_sheet_in_background,
+        test_pending_deletion_resumes_on_startup,
+        test_clear_cellular_data_in_background,
+        test_readers_skip_rows_being_deleted,
+        test_cellular_upload_during_clear_stays_visible,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test del Diccionario de Celdas
+=======================================
+
+Valida el diccionario de celdas (clave canónica -> ID entero):
+1. La clave canónica de Python coincide con la expresión SQL de los triggers
+2. Los registros existentes reciben sus IDs al crear el diccionario y los
+   nuevos (INSERT/UPDATE) en la misma transacción, con el mismo ID en todas
+   las tablas masivas
+3. Las escrituras en misiones con archivo propio registran sus claves en
+   el diccionario de kronos.db
+4. La correlación HUNTER-validated encuentra las mismas celdas cuando el
+   archivo HUNTER las trae como decimales ('12345.0')
+5. El núcleo de carga asigna los IDs una vez por lote, sin los triggers de
+   respaldo (que no se ejecutan durante sus lotes)
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import populate_mission
+from database.batch_write_guard import BEGIN_BATCH_WRITE_SQL
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.cell_dictionary_service import (
+    CellDictionaryService, CELL_KEY_COLUMNS, canonical_cell_key, get_cell_dictionary_service, _canonical_sql
+)
+from services.correlation_service_hunter_validated import CorrelationServiceHunterValidated
+from services.file_processor_service import FileProcessorService
+from services.mission_shard_service import MissionShardService
+from services.operator_ingestion_adapters import CALL_DATA_INSERT_SQL
+from testing.operator_fixtures import apply_operator_schema
+from test_operator_specific_codec import _prepared_rows, _setup_file
+
+PERIOD = ('2024-03-01 00:00:00', '2024-03-31 23:59:59')
+
+
+def _setup_mission(calls: int = 500) -> str:
+    """BD temporal con una misión poblada"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls=calls, hunter_cells=20, seed=3)
+    return mission_id
+
+
+def _insert_call(conn, mission_id: str, celda_origen, celda_destino) -> int:
+    file_upload_id = conn.execute(
+        "SELECT id FROM operator_data_sheets WHERE mission_id = ? LIMIT 1", (mission_id,)
+    ).fetchone()[0]
+    return conn.execute("""
+        INSERT INTO operator_call_data (
+            file_upload_id, mission_id, operator, tipo_llamada, numero_origen, numero_destino,
+            numero_objetivo, fecha_hora_llamada, celda_origen, celda_destino, record_hash
+        ) VALUES (?, ?, 'CLARO', 'SALIENTE', '3105550000', '3000000000', '3105550000',
+                  '2024-03-05 10:00:00', ?, ?, ?)
+    """, (file_upload_id, mission_id, celda_origen, celda_destino, uuid.uuid4().hex)).lastrowid
+
+
+def _key_ids(conn, call_id: int) -> tuple:
+    return conn.execute(
+        "SELECT celda_origen_key_id, celda_destino_key_id FROM operator_call_data WHERE id = ?", (call_id,)
+    ).fetchone()
+
+
+def test_canonical_key_matches_sql():
+    """Valida que la clave canónica de Python y la de SQL coinciden"""
+    print("=== TEST: DICCIONARIO DE CELDAS ===")
+    values = ['12345', ' 12345 ', '12345.0', '12345.000', '0012.', '12345.5', '1.0.0',
+              'ABC.0', '.0', 'A1B2', '', '   ', '5.10']
+    conn = sqlite3.connect(':memory:')
+    for value in values:
+        sql_key = conn.execute(f"SELECT {_canonical_sql('v')} FROM (SELECT ? AS v)", (value,)).fetchone()[0]
+        assert sql_key == canonical_cell_key(value), value
+    assert canonical_cell_key(12345.0) == canonical_cell_key(' 12345 ') == '12345'
+    assert canonical_cell_key('12345.5') == '12345.5' and canonical_cell_key('   ') is None
+    assert canonical_cell_key(None) is None
+
+
+def test_ids_assigned_on_backfill_insert_and_update():
+    """Valida la asignación de IDs a registros existentes, nuevos y actualizados"""
+    mission_id = _setup_mission()
+    service = CellDictionaryService()
+    keys = service.ensure_dictionary()
+    assert keys and keys == service.ensure_dictionary()
+
+    with get_db_connection() as conn:
+        for table, columns in CELL_KEY_COLUMNS.items():
+            for cell_column, key_column in columns.items():
+                mismatches = conn.execute(f"""
+                    SELECT COUNT(*) FROM {table} t LEFT JOIN cell_dictionary d ON d.id = t.{key_column}
+                    WHERE d.cell_key IS NOT {_canonical_sql('t.' + cell_column)}
+                """).fetchone()[0]
+                assert mismatches == 0, f"{table}.{key_column}"
+
+        hunter_cell, hunter_id = conn.execute(
+            "SELECT cell_id, cell_key_id FROM cellular_data WHERE mission_id = ? LIMIT 1", (mission_id,)
+        ).fetchone()
+        call_id = _insert_call(conn, mission_id, f" {hunter_cell}.0", '')
+        conn.commit()
+        assert _key_ids(conn, call_id) == (hunter_id, None)
+
+        new_id = _insert_call(conn, mission_id, '99999999', None)
+        conn.commit()
+        new_key_id = _key_ids(conn, new_id)[0]
+        assert conn.execute("SELECT cell_key FROM cell_dictionary WHERE id = ?", (new_key_id,)).fetchone()[0] == '99999999'
+
+        conn.execute("UPDATE operator_call_data SET celda_destino = '99999999.00' WHERE id = ?", (call_id,))
+        conn.commit()
+        assert _key_ids(conn, call_id) == (hunter_id, new_key_id)
+        assert conn.execute("SELECT COUNT(*) FROM cell_dictionary").fetchone()[0] == keys + 1
+
+    with get_database_manager().get_session() as session:
+        assert service.lookup_ids(session, [f"{hunter_cell}.0", 'desconocida', '']) == {hunter_cell: hunter_id}
+        assert service.lookup_keys(session, [hunter_id, new_key_id]) == {hunter_id: hunter_cell, new_key_id: '99999999'}
+
+
+def test_sharded_mission_uses_shared_dictionary():
+    """Valida la asignación de IDs en misiones con archivo propio"""
+    mission_id = _setup_mission()
+    MissionShardService().shard_mission(mission_id)
+    service = CellDictionaryService()
+    service.ensure_dictionary()
+
+    with get_db_connection(mission_id) as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM operator_call_data WHERE celda_origen != '' AND celda_origen_key_id IS NULL"
+        ).fetchone()[0] == 0
+        call_id = _insert_call(conn, mission_id, '77777777.0', '77777777')
+        conn.commit()
+        origen_id, destino_id = _key_ids(conn, call_id)
+    assert origen_id == destino_id
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT cell_key FROM cell_dictionary WHERE id = ?", (origen_id,)).fetchone()[0] == '77777777'
+
+
+def test_hunter_cells_match_decimal_format():
+    """Valida que celdas HUNTER en formato decimal encuentran las mismas correlaciones"""
+    mission_id = _setup_mission(calls=2000)
+    with get_db_connection() as conn:
+        cells = {row[0] for row in conn.execute(
+            "SELECT DISTINCT cell_id FROM cellular_data WHERE mission_id = ?", (mission_id,)
+        )}
+
+    results = []
+    for hunter_cells in (cells, {f"{cell}.0" for cell in cells}):
+        service = CorrelationServiceHunterValidated()
+        service._hunter_cells_cache = hunter_cells
+        service._cache_timestamp = time.time()
+        result = service.analyze_correlation(mission_id, *PERIOD, 1)
+        assert result['success']
+        results.append(sorted(
+            (r['numero_objetivo'], r['ocurrencias'], tuple(sorted(r['celdas_relacionadas']))) for r in result['data']
+        ))
+    assert results[0] and results[0] == results[1]
+    assert {cell for _, _, related in results[0] for cell in related} <= cells
+
+
+def test_ingest_core_assigns_ids_per_batch():
+    """Valida la asignación set-based del núcleo de carga y la marca de lotes de los triggers"""
+    mission_id = _setup_mission(calls=50)
+    service = get_cell_dictionary_service()
+    service.ensure_dictionary()
+    insert_trigger = 'trg_cell_dictionary_operator_call_data_insert'
+
+    with get_db_connection() as conn:
+        hunter_cell, hunter_id = conn.execute(
+            "SELECT cell_id, cell_key_id FROM cellular_data WHERE mission_id = ? LIMIT 1", (mission_id,)
+        ).fetchone()
+
+        # Con la marca del lote el trigger de respaldo no asigna IDs
+        conn.execute(BEGIN_BATCH_WRITE_SQL, ('operator_call_data',))
+        call_id = _insert_call(conn, mission_id, '66666666', None)
+        assert _key_ids(conn, call_id) == (None, None)
+        conn.rollback()
+
+        # Un trigger anterior a la marca de lotes se reemplaza
+        conn.execute(f"DROP TRIGGER {insert_trigger}")
+        conn.execute(f"CREATE TRIGGER {insert_trigger} AFTER INSERT ON operator_call_data BEGIN SELECT 1; END")
+        conn.commit()
+    service._ready_engine = None
+    service.ensure_ready()
+    with get_db_connection() as conn:
+        trigger_sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (insert_trigger,)).fetchone()[0]
+        assert 'batch_write_guard' in trigger_sql
+        # Sin trigger: los IDs de la carga solo pueden venir del núcleo
+        conn.execute(f"DROP TRIGGER {insert_trigger}")
+        conn.commit()
+
+    file_upload_id = _setup_file(mission_id)
+    rows = _prepared_rows(file_upload_id, mission_id, [json.dumps({'i': i}) for i in range(25)])
+    for index, (params, row_number) in enumerate(rows):
+        params = list(params)
+        params[9] = f" {hunter_cell}.0" if index % 2 else '88888888'
+        params[10] = '88888888.0'
+        if index == 12:
+            params[4] = 'abc'  # El lote 2 se reescribe fila a fila
+        rows[index] = (tuple(params), row_number)
+    processor = FileProcessorService()
+    processor.CHUNK_SIZE = 10
+    written = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {'sheet_name': 'Hoja1', 'rows': rows},
+                                             file_upload_id, mission_id)
+    assert written['records_processed'] == 24 and written['row_fallback_batches'] == 1, written
+
+    with get_db_connection() as conn:
+        new_id = conn.execute("SELECT id FROM cell_dictionary WHERE cell_key = '88888888'").fetchone()[0]
+        stored = conn.execute(
+            "SELECT celda_origen, celda_origen_key_id, celda_destino_key_id, celda_objetivo_key_id "
+            "FROM operator_call_data WHERE numero_origen LIKE '300%' AND file_upload_id = ?", (file_upload_id,)
+        ).fetchall()
+        assert len(stored) == 24
+        for celda_origen, origen_id, destino_id, objetivo_id in stored:
+            assert origen_id == (new_id if celda_origen == '88888888' else hunter_id)
+            assert destino_id == new_id and objetivo_id is not None
+        assert conn.execute("SELECT COUNT(*) FROM batch_write_guard").fetchone()[0] == 0
+
+
+if __name__ == "__main__":
+    tests = [
+        test_canonical_key_matches_sql,
+        test_ids_assigned_on_backfill_insert_and_update,
+        test_sharded_mission_uses_shared_dictionary,
+        test_hunter_cells_match_decimal_format,
+        test_ingest_core_assigns_ids_per_batch,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Extracción Vectorizada de Cell ID y LAC
+========================================================
+
+Valida utils.cell_id_converter.extract_cellid_lac_vectorized:
+1. Resultados idénticos a extract_cellid_lac_from_celda_origen fila por fila
+   (MOVISTAR, TIGO y formato por defecto), incluyendo valores inválidos
+2. Conversión exacta de valores hexadecimales largos (más de 15 dígitos)
+3. process_movistar_cellular_data retorna las mismas estadísticas que
+   get_conversion_stats y conserva columnas object con int/None
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.cell_id_converter import (
+    extract_cellid_lac_from_celda_origen, extract_cellid_lac_vectorized,
+    process_movistar_cellular_data, get_conversion_stats
+)
+
+EDGE_VALUES = [
+    '07F083-05', ' 07f083-05 ', '0A-1B', '010006CC', '010006cc ', '07F083-', '-05', '07F083-05-01',
+    'G7F083-05', '', '   ', None, np.nan, 12345, 1.5, 1e-05, 'nan', 'None',
+    '0' * 20 + '1-FF', 'F' * 16 + '-' + 'F' * 15, '7FFFFFFFFFFFFFF-0', 'ABCDEF12', '07F083\n-05'
+]
+
+
+def _random_values(count: int) -> list:
+    generator = random.Random(42)
+    values = []
+    for _ in range(count):
+        kind = generator.random()
+        if kind < 0.6:
+            values.append(f"{generator.randrange(16 ** 6):06X}-{generator.randrange(256):02X}")
+        elif kind < 0.8:
+            values.append(f"{generator.randrange(16 ** 8):08x}")
+        else:
+            values.append(generator.choice(EDGE_VALUES))
+    return values
+
+
+def _expected(values: list, operator: str) -> tuple:
+    results = [extract_cellid_lac_from_celda_origen(value, operator) for value in values]
+    return [r['cellid_decimal'] for r in results], [r['lac_decimal'] for r in results]
+
+
+def test_vectorized_matches_scalar():
+    """Valida paridad con la función escalar para cada formato de operador"""
+    print("=== TEST: CELL ID / LAC VECTORIZADO ===")
+    values = EDGE_VALUES + _random_values(3000)
+
+    for operator in ('MOVISTAR', 'TIGO', 'CLARO'):
+        expected_cellids, expected_lacs = _expected(values, operator)
+        result = extract_cellid_lac_vectorized(pd.Series(values, dtype=object), operator)
+
+        assert result['cellid_decimal'].tolist() == expected_cellids, operator
+        assert result['lac_decimal'].tolist() == expected_lacs, operator
+        assert all(type(v) in (int, type(None)) for v in result['cellid_decimal']), operator
+
+
+def test_long_hex_values_are_exact():
+    """Valida que los valores de más de 15 dígitos no pierdan precisión"""
+    result = extract_cellid_lac_vectorized(['F' * 20 + '-' + 'F' * 15, '7FFFFFFFFFFFFFF-1'])
+
+    assert result['cellid_decimal'].tolist() == [16 ** 20 - 1, 16 ** 15 // 2 - 1]
+    assert result['lac_decimal'].tolist() == [16 ** 15 - 1, 1]
+
+
+def test_process_movistar_cellular_data_stats():
+    """Valida columnas resultantes y estadísticas en una sola pasada"""
+    values = _random_values(500)
+    df = pd.DataFrame({'celda_origen': values}, index=range(1000, 1500))
+
+    stats = process_movistar_cellular_data(df)
+
+    expected_cellids, expected_lacs = _expected(values, 'MOVISTAR')
+    assert df['cellid_decimal'].dtype == object and df['lac_decimal'].dtype == object
+    assert df['cellid_decimal'].tolist() == expected_cellids
+    assert df['lac_decimal'].tolist() == expected_lacs
+    assert stats == get_conversion_stats(df)
+
+    empty = pd.DataFrame({'celda_origen': pd.Series([], dtype=object)})
+    assert process_movistar_cellular_data(empty)['total_records'] == 0
+
+
+if __name__ == "__main__":
+    tests = [
+        test_vectorized_matches_scalar,
+        test_long_hex_values_are_exact,
+        test_process_movistar_cellular_data_stats,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
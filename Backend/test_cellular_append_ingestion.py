@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Carga Incremental (append) de Datos SCANHUNTER
+===============================================================
+
+Valida la ingesta incremental de MissionService.upload_cellular_data:
+1. Modo 'append' omite mediciones ya existentes (hash de contenido)
+2. Duplicados dentro del mismo archivo se insertan una sola vez (append y replace)
+3. Registros previos sin hash se completan en la migración sin disparar
+   trg_clean_analysis_on_cellular_update; los que queden sin hash se
+   comparan en memoria
+4. Solo se invalidan los análisis de los operadores con datos nuevos
+5. Los observadores de cambios reciben misión y operadores afectados
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import base64
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+
+from database.connection import init_database, get_database_manager
+from database.models import Mission, CellularData, TargetRecord
+from services.mission_service import MissionService, register_cellular_change_listener
+from test_cellular_bulk_upload import SCANHUNTER_HEADER, build_scanhunter_file
+
+
+def _setup_service():
+    """Crea una BD temporal con una misión vacía"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+
+    with get_database_manager().get_session() as session:
+        session.add(Mission(id='mappend', code='APP-001', name='Mision Append',
+                            status='En Progreso', start_date='2025-01-01'))
+        session.commit()
+
+    service = MissionService()
+    service.db_manager = get_database_manager()
+    return service
+
+
+def _count_cellular(mission_id: str) -> int:
+    with get_database_manager().get_session() as session:
+        return session.query(CellularData).filter(CellularData.mission_id == mission_id).count()
+
+
+def _build_operator_file(operator: str, mnc_mcc: str, rows: int) -> dict:
+    """Construye un archivo SCANHUNTER con un único operador"""
+    lines = [SCANHUNTER_HEADER]
+    for i in range(1, rows + 1):
+        lines.append(f"{i};Q{i};4,{700000 + i};-74,{90000 + i};{mnc_mcc};{operator};-70;LTE;{50000 + i};101;301;Sesion Q;9001")
+    content = base64.b64encode("\n".join(lines).encode('utf-8')).decode('ascii')
+    return {'name': 'scanhunter.csv', 'content': f"data:text/csv;base64,{content}"}
+
+
+def test_append_skips_existing_measurements():
+    """Valida que una carga diaria solo inserte mediciones nuevas"""
+    print("=== TEST: CARGA INCREMENTAL SCANHUNTER ===")
+    service = _setup_service()
+
+    service.upload_cellular_data('mappend', build_scanhunter_file(100))
+
+    # Nueva sesión del escáner: Ids reiniciados, 40 mediciones repetidas y 30 nuevas
+    result = service.upload_cellular_data('mappend', build_scanhunter_file(70, start_id=61), mode='append')
+    summary = result['uploadSummary']
+    assert summary['recordsProcessed'] == 70
+    assert summary['recordsInserted'] == 30
+    assert summary['recordsSkipped'] == 40
+    assert _count_cellular('mappend') == 130
+
+    # Recargar el mismo archivo no inserta nada
+    result = service.upload_cellular_data('mappend', build_scanhunter_file(70, start_id=61), mode='append')
+    assert result['uploadSummary']['recordsInserted'] == 0
+    assert result['uploadSummary']['affectedOperators'] == []
+    assert _count_cellular('mappend') == 130
+    print(f"  Resumen: {summary}")
+
+
+def _install_schema_trigger(name: str) -> None:
+    """Instala en la BD temporal un trigger de database/schema.sql"""
+    schema = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'schema.sql'),
+                  encoding='utf-8').read()
+    start = schema.index(f"CREATE TRIGGER {name}")
+    trigger_sql = schema[start:schema.index("END;", start) + len("END;")]
+    with get_database_manager().get_session() as session:
+        session.execute(text(trigger_sql))
+        session.commit()
+
+
+def _build_repeated_file() -> dict:
+    """Archivo de 30 filas: 10 mediciones, las mismas repetidas y 10 nuevas"""
+    duplicated = build_scanhunter_file(10)
+    content = base64.b64decode(duplicated['content'].split(',', 1)[1]).decode('utf-8')
+    lines = content.split("\n")
+    repeated = lines + lines[1:] + [line.replace('4,6000', '4,6100', 1) for line in lines[1:]]
+    duplicated['content'] = "data:text/csv;base64," + base64.b64encode("\n".join(repeated).encode('utf-8')).decode('ascii')
+    return duplicated
+
+
+def test_append_backfills_legacy_rows_and_dedups_file():
+    """Valida el cálculo de hash en registros previos y duplicados del archivo"""
+    service = _setup_service()
+    service.upload_cellular_data('mappend', build_scanhunter_file(20))
+
+    with get_database_manager().get_session() as session:
+        session.query(CellularData).update({CellularData.record_hash: None})
+        session.add(TargetRecord(mission_id='mappend', target_id='T-CLARO', operator='CLARO',
+                                 lat=4.6, lon=-74.08, signal=-70, towers=1, coverage='Alta',
+                                 source_sheet='scanhunter'))
+        session.commit()
+    _install_schema_trigger('trg_clean_analysis_on_cellular_update')
+
+    # La migración completa los hashes sin disparar la invalidación por fila
+    get_database_manager()._migrate_cellular_record_hash()
+    with get_database_manager().get_session() as session:
+        assert session.query(CellularData).filter(CellularData.record_hash.is_(None)).count() == 0
+        assert session.query(TargetRecord).count() == 1
+        trigger = session.execute(text(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'trg_clean_analysis_on_cellular_update'"
+        )).scalar()
+        assert trigger == 1
+
+    result = service.upload_cellular_data('mappend', _build_repeated_file(), mode='append')
+    assert result['uploadSummary']['recordsProcessed'] == 30
+    assert result['uploadSummary']['recordsInserted'] == 10
+    assert _count_cellular('mappend') == 30
+
+    # Registros sin hash (cargados por otra ruta) se comparan sin actualizarlos
+    with get_database_manager().get_session() as session:
+        session.execute(text("DROP TRIGGER trg_clean_analysis_on_cellular_update"))
+        session.query(CellularData).update({CellularData.record_hash: None})
+        session.commit()
+    result = service.upload_cellular_data('mappend', _build_repeated_file(), mode='append')
+    assert result['uploadSummary']['recordsInserted'] == 0
+    with get_database_manager().get_session() as session:
+        assert session.query(CellularData).filter(CellularData.record_hash.is_(None)).count() == 30
+
+
+def test_replace_dedups_file_like_append():
+    """Valida que el modo replace también inserte una sola vez las filas repetidas"""
+    service = _setup_service()
+    result = service.upload_cellular_data('mappend', _build_repeated_file())
+    summary = result['uploadSummary']
+    assert summary['recordsProcessed'] == 30
+    assert summary['recordsInserted'] == 20
+    assert summary['recordsSkipped'] == 10
+    assert _count_cellular('mappend') == 20
+
+
+def test_append_invalidates_only_touched_operators():
+    """Valida que solo se invaliden análisis y caches de operadores afectados"""
+    service = _setup_service()
+    service.upload_cellular_data('mappend', build_scanhunter_file(10))
+
+    with get_database_manager().get_session() as session:
+        for operator in ('CLARO', 'MOVISTAR'):
+            session.add(TargetRecord(mission_id='mappend', target_id=f'T-{operator}',
+                                     operator=operator, lat=4.6, lon=-74.08, signal=-70,
+                                     towers=1, coverage='Alta', source_sheet='scanhunter'))
+        session.commit()
+
+    notifications = []
+    register_cellular_change_listener(lambda mission_id, operators: notifications.append((mission_id, operators)))
+
+    result = service.upload_cellular_data('mappend', _build_operator_file('MOVISTAR', '732123', 5), mode='append')
+    assert result['uploadSummary']['affectedOperators'] == ['MOVISTAR']
+    assert notifications[-1] == ('mappend', {'MOVISTAR'})
+
+    with get_database_manager().get_session() as session:
+        remaining = {r.operator for r in session.query(TargetRecord).filter(TargetRecord.mission_id == 'mappend')}
+        assert remaining == {'CLARO'}
+
+
+if __name__ == "__main__":
+    tests = [
+        test_append_skips_existing_measurements,
+        test_append_backfills_legacy_rows_and_dedups_file,
+        test_replace_dedups_file_like_append,
+        test_append_invalidates_only_touched_operators,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
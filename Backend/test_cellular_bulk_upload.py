@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Carga Masiva de Datos SCANHUNTER
+=================================================
+
+Valida la ruta de inserción masiva de MissionService.upload_cellular_data:
+1. Modo 'replace' elimina los datos previos y los reemplaza
+2. Modo 'append' conserva los datos previos
+3. La respuesta es un resumen liviano (sin cellularData)
+4. Modo de carga inválido es rechazado
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import base64
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager
+from database.models import Mission, CellularData
+from services.mission_service import MissionService, MissionServiceError
+
+SCANHUNTER_HEADER = "Id;Punto;Latitud;Longitud;MNC+MCC;OPERADOR;RSSI;TECNOLOGIA;CELLID;LAC o TAC;ENB;Comentario;CHANNEL"
+
+
+def build_scanhunter_file(rows: int, start_id: int = 1, punto_prefix: str = 'P') -> dict:
+    """Construye un archivo SCANHUNTER CSV en formato data URL"""
+    lines = [SCANHUNTER_HEADER]
+    for i in range(start_id, start_id + rows):
+        lines.append(
+            f"{i};{punto_prefix}{i % 7};4,{600000 + i};-74,{80000 + i};732101;CLARO;-{60 + i % 30};"
+            f"LTE;{20000 + i};{100 + i % 5};{300 + i % 3};Sesion {punto_prefix};{9000 + i % 4}"
+        )
+    content = base64.b64encode("\n".join(lines).encode('utf-8')).decode('ascii')
+    return {'name': 'scanhunter.csv', 'content': f"data:text/csv;base64,{content}"}
+
+
+def _setup_service():
+    """Crea una BD temporal con una misión vacía"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+
+    with get_database_manager().get_session() as session:
+        session.add(Mission(id='mbulk', code='BULK-001', name='Mision Bulk',
+                            status='En Progreso', start_date='2025-01-01'))
+        session.commit()
+
+    service = MissionService()
+    service.db_manager = get_database_manager()
+    return service
+
+
+def _count_cellular(mission_id: str) -> int:
+    with get_database_manager().get_session() as session:
+        return session.query(CellularData).filter(CellularData.mission_id == mission_id).count()
+
+
+def test_bulk_upload_replace_mode():
+    """Valida inserción masiva en modo replace"""
+    print("=== TEST: CARGA MASIVA SCANHUNTER (REPLACE) ===")
+    service = _setup_service()
+
+    result = service.upload_cellular_data('mbulk', build_scanhunter_file(120))
+    assert result['uploadSummary']['recordsInserted'] == 120
+    assert result['uploadSummary']['recordsDeleted'] == 0
+    assert result['cellularRecordsCount'] == 120
+    assert 'cellularData' not in result
+
+    result = service.upload_cellular_data('mbulk', build_scanhunter_file(30), mode='replace')
+    assert result['uploadSummary']['recordsDeleted'] == 120
+    assert _count_cellular('mbulk') == 30
+    print(f"  Resumen: {result['uploadSummary']}")
+
+
+def test_bulk_upload_append_mode():
+    """Valida que el modo append conserve los datos existentes"""
+    service = _setup_service()
+
+    service.upload_cellular_data('mbulk', build_scanhunter_file(50))
+    result = service.upload_cellular_data('mbulk', build_scanhunter_file(20, start_id=51), mode='append')
+    assert result['uploadSummary']['mode'] == 'append'
+    assert result['cellularRecordsCount'] == 70
+
+    with get_database_manager().get_session() as session:
+        sample = session.query(CellularData).filter(CellularData.file_record_id == 60).first()
+        assert sample.lat == 4.600060
+        assert sample.created_at is not None
+
+
+def test_bulk_upload_invalid_mode():
+    """Valida que un modo desconocido sea rechazado"""
+    service = _setup_service()
+    try:
+        service.upload_cellular_data('mbulk', build_scanhunter_file(5), mode='merge')
+        assert False, "Debe rechazar modo desconocido"
+    except MissionServiceError:
+        pass
+
+
+if __name__ == "__main__":
+    tests = [
+        test_bulk_upload_replace_mode,
+        test_bulk_upload_append_mode,
+        test_bulk_upload_invalid_mode,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
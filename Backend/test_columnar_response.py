@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Respuestas Columnares
+======================================
+
+Valida el formato de respuesta columnar opcional (utils.columnar_response):
+1. Codificar y decodificar conserva filas, tipos, nulos y columnas vacías;
+   las columnas categóricas se codifican con diccionario
+2. get_operator_sheet_data en formato columnar retorna los mismos registros
+   y cursor que el formato por registros, con un payload menor
+3. get_call_interactions y analyze_correlation en formato columnar
+   equivalen al formato por registros
+4. Un formato desconocido se rechaza
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import populate_mission
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.operator_data_service import get_operator_sheet_data
+from testing.operator_fixtures import apply_operator_schema, create_sheet_with_records
+from utils.columnar_response import decode_columnar, encode_columnar, is_columnar_format
+
+
+def test_encode_decode_round_trip():
+    """Valida la codificación columnar y por diccionario"""
+    print("=== TEST: RESPUESTAS COLUMNARES ===")
+    columns = ['id', 'operator', 'celda_origen', 'lat']
+    rows = [(1, 'CLARO', '101', 4.6), (2, 'TIGO', None, None), (3, 'CLARO', '101', -74.1)]
+
+    payload = encode_columnar(columns, rows)
+    assert payload['rowCount'] == 3 and payload['columns'] == columns
+    assert payload['values']['operator'] == [0, 1, 0]
+    assert payload['dictionaries'] == {'operator': ['CLARO', 'TIGO'], 'celda_origen': ['101']}
+    assert payload['values']['celda_origen'] == [0, None, 0]
+    assert payload['values']['lat'] == [4.6, None, -74.1]
+    assert decode_columnar(payload) == [dict(zip(columns, row)) for row in rows]
+
+    converted = encode_columnar(columns, rows, dictionary_columns=(), converters={'id': str})
+    assert converted['values']['id'] == ['1', '2', '3'] and converted['dictionaries'] == {}
+
+    empty = encode_columnar(columns, [])
+    assert empty['rowCount'] == 0 and empty['values'] == {name: [] for name in columns}
+    assert decode_columnar(empty) == []
+
+    assert not is_columnar_format(None) and is_columnar_format('COLUMNAR')
+    with pytest.raises(ValueError):
+        is_columnar_format('csv')
+
+
+def test_sheet_data_columnar_matches_records():
+    """Valida get_operator_sheet_data en formato columnar"""
+    file_upload_id = create_sheet_with_records()
+
+    for kwargs in ({}, {'sort_by': 'celda_id', 'sort_dir': 'desc'}, {'filters': {'celda_id': '20202'}}):
+        page_cursor = None
+        while True:
+            records = get_operator_sheet_data(file_upload_id, page_size=60, page_cursor=page_cursor, **kwargs)
+            columnar = get_operator_sheet_data(file_upload_id, page_size=60, page_cursor=page_cursor,
+                                               response_format='columnar', **kwargs)
+            assert columnar['success'] and columnar['metadata']['response_format'] == 'columnar'
+            assert decode_columnar(columnar['data']) == records['data']
+            assert (columnar['total'], columnar['hasMore'], columnar['nextCursor']) == \
+                (records['total'], records['hasMore'], records['nextCursor'])
+            if not records['hasMore']:
+                break
+            page_cursor = records['nextCursor']
+
+    records = get_operator_sheet_data(file_upload_id, page_size=5000)
+    columnar = get_operator_sheet_data(file_upload_id, page_size=5000, response_format='columnar')
+    assert len(json.dumps(columnar['data'])) < 0.6 * len(json.dumps(records['data']))
+
+    invalid = get_operator_sheet_data(file_upload_id, response_format='csv')
+    assert not invalid['success'] and invalid['error_code'] == 'INVALID_PARAMETERS'
+
+
+class _FixedCorrelationService:
+    """Resultado fijo del servicio HUNTER-VALIDATED (depende de un archivo SCANHUNTER local)"""
+
+    def analyze_correlation(self, **kwargs):
+        return {'success': True, 'total_count': 3, 'processing_time': 0.1, 'data': [
+            {'numero_objetivo': '3001112233', 'operador': 'CLARO', 'ocurrencias': 4,
+             'primera_deteccion': '2024-03-01 10:00:00', 'ultima_deteccion': '2024-03-02 10:00:00',
+             'celdas_relacionadas': ['101', '102'], 'nivel_confianza': 80},
+            {'numero_objetivo': '3004445566', 'operador': 'TIGO', 'ocurrencias': 1,
+             'celdas_relacionadas': [], 'nivel_confianza': 20},
+            {'numero_objetivo': '3007778899', 'operador': 'CLARO', 'ocurrencias': 2,
+             'celdas_relacionadas': ['101'], 'nivel_confianza': 40}
+        ]}
+
+
+def test_main_endpoints_columnar_match_records(monkeypatch):
+    """Valida get_call_interactions y analyze_correlation en formato columnar"""
+    import main
+    from main import analyze_correlation, get_call_interactions
+
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls=2000, hunter_cells=20, seed=43)
+    period = ('2024-03-01 00:00:00', '2024-03-15 23:59:59')
+
+    records = get_call_interactions(mission_id, '3000000000', *period)
+    columnar = get_call_interactions(mission_id, '3000000000', *period, response_format='columnar')
+    assert len(records) > 500 and columnar['rowCount'] == len(records)
+    assert decode_columnar(columnar) == records
+    assert any(record['punto_hunter'] for record in records)
+
+    monkeypatch.setattr(main, 'get_correlation_service_hunter_validated', _FixedCorrelationService)
+    records = analyze_correlation(mission_id, *period)
+    columnar = analyze_correlation(mission_id, *period, response_format='columnar')
+    assert columnar['success'] and columnar['statistics'] == records['statistics']
+    assert columnar['data']['dictionaries']['operator'] == ['CLARO', 'TIGO']
+    assert decode_columnar(columnar['data']) == records['data']
+    assert records['data'][1]['firstDetection'] == ''
+
+
+if __name__ == "__main__":
+    tests = [
+        test_encode_decode_round_trip,
+        test_sheet_data_columnar_matches_records,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Grafo de Comunicaciones en Memoria
+===================================================
+
+Valida utils.communication_graph y CommunicationGraphService:
+1. Vecindario a k saltos, grado y pesos por par coinciden con un cálculo
+   directo sobre la lista de llamadas, con y sin ventana de tiempo
+2. PageRank ponderado coincide con una iteración de potencias densa
+3. El servicio cachea el grafo por misión, lo descarta cuando termina una
+   carga o se marca un archivo para eliminación, y detecta con la firma de
+   respaldo las escrituras fuera de esos caminos
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import random
+import sys
+import tempfile
+import uuid
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection
+import services.communication_graph_service as graph_module
+from services.bulk_deletion_service import get_bulk_deletion_service
+from services.communication_graph_service import (
+    CommunicationGraphServiceError, get_communication_graph_service
+)
+from services.operator_data_service import get_operator_data_service, delete_operator_sheet
+from testing.operator_fixtures import apply_operator_schema
+from utils.communication_graph import CommunicationGraph, datetime_to_epoch, epoch_to_datetime
+
+
+def _random_calls(count: int, numbers: int, seed: int) -> list:
+    """Llamadas (origen, destino, epoch, duración) entre un conjunto de números"""
+    rng = random.Random(seed)
+    pool = [f"300{i:07d}" for i in range(numbers)]
+    base = datetime_to_epoch('2024-01-01 00:00:00')
+    return [(rng.choice(pool), rng.choice(pool), base + rng.randrange(90 * 86400), rng.randrange(600))
+            for _ in range(count)]
+
+
+def _build(calls: list) -> CommunicationGraph:
+    return CommunicationGraph.from_calls(*zip(*calls))
+
+
+def _expected_pairs(calls: list) -> dict:
+    """Pesos por par no dirigido calculados directamente"""
+    pairs = defaultdict(lambda: {'forward': 0, 'backward': 0, 'duration': 0, 'first': None, 'last': None})
+    for origen, destino, ts, duration in calls:
+        if origen == destino:
+            continue
+        a, b = sorted((origen, destino))
+        pair = pairs[(a, b)]
+        pair['forward' if origen == a else 'backward'] += 1
+        pair['duration'] += duration
+        pair['first'] = ts if pair['first'] is None else min(pair['first'], ts)
+        pair['last'] = ts if pair['last'] is None else max(pair['last'], ts)
+    return pairs
+
+
+def _expected_hops(calls: list, seed: str, hops: int) -> dict:
+    adjacency = defaultdict(set)
+    for origen, destino, _, _ in calls:
+        if origen != destino:
+            adjacency[origen].add(destino)
+            adjacency[destino].add(origen)
+    distance, frontier = {seed: 0}, [seed]
+    for hop in range(1, hops + 1):
+        frontier = {n for node in frontier for n in adjacency[node] if n not in distance}
+        distance.update({node: hop for node in frontier})
+    return distance
+
+
+def _assert_neighborhood(graph: CommunicationGraph, calls: list, seed: str, hops: int, **window) -> None:
+    result = graph.neighborhood(seed, hops=hops, max_nodes=10_000, **window)
+    expected = _expected_hops(calls, seed, hops)
+    assert {node['number']: node['hops'] for node in result['nodes']} == expected
+    assert not result['truncated']
+
+    pairs = _expected_pairs(calls)
+    expected_edges = {key: value for key, value in pairs.items() if key[0] in expected and key[1] in expected}
+    edges = {}
+    for edge in result['edges']:
+        a, b = sorted((edge['source'], edge['target']))
+        forward, backward = edge['callsSourceToTarget'], edge['callsTargetToSource']
+        if edge['source'] != a:
+            forward, backward = backward, forward
+        edges[(a, b)] = {'forward': forward, 'backward': backward, 'duration': edge['durationSeconds'],
+                         'first': datetime_to_epoch(edge['firstSeen']), 'last': datetime_to_epoch(edge['lastSeen'])}
+    assert edges == {key: dict(value) for key, value in expected_edges.items()}
+
+    degrees = defaultdict(int)
+    for a, b in pairs:
+        degrees[a] += 1
+        degrees[b] += 1
+    assert all(node['degree'] == degrees[node['number']] for node in result['nodes'])
+
+
+def test_neighborhood_matches_call_list():
+    """Valida vecindarios y pesos con y sin ventana de tiempo"""
+    print("=== TEST: GRAFO DE COMUNICACIONES ===")
+    calls = _random_calls(3000, 400, seed=40)
+    graph = _build(calls)
+    seed = calls[0][0]
+
+    for hops in (1, 2, 3):
+        _assert_neighborhood(graph, calls, seed, hops)
+
+    start_ts = datetime_to_epoch('2024-02-01 00:00:00')
+    end_ts = datetime_to_epoch('2024-02-15 12:00:00')
+    window_calls = [call for call in calls if start_ts <= call[2] <= end_ts]
+    window_seed = window_calls[0][0]
+    _assert_neighborhood(graph, window_calls, window_seed, 2, start_ts=start_ts, end_ts=end_ts)
+
+    assert graph.neighborhood('3999999999')['nodes'] == []
+    truncated = graph.neighborhood(seed, hops=3, max_nodes=10)
+    assert truncated['truncated'] and len(truncated['nodes']) == 10
+    assert truncated['nodes'][0]['number'] == seed
+
+
+def test_pagerank_matches_dense_power_iteration():
+    """Valida PageRank ponderado y métricas de centralidad"""
+    calls = _random_calls(800, 60, seed=41) + [('3111111111', '3111111111', 1_700_000_000, 5)]
+    graph = _build(calls)
+    n = graph.node_count
+
+    matrix = np.zeros((n, n))
+    for origen, destino, _, _ in calls:
+        if origen != destino:
+            a, b = graph.node_ids[origen], graph.node_ids[destino]
+            matrix[a, b] += 1
+            matrix[b, a] += 1
+    strength = matrix.sum(axis=1)
+    rank = np.full(n, 1.0 / n)
+    for _ in range(200):
+        spread = (matrix / np.where(strength == 0, 1, strength)[:, None]).T @ rank
+        rank = 0.15 / n + 0.85 * (spread + rank[strength == 0].sum() / n)
+
+    assert np.allclose(graph.window().pagerank(max_iterations=200, tolerance=0), rank)
+    top = graph.centrality(top=5)
+    assert [item['number'] for item in top] == [graph.numbers[i] for i in np.argsort(-rank, kind='stable')[:5]]
+    assert all(item['calls'] == strength[graph.node_ids[item['number']]] for item in top)
+    assert '3111111111' not in [item['number'] for item in graph.centrality(top=n)]
+    assert epoch_to_datetime(datetime_to_epoch('2024-03-05 10:11:12')) == '2024-03-05 10:11:12'
+
+
+def _insert_calls(mission_id: str, calls: list, status: str = 'COMPLETED') -> str:
+    with get_db_connection() as conn:
+        file_upload_id = str(uuid.uuid4())
+        conn.execute("""
+            INSERT INTO operator_data_sheets (
+                id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                operator, operator_file_format, processing_status, uploaded_by
+            ) VALUES (?, ?, 'archivo.xlsx', 1024, ?, 'CALL_DATA', 'CLARO', 'MULTI', ?, 'admin')
+        """, (file_upload_id, mission_id, uuid.uuid4().hex * 2, status))
+        conn.executemany("""
+            INSERT INTO operator_call_data (
+                file_upload_id, mission_id, operator, tipo_llamada, numero_origen, numero_destino,
+                numero_objetivo, fecha_hora_llamada, duracion_segundos, record_hash
+            ) VALUES (?, ?, 'CLARO', 'ENTRANTE', ?, ?, ?, ?, ?, ?)
+        """, [(file_upload_id, mission_id, origen, destino, destino, epoch_to_datetime(ts), duration,
+               uuid.uuid4().hex) for origen, destino, ts, duration in calls])
+        conn.commit()
+    return file_upload_id
+
+
+def test_service_caches_and_rebuilds_on_change():
+    """Valida el cache por misión y su invalidación al cambiar las llamadas"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id, user_id = conn.execute("SELECT id, created_by FROM missions LIMIT 1").fetchone()
+
+    calls = _random_calls(500, 80, seed=42)
+    _insert_calls(mission_id, calls)
+    graph_module._communication_graph_service_instance = None
+    service = get_communication_graph_service()
+
+    graph = service.get_graph(mission_id)
+    assert graph.event_count == 500
+    assert service.get_graph(mission_id) is graph
+
+    seed = calls[0][0]
+    result = service.get_neighborhood(mission_id, seed, hops=2, max_nodes=500)
+    assert {node['number']: node['hops'] for node in result['nodes']} == _expected_hops(calls, seed, 2)
+
+    # Una carga terminada invalida el grafo sin consultar la firma
+    file_upload_id = _insert_calls(mission_id, [(seed, '3209999999', datetime_to_epoch('2024-05-01 08:00:00'), 30)],
+                                   status='PROCESSING')
+    assert service.get_graph(mission_id) is graph
+    get_operator_data_service()._update_processing_status(file_upload_id, 'COMPLETED')
+    assert service.get_graph(mission_id) is not graph
+    window = service.get_neighborhood(mission_id, seed, hops=1, start_datetime='2024-05-01',
+                                      end_datetime='2024-05-01')
+    assert [node['number'] for node in window['nodes']] == [seed, '3209999999']
+
+    # Marcar el archivo para eliminación también
+    graph = service.get_graph(mission_id)
+    deletion = delete_operator_sheet(file_upload_id, user_id)
+    assert deletion['success'], deletion
+    assert service.get_graph(mission_id) is not graph
+    assert service.get_graph(mission_id).event_count == 500
+    get_bulk_deletion_service().wait_for_job(deletion['jobId'], timeout=60)
+
+    # Escrituras fuera de esos caminos: las detecta la firma de respaldo
+    graph = service.get_graph(mission_id)
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM operator_call_data WHERE id IN (SELECT id FROM operator_call_data LIMIT 10)")
+        conn.commit()
+    assert service.get_graph(mission_id) is graph
+    service.signature_check_seconds = 0
+    assert service.get_graph(mission_id) is not graph
+    assert service.get_graph(mission_id).event_count == 490
+
+    centrality = service.get_centrality(mission_id, top=3)
+    assert centrality['total'] == 3
+    with pytest.raises(CommunicationGraphServiceError):
+        service.get_neighborhood(mission_id, seed, hops=5)
+    with pytest.raises(CommunicationGraphServiceError):
+        service.get_centrality(mission_id, start_datetime='2024-05-02', end_datetime='2024-05-01')
+
+
+if __name__ == "__main__":
+    tests = [
+        test_neighborhood_matches_call_list,
+        test_pagerank_matches_dense_power_iteration,
+        test_service_caches_and_rebuilds_on_change,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test del Plan Unificado de Correlación
+===============================================
+
+Valida CorrelationServiceFixed.analyze_correlation (una sola pasada):
+1. Los resultados coinciden con la cascada anterior de estrategias (A, B, C y
+   rescate de emergencia) en distintos períodos y mínimos de ocurrencias
+2. Cada resultado indica las estrategias que lo detectaron (matchedStrategies)
+3. Sin celdas HUNTER en el período, los números objetivo se recuperan por
+   búsqueda directa o rescate de emergencia
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import legacy_analyze_correlation, populate_mission
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.correlation_service_fixed import CorrelationServiceFixed
+from testing.operator_fixtures import apply_operator_schema
+
+PERIODS = [
+    ('2024-03-05 00:00:00', '2024-03-20 23:59:59'),
+    ('2024-03-10 08:00:00', '2024-03-10 20:00:00'),
+    ('2024-03-01 00:00:00', '2024-03-31 23:59:59'),
+]
+
+
+def _setup_mission() -> str:
+    """BD temporal con una misión poblada con datos sintéticos"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls=4000, hunter_cells=40, seed=7)
+    return mission_id
+
+
+def _key(result: dict) -> tuple:
+    """
+    Campos comparables de un resultado
+
+    Cuando varios grupos número/operador empatan en confianza y llamadas, la
+    cascada conservaba el que SQLite entregara primero (orden no definido);
+    por eso se comparan los campos que no dependen del grupo elegido.
+    """
+    return (result['targetNumber'], result['detectionStrategy'], result['confidence'],
+            result['totalCalls'], result['uniqueHunterCells'], result['hunterCellsTotal'])
+
+
+def _assert_same_results(data: list, expected: list) -> None:
+    assert sorted(map(_key, data)) == sorted(map(_key, expected))
+    assert [(-r['confidence'], -r['totalCalls']) for r in data] == \
+        sorted((-r['confidence'], -r['totalCalls']) for r in data)
+
+
+def test_plan_matches_strategy_cascade():
+    """Valida que el plan unificado produce los mismos resultados que la cascada"""
+    print("=== TEST: PLAN UNIFICADO DE CORRELACIÓN ===")
+    mission_id = _setup_mission()
+    service = CorrelationServiceFixed()
+
+    for start, end in PERIODS:
+        for min_occurrences in (1, 2, 3):
+            expected = legacy_analyze_correlation(service, mission_id, start, end, min_occurrences)
+            response = service.analyze_correlation(mission_id, start, end, min_occurrences)
+            assert response['success']
+            _assert_same_results(response['data'], expected)
+            assert response['statistics']['totalFound'] == len(expected)
+
+
+def test_results_carry_strategy_provenance():
+    """Valida matchedStrategies y el conteo de coincidencias por estrategia"""
+    mission_id = _setup_mission()
+    response = CorrelationServiceFixed().analyze_correlation(mission_id, *PERIODS[0])
+    matches = response['statistics']['strategyMatches']
+
+    assert matches['Original'] > 0 and matches['Flexible'] >= matches['Original']
+    for result in response['data']:
+        strategies = result['matchedStrategies']
+        assert result['detectionStrategy'] in strategies
+        assert strategies == [s for s in CorrelationServiceFixed.STRATEGY_ORDER if s in strategies]
+        # Toda coincidencia A usa celdas que también son HUNTER en B
+        if 'Original' in strategies:
+            assert 'Flexible' in strategies
+
+    by_number = {result['targetNumber']: result for result in response['data']}
+    targets = sorted(CorrelationServiceFixed.TARGET_NUMBERS)
+    # Solo aparece fuera del período: rescatado por emergencia
+    assert by_number[targets[4]]['matchedStrategies'] == ['Emergency']
+    assert 'DirectTarget' in by_number[targets[1]]['matchedStrategies']
+
+
+def test_targets_recovered_without_hunter_cells():
+    """Valida la recuperación de objetivos cuando no hay celdas HUNTER en el período"""
+    mission_id = _setup_mission()
+    service = CorrelationServiceFixed()
+    period = ('2025-06-01 00:00:00', '2025-06-30 23:59:59')
+
+    response = service.analyze_correlation(mission_id, *period)
+    expected = legacy_analyze_correlation(service, mission_id, *period)
+    _assert_same_results(response['data'], expected)
+    assert response['statistics']['strategyMatches']['Original'] == 0
+    assert {r['detectionStrategy'] for r in response['data']} == {'Emergency'}
+    assert all(r['matchedStrategies'] == ['Emergency'] for r in response['data'])
+
+
+if __name__ == "__main__":
+    tests = [
+        test_plan_matches_strategy_cascade,
+        test_results_carry_strategy_provenance,
+        test_targets_recovered_without_hunter_cells,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Mantenimiento de Base de Datos
+===============================================
+
+Valida el servicio de mantenimiento programado:
+1. Los índices de correlación esperados se crean si faltan (también en los
+   archivos de misiones fragmentadas) y no se duplican
+2. ANALYZE se ejecuta solo después de cargas grandes y en inactividad
+3. incremental_vacuum acotado libera las páginas de filas eliminadas
+4. El reporte de tamaño lista tablas e índices con su fragmentación
+5. Los archivos creados sin auto_vacuum=INCREMENTAL se convierten una sola
+   vez y luego incremental_vacuum libera sus páginas
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import populate_mission
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.database_maintenance_service import (
+    DatabaseMaintenanceService, DatabaseMaintenanceServiceError, EXPECTED_INDEXES
+)
+from services.mission_shard_service import MissionShardService
+from testing.operator_fixtures import apply_operator_schema
+
+
+def _setup_missions() -> list:
+    """BD temporal con dos misiones pobladas"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_ids = [row[0] for row in conn.execute("SELECT id FROM missions ORDER BY id LIMIT 2")]
+        for seed, mission_id in enumerate(mission_ids):
+            populate_mission(conn, mission_id, calls=3000, hunter_cells=20, seed=seed)
+    return mission_ids
+
+
+def test_expected_indexes_are_created_once():
+    """Valida la creación de los índices de correlación faltantes"""
+    print("=== TEST: MANTENIMIENTO DE BASE DE DATOS ===")
+    mission_ids = _setup_missions()
+    service = DatabaseMaintenanceService(idle_seconds=0)
+
+    result = service.ensure_expected_indexes()
+    created = result['created'][0]['indexes']
+    assert 'idx_calls_objetivo_mission' in result['present'][0]['indexes']
+    assert set(created) | set(result['present'][0]['indexes']) == set(EXPECTED_INDEXES)
+    assert 'idx_operator_call_data_mission_origen' in created
+
+    MissionShardService().shard_mission(mission_ids[0])
+    with get_db_connection(mission_ids[0]) as conn:
+        conn.execute("DROP INDEX main.idx_operator_call_data_mission_fecha")
+        conn.commit()
+    result = service.ensure_expected_indexes()
+    assert [unit['indexes'] for unit in result['created']] == [[], ['idx_operator_call_data_mission_fecha']]
+    with get_db_connection(mission_ids[0]) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM operator_call_data "
+            "WHERE mission_id = ? AND fecha_hora_llamada >= '2024-03-10'", (mission_ids[0],)
+        ).fetchall()
+    assert any('idx_operator_call_data_mission_fecha' in row[3] for row in plan)
+
+
+def test_analyze_after_large_writes_and_idle_vacuum():
+    """Valida ANALYZE en inactividad después de cargas grandes y el vacuum acotado"""
+    mission_ids = _setup_missions()
+    service = DatabaseMaintenanceService(idle_seconds=0, analyze_after_rows=1000)
+
+    service.record_write_activity(mission_ids[1], 500)
+    assert service.run_maintenance()['analyzed'] == []
+    service.record_write_activity(mission_ids[1], 600)
+    assert service.get_status()['pendingRows'] == {'kronos.db': 1100}
+
+    with get_db_connection() as conn:
+        sheet_id = conn.execute("SELECT id FROM operator_data_sheets LIMIT 1").fetchone()[0]
+        conn.execute("UPDATE operator_data_sheets SET processing_status = 'PROCESSING' WHERE id = ?", (sheet_id,))
+        conn.commit()
+    assert service.run_maintenance()['skipped']
+    with get_db_connection() as conn:
+        conn.execute("UPDATE operator_data_sheets SET processing_status = 'COMPLETED' WHERE id = ?", (sheet_id,))
+        conn.execute("DELETE FROM operator_call_data WHERE mission_id = ?", (mission_ids[1],))
+        conn.commit()
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert free_pages > 0
+
+    result = service.run_maintenance()
+    assert not result['skipped'] and result['analyzed'] == [None] and result['pagesFreed'] > 0
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'operator_call_data'").fetchone()[0] > 0
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] < free_pages
+    status = service.get_status()
+    assert status['pendingRows'] == {} and status['analyzeRuns'] == 1
+
+    busy = DatabaseMaintenanceService(idle_seconds=3600)
+    busy.record_write_activity(None, 10)
+    assert busy.run_maintenance()['skipped'] and not busy.run_maintenance(force=True)['skipped']
+
+    with service._maintenance_lock:
+        with pytest.raises(DatabaseMaintenanceServiceError):
+            service.run_maintenance()
+
+
+def test_size_report():
+    """Valida el reporte de tamaño de tablas e índices"""
+    mission_ids = _setup_missions()
+    MissionShardService().shard_mission(mission_ids[0])
+    report = DatabaseMaintenanceService().get_size_report()
+
+    assert [report_file['missionId'] for report_file in report['files']] == [None, mission_ids[0]]
+    assert report['totalBytes'] == sum(report_file['fileBytes'] for report_file in report['files'])
+    for report_file in report['files']:
+        objects = {obj['name']: obj for obj in report_file['objects']}
+        calls = objects['operator_call_data']
+        assert calls['type'] == 'table' and calls['pages'] > 1 and calls['bytes'] == calls['pages'] * report_file['pageSize']
+        assert 0 <= calls['fragmentationPercent'] <= 100 and calls['unusedBytes'] < calls['bytes']
+        index = objects['idx_calls_objetivo_mission']
+        assert index['type'] == 'index' and index['table'] == 'operator_call_data'
+        assert sum(obj['pages'] for obj in report_file['objects']) + report_file['freePages'] <= report_file['pageCount']
+
+    quick = DatabaseMaintenanceService().get_size_report(include_fragmentation=False)
+    assert all(obj['fragmentationPercent'] is None for obj in quick['files'][0]['objects'])
+
+
+def test_auto_vacuum_conversion():
+    """Valida la conversión única a auto_vacuum=INCREMENTAL de archivos anteriores"""
+    mission_ids = _setup_missions()
+    MissionShardService().shard_mission(mission_ids[0])
+    for key in (None, mission_ids[0]):
+        with get_db_connection(key) as conn:
+            conn.execute("PRAGMA main.auto_vacuum = NONE")
+            conn.execute("VACUUM main")
+            assert conn.execute("PRAGMA main.auto_vacuum").fetchone()[0] == 0
+
+    service = DatabaseMaintenanceService(idle_seconds=0)
+    assert service.run_maintenance()['converted'] == []
+    assert all(report['autoVacuum'] == 0 for report in service.get_size_report(False)['files'])
+
+    result = service.run_maintenance(convert_auto_vacuum=True)
+    assert result['converted'] == [None, mission_ids[0]]
+    assert all(report['autoVacuum'] == 2 for report in service.get_size_report(False)['files'])
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM operator_call_data").fetchone()[0] > 0
+
+    # Ya convertidos: no se repite el VACUUM y las páginas libres se devuelven
+    assert service.run_maintenance(convert_auto_vacuum=True)['converted'] == []
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM operator_call_data")
+        conn.commit()
+    assert service.run_maintenance()['pagesFreed'] > 0
+
+if __name__ == "__main__":
+    tests = [
+        test_expected_indexes_are_created_once,
+        test_analyze_after_large_writes_and_idle_vacuum,
+        test_size_report,
+        test_auto_vacuum_conversion,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
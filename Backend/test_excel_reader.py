@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Capa de Lectura Excel
+======================================
+
+Valida utils.excel_reader:
+1. El resultado coincide con pd.read_excel (tipos, vacíos, encabezados duplicados)
+2. La proyección de columnas ignora mayúsculas y espacios
+3. La lectura por bloques recorre la pestaña completa
+4. La selección de motor rechaza motores desconocidos
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import io
+import os
+import sys
+from datetime import datetime
+
+import openpyxl
+import pandas as pd
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.excel_reader import (
+    select_excel_engine, list_excel_sheets, read_excel_sheet, read_excel_sheets, iter_excel_chunks
+)
+
+
+def _build_workbook() -> bytes:
+    """Libro con dos pestañas, filas vacías intermedias/finales y encabezado duplicado"""
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = 'Llamadas'
+    worksheet.append(['NUMERO A', 'CELDA', 'NUMERO A', None, 'FECHA'])
+    for i in range(25):
+        worksheet.append([3001234567 + i, None if i % 4 == 0 else f"C{i}", 12.0 + i,
+                          None, datetime(2024, 1, 1, 10, i)])
+        if i == 10:
+            worksheet.append([None] * 5)
+    worksheet.append([None] * 6)
+
+    second = workbook.create_sheet('Datos')
+    second.append([' Numero ', 'Lac ', 'Extra'])
+    second.append(['573001', 2.5, 'x'])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_read_matches_pandas():
+    """Valida paridad con pd.read_excel con y sin dtype=str"""
+    print("=== TEST: LECTURA EXCEL POR MOTOR ===")
+    file_bytes = _build_workbook()
+
+    for kwargs in ({}, {'dtype': str, 'na_filter': False}):
+        for sheet_name in (None, 'Datos'):
+            expected = pd.read_excel(io.BytesIO(file_bytes), sheet_name=sheet_name or 0, **kwargs)
+            result = read_excel_sheet(file_bytes, sheet_name=sheet_name, engine='openpyxl', **kwargs)
+            pd.testing.assert_frame_equal(result, expected)
+
+    sheets = dict(read_excel_sheets(file_bytes, engine='openpyxl'))
+    assert list(sheets) == list_excel_sheets(file_bytes) == ['Llamadas', 'Datos']
+    assert len(sheets['Llamadas']) == 26
+
+
+def test_column_projection_and_chunks():
+    """Valida la proyección de columnas y la lectura por bloques"""
+    file_bytes = _build_workbook()
+
+    projected = read_excel_sheet(file_bytes, 'Datos', columns=['NUMERO', 'lac'], dtype=str, na_filter=False)
+    assert list(projected.columns) == [' Numero ', 'Lac ']
+    assert projected.iloc[0].tolist() == ['573001', '2.5']
+
+    full = read_excel_sheet(file_bytes, columns=['celda', 'fecha'])
+    chunks = list(iter_excel_chunks(file_bytes, columns=['celda', 'fecha'], chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 6]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+
+
+def test_engine_selection():
+    """Valida el motor por defecto y el rechazo de motores no soportados"""
+    assert select_excel_engine() in ('calamine', 'openpyxl')
+    assert select_excel_engine('pandas') == 'pandas'
+    with pytest.raises(ValueError):
+        select_excel_engine('xlsxwriter')
+
+
+if __name__ == "__main__":
+    tests = [
+        test_read_matches_pandas,
+        test_column_projection_and_chunks,
+        test_engine_selection,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
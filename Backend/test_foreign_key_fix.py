@@ -61,17 +61,17 @@ def test_foreign_key_fix():
     processor = FileProcessorService()
     
     try:
-        result = processor._process_claro_cellular_chunk(
-            test_data, test_file_id, mission_id, 1
+        result = processor.process_claro_data_por_celda(
+            test_data.to_csv(index=False, sep=';').encode('utf-8'), "test_fix.csv", test_file_id, mission_id
         )
         
         if result.get('success'):
-            print(f"SUCCESS: Chunk procesado exitosamente")
+            print(f"SUCCESS: Archivo procesado exitosamente")
             print(f"   Registros procesados: {result.get('records_processed', 0)}")
             print(f"   Registros fallidos: {result.get('records_failed', 0)}")
             
             # Verificar que se insertaron datos
-            with get_db_connection() as conn:
+            with get_db_connection(mission_id) as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM operator_cellular_data WHERE file_upload_id = ?", 
                               (test_file_id,))
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Adaptadores de Carga por Operador
+==================================================
+
+Valida el núcleo común de carga y sus adaptadores declarativos:
+1. Las reglas de limpieza del adaptador TIGO (columnas, decimales con coma,
+   numéricos, filas sin datos críticos) y el error por columnas faltantes
+2. La escritura por lotes: un lote con un duplicado se reintenta fila a fila
+   y solo ese registro queda fuera, sin perder los demás
+3. Un formato nuevo registrado como adaptador se procesa con el mismo núcleo
+   en XLSX multi-pestaña y en CSV, con métricas de carga
+4. TIGO en CSV y en XLSX guarda los mismos registros
+5. El escritor deja de escribir cuando los errores de un lote superan el tope
+6. CLARO llamadas usa el núcleo: la validación vectorizada descarta los
+   registros inválidos y los duplicados cuentan como fallidos
+7. CLARO datos por celda se guarda en operator_cellular_data, la tasa de
+   éxito mínima marca la carga como fallida y el tope de errores la aborta
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import dataclasses
+import io
+import json
+import os
+import sys
+
+import openpyxl
+import pandas as pd
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import get_db_connection
+import services.parallel_sheet_processor as parallel_module
+from services.file_processor_service import FileProcessorService
+from services.operator_ingestion_adapters import (
+    IngestionAdapter, INGESTION_ADAPTERS, CALL_DATA_INSERT_SQL, CELLULAR_DATA_INSERT_SQL,
+    get_ingestion_adapter, register_ingestion_adapter
+)
+from test_operator_specific_codec import _prepared_rows
+from test_parallel_sheet_processing import _build_tigo_workbook, _create_upload, _stored_rows, TIGO_ROWS_PER_SHEET
+
+DEMO_ADAPTER = IngestionAdapter(
+    operator='WOM',
+    file_type='DEMO_DATA',
+    label='WOM demo',
+    insert_sql=CELLULAR_DATA_INSERT_SQL,
+    params_builder='_build_demo_params',
+    column_mapping={'NUMERO': 'numero', 'INICIO': 'inicio', 'CELDA': 'celda', 'LAT': 'latitud', 'BYTES': 'bytes'},
+    required_columns=('numero', 'inicio', 'celda'),
+    dropna_columns=('numero',),
+    decimal_comma_columns=('latitud',),
+    numeric_columns=('bytes',),
+    sheet_metadata_columns={'hoja': 'sheet_name'}
+)
+
+
+class DemoFileProcessor(FileProcessorService):
+    """Procesador con el método de parámetros del adaptador de prueba"""
+
+    def _build_demo_params(self, row_data, connection_type, file_upload_id, mission_id):
+        if row_data['celda'] == 'X':
+            return None
+        return (
+            file_upload_id, mission_id, 'WOM', str(row_data['numero']), row_data['inicio'], None, 0,
+            str(row_data['celda']), '', int(row_data['bytes']), 0, row_data['latitud'], None, '4G',
+            connection_type, json.dumps({'hoja': row_data.get('hoja')}),
+            f"{row_data['numero']}-{row_data['inicio']}"
+        )
+
+
+def _demo_rows(offset: int) -> list:
+    """Filas del formato de prueba: una sin número, una sin normalizar y una duplicada"""
+    rows = [[3001000000 + offset + i, f"2024-03-0{i % 9 + 1} 10:00:00", 2000 + i, '4,5', '' if i % 2 else i * 10]
+            for i in range(20)]
+    rows.append([None, '2024-03-01 10:00:00', 1, '4,5', 1])
+    rows.append([3009999999, '2024-03-01 10:00:00', 'X', '4,5', 1])
+    rows.append(list(rows[0]))
+    return rows
+
+
+def _run(process, file_bytes: bytes, file_name: str, operator: str, file_type: str) -> tuple:
+    """Ejecuta un procesador sin pool y retorna (resultado, file_upload_id)"""
+    file_upload_id, mission_id = _create_upload(operator, file_type)
+    original = parallel_module.PARALLEL_SHEET_MAX_WORKERS
+    parallel_module.PARALLEL_SHEET_MAX_WORKERS = 1
+    try:
+        return process(file_bytes, file_name, file_upload_id, mission_id), file_upload_id
+    finally:
+        parallel_module.PARALLEL_SHEET_MAX_WORKERS = original
+
+
+def test_tigo_cleaning_rules():
+    """Valida las reglas de limpieza declarativas del adaptador TIGO"""
+    print("=== TEST: ADAPTADORES DE CARGA ===")
+    adapter = get_ingestion_adapter('tigo', 'call_data')
+    df = pd.DataFrame({
+        ' NUMERO A ': ['3001', None, '3003'],
+        'TIPO_DE_LLAMADA': ['1', '1', '1'],
+        'DIRECCION: O SALIENTE, I ENTRANTE': ['O', 'I', None],
+        'FECHA Y HORA ORIGEN': ['01/03/2024 10:00:00'] * 3,
+        'DURACION TOTAL seg': ['15', 'x', '7'],
+        'LATITUDE': ['4,6', '"4,7"', ''],
+        'POTENCIA': ['43,5', 'nan', '1'],
+    })
+
+    df_clean, error = FileProcessorService()._clean_with_adapter(adapter, df)
+    assert error is None
+    assert list(df_clean['numero_a']) == ['3001']
+    row = df_clean.iloc[0]
+    assert row['latitud'] == 4.6 and row['potencia'] == 43.5 and row['duracion_total_seg'] == 15
+
+    df_clean, error = FileProcessorService()._clean_with_adapter(adapter, df.drop(columns=['TIPO_DE_LLAMADA']))
+    assert df_clean is None and error == 'Campos requeridos faltantes: tipo_de_llamada'
+
+
+def test_batch_with_duplicate_falls_back_to_rows():
+    """Valida que un lote con un duplicado solo pierde ese registro"""
+    file_upload_id, mission_id = _create_upload('TIGO', 'CALL_DATA')
+    rows = _prepared_rows(file_upload_id, mission_id, [json.dumps({'i': i}) for i in range(30)])
+    # El registro 25 repite el record_hash del 5
+    rows[25] = (rows[25][0][:20] + (rows[5][0][20],) + rows[25][0][21:], rows[25][1])
+
+    processor = FileProcessorService()
+    processor.CHUNK_SIZE = 10
+    written = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {'sheet_name': 'Hoja1', 'rows': rows},
+                                             file_upload_id, mission_id)
+    assert written['records_processed'] == 29 and written['records_duplicated'] == 1
+    assert written['batches'] == 3 and written['row_fallback_batches'] == 1
+    assert written['validation_failed'] == written['other_errors'] == 0
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM operator_call_data WHERE file_upload_id = ?",
+                            (file_upload_id,)).fetchone()[0] == 29
+
+
+def test_registered_adapter_uses_shared_core():
+    """Valida que un formato nuevo registrado se procesa en XLSX y CSV"""
+    register_ingestion_adapter(DEMO_ADAPTER)
+    try:
+        assert get_ingestion_adapter('wom', 'demo_data') is DEMO_ADAPTER
+        header = ['NUMERO', 'INICIO', 'CELDA', 'LAT', 'BYTES']
+
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+        for sheet in range(2):
+            worksheet = workbook.create_sheet(f"Datos{sheet + 1}")
+            worksheet.append(header)
+            for row in _demo_rows(sheet * 100):
+                worksheet.append(row)
+        workbook.create_sheet('Vacia').append(header)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        process = DemoFileProcessor().process_with_adapter
+        result, _ = _run(lambda *args: process(DEMO_ADAPTER, *args), buffer.getvalue(),
+                         'demo.xlsx', 'WOM', 'CELLULAR_DATA')
+        assert result['success'], result
+        # Por pestaña: 20 válidos, 1 sin número (descartado), 1 sin normalizar, 1 duplicado
+        assert result['records_processed'] == 40
+        assert result['records_duplicated'] == 2 and result['records_failed'] == 2
+        details = result['details']
+        assert details['sheets_combined'] == 2 and details['sheet_processing_summary']['empty_sheets'] == 1
+        metrics = details['ingestion_metrics']
+        assert metrics['write_batches'] == 2 and metrics['row_fallback_batches'] == 2
+        assert metrics['records_per_second'] > 0
+
+        stored = _stored_rows('operator_cellular_data', 'numero_telefono, trafico_subida_bytes, latitud, '
+                                                        'tipo_conexion, operator_specific_data')
+        assert len(stored) == 40
+        assert all(row[2] == 4.5 and row[3] == 'DATOS' for row in stored)
+        assert {json.loads(row[4])['hoja'] for row in stored} == {'Datos1', 'Datos2'}
+        # BYTES vacío queda en 0
+        assert sorted(row[1] for row in stored) == sorted(2 * ([0] * 10 + list(range(0, 200, 20))))
+
+        csv_bytes = pd.DataFrame(_demo_rows(0), columns=header).to_csv(index=False).encode('utf-8')
+        result, _ = _run(lambda *args: process(DEMO_ADAPTER, *args), csv_bytes, 'demo.csv', 'WOM', 'CELLULAR_DATA')
+        assert result['success'] and result['records_processed'] == 20, result
+        assert 'sheet_processing_summary' not in result['details']
+
+        result, _ = _run(lambda *args: process(DEMO_ADAPTER, *args), b'NUMERO,INICIO\n1,2\n', 'demo.csv',
+                         'WOM', 'CELLULAR_DATA')
+        assert not result['success'] and 'celda' in result['error']
+    finally:
+        INGESTION_ADAPTERS.pop(('WOM', 'DEMO_DATA'), None)
+
+
+def test_tigo_csv_matches_excel():
+    """Valida que TIGO guarda los mismos registros desde CSV y desde XLSX"""
+    file_bytes = _build_tigo_workbook()
+    workbook = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True)
+    frames = [pd.DataFrame(rows[1:], columns=rows[0])
+              for rows in (list(workbook[name].iter_rows(values_only=True)) for name in workbook.sheetnames)]
+    csv_bytes = pd.concat(frames).to_csv(index=False).encode('utf-8')
+    columns = "tipo_llamada, numero_origen, numero_destino, fecha_hora_llamada, duracion_segundos, celda_origen"
+
+    excel, _ = _run(FileProcessorService().process_tigo_llamadas_unificadas, file_bytes, 'tigo.xlsx', 'TIGO', 'CALL_DATA')
+    excel_rows = _stored_rows('operator_call_data', columns + ', operator_specific_data')
+    csv, _ = _run(FileProcessorService().process_tigo_llamadas_unificadas, csv_bytes, 'tigo.csv', 'TIGO', 'CALL_DATA')
+    csv_rows = _stored_rows('operator_call_data', columns + ', operator_specific_data')
+
+    assert excel['records_processed'] == csv['records_processed'] == 3 * TIGO_ROWS_PER_SHEET
+    assert csv['details']['entrantes_processed'] == excel['details']['entrantes_processed'] > 0
+    assert [row[:6] for row in csv_rows] == [row[:6] for row in excel_rows]
+
+
+def test_write_stops_after_error_cap():
+    """Valida que el tope de errores se verifica después de cada lote"""
+    file_upload_id, mission_id = _create_upload('TIGO', 'CALL_DATA')
+    rows = _prepared_rows(file_upload_id, mission_id, [json.dumps({'i': i}) for i in range(30)])
+    # Los registros 4, 5 y 16 no cumplen el CHECK de numero_origen
+    for index in (3, 4, 15):
+        params = list(rows[index][0])
+        params[4] = 'abc'
+        rows[index] = (tuple(params), rows[index][1])
+
+    processor = FileProcessorService()
+    processor.CHUNK_SIZE = 10
+    written = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {'sheet_name': 'Hoja1', 'rows': rows},
+                                             file_upload_id, mission_id, max_failures=1)
+    assert written['aborted'] and written['batches'] == 1
+    assert written['records_processed'] == 8 and written['validation_failed'] == 2
+
+
+def _processing_status(file_upload_id: str) -> tuple:
+    """Estado final y contadores del archivo en operator_data_sheets"""
+    with get_db_connection() as conn:
+        return conn.execute(
+            "SELECT processing_status, records_processed, records_failed FROM operator_data_sheets WHERE id = ?",
+            (file_upload_id,)
+        ).fetchone()
+
+
+def test_claro_calls_use_shared_core():
+    """Valida CLARO llamadas entrantes con la validación vectorizada del núcleo"""
+    calls = pd.DataFrame({
+        'celda_inicio_llamada': ['12345'] * 5,
+        'celda_final_llamada': ['67890', '67890', 'AB', '67890', '67890'],
+        'originador': ['3104277553', '3104277554', '3104277555', '3104277556', '3104277553'],
+        'receptor': ['3224274851'] * 5,
+        'fecha_hora': ['12/08/2024 23:13:20', '12/08/2024 23:14:20', '12/08/2024 23:15:20',
+                       '12/08/2024 23:16:20', '12/08/2024 23:13:20'],
+        'duracion': ['120', '60', '30', '-5', '120'],
+        'tipo': ['CDR_ENTRANTE'] * 5
+    })
+    result, file_upload_id = _run(FileProcessorService().process_claro_llamadas_entrantes,
+                                  calls.to_csv(index=False).encode('utf-8'), 'claro.csv', 'CLARO', 'CALL_DATA')
+    # Celda no numérica y duración negativa se descartan; el último registro repite el primero
+    assert result['success'] and result['records_processed'] == 2, result
+    assert result['records_validation_failed'] == 2 and result['records_duplicated'] == 1
+    assert result['records_failed'] == 3
+    assert [(record['row'], record['errors']) for record in result['failed_records']] == [
+        (3, ['Celda final no numérica']), (4, ['Duración no puede ser negativa'])
+    ]
+    assert _processing_status(file_upload_id) == ('COMPLETED', 2, 3)
+
+    stored = _stored_rows('operator_call_data', 'tipo_llamada, numero_origen, numero_objetivo, operator_specific_data')
+    assert [row[:3] for row in stored] == [('ENTRANTE', '3104277553', '3224274851'),
+                                           ('ENTRANTE', '3104277554', '3224274851')]
+
+
+def test_claro_cellular_success_rate_and_error_cap():
+    """Valida la tasa de éxito mínima y el tope de errores de CLARO datos por celda"""
+    header = ['numero', 'fecha_trafico', 'tipo_cdr', 'celda_decimal', 'lac_decimal']
+    rows = [[f"57300100000{i}", f"2024041908000{i}", 'DATOS', str(175000 + i), '100'] for i in range(4)]
+    rows.append(['12', '20240419080000', 'DATOS', '1', '1'])
+    csv_bytes = pd.DataFrame(rows, columns=header).to_csv(index=False, sep=';').encode('utf-8')
+
+    result, file_upload_id = _run(FileProcessorService().process_claro_data_por_celda, csv_bytes,
+                                  'claro.csv', 'CLARO', 'CELLULAR_DATA')
+    assert result['success'] and result['success_rate'] == 80.0, result
+    assert _processing_status(file_upload_id) == ('COMPLETED', 4, 1)
+    stored = _stored_rows('operator_cellular_data', 'numero_telefono, tipo_conexion, operator_specific_data')
+    assert [row[:2] for row in stored] == [(f"300100000{i}", 'DATOS') for i in range(4)]
+
+    # 3 de 5 válidos: 60% queda bajo el 80% exigido
+    low_rate = pd.DataFrame(rows[:3] + [rows[4], [*rows[4][:3], 'X', '1']], columns=header)
+    result, file_upload_id = _run(FileProcessorService().process_claro_data_por_celda,
+                                  low_rate.to_csv(index=False, sep=';').encode('utf-8'),
+                                  'claro.csv', 'CLARO', 'CELLULAR_DATA')
+    assert not result['success'] and result['error'].startswith('Tasa de éxito baja (60.0%)'), result
+    assert _processing_status(file_upload_id) == ('FAILED', 3, 2)
+
+    capped = dataclasses.replace(get_ingestion_adapter('CLARO', 'CELLULAR_DATA'), max_failed_records=1)
+    process = FileProcessorService().process_with_adapter
+    result, file_upload_id = _run(lambda *args: process(capped, *args),
+                                  low_rate.to_csv(index=False, sep=';').encode('utf-8'),
+                                  'claro.csv', 'CLARO', 'CELLULAR_DATA')
+    assert not result['success'] and result['records_processed'] == 0, result
+    assert result['error'] == 'Demasiados errores en el archivo (2). Verifique el formato.'
+    assert _processing_status(file_upload_id)[0] == 'FAILED'
+
+
+if __name__ == "__main__":
+    tests = [
+        test_tigo_cleaning_rules,
+        test_batch_with_duplicate_falls_back_to_rows,
+        test_registered_adapter_uses_shared_core,
+        test_tigo_csv_matches_excel,
+        test_write_stops_after_error_cap,
+        test_claro_calls_use_shared_core,
+        test_claro_cellular_success_rate_and_error_cap,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
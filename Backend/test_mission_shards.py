@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Almacenamiento por Misión
+==========================================
+
+Valida el almacenamiento de los datos masivos de una misión en su archivo
+propio (database/mission_shards.py y services/mission_shard_service.py):
+1. El DDL del fragmento no conserva claves foráneas
+2. Migrar una misión mueve sus filas fuera de kronos.db y las consultas de
+   correlación, interacciones, hojas de operador, búsqueda de números e
+   índice espacial retornan lo mismo antes y después
+3. Las escrituras por la conexión enrutada llegan al archivo de la misión y
+   los triggers TEMP mantienen el índice de números
+4. Devolver la misión a kronos.db conserva los datos y elimina el archivo
+5. Eliminar una misión fragmentada elimina su archivo
+6. El listado de misiones y el análisis leen los datos celulares del archivo
+   de la misión
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import populate_mission
+from database.connection import init_database, get_database_manager, get_db_connection
+from database.mission_shards import SHARDED_TABLES, _without_foreign_keys
+from services.correlation_service_fixed import CorrelationServiceFixed
+from services.mission_shard_service import MissionShardService, MissionShardServiceError
+from services.number_search_index_service import NumberSearchIndexService
+from services.operator_data_service import get_operator_sheet_data
+from services.spatial_index_service import SpatialIndexService
+from testing.operator_fixtures import apply_operator_schema
+
+PERIOD = ('2024-03-01 00:00:00', '2024-03-31 23:59:59')
+
+
+def _setup_mission() -> tuple:
+    """BD temporal con una misión poblada, índice de números e índice espacial"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls=1500, hunter_cells=20, seed=11)
+        file_upload_id = conn.execute(
+            "SELECT id FROM operator_data_sheets WHERE mission_id = ?", (mission_id,)
+        ).fetchone()[0]
+    NumberSearchIndexService().ensure_index()
+    SpatialIndexService().ensure_spatial_indexes()
+    return mission_id, file_upload_id
+
+
+def _mission_counts(mission_id: str) -> dict:
+    """Registros de la misión en kronos.db"""
+    with get_db_connection() as conn:
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table} WHERE mission_id = ?", (mission_id,)).fetchone()[0]
+            for table in SHARDED_TABLES
+        }
+
+
+def _query_results(mission_id: str, file_upload_id: str) -> dict:
+    """Resultados de las consultas de análisis de la misión"""
+    from main import get_call_interactions
+
+    correlation = CorrelationServiceFixed().analyze_correlation(mission_id, *PERIOD, 1)
+    sheet = get_operator_sheet_data(file_upload_id, page_size=5000, sort_by='id')
+    search = NumberSearchIndexService().search_number('3000000000', mission_id=mission_id)
+    nearby = SpatialIndexService().find_within_radius('cellular_data', 4.6, -74.0, 500, mission_id=mission_id)
+    return {
+        'correlation': sorted((r['targetNumber'], r['totalCalls'], r['confidence']) for r in correlation['data']),
+        'interactions': get_call_interactions(mission_id, '3000000000', *PERIOD),
+        'sheet': (sheet['total'], sheet['data']),
+        'search': [(e['operator'], e['firstSeen'], e['lastSeen'], e['callCount'], e['cells']) for e in search['data']],
+        'nearby': sorted(r['id'] for r in nearby['data'])
+    }
+
+
+def test_shard_ddl_has_no_foreign_keys():
+    """Valida que el DDL del fragmento no referencia tablas de kronos.db"""
+    print("=== TEST: ALMACENAMIENTO POR MISIÓN ===")
+    sql = _without_foreign_keys("""
+        CREATE TABLE t (
+            id INTEGER PRIMARY KEY,
+            mission_id TEXT NOT NULL REFERENCES missions(id) ON DELETE CASCADE, -- misión
+            file_upload_id TEXT NOT NULL,
+            CONSTRAINT fk_file FOREIGN KEY (file_upload_id) REFERENCES operator_data_sheets(id)
+                ON DELETE CASCADE ON UPDATE NO ACTION,
+            CHECK (id > 0)
+        )
+    """)
+    assert 'REFERENCES' not in sql.upper() and 'FOREIGN' not in sql.upper()
+    assert 'mission_id TEXT NOT NULL' in sql and 'CHECK (id > 0)' in sql
+
+
+def test_shard_and_unshard_round_trip():
+    """Valida la migración de ida y vuelta y el enrutamiento de las consultas"""
+    mission_id, file_upload_id = _setup_mission()
+    service = MissionShardService()
+    db_manager = get_database_manager()
+    before_counts = _mission_counts(mission_id)
+    before = _query_results(mission_id, file_upload_id)
+    assert before['correlation'] and before['interactions'] and before['search'] and before['nearby']
+
+    result = service.shard_mission(mission_id)
+    assert result['rowsMoved'] == {**before_counts, 'operator_specific_fields': 0}
+    assert db_manager.is_mission_sharded(mission_id)
+    assert _mission_counts(mission_id) == {table: 0 for table in SHARDED_TABLES}
+    with pytest.raises(MissionShardServiceError):
+        service.shard_mission(mission_id)
+
+    shard = service.get_status()['shards'][0]
+    assert shard['missionId'] == mission_id and shard['exists'] and shard['sizeBytes'] > 0
+    shard_path = os.path.join(os.path.dirname(db_manager.db_path), 'mission_shards', shard['shardFile'])
+    with get_db_connection(mission_id) as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM operator_call_data WHERE mission_id = ?", (mission_id,)
+        ).fetchone()[0] == before_counts['operator_call_data']
+        assert not conn.execute("PRAGMA foreign_key_list(operator_call_data)").fetchall()
+        assert not conn.execute(
+            "SELECT 1 FROM sqlite_temp_master WHERE name LIKE 'trg_spatial_%'"
+        ).fetchone()
+    assert _query_results(mission_id, file_upload_id) == before
+
+    # Escritura enrutada: el índice de números se actualiza por los triggers TEMP
+    with get_db_connection(mission_id) as conn:
+        conn.execute("""
+            INSERT INTO operator_call_data (
+                file_upload_id, mission_id, operator, tipo_llamada, numero_origen, numero_destino,
+                numero_objetivo, fecha_hora_llamada, celda_objetivo, duracion_segundos, record_hash
+            ) VALUES (?, ?, 'CLARO', 'SALIENTE', '3105550000', '3000000000', '3105550000',
+                      '2025-01-01 10:00:00', '777', 5, ?)
+        """, (file_upload_id, mission_id, uuid.uuid4().hex))
+        conn.commit()
+    search = NumberSearchIndexService().search_number('3105550000', mission_id=mission_id)
+    assert [(e['callCount'], e['lastSeen']) for e in search['data']] == [(1, '2025-01-01 10:00:00')]
+    assert os.path.getsize(shard_path) > 0
+    assert _mission_counts(mission_id)['operator_call_data'] == 0
+
+    with get_db_connection(mission_id) as conn:
+        conn.execute("DELETE FROM operator_call_data WHERE numero_origen = '3105550000'")
+        conn.commit()
+    assert NumberSearchIndexService().search_number('3105550000', mission_id=mission_id)['data'] == []
+    assert NumberSearchIndexService().rebuild_index() > 0
+    assert _query_results(mission_id, file_upload_id) == before
+
+    result = service.unshard_mission(mission_id)
+    assert result['rowsMoved']['operator_call_data'] == before_counts['operator_call_data']
+    assert result['renumberedTables'] == []
+    assert not db_manager.is_mission_sharded(mission_id) and not os.path.exists(shard_path)
+    assert _mission_counts(mission_id) == before_counts
+    assert _query_results(mission_id, file_upload_id) == before
+    with pytest.raises(MissionShardServiceError):
+        service.unshard_mission(mission_id)
+
+
+def test_mission_list_and_analysis_read_shard():
+    """Valida get_all_missions y el análisis sobre una misión fragmentada"""
+    from services.analysis_service import AnalysisService
+    from services.mission_service import MissionService
+
+    mission_id, _ = _setup_mission()
+    mission_service = MissionService()
+    analysis_service = AnalysisService()
+
+    def _mission_view() -> tuple:
+        mission = next(m for m in mission_service.get_all_missions() if m['id'] == mission_id)
+        return (sorted(record['id'] for record in mission['cellularData']),
+                analysis_service.get_analysis_stats(mission_id))
+
+    before = _mission_view()
+    assert len(before[0]) == _mission_counts(mission_id)['cellular_data'] > 0
+    assert before[1]['cellularRecordsAvailable'] == len(before[0])
+
+    MissionShardService().shard_mission(mission_id)
+    assert _mission_view() == before
+    assert mission_service.update_mission(mission_id, {'name': 'Misión fragmentada'})['cellularData']
+    assert analysis_service.run_analysis(mission_id) == []
+    assert analysis_service.get_analysis_stats(mission_id)['analysisStatus'] == 'ready'
+
+
+def test_delete_sharded_mission_removes_file():
+    """Valida que eliminar una misión fragmentada elimina su archivo"""
+    from services.mission_service import MissionService
+
+    mission_id, _ = _setup_mission()
+    service = MissionShardService(storage_mode='sharded')
+    service.shard_mission(mission_id)
+    shard_file = service.get_status()['shards'][0]['shardFile']
+    shard_path = os.path.join(os.path.dirname(get_database_manager().db_path), 'mission_shards', shard_file)
+    assert os.path.exists(shard_path)
+
+    MissionService().delete_mission(mission_id)
+    assert not os.path.exists(shard_path)
+    assert service.get_status()['shards'] == []
+    assert MissionShardService(storage_mode='invalido').storage_mode == 'shared'
+
+
+if __name__ == "__main__":
+    tests = [
+        test_shard_ddl_has_no_foreign_keys,
+        test_shard_and_unshard_round_trip,
+        test_mission_list_and_analysis_read_shard,
+        test_delete_sharded_mission_removes_file,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Listado Liviano y Paginado de Misiones
+=======================================================
+
+Valida que el listado de misiones no cargue datos celulares:
+1. get_missions_summary retorna conteos calculados con COUNT
+2. Paginación y búsqueda por código/nombre
+3. get_mission_cellular_data pagina los registros SCANHUNTER bajo demanda
+4. Mission.get_stats no materializa la relación cellular_data
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager
+from database.models import Mission, CellularData
+from services.mission_service import MissionService, MissionServiceError
+
+
+def _setup_database():
+    """Crea una BD temporal con misiones y datos celulares de prueba"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+
+    with get_database_manager().get_session() as session:
+        # Eliminar misiones de ejemplo para tener conteos deterministas
+        session.query(Mission).delete()
+        for i in range(12):
+            session.add(Mission(
+                id=f'mt{i}', code=f'TST-{i:03d}', name=f'Mision Prueba {i}',
+                description='Mision para pruebas de paginacion',
+                status='En Progreso', start_date='2025-01-01'
+            ))
+        session.flush()
+
+        for i in range(25):
+            session.add(CellularData(
+                mission_id='mt0', file_record_id=i + 1, punto=f'P{i}',
+                lat=4.6 + i * 0.001, lon=-74.08, mnc_mcc='732101',
+                operator='CLARO', rssi=-70, tecnologia='LTE', cell_id=str(1000 + i)
+            ))
+        session.commit()
+
+    service = MissionService()
+    service.db_manager = get_database_manager()
+    return service
+
+
+def test_missions_summary_counts_and_pagination():
+    """Valida conteos agregados y paginación del listado"""
+    print("=== TEST: LISTADO LIVIANO DE MISIONES ===")
+    service = _setup_database()
+
+    first_page = service.get_missions_summary(page=1, page_size=5)
+    assert first_page['total'] == 12
+    assert len(first_page['data']) == 5
+    assert first_page['hasMore'] is True
+
+    last_page = service.get_missions_summary(page=3, page_size=5)
+    assert len(last_page['data']) == 2
+    assert last_page['hasMore'] is False
+
+    all_missions = service.get_missions_summary(page=1, page_size=50)['data']
+    by_id = {m['id']: m for m in all_missions}
+    assert by_id['mt0']['cellularRecordsCount'] == 25
+    assert by_id['mt1']['cellularRecordsCount'] == 0
+    assert all('cellularData' not in m for m in all_missions)
+    print(f"  Misiones: {first_page['total']}, conteo mt0: {by_id['mt0']['cellularRecordsCount']}")
+
+
+def test_missions_summary_search():
+    """Valida la búsqueda por código y nombre"""
+    service = _setup_database()
+
+    result = service.get_missions_summary(search='TST-011')
+    assert result['total'] == 1
+    assert result['data'][0]['id'] == 'mt11'
+
+    result = service.get_missions_summary(search='prueba 1')
+    assert {m['id'] for m in result['data']} == {'mt1', 'mt10', 'mt11'}
+
+
+def test_mission_cellular_data_on_demand():
+    """Valida la paginación de datos celulares bajo demanda"""
+    service = _setup_database()
+
+    page_1 = service.get_mission_cellular_data('mt0', page=1, page_size=10)
+    page_3 = service.get_mission_cellular_data('mt0', page=3, page_size=10)
+    assert page_1['total'] == 25
+    assert [r['fileRecordId'] for r in page_1['data']] == list(range(1, 11))
+    assert len(page_3['data']) == 5
+    assert page_3['hasMore'] is False
+
+    try:
+        service.get_mission_cellular_data('no-existe')
+        assert False, "Debe fallar con misión inexistente"
+    except MissionServiceError:
+        pass
+
+
+def test_mission_get_stats_uses_counts():
+    """Valida que get_stats no cargue la relación cellular_data"""
+    _setup_database()
+
+    with get_database_manager().get_session() as session:
+        mission = session.query(Mission).filter(Mission.id == 'mt0').first()
+        stats = mission.get_stats()
+        assert stats['cellularRecordsCount'] == 25
+        assert 'cellular_data' not in mission.__dict__
+
+
+if __name__ == "__main__":
+    tests = [
+        test_missions_summary_counts_and_pagination,
+        test_missions_summary_search,
+        test_mission_cellular_data_on_demand,
+        test_mission_get_stats_uses_counts,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Índice de Búsqueda de Números
+==============================================
+
+Valida NumberSearchIndexService (índice invertido entre misiones):
+1. El índice creado sobre registros existentes coincide con un recorrido
+   completo de operator_call_data y operator_cellular_data (prefijo 57 incluido)
+2. Los triggers mantienen el índice en cargas, actualizaciones y borrados,
+   recalculando primera/última aparición al borrar los extremos
+3. Validación del número buscado y filtro por misión
+4. El núcleo de carga y el borrado por lotes mantienen el índice una vez por
+   lote, sin que los triggers cuenten de nuevo las mismas filas
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import services.bulk_deletion_service as bulk_deletion_module
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.bulk_deletion_service import BulkDeletionService
+from services.file_processor_service import FileProcessorService
+from services.number_search_index_service import (
+    NumberSearchIndexService, NumberSearchIndexServiceError, get_number_search_index_service,
+    normalize_search_number
+)
+from services.operator_ingestion_adapters import CALL_DATA_INSERT_SQL
+from testing.operator_fixtures import apply_operator_schema
+from test_operator_specific_codec import _prepared_rows, _setup_file
+
+NUMBERS = ['3001112233', '573001112233', '3104445566', '3205556677', '6012345678']
+CELLS = ['C100', 'C200', 'C300', ' C400 ', '']
+
+
+def _setup_database() -> list:
+    """BD temporal con el esquema de operadores y dos misiones"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+
+    with get_db_connection() as conn:
+        mission_id, user_id = conn.execute("SELECT id, created_by FROM missions LIMIT 1").fetchone()
+        conn.execute(
+            "INSERT INTO missions (id, code, name, status, start_date, created_by) "
+            "VALUES ('mnum2', 'NUM-002', 'Mision Numeros', 'En Progreso', '2025-01-01', ?)", (user_id,)
+        )
+        conn.commit()
+    return [mission_id, 'mnum2']
+
+
+def _insert_records(missions: list, count: int, seed: int) -> None:
+    """Inserta llamadas y sesiones de datos aleatorias en todas las misiones"""
+    rng = random.Random(seed)
+    with get_db_connection() as conn:
+        for mission_id in missions:
+            file_upload_id = str(uuid.uuid4())
+            conn.execute("""
+                INSERT INTO operator_data_sheets (
+                    id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                    operator, operator_file_format, processing_status, uploaded_by
+                ) VALUES (?, ?, 'archivo.xlsx', 1024, ?, 'CALL_DATA', 'CLARO', 'MULTI', 'COMPLETED', 'admin')
+            """, (file_upload_id, mission_id, uuid.uuid4().hex * 2))
+            for i in range(count):
+                operator = rng.choice(['CLARO', 'TIGO'])
+                origen, destino = rng.choice(NUMBERS), rng.choice(NUMBERS)
+                fecha = f"2024-0{rng.randint(1, 9)}-{rng.randint(10, 28)} {rng.randint(10, 23)}:00:00"
+                conn.execute("""
+                    INSERT INTO operator_call_data (
+                        file_upload_id, mission_id, operator, tipo_llamada, numero_origen,
+                        numero_destino, numero_objetivo, fecha_hora_llamada, duracion_segundos,
+                        celda_origen, celda_destino, record_hash
+                    ) VALUES (?, ?, ?, 'ENTRANTE', ?, ?, ?, ?, 10, ?, ?, ?)
+                """, (file_upload_id, mission_id, operator, origen, destino, destino, fecha,
+                      rng.choice(CELLS + [None]), rng.choice(CELLS), uuid.uuid4().hex))
+                fin = None if i % 4 == 0 else fecha.replace(':00:00', ':30:00')
+                conn.execute("""
+                    INSERT INTO operator_cellular_data (
+                        file_upload_id, mission_id, operator, numero_telefono, fecha_hora_inicio,
+                        fecha_hora_fin, celda_id, tecnologia, tipo_conexion, record_hash
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, 'LTE', 'DATOS', ?)
+                """, (file_upload_id, mission_id, operator, rng.choice(NUMBERS), fecha, fin,
+                      rng.choice(CELLS[:4]), uuid.uuid4().hex))
+        conn.commit()
+
+
+def _expected(number: str) -> list:
+    """Entradas esperadas de un número por recorrido completo de las tablas"""
+    numero = normalize_search_number(number)
+    entries = {}
+
+    def add(row, raw, cell, first, last, counter):
+        if normalize_search_number(raw) != numero:
+            return
+        entry = entries.setdefault((row['mission_id'], row['operator']), {
+            'firstSeen': first, 'lastSeen': last, 'callCount': 0, 'dataCount': 0, 'cells': {}
+        })
+        entry['firstSeen'], entry['lastSeen'] = min(entry['firstSeen'], first), max(entry['lastSeen'], last)
+        entry[counter] += 1
+        if (cell or '').strip():
+            entry['cells'][cell.strip()] = entry['cells'].get(cell.strip(), 0) + 1
+
+    with get_database_manager().get_session() as session:
+        for row in session.execute(text("SELECT * FROM operator_call_data")).mappings():
+            add(row, row['numero_origen'], row['celda_origen'], row['fecha_hora_llamada'],
+                row['fecha_hora_llamada'], 'callCount')
+            if normalize_search_number(row['numero_destino']) != normalize_search_number(row['numero_origen']):
+                add(row, row['numero_destino'], row['celda_destino'], row['fecha_hora_llamada'],
+                    row['fecha_hora_llamada'], 'callCount')
+        for row in session.execute(text("SELECT * FROM operator_cellular_data")).mappings():
+            add(row, row['numero_telefono'], row['celda_id'], row['fecha_hora_inicio'],
+                row['fecha_hora_fin'] or row['fecha_hora_inicio'], 'dataCount')
+
+    return sorted((key, entry['firstSeen'], entry['lastSeen'], entry['callCount'], entry['dataCount'],
+                   sorted(entry['cells'].items())) for key, entry in entries.items())
+
+
+def _actual(service: NumberSearchIndexService, number: str, mission_id: str = None) -> list:
+    result = service.search_number(number, mission_id=mission_id)
+    assert result['total'] == len(result['data'])
+    return sorted(((e['missionId'], e['operator']), e['firstSeen'], e['lastSeen'], e['callCount'],
+                   e['dataCount'], sorted((c['cellId'], c['hits']) for c in e['cells']))
+                  for e in result['data'])
+
+
+def test_index_matches_full_scan():
+    """Valida el índice poblado desde registros existentes"""
+    print("=== TEST: ÍNDICE DE BÚSQUEDA DE NÚMEROS ===")
+    missions = _setup_database()
+    _insert_records(missions, 120, seed=39)
+    service = NumberSearchIndexService()
+
+    assert service.ensure_index() > 0
+    for number in NUMBERS + ['+57 (310) 444-5566', '3999999999']:
+        assert _actual(service, number) == _expected(number), number
+
+    result = service.search_number('573001112233')
+    assert result['numero'] == '3001112233'
+    assert result['totalMissions'] == 2
+    assert {entry['missionCode'] for entry in result['data']} >= {'NUM-002'}
+
+
+def test_triggers_keep_index_in_sync():
+    """Valida el mantenimiento del índice en cargas, actualizaciones y borrados"""
+    missions = _setup_database()
+    service = NumberSearchIndexService()
+    assert service.ensure_index() == 0
+
+    _insert_records(missions, 80, seed=40)
+    for number in NUMBERS:
+        assert _actual(service, number) == _expected(number), number
+
+    with get_db_connection() as conn:
+        # Borrar los extremos de tiempo de un número y actualizar otro registro
+        conn.execute("""
+            DELETE FROM operator_call_data WHERE id IN (
+                SELECT id FROM operator_call_data WHERE numero_origen = '3104445566'
+                ORDER BY fecha_hora_llamada LIMIT 3)
+        """)
+        conn.execute("""
+            DELETE FROM operator_cellular_data WHERE id IN (
+                SELECT id FROM operator_cellular_data WHERE numero_telefono = '3104445566'
+                ORDER BY COALESCE(fecha_hora_fin, fecha_hora_inicio) DESC LIMIT 3)
+        """)
+        conn.execute("""
+            UPDATE operator_call_data SET numero_origen = '3157778899', celda_origen = 'C900'
+            WHERE id = (SELECT MIN(id) FROM operator_call_data)
+        """)
+        conn.commit()
+
+    with get_db_connection() as conn:
+        stale = conn.execute("SELECT COUNT(*) FROM number_search_index WHERE stale = 1").fetchone()[0]
+    assert stale > 0
+    for number in NUMBERS + ['3157778899']:
+        assert _actual(service, number) == _expected(number), number
+
+    # Borrado de todos los registros de una misión
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM operator_call_data WHERE mission_id = ?", (missions[1],))
+        conn.execute("DELETE FROM operator_cellular_data WHERE mission_id = ?", (missions[1],))
+        conn.commit()
+        remaining = conn.execute("SELECT COUNT(*) FROM number_search_cells WHERE mission_id = ?",
+                                 (missions[1],)).fetchone()[0]
+    assert remaining == 0
+    assert _actual(service, NUMBERS[0], mission_id=missions[1]) == []
+    assert _actual(service, NUMBERS[0]) == _expected(NUMBERS[0])
+
+    assert service.rebuild_index() > 0
+    for number in NUMBERS:
+        assert _actual(service, number) == _expected(number), number
+
+
+def test_search_validation():
+    """Valida el rechazo de números demasiado cortos"""
+    _setup_database()
+    service = NumberSearchIndexService()
+
+    with pytest.raises(NumberSearchIndexServiceError):
+        service.search_number('12-34')
+    with pytest.raises(NumberSearchIndexServiceError):
+        service.search_number(None)
+    assert service.search_number('3001112233')['data'] == []
+
+
+def test_batches_keep_index_in_sync():
+    """Valida el mantenimiento por lote en la carga del núcleo y en el borrado por lotes"""
+    missions = _setup_database()
+    service = get_number_search_index_service()
+    service.ensure_index()
+    _insert_records(missions, 30, seed=41)
+
+    file_upload_id = _setup_file(missions[0])
+    rng = random.Random(42)
+    rows = []
+    for params, row_number in _prepared_rows(file_upload_id, missions[0], [json.dumps({'i': i}) for i in range(60)]):
+        params = list(params)
+        params[4], params[5] = rng.choice(NUMBERS), rng.choice(NUMBERS)
+        params[6] = params[5]
+        params[7] = f"2024-1{rng.randint(0, 2)}-{rng.randint(10, 28)} {rng.randint(10, 23)}:00:00"
+        params[9], params[10] = rng.choice(CELLS + [None]), rng.choice(CELLS)
+        rows.append((tuple(params), row_number))
+    processor = FileProcessorService()
+    processor.CHUNK_SIZE = 25
+    written = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {'sheet_name': 'Hoja1', 'rows': rows},
+                                             file_upload_id, missions[0])
+    assert written['records_processed'] == 60 and written['batches'] == 3
+    for number in NUMBERS:
+        assert _actual(service, number) == _expected(number), number
+
+    batch_size = bulk_deletion_module.DELETION_BATCH_SIZE
+    bulk_deletion_module.DELETION_BATCH_SIZE = 7
+    try:
+        deletion = BulkDeletionService()
+        job = deletion.start_job('OPERATOR_SHEET', file_upload_id, [
+            {'table': 'operator_call_data', 'where': 'file_upload_id = ?', 'params': (file_upload_id,)}
+        ], mission_id=missions[0])
+        job = deletion.wait_for_job(job['jobId'], timeout=60)
+    finally:
+        bulk_deletion_module.DELETION_BATCH_SIZE = batch_size
+    assert job['status'] == 'COMPLETED' and job['rowsDeleted'] == 60 and job['batches'] == 9, job
+
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM number_search_index WHERE stale = 1").fetchone()[0] > 0
+        assert conn.execute("SELECT COUNT(*) FROM batch_write_guard").fetchone()[0] == 0
+    for number in NUMBERS:
+        assert _actual(service, number) == _expected(number), number
+
+
+if __name__ == "__main__":
+    tests = [
+        test_index_matches_full_scan,
+        test_triggers_keep_index_in_sync,
+        test_search_validation,
+        test_batches_keep_index_in_sync,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Backups en Línea
+=================================
+
+Valida el backup con la API de SQLite y el servicio de backups:
+1. online_backup copia por pasos un snapshot consistente mientras otra
+   conexión sigue escribiendo
+2. Un backup diferencial copia solo los archivos modificados (kronos.db o el
+   archivo de una misión fragmentada) y referencia el resto al completo
+3. La verificación detecta archivos alterados y la restauración reconstruye
+   un diferencial
+4. La retención elimina los backups completos antiguos con sus diferenciales
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+import pytest
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection, online_backup
+from services.backup_service import BackupService, BackupServiceError
+from services.mission_shard_service import MissionShardService
+from testing.operator_fixtures import apply_operator_schema
+
+
+def test_online_backup_during_writes():
+    """Valida que el backup por pasos termina con escrituras concurrentes"""
+    print("=== TEST: BACKUPS EN LÍNEA ===")
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    source_path = os.path.join(tmp_dir, 'origen.db')
+    with sqlite3.connect(source_path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE probe (id INTEGER PRIMARY KEY, payload BLOB)")
+        conn.executemany("INSERT INTO probe (payload) VALUES (randomblob(1000))", [()] * 5000)
+
+    stop = threading.Event()
+    writes = []
+
+    def writer():
+        conn = sqlite3.connect(source_path, timeout=20)
+        while not stop.is_set():
+            conn.execute("INSERT INTO probe (payload) VALUES (randomblob(1000))")
+            conn.commit()
+            writes.append(1)
+        conn.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        result = online_backup(source_path, os.path.join(tmp_dir, 'copia.db'), pages_per_step=50,
+                               step_sleep_seconds=0.002)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert writes and result['steps'] > 10 and result['pages'] > 1000
+    with sqlite3.connect(os.path.join(tmp_dir, 'copia.db')) as copy:
+        assert copy.execute("PRAGMA quick_check").fetchone()[0] == 'ok'
+        copied = copy.execute("SELECT COUNT(*) FROM probe").fetchone()[0]
+    with sqlite3.connect(source_path) as conn:
+        assert 5000 <= copied <= conn.execute("SELECT COUNT(*) FROM probe").fetchone()[0]
+
+
+def test_differential_backup_verify_restore_and_retention():
+    """Valida backups diferenciales, verificación, restauración y retención"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+    MissionShardService().shard_mission(mission_id)
+
+    service = BackupService(backup_dir=os.path.join(tmp_dir, 'backups'), retention_full=1)
+    with pytest.raises(BackupServiceError):
+        service.run_backup('incremental')
+
+    full = service.run_backup()
+    assert full['kind'] == 'full' and full['baseBackupId'] is None
+    assert [unit['copied'] for unit in full['units']] == [True, True]
+    assert full['units'][1]['missionId'] == mission_id
+
+    unchanged = service.run_backup('differential')
+    assert unchanged['baseBackupId'] == full['backupId']
+    assert not any(unit['copied'] for unit in unchanged['units'])
+
+    with get_db_connection(mission_id) as conn:
+        conn.execute(
+            "INSERT INTO cellular_data (mission_id, punto, lat, lon, mnc_mcc, operator, rssi, tecnologia, cell_id) "
+            "VALUES (?, 'P1', 4.6, -74.0, '732101', 'CLARO', -70, 'LTE', '12345')", (mission_id,)
+        )
+        conn.commit()
+    differential = service.run_backup('differential')
+    copied = {unit['name']: unit['copied'] for unit in differential['units']}
+    assert copied['kronos.db'] is False and list(copied.values()).count(True) == 1
+    assert service.next_scheduled_kind() == 'differential'
+
+    assert service.verify_backup(differential['backupId'])['valid']
+    restore_dir = os.path.join(tmp_dir, 'restaurado')
+    restored = service.restore_backup(differential['backupId'], restore_dir)
+    assert len(restored) == 2
+    with sqlite3.connect(restored[1]) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cellular_data").fetchone()[0] == 1
+    with pytest.raises(BackupServiceError):
+        service.restore_backup(differential['backupId'], restore_dir)
+
+    # Alterar el kronos.db del completo invalida también a sus diferenciales
+    with open(os.path.join(service.backup_dir, full['backupId'], 'kronos.db'), 'r+b') as handle:
+        handle.seek(200)
+        handle.write(b'\xff' * 16)
+    verification = service.verify_backup(differential['backupId'])
+    assert not verification['valid']
+    assert [unit['valid'] for unit in verification['units']] == [False, True]
+
+    newest = service.run_backup('full')
+    assert [manifest['backupId'] for manifest in service.list_backups()] == [newest['backupId']]
+    assert service.get_status()['backups'] == 4
+
+
+if __name__ == "__main__":
+    tests = [
+        test_online_backup_during_writes,
+        test_differential_backup_verify_restore_and_retention,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test del Singleton de OperatorDataService
+==================================================
+
+Valida que el servicio de datos de operador sea de larga duración:
+1. get_operator_data_service retorna la misma instancia entre hilos
+2. La verificación de migración de schema se ejecuta una sola vez por BD y
+   se repite al reinicializar la BD
+3. El normalizador se comparte con el procesador de archivos
+4. El contexto de OperatorLogger es independiente por hilo
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection
+import services.operator_data_service as operator_module
+from services.operator_data_service import OperatorDataService, get_operator_data_service
+from testing.operator_fixtures import apply_operator_schema
+
+
+def _reset_singleton():
+    """Crea una BD temporal y descarta la instancia compartida previa"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    operator_module._operator_data_service_instance = None
+
+
+def test_singleton_shared_across_threads():
+    """Valida una sola instancia y una sola verificación de schema"""
+    print("=== TEST: SINGLETON OPERATOR DATA SERVICE ===")
+    _reset_singleton()
+
+    original_check = OperatorDataService._ensure_schema_migration
+    schema_checks = []
+
+    def counting_check(self):
+        schema_checks.append(threading.get_ident())
+        return original_check(self)
+
+    OperatorDataService._ensure_schema_migration = counting_check
+    try:
+        instances = []
+        threads = [threading.Thread(target=lambda: instances.append(get_operator_data_service()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        OperatorDataService._ensure_schema_migration = original_check
+
+    assert len(instances) == 8
+    assert all(instance is instances[0] for instance in instances)
+    assert len(schema_checks) == 1
+    assert instances[0].file_processor.data_normalizer is instances[0].data_normalizer
+    print(f"  Instancias: {len(set(map(id, instances)))}, verificaciones de schema: {len(schema_checks)}")
+
+
+def test_schema_migration_repeats_after_database_reinit():
+    """Valida que una BD nueva reciba la migración en la instancia existente"""
+    _reset_singleton()
+    service = get_operator_data_service()
+
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+
+    assert get_operator_data_service() is service
+    with get_db_connection() as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(operator_data_sheets)")}
+    assert 'data_row_count' in columns
+
+
+def test_logger_context_is_thread_local():
+    """Valida que el contexto de logging de un hilo no afecte a otro"""
+    _reset_singleton()
+    service_logger = get_operator_data_service().logger
+
+    service_logger.set_context(file_upload_id='upload-main', operator='CLARO')
+    seen_in_thread = []
+
+    def other_request():
+        service_logger.set_context(operator='TIGO')
+        seen_in_thread.append(dict(service_logger._current_context))
+        service_logger.clear_context()
+
+    thread = threading.Thread(target=other_request)
+    thread.start()
+    thread.join()
+
+    assert seen_in_thread == [{'operator': 'TIGO'}]
+    assert service_logger._current_context == {'file_upload_id': 'upload-main', 'operator': 'CLARO'}
+    service_logger.clear_context()
+
+
+if __name__ == "__main__":
+    tests = [
+        test_singleton_shared_across_threads,
+        test_schema_migration_repeats_after_database_reinit,
+        test_logger_context_is_thread_local,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Paginación por Cursor de Hojas de Operador
+===========================================================
+
+Valida get_operator_sheet_data con paginación por cursor:
+1. Recorrer un archivo por cursor retorna todas las filas en el orden pedido
+2. El conteo total se cachea en operator_data_sheets.data_row_count y, sin
+   la columna, se cuenta con COUNT
+3. Los filtros por columna cuentan en la primera página y respetan el cursor;
+   un filtro solo se combina con el orden por id o por la misma columna
+4. Las consultas usan los índices (file_upload_id, columna) sin ordenar en memoria
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import get_db_connection
+from services.operator_data_service import get_operator_data_service, get_operator_sheet_data
+from testing.operator_fixtures import create_sheet_with_records, SHEET_TOTAL_RECORDS, SHEET_CELLS
+
+TOTAL_RECORDS = SHEET_TOTAL_RECORDS
+CELLS = SHEET_CELLS
+
+
+def _fetch_all_by_cursor(file_upload_id: str, **kwargs) -> list:
+    """Recorre el archivo completo siguiendo nextCursor"""
+    rows = []
+    page_cursor = None
+    while True:
+        result = get_operator_sheet_data(file_upload_id, page_size=40, page_cursor=page_cursor, **kwargs)
+        assert result['success'], result
+        rows.extend(result['data'])
+        if not result['hasMore']:
+            assert result['nextCursor'] is None
+            return rows
+        page_cursor = result['nextCursor']
+
+
+def test_cursor_pages_cover_sheet_in_order():
+    """Valida orden, desempate por id y conteo cacheado"""
+    print("=== TEST: PAGINACIÓN POR CURSOR ===")
+    file_upload_id = create_sheet_with_records()
+
+    with get_db_connection() as conn:
+        cached = conn.execute("SELECT data_row_count FROM operator_data_sheets WHERE id = ?",
+                              (file_upload_id,)).fetchone()[0]
+    assert cached == TOTAL_RECORDS
+
+    first_page = get_operator_sheet_data(file_upload_id, page_size=40)
+    assert first_page['total'] == TOTAL_RECORDS
+    assert first_page['nextCursor'] == {'id': first_page['data'][-1]['id'], 'value': first_page['data'][-1]['id']}
+
+    # La paginación por OFFSET sigue disponible y coincide con el cursor
+    second_by_offset = get_operator_sheet_data(file_upload_id, page=2, page_size=40)
+    second_by_cursor = get_operator_sheet_data(file_upload_id, page_size=40, page_cursor=first_page['nextCursor'])
+    assert second_by_offset['data'] == second_by_cursor['data']
+
+    for sort_dir in ('asc', 'desc'):
+        rows = _fetch_all_by_cursor(file_upload_id, sort_by='fecha_hora_inicio', sort_dir=sort_dir)
+        keys = [(row['fecha_hora_inicio'], row['id']) for row in rows]
+        assert len(keys) == TOTAL_RECORDS
+        assert keys == sorted(keys, reverse=(sort_dir == 'desc'))
+
+
+def test_total_without_cached_count_column():
+    """Valida el conteo con COUNT si la migración de data_row_count no se aplicó"""
+    file_upload_id = create_sheet_with_records()
+    with get_db_connection() as conn:
+        conn.execute("ALTER TABLE operator_data_sheets DROP COLUMN data_row_count")
+        conn.commit()
+
+    result = get_operator_sheet_data(file_upload_id, page_size=40)
+    assert result['success'], result
+    assert result['total'] == TOTAL_RECORDS
+    assert len(result['data']) == 40
+
+
+def test_filters_and_invalid_parameters():
+    """Valida filtros del lado del servidor y rechazo de columnas no soportadas"""
+    file_upload_id = create_sheet_with_records()
+
+    first_page = get_operator_sheet_data(file_upload_id, page_size=40, filters={'celda_id': CELLS[0]})
+    expected = len(range(0, TOTAL_RECORDS, 3))
+    assert first_page['total'] == expected
+    assert all(row['celda_id'] == CELLS[0] for row in first_page['data'])
+
+    next_page = get_operator_sheet_data(file_upload_id, page_size=40, filters={'celda_id': CELLS[0]},
+                                        page_cursor=first_page['nextCursor'])
+    assert next_page['total'] is None
+    assert next_page['data'][0]['id'] > first_page['data'][-1]['id']
+
+    rows = _fetch_all_by_cursor(file_upload_id, sort_by='celda_id', sort_dir='desc', filters={'celda_id': CELLS[0]})
+    assert len(rows) == expected
+    assert [row['id'] for row in rows] == sorted((row['id'] for row in rows), reverse=True)
+
+    # Un filtro con orden por otra columna no tiene índice que lo sirva
+    for kwargs in ({'sort_by': 'created_at'}, {'filters': {'latitud': 4.6}}, {'sort_dir': 'up'},
+                   {'sort_by': 'fecha_hora_inicio', 'page_cursor': {'id': 5}},
+                   {'sort_by': 'numero_telefono', 'filters': {'celda_id': CELLS[0]}},
+                   {'filters': {'celda_id': CELLS[0], 'tecnologia': 'LTE'}}):
+        result = get_operator_sheet_data(file_upload_id, **kwargs)
+        assert result['error_code'] == 'INVALID_PARAMETERS', kwargs
+
+
+def test_cursor_queries_use_file_indexes():
+    """Valida que la página por cursor busque en el índice sin ordenar en memoria"""
+    file_upload_id = create_sheet_with_records()
+    service = get_operator_data_service()
+
+    cases = [
+        ('id', None, 'idx_cellular_file_upload'),
+        ('fecha_hora_inicio', None, 'idx_cellular_file_fecha'),
+        ('id', {'celda_id': CELLS[1]}, 'idx_cellular_file_celda'),
+        ('celda_id', {'celda_id': CELLS[1]}, 'idx_cellular_file_celda'),
+        ('id', {'tecnologia': 'LTE'}, 'idx_cellular_file_tecnologia'),
+    ]
+    with get_db_connection() as conn:
+        # Con estadísticas (ANALYZE de mantenimiento) el plan debe ser el mismo
+        conn.execute("ANALYZE")
+        for sort_by, filters, index_name in cases:
+            conditions, params, order_by = service._build_sheet_page_query(
+                'CELLULAR_DATA', sort_by, 'asc', filters, {'id': 100, 'value': '2024-01-01 00:00:03'}
+            )
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM operator_cellular_data "
+                f"WHERE file_upload_id = ?{conditions} ORDER BY {order_by} LIMIT 41",
+                [file_upload_id] + params
+            ).fetchall()
+            details = ' '.join(row[-1] for row in plan)
+            assert index_name in details, details
+            assert 'TEMP B-TREE' not in details, details
+
+
+if __name__ == "__main__":
+    tests = [
+        test_cursor_pages_cover_sheet_in_order,
+        test_total_without_cached_count_column,
+        test_filters_and_invalid_parameters,
+        test_cursor_queries_use_file_indexes,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Almacenamiento Compacto de operator_specific_data
+==================================================================
+
+Valida utils.operator_specific_codec y su uso en la carga de archivos:
+1. Empaquetar y expandir reconstruye el JSON original (campos variables,
+   ausentes, anidados, agregados después y tipos estrictos)
+2. Las filas antiguas con JSON completo se leen sin cambios
+3. La escritura de registros preparados guarda filas compactas y el
+   diccionario de campos del archivo (al menos 50% menos bytes)
+4. get_operator_record_details devuelve el JSON completo y la eliminación
+   del archivo incluye su diccionario de campos
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import uuid
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.data_normalizer_service import DataNormalizerService
+from services.file_processor_service import FileProcessorService
+from services.operator_ingestion_adapters import CALL_DATA_INSERT_SQL
+from services.operator_data_service import get_operator_data_service, get_operator_record_details
+from testing.operator_fixtures import apply_operator_schema
+from utils.operator_specific_codec import (
+    OperatorSpecificDataPacker, expand_operator_specific_data, load_field_dictionary
+)
+
+
+def _claro_specific_data(normalizer: DataNormalizerService, rng: random.Random) -> str:
+    """operator_specific_data de una llamada CLARO como lo genera el normalizador"""
+    raw = {
+        'originador': f"300{rng.randrange(10**7):07d}",
+        'receptor': f"310{rng.randrange(10**7):07d}",
+        'fecha_hora': '2024-03-05 10:00:00',
+        'duracion': rng.randrange(600),
+        'tipo': rng.choice(['CDR_ENTRANTE', 'CDR_SALIENTE']),
+        'celda_inicio_llamada': '12345',
+        'celda_final_llamada': '12346',
+        'imei': f"35{rng.randrange(10**13):013d}",
+        'direccion_celda': 'CALLE 10 # 20-30',
+        'ciudad': rng.choice(['BOGOTA', 'BOGOTA', 'BOGOTA', 'SOACHA'])
+    }
+    return normalizer._create_call_operator_specific_data('CLARO', raw)
+
+
+def test_pack_expand_round_trip():
+    """Valida que expandir una fila empaquetada reconstruye el original"""
+    print("=== TEST: operator_specific_data COMPACTO ===")
+    rng = random.Random(42)
+    packer = OperatorSpecificDataPacker('archivo-1')
+    normalizer = DataNormalizerService()
+    values = [json.loads(_claro_specific_data(normalizer, rng)) for _ in range(200)]
+    values += [
+        {'operator': 'CLARO', 'data_type': 'call_data'},                  # campos ausentes
+        {'operator': 'CLARO', 'extra': {'nuevo': [1, 2], 'vacio': {}}},   # campos nuevos anidados
+        {'operator': 'CLARO', 'original_fields': {'imei': None}},          # None explícito
+        {'operator': 'CLARO', 'data_type': 1},
+        {'operator': 'CLARO', 'data_type': True},                           # True no es 1
+        {}
+    ]
+    packed = [packer.pack(json.dumps(value)) for value in values]
+
+    for value, row in zip(values, packed):
+        assert expand_operator_specific_data(row, packer.fields) == value
+
+    # Filas antiguas y valores no empaquetables
+    legacy = json.dumps(values[0])
+    assert expand_operator_specific_data(legacy, packer.fields) == values[0]
+    assert expand_operator_specific_data(None, packer.fields) is None
+    assert packer.pack(None) is None and packer.pack('no es json') == 'no es json'
+    assert packer.pack(packed[0]) == packed[0]
+
+    # Expandir no modifica los valores por defecto del diccionario
+    expanded = expand_operator_specific_data(packed[-5], packer.fields)
+    expanded['extra']['nuevo'].append(3)
+    assert expand_operator_specific_data(packed[-5], packer.fields) == values[-5]
+
+
+def _setup_file(mission_id: str) -> str:
+    file_upload_id = str(uuid.uuid4())
+    with get_db_connection() as conn:
+        # Columnas agregadas por migration_add_cellid_lac_fields.py
+        conn.execute("ALTER TABLE operator_call_data ADD COLUMN cellid_decimal INTEGER")
+        conn.execute("ALTER TABLE operator_call_data ADD COLUMN lac_decimal INTEGER")
+        conn.execute("""
+            INSERT INTO operator_data_sheets (
+                id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                operator, operator_file_format, processing_status, uploaded_by
+            ) VALUES (?, ?, 'tigo.xlsx', 1024, ?, 'CALL_DATA', 'TIGO', 'LLAMADAS_MIXTAS', 'COMPLETED', 'admin')
+        """, (file_upload_id, mission_id, uuid.uuid4().hex * 2))
+        conn.commit()
+    return file_upload_id
+
+
+def _prepared_rows(file_upload_id: str, mission_id: str, specific_data: list) -> list:
+    """Parámetros de CALL_DATA_INSERT_SQL como los arma _build_tigo_call_params"""
+    rows = []
+    for i, value in enumerate(specific_data):
+        params = (file_upload_id, mission_id, 'TIGO', 'ENTRANTE', f"300{i:07d}", '3100000000', '3100000000',
+                  '2024-03-05 10:00:00', 60, '12345', None, '12345', None, None, None, None, '4G',
+                  'VOZ', 'COMPLETADA', value, uuid.uuid4().hex, 12345, None)
+        rows.append((params, i + 1))
+    return rows
+
+
+def test_prepared_rows_are_stored_compact():
+    """Valida la escritura compacta, el detalle por registro y la eliminación"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+    file_upload_id = _setup_file(mission_id)
+
+    rng = random.Random(43)
+    normalizer = DataNormalizerService()
+    specific_data = [_claro_specific_data(normalizer, rng) for _ in range(600)]
+    processor = FileProcessorService()
+    # Dos pestañas: la segunda agrega un campo al diccionario ya guardado
+    first = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {
+        'sheet_name': 'Hoja1', 'rows': _prepared_rows(file_upload_id, mission_id, specific_data[:300])
+    }, file_upload_id, mission_id)
+    later = [json.dumps({**json.loads(value), 'source_sheet': 'Hoja2'}) for value in specific_data[300:]]
+    second = processor._write_prepared_rows(CALL_DATA_INSERT_SQL, {
+        'sheet_name': 'Hoja2', 'rows': _prepared_rows(file_upload_id, mission_id, later)
+    }, file_upload_id, mission_id)
+    assert first['records_processed'] == 300 and second['records_processed'] == 300
+    original = specific_data[:300] + later
+
+    with get_db_connection() as conn:
+        ids, stored = zip(*conn.execute(
+            "SELECT id, operator_specific_data FROM operator_call_data WHERE file_upload_id = ? ORDER BY id",
+            (file_upload_id,)
+        ).fetchall())
+        fields = load_field_dictionary(conn.cursor(), file_upload_id)
+    assert sum(map(len, stored)) <= 0.5 * sum(map(len, original))
+    assert [expand_operator_specific_data(row, fields) for row in stored] == [json.loads(v) for v in original]
+
+    for position in (0, 299, 300, 599):
+        response = get_operator_record_details(file_upload_id, ids[position])
+        assert response['success']
+        assert response['data']['operator_specific_data'] == json.loads(original[position])
+    assert get_operator_record_details(file_upload_id, -1)['error_code'] == 'RECORD_NOT_FOUND'
+
+    with get_db_connection() as conn:
+        steps = get_operator_data_service()._build_sheet_deletion_steps(conn.cursor(), file_upload_id)
+    assert [step['table'] for step in steps] == [
+        'operator_cellular_data', 'operator_call_data', 'file_processing_logs',
+        'operator_specific_fields', 'operator_data_sheets'
+    ]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_pack_expand_round_trip,
+        test_prepared_rows_are_stored_compact,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Procesamiento Paralelo de Pestañas
+===================================================
+
+Valida el procesamiento por pestaña en pool de procesos (TIGO y WOM):
+1. Un libro TIGO multi-pestaña inserta los mismos registros en paralelo que
+   en el flujo serial, con estadísticas por pestaña
+2. Un libro WOM de datos por celda produce el mismo resultado en ambos flujos
+3. Las pestañas vacías o sin columnas requeridas se reportan sin detener el archivo
+4. El flujo serial abre el libro una sola vez para leer todas las pestañas
+
+Usa bases de datos temporales, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import uuid
+
+import openpyxl
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager, get_db_connection
+import services.parallel_sheet_processor as parallel_module
+import utils.excel_reader as excel_reader_module
+from services.file_processor_service import FileProcessorService
+from testing.operator_fixtures import apply_operator_schema
+from utils.operator_specific_codec import expand_operator_specific_data, load_field_dictionary
+
+TIGO_ROWS_PER_SHEET = 40
+
+WOM_DATOS_HEADER = [
+    'OPERADOR_TECNOLOGIA', 'BTS_ID', 'TAC', 'CELL_ID_VOZ', 'SECTOR', 'FECHA_HORA_INICIO',
+    'FECHA_HORA_FIN', 'OPERADOR_RAN', 'NUMERO_ORIGEN', 'DURACION_SEG', 'UP_DATA_BYTES',
+    'DOWN_DATA_BYTES', 'IMSI', 'LOCALIZACION_USUARIO', 'NOMBRE_ANTENA', 'DIRECCION',
+    'LATITUD', 'LONGITUD', 'LOCALIDAD', 'CIUDAD', 'DEPARTAMENTO', 'REGIONAL',
+    'ENTORNO_GEOGRAFICO', 'ULI'
+]
+
+
+def _build_tigo_workbook(extra_sheets: bool = False) -> bytes:
+    """Libro TIGO con tres pestañas de datos y, opcionalmente, una vacía y una inválida"""
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    header = list(FileProcessorService.TIGO_COLUMN_MAPPING)
+    for sheet in range(3):
+        worksheet = workbook.create_sheet(f"Hoja{sheet + 1}")
+        worksheet.append(header)
+        for i in range(TIGO_ROWS_PER_SHEET):
+            worksheet.append([
+                1, 3001000000 + sheet * 1000 + i, 3109000000 + i, 'AMR', 'O' if i % 3 else 'I', i * 7,
+                f"{(i % 28) + 1:02d}/0{sheet + 1}/2024 10:{i % 60:02d}:00", f"{12000 + i}", 'LTE',
+                'CRA 7', 'BOGOTA', 'CUNDINAMARCA', 120, 30, '43,5', '-74,08', '4,6',
+                'URBANA', 'TORRE', 'TIGO', '7321031234'
+            ])
+    if extra_sheets:
+        workbook.create_sheet('Vacia').append(header)
+        invalid = workbook.create_sheet('SinColumnas')
+        invalid.append(header[:3])
+        invalid.append([1, 3001000000, 3109000000])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _build_wom_datos_workbook() -> bytes:
+    """Libro WOM de datos por celda con dos pestañas"""
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for sheet in range(2):
+        worksheet = workbook.create_sheet(f"Datos{sheet + 1}")
+        worksheet.append(WOM_DATOS_HEADER)
+        for i in range(25):
+            worksheet.append([
+                'WOM 4G', 11648 + i, 2717, 2981895 + i, 7, f"18/04/2024 1{sheet}:{i:02d}",
+                f"18/04/2024 1{sheet + 1}:{i:02d}", 'WOM', f"32369{sheet}{i:04d}", 600 + i, 1777 + i,
+                6673 + i, '732360130234793', '823702630a9d370263002d8007', 'BTA Ciudad Bachue I',
+                'Cr 95 G 86 B 21', '4,71576', '-74,10501', 'Engativa', 'Bogota', 'Cundinamarca',
+                'Centro', 'Urbano', '73236027172981895'
+            ])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _create_upload(operator: str, file_type: str) -> tuple:
+    """Crea una BD temporal con el esquema de operadores y un archivo en PROCESSING"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+
+    file_upload_id = str(uuid.uuid4())
+    with get_db_connection() as conn:
+        # Columnas agregadas por migration_add_cellid_lac_fields.py
+        conn.execute("ALTER TABLE operator_call_data ADD COLUMN cellid_decimal INTEGER")
+        conn.execute("ALTER TABLE operator_call_data ADD COLUMN lac_decimal INTEGER")
+        mission_id, user_id = conn.execute("SELECT id, created_by FROM missions LIMIT 1").fetchone()
+        conn.execute("""
+            INSERT INTO operator_data_sheets (
+                id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                operator, operator_file_format, processing_status, uploaded_by
+            ) VALUES (?, ?, 'archivo.xlsx', 1024, ?, ?, ?, 'MULTI', 'PROCESSING', ?)
+        """, (file_upload_id, mission_id, uuid.uuid4().hex * 2, file_type, operator, user_id))
+        conn.commit()
+    return file_upload_id, mission_id
+
+
+def _stored_rows(table: str, columns: str) -> list:
+    """Filas guardadas con operator_specific_data expandido (el empaquetado depende del orden de escritura)"""
+    position = [column.strip() for column in columns.split(',')].index('operator_specific_data')
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        rows = conn.execute(f"SELECT file_upload_id, {columns} FROM {table}").fetchall()
+        fields = {file_upload_id: load_field_dictionary(cursor, file_upload_id)
+                  for file_upload_id in {row[0] for row in rows}}
+    return sorted(
+        row[1:position + 1]
+        + (json.dumps(expand_operator_specific_data(row[position + 1], fields[row[0]]), sort_keys=True),)
+        + row[position + 2:]
+        for row in rows
+    )
+
+
+def _run(process, file_bytes: bytes, parallel: bool, operator: str, file_type: str) -> tuple:
+    """Ejecuta un procesador con o sin pool y retorna (resultado, file_upload_id)"""
+    file_upload_id, mission_id = _create_upload(operator, file_type)
+    original = (parallel_module.PARALLEL_SHEET_MAX_WORKERS, parallel_module.PARALLEL_SHEET_MIN_FILE_BYTES)
+    parallel_module.PARALLEL_SHEET_MAX_WORKERS = 2 if parallel else 1
+    parallel_module.PARALLEL_SHEET_MIN_FILE_BYTES = 0
+    try:
+        result = process(FileProcessorService(), file_bytes, 'archivo.xlsx', file_upload_id, mission_id)
+    finally:
+        parallel_module.PARALLEL_SHEET_MAX_WORKERS, parallel_module.PARALLEL_SHEET_MIN_FILE_BYTES = original
+    return result, file_upload_id
+
+
+def test_tigo_parallel_matches_serial():
+    """Valida que el flujo paralelo TIGO inserte lo mismo que el serial"""
+    print("=== TEST: PESTAÑAS EN PARALELO ===")
+    file_bytes = _build_tigo_workbook()
+    # record_hash TIGO incluye file_upload_id y un uuid aleatorio, no es comparable
+    columns = ("tipo_llamada, numero_origen, numero_destino, fecha_hora_llamada, "
+               "duracion_segundos, celda_origen, cellid_decimal, operator_specific_data")
+
+    serial, _ = _run(FileProcessorService.process_tigo_llamadas_unificadas, file_bytes, False, 'TIGO', 'CALL_DATA')
+    serial_rows = _stored_rows('operator_call_data', columns)
+
+    parallel, file_upload_id = _run(FileProcessorService.process_tigo_llamadas_unificadas, file_bytes, True,
+                                    'TIGO', 'CALL_DATA')
+    parallel_rows = _stored_rows('operator_call_data', columns)
+
+    assert serial['success'] and parallel['success'], (serial, parallel)
+    assert parallel['details']['parallel_sheets'] is True
+    assert 'parallel_sheets' not in serial['details']
+    assert parallel['records_processed'] == serial['records_processed'] == 3 * TIGO_ROWS_PER_SHEET
+    assert parallel['records_failed'] == serial['records_failed'] == 0
+    assert parallel_rows == serial_rows
+    for key in ('entrantes_processed', 'salientes_processed', 'sheets_combined'):
+        assert parallel['details'][key] == serial['details'][key], key
+    assert (parallel['details']['sheet_processing_summary']['sheet_record_counts'] ==
+            serial['details']['sheet_processing_summary']['sheet_record_counts'])
+
+    with get_db_connection() as conn:
+        status = conn.execute("SELECT processing_status, records_processed FROM operator_data_sheets WHERE id = ?",
+                              (file_upload_id,)).fetchone()
+    assert status == ('COMPLETED', 3 * TIGO_ROWS_PER_SHEET)
+
+
+def test_tigo_parallel_reports_empty_and_invalid_sheets():
+    """Valida las estadísticas de pestañas vacías e inválidas en el flujo paralelo"""
+    result, _ = _run(FileProcessorService.process_tigo_llamadas_unificadas, _build_tigo_workbook(extra_sheets=True),
+                     True, 'TIGO', 'CALL_DATA')
+
+    assert result['success'], result
+    summary = result['details']['sheet_processing_summary']
+    assert summary['total_sheets'] == 5
+    assert summary['successful_sheets'] == 3
+    assert summary['empty_sheets'] == 1
+    assert summary['failed_sheet_names'] == ['SinColumnas']
+    assert result['records_processed'] == 3 * TIGO_ROWS_PER_SHEET
+
+
+def test_serial_flow_opens_workbook_once():
+    """Valida que el flujo serial no vuelva a abrir el libro por cada pestaña"""
+    original_open = excel_reader_module._open_workbook
+    opened = []
+
+    def counting_open(file_bytes, engine):
+        opened.append(engine)
+        return original_open(file_bytes, engine)
+
+    excel_reader_module._open_workbook = counting_open
+    try:
+        result, _ = _run(FileProcessorService.process_tigo_llamadas_unificadas,
+                         _build_tigo_workbook(extra_sheets=True), False, 'TIGO', 'CALL_DATA')
+    finally:
+        excel_reader_module._open_workbook = original_open
+
+    assert result['success'], result
+    # Una apertura para listar las pestañas y otra para leerlas todas
+    assert len(opened) == 2
+    summary = result['details']['sheet_processing_summary']
+    assert (summary['successful_sheets'], summary['empty_sheets']) == (3, 1)
+    assert summary['failed_sheet_names'] == ['SinColumnas']
+    assert result['records_processed'] == 3 * TIGO_ROWS_PER_SHEET
+
+
+def test_wom_datos_parallel_matches_serial():
+    """Valida que el flujo paralelo WOM datos por celda inserte lo mismo que el serial"""
+    file_bytes = _build_wom_datos_workbook()
+    columns = ("numero_telefono, fecha_hora_inicio, fecha_hora_fin, duracion_segundos, celda_id, "
+               "lac_tac, latitud, longitud, tecnologia, operator_specific_data, record_hash")
+
+    serial, _ = _run(FileProcessorService.process_wom_datos_por_celda, file_bytes, False, 'WOM', 'CELLULAR_DATA')
+    serial_rows = _stored_rows('operator_cellular_data', columns)
+
+    parallel, _ = _run(FileProcessorService.process_wom_datos_por_celda, file_bytes, True, 'WOM', 'CELLULAR_DATA')
+    parallel_rows = _stored_rows('operator_cellular_data', columns)
+
+    assert serial['success'] and parallel['success'], (serial, parallel)
+    assert parallel['records_processed'] == serial['records_processed'] == 50
+    assert parallel['records_duplicated'] == serial['records_duplicated']
+    assert parallel_rows == serial_rows
+    assert parallel['details']['operator_technology_types'] == serial['details']['operator_technology_types']
+
+
+if __name__ == "__main__":
+    tests = [
+        test_tigo_parallel_matches_serial,
+        test_tigo_parallel_reports_empty_and_invalid_sheets,
+        test_serial_flow_opens_workbook_once,
+        test_wom_datos_parallel_matches_serial,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Regresión de Planes de Consulta
+================================================
+
+Captura el EXPLAIN QUERY PLAN de cada consulta que ejecutan en producción los
+servicios de correlación (fixed, dynamic, hunter-validated) y de diagramas
+sobre un dataset sintético, y lo compara con query_plan_baseline.json:
+1. Falla si una consulta deja de usar un índice que usaba su plan de referencia
+2. Falla si una consulta empieza a construir un B-tree temporal (GROUP BY,
+   ORDER BY, DISTINCT) o a recorrer completa una tabla que antes no recorría
+3. Falla si aparece una consulta sin plan de referencia
+4. Registra el diff de los planes en query_plan_diff_<fecha>.txt
+
+Tras un cambio intencional del SQL, revisar el diff y regenerar la referencia:
+    python test_query_plans.py --update-baseline
+
+Los planes dependen de la versión de SQLite; la referencia indica con cuál se
+generó. Las tablas no tienen estadísticas (sin ANALYZE), como una BD recién
+cargada, y los índices son los que crea el arranque (ensure_expected_indexes).
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import difflib
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.correlation_reference import populate_mission
+from database.connection import init_database, get_database_manager, get_db_connection
+from services.correlation_service_dynamic import CorrelationServiceDynamic
+from services.correlation_service_fixed import CorrelationServiceFixed
+from services.correlation_service_hunter_validated import CorrelationServiceHunterValidated
+from services.database_maintenance_service import DatabaseMaintenanceService
+from services.diagram_correlation_service import DiagramCorrelationService
+from testing.operator_fixtures import apply_operator_schema
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BACKEND_DIR, 'query_plan_baseline.json')
+PERIOD = ('2024-03-01 00:00:00', '2024-03-31 23:59:59')
+
+_LEADING_COMMENTS = re.compile(r'^(\s*--[^\n]*\n)*\s*')
+_NAMED_INDEX = re.compile(r'USING (?:COVERING |PRIMARY KEY )?INDEX (\w+)')
+_FULL_SCAN = re.compile(r'^SCAN \w+$')
+
+
+def _setup_dataset() -> tuple:
+    """BD temporal con una misión poblada y los índices del arranque"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    with get_db_connection() as conn:
+        mission_id = conn.execute("SELECT id FROM missions LIMIT 1").fetchone()[0]
+        populate_mission(conn, mission_id, calls=1500, hunter_cells=20, seed=5)
+        hunter_cells = {row[0] for row in conn.execute(
+            "SELECT DISTINCT cell_id FROM cellular_data WHERE mission_id = ?", (mission_id,)
+        )}
+        number = conn.execute("""
+            SELECT numero_origen FROM operator_call_data WHERE mission_id = ?
+            GROUP BY numero_origen ORDER BY COUNT(*) DESC, numero_origen LIMIT 1
+        """, (mission_id,)).fetchone()[0]
+    DatabaseMaintenanceService().ensure_expected_indexes()
+    return mission_id, hunter_cells, number
+
+
+def _scenarios(mission_id: str, hunter_cells: set, number: str) -> dict:
+    """Llamadas de producción cuyas consultas se capturan, por nombre"""
+    hunter_service = CorrelationServiceHunterValidated()
+    # Las celdas del archivo SCANHUNTER se reemplazan por las del dataset
+    hunter_service._hunter_cells_cache = hunter_cells
+    hunter_service._cache_timestamp = time.time()
+    return {
+        'fixed.analyze_correlation': lambda: CorrelationServiceFixed().analyze_correlation(mission_id, *PERIOD, 1),
+        'fixed.get_correlation_summary': lambda: CorrelationServiceFixed().get_correlation_summary(mission_id),
+        'dynamic.analyze_correlation': lambda: CorrelationServiceDynamic().analyze_correlation(mission_id, *PERIOD, 1),
+        'hunter_validated.analyze_correlation': lambda: hunter_service.analyze_correlation(mission_id, *PERIOD, 1),
+        'hunter_validated.get_individual_number_diagram_data':
+            lambda: hunter_service.get_individual_number_diagram_data(mission_id, number, *PERIOD),
+        'diagram.get_correlation_diagram_data':
+            lambda: DiagramCorrelationService().get_correlation_diagram_data(mission_id, number, *PERIOD),
+    }
+
+
+def _explain(conn: sqlite3.Connection, sql: str, params) -> list:
+    """Plan de la consulta como líneas indentadas según el árbol de EXPLAIN QUERY PLAN"""
+    depth = {0: -1}
+    lines = []
+    for node_id, parent_id, _, detail in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params or ()):
+        depth[node_id] = depth.get(parent_id, -1) + 1
+        lines.append('  ' * depth[node_id] + detail)
+    return lines
+
+
+def _capture_queries(dataset: tuple) -> dict:
+    """
+    Ejecuta los escenarios y retorna cada consulta de lectura con sus parámetros
+
+    Las consultas se identifican por escenario y orden de ejecución
+    ('<escenario>#<n>'); las de catálogo (sqlite_master) se omiten.
+    """
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sql = _LEADING_COMMENTS.sub('', statement, count=1)
+        if (not executemany and sql.split(None, 1)[0].upper() in ('SELECT', 'WITH')
+                and 'sqlite_master' not in sql):
+            captured.append((sql, parameters))
+
+    queries = {}
+    event.listen(Engine, 'before_cursor_execute', capture)
+    try:
+        for name, scenario in _scenarios(*dataset).items():
+            captured.clear()
+            scenario()
+            for position, query in enumerate(list(captured), start=1):
+                queries[f"{name}#{position}"] = query
+    finally:
+        event.remove(Engine, 'before_cursor_execute', capture)
+    return queries
+
+
+def _explain_queries(queries: dict) -> dict:
+    """Plan actual de cada consulta capturada"""
+    with sqlite3.connect(get_database_manager().db_path) as conn:
+        return {
+            key: {'sql': ' '.join(sql.split())[:160], 'plan': _explain(conn, sql, parameters)}
+            for key, (sql, parameters) in queries.items()
+        }
+
+
+def capture_query_plans() -> dict:
+    """Planes de las consultas de producción sobre un dataset sintético nuevo"""
+    return _explain_queries(_capture_queries(_setup_dataset()))
+
+
+def _indexes(plan: list) -> set:
+    """Índices con nombre usados por el plan (sin los automáticos)"""
+    return {match.group(1) for line in plan for match in [_NAMED_INDEX.search(line)] if match}
+
+
+def _costly_steps(plan: list) -> Counter:
+    """B-trees temporales y recorridos completos del plan"""
+    return Counter(
+        line.strip() for line in plan
+        if 'USE TEMP B-TREE' in line or _FULL_SCAN.match(line.strip())
+    )
+
+
+def compare_query_plans(baseline: dict, current: dict) -> tuple:
+    """
+    Compara los planes capturados con la referencia
+
+    Returns:
+        tuple: (regresiones, diff unificado de los planes que cambiaron)
+    """
+    regressions = []
+    diff = []
+    for key in sorted(set(baseline) | set(current)):
+        if key not in current:
+            diff.append(f"--- {key}: la consulta ya no se ejecuta")
+            continue
+        if key not in baseline:
+            regressions.append(f"{key}: consulta sin plan de referencia ({current[key]['sql'][:80]})")
+            diff.extend(difflib.unified_diff([], current[key]['plan'], f"{key} (referencia)", key, lineterm=''))
+            continue
+
+        expected, actual = baseline[key]['plan'], current[key]['plan']
+        if expected == actual:
+            continue
+        diff.extend(difflib.unified_diff(expected, actual, f"{key} (referencia)", key, lineterm=''))
+        for index in sorted(_indexes(expected) - _indexes(actual)):
+            regressions.append(f"{key}: ya no usa el índice {index}")
+        for step, count in sorted((_costly_steps(actual) - _costly_steps(expected)).items()):
+            regressions.append(f"{key}: nuevo paso costoso '{step}' (x{count})")
+    return regressions, '\n'.join(diff)
+
+
+def _record_diff(diff: str, directory: str) -> str:
+    """Guarda el diff de los planes y retorna la ruta del archivo"""
+    path = os.path.join(directory, f"query_plan_diff_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(diff + '\n')
+    return path
+
+
+def _load_baseline() -> dict:
+    """Planes de referencia"""
+    with open(BASELINE_PATH, encoding='utf-8') as handle:
+        return json.load(handle)['queries']
+
+
+def update_baseline() -> None:
+    """Regenera query_plan_baseline.json con los planes actuales"""
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as handle:
+        json.dump({'sqliteVersion': sqlite3.sqlite_version, 'queries': capture_query_plans()},
+                  handle, indent=2, ensure_ascii=False)
+        handle.write('\n')
+
+
+def test_query_plans_match_baseline():
+    """Valida que ninguna consulta pierde su índice ni agrega pasos costosos"""
+    print("=== TEST: PLANES DE CONSULTA ===")
+    baseline = _load_baseline()
+    current = capture_query_plans()
+    assert len(current) >= 8
+
+    regressions, diff = compare_query_plans(baseline, current)
+    if diff:
+        print(f"Diff de planes registrado en {_record_diff(diff, BACKEND_DIR)}")
+    assert not regressions, '\n'.join(regressions) + '\n\n' + diff
+
+
+def test_dropped_index_is_reported():
+    """Valida que la comparación detecta un índice perdido y pasos costosos nuevos"""
+    queries = _capture_queries(_setup_dataset())
+    baseline = _explain_queries(queries)
+    assert not compare_query_plans(baseline, baseline)[0]
+
+    with get_db_connection() as conn:
+        conn.execute("DROP INDEX idx_operator_call_data_mission_destino")
+        conn.commit()
+    regressions, diff = compare_query_plans(baseline, _explain_queries(queries))
+    assert any(key.startswith('diagram.get_correlation_diagram_data#') and
+               key.endswith('ya no usa el índice idx_operator_call_data_mission_destino')
+               for key in regressions)
+    assert '-' in diff and '+' in diff
+    diff_path = _record_diff(diff, tempfile.mkdtemp(prefix='kronos_test_'))
+    with open(diff_path, encoding='utf-8') as handle:
+        assert 'idx_operator_call_data_mission_destino' in handle.read()
+
+    synthetic = {'q#1': {'sql': 'SELECT ...', 'plan': [
+        'SEARCH c USING INDEX idx_operator_call_data_mission_fecha (mission_id=?)'
+    ]}}
+    scanned = {'q#1': {'sql': 'SELECT ...', 'plan': [
+        'SCAN c', 'USE TEMP B-TREE FOR ORDER BY'
+    ]}, 'q#2': {'sql': 'SELECT 1', 'plan': ['SCAN CONSTANT ROW']}}
+    regressions, _ = compare_query_plans(synthetic, scanned)
+    assert regressions == [
+        "q#1: ya no usa el índice idx_operator_call_data_mission_fecha",
+        "q#1: nuevo paso costoso 'SCAN c' (x1)",
+        "q#1: nuevo paso costoso 'USE TEMP B-TREE FOR ORDER BY' (x1)",
+        "q#2: consulta sin plan de referencia (SELECT 1)",
+    ]
+
+
+if __name__ == "__main__":
+    if '--update-baseline' in sys.argv:
+        update_baseline()
+        print(f"Referencia actualizada: {BASELINE_PATH}")
+        sys.exit(0)
+    tests = [
+        test_query_plans_match_baseline,
+        test_dropped_index_is_reported,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Validación Columnar de Datos de Scanner
+========================================================
+
+Valida ScannerDataProcessor._validate_and_clean_data contra la validación
+fila por fila anterior (benchmark_scanner_validation.legacy_validate_and_clean):
+1. Mismo DataFrame limpio (valores, tipos, is_validated, validation_errors)
+   con valores de borde: textos, nulos, números como texto, fuera de rango
+2. Mismos ValidationResult, en el mismo orden, y mismos duplicados
+3. Con el límite MAX_VALIDATION_RESULTS solo se materializan los primeros
+   resultados, pero estadísticas y resumen cuentan todos
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testing.scanner_reference import build_scanner_frame, legacy_validate_and_clean
+from services.scanner_data_processor import ScannerDataProcessor, ValidationSeverity
+
+
+def _edge_frame() -> pd.DataFrame:
+    """Columnas SCANHUNTER con valores de borde para cada validación"""
+    return pd.DataFrame({
+        'Id': range(14),
+        'Punto': ['A', ' B ', None, '', 5, 'x' * 120, 'A', 'A', 'nan', np.nan, 1.0, 1, 'G', 'A'],
+        'Latitud': ['4.6', ' 4.7 ', 'abc', None, 'nan', 'inf', 95, 4.6, 20.0, '1_0', True, '4,6', 4.6, -4.5],
+        'Longitud': [-74.0, '-74.1', '', None, -60, 200, -74.0, -74.0, -74, 'x', -74, -74, -74.0, '-83'],
+        'MNC+MCC': [732101, '732101', ' 73210 ', 'abc', '7321', '310260', None, 732101.0, '', '１２３４５６',
+                    732123, 732130, 1, 2],
+        'OPERADOR': ['claro', ' COMCEL', None, '', 'xyz', 'UNKNOWN', 'claro', 'CLARO', 5, 'Tigo', 'wom',
+                     'une', 'etb', 'Partners'],
+        'RSSI': ['-85', -85.5, None, 'abc', 'inf', '5', 1e300, -200, -20, '-85.0', True, -85, ' -90 ', 'nan'],
+        'TECNOLOGIA': ['lte', None, '', 'x', 'UNKNOWN', '5g nr', 'NR', '2G', 'gsm', 3, 'LTE', '4G', 'wcdma', 'umts'],
+        'CELLID': ['123', '12 34', None, '', '***', 'c' * 60, 12345.0, 99, '55#1', 'a-b_c', 'é1', '123', '123', ' 7 '],
+    })
+
+
+def _result_key(result) -> tuple:
+    # str() para comparar NaN en original_value
+    return (result.row_index, result.field, result.severity, result.message,
+            str(result.original_value), str(result.suggested_value))
+
+
+def _assert_matches_legacy(raw: pd.DataFrame) -> tuple:
+    processor = ScannerDataProcessor('mission_test')
+    mapped = processor._map_columns(raw)
+    expected_df, expected_results, expected_duplicates = legacy_validate_and_clean(processor, mapped)
+
+    cleaned_df = processor._validate_and_clean_data(mapped)
+
+    pd.testing.assert_frame_equal(cleaned_df, expected_df)
+    for column in cleaned_df.columns:
+        assert ([type(value) for value in cleaned_df[column]] ==
+                [type(value) for value in expected_df[column]]), column
+    assert processor.stats.duplicates == expected_duplicates
+    return processor, expected_results
+
+
+def test_edge_values_match_row_by_row():
+    """Valida paridad con la validación fila por fila en valores de borde"""
+    print("=== TEST: VALIDACIÓN COLUMNAR SCANNER ===")
+    processor, expected_results = _assert_matches_legacy(_edge_frame())
+
+    assert [_result_key(r) for r in processor.validation_results] == [_result_key(r) for r in expected_results]
+
+
+def test_scanner_drive_matches_row_by_row():
+    """Valida paridad en un recorrido sintético con duplicados y conteos del resumen"""
+    processor, expected_results = _assert_matches_legacy(build_scanner_frame(2000, seed=7))
+
+    assert [_result_key(r) for r in processor.validation_results] == [_result_key(r) for r in expected_results]
+    assert processor.stats.duplicates > 0
+    assert processor.validation_counts['by_message'] == Counter(r.message for r in expected_results)
+
+    summary = processor.get_validation_summary()
+    assert summary['total_validations'] == summary['stored_validations'] == len(expected_results)
+    assert summary['by_field'] == dict(Counter(r.field for r in expected_results))
+    assert summary['by_severity'] == {
+        severity.value: len([r for r in expected_results if r.severity == severity])
+        for severity in ValidationSeverity
+    }
+
+
+def test_validation_results_cap():
+    """Valida el límite de ValidationResult materializados en process_file"""
+    processor = ScannerDataProcessor('mission_test')
+    processor.MAX_VALIDATION_RESULTS = 50
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'scanhunter.csv')
+        build_scanner_frame(1500, seed=11).to_csv(csv_path, index=False)
+        _, stats, results = processor.process_file(csv_path)
+        raw = pd.read_csv(csv_path)
+
+    _, expected_results, _ = legacy_validate_and_clean(processor, processor._map_columns(raw))
+
+    summary = processor.get_validation_summary()
+    assert len(results) == summary['stored_validations'] == 50
+    assert [_result_key(r) for r in results] == [_result_key(r) for r in expected_results[:50]]
+    assert summary['total_validations'] == len(expected_results)
+    assert stats.warnings == len([r for r in expected_results if r.severity == ValidationSeverity.WARNING])
+    assert stats.errors == len([r for r in expected_results if r.severity == ValidationSeverity.ERROR])
+
+
+if __name__ == "__main__":
+    tests = [
+        test_edge_values_match_row_by_row,
+        test_scanner_drive_matches_row_by_row,
+        test_validation_results_cap,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
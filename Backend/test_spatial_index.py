@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Índice Espacial (R*Tree)
+=========================================
+
+Valida SpatialIndexService sobre puntos HUNTER y registro de celdas:
+1. Consultas por rectángulo y radio coinciden con un recorrido completo
+2. kNN retorna los k vecinos exactos ordenados por distancia
+3. Los triggers mantienen el índice sincronizado en INSERT/UPDATE/DELETE
+4. Celdas cercanas a un punto HUNTER de la misión
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import random
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+
+from database.connection import init_database, get_database_manager
+from database.models import Mission, CellularData
+from services.spatial_index_service import SpatialIndexService, SpatialIndexServiceError
+from utils.helpers import calculate_distance
+
+CENTER_LAT, CENTER_LON = 4.6097, -74.0817
+
+
+def _setup_service():
+    """Crea una BD temporal con puntos HUNTER y un registro de celdas"""
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    rng = random.Random(29)
+
+    with get_database_manager().get_session() as session:
+        session.add(Mission(id='mgeo', code='GEO-001', name='Mision Geo',
+                            status='En Progreso', start_date='2025-01-01'))
+        session.flush()
+        for i in range(300):
+            session.add(CellularData(
+                mission_id='mgeo', file_record_id=i + 1, punto=f'P{i}',
+                lat=CENTER_LAT + rng.uniform(-0.05, 0.05), lon=CENTER_LON + rng.uniform(-0.05, 0.05),
+                mnc_mcc='732101', operator='CLARO', rssi=-70, tecnologia='LTE', cell_id=str(1000 + i)
+            ))
+
+        session.execute(text(
+            "CREATE TABLE operator_cell_registry (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "operator TEXT NOT NULL, celda_id TEXT NOT NULL, lac_tac TEXT, latitud REAL, longitud REAL, "
+            "ciudad TEXT, tecnologia_predominante TEXT)"
+        ))
+        for i in range(200):
+            session.execute(text(
+                "INSERT INTO operator_cell_registry (operator, celda_id, latitud, longitud, ciudad) "
+                "VALUES ('CLARO', :celda, :lat, :lon, 'BOGOTA')"
+            ), {'celda': f'C{i}', 'lat': CENTER_LAT + rng.uniform(-0.05, 0.05),
+                'lon': CENTER_LON + rng.uniform(-0.05, 0.05)})
+        session.execute(text(
+            "INSERT INTO operator_cell_registry (operator, celda_id) VALUES ('TIGO', 'SIN_COORDENADAS')"
+        ))
+        session.commit()
+
+    return SpatialIndexService()
+
+
+def _brute_force(table: str, lat_col: str, lon_col: str, lat: float, lon: float) -> list:
+    """Distancias (id, metros) de todos los registros con coordenadas"""
+    with get_database_manager().get_session() as session:
+        rows = session.execute(text(
+            f"SELECT id, {lat_col}, {lon_col} FROM {table} WHERE {lat_col} IS NOT NULL"
+        )).fetchall()
+    return sorted((calculate_distance(lat, lon, r[1], r[2]) * 1000, r[0]) for r in rows)
+
+
+def test_radius_and_bbox_match_full_scan():
+    """Valida que las consultas por radio y rectángulo sean exactas"""
+    print("=== TEST: ÍNDICE ESPACIAL - RADIO Y RECTÁNGULO ===")
+    service = _setup_service()
+
+    indexed = service.ensure_spatial_indexes()
+    assert indexed['cellular_data'] == 300
+    assert indexed['operator_cell_registry'] == 200
+    assert 'operator_call_origen' not in indexed
+
+    expected = {rid for dist, rid in _brute_force('cellular_data', 'lat', 'lon', CENTER_LAT, CENTER_LON) if dist <= 1500}
+    result = service.find_within_radius('cellular_data', CENTER_LAT, CENTER_LON, 1500, mission_id='mgeo')
+    assert {r['id'] for r in result['data']} == expected
+    distances = [r['distanceM'] for r in result['data']]
+    assert distances == sorted(distances)
+
+    bbox = service.find_in_bbox('operator_cell_registry', 4.60, -74.09, 4.62, -74.07)
+    assert bbox['total'] > 0
+    assert all(4.60 <= r['lat'] <= 4.62 and -74.09 <= r['lon'] <= -74.07 for r in bbox['data'])
+    print(f"  Radio 1500 m: {result['total']} puntos en {result['queryTime']}s")
+
+
+def test_knn_matches_full_scan():
+    """Valida que kNN retorne exactamente los k más cercanos"""
+    service = _setup_service()
+
+    expected = [rid for _, rid in _brute_force('operator_cell_registry', 'latitud', 'longitud', 4.6, -74.07)[:7]]
+    result = service.find_nearest('operator_cell_registry', 4.6, -74.07, k=7)
+    assert [r['id'] for r in result['data']] == expected
+
+
+def test_triggers_keep_index_in_sync():
+    """Valida la sincronización del índice con INSERT/UPDATE/DELETE"""
+    service = _setup_service()
+    service.ensure_spatial_indexes()
+
+    with get_database_manager().get_session() as session:
+        session.add(CellularData(
+            mission_id='mgeo', file_record_id=999, punto='NUEVO', lat=10.0, lon=-75.0,
+            mnc_mcc='732101', operator='CLARO', rssi=-60, tecnologia='LTE', cell_id='9999'
+        ))
+        session.commit()
+
+    result = service.find_nearest('cellular_data', 10.0, -75.0, k=1)
+    assert result['data'][0]['punto'] == 'NUEVO'
+
+    with get_database_manager().get_session() as session:
+        session.execute(text("UPDATE cellular_data SET lat = 11.0 WHERE punto = 'NUEVO'"))
+        session.commit()
+    assert service.find_within_radius('cellular_data', 10.0, -75.0, 1000)['total'] == 0
+    assert service.find_within_radius('cellular_data', 11.0, -75.0, 1000)['total'] == 1
+
+    with get_database_manager().get_session() as session:
+        session.execute(text("DELETE FROM cellular_data WHERE punto = 'NUEVO'"))
+        session.commit()
+    assert service.find_within_radius('cellular_data', 11.0, -75.0, 1000)['total'] == 0
+
+
+def test_cells_near_hunter_point():
+    """Valida la búsqueda de celdas alrededor de un punto HUNTER"""
+    service = _setup_service()
+
+    with get_database_manager().get_session() as session:
+        hunter = session.query(CellularData).filter(CellularData.punto == 'P0').first()
+        hunter_id, lat, lon = hunter.id, hunter.lat, hunter.lon
+
+    result = service.find_cells_near_hunter_point('mgeo', hunter_id, 2000)
+    expected = {rid for dist, rid in _brute_force('operator_cell_registry', 'latitud', 'longitud', lat, lon) if dist <= 2000}
+    assert result['hunterPoint']['punto'] == 'P0'
+    assert {r['id'] for r in result['data']} == expected
+
+    for invalid_call in (lambda: service.find_cells_near_hunter_point('otra', hunter_id, 2000),
+                         lambda: service.find_within_radius('tabla_inexistente', lat, lon, 100),
+                         lambda: service.find_within_radius('cellular_data', lat, lon, 0)):
+        try:
+            invalid_call()
+            assert False, "Debe rechazar la consulta"
+        except SpatialIndexServiceError:
+            pass
+
+
+if __name__ == "__main__":
+    tests = [
+        test_radius_and_bbox_match_full_scan,
+        test_knn_matches_full_scan,
+        test_triggers_keep_index_in_sync,
+        test_cells_near_hunter_point,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
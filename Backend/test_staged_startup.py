@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Arranque por Etapas
+====================================
+
+Valida el arranque rápido del backend:
+1. Importar main no carga pandas, numpy ni openpyxl
+2. init_database(defer_checks=True) omite la verificación en BD existentes
+3. run_deferred_checks ejecuta la auto-reparación pendiente
+4. Un paso fallido de la etapa 2 no impide ejecutar los siguientes
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import init_database, get_database_manager
+from database.models import Role, User, Mission
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_main_import_defers_heavy_modules():
+    """Valida que los módulos pesados no se importen al cargar main"""
+    print("=== TEST: ARRANQUE POR ETAPAS ===")
+    code = (
+        f"import sys; sys.path.insert(0, {BACKEND_DIR!r}); import main; "
+        "print('HEAVY:' + ','.join(m for m in ('pandas', 'numpy', 'openpyxl') if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], cwd=tempfile.mkdtemp(prefix='kronos_test_'),
+                            capture_output=True, text=True, check=True).stdout
+    assert 'HEAVY:\n' in output
+
+
+def test_deferred_database_checks():
+    """Valida que la auto-reparación se ejecute en run_deferred_checks"""
+    db_path = os.path.join(tempfile.mkdtemp(prefix='kronos_test_'), 'kronos_test.db')
+    init_database(db_path, force_recreate=True)
+
+    with get_database_manager().get_session() as session:
+        session.query(Mission).delete()
+        session.query(User).delete()
+        session.commit()
+
+    init_database(db_path, defer_checks=True)
+    manager = get_database_manager()
+    with manager.get_session() as session:
+        assert session.query(User).count() == 0
+        assert session.query(Role).count() > 0
+
+    manager.run_deferred_checks()
+    with manager.get_session() as session:
+        assert session.query(User).count() > 0
+
+    # Una segunda llamada no repite las verificaciones
+    manager.run_deferred_checks()
+
+
+def test_failed_startup_step_does_not_stop_later_steps():
+    """Valida el error por paso y la ejecución de los pasos siguientes"""
+    import main
+
+    def failing_index():
+        raise RuntimeError("índice no disponible")
+
+    original_steps = main.STARTUP_STEPS
+    main.STARTUP_STEPS = (
+        ('databaseIntegrity', lambda: True),
+        ('numberSearchIndex', failing_index),
+        ('scheduledBackups', lambda: True),
+    )
+    main.startup_status.update(checks={}, errors={}, error=None)
+    try:
+        main.run_startup_checks(0.0)
+        status = main.get_startup_status()
+    finally:
+        main.STARTUP_STEPS = original_steps
+
+    assert status['stage'] == 'degraded'
+    assert status['checks'] == {'databaseIntegrity': True, 'scheduledBackups': True}
+    assert status['errors'] == {'numberSearchIndex': 'índice no disponible'}
+    assert 'numberSearchIndex' in status['error']
+
+
+if __name__ == "__main__":
+    tests = [
+        test_main_import_defers_heavy_modules,
+        test_deferred_database_checks,
+        test_failed_startup_step_does_not_stop_later_steps,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Distancias Vectorizadas
+========================================
+
+Valida las funciones NumPy de utils.helpers contra calculate_distance:
+1. Uno a muchos (calculate_distances_to_point)
+2. Matriz por bloques con memoria acotada (iter_distance_matrix_blocks)
+3. Punto más cercano (find_nearest_points)
+4. Conteo dentro de un radio (count_points_within_distance)
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.helpers import (
+    calculate_distance,
+    calculate_distances_to_point,
+    iter_distance_matrix_blocks,
+    find_nearest_points,
+    count_points_within_distance
+)
+
+
+def _random_points(count: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(4.5, 4.8, count), rng.uniform(-74.2, -74.0, count)
+
+
+def test_distances_to_point_match_scalar():
+    """Valida uno a muchos contra la versión escalar"""
+    print("=== TEST: DISTANCIAS VECTORIZADAS ===")
+    lats, lons = _random_points(200, seed=1)
+
+    vectorized = calculate_distances_to_point(4.6097, -74.0817, lats, lons)
+    scalar = [calculate_distance(4.6097, -74.0817, lat, lon) for lat, lon in zip(lats, lons)]
+    assert np.allclose(vectorized, scalar, rtol=0, atol=1e-9)
+
+
+def test_matrix_blocks_cover_full_matrix():
+    """Valida que los bloques respeten el límite y cubran la matriz completa"""
+    lats1, lons1 = _random_points(53, seed=2)
+    lats2, lons2 = _random_points(17, seed=3)
+
+    rows = []
+    for start, block in iter_distance_matrix_blocks(lats1, lons1, lats2, lons2, max_block_elements=100):
+        assert block.size <= 100
+        assert start == sum(len(r) for r in rows)
+        rows.append(block)
+    matrix = np.vstack(rows)
+
+    assert matrix.shape == (53, 17)
+    assert np.isclose(matrix[10, 5], calculate_distance(lats1[10], lons1[10], lats2[5], lons2[5]))
+
+
+def test_nearest_points_and_counts_match_brute_force():
+    """Valida punto más cercano y conteos por radio contra fuerza bruta"""
+    cells_lat, cells_lon = _random_points(300, seed=4)
+    hunter_lat, hunter_lon = _random_points(80, seed=5)
+
+    indices, distances = find_nearest_points(cells_lat, cells_lon, hunter_lat, hunter_lon,
+                                             max_block_elements=1000)
+    counts = count_points_within_distance(cells_lat, cells_lon, hunter_lat, hunter_lon, 2.0,
+                                          max_block_elements=1000)
+
+    for i in (0, 99, 299):
+        brute = [calculate_distance(cells_lat[i], cells_lon[i], lat, lon) for lat, lon in zip(hunter_lat, hunter_lon)]
+        assert indices[i] == int(np.argmin(brute))
+        assert np.isclose(distances[i], min(brute))
+        assert counts[i] == sum(1 for d in brute if d <= 2.0)
+
+    try:
+        find_nearest_points(cells_lat, cells_lon, [], [])
+        assert False, "Debe rechazar candidatos vacíos"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    tests = [
+        test_distances_to_point_match_scalar,
+        test_matrix_blocks_cover_full_matrix,
+        test_nearest_points_and_counts_match_brute_force,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+KRONOS - Test de Lecturas sobre Snapshots del WAL
+=================================================
+
+Valida las conexiones de lectura y los checkpoints del WAL:
+1. get_read_session y get_db_read_connection ven un snapshot consistente:
+   una inserción confirmada en paralelo no aparece hasta la siguiente lectura
+2. Las conexiones de lectura rechazan escrituras (query_only)
+3. Las conexiones de escritura usan wal_autocheckpoint alto
+4. WalCheckpointService ejecuta checkpoints manuales y en segundo plano y
+   rechaza modos desconocidos
+
+Usa una base de datos temporal, no modifica kronos.db.
+
+Autor: Sistema KRONOS
+Fecha: 2026-10-19
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# Agregar el directorio del backend al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database.connection import (
+    init_database, get_database_manager, get_db_connection, get_db_read_connection,
+    WAL_AUTOCHECKPOINT_PAGES
+)
+from services.wal_checkpoint_service import WalCheckpointService, WalCheckpointServiceError
+
+
+def _setup_database() -> None:
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE snapshot_probe (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO snapshot_probe (value) VALUES ('inicial')")
+        conn.commit()
+
+
+def _insert_probe(value: str) -> None:
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO snapshot_probe (value) VALUES (?)", (value,))
+        conn.commit()
+
+
+def test_read_snapshots_isolate_concurrent_writes():
+    """Valida el aislamiento de los snapshots de lectura"""
+    print("=== TEST: SNAPSHOTS DE LECTURA DEL WAL ===")
+    _setup_database()
+    count_sql = "SELECT COUNT(*) FROM snapshot_probe"
+
+    with get_database_manager().get_read_session() as session:
+        assert session.execute(text(count_sql)).scalar() == 1
+        _insert_probe('durante sesión')
+        assert session.execute(text(count_sql)).scalar() == 1
+        with pytest.raises(OperationalError):
+            session.execute(text("INSERT INTO snapshot_probe (value) VALUES ('x')"))
+
+    with get_db_read_connection() as conn:
+        assert conn.execute(count_sql).fetchone()[0] == 2
+        _insert_probe('durante conexión')
+        assert conn.execute(count_sql).fetchone()[0] == 2
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM snapshot_probe")
+
+    with get_database_manager().get_read_session() as session:
+        assert session.execute(text(count_sql)).scalar() == 3
+    with get_db_connection() as conn:
+        assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == WAL_AUTOCHECKPOINT_PAGES
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_checkpoint_service():
+    """Valida los checkpoints manuales y en segundo plano"""
+    _setup_database()
+    service = WalCheckpointService(interval_seconds=0.05)
+
+    result = service.checkpoint('passive')
+    assert result['mode'] == 'PASSIVE' and not result['busy']
+    assert result['walFrames'] >= result['checkpointedFrames'] >= 0
+    with pytest.raises(WalCheckpointServiceError):
+        service.checkpoint('AGGRESSIVE')
+
+    status = service.start()
+    assert status['running'] and service.start()['running']
+    _insert_probe('en segundo plano')
+    deadline = time.time() + 5
+    while service.get_status()['checkpoints'] < 3 and time.time() < deadline:
+        time.sleep(0.05)
+    service.stop()
+
+    status = service.get_status()
+    assert not status['running'] and status['errors'] == 0
+    assert status['checkpoints'] >= 3 and status['lastCheckpoint']['mode'] == 'PASSIVE'
+    assert service.checkpoint('TRUNCATE')['walFrames'] == 0
+
+
+if __name__ == "__main__":
+    tests = [
+        test_read_snapshots_isolate_concurrent_writes,
+        test_checkpoint_service,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[PASSED] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAILED] {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,7 @@
+"""
+KRONOS Backend Testing
+===============================================================================
+Utilidades compartidas por los tests y benchmarks del backend: esquemas y
+datos de prueba, e implementaciones de referencia para comparar resultados.
+No se usan en la aplicación.
+"""
@@ -0,0 +1,238 @@
+"""
+KRONOS - Referencia del plan de correlación
+===============================================================================
+Misiones sintéticas (HUNTER y llamadas) y la cascada de estrategias anterior
+de CorrelationServiceFixed (estrategia A, B y C, validación de números
+objetivo y rescate de emergencia). Los tests comparan el plan unificado con
+esta referencia y benchmark_correlation_planner.py mide ambos.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from services.correlation_service_fixed import CorrelationServiceFixed
+
+CALL_OPERATORS = ['CLARO', 'CLARO', 'CLARO', ' claro ', 'CLARO MOVIL', '', 'TIGO']
+HUNTER_OPERATORS = ['CLARO', 'CLARO', ' Claro', 'CLARO 4G', 'claro', 'MOVISTAR']
+
+
+def populate_mission(conn, mission_id: str, calls: int, hunter_cells: int, seed: int = 41) -> None:
+    """
+    Inserta datos HUNTER y llamadas sintéticas en una misión (conexión sqlite3)
+
+    Las fechas se distribuyen en marzo de 2024; los números objetivo aparecen
+    con y sin prefijo 57, dentro de otros números y solo fuera del período.
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 3, 1)
+    cells = [f"{rng.randrange(100000, 999999)}" for _ in range(hunter_cells * 10)]
+
+    conn.executemany("""
+        INSERT INTO cellular_data (mission_id, punto, lat, lon, mnc_mcc, operator, rssi, tecnologia,
+                                   cell_id, created_at)
+        VALUES (?, 'P', 4.6, -74.0, '732101', ?, -70, 'LTE', ?, ?)
+    """, [(mission_id, rng.choice(HUNTER_OPERATORS), cell,
+           (base + timedelta(hours=rng.randrange(31 * 24))).strftime('%Y-%m-%d %H:%M:%S'))
+          for cell in cells[:hunter_cells] for _ in range(2)])
+
+    targets = sorted(CorrelationServiceFixed.TARGET_NUMBERS)
+    numbers = [f"3{rng.randrange(10 ** 9):09d}" for _ in range(max(calls // 20, 10))]
+    numbers += targets[:3] + ['57' + targets[1], '57' + targets[3]]
+
+    file_upload_id = str(uuid.uuid4())
+    conn.execute("""
+        INSERT INTO operator_data_sheets (
+            id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+            operator, operator_file_format, processing_status, uploaded_by
+        ) VALUES (?, ?, 'archivo.xlsx', 1024, ?, 'CALL_DATA', 'CLARO', 'MULTI', 'COMPLETED', 'admin')
+    """, (file_upload_id, mission_id, uuid.uuid4().hex * 2))
+
+    rows = []
+    for _ in range(calls):
+        objetivo = rng.choice(numbers)
+        rows.append((objetivo, (base + timedelta(minutes=rng.randrange(31 * 24 * 60))).strftime('%Y-%m-%d %H:%M:%S'),
+                     rng.choice(cells + [None]), rng.choice(cells + [None]), rng.choice(cells),
+                     rng.choice(CALL_OPERATORS)))
+    # Objetivos solo fuera del período, dentro de otros números y números cortos
+    for i in range(12):
+        rows.append((targets[4], f"2023-0{1 + i % 9}-15 10:00:00", None, None, rng.choice(cells), 'CLARO'))
+        rows.append((f"99{targets[5]}", f"2023-0{1 + i % 9}-16 10:00:00", rng.choice(cells), None, None,
+                     rng.choice(CALL_OPERATORS[:3])))
+        rows.append((f"{rng.randrange(10 ** 7, 10 ** 8)}", (base + timedelta(days=i)).strftime('%Y-%m-%d %H:%M:%S'),
+                     rng.choice(cells), None, None, 'CLARO'))
+
+    conn.executemany("""
+        INSERT INTO operator_call_data (
+            file_upload_id, mission_id, operator, tipo_llamada, numero_origen, numero_destino,
+            numero_objetivo, fecha_hora_llamada, celda_origen, celda_destino, celda_objetivo,
+            duracion_segundos, record_hash
+        ) VALUES (?, ?, ?, 'SALIENTE', ?, '3000000000', ?, ?, ?, ?, ?, 10, ?)
+    """, [(file_upload_id, mission_id, operator, objetivo, objetivo, fecha, origen, destino, celda,
+           uuid.uuid4().hex) for objetivo, fecha, origen, destino, celda, operator in rows])
+    conn.commit()
+
+
+# ============================================================================
+# CASCADA ANTERIOR (referencia)
+# ============================================================================
+
+def _legacy_hunter_cells(session, mission_id, start_dt, end_dt, flexible):
+    operator_filter = ("(UPPER(TRIM(operator)) LIKE '%CLARO%' OR TRIM(operator) = '')" if flexible
+                       else "UPPER(TRIM(operator)) = 'CLARO'")
+    result = session.execute(text(f"""
+        SELECT DISTINCT cell_id
+        FROM cellular_data
+        WHERE mission_id = :mission_id
+          AND created_at >= :start_dt
+          AND created_at <= :end_dt
+          AND cell_id IS NOT NULL
+          AND LENGTH(TRIM(cell_id)) > 0
+          AND {operator_filter}
+        ORDER BY cell_id
+    """), {'mission_id': mission_id, 'start_dt': start_dt, 'end_dt': end_dt})
+    return {row[0] for row in result.fetchall() if row[0]}
+
+
+def _legacy_correlated_numbers(service, session, mission_id, hunter_cells, start_dt, end_dt,
+                               min_occurrences, flexible):
+    hunter_cells_list = list(hunter_cells)
+    if not hunter_cells_list:
+        return []
+    placeholders = ','.join(':cell_{}'.format(i) for i in range(len(hunter_cells_list)))
+    cell_case = f"""
+        CASE
+            WHEN celda_objetivo IN ({placeholders}) THEN celda_objetivo
+            WHEN celda_origen IN ({placeholders}) THEN celda_origen
+            WHEN celda_destino IN ({placeholders}) THEN celda_destino
+        END"""
+    filters = ("AND LENGTH(TRIM(numero_objetivo)) >= 8 "
+               "AND (UPPER(TRIM(operator)) LIKE '%CLARO%' OR TRIM(operator) = '')" if flexible
+               else "AND LENGTH(TRIM(numero_objetivo)) >= 10 AND UPPER(TRIM(operator)) = 'CLARO'")
+    query = text(f"""
+        SELECT
+            numero_objetivo,
+            operator,
+            COUNT(*) as total_calls,
+            COUNT(DISTINCT {cell_case}) as unique_hunter_cells_used,
+            MIN(fecha_hora_llamada) as first_detection,
+            MAX(fecha_hora_llamada) as last_detection,
+            GROUP_CONCAT(DISTINCT {cell_case}) as related_cells
+        FROM operator_call_data
+        WHERE mission_id = :mission_id
+          AND fecha_hora_llamada >= :start_dt
+          AND fecha_hora_llamada <= :end_dt
+          AND numero_objetivo IS NOT NULL
+          {filters}
+          AND (
+              celda_objetivo IN ({placeholders}) OR
+              celda_origen IN ({placeholders}) OR
+              celda_destino IN ({placeholders})
+          )
+        GROUP BY numero_objetivo, operator
+        HAVING unique_hunter_cells_used >= :min_occurrences
+        ORDER BY unique_hunter_cells_used DESC, total_calls DESC
+    """)
+    params = {'mission_id': mission_id, 'start_dt': start_dt, 'end_dt': end_dt,
+              'min_occurrences': 1 if flexible else min_occurrences}
+    params.update({f'cell_{i}': cell for i, cell in enumerate(hunter_cells_list)})
+    return service._process_correlation_results(session.execute(query, params).fetchall())
+
+
+def _legacy_direct_target(service, session, mission_id, target_number, start_dt, end_dt):
+    results = []
+    for search_number in service._generate_number_variations(target_number):
+        result = session.execute(text("""
+            SELECT
+                numero_objetivo,
+                operator,
+                COUNT(*) as total_calls,
+                1 as unique_hunter_cells_used,
+                MIN(fecha_hora_llamada) as first_detection,
+                MAX(fecha_hora_llamada) as last_detection,
+                GROUP_CONCAT(DISTINCT celda_objetivo) as related_cells
+            FROM operator_call_data
+            WHERE mission_id = :mission_id
+              AND fecha_hora_llamada >= :start_dt
+              AND fecha_hora_llamada <= :end_dt
+              AND numero_objetivo = :target_number
+            GROUP BY numero_objetivo, operator
+            ORDER BY total_calls DESC
+        """), {'mission_id': mission_id, 'start_dt': start_dt, 'end_dt': end_dt, 'target_number': search_number})
+        results.extend(service._process_correlation_results(result.fetchall()))
+    return results
+
+
+def _legacy_emergency(service, session, mission_id, missing_number):
+    results = []
+    for variation in service._generate_number_variations(missing_number):
+        result = session.execute(text("""
+            SELECT
+                numero_objetivo,
+                operator,
+                COUNT(*) as total_calls,
+                1 as unique_hunter_cells_used,
+                MIN(fecha_hora_llamada) as first_detection,
+                MAX(fecha_hora_llamada) as last_detection,
+                GROUP_CONCAT(DISTINCT
+                    CASE
+                        WHEN celda_objetivo IS NOT NULL THEN celda_objetivo
+                        WHEN celda_origen IS NOT NULL THEN celda_origen
+                        WHEN celda_destino IS NOT NULL THEN celda_destino
+                        ELSE 'N/A'
+                    END
+                ) as related_cells
+            FROM operator_call_data
+            WHERE mission_id = :mission_id
+              AND (numero_objetivo = :variation
+                   OR numero_objetivo LIKE :variation_like)
+            GROUP BY numero_objetivo, operator
+            ORDER BY total_calls DESC
+            LIMIT 10
+        """), {'mission_id': mission_id, 'variation': variation, 'variation_like': f'%{variation}%'})
+        results.extend(service._process_correlation_results(result.fetchall()))
+    return results
+
+
+def legacy_analyze_correlation(service: CorrelationServiceFixed, mission_id: str, start_datetime: str,
+                               end_datetime: str, min_occurrences: int = 1) -> list:
+    """
+    Cascada anterior de analyze_correlation (estrategias A, B, C y rescate)
+
+    Returns:
+        Lista de resultados fusionados, en el formato de 'data'
+    """
+    expanded_start = (datetime.strptime(start_datetime, '%Y-%m-%d %H:%M:%S')
+                      - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+    expanded_end = (datetime.strptime(end_datetime, '%Y-%m-%d %H:%M:%S')
+                    + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+
+    with service.db_manager.get_session() as session:
+        all_results = []
+        cells_a = _legacy_hunter_cells(session, mission_id, start_datetime, end_datetime, flexible=False)
+        all_results.extend(service._enrich_results_with_strategy_info(_legacy_correlated_numbers(
+            service, session, mission_id, cells_a, start_datetime, end_datetime, min_occurrences, False
+        ), "Original", len(cells_a)))
+
+        cells_b = _legacy_hunter_cells(session, mission_id, expanded_start, expanded_end, flexible=True)
+        all_results.extend(service._enrich_results_with_strategy_info(_legacy_correlated_numbers(
+            service, session, mission_id, cells_b, expanded_start, expanded_end, 1, True
+        ), "Flexible", len(cells_b)))
+
+        direct = []
+        for target_number in sorted(service.TARGET_NUMBERS):
+            direct.extend(_legacy_direct_target(service, session, mission_id, target_number,
+                                                start_datetime, end_datetime))
+        all_results.extend(service._enrich_results_with_strategy_info(direct, "DirectTarget", 0))
+
+        merged = service._merge_and_deduplicate_results(all_results)
+        missing = service._validate_target_numbers_presence(merged)
+        if missing:
+            emergency = []
+            for missing_number in sorted(missing):
+                emergency.extend(_legacy_emergency(service, session, mission_id, missing_number))
+            merged.extend(service._enrich_results_with_strategy_info(emergency, "Emergency", 0))
+            merged = service._merge_and_deduplicate_results(merged)
+        return merged
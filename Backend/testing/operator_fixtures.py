@@ -0,0 +1,86 @@
+"""
+KRONOS - Datos de prueba de operadores
+===============================================================================
+Crea las tablas de operadores en una base de datos temporal y carga archivos
+de ejemplo. init_database no crea estas tablas: vienen de
+database/operator_data_schema_optimized.sql.
+"""
+
+import os
+import sqlite3
+import tempfile
+import uuid
+
+from database.connection import init_database, get_database_manager, get_db_connection
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPERATOR_SCHEMA_PATH = os.path.join(BACKEND_DIR, 'database', 'operator_data_schema_optimized.sql')
+
+# Archivo celular de create_sheet_with_records
+SHEET_TOTAL_RECORDS = 250
+SHEET_CELLS = ('10101', '20202', '30303')
+
+
+def apply_operator_schema(db_path: str, replacements: tuple = ()):
+    """
+    Crea las tablas e índices de operadores con la validación de duplicados por
+    misión (ya migrada), sin triggers ni vistas y omitiendo índices que ya
+    existen en schema.sql. replacements permite simular esquemas anteriores.
+    """
+    replacements = (('file_checksum TEXT NOT NULL UNIQUE,', 'file_checksum TEXT NOT NULL,'),) + tuple(replacements)
+    statement = ''
+    with sqlite3.connect(db_path) as conn:
+        for line in open(OPERATOR_SCHEMA_PATH, encoding='utf-8'):
+            for old, new in replacements:
+                line = line.replace(old, new)
+            statement += line
+            if sqlite3.complete_statement(statement):
+                sql = '\n'.join(l for l in statement.splitlines() if not l.strip().startswith('--')).strip()
+                if not sql.startswith(('CREATE TABLE', 'CREATE INDEX')):
+                    statement = ''
+                    continue
+                try:
+                    conn.execute(statement)
+                except sqlite3.OperationalError as e:
+                    if 'already exists' not in str(e):
+                        raise
+                statement = ''
+
+
+def create_sheet_with_records() -> str:
+    """
+    Crea una BD temporal con esquema de operadores y un archivo celular CLARO
+    completado de SHEET_TOTAL_RECORDS registros. Retorna el ID del archivo.
+    """
+    import services.operator_data_service as operator_module
+    from services.operator_data_service import get_operator_data_service
+
+    tmp_dir = tempfile.mkdtemp(prefix='kronos_test_')
+    init_database(os.path.join(tmp_dir, 'kronos_test.db'), force_recreate=True)
+    apply_operator_schema(get_database_manager().db_path)
+    operator_module._operator_data_service_instance = None
+    service = get_operator_data_service()
+
+    file_upload_id = str(uuid.uuid4())
+    with get_db_connection() as conn:
+        mission_id, user_id = conn.execute("SELECT id, created_by FROM missions LIMIT 1").fetchone()
+        conn.execute("""
+            INSERT INTO operator_data_sheets (
+                id, mission_id, file_name, file_size_bytes, file_checksum, file_type,
+                operator, operator_file_format, processing_status, uploaded_by
+            ) VALUES (?, ?, 'claro_datos.xlsx', 1024, ?, 'CELLULAR_DATA', 'CLARO', 'CLARO_DATOS', 'PROCESSING', ?)
+        """, (file_upload_id, mission_id, 'a' * 64, user_id))
+        conn.executemany("""
+            INSERT INTO operator_cellular_data (
+                file_upload_id, mission_id, operator, numero_telefono,
+                fecha_hora_inicio, celda_id, tecnologia, record_hash
+            ) VALUES (?, ?, 'CLARO', ?, ?, ?, 'LTE', ?)
+        """, [
+            (file_upload_id, mission_id, f"300{i % 11:07d}",
+             f"2024-01-01 00:00:{i % 7:02d}", SHEET_CELLS[i % 3], f"hash-{i}")
+            for i in range(SHEET_TOTAL_RECORDS)
+        ])
+        conn.commit()
+
+    service._update_processing_status(file_upload_id, 'COMPLETED')
+    return file_upload_id
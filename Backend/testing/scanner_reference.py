@@ -0,0 +1,129 @@
+"""
+KRONOS - Referencia de validación de datos de scanner
+===============================================================================
+Recorridos SCANHUNTER sintéticos y la validación fila por fila anterior de
+ScannerDataProcessor (iterrows, ocho _validate_* por registro, cleaned_df.at
+y hash por registro para duplicados). Los tests comparan la validación
+columnar con esta referencia y benchmark_scanner_validation.py mide ambas.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from services.scanner_data_processor import ScannerDataProcessor, ValidationSeverity, ValidationResult
+
+
+def build_scanner_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Genera un recorrido SCANHUNTER sintético (columnas originales)"""
+    generator = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Id': np.arange(1, rows + 1),
+        'Punto': generator.choice(['CALLE 100', ' CALLE 26 ', 'AV BOYACA', '', 'PUNTO ' + 'X' * 120], rows,
+                                  p=[0.5, 0.2, 0.27, 0.01, 0.02]),
+        'Latitud': np.round(4.6 + generator.normal(0, 0.05, rows), 5),
+        'Longitud': np.round(-74.08 + generator.normal(0, 0.05, rows), 5),
+        'MNC+MCC': generator.choice(['732101', '732123', '73213', '310260', '7321O1', ''], rows,
+                                    p=[0.6, 0.2, 0.1, 0.04, 0.03, 0.03]),
+        'OPERADOR': generator.choice(['CLARO', 'COMCEL', 'movistar', 'TIGO', 'WOM', 'OTRO', ''], rows,
+                                     p=[0.35, 0.1, 0.2, 0.2, 0.1, 0.03, 0.02]),
+        'RSSI': generator.integers(-160, 10, rows).astype(float),
+        'TECNOLOGIA': generator.choice(['LTE', '4G', '2G', 'NR', 'WCDMA', 'X', ''], rows),
+        'CELLID': generator.choice([f"{i}" for i in range(2000)] + ['12 34', '55#1', '***'], rows),
+        'LAC o TAC': generator.integers(1000, 9999, rows),
+        'ENB': generator.integers(1, 999, rows),
+        'Comentario': '',
+        'CHANNEL': generator.integers(1, 3000, rows)
+    })
+    # Coordenadas fuera de Colombia / fuera de rango y RSSI no numérico
+    df.loc[df.sample(frac=0.01, random_state=1).index, 'Latitud'] = 95.0
+    df.loc[df.sample(frac=0.01, random_state=2).index, 'Longitud'] = -60.0
+    df.loc[df.sample(frac=0.005, random_state=3).index, 'RSSI'] = np.nan
+    # Duplicados exactos
+    duplicates = df.sample(frac=0.05, random_state=4)
+    return pd.concat([df, duplicates], ignore_index=True)
+
+
+def legacy_validate_and_clean(processor: ScannerDataProcessor, df: pd.DataFrame) -> tuple:
+    """
+    Implementación anterior de _validate_and_clean_data (fila por fila)
+
+    Returns:
+        Tuple (DataFrame limpio, lista completa de ValidationResult, duplicados)
+    """
+    cleaned_df = df.copy()
+    results = []
+    duplicate_hashes = set()
+    duplicates = 0
+    blocking = [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]
+
+    for index, row in cleaned_df.iterrows():
+        row_errors = []
+
+        punto_result = processor._validate_punto(row['punto'], index)
+        if punto_result:
+            results.append(punto_result)
+            if punto_result.severity in blocking:
+                row_errors.append(punto_result.message)
+            if punto_result.suggested_value:
+                cleaned_df.at[index, 'punto'] = punto_result.suggested_value
+
+        for field, validator in (('latitude', processor._validate_latitude),
+                                 ('longitude', processor._validate_longitude)):
+            result = validator(row[field], index)
+            if result:
+                results.append(result)
+                if result.severity in blocking:
+                    row_errors.append(result.message)
+                elif result.suggested_value is not None:
+                    cleaned_df.at[index, field] = result.suggested_value
+
+        for field, validator in (('mnc_mcc', processor._validate_mnc_mcc),
+                                 ('operator_name', processor._validate_operator)):
+            result = validator(row[field], index)
+            if result:
+                results.append(result)
+                if result.suggested_value:
+                    cleaned_df.at[index, field] = result.suggested_value
+
+        rssi_result = processor._validate_rssi(row['rssi_dbm'], index)
+        if rssi_result:
+            results.append(rssi_result)
+            if rssi_result.severity in blocking:
+                row_errors.append(rssi_result.message)
+            elif rssi_result.suggested_value is not None:
+                cleaned_df.at[index, 'rssi_dbm'] = rssi_result.suggested_value
+
+        tech_result = processor._validate_technology(row['technology'], index)
+        if tech_result:
+            results.append(tech_result)
+            if tech_result.suggested_value:
+                cleaned_df.at[index, 'technology'] = tech_result.suggested_value
+
+        cell_result = processor._validate_cell_id(row['cell_id'], index)
+        if cell_result:
+            results.append(cell_result)
+            if cell_result.severity in blocking:
+                row_errors.append(cell_result.message)
+            elif cell_result.suggested_value:
+                cleaned_df.at[index, 'cell_id'] = cell_result.suggested_value
+
+        current = cleaned_df.iloc[index]
+        row_hash = hashlib.md5('|'.join(
+            str(current[field]) for field in ScannerDataProcessor.DUPLICATE_KEY_FIELDS
+        ).encode()).hexdigest()
+        if row_hash in duplicate_hashes:
+            results.append(ValidationResult(
+                index, 'duplicate', ValidationSeverity.WARNING,
+                "Posible registro duplicado detectado", row_hash
+            ))
+            duplicates += 1
+        duplicate_hashes.add(row_hash)
+
+        if not row_errors:
+            cleaned_df.at[index, 'is_validated'] = True
+        else:
+            cleaned_df.at[index, 'validation_errors'] = '; '.join(row_errors)
+
+    return cleaned_df, results, duplicates
@@ -42,7 +42,21 @@ from utils.helpers import (
     validate_dataframe_not_empty,
     chunk_list,
     safe_get_nested,
-    calculate_distance
+    calculate_distance,
+    calculate_bounding_box,
+    calculate_distances_to_point,
+    iter_distance_matrix_blocks,
+    find_nearest_points,
+    count_points_within_distance
+)
+
+from utils.excel_reader import (
+    get_available_excel_engines,
+    select_excel_engine,
+    list_excel_sheets,
+    read_excel_sheet,
+    read_excel_sheets,
+    iter_excel_chunks
 )
 
 __all__ = [
@@ -82,5 +96,18 @@ __all__ = [
     'validate_dataframe_not_empty',
     'chunk_list',
     'safe_get_nested',
-    'calculate_distance'
+    'calculate_distance',
+    'calculate_bounding_box',
+    'calculate_distances_to_point',
+    'iter_distance_matrix_blocks',
+    'find_nearest_points',
+    'count_points_within_distance',
+    
+    # Excel reader
+    'get_available_excel_engines',
+    'select_excel_engine',
+    'list_excel_sheets',
+    'read_excel_sheet',
+    'read_excel_sheets',
+    'iter_excel_chunks'
 ]
\ No newline at end of file
@@ -148,37 +148,148 @@ def convert_hex_to_decimal(hex_value: str) -> Optional[int]:
         return None
 
 
-def process_movistar_cellular_data(df) -> None:
+# Patrones de celda_origen (sobre el valor ya limpio: strip + upper)
+MOVISTAR_CELDA_PATTERN = r'^([A-F0-9]+)-([A-F0-9]+)$'
+TIGO_CELDA_PATTERN = r'^([A-F0-9]{6})([A-F0-9]{2})$'
+
+# Máximo de dígitos hex convertibles en int64 sin desbordamiento (16^15 = 2^60)
+_MAX_VECTOR_HEX_DIGITS = 15
+
+
+def _hex_values_to_int(hex_values) -> list:
+    """
+    Convierte un arreglo de strings hexadecimales (ya validados, en mayúsculas)
+    a enteros de Python.
+
+    Los valores de hasta 15 dígitos se convierten con numpy (tabla de dígitos y
+    pesos 16^k); los más largos usan int(valor, 16) para conservar la precisión.
+    """
+    import numpy as np
+
+    hex_array = np.asarray(hex_values, dtype=str)
+    if hex_array.size == 0:
+        return []
+
+    result = np.empty(hex_array.size, dtype=object)
+    lengths = np.char.str_len(hex_array)
+    short_mask = lengths <= _MAX_VECTOR_HEX_DIGITS
+
+    if short_mask.any():
+        width = int(lengths[short_mask].max())
+        padded = np.char.zfill(hex_array[short_mask], width).astype(f'U{width}')
+        codes = padded.view(np.uint32).reshape(-1, width)
+
+        digit_table = np.zeros(128, dtype=np.int64)
+        digit_table[ord('0'):ord('9') + 1] = np.arange(10)
+        digit_table[ord('A'):ord('F') + 1] = np.arange(10, 16)
+
+        weights = 16 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+        result[short_mask] = (digit_table[codes] * weights).sum(axis=1).tolist()
+
+    if not short_mask.all():
+        result[~short_mask] = [int(value, 16) for value in hex_array[~short_mask]]
+
+    return result.tolist()
+
+
+def extract_cellid_lac_vectorized(values, operator: str = "MOVISTAR"):
+    """
+    Versión vectorizada de extract_cellid_lac_from_celda_origen para una
+    columna completa.
+
+    Cada valor distinto se limpia, se valida con str.extract y se convierte
+    de hexadecimal una sola vez; el resultado se expande a todas las filas con
+    los códigos de pd.factorize. Los resultados son idénticos a aplicar la
+    función escalar fila por fila.
+
+    Args:
+        values: Serie (o secuencia) con los valores de celda_origen
+        operator (str): "MOVISTAR", "TIGO" u otro (intenta ambos formatos)
+
+    Returns:
+        pd.DataFrame: Columnas cellid_decimal y lac_decimal (object, int o None)
+                      con el mismo índice de la serie de entrada
+    """
+    import numpy as np
+    import pandas as pd
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+
+    cellid_by_unique = np.full(len(uniques), None, dtype=object)
+    lac_by_unique = np.full(len(uniques), None, dtype=object)
+
+    if len(uniques):
+        # Misma limpieza que la versión escalar: str(valor).strip().upper()
+        cleaned = pd.Series(np.asarray(uniques, dtype=object), dtype=object).map(str).str.strip().str.upper()
+
+        operator_upper = operator.upper()
+        if operator_upper == "MOVISTAR":
+            parts = cleaned.str.extract(MOVISTAR_CELDA_PATTERN)
+        elif operator_upper == "TIGO":
+            parts = cleaned.str.extract(TIGO_CELDA_PATTERN)
+        else:
+            parts = cleaned.str.extract(MOVISTAR_CELDA_PATTERN)
+            unmatched = parts[0].isna()
+            if unmatched.any():
+                parts.loc[unmatched] = cleaned[unmatched].str.extract(TIGO_CELDA_PATTERN).to_numpy()
+
+        matched = parts[0].notna().to_numpy()
+        cellid_by_unique[matched] = _hex_values_to_int(parts.loc[matched, 0].to_numpy())
+        lac_by_unique[matched] = _hex_values_to_int(parts.loc[matched, 1].to_numpy())
+
+        unrecognized = uniques[~matched]
+        if len(unrecognized):
+            examples = ', '.join(str(value) for value in unrecognized[:5])
+            logger.warning(f"Formato {operator_upper} no reconocido en {len(unrecognized)} valores "
+                           f"distintos de celda_origen (ej: {examples})")
+
+    # Expandir por fila (los valores nulos quedan en None)
+    present = codes != -1
+    cellid_decimal = np.full(len(series), None, dtype=object)
+    lac_decimal = np.full(len(series), None, dtype=object)
+    cellid_decimal[present] = cellid_by_unique[codes[present]]
+    lac_decimal[present] = lac_by_unique[codes[present]]
+
+    return pd.DataFrame({'cellid_decimal': cellid_decimal, 'lac_decimal': lac_decimal},
+                        index=series.index, dtype=object)
+
+
+def process_movistar_cellular_data(df) -> Dict[str, int]:
     """
     Procesa un DataFrame de Movistar para extraer cellid_decimal y lac_decimal.
     Modifica el DataFrame in-place agregando las nuevas columnas.
     
     Args:
         df: DataFrame de pandas con datos de Movistar que incluye columna celda_origen
-    """
-    import pandas as pd
     
+    Returns:
+        Dict[str, int]: Estadísticas de conversión (mismo formato que get_conversion_stats),
+                        calculadas en la misma pasada
+    """
     if 'celda_origen' not in df.columns:
         logger.warning("DataFrame no contiene columna celda_origen")
-        return
+        return get_conversion_stats(df)
     
     logger.info(f"Procesando {len(df)} registros para extraer cellid y lac")
     
-    # Inicializar columnas
-    df['cellid_decimal'] = None
-    df['lac_decimal'] = None
-    
-    # Aplicar extracción y conversión
-    for idx, row in df.iterrows():
-        result = extract_cellid_lac_from_celda_origen(row['celda_origen'])
-        df.at[idx, 'cellid_decimal'] = result['cellid_decimal']
-        df.at[idx, 'lac_decimal'] = result['lac_decimal']
+    # Extracción y conversión vectorizada
+    cell_data = extract_cellid_lac_vectorized(df['celda_origen'], "MOVISTAR")
+    df['cellid_decimal'] = cell_data['cellid_decimal'].to_numpy()
+    df['lac_decimal'] = cell_data['lac_decimal'].to_numpy()
     
     # Estadísticas de procesamiento
-    cellid_converted = df['cellid_decimal'].notna().sum()
-    lac_converted = df['lac_decimal'].notna().sum()
+    cellid_converted = int(df['cellid_decimal'].notna().sum())
+    lac_converted = int(df['lac_decimal'].notna().sum())
+    stats = {
+        'total_records': len(df),
+        'cellid_converted': cellid_converted,
+        'lac_converted': lac_converted,
+        'conversion_errors': int(df['celda_origen'].notna().sum()) - cellid_converted
+    }
     
     logger.info(f"Conversión completada: {cellid_converted}/{len(df)} cellid, {lac_converted}/{len(df)} lac")
+    return stats
 
 
 def get_conversion_stats(df) -> Dict[str, int]:
@@ -0,0 +1,114 @@
+"""
+KRONOS Columnar Response
+=====================================
+Formato columnar opcional para endpoints eel que devuelven tablas grandes.
+
+En el formato por registros cada fila repite todos los nombres de columna.
+En el formato columnar los nombres van una sola vez y cada columna es un
+arreglo:
+
+    {
+        'format': 'columnar',
+        'columns': ['id', 'operator', ...],
+        'rowCount': 2,
+        'values': {'id': [1, 2], 'operator': [0, 0]},
+        'dictionaries': {'operator': ['CLARO']}
+    }
+
+Las columnas categóricas (operador, tecnología, celdas, ...) se codifican
+con diccionario: 'values' guarda la posición del valor en 'dictionaries'
+(None se conserva como null). El payload se arma directamente desde las
+tuplas del cursor, sin crear un diccionario por fila.
+
+Author: KRONOS Development Team
+Date: 2026-10-19
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Callable, Iterable
+
+# Configurar logger específico para este módulo
+logger = logging.getLogger(__name__)
+
+RECORDS_FORMAT = 'records'
+COLUMNAR_FORMAT = 'columnar'
+RESPONSE_FORMATS = (RECORDS_FORMAT, COLUMNAR_FORMAT)
+
+# Columnas de baja cardinalidad que se codifican con diccionario si están presentes
+DICTIONARY_COLUMNS = (
+    'operator', 'operador', 'tecnologia', 'tipo_llamada', 'tipo_conexion',
+    'celda_id', 'celda_origen', 'celda_destino', 'hunter_source', 'precision_ubicacion'
+)
+
+
+def is_columnar_format(response_format: Optional[str]) -> bool:
+    """
+    Valida el formato de respuesta solicitado
+
+    Raises:
+        ValueError: Si el formato no es 'records' ni 'columnar'
+    """
+    response_format = (response_format or RECORDS_FORMAT).lower()
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"Formato de respuesta no soportado: {response_format} (use 'records' o 'columnar')")
+    return response_format == COLUMNAR_FORMAT
+
+
+def _dictionary_encode(values: Sequence[Any]) -> tuple:
+    """Códigos y diccionario (en orden de aparición) de una columna"""
+    positions = {}
+    codes = [None if value is None else positions.setdefault(value, len(positions)) for value in values]
+    return codes, list(positions)
+
+
+def encode_columnar(columns: Sequence[str], rows: Sequence[Sequence[Any]],
+                    dictionary_columns: Iterable[str] = DICTIONARY_COLUMNS,
+                    converters: Optional[Dict[str, Callable[[Any], Any]]] = None) -> Dict[str, Any]:
+    """
+    Construye el payload columnar a partir de filas de un cursor
+
+    Args:
+        columns: Nombres de columna (cursor.description)
+        rows: Filas como tuplas
+        dictionary_columns: Columnas a codificar con diccionario (se ignoran las ausentes)
+        converters: Conversión opcional por columna (no se aplica a None)
+
+    Returns:
+        Dict con 'format', 'columns', 'rowCount', 'values' y 'dictionaries'
+    """
+    columns = list(columns)
+    column_values = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+    converters = converters or {}
+    dictionary_columns = set(dictionary_columns)
+
+    values = {}
+    dictionaries = {}
+    for name, column in zip(columns, column_values):
+        convert = converters.get(name)
+        if convert is not None:
+            column = [None if value is None else convert(value) for value in column]
+        if name in dictionary_columns:
+            column, dictionaries[name] = _dictionary_encode(column)
+        values[name] = column
+
+    return {
+        'format': COLUMNAR_FORMAT,
+        'columns': columns,
+        'rowCount': len(rows),
+        'values': values,
+        'dictionaries': dictionaries
+    }
+
+
+def decode_columnar(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convierte un payload columnar en la lista de registros equivalente"""
+    columns = payload['columns']
+    dictionaries = payload.get('dictionaries', {})
+    decoded = []
+    for name in columns:
+        column = payload['values'][name]
+        if name in dictionaries:
+            dictionary = dictionaries[name]
+            column = [None if code is None else dictionary[code] for code in column]
+        decoded.append(column)
+    return [dict(zip(columns, row)) for row in zip(*decoded)]
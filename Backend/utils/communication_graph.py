@@ -0,0 +1,288 @@
+"""
+KRONOS Communication Graph
+=====================================
+Grafo de comunicaciones en memoria de una misión, construido una sola vez a
+partir de las llamadas (operator_call_data) y consultado sin SQL.
+
+Estructura:
+- Cada número recibe un ID entero (posición en 'numbers')
+- Los eventos (origen, destino, fecha, duración) se guardan ordenados por
+  fecha en arreglos numpy, lo que permite filtrar ventanas de tiempo con
+  búsqueda binaria
+- Cada ventana se agrega en una adyacencia CSR simétrica (indptr/indices)
+  con pesos por par: llamadas en cada sentido, duración total y primera/
+  última comunicación
+
+Funcionalidades principales:
+- Vecindario a k saltos de un número (BFS sobre CSR)
+- Grado, grado ponderado y PageRank ponderado
+- Filtro por ventana de tiempo sin volver a consultar la base de datos
+
+Author: KRONOS Development Team
+Date: 2026-10-19
+"""
+
+import calendar
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+# Configurar logger específico para este módulo
+logger = logging.getLogger(__name__)
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def datetime_to_epoch(value: Optional[str]) -> Optional[int]:
+    """Convierte 'YYYY-MM-DD HH:MM:SS' (o 'YYYY-MM-DD') a segundos epoch, como strftime('%s') de SQLite"""
+    if value is None or value == '':
+        return None
+    value = str(value).strip()
+    fmt = DATETIME_FORMAT if ' ' in value else '%Y-%m-%d'
+    return calendar.timegm(datetime.strptime(value, fmt).timetuple())
+
+
+def epoch_to_datetime(value: int) -> str:
+    """Convierte segundos epoch a 'YYYY-MM-DD HH:MM:SS'"""
+    return datetime.fromtimestamp(int(value), timezone.utc).strftime(DATETIME_FORMAT)
+
+
+def _gather_positions(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Posiciones en 'indices' de todas las entradas de las filas dadas"""
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total, dtype=np.int64) - offsets + np.repeat(starts, counts)
+
+
+class GraphWindow:
+    """
+    Adyacencia CSR simétrica de los eventos de una ventana de tiempo
+
+    Para la entrada (u, v) en la posición p:
+    - calls_out[p]: llamadas de u hacia v
+    - calls_in[p]: llamadas de v hacia u
+    - duration[p]: duración total en segundos (ambos sentidos)
+    - first_seen[p] / last_seen[p]: primera y última comunicación (epoch)
+    """
+
+    def __init__(self, node_count: int, src: np.ndarray, dst: np.ndarray,
+                 ts: np.ndarray, duration: np.ndarray):
+        self.node_count = node_count
+        self.event_count = len(src)
+
+        # Las autollamadas no aportan vecinos
+        mask = src != dst
+        src, dst, ts, duration = src[mask], dst[mask], ts[mask], duration[mask]
+
+        rows = np.concatenate([src, dst]).astype(np.int64)
+        cols = np.concatenate([dst, src]).astype(np.int64)
+        outgoing = np.concatenate([np.ones(len(src), dtype=np.int64), np.zeros(len(src), dtype=np.int64)])
+        ts = np.concatenate([ts, ts])
+        duration = np.concatenate([duration, duration])
+
+        order = np.argsort(rows * node_count + cols, kind='stable')
+        rows, cols, outgoing, ts, duration = rows[order], cols[order], outgoing[order], ts[order], duration[order]
+
+        if len(rows):
+            boundaries = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+            starts = np.concatenate([[0], boundaries])
+        else:
+            starts = np.empty(0, dtype=np.int64)
+
+        self.rows = rows[starts]
+        self.indices = cols[starts]
+        self.calls_out = np.add.reduceat(outgoing, starts) if len(starts) else outgoing
+        self.calls_in = (np.diff(np.append(starts, len(rows))) - self.calls_out) if len(starts) else outgoing
+        self.duration = np.add.reduceat(duration, starts) if len(starts) else duration
+        self.first_seen = np.minimum.reduceat(ts, starts) if len(starts) else ts
+        self.last_seen = np.maximum.reduceat(ts, starts) if len(starts) else ts
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(self.rows, minlength=node_count))]).astype(np.int64)
+
+    @property
+    def calls(self) -> np.ndarray:
+        """Llamadas totales por entrada (ambos sentidos)"""
+        return self.calls_out + self.calls_in
+
+    def degree(self) -> np.ndarray:
+        """Cantidad de contactos distintos por nodo"""
+        return np.diff(self.indptr)
+
+    def weighted_degree(self) -> np.ndarray:
+        """Cantidad de llamadas por nodo (entrantes y salientes)"""
+        return np.bincount(self.rows, weights=self.calls, minlength=self.node_count).astype(np.int64)
+
+    def pagerank(self, damping: float = 0.85, max_iterations: int = 100, tolerance: float = 1e-10) -> np.ndarray:
+        """
+        PageRank ponderado por llamadas sobre la adyacencia simétrica
+
+        Los nodos sin comunicaciones en la ventana reparten su masa de manera
+        uniforme (nodos colgantes), por lo que el vector siempre suma 1.
+        """
+        n = self.node_count
+        if n == 0:
+            return np.empty(0)
+        weights = self.calls.astype(np.float64)
+        strength = np.bincount(self.rows, weights=weights, minlength=n)
+        dangling = strength == 0
+        transition = weights / np.where(strength == 0, 1.0, strength)[self.rows]
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            spread = np.bincount(self.indices, weights=transition * rank[self.rows], minlength=n)
+            updated = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            converged = np.abs(updated - rank).sum() < tolerance
+            rank = updated
+            if converged:
+                break
+        return rank
+
+    def k_hop(self, seed: int, hops: int) -> np.ndarray:
+        """
+        Distancia en saltos desde seed hasta cada nodo (-1 si no es alcanzable en 'hops')
+        """
+        distance = np.full(self.node_count, -1, dtype=np.int32)
+        distance[seed] = 0
+        frontier = np.array([seed], dtype=np.int64)
+        for hop in range(1, hops + 1):
+            neighbors = self.indices[_gather_positions(self.indptr, frontier)]
+            frontier = np.unique(neighbors[distance[neighbors] == -1])
+            if not len(frontier):
+                break
+            distance[frontier] = hop
+        return distance
+
+    def induced_edges(self, selected: np.ndarray) -> np.ndarray:
+        """Posiciones de las entradas u < v con ambos extremos seleccionados"""
+        return np.flatnonzero(selected[self.rows] & selected[self.indices] & (self.rows < self.indices))
+
+
+class CommunicationGraph:
+    """
+    Grafo de comunicaciones de una misión con eventos ordenados por fecha
+
+    La ventana completa se agrega una vez y se reutiliza; las ventanas de
+    tiempo se agregan bajo demanda a partir de un corte de los eventos.
+    """
+
+    def __init__(self, numbers: Sequence[str], src: np.ndarray, dst: np.ndarray,
+                 ts: np.ndarray, duration: np.ndarray):
+        order = np.argsort(ts, kind='stable')
+        self.numbers = np.asarray(numbers, dtype=object)
+        self.node_ids = {number: i for i, number in enumerate(self.numbers)}
+        self.src = np.asarray(src, dtype=np.int64)[order]
+        self.dst = np.asarray(dst, dtype=np.int64)[order]
+        self.ts = np.asarray(ts, dtype=np.int64)[order]
+        self.duration = np.asarray(duration, dtype=np.int64)[order]
+        self._full_window = None
+
+    @classmethod
+    def from_calls(cls, origen: Sequence[str], destino: Sequence[str],
+                   ts: Sequence[int], duration: Sequence[int]) -> 'CommunicationGraph':
+        """Construye el grafo a partir de columnas de llamadas (números, epoch, segundos)"""
+        node_ids = {}
+        src = np.fromiter((node_ids.setdefault(str(number), len(node_ids)) for number in origen),
+                          dtype=np.int64, count=len(origen))
+        dst = np.fromiter((node_ids.setdefault(str(number), len(node_ids)) for number in destino),
+                          dtype=np.int64, count=len(destino))
+        return cls(list(node_ids), src, dst, np.asarray(ts, dtype=np.int64), np.asarray(duration, dtype=np.int64))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.numbers)
+
+    @property
+    def event_count(self) -> int:
+        return len(self.ts)
+
+    def window(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> GraphWindow:
+        """
+        Adyacencia de los eventos con start_ts <= fecha <= end_ts (extremos opcionales)
+        """
+        if start_ts is None and end_ts is None:
+            if self._full_window is None:
+                self._full_window = GraphWindow(self.node_count, self.src, self.dst, self.ts, self.duration)
+            return self._full_window
+
+        lo = 0 if start_ts is None else int(np.searchsorted(self.ts, start_ts, side='left'))
+        hi = len(self.ts) if end_ts is None else int(np.searchsorted(self.ts, end_ts, side='right'))
+        return GraphWindow(self.node_count, self.src[lo:hi], self.dst[lo:hi], self.ts[lo:hi], self.duration[lo:hi])
+
+    def neighborhood(self, number: str, hops: int = 2, max_nodes: int = 100,
+                     start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Subgrafo a k saltos de un número
+
+        Si supera max_nodes se conservan los nodos más cercanos y, a igual
+        distancia, los de más llamadas.
+
+        Returns:
+            Dict con 'nodes' (id, número, saltos, grado, llamadas), 'edges'
+            (pares con pesos) y 'truncated'
+        """
+        seed = self.node_ids.get(number)
+        if seed is None:
+            return {'nodes': [], 'edges': [], 'truncated': False}
+
+        graph_window = self.window(start_ts, end_ts)
+        distance = graph_window.k_hop(seed, hops)
+        degree = graph_window.degree()
+        weighted = graph_window.weighted_degree()
+
+        reached = np.flatnonzero(distance >= 0)
+        truncated = len(reached) > max_nodes
+        if truncated:
+            reached = reached[np.lexsort((reached, -weighted[reached], distance[reached]))][:max_nodes]
+
+        selected = np.zeros(self.node_count, dtype=bool)
+        selected[reached] = True
+        positions = graph_window.induced_edges(selected)
+
+        nodes = [{
+            'id': int(node),
+            'number': self.numbers[node],
+            'hops': int(distance[node]),
+            'degree': int(degree[node]),
+            'calls': int(weighted[node])
+        } for node in sorted(reached.tolist(), key=lambda node: (distance[node], -weighted[node], node))]
+
+        edges = [{
+            'source': self.numbers[graph_window.rows[p]],
+            'target': self.numbers[graph_window.indices[p]],
+            'callsSourceToTarget': int(graph_window.calls_out[p]),
+            'callsTargetToSource': int(graph_window.calls_in[p]),
+            'durationSeconds': int(graph_window.duration[p]),
+            'firstSeen': epoch_to_datetime(graph_window.first_seen[p]),
+            'lastSeen': epoch_to_datetime(graph_window.last_seen[p])
+        } for p in positions.tolist()]
+
+        return {'nodes': nodes, 'edges': edges, 'truncated': truncated}
+
+    def centrality(self, top: int = 20, start_ts: Optional[int] = None,
+                   end_ts: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Números con mayor PageRank en la ventana, con grado y centralidad de grado
+        """
+        graph_window = self.window(start_ts, end_ts)
+        degree = graph_window.degree()
+        active = np.flatnonzero(degree > 0)
+        if not len(active):
+            return []
+
+        rank = graph_window.pagerank()
+        weighted = graph_window.weighted_degree()
+        denominator = max(len(active) - 1, 1)
+        best = active[np.lexsort((active, -rank[active]))][:top]
+
+        return [{
+            'number': self.numbers[node],
+            'degree': int(degree[node]),
+            'calls': int(weighted[node]),
+            'degreeCentrality': round(float(degree[node]) / denominator, 6),
+            'pagerank': round(float(rank[node]), 8)
+        } for node in best.tolist()]
@@ -0,0 +1,399 @@
+"""
+KRONOS Excel Reader
+===============================================================================
+Capa de lectura de archivos Excel con selección de motor.
+
+Los archivos de operadores (TIGO, WOM, CLARO) llegan como XLSX de cientos de
+miles de filas repartidas en varias pestañas. pd.read_excel convierte todas las
+columnas de la pestaña a una lista intermedia antes de construir el DataFrame;
+esta capa lee fila por fila con el motor más rápido disponible y conserva solo
+las columnas solicitadas:
+
+- 'calamine': lector en Rust (paquete opcional python-calamine)
+- 'openpyxl': openpyxl en modo read_only (streaming, siempre disponible)
+- 'pandas': pd.read_excel clásico, usado como respaldo (p. ej. archivos .xls)
+
+Características principales:
+- Selección automática del motor según disponibilidad
+- Proyección de columnas: solo se convierten las columnas solicitadas
+- Lectura por pestaña y por bloques de filas (iter_excel_chunks)
+- Mismo resultado que pd.read_excel: encabezados duplicados renombrados
+  ('col.1'), filas vacías finales descartadas, enteros sin '.0'
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+# pandas/openpyxl se importan dentro de las funciones para no cargarlos al
+# iniciar la aplicación (solo en cargas de archivos)
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Orden de preferencia de motores cuando no se especifica uno
+EXCEL_ENGINE_PREFERENCE = ('calamine', 'openpyxl')
+
+# Motores soportados por la capa de lectura
+SUPPORTED_EXCEL_ENGINES = ('calamine', 'openpyxl', 'pandas')
+
+# Filas por bloque por defecto en iter_excel_chunks
+DEFAULT_EXCEL_CHUNK_SIZE = 10000
+
+
+def _calamine_available() -> bool:
+    try:
+        import python_calamine  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_available_excel_engines() -> List[str]:
+    """
+    Retorna los motores de lectura disponibles en este entorno
+
+    Returns:
+        Lista de motores en orden de preferencia
+    """
+    engines = []
+    if _calamine_available():
+        engines.append('calamine')
+    engines.extend(['openpyxl', 'pandas'])
+    return engines
+
+
+def select_excel_engine(preferred: Optional[str] = None) -> str:
+    """
+    Selecciona el motor de lectura a usar
+
+    Args:
+        preferred: Motor solicitado (None = el más rápido disponible)
+
+    Returns:
+        Nombre del motor seleccionado
+
+    Raises:
+        ValueError: Si el motor solicitado no es soportado
+    """
+    available = get_available_excel_engines()
+
+    if preferred:
+        if preferred not in SUPPORTED_EXCEL_ENGINES:
+            raise ValueError(f"Motor de Excel no soportado: {preferred}. "
+                             f"Soportados: {', '.join(SUPPORTED_EXCEL_ENGINES)}")
+        if preferred in available:
+            return preferred
+        logger.warning(f"Motor de Excel '{preferred}' no disponible, usando el siguiente disponible")
+
+    for engine in EXCEL_ENGINE_PREFERENCE:
+        if engine in available:
+            return engine
+    return 'pandas'
+
+
+# ============================================================================
+# ADAPTADORES DE MOTOR
+# ============================================================================
+
+def _open_workbook(file_bytes: bytes, engine: str):
+    """Abre el libro con el motor indicado"""
+    if engine == 'calamine':
+        from python_calamine import CalamineWorkbook
+        return CalamineWorkbook.from_filelike(io.BytesIO(file_bytes))
+
+    import openpyxl
+    return openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True, keep_links=False)
+
+
+def _workbook_sheet_names(workbook, engine: str) -> List[str]:
+    if engine == 'calamine':
+        return list(workbook.sheet_names)
+    return list(workbook.sheetnames)
+
+
+def _iter_raw_rows(workbook, engine: str, sheet_name: str) -> Iterator[Sequence[Any]]:
+    """Itera las filas crudas de una pestaña"""
+    if engine == 'calamine':
+        sheet = workbook.get_sheet_by_name(sheet_name)
+        if hasattr(sheet, 'iter_rows'):
+            yield from sheet.iter_rows()
+        else:
+            yield from sheet.to_python(skip_empty_area=False)
+        return
+
+    worksheet = workbook[sheet_name]
+    # Algunos generadores de Excel escriben dimensiones incorrectas
+    worksheet.reset_dimensions()
+    yield from worksheet.iter_rows(values_only=True)
+
+
+def _close_workbook(workbook, engine: str) -> None:
+    if engine == 'openpyxl':
+        workbook.close()
+
+
+def _convert_cell(value: Any) -> Any:
+    """Convierte una celda igual que pandas (vacío -> '', flotante entero -> int)"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _resolve_sheet_name(sheet_names: List[str], sheet_name: Optional[Any]) -> str:
+    """Resuelve el nombre de pestaña (None = primera, int = posición)"""
+    if not sheet_names:
+        raise ValueError("El archivo Excel no contiene pestañas")
+    if sheet_name is None:
+        return sheet_names[0]
+    if isinstance(sheet_name, int):
+        if sheet_name >= len(sheet_names):
+            raise ValueError(f"Pestaña {sheet_name} fuera de rango ({len(sheet_names)} pestañas)")
+        return sheet_names[sheet_name]
+    if sheet_name not in sheet_names:
+        raise ValueError(f"Pestaña '{sheet_name}' no encontrada. Disponibles: {sheet_names}")
+    return sheet_name
+
+
+def _select_column_positions(header: List[Any], columns: Optional[Sequence[str]]) -> List[int]:
+    """
+    Posiciones de las columnas a conservar. La comparación ignora mayúsculas y
+    espacios; las columnas solicitadas que no existen se omiten.
+    """
+    if columns is None:
+        return list(range(len(header)))
+
+    wanted = {str(column).strip().lower() for column in columns}
+    return [position for position, name in enumerate(header)
+            if str(name).strip().lower() in wanted]
+
+
+def _iter_sheet_rows(workbook, engine: str, sheet_name: str,
+                     columns: Optional[Sequence[str]]) -> Tuple[List[Any], Iterator[List[Any]]]:
+    """
+    Retorna (encabezado proyectado, iterador de filas convertidas y proyectadas).
+    Las filas vacías se retienen hasta encontrar una fila con datos, de modo que
+    las filas vacías finales se descartan como en pd.read_excel.
+    """
+    raw_rows = _iter_raw_rows(workbook, engine, sheet_name)
+
+    header: List[Any] = []
+    for raw_header in raw_rows:
+        header = [_convert_cell(value) for value in raw_header]
+        while header and header[-1] == '':
+            header.pop()
+        if header:
+            break
+
+    positions = _select_column_positions(header, columns)
+    width = len(header)
+
+    def rows() -> Iterator[List[Any]]:
+        pending_blank: List[List[Any]] = []
+        for raw_row in raw_rows:
+            row_width = min(len(raw_row), width)
+            row = [_convert_cell(raw_row[position]) if position < row_width else ''
+                   for position in positions]
+            if all(value is None or value == '' for value in raw_row[:width]):
+                pending_blank.append(row)
+                continue
+            if pending_blank:
+                yield from pending_blank
+                pending_blank = []
+            yield row
+
+    return [header[position] for position in positions], rows()
+
+
+def _rows_to_dataframe(header: List[Any], rows: List[List[Any]], dtype: Optional[Any],
+                       na_filter: bool) -> 'pd.DataFrame':
+    """Construye el DataFrame con el mismo parser que usa pd.read_excel"""
+    import pandas as pd
+    from pandas.io.parsers import TextParser
+
+    if not header:
+        return pd.DataFrame()
+    return TextParser([header] + rows, header=0, dtype=dtype, na_filter=na_filter).read()
+
+
+# ============================================================================
+# API PÚBLICA
+# ============================================================================
+
+def list_excel_sheets(file_bytes: bytes, engine: Optional[str] = None) -> List[str]:
+    """
+    Lista las pestañas de un archivo Excel sin leer sus datos
+
+    Args:
+        file_bytes: Contenido del archivo Excel
+        engine: Motor de lectura (None = selección automática)
+
+    Returns:
+        Nombres de las pestañas en orden
+    """
+    engine = select_excel_engine(engine)
+    if engine == 'pandas':
+        import pandas as pd
+        return list(pd.ExcelFile(io.BytesIO(file_bytes)).sheet_names)
+
+    try:
+        workbook = _open_workbook(file_bytes, engine)
+    except Exception as e:
+        logger.warning(f"Motor '{engine}' no pudo abrir el archivo ({e}), usando pd.ExcelFile")
+        return list_excel_sheets(file_bytes, engine='pandas')
+
+    try:
+        return _workbook_sheet_names(workbook, engine)
+    finally:
+        _close_workbook(workbook, engine)
+
+
+def iter_excel_chunks(file_bytes: bytes, sheet_name: Optional[Any] = None,
+                      columns: Optional[Sequence[str]] = None,
+                      chunk_size: int = DEFAULT_EXCEL_CHUNK_SIZE,
+                      dtype: Optional[Any] = None, na_filter: bool = True,
+                      engine: Optional[str] = None) -> Iterator['pd.DataFrame']:
+    """
+    Lee una pestaña en bloques de filas, sin materializar la hoja completa
+
+    Args:
+        file_bytes: Contenido del archivo Excel
+        sheet_name: Pestaña por nombre o posición (None = primera)
+        columns: Columnas a conservar (None = todas)
+        chunk_size: Filas por bloque
+        dtype: Tipo de datos (str = todo como texto)
+        na_filter: Detectar valores vacíos como NaN
+        engine: Motor de lectura (None = selección automática)
+
+    Yields:
+        DataFrames de hasta chunk_size filas con el mismo encabezado
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser mayor que 0")
+
+    engine = select_excel_engine(engine)
+    if engine == 'pandas':
+        df = _read_with_pandas(file_bytes, sheet_name, columns, dtype, na_filter)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size].reset_index(drop=True)
+        return
+
+    workbook = _open_workbook(file_bytes, engine)
+    try:
+        resolved = _resolve_sheet_name(_workbook_sheet_names(workbook, engine), sheet_name)
+        header, rows = _iter_sheet_rows(workbook, engine, resolved, columns)
+
+        chunk: List[List[Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield _rows_to_dataframe(header, chunk, dtype, na_filter)
+                chunk = []
+        if chunk:
+            yield _rows_to_dataframe(header, chunk, dtype, na_filter)
+    finally:
+        _close_workbook(workbook, engine)
+
+
+def read_excel_sheet(file_bytes: bytes, sheet_name: Optional[Any] = None,
+                     columns: Optional[Sequence[str]] = None,
+                     dtype: Optional[Any] = None, na_filter: bool = True,
+                     engine: Optional[str] = None) -> 'pd.DataFrame':
+    """
+    Lee una pestaña completa con el motor seleccionado
+
+    Equivale a pd.read_excel(..., sheet_name, dtype, na_filter) pero solo
+    convierte las columnas solicitadas. Si el motor de streaming no puede abrir
+    el archivo (p. ej. formato .xls), se usa pd.read_excel como respaldo.
+
+    Args:
+        file_bytes: Contenido del archivo Excel
+        sheet_name: Pestaña por nombre o posición (None = primera)
+        columns: Columnas a conservar (None = todas)
+        dtype: Tipo de datos (str = todo como texto)
+        na_filter: Detectar valores vacíos como NaN
+        engine: Motor de lectura (None = selección automática)
+
+    Returns:
+        DataFrame con los datos de la pestaña
+    """
+    engine = select_excel_engine(engine)
+    if engine == 'pandas':
+        return _read_with_pandas(file_bytes, sheet_name, columns, dtype, na_filter)
+
+    try:
+        workbook = _open_workbook(file_bytes, engine)
+    except Exception as e:
+        logger.warning(f"Motor '{engine}' no pudo abrir el archivo ({e}), usando pd.read_excel")
+        return _read_with_pandas(file_bytes, sheet_name, columns, dtype, na_filter)
+
+    try:
+        resolved = _resolve_sheet_name(_workbook_sheet_names(workbook, engine), sheet_name)
+        header, rows = _iter_sheet_rows(workbook, engine, resolved, columns)
+        return _rows_to_dataframe(header, list(rows), dtype, na_filter)
+    finally:
+        _close_workbook(workbook, engine)
+
+
+def read_excel_sheets(file_bytes: bytes, columns: Optional[Sequence[str]] = None,
+                      dtype: Optional[Any] = None, na_filter: bool = True,
+                      engine: Optional[str] = None) -> Iterator[Tuple[str, 'pd.DataFrame']]:
+    """
+    Lee las pestañas de un archivo una por una, abriendo el libro una sola vez
+
+    Args:
+        file_bytes: Contenido del archivo Excel
+        columns: Columnas a conservar (None = todas)
+        dtype: Tipo de datos (str = todo como texto)
+        na_filter: Detectar valores vacíos como NaN
+        engine: Motor de lectura (None = selección automática)
+
+    Yields:
+        Tuplas (nombre de pestaña, DataFrame)
+    """
+    engine = select_excel_engine(engine)
+    if engine == 'pandas':
+        import pandas as pd
+        excel_file = pd.ExcelFile(io.BytesIO(file_bytes))
+        for name in excel_file.sheet_names:
+            yield name, _project_columns(pd.read_excel(excel_file, sheet_name=name, dtype=dtype,
+                                                       na_filter=na_filter), columns)
+        return
+
+    workbook = _open_workbook(file_bytes, engine)
+    try:
+        for name in _workbook_sheet_names(workbook, engine):
+            header, rows = _iter_sheet_rows(workbook, engine, name, columns)
+            yield name, _rows_to_dataframe(header, list(rows), dtype, na_filter)
+    finally:
+        _close_workbook(workbook, engine)
+
+
+def _project_columns(df: 'pd.DataFrame', columns: Optional[Sequence[str]]) -> 'pd.DataFrame':
+    if columns is None:
+        return df
+    positions = _select_column_positions(list(df.columns), columns)
+    return df.iloc[:, positions]
+
+
+def _read_with_pandas(file_bytes: bytes, sheet_name: Optional[Any], columns: Optional[Sequence[str]],
+                      dtype: Optional[Any], na_filter: bool) -> 'pd.DataFrame':
+    import pandas as pd
+    df = pd.read_excel(io.BytesIO(file_bytes), sheet_name=sheet_name if sheet_name is not None else 0,
+                       dtype=dtype, na_filter=na_filter)
+    return _project_columns(df, columns)
+
+
+def get_excel_reader_info() -> Dict[str, Any]:
+    """Retorna el motor seleccionado y los disponibles (diagnóstico)"""
+    return {
+        'selected': select_excel_engine(),
+        'available': get_available_excel_engines(),
+        'preference': list(EXCEL_ENGINE_PREFERENCE)
+    }
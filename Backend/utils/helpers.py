@@ -15,17 +15,24 @@ Características principales:
 ===============================================================================
 """
 
+from __future__ import annotations
+
 import base64
 import io
 import json
 import secrets
 import string
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union, Tuple
-import pandas as pd
+from typing import Dict, Any, List, Optional, Union, Tuple, Iterator, TYPE_CHECKING
 from pathlib import Path
 import logging
 
+# pandas/numpy se importan dentro de las funciones que los usan para no
+# cargarlos al iniciar la aplicación (solo en cargas y análisis)
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -214,13 +221,16 @@ def _normalize_line_terminators(file_bytes: bytes) -> bytes:
         return file_bytes
 
 
-def read_excel_file(file_bytes: bytes, sheet_name: Optional[str] = None) -> pd.DataFrame:
+def read_excel_file(file_bytes: bytes, sheet_name: Optional[str] = None,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
-    Lee archivo Excel desde bytes usando pandas
+    Lee archivo Excel desde bytes con el motor más rápido disponible
+    (ver utils.excel_reader)
     
     Args:
         file_bytes: Contenido del archivo Excel
         sheet_name: Nombre de la hoja específica (opcional)
+        columns: Columnas a leer (opcional, None = todas)
         
     Returns:
         DataFrame con los datos
@@ -228,16 +238,10 @@ def read_excel_file(file_bytes: bytes, sheet_name: Optional[str] = None) -> pd.D
     Raises:
         ValueError: Si hay error leyendo el archivo
     """
+    from utils.excel_reader import read_excel_sheet
+    
     try:
-        file_obj = create_file_like_object(file_bytes)
-        
-        # Leer con pandas
-        if sheet_name:
-            df = pd.read_excel(file_obj, sheet_name=sheet_name)
-        else:
-            df = pd.read_excel(file_obj)
-        
-        return df
+        return read_excel_sheet(file_bytes, sheet_name=sheet_name or None, columns=columns)
         
     except Exception as e:
         logger.error(f"Error leyendo archivo Excel: {e}")
@@ -259,6 +263,8 @@ def read_csv_file(file_bytes: bytes, **kwargs) -> pd.DataFrame:
     Raises:
         ValueError: Si hay error leyendo el archivo
     """
+    import pandas as pd
+    
     try:
         # CORRECCIÓN CRÍTICA: Detectar y normalizar line terminators
         normalized_bytes = _normalize_line_terminators(file_bytes)
@@ -313,6 +319,8 @@ def clean_dataframe(df: pd.DataFrame, required_columns: List[str]) -> pd.DataFra
     Raises:
         ValueError: Si faltan columnas requeridas
     """
+    import pandas as pd
+    
     # Verificar columnas requeridas
     missing_columns = set(required_columns) - set(df.columns)
     if missing_columns:
@@ -622,6 +630,33 @@ def safe_get_nested(data: Dict[str, Any], keys: List[str], default: Any = None)
         return default
 
 
+def calculate_bounding_box(lat: float, lon: float, radius_m: float) -> Dict[str, float]:
+    """
+    Calcula el rectángulo de coordenadas que contiene un círculo de radio dado
+    
+    Args:
+        lat, lon: Centro del círculo en grados decimales
+        radius_m: Radio en metros
+        
+    Returns:
+        Diccionario con min_lat, max_lat, min_lon, max_lon
+    """
+    import math
+    
+    # Un grado de latitud equivale a ~111.32 km en cualquier punto
+    delta_lat = radius_m / 111320.0
+    # Un grado de longitud se reduce con el coseno de la latitud (limitado cerca de los polos)
+    cos_lat = max(math.cos(math.radians(lat)), 0.01)
+    delta_lon = radius_m / (111320.0 * cos_lat)
+    
+    return {
+        'min_lat': max(lat - delta_lat, -90.0),
+        'max_lat': min(lat + delta_lat, 90.0),
+        'min_lon': max(lon - delta_lon, -180.0),
+        'max_lon': min(lon + delta_lon, 180.0)
+    }
+
+
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calcula distancia aproximada entre dos puntos geográficos (fórmula haversine simplificada)
@@ -652,4 +687,160 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     # Radio de la Tierra en km
     r = 6371
     
-    return c * r
\ No newline at end of file
+    return c * r
+
+
+# ============================================================================
+# DISTANCIAS VECTORIZADAS (NumPy)
+# ============================================================================
+
+EARTH_RADIUS_KM = 6371.0
+# Elementos máximos por bloque de la matriz de distancias (~32 MB en float64)
+DISTANCE_BLOCK_ELEMENTS = 4_000_000
+
+
+def _to_radians(lats, lons) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte coordenadas en grados a arreglos float64 en radianes"""
+    import numpy as np
+    return (np.radians(np.asarray(lats, dtype=np.float64)),
+            np.radians(np.asarray(lons, dtype=np.float64)))
+
+
+def _haversine_term(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2) -> np.ndarray:
+    """Término 'a' de la fórmula haversine (monótono con la distancia)"""
+    import numpy as np
+    a = np.sin((lat2 - lat1) * 0.5) ** 2 + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) * 0.5) ** 2
+    return np.minimum(a, 1.0, out=a)
+
+
+def _haversine_term_to_km(a: np.ndarray) -> np.ndarray:
+    """Convierte el término 'a' de haversine a kilómetros"""
+    import numpy as np
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def calculate_distances_to_point(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """
+    Calcula la distancia de un punto a muchos puntos (uno a muchos)
+    
+    Args:
+        lat, lon: Coordenadas del punto de referencia
+        lats, lons: Secuencias o arreglos de coordenadas destino
+        
+    Returns:
+        Arreglo de distancias en kilómetros, mismo orden que lats/lons
+    """
+    import numpy as np
+    lat_rad, lon_rad = np.radians([float(lat), float(lon)])
+    lats_rad, lons_rad = _to_radians(lats, lons)
+    a = _haversine_term(lat_rad, lon_rad, np.cos(lat_rad), lats_rad, lons_rad, np.cos(lats_rad))
+    return _haversine_term_to_km(a)
+
+
+def iter_distance_matrix_blocks(lats1, lons1, lats2, lons2,
+                                max_block_elements: int = DISTANCE_BLOCK_ELEMENTS
+                                ) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Genera la matriz de distancias entre dos conjuntos de puntos por bloques de filas
+    
+    Cada bloque tiene a lo sumo max_block_elements elementos, por lo que la
+    memoria usada no depende del tamaño total de la matriz.
+    
+    Args:
+        lats1, lons1: Coordenadas del primer conjunto (filas)
+        lats2, lons2: Coordenadas del segundo conjunto (columnas)
+        max_block_elements: Máximo de elementos por bloque
+        
+    Yields:
+        Tuplas (fila_inicial, bloque) con bloque de forma (filas, len(lats2)) en kilómetros
+    """
+    for start, a in _iter_haversine_term_blocks(lats1, lons1, lats2, lons2, max_block_elements):
+        yield start, _haversine_term_to_km(a)
+
+
+def _iter_haversine_term_blocks(lats1, lons1, lats2, lons2,
+                                max_block_elements: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Genera bloques de filas del término 'a' de haversine"""
+    import numpy as np
+    lats1_rad, lons1_rad = _to_radians(lats1, lons1)
+    lats2_rad, lons2_rad = _to_radians(lats2, lons2)
+    cos_lat1 = np.cos(lats1_rad)
+    cos_lat2 = np.cos(lats2_rad)
+    
+    block_rows = max(1, int(max_block_elements) // max(len(lats2_rad), 1))
+    for start in range(0, len(lats1_rad), block_rows):
+        end = start + block_rows
+        yield start, _haversine_term(
+            lats1_rad[start:end, None], lons1_rad[start:end, None], cos_lat1[start:end, None],
+            lats2_rad[None, :], lons2_rad[None, :], cos_lat2[None, :]
+        )
+
+
+def _to_unit_vectors(lats, lons) -> np.ndarray:
+    """Convierte coordenadas en grados a vectores unitarios 3D (n, 3)"""
+    import numpy as np
+    lats_rad, lons_rad = _to_radians(lats, lons)
+    cos_lat = np.cos(lats_rad)
+    return np.column_stack((cos_lat * np.cos(lons_rad), cos_lat * np.sin(lons_rad), np.sin(lats_rad)))
+
+
+def find_nearest_points(lats1, lons1, lats2, lons2,
+                        max_block_elements: int = DISTANCE_BLOCK_ELEMENTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encuentra, para cada punto del primer conjunto, el punto más cercano del segundo
+    
+    Ejemplo: para cada celda de operador, el punto HUNTER más cercano de la misión.
+    
+    El más cercano es el de mayor producto punto entre vectores unitarios
+    (equivalente al menor ángulo), que se calcula por bloques como producto
+    de matrices; la distancia del par elegido se recalcula con haversine.
+    
+    Args:
+        lats1, lons1: Coordenadas de los puntos a resolver
+        lats2, lons2: Coordenadas de los candidatos (no vacío)
+        max_block_elements: Máximo de elementos por bloque
+        
+    Returns:
+        Tupla (índices en el segundo conjunto, distancias en kilómetros)
+    """
+    import numpy as np
+    if len(lats2) == 0:
+        raise ValueError("El conjunto de candidatos no puede estar vacío")
+    
+    vectors1 = _to_unit_vectors(lats1, lons1)
+    vectors2_t = np.ascontiguousarray(_to_unit_vectors(lats2, lons2).T)
+    
+    indices = np.empty(len(vectors1), dtype=np.int64)
+    block_rows = max(1, int(max_block_elements) // len(vectors2_t[0]))
+    for start in range(0, len(vectors1), block_rows):
+        block = vectors1[start:start + block_rows] @ vectors2_t
+        indices[start:start + len(block)] = np.argmax(block, axis=1)
+    
+    lats1_rad, lons1_rad = _to_radians(lats1, lons1)
+    lats2_rad, lons2_rad = _to_radians(np.asarray(lats2)[indices], np.asarray(lons2)[indices])
+    a = _haversine_term(lats1_rad, lons1_rad, np.cos(lats1_rad), lats2_rad, lons2_rad, np.cos(lats2_rad))
+    return indices, _haversine_term_to_km(a)
+
+
+def count_points_within_distance(lats1, lons1, lats2, lons2, radius_km: float,
+                                 max_block_elements: int = DISTANCE_BLOCK_ELEMENTS) -> np.ndarray:
+    """
+    Cuenta, para cada punto del primer conjunto, los puntos del segundo a menos de radius_km
+    
+    Args:
+        lats1, lons1: Coordenadas de los puntos a resolver
+        lats2, lons2: Coordenadas de los candidatos
+        radius_km: Radio en kilómetros
+        max_block_elements: Máximo de elementos por bloque
+        
+    Returns:
+        Arreglo de conteos, mismo orden que lats1/lons1
+    """
+    import numpy as np
+    # Comparar contra el término 'a' equivalente evita arcsin/sqrt por elemento
+    threshold = np.sin(min(radius_km / (2 * EARTH_RADIUS_KM), np.pi / 2)) ** 2
+    counts = np.zeros(len(lats1), dtype=np.int64)
+    for start, a in _iter_haversine_term_blocks(lats1, lons1, lats2, lons2, max_block_elements):
+        counts[start:start + len(a)] = np.count_nonzero(a <= threshold, axis=1)
+    return counts
+
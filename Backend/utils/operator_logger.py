@@ -282,8 +282,9 @@ class OperatorLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
         
-        # Inicializar contexto de procesamiento
-        self._current_context = {}
+        # Contexto de procesamiento por hilo: la instancia se comparte
+        # entre solicitudes Eel concurrentes
+        self._context_local = threading.local()
         
         # Evitar configuración duplicada
         if self.logger.handlers:
@@ -332,6 +333,13 @@ class OperatorLogger:
         except Exception as e:
             self.logger.warning(f"No se pudo configurar DatabaseLogHandler: {e}")
     
+    @property
+    def _current_context(self) -> Dict[str, Any]:
+        """Contexto de procesamiento del hilo actual."""
+        if not hasattr(self._context_local, 'context'):
+            self._context_local.context = {}
+        return self._context_local.context
+    
     def set_context(self, **kwargs) -> None:
         """
         Establece el contexto actual para todos los logs siguientes.
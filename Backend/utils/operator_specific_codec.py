@@ -0,0 +1,179 @@
+"""
+KRONOS Operator Specific Data Codec
+=====================================
+Almacenamiento compacto de operator_specific_data.
+
+Cada fila guardaba un JSON completo con todos los campos originales no
+mapeados, repitiendo en cada registro los nombres de campo y los metadatos
+constantes del archivo. Con este codec:
+
+- Cada archivo (file_upload_id) tiene un diccionario de campos en
+  operator_specific_fields: lista de [ruta, valor por defecto], donde el valor
+  por defecto es el primero observado
+- Cada fila guarda solo los valores que difieren del valor por defecto, por
+  posición: {"_n": 12, "3": "valor", "7": null}
+  "_n" es la cantidad de campos del diccionario al empaquetar la fila y "_a"
+  lista las posiciones ausentes en la fila
+- El resultado sigue siendo JSON válido (restricción json_valid del esquema)
+  y las filas antiguas con JSON completo se leen sin cambios
+
+El diccionario solo crece (nuevos campos se agregan al final), por lo que las
+filas empaquetadas antes siguen siendo válidas con la versión más reciente.
+
+Author: KRONOS Development Team
+Date: 2026-10-19
+"""
+
+import copy
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+# Configurar logger específico para este módulo
+logger = logging.getLogger(__name__)
+
+FIELD_DICTIONARY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS operator_specific_fields (
+        file_upload_id TEXT PRIMARY KEY,
+        fields TEXT NOT NULL CHECK (json_valid(fields) = 1),
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+COUNT_KEY = '_n'
+ABSENT_KEY = '_a'
+
+
+def _flatten(value: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], Any]]:
+    """Pares (ruta, valor) de las hojas de un diccionario anidado (dict vacío y listas son hojas)"""
+    leaves = []
+    for key, item in value.items():
+        path = prefix + (str(key),)
+        if isinstance(item, dict) and item:
+            leaves.extend(_flatten(item, path))
+        else:
+            leaves.append((path, item))
+    return leaves
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Igualdad estricta (True no es igual a 1)"""
+    return type(a) is type(b) and a == b
+
+
+class OperatorSpecificDataPacker:
+    """
+    Diccionario de campos de un archivo y empaquetado de sus filas
+
+    Se crea una instancia por archivo; save() persiste el diccionario y debe
+    llamarse en la misma transacción que las filas empaquetadas.
+    """
+
+    def __init__(self, file_upload_id: str, fields: Optional[List[List[Any]]] = None):
+        self.file_upload_id = file_upload_id
+        self.fields = [[list(path), default] for path, default in (fields or [])]
+        self._positions = {tuple(path): i for i, (path, _) in enumerate(self.fields)}
+        self._saved_count = len(self.fields)
+
+    @classmethod
+    def load(cls, cursor, file_upload_id: str) -> 'OperatorSpecificDataPacker':
+        """Crea el empaquetador continuando el diccionario guardado del archivo (si existe)"""
+        return cls(file_upload_id, load_field_dictionary(cursor, file_upload_id))
+
+    @property
+    def dirty(self) -> bool:
+        """El diccionario tiene campos sin guardar"""
+        return len(self.fields) != self._saved_count
+
+    def pack(self, value: Any) -> Any:
+        """
+        Empaqueta un operator_specific_data (JSON o dict)
+
+        Returns:
+            JSON compacto, o el valor original si no es un objeto JSON
+        """
+        if value is None or value == '':
+            return value
+        try:
+            data = json.loads(value) if isinstance(value, str) else value
+        except (TypeError, ValueError):
+            return value
+        if not isinstance(data, dict) or COUNT_KEY in data:
+            return value
+
+        compact = {}
+        present = set()
+        for path, leaf in _flatten(data):
+            position = self._positions.get(path)
+            if position is None:
+                # Campo nuevo: su primer valor queda como valor por defecto
+                position = len(self.fields)
+                self._positions[path] = position
+                self.fields.append([list(path), leaf])
+            elif not _same_value(leaf, self.fields[position][1]):
+                compact[str(position)] = leaf
+            present.add(position)
+
+        absent = [i for i in range(len(self.fields)) if i not in present]
+        packed = {COUNT_KEY: len(self.fields)}
+        if absent:
+            packed[ABSENT_KEY] = absent
+        packed.update(compact)
+        return json.dumps(packed, ensure_ascii=False, separators=(',', ':'), default=str)
+
+    def save(self, cursor) -> None:
+        """Guarda el diccionario del archivo si cambió (cursor sqlite3)"""
+        if not self.dirty:
+            return
+        cursor.execute(FIELD_DICTIONARY_SCHEMA)
+        cursor.execute("""
+            INSERT INTO operator_specific_fields (file_upload_id, fields, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(file_upload_id) DO UPDATE SET
+                fields = excluded.fields,
+                updated_at = excluded.updated_at
+        """, (self.file_upload_id, json.dumps(self.fields, ensure_ascii=False, default=str)))
+        self._saved_count = len(self.fields)
+
+
+def load_field_dictionary(cursor, file_upload_id: str) -> Optional[List[List[Any]]]:
+    """Diccionario de campos guardado de un archivo, o None si no tiene"""
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='operator_specific_fields'"
+    )
+    if not cursor.fetchone():
+        return None
+    cursor.execute("SELECT fields FROM operator_specific_fields WHERE file_upload_id = ?", (file_upload_id,))
+    row = cursor.fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def expand_operator_specific_data(value: Any, fields: Optional[List[List[Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    Reconstruye el operator_specific_data completo de una fila
+
+    Args:
+        value: Valor guardado (JSON empaquetado o JSON completo de filas antiguas)
+        fields: Diccionario de campos del archivo
+
+    Returns:
+        Diccionario con los datos específicos del operador, o None
+    """
+    if value is None or value == '':
+        return None
+    data = json.loads(value) if isinstance(value, str) else value
+    if not isinstance(data, dict) or COUNT_KEY not in data:
+        return data
+    if fields is None:
+        raise ValueError("operator_specific_data empaquetado sin diccionario de campos")
+
+    absent = set(data.get(ABSENT_KEY, ()))
+    expanded = {}
+    for position, (path, default) in enumerate(fields[:data[COUNT_KEY]]):
+        if position in absent:
+            continue
+        target = expanded
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = data[str(position)] if str(position) in data else copy.deepcopy(default)
+    return expanded
@@ -12,7 +12,7 @@ import NotificationSystem from './components/ui/NotificationSystem';
 import { ConfirmationProvider } from './hooks/useConfirmation';
 
 import type { User, Role, Mission } from './types';
-import { getUsers, getRoles, getMissions, resetMockData } from './services/api';
+import { getUsers, getRoles, getAllMissionsSummary, resetMockData } from './services/api';
 import { useNotification } from './hooks/useNotification';
 
 const AppContent: React.FC<{ onLogout: () => void }> = ({ onLogout }) => {
@@ -33,7 +33,8 @@ const AppContent: React.FC<{ onLogout: () => void }> = ({ onLogout }) => {
                 const [usersData, rolesData, missionsData] = await Promise.all([
                     getUsers(),
                     getRoles(),
-                    getMissions(),
+                    // Listado liviano: los datos celulares se cargan al abrir cada misión
+                    getAllMissionsSummary(),
                 ]);
                 setUsers(usersData);
                 setRoles(rolesData);
@@ -14,7 +14,7 @@ import TableCorrelationModal from '../components/ui/TableCorrelationModal';
 import ActionButton from '../components/ui/ActionButton';
 import { OperatorDataUpload, OperatorSheetsManager, OperatorDataViewer } from '../components/operator-data';
 import { ICONS } from '../constants';
-import { uploadCellularData, clearCellularDataApi, runAnalysis, getOperatorSheets, deleteOperatorSheet, analyzeCorrelation } from '../services/api';
+import { uploadCellularData, clearCellularDataApi, getAllMissionCellularData, runAnalysis, getOperatorSheets, deleteOperatorSheet, analyzeCorrelation } from '../services/api';
 import { useNotification } from '../hooks/useNotification';
 import { useConfirmation, confirmationPresets } from '../hooks/useConfirmation';
 import { useProcessingOverlay } from '../hooks/useProcessingOverlay';
@@ -45,6 +45,7 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
     const [isAnalysisRunning, setIsAnalysisRunning] = useState(false);
     const [operatorSheets, setOperatorSheets] = useState<OperatorSheet[]>([]);
     const [isLoadingOperatorSheets, setIsLoadingOperatorSheets] = useState(false);
+    const [isLoadingCellularData, setIsLoadingCellularData] = useState(false);
     
     // Estados para análisis de correlación
     const [correlationResults, setCorrelationResults] = useState<CorrelationResult[]>([]);
@@ -87,6 +88,28 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
         }
     }, [mission?.id]);
 
+    // El listado de misiones es liviano: los datos celulares se cargan al abrir la misión
+    useEffect(() => {
+        if (mission?.id && mission.cellularData === undefined) {
+            loadCellularData(mission.id);
+        }
+    }, [mission?.id]);
+
+    const loadCellularData = async (targetMissionId: string) => {
+        setIsLoadingCellularData(true);
+        try {
+            const cellularData = await getAllMissionCellularData(targetMissionId);
+            setMissions(currentMissions =>
+                currentMissions.map(m => m.id === targetMissionId ? { ...m, cellularData, cellularRecordsCount: cellularData.length } : m)
+            );
+        } catch (error) {
+            console.error('Error al cargar datos celulares:', error);
+            showError("Error de Carga", `No se pudieron cargar los datos celulares: ${(error as Error).message}`);
+        } finally {
+            setIsLoadingCellularData(false);
+        }
+    };
+
     const loadOperatorSheets = async () => {
         if (!mission?.id) return;
         
@@ -111,20 +134,24 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
         if (mission) {
             const startTime = Date.now();
             try {
-                const updatedMission = await uploadCellularData(mission.id, file);
+                const { uploadSummary, ...updatedMission } = await uploadCellularData(mission.id, file);
                 const processingTime = Date.now() - startTime;
                 
                 // Crear resultado del procesamiento para la notificación
                 const result: FileProcessingResult = {
                     fileName: file.name,
                     fileType: 'SCANHUNTER',
-                    processedRecords: updatedMission.cellularData?.length || 0,
+                    processedRecords: uploadSummary.recordsInserted,
                     failedRecords: 0,
+                    duplicatedRecords: uploadSummary.recordsSkipped,
+                    totalRecords: uploadSummary.recordsProcessed,
                     processingTime
                 };
                 
                 showFileProcessingResult(result, true);
-                updateMissionState(updatedMission);
+                // La respuesta ya no trae cellularData: se recarga desde get_mission_cellular_data
+                updateMissionState({ ...updatedMission, cellularData: undefined });
+                await loadCellularData(updatedMission.id);
             } catch (error) {
                 const processingTime = Date.now() - startTime;
                 console.error('Error al subir datos celulares:', error);
@@ -147,7 +174,7 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
     const handleClearCellularData = async () => {
         if (!mission) return;
         
-        const recordCount = mission.cellularData?.length || 0;
+        const recordCount = mission.cellularData?.length ?? mission.cellularRecordsCount ?? 0;
         const confirmed = await showConfirmation(
             confirmationPresets.clearCellularData(recordCount)
         );
@@ -500,7 +527,9 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
                 {/* Indicadores estadísticos */}
                 <CellularDataStats data={mission.cellularData || []} />
                 
-                {hasData ? (
+                {isLoadingCellularData && !hasData ? (
+                    <p className="text-center text-medium py-8">Cargando datos celulares...</p>
+                ) : hasData ? (
                     <div className="overflow-x-auto">
                         <Table headers={['ID BD', 'ID Archivo', 'Punto', 'Coordenadas', 'MNC/MCC', 'Operador', 'RSSI', 'Tecnología', 'Cell ID', 'LAC/TAC', 'eNB', 'Canal', 'Comentario']}>
                             {mission.cellularData!.map(d => (
@@ -586,7 +615,7 @@ const MissionDetail: React.FC<MissionDetailProps> = ({ missions, setMissions })
                             <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
                                 <div className="bg-secondary-light p-4 rounded-md">
                                     <p className="text-sm text-medium">Registros de Datos Celulares</p>
-                                    <p className="text-2xl font-bold text-light">{mission.cellularData?.length || 0}</p>
+                                    <p className="text-2xl font-bold text-light">{mission.cellularData?.length ?? mission.cellularRecordsCount ?? 0}</p>
                                 </div>
                                 <div className="bg-secondary-light p-4 rounded-md">
                                     <p className="text-sm text-medium">Archivos de Operador</p>
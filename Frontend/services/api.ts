@@ -1,4 +1,4 @@
-import type { Mission, User, Role, Permissions, OperatorSheet, OperatorCellularRecord, OperatorUploadResponse, TargetRecord, CorrelationResult, CorrelationAnalysisResponse } from '../types';
+import type { Mission, CellularDataRecord, CellularUploadResponse, PagedResponse, User, Role, Permissions, OperatorSheet, OperatorSheetCursor, OperatorSheetQueryOptions, OperatorCellularRecord, OperatorUploadResponse, TargetRecord, CorrelationResult, CorrelationAnalysisResponse, ColumnarPayload, ResponseFormat } from '../types';
 import { initialUsers, initialRoles, initialMissions } from './mockData';
 
 // Eel types for better autocompletion, assuming eel is exposed to window
@@ -20,25 +20,27 @@ declare global {
             
             // Missions
             get_missions(): () => Promise<Mission[]>;
+            get_missions_summary(page: number, pageSize: number, search: string | null): () => Promise<PagedResponse<Mission>>;
+            get_mission_cellular_data(missionId: string, page: number, pageSize: number): () => Promise<PagedResponse<CellularDataRecord>>;
             create_mission(missionData: Omit<Mission, 'id' | 'cellularData' | 'operatorData'>): () => Promise<Mission>;
             update_mission(missionId: string, missionData: Partial<Mission>): () => Promise<Mission>;
             delete_mission(missionId: string): () => Promise<{ status: string }>;
             
             // Cellular Data (existing)
-            upload_cellular_data(missionId: string, fileData: {name: string, content: string}): () => Promise<Mission>;
+            upload_cellular_data(missionId: string, fileData: {name: string, content: string}): () => Promise<CellularUploadResponse>;
             clear_cellular_data(missionId: string): () => Promise<Mission>;
             
             // Analysis
             run_analysis(missionId: string): () => Promise<TargetRecord[]>;
             
             // Correlation Analysis
-            analyze_correlation(missionId: string, startDateTime: string, endDateTime: string, minOccurrences: number): () => Promise<CorrelationAnalysisResponse>;
+            analyze_correlation(missionId: string, startDateTime: string, endDateTime: string, minOccurrences: number, responseFormat?: ResponseFormat): () => Promise<CorrelationAnalysisResponse>;
             get_correlation_summary(missionId: string): () => Promise<any>;
             
             // Operator Data
             upload_operator_data(file_data: string, file_name: string, mission_id: string, operator: string, file_type: string, user_id: string): () => Promise<OperatorUploadResponse>;
             get_operator_sheets(missionId: string): () => Promise<OperatorSheet[]>;
-            get_operator_sheet_data(sheetId: string, page: number, pageSize: number): () => Promise<{data: OperatorCellularRecord[], total: number, hasMore: boolean, columns?: string[], displayNames?: {[key: string]: string}}>;
+            get_operator_sheet_data(sheetId: string, page: number, pageSize: number, pageCursor?: OperatorSheetCursor | null, sortBy?: string, sortDir?: 'asc' | 'desc', filters?: {[column: string]: string}, responseFormat?: ResponseFormat): () => Promise<{data: OperatorCellularRecord[] | ColumnarPayload, total: number | null, hasMore: boolean, nextCursor?: OperatorSheetCursor | null, columns?: string[], displayNames?: {[key: string]: string}}>;
             delete_operator_sheet(file_upload_id: string, user_id: string): () => Promise<{status: string}>;
             get_operator_statistics(mission_id?: string): () => Promise<{success: boolean, statistics: any, totals: any, mission_id?: string, error?: string}>;
         }
@@ -229,6 +231,27 @@ export function getRequestManager(): RequestCancellationManager {
 const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 const generateId = () => `id_${new Date().getTime()}_${Math.random().toString(36).substr(2, 9)}`;
 
+export const isColumnarPayload = (data: unknown): data is ColumnarPayload =>
+    !!data && !Array.isArray(data) && (data as ColumnarPayload).format === 'columnar';
+
+/**
+ * Convierte una respuesta columnar en la lista de registros equivalente
+ */
+export function decodeColumnar<T = Record<string, any>>(payload: ColumnarPayload): T[] {
+    const columns = payload.columns.map(name => {
+        const values = payload.values[name];
+        const dictionary = payload.dictionaries[name];
+        return dictionary ? values.map(code => (code === null ? null : dictionary[code])) : values;
+    });
+    const records: T[] = [];
+    for (let row = 0; row < payload.rowCount; row++) {
+        const record: Record<string, any> = {};
+        payload.columns.forEach((name, i) => { record[name] = columns[i][row]; });
+        records.push(record as T);
+    }
+    return records;
+}
+
 /**
  * Maneja las respuestas de Eel con mejor gestión de errores, cancellation y fallback automático
  */
@@ -446,6 +469,68 @@ export const getMissions = async () => {
     return handleEelResponse(() => window.eel.get_missions()(), 'obtener misiones');
 };
 
+// Tamaños máximos aceptados por el backend (MAX_MISSIONS_PAGE_SIZE / MAX_CELLULAR_PAGE_SIZE)
+export const MISSIONS_PAGE_SIZE = 500;
+export const CELLULAR_DATA_PAGE_SIZE = 5000;
+
+export const getMissionsSummary = async (page: number = 1, pageSize: number = 50, search?: string): Promise<PagedResponse<Mission>> => {
+    if (USE_MOCK_API) {
+        await sleep(MOCK_API_DELAY);
+        const term = (search || '').toLowerCase();
+        const filtered = mockMissions.filter(m => !term || [m.code, m.name, m.description].some(v => (v || '').toLowerCase().includes(term)));
+        const startIndex = (page - 1) * pageSize;
+        const data = filtered.slice(startIndex, startIndex + pageSize).map(({ cellularData, operatorSheets, ...mission }) => ({
+            ...mission,
+            cellularRecordsCount: cellularData?.length || 0,
+        }));
+        console.log('🎯 Obteniendo resumen de misiones mock:', data.length, 'misiones, página:', page);
+        return { data, total: filtered.length, hasMore: startIndex + data.length < filtered.length, page, pageSize };
+    }
+    return handleEelResponse(() => window.eel.get_missions_summary(page, pageSize, search ?? null)(), 'obtener resumen de misiones');
+};
+
+// Recorre todas las páginas del listado liviano (sin datos celulares)
+export const getAllMissionsSummary = async (pageSize: number = MISSIONS_PAGE_SIZE): Promise<Mission[]> => {
+    const missions: Mission[] = [];
+    let page = 1;
+    let hasMore = true;
+    while (hasMore) {
+        const response = await getMissionsSummary(page, pageSize);
+        missions.push(...response.data);
+        hasMore = response.hasMore && response.data.length > 0;
+        page++;
+    }
+    return missions;
+};
+
+export const getMissionCellularData = async (missionId: string, page: number = 1, pageSize: number = 1000): Promise<PagedResponse<CellularDataRecord>> => {
+    if (USE_MOCK_API) {
+        await sleep(MOCK_API_DELAY);
+        const mission = mockMissions.find(m => m.id === missionId);
+        if (!mission) throw new Error("Misión no encontrada");
+        const records = mission.cellularData || [];
+        const startIndex = (page - 1) * pageSize;
+        const data = JSON.parse(JSON.stringify(records.slice(startIndex, startIndex + pageSize)));
+        console.log('📡 Obteniendo datos celulares mock:', missionId, 'página:', page, 'registros:', data.length);
+        return { data, total: records.length, hasMore: startIndex + data.length < records.length, page, pageSize };
+    }
+    return handleEelResponse(() => window.eel.get_mission_cellular_data(missionId, page, pageSize)(), 'obtener datos celulares');
+};
+
+// Carga completa de los datos celulares de una misión, página por página
+export const getAllMissionCellularData = async (missionId: string, pageSize: number = CELLULAR_DATA_PAGE_SIZE): Promise<CellularDataRecord[]> => {
+    const records: CellularDataRecord[] = [];
+    let page = 1;
+    let hasMore = true;
+    while (hasMore) {
+        const response = await getMissionCellularData(missionId, page, pageSize);
+        records.push(...response.data);
+        hasMore = response.hasMore && response.data.length > 0;
+        page++;
+    }
+    return records;
+};
+
 export const createMission = async (missionData: Omit<Mission, 'id' | 'cellularData'>) => {
     if (USE_MOCK_API) {
         await sleep(MOCK_API_DELAY);
@@ -480,14 +565,29 @@ export const deleteMission = async (missionId: string) => {
     return handleEelResponse(() => window.eel.delete_mission(missionId)(), 'eliminar misión');
 };
 
-export const uploadCellularData = async (missionId: string, file: File) => {
+export const uploadCellularData = async (missionId: string, file: File): Promise<CellularUploadResponse> => {
     if (USE_MOCK_API) {
         await sleep(MOCK_API_DELAY * 2);
         const missionIndex = mockMissions.findIndex(m => m.id === missionId);
         if (missionIndex === -1) throw new Error("Misión no encontrada");
+        const recordsDeleted = mockMissions[missionIndex].cellularData?.length || 0;
         mockMissions[missionIndex].cellularData = initialMissions[0].cellularData;
+        const recordsInserted = mockMissions[missionIndex].cellularData?.length || 0;
         console.log('📡 Datos celulares mock cargados:', file.name);
-        return mockMissions[missionIndex];
+        const { cellularData, ...mission } = mockMissions[missionIndex];
+        return {
+            ...mission,
+            cellularRecordsCount: recordsInserted,
+            uploadSummary: {
+                mode: 'replace',
+                recordsProcessed: recordsInserted,
+                recordsInserted,
+                recordsSkipped: 0,
+                recordsDeleted,
+                affectedOperators: [],
+                processingTime: 0,
+            },
+        };
     }
     const content = await toBase64(file);
     return handleEelResponse(() => window.eel.upload_cellular_data(missionId, { name: file.name, content })(), 'cargar datos celulares');
@@ -686,7 +786,7 @@ function mapBackendStatus(backendStatus?: string): 'processing' | 'completed' |
     }
 }
 
-export const getOperatorSheetData = async (sheetId: string, page: number = 1, pageSize: number = 50): Promise<{data: OperatorCellularRecord[], total: number, hasMore: boolean, columns?: string[], displayNames?: {[key: string]: string}}> => {
+export const getOperatorSheetData = async (sheetId: string, page: number = 1, pageSize: number = 50, options: OperatorSheetQueryOptions = {}): Promise<{data: OperatorCellularRecord[], total: number | null, hasMore: boolean, nextCursor?: OperatorSheetCursor | null, columns?: string[], displayNames?: {[key: string]: string}}> => {
     if (USE_MOCK_API) {
         await sleep(MOCK_API_DELAY);
         
@@ -721,7 +821,13 @@ export const getOperatorSheetData = async (sheetId: string, page: number = 1, pa
         return { data, total, hasMore };
     }
     
-    return handleEelResponse(() => window.eel.get_operator_sheet_data(sheetId, page, pageSize)(), 'obtener datos de hoja de operador');
+    const response = await handleEelResponse(() => window.eel.get_operator_sheet_data(
+        sheetId, page, pageSize, options.cursor ?? null, options.sortBy ?? 'id', options.sortDir ?? 'asc', options.filters ?? {},
+        options.responseFormat ?? 'records'
+    )(), 'obtener datos de hoja de operador');
+    // El formato columnar reduce el payload; la UI sigue recibiendo registros
+    const data = isColumnarPayload(response.data) ? decodeColumnar<OperatorCellularRecord>(response.data) : response.data;
+    return { ...response, data };
 };
 
 export const deleteOperatorSheet = async (missionId: string, sheetId: string, userId?: string): Promise<{status: string}> => {
@@ -84,6 +84,31 @@ export interface OperatorCellularRecord {
     rawData: Record<string, any>; // Datos originales del archivo
 }
 
+// Cursor de paginación retornado por get_operator_sheet_data como nextCursor
+export interface OperatorSheetCursor {
+    id: number;
+    value: string | number;
+}
+
+export type ResponseFormat = 'records' | 'columnar';
+
+// Respuesta columnar de tablas grandes (Backend/utils/columnar_response.py)
+export interface ColumnarPayload {
+    format: 'columnar';
+    columns: string[];
+    rowCount: number;
+    values: {[column: string]: any[]};
+    dictionaries: {[column: string]: any[]};
+}
+
+export interface OperatorSheetQueryOptions {
+    cursor?: OperatorSheetCursor | null;
+    sortBy?: string;
+    sortDir?: 'asc' | 'desc';
+    filters?: {[column: string]: string};
+    responseFormat?: ResponseFormat;
+}
+
 export interface ProcessingLog {
     id: string;
     sheetId: string;
@@ -137,8 +162,35 @@ export interface Mission {
     status: MissionStatus;
     startDate: string;
     endDate: string;
-    cellularData?: CellularDataRecord[];
+    cellularData?: CellularDataRecord[]; // undefined hasta que se carga bajo demanda
     operatorSheets?: OperatorSheet[];
+    cellularRecordsCount?: number; // conteos del listado liviano (get_missions_summary)
+    operatorSheetsCount?: number;
+    targetRecordsCount?: number;
+}
+
+// Resumen de carga retornado por upload_cellular_data (ya no incluye cellularData)
+export interface CellularUploadSummary {
+    mode: 'replace' | 'append';
+    recordsProcessed: number;
+    recordsInserted: number;
+    recordsSkipped: number;
+    recordsDeleted: number;
+    affectedOperators: string[];
+    processingTime: number;
+}
+
+export interface CellularUploadResponse extends Mission {
+    uploadSummary: CellularUploadSummary;
+}
+
+// Página genérica retornada por get_missions_summary y get_mission_cellular_data
+export interface PagedResponse<T> {
+    data: T[];
+    total: number;
+    hasMore: boolean;
+    page: number;
+    pageSize: number;
 }
 
 // Tipos para el sistema de notificaciones profesional